@@ -0,0 +1,59 @@
+"""add_webhook_outbox
+
+Revision ID: a7c3e9f1b2d4
+Revises: f972939dd331
+Create Date: 2026-10-18 09:12:40.118203
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e9f1b2d4"
+down_revision: Union[str, Sequence[str], None] = "f972939dd331"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "webhook_outbox",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("tenant_id", sa.String(length=50), nullable=True),
+        sa.Column("principal_id", sa.String(length=50), nullable=True),
+        sa.Column("kind", sa.String(length=30), nullable=False),  # "protocol", "delivery_report"
+        sa.Column("endpoint_url", sa.Text(), nullable=False),
+        sa.Column("endpoint_key", sa.Text(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("delivery_config", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("event_metadata", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempt_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="8"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("locked_by", sa.String(length=100), nullable=True),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Dispatcher polls due rows by status; ordering checks walk rows per endpoint by id
+    op.create_index("idx_webhook_outbox_due", "webhook_outbox", ["status", "next_attempt_at"])
+    op.create_index("idx_webhook_outbox_endpoint", "webhook_outbox", ["endpoint_key", "id"])
+    op.create_index("idx_webhook_outbox_tenant", "webhook_outbox", ["tenant_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_webhook_outbox_tenant", table_name="webhook_outbox")
+    op.drop_index("idx_webhook_outbox_endpoint", table_name="webhook_outbox")
+    op.drop_index("idx_webhook_outbox_due", table_name="webhook_outbox")
+    op.drop_table("webhook_outbox")
@@ -0,0 +1,33 @@
+"""add_media_buy_readiness_snapshot
+
+Revision ID: a9c3e7f1b5d4
+Revises: f4b8d2a6c9e3
+Create Date: 2026-10-18 23:04:51.662913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c3e7f1b5d4"
+down_revision: Union[str, Sequence[str], None] = "f4b8d2a6c9e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Populated by scripts/ops/recompute_readiness.py; NULL snapshots are computed on read
+    op.add_column("media_buys", sa.Column("readiness_snapshot", postgresql.JSONB(), nullable=True))
+    op.add_column("media_buys", sa.Column("readiness_updated_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("media_buys", "readiness_updated_at")
+    op.drop_column("media_buys", "readiness_snapshot")
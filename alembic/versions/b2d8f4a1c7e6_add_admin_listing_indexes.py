@@ -0,0 +1,39 @@
+"""add_admin_listing_indexes
+
+Revision ID: b2d8f4a1c7e6
+Revises: a9c3e7f1b5d4
+Create Date: 2026-10-19 09:41:27.105836
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d8f4a1c7e6"
+down_revision: Union[str, Sequence[str], None] = "a9c3e7f1b5d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (sort column, unique key) indexes for keyset pagination of the admin listings;
+    # B-tree indexes are scanned backward for the descending (newest first) sorts
+    op.create_index("idx_products_tenant_name", "products", ["tenant_id", "name", "product_id"])
+    op.create_index("idx_principals_tenant_name", "principals", ["tenant_id", "name", "principal_id"])
+    op.create_index("idx_creatives_tenant_created", "creatives", ["tenant_id", "created_at", "creative_id"])
+    # Replaces the created_at-only index
+    op.drop_index("idx_workflow_steps_created", table_name="workflow_steps")
+    op.create_index("idx_workflow_steps_created", "workflow_steps", ["created_at", "step_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_workflow_steps_created", table_name="workflow_steps")
+    op.create_index("idx_workflow_steps_created", "workflow_steps", ["created_at"])
+    op.drop_index("idx_creatives_tenant_created", table_name="creatives")
+    op.drop_index("idx_principals_tenant_name", table_name="principals")
+    op.drop_index("idx_products_tenant_name", table_name="products")
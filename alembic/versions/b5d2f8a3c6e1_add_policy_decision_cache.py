@@ -0,0 +1,49 @@
+"""add_policy_decision_cache
+
+Revision ID: b5d2f8a3c6e1
+Revises: a7c3e9f1b2d4
+Create Date: 2026-10-18 14:03:27.551902
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d2f8a3c6e1"
+down_revision: Union[str, Sequence[str], None] = "a7c3e9f1b2d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "policy_decision_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("tenant_id", sa.String(length=50), nullable=False),
+        sa.Column("model", sa.String(length=200), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=True),
+        sa.Column("restrictions", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("warnings", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("decided_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.tenant_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+
+    op.create_index("idx_policy_decision_cache_tenant", "policy_decision_cache", ["tenant_id"])
+    # Expired rows are purged by range scan on expires_at
+    op.create_index("idx_policy_decision_cache_expires", "policy_decision_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_policy_decision_cache_expires", table_name="policy_decision_cache")
+    op.drop_index("idx_policy_decision_cache_tenant", table_name="policy_decision_cache")
+    op.drop_table("policy_decision_cache")
@@ -0,0 +1,47 @@
+"""add_format_metrics_daily
+
+Revision ID: c5e1a7d3f9b2
+Revises: b2d8f4a1c7e6
+Create Date: 2026-10-19 11:26:03.448190
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e1a7d3f9b2"
+down_revision: Union[str, Sequence[str], None] = "b2d8f4a1c7e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Daily per country + creative size aggregates; format_performance_metrics windows are summed from these
+    op.create_table(
+        "format_metrics_daily",
+        sa.Column("tenant_id", sa.String(length=50), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("country_code", sa.String(length=3), nullable=False),
+        sa.Column("creative_size", sa.String(length=20), nullable=False),
+        sa.Column("total_impressions", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("total_clicks", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("total_revenue_micros", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("line_item_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "cpm_sketch", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default=sa.text("'{}'::jsonb")
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.tenant_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id", "day", "country_code", "creative_size"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("format_metrics_daily")
@@ -0,0 +1,32 @@
+"""add_products_latency_budget_to_tenants
+
+Revision ID: c8e1a4d7f2b9
+Revises: b5d2f8a3c6e1
+Create Date: 2026-10-18 16:41:08.274415
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e1a4d7f2b9"
+down_revision: Union[str, Sequence[str], None] = "b5d2f8a3c6e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add products_latency_budget_ms column to tenants table."""
+    op.add_column(
+        "tenants",
+        sa.Column("products_latency_budget_ms", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove products_latency_budget_ms column from tenants table."""
+    op.drop_column("tenants", "products_latency_budget_ms")
@@ -0,0 +1,61 @@
+"""add_creative_review_jobs
+
+Revision ID: d3f7b1e9a5c2
+Revises: c8e1a4d7f2b9
+Create Date: 2026-10-18 18:05:52.630917
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f7b1e9a5c2"
+down_revision: Union[str, Sequence[str], None] = "c8e1a4d7f2b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "creative_review_jobs",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("task_id", sa.String(length=100), nullable=False),
+        sa.Column("tenant_id", sa.String(length=50), nullable=False),
+        sa.Column("creative_id", sa.String(length=100), nullable=False),
+        sa.Column("webhook_url", sa.Text(), nullable=True),
+        sa.Column("slack_webhook_url", sa.Text(), nullable=True),
+        sa.Column("principal_name", sa.String(length=255), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempt_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="3"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("locked_by", sa.String(length=100), nullable=True),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("result", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.tenant_id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["creative_id"], ["creatives.creative_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("task_id"),
+    )
+
+    # Workers poll due rows by status; fairness counts in-flight rows per tenant
+    op.create_index("idx_creative_review_jobs_due", "creative_review_jobs", ["status", "next_attempt_at"])
+    op.create_index("idx_creative_review_jobs_tenant", "creative_review_jobs", ["tenant_id", "status"])
+    op.create_index("idx_creative_review_jobs_creative", "creative_review_jobs", ["creative_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_creative_review_jobs_creative", table_name="creative_review_jobs")
+    op.drop_index("idx_creative_review_jobs_tenant", table_name="creative_review_jobs")
+    op.drop_index("idx_creative_review_jobs_due", table_name="creative_review_jobs")
+    op.drop_table("creative_review_jobs")
@@ -0,0 +1,64 @@
+"""add_delivery_facts
+
+Revision ID: d7f2a9c4e1b8
+Revises: c5e1a7d3f9b2
+Create Date: 2026-10-19 15:02:47.318521
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7f2a9c4e1b8"
+down_revision: Union[str, Sequence[str], None] = "c5e1a7d3f9b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Delivery per media buy package and day (or hour), synced from the ad server
+    op.create_table(
+        "delivery_facts",
+        sa.Column("media_buy_id", sa.String(length=100), nullable=False),
+        sa.Column("package_id", sa.String(length=100), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("hour", sa.Integer(), nullable=False),
+        sa.Column("tenant_id", sa.String(length=50), nullable=False),
+        sa.Column("impressions", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("clicks", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("spend", sa.DECIMAL(precision=15, scale=4), nullable=False, server_default="0"),
+        sa.Column("video_completions", sa.BigInteger(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.CheckConstraint("hour BETWEEN -1 AND 23", name="ck_delivery_facts_hour"),
+        sa.ForeignKeyConstraint(["media_buy_id"], ["media_buys.media_buy_id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.tenant_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("media_buy_id", "package_id", "day", "hour"),
+    )
+    op.create_index("idx_delivery_facts_tenant_day", "delivery_facts", ["tenant_id", "day"])
+
+    # How far delivery_facts are complete per media buy
+    op.create_table(
+        "delivery_sync_state",
+        sa.Column("media_buy_id", sa.String(length=100), nullable=False),
+        sa.Column("tenant_id", sa.String(length=50), nullable=False),
+        sa.Column("synced_from", sa.Date(), nullable=False),
+        sa.Column("synced_through", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_synced_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["media_buy_id"], ["media_buys.media_buy_id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.tenant_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("media_buy_id"),
+    )
+    op.create_index(op.f("ix_delivery_sync_state_tenant_id"), "delivery_sync_state", ["tenant_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_delivery_sync_state_tenant_id"), table_name="delivery_sync_state")
+    op.drop_table("delivery_sync_state")
+    op.drop_index("idx_delivery_facts_tenant_day", table_name="delivery_facts")
+    op.drop_table("delivery_facts")
@@ -0,0 +1,48 @@
+"""add_idempotency_records
+
+Revision ID: e3b8c1f6a9d2
+Revises: d7f2a9c4e1b8
+Create Date: 2026-10-20 10:41:09.274318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b8c1f6a9d2"
+down_revision: Union[str, Sequence[str], None] = "d7f2a9c4e1b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "idempotency_records",
+        sa.Column("tenant_id", sa.String(length=50), nullable=False),
+        sa.Column("principal_id", sa.String(length=50), nullable=False),
+        sa.Column("tool_name", sa.String(length=50), nullable=False),
+        sa.Column("idempotency_key", sa.String(length=255), nullable=False),
+        sa.Column("request_hash", sa.String(length=64), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("response", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.tenant_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id", "principal_id", "tool_name", "idempotency_key"),
+    )
+    # Expired rows are purged by range scan on expires_at
+    op.create_index("idx_idempotency_records_expires", "idempotency_records", ["expires_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_idempotency_records_expires", table_name="idempotency_records")
+    op.drop_table("idempotency_records")
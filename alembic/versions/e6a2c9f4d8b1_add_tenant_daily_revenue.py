@@ -0,0 +1,43 @@
+"""add_tenant_daily_revenue
+
+Revision ID: e6a2c9f4d8b1
+Revises: d3f7b1e9a5c2
+Create Date: 2026-10-18 19:12:40.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a2c9f4d8b1"
+down_revision: Union[str, Sequence[str], None] = "d3f7b1e9a5c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tenant_daily_revenue",
+        sa.Column("tenant_id", sa.String(length=50), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("revenue", sa.DECIMAL(precision=18, scale=4), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.tenant_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id", "day"),
+    )
+    # Dashboard reads the rollup once scripts/ops/backfill_revenue_rollups.py has run for the tenant
+    op.add_column(
+        "tenants",
+        sa.Column("revenue_rollup_backfilled_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tenants", "revenue_rollup_backfilled_at")
+    op.drop_table("tenant_daily_revenue")
@@ -0,0 +1,128 @@
+"""partition_audit_logs_by_month
+
+Revision ID: f4b8d2a6c9e3
+Revises: e6a2c9f4d8b1
+Create Date: 2026-10-18 20:03:11.527690
+
+Rebuilds audit_logs as a table range-partitioned by month on "timestamp".
+Existing rows are copied into monthly partitions (audit_logs_pYYYYMM) covering
+the oldest row through three months ahead, plus audit_logs_default for anything
+outside that range. Later partitions are created by AuditLogPartitionScheduler
+(src/services/audit_log_partitions.py).
+
+The primary key becomes (log_id, timestamp), since PostgreSQL requires the
+partition key in unique constraints; log_id is still unique via its sequence.
+(tenant_id, timestamp DESC) replaces the tenant_id-only index and serves the
+dashboard and activity stream "latest activity for tenant" queries.
+
+The copy rewrites the whole table; on large installs run it in a maintenance
+window.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b8d2a6c9e3"
+down_revision: Union[str, Sequence[str], None] = "e6a2c9f4d8b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_indexes_and_constraints() -> None:
+    op.execute("ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (log_id, timestamp)")
+    op.execute(
+        "ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_tenant_id_fkey "
+        "FOREIGN KEY (tenant_id) REFERENCES tenants (tenant_id) ON DELETE CASCADE"
+    )
+    op.execute(
+        "ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_strategy_id_fkey "
+        "FOREIGN KEY (strategy_id) REFERENCES strategies (strategy_id) ON DELETE SET NULL"
+    )
+    op.execute('CREATE INDEX idx_audit_logs_tenant_timestamp ON audit_logs (tenant_id, "timestamp" DESC)')
+    op.execute('CREATE INDEX idx_audit_logs_timestamp ON audit_logs ("timestamp")')
+    op.execute("CREATE INDEX idx_audit_logs_strategy ON audit_logs (strategy_id)")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('UPDATE audit_logs SET "timestamp" = now() WHERE "timestamp" IS NULL')
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned")
+    op.execute(
+        'CREATE TABLE audit_logs (LIKE audit_logs_unpartitioned INCLUDING DEFAULTS) PARTITION BY RANGE ("timestamp")'
+    )
+    op.execute('ALTER TABLE audit_logs ALTER COLUMN "timestamp" SET NOT NULL')
+
+    # Monthly partitions from the oldest row's month through three months ahead
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month date := date_trunc('month', COALESCE((SELECT min("timestamp") FROM audit_logs_unpartitioned), now()));
+            last_month date := date_trunc('month', now() + interval '3 months');
+        BEGIN
+            WHILE month <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+                    'audit_logs_p' || to_char(month, 'YYYYMM'), month, month + interval '1 month'
+                );
+                month := month + interval '1 month';
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_unpartitioned")
+
+    # Keep the log_id sequence when the old table (its owner) is dropped
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            seq text := pg_get_serial_sequence('audit_logs_unpartitioned', 'log_id');
+        BEGIN
+            IF seq IS NOT NULL THEN
+                EXECUTE format('ALTER SEQUENCE %s OWNED BY audit_logs.log_id', seq);
+            END IF;
+        END $$
+        """
+    )
+    op.execute("DROP TABLE audit_logs_unpartitioned")
+
+    _create_indexes_and_constraints()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute("CREATE TABLE audit_logs (LIKE audit_logs_partitioned INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned")
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            seq text := pg_get_serial_sequence('audit_logs_partitioned', 'log_id');
+        BEGIN
+            IF seq IS NOT NULL THEN
+                EXECUTE format('ALTER SEQUENCE %s OWNED BY audit_logs.log_id', seq);
+            END IF;
+        END $$
+        """
+    )
+    op.execute("DROP TABLE audit_logs_partitioned")
+
+    op.execute("ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (log_id)")
+    op.execute(
+        "ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_tenant_id_fkey "
+        "FOREIGN KEY (tenant_id) REFERENCES tenants (tenant_id) ON DELETE CASCADE"
+    )
+    op.execute(
+        "ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_strategy_id_fkey "
+        "FOREIGN KEY (strategy_id) REFERENCES strategies (strategy_id) ON DELETE SET NULL"
+    )
+    op.execute("CREATE INDEX idx_audit_logs_tenant ON audit_logs (tenant_id)")
+    op.execute('CREATE INDEX idx_audit_logs_timestamp ON audit_logs ("timestamp")')
+    op.execute("CREATE INDEX idx_audit_logs_strategy ON audit_logs (strategy_id)")
@@ -0,0 +1,53 @@
+"""add_sync_leases_and_schedules
+
+Revision ID: f4c9d2b7e1a3
+Revises: e3b8c1f6a9d2
+Create Date: 2026-10-21 09:12:47.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4c9d2b7e1a3"
+down_revision: Union[str, Sequence[str], None] = "e3b8c1f6a9d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("sync_jobs", sa.Column("lease_owner", sa.String(length=255), nullable=True))
+    op.add_column("sync_jobs", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("sync_jobs", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True))
+    # Expired leases are found by (status = 'running', lease_expires_at < now())
+    op.create_index("idx_sync_jobs_status_lease", "sync_jobs", ["status", "lease_expires_at"])
+
+    op.create_table(
+        "sync_schedules",
+        sa.Column("tenant_id", sa.String(length=50), nullable=False),
+        sa.Column("sync_type", sa.String(length=20), nullable=False),
+        sa.Column("enabled", sa.Boolean(), server_default=sa.text("true"), nullable=False),
+        sa.Column("interval_seconds", sa.Integer(), nullable=False),
+        sa.Column("next_run_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_sync_id", sa.String(length=100), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.tenant_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id", "sync_type"),
+    )
+    op.create_index("idx_sync_schedules_due", "sync_schedules", ["next_run_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_sync_schedules_due", table_name="sync_schedules")
+    op.drop_table("sync_schedules")
+    op.drop_index("idx_sync_jobs_status_lease", table_name="sync_jobs")
+    op.drop_column("sync_jobs", "heartbeat_at")
+    op.drop_column("sync_jobs", "lease_expires_at")
+    op.drop_column("sync_jobs", "lease_owner")
@@ -2,8 +2,9 @@
 """
 Aggregate format performance metrics for all GAM-enabled tenants.
 
-This script queries GAM ReportService for historical data by COUNTRY_CODE + CREATIVE_SIZE,
-calculates CPM percentiles, and stores results in format_performance_metrics table.
+This script queries GAM ReportService for the days not yet ingested (by DATE + COUNTRY_CODE +
+CREATIVE_SIZE), stores them in format_metrics_daily, then calculates the rolling-window totals
+and CPM percentiles into the format_performance_metrics table.
 
 Intended to be run as a daily cron job:
   0 2 * * * /path/to/aggregate_format_metrics.py
@@ -11,6 +12,8 @@ Intended to be run as a daily cron job:
 Arguments:
   --period-days N  Number of days to aggregate (default: 30)
   --tenant-id ID   Process single tenant only (optional)
+  --workers N      Tenants processed in parallel worker processes (default: 4)
+  --rebuild        Re-ingest every day of the period instead of only new days
 """
 
 import argparse
@@ -22,8 +25,9 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from src.services.format_metrics_service import (
-    FormatMetricsAggregationService,
+    FORMAT_METRICS_WORKERS,
     aggregate_all_tenants,
+    aggregate_tenant_metrics,
 )
 
 logging.basicConfig(
@@ -47,6 +51,17 @@ def main():
         type=str,
         help="Process single tenant only (optional)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=FORMAT_METRICS_WORKERS,
+        help=f"Tenants processed in parallel worker processes (default: {FORMAT_METRICS_WORKERS})",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Re-ingest every day of the period instead of only new days",
+    )
 
     args = parser.parse_args()
 
@@ -57,7 +72,6 @@ def main():
     try:
         if args.tenant_id:
             # Process single tenant
-            from src.adapters.gam.client import GAMClientManager
             from src.core.database.database_session import get_db_session
             from src.core.database.models import AdapterConfig, Tenant
 
@@ -73,22 +87,20 @@ def main():
                     logger.error(f"Tenant {args.tenant_id} does not have GAM configured")
                     sys.exit(1)
 
-                # Initialize GAM client
-                gam_config = {
-                    "refresh_token": adapter_config.gam_refresh_token,
-                }
-                client_manager = GAMClientManager(gam_config, adapter_config.gam_network_code)
-                gam_client = client_manager.get_client()
-
-                # Aggregate metrics
-                service = FormatMetricsAggregationService(db_session)
-                summary = service.aggregate_metrics_for_tenant(args.tenant_id, gam_client, args.period_days)
+                network_code = adapter_config.gam_network_code
+                refresh_token = adapter_config.gam_refresh_token
 
-                logger.info(f"Aggregation complete for tenant {args.tenant_id}: {summary}")
+            # Aggregate metrics
+            summary = aggregate_tenant_metrics(
+                args.tenant_id, network_code, refresh_token, args.period_days, rebuild=args.rebuild
+            )
+            logger.info(f"Aggregation complete for tenant {args.tenant_id}: {summary}")
 
         else:
             # Process all tenants
-            summary = aggregate_all_tenants(period_days=args.period_days)
+            summary = aggregate_all_tenants(
+                period_days=args.period_days, max_workers=args.workers, rebuild=args.rebuild
+            )
             logger.info(
                 f"Aggregation complete: {summary['successful']} successful, "
                 f"{summary['failed']} failed out of {summary['total_tenants']} tenants"
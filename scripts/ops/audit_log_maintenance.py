@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Audit log partition maintenance.
+
+Creates upcoming monthly audit_logs partitions and archives partitions older than
+the retention period to gzip-compressed CSV files before dropping them.
+
+Intended to be run as a daily cron job:
+  15 3 * * * /path/to/audit_log_maintenance.py
+
+Arguments:
+  --retention-months N  Months kept in the database (default: AUDIT_LOG_RETENTION_MONTHS or 12; 0 = keep all)
+  --archive-dir PATH    Directory for archive files (default: AUDIT_LOG_ARCHIVE_DIR or archives/audit_logs)
+  --no-export           Drop expired partitions without writing an archive
+  --dry-run             Only list partitions that would be archived
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.services.audit_log_partitions import (
+    AUDIT_LOG_ARCHIVE_DIR,
+    AUDIT_LOG_RETENTION_MONTHS,
+    archive_audit_log_partitions,
+    ensure_audit_log_partitions,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point for audit log partition maintenance."""
+    parser = argparse.ArgumentParser(description="Create and archive monthly audit_logs partitions")
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=AUDIT_LOG_RETENTION_MONTHS,
+        help=f"Months kept in the database (default: {AUDIT_LOG_RETENTION_MONTHS}; 0 = keep all)",
+    )
+    parser.add_argument(
+        "--archive-dir",
+        type=str,
+        default=AUDIT_LOG_ARCHIVE_DIR,
+        help=f"Directory for archive files (default: {AUDIT_LOG_ARCHIVE_DIR})",
+    )
+    parser.add_argument(
+        "--no-export",
+        action="store_true",
+        help="Drop expired partitions without writing an archive",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only list partitions that would be archived",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if not args.dry_run:
+            created = ensure_audit_log_partitions()
+            logger.info(f"Partitions created: {created or 'none'}")
+
+        results = archive_audit_log_partitions(
+            retention_months=args.retention_months,
+            archive_dir=args.archive_dir,
+            export=not args.no_export,
+            dry_run=args.dry_run,
+        )
+        for result in results:
+            if args.dry_run:
+                logger.info(f"Would archive {result.name}")
+            else:
+                logger.info(
+                    f"{result.name}: {result.rows} rows -> {result.path or 'not exported'} (dropped={result.dropped})"
+                )
+
+        # Exit with error code if any expired partition could not be dropped
+        if any(not result.dropped for result in results) and not args.dry_run:
+            sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"Audit log maintenance failed: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
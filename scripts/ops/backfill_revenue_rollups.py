@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Backfill the per-tenant daily revenue rollup used by the admin dashboard.
+
+Rebuilds tenant_daily_revenue from media_buys and marks each tenant as backfilled,
+after which the dashboard revenue chart reads the rollup instead of computing it.
+Re-running is safe and repairs any drift, so it can also run as a nightly cron job:
+  30 2 * * * /path/to/backfill_revenue_rollups.py --only-missing
+
+Arguments:
+  --tenant-id ID   Backfill single tenant only (optional)
+  --only-missing   Skip tenants that have already been backfilled
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.services.revenue_rollup_service import backfill_all_tenants, backfill_tenant_revenue_rollup
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point for the revenue rollup backfill."""
+    parser = argparse.ArgumentParser(description="Backfill the daily revenue rollup from media buys")
+    parser.add_argument(
+        "--tenant-id",
+        type=str,
+        help="Backfill single tenant only (optional)",
+    )
+    parser.add_argument(
+        "--only-missing",
+        action="store_true",
+        help="Skip tenants that have already been backfilled",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if args.tenant_id:
+            days = backfill_tenant_revenue_rollup(args.tenant_id)
+            logger.info(f"Backfill complete for tenant {args.tenant_id}: {days} days")
+        else:
+            results = backfill_all_tenants(only_missing=args.only_missing)
+            logger.info(f"Backfill complete for {len(results)} tenants")
+    except Exception as e:
+        logger.error(f"Revenue rollup backfill failed: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
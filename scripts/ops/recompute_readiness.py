@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Recompute the readiness snapshots stored on media buys.
+
+Readiness (package/creative/GAM status counts, blocking issues and warnings) is kept
+up to date on every write, so this is only needed after deploying the readiness
+columns, after writes that bypassed the ORM (raw SQL, bulk updates), or to verify
+snapshots in CI/staging:
+  0 4 * * 0 /path/to/recompute_readiness.py --check
+
+Arguments:
+  --tenant-id ID   Recompute single tenant only (optional)
+  --check          Only report media buys whose snapshot is missing or stale (exit 1 if any)
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.admin.services.media_buy_readiness_service import check_readiness_consistency, recompute_readiness
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point for the readiness recomputation."""
+    parser = argparse.ArgumentParser(description="Recompute stored media buy readiness snapshots")
+    parser.add_argument(
+        "--tenant-id",
+        type=str,
+        help="Recompute single tenant only (optional)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report missing or stale snapshots (exit 1 if any)",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if args.check:
+            mismatches = check_readiness_consistency(args.tenant_id)
+            for mismatch in mismatches:
+                logger.warning(
+                    f"Stale readiness for {mismatch.media_buy_id}: stored={mismatch.stored} expected={mismatch.expected}"
+                )
+            logger.info(f"Readiness check complete: {len(mismatches)} stale snapshots")
+            if mismatches:
+                sys.exit(1)
+        else:
+            count = recompute_readiness(args.tenant_id)
+            logger.info(f"Recomputed readiness for {count} media buys")
+    except Exception as e:
+        logger.error(f"Readiness recomputation failed: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
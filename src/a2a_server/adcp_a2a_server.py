@@ -4,6 +4,7 @@ AdCP Sales Agent A2A Server using official a2a-sdk library.
 Supports both standard A2A message format and JSON-RPC 2.0.
 """
 
+import asyncio
 import contextvars
 import logging
 import os
@@ -68,6 +69,7 @@ from src.core.config_loader import get_current_tenant
 from src.core.database.models import PushNotificationConfig as DBPushNotificationConfig
 from src.core.domain_config import get_a2a_server_url, get_sales_agent_domain
 from src.core.product_conversion import add_v2_compat_to_products
+from src.core.request_scope import request_scope, seed_request_cache
 from src.core.schemas import CreativeStatusEnum
 from src.core.testing_hooks import AdCPTestContext
 from src.core.tool_context import ToolContext
@@ -333,6 +335,9 @@ class AdCPRequestHandler(RequestHandler):
                 )
             )
 
+        # Resolved once per skill call; later tenant lookups in this request reuse it
+        seed_request_cache(("tenant", tenant_context["tenant_id"]), tenant_context)
+
         # Generate context ID if not provided
         if not context_id:
             context_id = f"a2a_{datetime.now(UTC).timestamp()}"
@@ -348,7 +353,12 @@ class AdCPRequestHandler(RequestHandler):
             principal_id=principal_id,
             tool_name=tool_name,
             request_timestamp=datetime.now(UTC),
-            metadata={"source": "a2a_server", "protocol": "a2a_jsonrpc"},
+            metadata={
+                "source": "a2a_server",
+                "protocol": "a2a_jsonrpc",
+                # Retries of mutating skills carrying the same key replay the stored response
+                "idempotency_key": get_header("Idempotency-Key"),
+            },
             testing_context=AdCPTestContext().model_dump(),  # Default testing context for A2A requests
         )
 
@@ -1479,8 +1489,10 @@ class AdCPRequestHandler(RequestHandler):
 
         try:
             handler = skill_handlers[skill_name]
-            # All handlers are async and call core tools
-            result = await cast(Any, handler)(parameters, auth_token)
+            # All handlers are async and call core tools; the request scope memoizes
+            # tenant/principal/adapter lookups for the duration of the skill call
+            with request_scope(skill_name, protocol="a2a"):
+                result = await cast(Any, handler)(parameters, auth_token)
             return result
         except ServerError:
             # Re-raise ServerError as-is (already properly formatted)
@@ -1685,8 +1697,10 @@ class AdCPRequestHandler(RequestHandler):
                     "received_parameters": list(parameters.keys()),
                 }
 
-            # Call core function with spec-compliant parameters (AdCP v2.5)
-            response = core_sync_creatives_tool(
+            # Call core function with spec-compliant parameters (AdCP v2.5); it blocks (database
+            # work and idempotency waits), so it runs off the event loop
+            response = await asyncio.to_thread(
+                core_sync_creatives_tool,
                 creatives=parameters["creatives"],
                 # AdCP 2.5: Full upsert semantics (patch parameter removed)
                 creative_ids=parameters.get("creative_ids"),
@@ -2645,6 +2659,31 @@ def main():
     # Add debug route
     app.router.routes.append(Route("/debug/tenant", debug_tenant_endpoint, methods=["GET"]))
 
+    # Prometheus metrics and the sampling profiler (same endpoints as the MCP server)
+    from starlette.responses import Response
+
+    from src.core.metrics import METRICS_CONTENT_TYPE, get_metrics_text, monitor_event_loop_lag
+    from src.core.profiling import profiler_endpoint
+
+    async def metrics_endpoint(request):
+        """Prometheus metrics endpoint (skill latency, DB queries, adapter calls)."""
+        return Response(get_metrics_text(), media_type=METRICS_CONTENT_TYPE)
+
+    app.router.routes.append(Route("/metrics", metrics_endpoint, methods=["GET"]))
+    app.router.routes.append(Route("/debug/profiler", profiler_endpoint, methods=["GET", "POST"]))
+
+    loop_lag_tasks: list[asyncio.Task] = []
+
+    async def start_loop_lag_monitor():
+        loop_lag_tasks.append(asyncio.create_task(monitor_event_loop_lag("a2a")))
+
+    async def stop_loop_lag_monitor():
+        for task in loop_lag_tasks:
+            task.cancel()
+
+    app.router.on_startup.append(start_loop_lag_monitor)
+    app.router.on_shutdown.append(stop_loop_lag_monitor)
+
     # Add middleware for backward compatibility with numeric messageId
     @app.middleware("http")
     async def messageId_compatibility_middleware(request, call_next):
@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
 
 from rich.console import Console
 
 from src.core.audit_logger import get_audit_logger
+from src.core.metrics import instrument_adapter_call
 from src.core.schemas import (
+    AdapterDeliveryFacts,
     AdapterGetMediaBuyDeliveryResponse,
+    AdapterPackageUpdate,
+    AdapterPackageUpdateResult,
     AssetStatus,
     CheckMediaBuyStatusResponse,
     CreateMediaBuyRequest,
@@ -64,6 +68,30 @@ class AdServerAdapter(ABC):
     # Subclasses should override with their supported channels
     default_channels: list[str] = []
 
+    # Interface methods timed in adapter_call_duration_seconds (see src/core/metrics.py)
+    instrumented_methods: tuple[str, ...] = (
+        "create_media_buy",
+        "add_creative_assets",
+        "associate_creatives",
+        "check_media_buy_status",
+        "get_media_buy_delivery",
+        "get_media_buy_deliveries",
+        "get_delivery_facts",
+        "update_media_buy_performance_index",
+        "update_media_buy",
+        "update_packages",
+        "get_available_inventory",
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """Wrap the interface methods a subclass implements with latency metrics."""
+        super().__init_subclass__(**kwargs)
+        adapter_name = getattr(cls, "adapter_name", cls.__name__)
+        for method_name in cls.instrumented_methods:
+            method = cls.__dict__.get(method_name)
+            if callable(method) and not getattr(method, "__isabstractmethod__", False):
+                setattr(cls, method_name, instrument_adapter_call(adapter_name, method_name)(method))
+
     def __init__(
         self,
         config: dict[str, Any],
@@ -184,6 +212,30 @@ class AdServerAdapter(ABC):
         """Gets delivery data for a media buy."""
         pass
 
+    def get_media_buy_deliveries(
+        self, media_buy_ids: list[str], date_range: ReportingPeriod, today: datetime
+    ) -> dict[str, AdapterGetMediaBuyDeliveryResponse]:
+        """Gets delivery data for several media buys, keyed by media buy ID.
+
+        The default makes one get_media_buy_delivery call per media buy; adapters whose
+        reporting API can filter by many orders at once override this with a single query.
+        """
+        return {
+            media_buy_id: self.get_media_buy_delivery(media_buy_id=media_buy_id, date_range=date_range, today=today)
+            for media_buy_id in media_buy_ids
+        }
+
+    def get_delivery_facts(
+        self, media_buy_ids: list[str], start_date: date, today: datetime
+    ) -> AdapterDeliveryFacts | None:
+        """Gets delivery per package and day (hourly for today) since start_date.
+
+        Used by the delivery fact sync (src/services/delivery_facts.py) to store delivery
+        locally. Returns None when the adapter cannot report delivery by day; delivery for
+        its media buys is then always fetched live.
+        """
+        return None
+
     @abstractmethod
     def update_media_buy_performance_index(
         self, media_buy_id: str, package_performance: list[PackagePerformance]
@@ -204,6 +256,33 @@ class AdServerAdapter(ABC):
         """Updates a media buy with a specific action."""
         pass
 
+    def update_packages(
+        self, media_buy_id: str, buyer_ref: str, updates: list[AdapterPackageUpdate], today: datetime
+    ) -> list[AdapterPackageUpdateResult]:
+        """Applies several package changes to a media buy, returning one result per change in order.
+
+        Every change is attempted, so one rejected package does not block the others. The default
+        makes one update_media_buy call per change; adapters whose API can update many line items
+        at once override this with batched calls.
+        """
+        results = []
+        for update in updates:
+            response = self.update_media_buy(
+                media_buy_id=media_buy_id,
+                buyer_ref=buyer_ref,
+                action=update.action,
+                package_id=update.package_id,
+                budget=int(update.budget) if update.budget is not None else None,
+                today=today,
+            )
+            errors = getattr(response, "errors", None)
+            results.append(
+                AdapterPackageUpdateResult(
+                    package_id=update.package_id, action=update.action, error=errors[0] if errors else None
+                )
+            )
+        return results
+
     def get_config_ui_endpoint(self) -> str | None:
         """
         Returns the endpoint path for this adapter's configuration UI.
@@ -6,6 +6,7 @@ for Google Ad Manager orders.
 """
 
 import logging
+import time
 from collections.abc import Callable
 from datetime import datetime
 from typing import Any
@@ -20,6 +21,9 @@ logger = logging.getLogger(__name__)
 GUARANTEED_LINE_ITEM_TYPES = {"STANDARD", "SPONSORSHIP"}
 NON_GUARANTEED_LINE_ITEM_TYPES = {"NETWORK", "BULK", "PRICE_PRIORITY", "HOUSE"}
 
+# Line items per getLineItemsByStatement/updateLineItems/performLineItemAction call
+LINE_ITEM_BATCH_SIZE = 200
+
 
 class GAMOrdersManager:
     """Manages Google Ad Manager order operations."""
@@ -210,8 +214,6 @@ class GAMOrdersManager:
         Returns:
             True if approval succeeded, False otherwise
         """
-        import time
-
         logger.info(f"[APPROVAL] Approving GAM Order {order_id} (dry_run={self.dry_run})")
 
         if self.dry_run:
@@ -393,16 +395,12 @@ class GAMOrdersManager:
         # Get line item naming template from adapter config
         line_item_name_template = "{product_name}"  # Default
         if tenant_id:
-            from sqlalchemy import select
+            from src.core.helpers.adapter_helpers import get_tenant_adapter_config
 
-            from src.core.database.database_session import get_db_session
-            from src.core.database.models import AdapterConfig
-
-            with get_db_session() as db_session:
-                stmt = select(AdapterConfig).filter_by(tenant_id=tenant_id)
-                adapter_config = db_session.scalars(stmt).first()
-                if adapter_config and adapter_config.gam_line_item_name_template:
-                    line_item_name_template = adapter_config.gam_line_item_name_template
+            # Memoized per tool call - get_adapter() already loaded this row
+            adapter_config = get_tenant_adapter_config(tenant_id)
+            if adapter_config and adapter_config.gam_line_item_name_template:
+                line_item_name_template = adapter_config.gam_line_item_name_template
 
         created_line_item_ids: list[str] = []
         flight_duration_days = (end_time - start_time).days
@@ -1077,102 +1075,154 @@ class GAMOrdersManager:
         Returns:
             True if update successful, False otherwise
         """
-        if self.dry_run:
-            logger.info(
-                f"[DRY RUN] Would update line item {line_item_id} budget to {new_budget} {currency} "
-                f"(pricing: {pricing_model})"
-            )
-            return True
+        errors = self.update_line_item_budgets({line_item_id: (new_budget, pricing_model)}, max_retries=max_retries)
+        if errors[line_item_id]:
+            return False
+        logger.info(f"✓ Updated line item {line_item_id} budget: ${new_budget} {currency} (pricing: {pricing_model})")
+        return True
 
-        import time
+    def update_line_item_budgets(
+        self, budgets: dict[str, tuple[float, str]], max_retries: int = 5
+    ) -> dict[str, str | None]:
+        """Update the budgets of many line items with batched GAM calls.
 
-        for attempt in range(max_retries):
-            try:
-                line_item_service = self.client_manager.get_service("LineItemService")
+        Line items are read with one getLineItemsByStatement and written with one
+        updateLineItems call per LINE_ITEM_BATCH_SIZE line items.
 
-                # Get current line item
-                statement_builder = ad_manager.StatementBuilder()
-                statement_builder.Where("id = :lineItemId")
-                statement_builder.WithBindVariable("lineItemId", int(line_item_id))
-                statement = statement_builder.ToStatement()
+        Args:
+            budgets: New (budget, pricing_model) per GAM line item ID
+            max_retries: Maximum number of retries for NO_FORECAST_YET errors (default: 5)
 
-                result = line_item_service.getLineItemsByStatement(statement)
-                line_items = result.get("results", []) if isinstance(result, dict) else getattr(result, "results", [])
+        Returns:
+            Error message per line item ID, None for line items that were updated
+        """
+        if self.dry_run:
+            for line_item_id, (new_budget, pricing_model) in budgets.items():
+                logger.info(
+                    f"[DRY RUN] Would update line item {line_item_id} budget to {new_budget} (pricing: {pricing_model})"
+                )
+            return dict.fromkeys(budgets)
 
-                if not line_items:
+        results: dict[str, str | None] = {}
+        line_item_ids = list(budgets)
+        for start in range(0, len(line_item_ids), LINE_ITEM_BATCH_SIZE):
+            batch_ids = line_item_ids[start : start + LINE_ITEM_BATCH_SIZE]
+            try:
+                line_items = self._get_line_items_by_id(batch_ids)
+            except Exception as e:
+                logger.error(f"Error loading line items {batch_ids} for budget update: {e}")
+                results.update(dict.fromkeys(batch_ids, f"Failed to load line item from GAM: {e}"))
+                continue
+
+            to_update = []
+            for line_item_id in batch_ids:
+                line_item = line_items.get(line_item_id)
+                if line_item is None:
                     logger.error(f"Line item {line_item_id} not found in GAM")
-                    return False
-
-                line_item = line_items[0]
-
-                # Calculate new goal units based on pricing model
-                # Budget = (costPerUnit / 1000) * goal_units for CPM
-                # Budget = costPerUnit * goal_units for CPC
-                # Use helper function to handle both dict and object responses from GAM API
-                current_cost_per_unit_micro = self._safe_get_nested(line_item, "costPerUnit", "microAmount", default=0)
-                current_cost_per_unit = float(current_cost_per_unit_micro) / 1_000_000
-
-                if current_cost_per_unit <= 0:
-                    logger.error(f"Invalid costPerUnit for line item {line_item_id}: {current_cost_per_unit}")
-                    return False
-
-                # Calculate new goal units based on pricing model
-                if pricing_model in ["cpm", "vcpm"]:
-                    # CPM/VCPM: budget = (rate / 1000) * impressions → impressions = budget / (rate / 1000)
-                    new_goal_units = int((new_budget * 1000) / current_cost_per_unit)
-                elif pricing_model == "cpc":
-                    # CPC: budget = rate * clicks → clicks = budget / rate
-                    new_goal_units = int(new_budget / current_cost_per_unit)
-                elif pricing_model == "flat_rate":
-                    # FLAT_RATE: Keep existing goal units (100% for sponsorship)
-                    new_goal_units = self._safe_get_nested(line_item, "primaryGoal", "units", default=100)
+                    results[line_item_id] = "Line item not found in GAM"
+                    continue
+                new_budget, pricing_model = budgets[line_item_id]
+                error = self._set_budget_goal(line_item, new_budget, pricing_model)
+                if error:
+                    logger.error(f"Cannot update line item {line_item_id} budget: {error}")
+                    results[line_item_id] = error
                 else:
-                    logger.error(f"Unsupported pricing model for budget update: {pricing_model}")
-                    return False
+                    to_update.append(line_item)
+
+            results.update(self._update_line_items(to_update, max_retries))
+        return results
+
+    def _set_budget_goal(self, line_item: Any, new_budget: float, pricing_model: str) -> str | None:
+        """Set a line item's primaryGoal units for a new budget; returns an error message if it can't."""
+        # Budget = (costPerUnit / 1000) * goal_units for CPM
+        # Budget = costPerUnit * goal_units for CPC
+        # Use helper function to handle both dict and object responses from GAM API
+        current_cost_per_unit_micro = self._safe_get_nested(line_item, "costPerUnit", "microAmount", default=0)
+        current_cost_per_unit = float(current_cost_per_unit_micro) / 1_000_000
+
+        if current_cost_per_unit <= 0:
+            return f"Invalid costPerUnit: {current_cost_per_unit}"
+
+        if pricing_model in ["cpm", "vcpm"]:
+            # CPM/VCPM: budget = (rate / 1000) * impressions → impressions = budget / (rate / 1000)
+            new_goal_units = int((new_budget * 1000) / current_cost_per_unit)
+        elif pricing_model == "cpc":
+            # CPC: budget = rate * clicks → clicks = budget / rate
+            new_goal_units = int(new_budget / current_cost_per_unit)
+        elif pricing_model == "flat_rate":
+            # FLAT_RATE: Keep existing goal units (100% for sponsorship)
+            new_goal_units = self._safe_get_nested(line_item, "primaryGoal", "units", default=100)
+        else:
+            return f"Unsupported pricing model for budget update: {pricing_model}"
 
-                # Update line item (works for both dict and object)
-                if isinstance(line_item, dict):
-                    line_item["primaryGoal"]["units"] = new_goal_units
-                else:
-                    line_item.primaryGoal.units = new_goal_units
+        # Update line item (works for both dict and object)
+        if isinstance(line_item, dict):
+            line_item["primaryGoal"]["units"] = new_goal_units
+        else:
+            line_item.primaryGoal.units = new_goal_units
+        return None
 
-                # Update the line item in GAM
-                updated_line_items = line_item_service.updateLineItems([line_item])
+    def _update_line_items(self, line_items: list[Any], max_retries: int) -> dict[str, str | None]:
+        """Write line items with one updateLineItems call.
 
-                if updated_line_items:
-                    logger.info(
-                        f"✓ Updated line item {line_item_id} budget: ${new_budget} {currency} "
-                        f"(goal units: {new_goal_units}, pricing: {pricing_model})"
-                    )
-                    return True
-                else:
-                    logger.error(f"Failed to update line item {line_item_id} - GAM API returned no results")
-                    return False
+        updateLineItems is all-or-nothing, so when GAM rejects a batch its line items
+        are written one at a time to find out which of them it refuses.
+        """
+        if not line_items:
+            return {}
+        line_item_ids = [str(self._safe_get_nested(line_item, "id")) for line_item in line_items]
+        line_item_service = self.client_manager.get_service("LineItemService")
 
+        for attempt in range(max_retries):
+            try:
+                updated_line_items = line_item_service.updateLineItems(line_items)
             except Exception as e:
-                error_str = str(e)
-                # Check if this is a NO_FORECAST_YET error
-                if "NO_FORECAST_YET" in error_str and attempt < max_retries - 1:
+                # GAM needs time to forecast recently created line items
+                if "NO_FORECAST_YET" in str(e) and attempt < max_retries - 1:
                     # Wait with exponential backoff (capped at 30s)
                     # Sequence: 5s, 10s, 20s, 30s, 30s (total ~95s for 5 retries)
                     wait_time = min(5 * (2**attempt), 30)
                     logger.warning(
-                        f"⏳ Line item {line_item_id} forecasting not ready yet - retrying in {wait_time}s "
+                        f"⏳ Line items {line_item_ids} forecasting not ready yet - retrying in {wait_time}s "
                         f"(attempt {attempt + 1}/{max_retries})"
                     )
                     time.sleep(wait_time)
-                    continue  # Retry
-                else:
-                    # Non-retryable error or last attempt
-                    logger.error(f"Error updating line item {line_item_id} budget: {e}")
-                    return False
+                    continue
+                if len(line_items) == 1:
+                    logger.error(f"Error updating line item {line_item_ids[0]}: {e}")
+                    return {line_item_ids[0]: str(e)}
+                logger.warning(f"Updating {len(line_items)} line items failed ({e}) - retrying one at a time")
+                results: dict[str, str | None] = {}
+                for line_item in line_items:
+                    results.update(self._update_line_items([line_item], max_retries=1))
+                return results
+
+            if not updated_line_items:
+                logger.error(f"Failed to update line items {line_item_ids} - GAM API returned no results")
+                return dict.fromkeys(line_item_ids, "GAM API returned no results")
+            logger.info(f"✓ Updated {len(line_item_ids)} line items in GAM")
+            return dict.fromkeys(line_item_ids)
 
         # All retries exhausted
-        logger.error(f"Failed to update line item {line_item_id} budget after {max_retries} attempts")
-        return False
+        return dict.fromkeys(line_item_ids, f"Failed after {max_retries} attempts")
+
+    def _get_line_items_by_id(self, line_item_ids: list[str]) -> dict[str, Any]:
+        """Get line items by ID with one getLineItemsByStatement call, keyed by line item ID."""
+        line_item_service = self.client_manager.get_service("LineItemService")
+        result = line_item_service.getLineItemsByStatement(self._line_item_ids_statement(line_item_ids))
+        line_items = result.get("results", []) if isinstance(result, dict) else getattr(result, "results", [])
+        return {str(self._safe_get_nested(line_item, "id")): line_item for line_item in line_items or []}
+
+    def _line_item_ids_statement(self, line_item_ids: list[str]):
+        """Statement selecting line items by ID (at most LINE_ITEM_BATCH_SIZE of them)."""
+        # int() keeps the PQL literal list numeric; PQL has no list bind variables
+        id_list = ", ".join(str(int(line_item_id)) for line_item_id in line_item_ids)
+        statement_builder = ad_manager.StatementBuilder()
+        statement_builder.Where(f"id IN ({id_list})")
+        return statement_builder.ToStatement()
 
     def pause_line_item(self, line_item_id: str) -> bool:
-        """Pause line item in GAM by setting status to PAUSED.
+        """Pause line item in GAM.
 
         Args:
             line_item_id: GAM line item ID
@@ -1180,10 +1230,10 @@ class GAMOrdersManager:
         Returns:
             True if pause successful, False otherwise
         """
-        return self._update_line_item_status(line_item_id, "PAUSED")
+        return self.perform_line_item_action([line_item_id], "PauseLineItems")[line_item_id] is None
 
     def resume_line_item(self, line_item_id: str) -> bool:
-        """Resume line item in GAM by setting status to READY.
+        """Resume a paused line item in GAM.
 
         Args:
             line_item_id: GAM line item ID
@@ -1191,56 +1241,53 @@ class GAMOrdersManager:
         Returns:
             True if resume successful, False otherwise
         """
-        return self._update_line_item_status(line_item_id, "READY")
+        return self.perform_line_item_action([line_item_id], "ResumeLineItems")[line_item_id] is None
 
-    def _update_line_item_status(self, line_item_id: str, new_status: str) -> bool:
-        """Update line item status in GAM.
+    def perform_line_item_action(self, line_item_ids: list[str], action: str) -> dict[str, str | None]:
+        """Run a LineItemService action (PauseLineItems, ResumeLineItems, ...) on many line items.
+
+        Makes one performLineItemAction call per LINE_ITEM_BATCH_SIZE line items. Line items
+        already in the target state are left unchanged by GAM and count as done.
 
         Args:
-            line_item_id: GAM line item ID
-            new_status: New status (READY, PAUSED, etc.)
+            line_item_ids: GAM line item IDs
+            action: LineItemAction type
 
         Returns:
-            True if update successful, False otherwise
+            Error message per line item ID, None for line items the action was applied to
         """
         if self.dry_run:
-            logger.info(f"[DRY RUN] Would update line item {line_item_id} status to {new_status}")
-            return True
-
+            logger.info(f"[DRY RUN] Would call performLineItemAction({action}) for line items {line_item_ids}")
+            return dict.fromkeys(line_item_ids)
+
+        line_item_service = self.client_manager.get_service("LineItemService")
+        results: dict[str, str | None] = {}
+        for start in range(0, len(line_item_ids), LINE_ITEM_BATCH_SIZE):
+            batch_ids = line_item_ids[start : start + LINE_ITEM_BATCH_SIZE]
+            results.update(self._perform_line_item_action(line_item_service, action, batch_ids))
+        return results
+
+    def _perform_line_item_action(
+        self, line_item_service: Any, action: str, line_item_ids: list[str]
+    ) -> dict[str, str | None]:
         try:
-            line_item_service = self.client_manager.get_service("LineItemService")
-
-            # Get current line item
-            statement_builder = ad_manager.StatementBuilder()
-            statement_builder.Where("id = :lineItemId")
-            statement_builder.WithBindVariable("lineItemId", int(line_item_id))
-            statement = statement_builder.ToStatement()
-
-            result = line_item_service.getLineItemsByStatement(statement)
-            line_items = result.get("results", []) if isinstance(result, dict) else getattr(result, "results", [])
-
-            if not line_items:
-                logger.error(f"Line item {line_item_id} not found in GAM")
-                return False
-
-            line_item = line_items[0]
-
-            # Update status
-            line_item["status"] = new_status
-
-            # Update the line item in GAM
-            updated_line_items = line_item_service.updateLineItems([line_item])
-
-            if updated_line_items:
-                logger.info(f"✓ Updated line item {line_item_id} status to {new_status}")
-                return True
-            else:
-                logger.error(f"Failed to update line item {line_item_id} status - GAM API returned no results")
-                return False
-
+            result = line_item_service.performLineItemAction(
+                {"xsi_type": action}, self._line_item_ids_statement(line_item_ids)
+            )
         except Exception as e:
-            logger.error(f"Error updating line item {line_item_id} status: {e}")
-            return False
+            if len(line_item_ids) == 1:
+                logger.error(f"Error running {action} on line item {line_item_ids[0]}: {e}")
+                return {line_item_ids[0]: str(e)}
+            # The action is rejected as a whole; find out which line items GAM refuses
+            logger.warning(f"{action} failed for {len(line_item_ids)} line items ({e}) - retrying one at a time")
+            results: dict[str, str | None] = {}
+            for line_item_id in line_item_ids:
+                results.update(self._perform_line_item_action(line_item_service, action, [line_item_id]))
+            return results
+
+        num_changes = result.get("numChanges", 0) if isinstance(result, dict) else getattr(result, "numChanges", 0)
+        logger.info(f"✓ {action} changed {num_changes} of {len(line_item_ids)} line items")
+        return dict.fromkeys(line_item_ids)
 
     def get_advertisers(
         self, search_query: str | None = None, limit: int = 500, fetch_all: bool = False
@@ -14,19 +14,41 @@ This module provides:
 
 import json
 import os
+from collections import defaultdict
+from collections.abc import Callable, Iterator
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
 
 import pytz
 from googleads import ad_manager
-from zeep.helpers import serialize_object
 
-from src.adapters.gam.utils.error_handler import with_retry
+from src.adapters.gam.utils.error_handler import GAMError, with_retry
 from src.adapters.gam.utils.logging import logger
 from src.adapters.gam.utils.timeout_handler import timeout
 
+# Each statement page gets its own timeout and retries, so a slow page never restarts a whole discovery
+GAM_PAGE_TIMEOUT_SECONDS = 120
+
+R = TypeVar("R")
+
+
+def _field(gam_object: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a SOAP object or serialized dict, treating missing and null the same."""
+    try:
+        value = gam_object[name]
+    except KeyError:
+        return default
+    return default if value is None else value
+
+
+@with_retry(operation_name="fetch_gam_page")
+@timeout(seconds=GAM_PAGE_TIMEOUT_SECONDS)
+def _fetch_page(fetch: Callable[[dict[str, Any]], Any], statement: dict[str, Any]) -> Any:
+    """Fetch a single statement page from a GAM service."""
+    return fetch(statement)
+
 
 class AdUnitStatus(Enum):
     """Ad unit status in GAM."""
@@ -36,7 +58,7 @@ class AdUnitStatus(Enum):
     ARCHIVED = "ARCHIVED"
 
 
-@dataclass
+@dataclass(slots=True)
 class AdUnit:
     """Represents a GAM ad unit."""
 
@@ -60,38 +82,37 @@ class AdUnit:
         return data
 
     @classmethod
-    def from_gam_object(cls, gam_ad_unit: dict[str, Any]) -> "AdUnit":
-        """Create from GAM API response."""
+    def from_gam_object(cls, gam_ad_unit: Any) -> "AdUnit":
+        """Create from GAM API response (SOAP object or serialized dict)."""
         # Extract sizes from ad unit sizes
         sizes = []
-        if "adUnitSizes" in gam_ad_unit:
-            for size_obj in gam_ad_unit["adUnitSizes"]:
-                if "size" in size_obj:
-                    sizes.append({"width": size_obj["size"]["width"], "height": size_obj["size"]["height"]})
+        for size_obj in _field(gam_ad_unit, "adUnitSizes", []):
+            size = _field(size_obj, "size")
+            if size:
+                sizes.append({"width": size["width"], "height": size["height"]})
 
         # Build path from parent path + current name
-        path = []
-        if "parentPath" in gam_ad_unit:
-            path = [node["name"] for node in gam_ad_unit["parentPath"]]
+        path = [node["name"] for node in _field(gam_ad_unit, "parentPath", [])]
         path.append(gam_ad_unit["name"])
 
+        parent_id = _field(gam_ad_unit, "parentId")
         return cls(
             id=str(gam_ad_unit["id"]),
             name=gam_ad_unit["name"],
             ad_unit_code=gam_ad_unit["adUnitCode"],
-            parent_id=str(gam_ad_unit.get("parentId")) if gam_ad_unit.get("parentId") else None,
+            parent_id=str(parent_id) if parent_id else None,
             status=AdUnitStatus.ACTIVE,  # Default all ad units to active
-            description=gam_ad_unit.get("description"),
-            target_window=gam_ad_unit.get("targetWindow"),
-            effective_applied_labels=[str(label["labelId"]) for label in gam_ad_unit.get("appliedLabels", [])],
-            explicitly_targeted=gam_ad_unit.get("explicitlyTargeted", False),
-            has_children=gam_ad_unit.get("hasChildren", False),
+            description=_field(gam_ad_unit, "description"),
+            target_window=_field(gam_ad_unit, "targetWindow"),
+            effective_applied_labels=[str(label["labelId"]) for label in _field(gam_ad_unit, "appliedLabels", [])],
+            explicitly_targeted=_field(gam_ad_unit, "explicitlyTargeted", False),
+            has_children=_field(gam_ad_unit, "hasChildren", False),
             path=path,
             sizes=sizes,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Placement:
     """Represents a GAM placement."""
 
@@ -109,21 +130,21 @@ class Placement:
         return asdict(self)
 
     @classmethod
-    def from_gam_object(cls, gam_placement: dict[str, Any]) -> "Placement":
-        """Create from GAM API response."""
+    def from_gam_object(cls, gam_placement: Any) -> "Placement":
+        """Create from GAM API response (SOAP object or serialized dict)."""
         return cls(
             id=str(gam_placement["id"]),
             name=gam_placement["name"],
-            description=gam_placement.get("description"),
+            description=_field(gam_placement, "description"),
             placement_code=gam_placement["placementCode"],
             status=gam_placement["status"],
-            is_ad_sense_targeting_enabled=gam_placement.get("isAdSenseTargetingEnabled", False),
-            ad_unit_ids=[str(id) for id in gam_placement.get("targetedAdUnitIds", [])],
-            targeting_description=gam_placement.get("targetingDescription"),
+            is_ad_sense_targeting_enabled=_field(gam_placement, "isAdSenseTargetingEnabled", False),
+            ad_unit_ids=[str(id) for id in _field(gam_placement, "targetedAdUnitIds", [])],
+            targeting_description=_field(gam_placement, "targetingDescription"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Label:
     """Represents a GAM label for targeting."""
 
@@ -139,19 +160,20 @@ class Label:
         return asdict(self)
 
     @classmethod
-    def from_gam_object(cls, gam_label: dict[str, Any]) -> "Label":
-        """Create from GAM API response."""
+    def from_gam_object(cls, gam_label: Any) -> "Label":
+        """Create from GAM API response (SOAP object or serialized dict)."""
+        types = _field(gam_label, "types")
         return cls(
             id=str(gam_label["id"]),
             name=gam_label["name"],
-            description=gam_label.get("description"),
+            description=_field(gam_label, "description"),
             is_active=gam_label["isActive"],
-            ad_category=gam_label.get("adCategory"),
-            label_type=gam_label["types"][0] if gam_label.get("types") else "UNKNOWN",
+            ad_category=_field(gam_label, "adCategory"),
+            label_type=types[0] if types else "UNKNOWN",
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomTargetingKey:
     """Represents a GAM custom targeting key."""
 
@@ -167,19 +189,19 @@ class CustomTargetingKey:
         return asdict(self)
 
     @classmethod
-    def from_gam_object(cls, gam_key: dict[str, Any]) -> "CustomTargetingKey":
-        """Create from GAM API response."""
+    def from_gam_object(cls, gam_key: Any) -> "CustomTargetingKey":
+        """Create from GAM API response (SOAP object or serialized dict)."""
         return cls(
             id=str(gam_key["id"]),
             name=gam_key["name"],
-            display_name=gam_key.get("displayName", gam_key["name"]),
+            display_name=_field(gam_key, "displayName", gam_key["name"]),
             type=gam_key["type"],
-            status=gam_key.get("status", "ACTIVE"),
-            reportable_type=gam_key.get("reportableType"),
+            status=_field(gam_key, "status", "ACTIVE"),
+            reportable_type=_field(gam_key, "reportableType"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomTargetingValue:
     """Represents a GAM custom targeting value."""
 
@@ -195,19 +217,19 @@ class CustomTargetingValue:
         return asdict(self)
 
     @classmethod
-    def from_gam_object(cls, gam_value: dict[str, Any]) -> "CustomTargetingValue":
-        """Create from GAM API response."""
+    def from_gam_object(cls, gam_value: Any) -> "CustomTargetingValue":
+        """Create from GAM API response (SOAP object or serialized dict)."""
         return cls(
             id=str(gam_value["id"]),
             custom_targeting_key_id=str(gam_value["customTargetingKeyId"]),
             name=gam_value["name"],
-            display_name=gam_value.get("displayName", gam_value["name"]),
-            match_type=gam_value.get("matchType", "EXACT"),
-            status=gam_value.get("status", "ACTIVE"),
+            display_name=_field(gam_value, "displayName", gam_value["name"]),
+            match_type=_field(gam_value, "matchType", "EXACT"),
+            status=_field(gam_value, "status", "ACTIVE"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AudienceSegment:
     """Represents a GAM audience segment (first-party or third-party)."""
 
@@ -226,23 +248,29 @@ class AudienceSegment:
         return asdict(self)
 
     @classmethod
-    def from_gam_object(cls, gam_segment: dict[str, Any]) -> "AudienceSegment":
-        """Create from GAM API response."""
+    def from_gam_object(cls, gam_segment: Any) -> "AudienceSegment":
+        """Create from GAM API response (SOAP object or serialized dict)."""
         return cls(
             id=str(gam_segment["id"]),
             name=gam_segment["name"],
-            description=gam_segment.get("description"),
-            category_ids=[str(cat_id) for cat_id in gam_segment.get("categoryIds", [])],
-            type=gam_segment.get("type", "UNKNOWN"),
-            size=gam_segment.get("size"),
-            data_provider_name=gam_segment.get("dataProviderName"),
-            status=gam_segment.get("status", "ACTIVE"),
-            segment_type=gam_segment.get("segmentType", "UNKNOWN"),
+            description=_field(gam_segment, "description"),
+            category_ids=[str(cat_id) for cat_id in _field(gam_segment, "categoryIds", [])],
+            type=_field(gam_segment, "type", "UNKNOWN"),
+            size=_field(gam_segment, "size"),
+            data_provider_name=_field(gam_segment, "dataProviderName"),
+            status=_field(gam_segment, "status", "ACTIVE"),
+            segment_type=_field(gam_segment, "segmentType", "UNKNOWN"),
         )
 
 
 class GAMInventoryDiscovery:
-    """Discovers and syncs GAM inventory configuration."""
+    """Discovers and syncs GAM inventory configuration.
+
+    The ``iter_*`` methods stream records page by page without keeping them on the
+    instance, so a sync can hand each page to the database writer and drop it. The
+    ``discover_*`` methods collect the same records into the in-memory model used by
+    the ad unit tree, suggestions and the file cache.
+    """
 
     def __init__(self, client: ad_manager.AdManagerClient, tenant_id: str):
         self.client = client
@@ -255,22 +283,46 @@ class GAMInventoryDiscovery:
         self.audience_segments: dict[str, AudienceSegment] = {}
         self.last_sync: datetime | None = None
 
-    @timeout(seconds=600)  # 10 minute timeout for ad units (same as placements)
-    @with_retry(operation_name="discover_ad_units")
-    def discover_ad_units(self, since: datetime | None = None) -> list[AdUnit]:
-        """
-        Discover ad units in the GAM network using flat pagination (no recursion).
+    @staticmethod
+    def _utc(since: datetime) -> datetime:
+        """Ensure a timezone-aware datetime for the GAM API (pytz for GAM compatibility)."""
+        if since.tzinfo is None:
+            return pytz.utc.localize(since)
+        # Convert to pytz timezone if using datetime.timezone.UTC
+        return since.astimezone(pytz.utc)
+
+    def _iter_pages(
+        self,
+        fetch: Callable[[dict[str, Any]], Any],
+        statement_builder: ad_manager.StatementBuilder,
+        record: Callable[[Any], R],
+        limit: int | None = None,
+    ) -> Iterator[list[R]]:
+        """Yield one list of records per statement page, stopping after ``limit`` records."""
+        fetched = 0
+        while True:
+            response = _fetch_page(fetch, statement_builder.ToStatement())
+            results = response["results"] if "results" in response else None
+            if not results:
+                return
+
+            page = [record(result) for result in results]
+            if limit:
+                page = page[: limit - fetched]
+            fetched += len(page)
+            yield page
+
+            if limit and fetched >= limit:
+                return
+            statement_builder.offset += len(results)
+
+    def iter_ad_units(self, since: datetime | None = None) -> Iterator[list[AdUnit]]:
+        """Stream active ad units (excludes ARCHIVED) page by page.
 
         Args:
             since: Optional datetime to fetch only items modified since this time (incremental sync)
-
-        Returns:
-            List of discovered ad units (active only - excludes ARCHIVED)
         """
-        logger.info(f"Discovering ad units (incremental={since is not None})")
-
         inventory_service = self.client.GetService("InventoryService")
-        discovered_units = []
 
         # Build statement to query ACTIVE ad units only (excludes ARCHIVED to reduce sync time)
         statement_builder = ad_manager.StatementBuilder(version="v202505")
@@ -278,13 +330,7 @@ class GAMInventoryDiscovery:
 
         # Add incremental sync filter if requested
         if since:
-            # Ensure timezone-aware datetime for GAM API (use pytz for GAM compatibility)
-            if since.tzinfo is None:
-                since = pytz.utc.localize(since)
-            else:
-                # Convert to pytz timezone if using datetime.timezone.UTC
-                since = since.astimezone(pytz.utc)
-
+            since = self._utc(since)
             statement_builder = (
                 statement_builder.Where("lastModifiedDateTime > :since AND status != :archived")
                 .WithBindVariable("since", since)
@@ -292,79 +338,95 @@ class GAMInventoryDiscovery:
             )
             logger.info(f"Incremental sync: fetching ad units modified since {since} (active only)")
 
-        # Page through results
-        while True:
-            response = inventory_service.getAdUnitsByStatement(statement_builder.ToStatement())
+        yield from self._iter_pages(inventory_service.getAdUnitsByStatement, statement_builder, AdUnit.from_gam_object)
+
+    @timeout(seconds=600)  # 10 minute timeout for ad units (same as placements)
+    def discover_ad_units(self, since: datetime | None = None) -> list[AdUnit]:
+        """
+        Discover ad units in the GAM network using flat pagination (no recursion).
+
+        Args:
+            since: Optional datetime to fetch only items modified since this time (incremental sync)
 
-            if "results" in response and response["results"]:
-                for gam_ad_unit in response["results"]:
-                    # Convert SUDS object to dictionary
-                    gam_ad_unit_dict = serialize_object(gam_ad_unit)
-                    ad_unit = AdUnit.from_gam_object(gam_ad_unit_dict)
-                    discovered_units.append(ad_unit)
-                    self.ad_units[ad_unit.id] = ad_unit
+        Returns:
+            List of discovered ad units (active only - excludes ARCHIVED)
+        """
+        logger.info(f"Discovering ad units (incremental={since is not None})")
 
-                statement_builder.offset += len(response["results"])
-            else:
-                break
+        discovered_units = []
+        for page in self.iter_ad_units(since):
+            for ad_unit in page:
+                self.ad_units[ad_unit.id] = ad_unit
+            discovered_units.extend(page)
 
         logger.info(f"Discovered {len(discovered_units)} ad units")
         return discovered_units
 
-    @timeout(seconds=600)  # 10 minute timeout for placements (AccuWeather has large dataset)
-    @with_retry(operation_name="discover_placements")
-    def discover_placements(self, since: datetime | None = None) -> list[Placement]:
-        """Discover placements in the GAM network.
+    def iter_placements(self, since: datetime | None = None) -> Iterator[list[Placement]]:
+        """Stream active placements (excludes ARCHIVED) page by page.
 
         Args:
             since: Optional datetime to fetch only items modified since this time (incremental sync)
-
-        Returns:
-            List of placements (active only - excludes ARCHIVED)
         """
-        logger.info(f"Discovering placements (incremental={since is not None})")
-
         placement_service = self.client.GetService("PlacementService")
-        discovered_placements = []
 
         # Filter out ARCHIVED placements
         statement_builder = ad_manager.StatementBuilder(version="v202505")
         statement_builder = statement_builder.Where("status != :archived").WithBindVariable("archived", "ARCHIVED")
 
         if since:
-            # Ensure timezone-aware datetime for GAM API (use pytz for GAM compatibility)
-            if since.tzinfo is None:
-                since = pytz.utc.localize(since)
-            else:
-                # Convert to pytz timezone if using datetime.timezone.UTC
-                since = since.astimezone(pytz.utc)
-
             statement_builder = (
                 statement_builder.Where("lastModifiedDateTime > :since AND status != :archived")
-                .WithBindVariable("since", since)
+                .WithBindVariable("since", self._utc(since))
                 .WithBindVariable("archived", "ARCHIVED")
             )
 
-        while True:
-            response = placement_service.getPlacementsByStatement(statement_builder.ToStatement())
+        yield from self._iter_pages(
+            placement_service.getPlacementsByStatement, statement_builder, Placement.from_gam_object
+        )
+
+    @timeout(seconds=600)  # 10 minute timeout for placements (AccuWeather has large dataset)
+    def discover_placements(self, since: datetime | None = None) -> list[Placement]:
+        """Discover placements in the GAM network.
 
-            if "results" in response and response["results"]:
-                for gam_placement in response["results"]:
-                    # Convert SUDS object to dictionary
-                    gam_placement_dict = serialize_object(gam_placement)
-                    placement = Placement.from_gam_object(gam_placement_dict)
-                    discovered_placements.append(placement)
-                    self.placements[placement.id] = placement
+        Args:
+            since: Optional datetime to fetch only items modified since this time (incremental sync)
 
-                statement_builder.offset += len(response["results"])
-            else:
-                break
+        Returns:
+            List of placements (active only - excludes ARCHIVED)
+        """
+        logger.info(f"Discovering placements (incremental={since is not None})")
+
+        discovered_placements = []
+        for page in self.iter_placements(since):
+            for placement in page:
+                self.placements[placement.id] = placement
+            discovered_placements.extend(page)
 
         logger.info(f"Discovered {len(discovered_placements)} placements")
         return discovered_placements
 
+    def iter_labels(self) -> Iterator[list[Label]]:
+        """Stream all labels page by page.
+
+        GAM LabelService doesn't support lastModifiedDateTime filtering, so this always
+        fetches all labels (they're usually few and rarely change).
+        """
+        label_service = self.client.GetService("LabelService")
+        statement_builder = ad_manager.StatementBuilder(version="v202505")
+
+        try:
+            yield from self._iter_pages(label_service.getLabelsByStatement, statement_builder, Label.from_gam_object)
+        except GAMError as e:
+            # Handle googleads library bug with error parsing when no labels exist
+            # Error: "argument should be integer or bytes-like object, not 'str'"
+            # This happens when GAM returns a SOAP fault and googleads library fails to parse it
+            if "argument should be integer or bytes-like object" in str(e):
+                logger.info("No labels found in GAM account (or empty result set)")
+                return
+            raise
+
     @timeout(seconds=300)  # 5 minute timeout for labels
-    @with_retry(operation_name="discover_labels")
     def discover_labels(self, since: datetime | None = None) -> list[Label]:
         """Discover labels (for competitive exclusion, etc.).
 
@@ -375,48 +437,59 @@ class GAMInventoryDiscovery:
         """
         logger.info(f"Discovering labels (incremental={since is not None}, note: always fetches all labels)")
 
-        label_service = self.client.GetService("LabelService")
         discovered_labels = []
+        for page in self.iter_labels():
+            for label in page:
+                self.labels[label.id] = label
+            discovered_labels.extend(page)
 
+        logger.info(f"Discovered {len(discovered_labels)} labels")
+        return discovered_labels
+
+    def iter_custom_targeting_keys(self) -> Iterator[list[CustomTargetingKey]]:
+        """Stream all custom targeting keys page by page.
+
+        GAM CustomTargetingService doesn't support lastModifiedDateTime filtering, so this
+        always fetches all keys (acceptable as keys are few and small).
+        """
+        custom_targeting_service = self.client.GetService("CustomTargetingService")
         statement_builder = ad_manager.StatementBuilder(version="v202505")
 
-        # Note: LabelService doesn't support lastModifiedDateTime filtering in GAM API
-        # So we always fetch all labels, even during incremental sync
-        # This is acceptable because:
-        # 1. Labels don't change frequently
-        # 2. There are usually few labels per network
-        # 3. The fetch is fast
+        yield from self._iter_pages(
+            custom_targeting_service.getCustomTargetingKeysByStatement,
+            statement_builder,
+            CustomTargetingKey.from_gam_object,
+        )
 
-        try:
-            while True:
-                response = label_service.getLabelsByStatement(statement_builder.ToStatement())
-
-                if "results" in response and response["results"]:
-                    for gam_label in response["results"]:
-                        # Convert SUDS object to dictionary
-                        gam_label_dict = serialize_object(gam_label)
-                        label = Label.from_gam_object(gam_label_dict)
-                        discovered_labels.append(label)
-                        self.labels[label.id] = label
-
-                    statement_builder.offset += len(response["results"])
-                else:
-                    break
-        except TypeError as e:
-            # Handle googleads library bug with error parsing when no labels exist
-            # Error: "argument should be integer or bytes-like object, not 'str'"
-            # This happens when GAM returns a SOAP fault and googleads library fails to parse it
-            if "argument should be integer or bytes-like object" in str(e):
-                logger.info("No labels found in GAM account (or empty result set)")
-                return []
-            else:
-                raise
+    def iter_custom_targeting_values(
+        self, key_id: str, max_values: int | None = None
+    ) -> Iterator[list[CustomTargetingValue]]:
+        """Stream the values of one custom targeting key page by page.
 
-        logger.info(f"Discovered {len(discovered_labels)} labels")
-        return discovered_labels
+        Args:
+            key_id: The custom targeting key ID
+            max_values: Optional maximum number of values to fetch
+        """
+        custom_targeting_service = self.client.GetService("CustomTargetingService")
+
+        statement_builder = (
+            ad_manager.StatementBuilder(version="v202505")
+            .Where("customTargetingKeyId = :keyId")
+            .WithBindVariable("keyId", int(key_id))
+        )
+
+        # Apply limit if specified
+        if max_values:
+            statement_builder.limit = max_values
+
+        yield from self._iter_pages(
+            custom_targeting_service.getCustomTargetingValuesByStatement,
+            statement_builder,
+            CustomTargetingValue.from_gam_object,
+            limit=max_values,
+        )
 
     @timeout(seconds=600)  # 10 minute timeout for custom targeting (can have 10k+ values per key)
-    @with_retry(operation_name="discover_custom_targeting")
     def discover_custom_targeting(
         self, max_values_per_key: int | None = None, fetch_values: bool = True, since: datetime | None = None
     ) -> dict[str, Any]:
@@ -436,35 +509,12 @@ class GAMInventoryDiscovery:
             + (" (note: always fetches all keys)" if since else "")
         )
 
-        custom_targeting_service = self.client.GetService("CustomTargetingService")
         discovered_keys = []
-
-        # Discover keys first
-        statement_builder = ad_manager.StatementBuilder(version="v202505")
-
-        # Note: CustomTargetingService doesn't support lastModifiedDateTime filtering in GAM API
-        # So we always fetch all keys, even during incremental sync
-        # This is acceptable because:
-        # 1. Custom targeting keys don't change frequently
-        # 2. There are usually a modest number of keys per network (<1000)
-        # 3. The fetch is reasonably fast
-        # 4. Keys are small objects
-
-        while True:
-            response = custom_targeting_service.getCustomTargetingKeysByStatement(statement_builder.ToStatement())
-
-            if "results" in response and response["results"]:
-                for gam_key in response["results"]:
-                    # Convert SUDS object to dictionary
-                    gam_key_dict = serialize_object(gam_key)
-                    key = CustomTargetingKey.from_gam_object(gam_key_dict)
-                    discovered_keys.append(key)
-                    self.custom_targeting_keys[key.id] = key
-                    self.custom_targeting_values[key.id] = []
-
-                statement_builder.offset += len(response["results"])
-            else:
-                break
+        for page in self.iter_custom_targeting_keys():
+            for key in page:
+                self.custom_targeting_keys[key.id] = key
+                self.custom_targeting_values[key.id] = []
+            discovered_keys.extend(page)
 
         logger.info(f"Discovered {len(discovered_keys)} custom targeting keys")
 
@@ -515,62 +565,26 @@ class GAMInventoryDiscovery:
             key_id: The custom targeting key ID
             max_values: Optional maximum number of values to fetch
         """
-        custom_targeting_service = self.client.GetService("CustomTargetingService")
         discovered_values = []
+        for page in self.iter_custom_targeting_values(key_id, max_values):
+            discovered_values.extend(page)
 
-        statement_builder = (
-            ad_manager.StatementBuilder(version="v202505")
-            .Where("customTargetingKeyId = :keyId")
-            .WithBindVariable("keyId", int(key_id))
-        )
-
-        # Apply limit if specified
-        if max_values:
-            statement_builder.limit = max_values
-
-        while True:
-            response = custom_targeting_service.getCustomTargetingValuesByStatement(statement_builder.ToStatement())
-
-            if "results" in response and response["results"]:
-                for gam_value in response["results"]:
-                    # Convert SUDS object to dictionary
-                    gam_value_dict = serialize_object(gam_value)
-                    value = CustomTargetingValue.from_gam_object(gam_value_dict)
-                    discovered_values.append(value)
-
-                    # Check if we've hit the limit
-                    if max_values and len(discovered_values) >= max_values:
-                        logger.info(f"Reached limit of {max_values} values for key {key_id}")
-                        return discovered_values
-
-                statement_builder.offset += len(response["results"])
-            else:
-                break
-
+        if max_values and len(discovered_values) >= max_values:
+            logger.info(f"Reached limit of {max_values} values for key {key_id}")
         return discovered_values
 
-    @with_retry(operation_name="discover_audience_segments")
-    def discover_audience_segments(
+    def iter_audience_segments(
         self, max_segments: int | None = None, since: datetime | None = None
-    ) -> list[AudienceSegment]:
-        """Discover audience segments (first-party only - skips 3rd party to reduce sync time).
+    ) -> Iterator[list[AudienceSegment]]:
+        """Stream first-party audience segments page by page (3rd party segments excluded).
 
         Args:
             max_segments: Optional maximum number of segments to fetch
             since: Optional datetime to fetch only items modified since this time (incremental sync)
-
-        Returns:
-            List of first-party audience segments only (3rd party segments excluded)
         """
-        logger.info(
-            f"Discovering audience segments (first-party only, incremental={since is not None})"
-            + (f" (max {max_segments})" if max_segments else "")
-        )
-
         # Note: The exact service and method names may vary based on GAM API version
         # This is a representative implementation
         audience_segment_service = self.client.GetService("AudienceSegmentService")
-        discovered_segments = []
 
         # Only fetch FIRST_PARTY segments (skip THIRD_PARTY to massively reduce sync time)
         # Google makes all 3rd party segments available to everyone, so they're huge and not tenant-specific
@@ -578,16 +592,9 @@ class GAMInventoryDiscovery:
         statement_builder = statement_builder.Where("type = :type").WithBindVariable("type", "FIRST_PARTY")
 
         if since:
-            # Ensure timezone-aware datetime for GAM API (use pytz for GAM compatibility)
-            if since.tzinfo is None:
-                since = pytz.utc.localize(since)
-            else:
-                # Convert to pytz timezone if using datetime.timezone.UTC
-                since = since.astimezone(pytz.utc)
-
             statement_builder = (
                 statement_builder.Where("lastModifiedDateTime > :since AND type = :type")
-                .WithBindVariable("since", since)
+                .WithBindVariable("since", self._utc(since))
                 .WithBindVariable("type", "FIRST_PARTY")
             )
 
@@ -595,60 +602,66 @@ class GAMInventoryDiscovery:
         if max_segments:
             statement_builder.limit = max_segments
 
-        while True:
-            try:
-                response = audience_segment_service.getAudienceSegmentsByStatement(statement_builder.ToStatement())
-
-                if "results" in response and response["results"]:
-                    for gam_segment in response["results"]:
-                        # Convert SUDS object to dictionary
-                        gam_segment_dict = serialize_object(gam_segment)
-                        segment = AudienceSegment.from_gam_object(gam_segment_dict)
-                        discovered_segments.append(segment)
-                        self.audience_segments[segment.id] = segment
-
-                        # Check if we've hit the limit
-                        if max_segments and len(discovered_segments) >= max_segments:
-                            logger.info(f"Reached limit of {max_segments} audience segments")
-                            return discovered_segments
-
-                    statement_builder.offset += len(response["results"])
-                else:
-                    break
-            except Exception as e:
-                logger.warning(f"Could not discover audience segments: {e}")
-                # Some GAM networks may not have audience segments enabled
-                break
+        try:
+            yield from self._iter_pages(
+                audience_segment_service.getAudienceSegmentsByStatement,
+                statement_builder,
+                AudienceSegment.from_gam_object,
+                limit=max_segments,
+            )
+        except Exception as e:
+            # Some GAM networks may not have audience segments enabled
+            logger.warning(f"Could not discover audience segments: {e}")
 
+    def discover_audience_segments(
+        self, max_segments: int | None = None, since: datetime | None = None
+    ) -> list[AudienceSegment]:
+        """Discover audience segments (first-party only - skips 3rd party to reduce sync time).
+
+        Args:
+            max_segments: Optional maximum number of segments to fetch
+            since: Optional datetime to fetch only items modified since this time (incremental sync)
+
+        Returns:
+            List of first-party audience segments only (3rd party segments excluded)
+        """
+        logger.info(
+            f"Discovering audience segments (first-party only, incremental={since is not None})"
+            + (f" (max {max_segments})" if max_segments else "")
+        )
+
+        discovered_segments = []
+        for page in self.iter_audience_segments(max_segments, since):
+            for segment in page:
+                self.audience_segments[segment.id] = segment
+            discovered_segments.extend(page)
+
+        if max_segments and len(discovered_segments) >= max_segments:
+            logger.info(f"Reached limit of {max_segments} audience segments")
         logger.info(f"Discovered {len(discovered_segments)} audience segments")
         return discovered_segments
 
     def build_ad_unit_tree(self) -> dict[str, Any]:
-        """Build hierarchical tree structure of ad units."""
-        # Find root units (no parent)
-        root_units = [unit for unit in self.ad_units.values() if unit.parent_id is None]
+        """Build hierarchical tree structure of ad units from the discovered in-memory model."""
+        # Index children once so the tree builds in linear time
+        children_by_parent: dict[str | None, list[AdUnit]] = defaultdict(list)
+        for unit in self.ad_units.values():
+            children_by_parent[unit.parent_id].append(unit)
 
         def build_node(unit: AdUnit) -> dict[str, Any]:
-            children: list[dict[str, Any]] = []
-            node: dict[str, Any] = {
+            return {
                 "id": unit.id,
                 "name": unit.name,
                 "code": unit.ad_unit_code,
                 "status": unit.status.value,
                 "sizes": unit.sizes,
                 "explicitly_targeted": unit.explicitly_targeted,
-                "children": children,
+                "children": [build_node(child) for child in children_by_parent.get(unit.id, [])],
             }
 
-            # Find children
-            for child_unit in self.ad_units.values():
-                if child_unit.parent_id == unit.id:
-                    children.append(build_node(child_unit))
-
-            return node
-
         tree = {
-            "root_units": [build_node(unit) for unit in root_units],
+            # Root units have no parent
+            "root_units": [build_node(unit) for unit in children_by_parent.get(None, [])],
             "total_units": len(self.ad_units),
             "last_sync": self.last_sync.isoformat() if self.last_sync else None,
         }
@@ -8,11 +8,14 @@ This module provides:
 - Performance metrics tracking
 """
 
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+import pytz
 from googleads import ad_manager
 from zeep.helpers import serialize_object
 
@@ -123,6 +126,63 @@ class LineItemStatus(Enum):
     ACTIVE = "ACTIVE"  # Active line items (fallback status)
 
 
+# Status partitions paged concurrently on each sync. Values are GAM's own
+# OrderStatus / ComputedStatus names; the catch-all partition (None) picks up
+# anything not listed so a status added by GAM is never silently skipped.
+ORDER_STATUS_PARTITIONS: list[tuple[str, ...] | None] = [
+    ("DRAFT", "PENDING_APPROVAL"),
+    ("APPROVED",),
+    ("PAUSED",),
+    ("CANCELED", "DISAPPROVED"),
+    ("DELETED",),
+    None,
+]
+LINE_ITEM_STATUS_PARTITIONS: list[tuple[str, ...] | None] = [
+    ("DELIVERING", "DELIVERY_EXTENDED"),
+    ("READY",),
+    ("PAUSED", "PAUSED_INVENTORY_RELEASED"),
+    ("COMPLETED",),
+    ("DRAFT", "PENDING_APPROVAL"),
+    ("INACTIVE", "CANCELED", "DISAPPROVED"),
+    None,
+]
+# Delivery stats move without bumping lastModifiedDateTime: always refetched
+ALWAYS_REFRESHED_LINE_ITEM_PARTITIONS = [("DELIVERING", "DELIVERY_EXTENDED"), ("READY",)]
+PARTITION_CONCURRENCY = 4
+
+
+def _status_clause(partition: tuple[str, ...] | None, partitions: list[tuple[str, ...] | None]) -> str:
+    """PQL filter for a status partition; None is every status not in a named partition."""
+    if partition is not None:
+        return "status IN (" + ", ".join(f"'{status}'" for status in partition) + ")"
+    return " AND ".join(f"status != '{status}'" for p in partitions if p is not None for status in p)
+
+
+def _partition_filters(
+    partitions: list[tuple[str, ...] | None], limit: int | None
+) -> list[tuple[tuple[str, ...] | None, list[str]]]:
+    """(partition, where clauses) pairs to page; a capped fetch reads one unpartitioned statement."""
+    if limit is not None:
+        return [(None, [])]
+    return [(partition, [_status_clause(partition, partitions)]) for partition in partitions]
+
+
+def _since_filter(since: datetime | None) -> tuple[list[str], dict[str, Any]]:
+    """PQL clause and bind variable for an incremental (lastModifiedDateTime) sync."""
+    if since is None:
+        return [], {}
+    # Ensure timezone-aware datetime for GAM API (use pytz for GAM compatibility)
+    since = pytz.utc.localize(since) if since.tzinfo is None else since.astimezone(pytz.utc)
+    return ["lastModifiedDateTime >= :since"], {"since": since}
+
+
+def _gam_object_id(gam_object: Any) -> str:
+    try:
+        return str(getattr(gam_object, "id", None) or gam_object["id"])
+    except Exception:
+        return "unknown"
+
+
 @dataclass
 class Order:
     """Represents a GAM order."""
@@ -506,121 +566,161 @@ class GAMOrdersDiscovery:
         self.line_items: dict[str, LineItem] = {}
         self.last_sync: datetime | None = None
 
-    @with_retry()
     @log_gam_operation(GAMOperation.GET_REPORT, "Order")
-    def discover_orders(self, limit: int | None = None) -> list[Order]:
+    def discover_orders(self, limit: int | None = None, since: datetime | None = None) -> list[Order]:
         """
-        Discover all orders from GAM.
+        Discover orders from GAM, paging the status partitions in parallel.
 
         Args:
-            limit: Optional limit on number of orders to fetch
+            limit: Optional limit on number of orders to fetch (fetched unpartitioned)
+            since: Optional datetime to fetch only orders modified since this time (incremental sync)
 
         Returns:
             List of discovered orders
         """
-        logger.info(f"Discovering orders for tenant {self.tenant_id}")
-
-        order_service = self.client.GetService("OrderService", version="v202505")
+        logger.info(f"Discovering orders for tenant {self.tenant_id} (incremental={since is not None})")
 
-        # Build statement to get all orders
-        statement_builder = ad_manager.StatementBuilder(version="v202505")
-        if limit:
-            statement_builder.limit = limit
+        since_clauses, since_variables = _since_filter(since)
+        statements = [
+            (status_clauses + since_clauses, since_variables)
+            for _, status_clauses in _partition_filters(ORDER_STATUS_PARTITIONS, limit)
+        ]
+        gam_orders = self._fetch_statements("OrderService", "getOrdersByStatement", statements, limit)
 
         discovered_orders = []
-
-        while True:
-            response = order_service.getOrdersByStatement(statement_builder.ToStatement())
-
-            if "results" in response and response["results"]:
-                for gam_order in response["results"]:
-                    try:
-                        # Serialize SUDS object to dict
-                        order_dict = serialize_object(gam_order)
-                        order = Order.from_gam_object(order_dict)
-                        self.orders[order.order_id] = order
-                        discovered_orders.append(order)
-                    except Exception as e:
-                        order_id = "unknown"
-                        try:
-                            order_id = str(getattr(gam_order, "id", "unknown"))
-                        except:
-                            pass
-                        logger.error(f"Error processing order {order_id}: {e}")
-                        continue
-
-                statement_builder.offset += len(response["results"])
-                logger.info(f"Fetched {len(response['results'])} orders (total: {len(discovered_orders)})")
-            else:
-                break
+        for gam_order in gam_orders:
+            try:
+                # Serialize SUDS object to dict
+                order = Order.from_gam_object(serialize_object(gam_order))
+            except Exception as e:
+                logger.error(f"Error processing order {_gam_object_id(gam_order)}: {e}")
+                continue
+            self.orders[order.order_id] = order
+            discovered_orders.append(order)
 
         logger.info(f"Discovered {len(discovered_orders)} orders")
         return discovered_orders
 
-    @with_retry()
     @log_gam_operation(GAMOperation.GET_REPORT, "LineItem")
-    def discover_line_items(self, order_id: str | None = None, limit: int | None = None) -> list[LineItem]:
+    def discover_line_items(
+        self, order_id: str | None = None, limit: int | None = None, since: datetime | None = None
+    ) -> list[LineItem]:
         """
-        Discover line items from GAM.
+        Discover line items from GAM, paging the status partitions in parallel.
+
+        Delivery stats change without touching lastModifiedDateTime, so an
+        incremental sync still refetches every line item that is delivering.
 
         Args:
             order_id: Optional order ID to filter by
-            limit: Optional limit on number of line items to fetch
+            limit: Optional limit on number of line items to fetch (fetched unpartitioned)
+            since: Optional datetime to fetch only line items modified since this time (incremental sync)
 
         Returns:
             List of discovered line items
         """
         logger.info(
-            f"Discovering line items for tenant {self.tenant_id}" + (f" (order: {order_id})" if order_id else "")
+            f"Discovering line items for tenant {self.tenant_id} (incremental={since is not None})"
+            + (f" (order: {order_id})" if order_id else "")
         )
 
-        line_item_service = self.client.GetService("LineItemService", version="v202505")
-
-        # Build statement to get line items
-        statement_builder = ad_manager.StatementBuilder(version="v202505")
+        clauses: list[str] = []
+        bind_variables: dict[str, Any] = {}
         if order_id:
-            statement_builder.Where("orderId = :orderId").WithBindVariable("orderId", int(order_id))
-        if limit:
-            statement_builder.limit = limit
+            clauses.append("orderId = :orderId")
+            bind_variables["orderId"] = int(order_id)
+
+        since_clauses, since_variables = _since_filter(since)
+        statements = []
+        for partition, status_clauses in _partition_filters(LINE_ITEM_STATUS_PARTITIONS, limit):
+            if partition in ALWAYS_REFRESHED_LINE_ITEM_PARTITIONS:
+                statements.append((clauses + status_clauses, bind_variables))
+            else:
+                statements.append((clauses + status_clauses + since_clauses, {**bind_variables, **since_variables}))
+        gam_line_items = self._fetch_statements("LineItemService", "getLineItemsByStatement", statements, limit)
 
         discovered_line_items = []
-
-        while True:
-            response = line_item_service.getLineItemsByStatement(statement_builder.ToStatement())
-
-            if "results" in response and response["results"]:
-                for gam_line_item in response["results"]:
-                    try:
-                        # Serialize SUDS object to dict
-                        line_item_dict = serialize_object(gam_line_item)
-                        line_item = LineItem.from_gam_object(line_item_dict)
-                        self.line_items[line_item.line_item_id] = line_item
-                        discovered_line_items.append(line_item)
-                    except Exception as e:
-                        li_id = "unknown"
-                        try:
-                            li_id = str(getattr(gam_line_item, "id", "unknown"))
-                        except:
-                            pass
-                        logger.error(f"Error processing line item {li_id}: {e}")
-                        continue
-
-                statement_builder.offset += len(response["results"])
-                logger.info(f"Fetched {len(response['results'])} line items (total: {len(discovered_line_items)})")
-            else:
-                break
+        for gam_line_item in gam_line_items:
+            try:
+                # Serialize SUDS object to dict
+                line_item = LineItem.from_gam_object(serialize_object(gam_line_item))
+            except Exception as e:
+                logger.error(f"Error processing line item {_gam_object_id(gam_line_item)}: {e}")
+                continue
+            self.line_items[line_item.line_item_id] = line_item
+            discovered_line_items.append(line_item)
 
         logger.info(f"Discovered {len(discovered_line_items)} line items")
         return discovered_line_items
 
-    def sync_all(self) -> dict[str, Any]:
+    def _fetch_statements(
+        self,
+        service_name: str,
+        method_name: str,
+        statements: list[tuple[list[str], dict[str, Any]]],
+        limit: int | None,
+    ) -> list[Any]:
+        """Page each (where clauses, bind variables) statement on its own thread.
+
+        Results come back in statement order; the first failed partition is
+        raised once every partition has finished.
         """
-        Sync all orders and line items from GAM.
+
+        def fetch(statement: tuple[list[str], dict[str, Any]]) -> list[Any]:
+            where, bind_variables = statement
+            return self._fetch_partition(service_name, method_name, where, bind_variables, limit)
+
+        workers = min(PARTITION_CONCURRENCY, len(statements))
+        if workers <= 1:
+            pages = [fetch(statement) for statement in statements]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gam-orders-sync") as executor:
+                # Each partition keeps the caller's context (request scope, tenant)
+                futures = [executor.submit(contextvars.copy_context().run, fetch, s) for s in statements]
+                pages = [future.result() for future in futures]
+        return [result for page in pages for result in page]
+
+    @with_retry()
+    def _fetch_partition(
+        self,
+        service_name: str,
+        method_name: str,
+        where: list[str],
+        bind_variables: dict[str, Any],
+        limit: int | None,
+    ) -> list[Any]:
+        """Page one statement to the end (or to ``limit`` results)."""
+        # zeep clients are not thread-safe: each partition gets its own service
+        service = self.client.GetService(service_name, version="v202505")
+        statement_builder = ad_manager.StatementBuilder(version="v202505")
+        if where:
+            statement_builder.Where(" AND ".join(where))
+        for name, value in bind_variables.items():
+            statement_builder.WithBindVariable(name, value)
+        if limit:
+            statement_builder.limit = min(limit, ad_manager.SUGGESTED_PAGE_LIMIT)
+
+        results: list[Any] = []
+        while limit is None or len(results) < limit:
+            response = getattr(service, method_name)(statement_builder.ToStatement())
+            if "results" not in response or not response["results"]:
+                break
+            results.extend(response["results"])
+            statement_builder.offset += len(response["results"])
+            logger.info(f"Fetched {len(response['results'])} from {service_name} (partition total: {len(results)})")
+        return results[:limit] if limit else results
+
+    def sync_all(self, since: datetime | None = None) -> dict[str, Any]:
+        """
+        Sync orders and line items from GAM.
+
+        Args:
+            since: Optional datetime to fetch only items modified since this time (incremental sync)
 
         Returns:
             Summary of synced data
         """
-        logger.info(f"Starting full orders sync for tenant {self.tenant_id}")
+        logger.info(f"Starting {'incremental' if since else 'full'} orders sync for tenant {self.tenant_id}")
 
         start_time = datetime.now()
 
@@ -629,9 +729,19 @@ class GAMOrdersDiscovery:
         self.line_items.clear()
 
         # Discover all data
-        orders = self.discover_orders()
-        line_items = self.discover_line_items()
-
+        orders = self.discover_orders(since=since)
+        line_items = self.discover_line_items(since=since)
+
+        return self.build_summary(orders, line_items, start_time, since)
+
+    def build_summary(
+        self,
+        orders: list[Order],
+        line_items: list[LineItem],
+        start_time: datetime,
+        since: datetime | None = None,
+    ) -> dict[str, Any]:
+        """Summarize a sync run: counts by status, type and order."""
         self.last_sync = datetime.now()
 
         # Group line items by order
@@ -645,6 +755,8 @@ class GAMOrdersDiscovery:
             "tenant_id": self.tenant_id,
             "sync_time": self.last_sync.isoformat(),
             "duration_seconds": (self.last_sync - start_time).total_seconds(),
+            "mode": "incremental" if since else "full",
+            "since": since.isoformat() if since else None,
             "orders": {"total": len(orders), "by_status": {}},
             "line_items": {
                 "total": len(line_items),
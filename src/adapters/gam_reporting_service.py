@@ -42,6 +42,9 @@ class ReportingConfig:
     # User agent for HTTP requests
     USER_AGENT = "AdCP-Sales-Agent/1.0"
 
+    # Orders per report job when filtering by ORDER_ID IN (...), keeping the PQL statement bounded
+    MAX_ORDER_IDS_PER_REPORT = 500
+
 
 @dataclass
 class ReportingData:
@@ -141,6 +144,73 @@ class GAMReportingService:
             metrics=metrics,
         )
 
+    def get_order_delivery_data(
+        self,
+        date_range: Literal["lifetime", "this_month", "today"],
+        order_ids: list[str],
+        advertiser_id: str | None = None,
+        requested_timezone: str = "America/New_York",
+        line_item_ids: list[str] | None = None,
+    ) -> ReportingData:
+        """
+        Get delivery rows for many orders with one report job (ORDER_ID IN (...))
+
+        Used to report delivery for several media buys at once instead of running one
+        report per media buy. Rows keep the ORDER_ID and LINE_ITEM_ID dimensions so
+        callers can split them back per order and line item. Non-numeric IDs are
+        skipped; more than MAX_ORDER_IDS_PER_REPORT IDs are split across jobs.
+
+        Args:
+            date_range: One of "lifetime", "this_month", or "today"
+            order_ids: GAM order IDs to report on
+            advertiser_id: Optional advertiser/company ID filter
+            requested_timezone: Timezone for the request
+            line_item_ids: GAM line item IDs to report on in addition to whole orders
+                (LINE_ITEM_ID IN (...)), for media buys whose order ID is not known
+
+        Returns:
+            ReportingData object containing rows for all requested orders and line items
+        """
+        dimensions, start_date, end_date, granularity = self._get_report_config(date_range, requested_timezone)
+
+        report_data: list[dict[str, Any]] = []
+        chunk_size = ReportingConfig.MAX_ORDER_IDS_PER_REPORT
+        for filter_name, ids in (("order_ids", order_ids), ("line_item_ids", line_item_ids or [])):
+            valid_ids: list[str] = []
+            for value in ids:
+                try:
+                    valid_ids.append(str(int(value)))
+                except (ValueError, TypeError):
+                    logger.warning(f"Invalid {filter_name[:-1]} format: {value}")
+            valid_ids = list(dict.fromkeys(valid_ids))
+
+            for i in range(0, len(valid_ids), chunk_size):
+                chunk = valid_ids[i : i + chunk_size]
+                by_order = filter_name == "order_ids"
+                report_job = self._build_report_query(
+                    dimensions,
+                    start_date,
+                    end_date,
+                    advertiser_id=advertiser_id,
+                    order_ids=chunk if by_order else None,
+                    line_item_ids=None if by_order else chunk,
+                )
+                report_data.extend(self._run_report(report_job))
+
+        processed_data = self._process_report_data(report_data, granularity, requested_timezone)
+
+        return ReportingData(
+            data=processed_data,
+            start_date=start_date,
+            end_date=end_date,
+            requested_timezone=requested_timezone,
+            data_timezone=self.network_timezone if self.network_timezone != requested_timezone else requested_timezone,
+            data_valid_until=self._calculate_data_validity(date_range, requested_timezone),
+            query_type=date_range,
+            dimensions=dimensions,
+            metrics=self._calculate_metrics(processed_data),
+        )
+
     def _get_report_config(
         self,
         date_range: str,
@@ -237,6 +307,8 @@ class GAMReportingService:
         advertiser_id: str | None = None,
         order_id: str | None = None,
         line_item_id: str | None = None,
+        order_ids: list[str] | None = None,
+        line_item_ids: list[str] | None = None,
     ) -> dict[str, Any]:
         """Build the GAM report query"""
 
@@ -267,6 +339,27 @@ class GAMReportingService:
             except (ValueError, TypeError):
                 logger.warning(f"Invalid order_id format: {order_id}")
 
+        if order_ids:
+            # PQL has no list bind values, so the IN list is inlined - only validated integers
+            order_id_ints = []
+            for value in order_ids:
+                try:
+                    order_id_ints.append(int(value))
+                except (ValueError, TypeError):
+                    logger.warning(f"Invalid order_id format: {value}")
+            if order_id_ints:
+                where_clauses.append(f"ORDER_ID IN ({', '.join(str(v) for v in order_id_ints)})")
+
+        if line_item_ids:
+            line_item_id_ints = []
+            for value in line_item_ids:
+                try:
+                    line_item_id_ints.append(int(value))
+                except (ValueError, TypeError):
+                    logger.warning(f"Invalid line_item_id format: {value}")
+            if line_item_id_ints:
+                where_clauses.append(f"LINE_ITEM_ID IN ({', '.join(str(v) for v in line_item_id_ints)})")
+
         if line_item_id:
             # Validate numeric ID
             try:
@@ -14,7 +14,7 @@ __all__ = [
 
 import logging
 import uuid
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Any, Literal, cast
 
 from adcp.types.aliases import Package as ResponsePackage
@@ -42,7 +42,10 @@ from src.adapters.gam.pricing_compatibility import PricingCompatibility
 from src.adapters.gam_data_freshness import validate_and_log_freshness
 from src.core.audit_logger import AuditLogger
 from src.core.schemas import (
+    AdapterDeliveryFacts,
     AdapterGetMediaBuyDeliveryResponse,
+    AdapterPackageUpdate,
+    AdapterPackageUpdateResult,
     AffectedPackage,
     AssetStatus,
     CheckMediaBuyStatusResponse,
@@ -1138,23 +1141,10 @@ class GoogleAdManager(AdServerAdapter):
 
         reporting_service = GAMReportingService(self.client)
 
-        # Parse date range
-        start_dt = dt.fromisoformat(date_range.start.replace("Z", "+00:00"))
-        end_dt = dt.fromisoformat(date_range.end.replace("Z", "+00:00"))
-
-        # Determine date range type for reporting
-        days_diff = (end_dt - start_dt).days
-        if days_diff <= 1:
-            range_type: str = "today"
-        elif days_diff <= 31:
-            range_type = "this_month"
-        else:
-            range_type = "lifetime"
-
         # Fetch delivery data from GAM
         # Note: We'll aggregate across all line items associated with this media buy
         reporting_data = reporting_service.get_reporting_data(
-            date_range=cast("Literal['lifetime', 'this_month', 'today']", range_type),
+            date_range=self._reporting_range_type(date_range),
             advertiser_id=self.advertiser_id,
             requested_timezone="America/New_York",
         )
@@ -1268,6 +1258,302 @@ class GoogleAdManager(AdServerAdapter):
             daily_breakdown=daily_breakdown if daily_breakdown else None,
         )
 
+    def get_media_buy_deliveries(
+        self, media_buy_ids: list[str], date_range: ReportingPeriod, today: datetime
+    ) -> dict[str, AdapterGetMediaBuyDeliveryResponse]:
+        """Get delivery metrics for several media buys from a single GAM report job.
+
+        Media buy IDs are usually GAM order IDs, so one report filtered by
+        ORDER_ID IN (...) covers every requested buy. Buys created through manual
+        approval keep their mb_ ID, so their rows are selected by the line item IDs
+        stored on their packages instead (LINE_ITEM_ID IN (...)). Rows are split back
+        per media buy and package through those line item IDs, falling back to the
+        order ID. Media buys that are unknown or have no delivery yet get zero totals.
+
+        Args:
+            media_buy_ids: The media buy IDs (GAM order IDs or mb_ IDs)
+            date_range: Reporting period with start/end dates
+            today: Current date for time-based calculations
+
+        Returns:
+            Media buy ID -> AdapterGetMediaBuyDeliveryResponse with real metrics from GAM
+        """
+        from datetime import datetime as dt
+
+        from src.adapters.gam_reporting_service import GAMReportingService
+        from src.core.schemas import AdapterPackageDelivery, DeliveryTotals
+
+        media_buy_ids = [
+            media_buy_id
+            for media_buy_id in dict.fromkeys(media_buy_ids)
+            if isinstance(media_buy_id, str)
+            and media_buy_id
+            and len(media_buy_id) <= 255
+            and media_buy_id.isprintable()
+        ]
+
+        def empty_response(media_buy_id: str, currency: str = "USD") -> AdapterGetMediaBuyDeliveryResponse:
+            return AdapterGetMediaBuyDeliveryResponse(
+                media_buy_id=media_buy_id,
+                reporting_period=date_range,
+                by_package=[],
+                totals=DeliveryTotals(
+                    impressions=0, spend=0, clicks=0, ctr=0.0, video_completions=None, completion_rate=None
+                ),
+                currency=currency,
+            )
+
+        media_buys, line_items = self._load_media_buy_line_items(media_buy_ids)
+
+        results = {media_buy_id: empty_response(media_buy_id) for media_buy_id in media_buy_ids}
+        for media_buy_id in media_buy_ids:
+            if media_buy_id not in media_buys:
+                logger.error(f"Media buy {media_buy_id} not found in database")
+
+        if not media_buys:
+            return results
+
+        if self.dry_run or not self.client:
+            # Dry run mode - return simulated metrics (50% delivery at $1 CPM and 1% CTR)
+            logger.info(f"Dry-run mode: returning simulated metrics for {len(media_buys)} media buys")
+            for media_buy_id, media_buy in media_buys.items():
+                total_budget = float(media_buy.budget) if media_buy.budget else 0.0
+                progress = 0.5
+                results[media_buy_id] = AdapterGetMediaBuyDeliveryResponse(
+                    media_buy_id=media_buy_id,
+                    reporting_period=date_range,
+                    by_package=[],
+                    totals=DeliveryTotals(
+                        impressions=int(total_budget * 1000 * progress),
+                        spend=total_budget * progress,
+                        clicks=int(total_budget * 1000 * progress * 0.01),
+                        ctr=1.0,
+                        video_completions=None,
+                        completion_rate=None,
+                    ),
+                    currency=str(media_buy.currency or "USD"),
+                )
+            return results
+
+        reporting_service = GAMReportingService(self.client)
+        order_ids, line_item_ids = self._delivery_report_filters(media_buys, line_items)
+        reporting_data = reporting_service.get_order_delivery_data(
+            date_range=self._reporting_range_type(date_range),
+            order_ids=order_ids,
+            advertiser_id=self.advertiser_id,
+            requested_timezone="America/New_York",
+            line_item_ids=line_item_ids,
+        )
+
+        # Validate data freshness once for the whole batch
+        target_date = dt.fromisoformat(date_range.end.replace("Z", "+00:00"))
+        if not validate_and_log_freshness(reporting_data, ", ".join(media_buys), target_date=target_date):
+            raise ValueError(f"GAM data is not fresh enough for media buys {', '.join(media_buys)}")
+
+        rows_by_media_buy: dict[str, list[dict[str, Any]]] = {}
+        for row in reporting_data.data:
+            rows_by_media_buy.setdefault(self._row_media_buy_id(row, line_items), []).append(row)
+
+        for media_buy_id, media_buy in media_buys.items():
+            rows = rows_by_media_buy.get(media_buy_id, [])
+            currency = str(media_buy.currency or "USD")
+            if not rows:
+                results[media_buy_id] = empty_response(media_buy_id, currency)
+                continue
+
+            daily_metrics: dict[str, dict[str, float]] = {}
+            package_metrics: dict[str, dict[str, float]] = {}
+            for row in rows:
+                # Daily rows carry a "YYYY-MM-DDT00:00:00" timestamp
+                date_str = str(row.get("timestamp", ""))[:10]
+                if date_str:
+                    day = daily_metrics.setdefault(date_str, {"impressions": 0.0, "spend": 0.0})
+                    day["impressions"] += float(row.get("impressions", 0))
+                    day["spend"] += float(row.get("spend", 0.0))
+
+                package_id = line_items.get(str(row.get("line_item_id", "")), ("", ""))[1]
+                if package_id:
+                    pkg = package_metrics.setdefault(package_id, {"impressions": 0.0, "spend": 0.0})
+                    pkg["impressions"] += float(row.get("impressions", 0))
+                    pkg["spend"] += float(row.get("spend", 0.0))
+
+            total_impressions = sum(int(row.get("impressions", 0)) for row in rows)
+            total_clicks = sum(int(row.get("clicks", 0)) for row in rows)
+            total_spend = round(sum(float(row.get("spend", 0.0)) for row in rows), 2)
+
+            results[media_buy_id] = AdapterGetMediaBuyDeliveryResponse(
+                media_buy_id=media_buy_id,
+                reporting_period=date_range,
+                by_package=[
+                    AdapterPackageDelivery(
+                        package_id=package_id, impressions=int(metrics["impressions"]), spend=round(metrics["spend"], 2)
+                    )
+                    for package_id, metrics in package_metrics.items()
+                ],
+                totals=DeliveryTotals(
+                    impressions=total_impressions,
+                    spend=total_spend,
+                    clicks=total_clicks if total_clicks > 0 else None,
+                    ctr=(total_clicks / total_impressions) if total_clicks > 0 and total_impressions > 0 else None,
+                    video_completions=None,
+                    completion_rate=None,
+                ),
+                currency=currency,
+                daily_breakdown=[
+                    {"date": date_str, "impressions": metrics["impressions"], "spend": round(metrics["spend"], 2)}
+                    for date_str, metrics in sorted(daily_metrics.items())
+                ]
+                or None,
+            )
+
+        return results
+
+    def get_delivery_facts(
+        self, media_buy_ids: list[str], start_date: date, today: datetime
+    ) -> AdapterDeliveryFacts | None:
+        """Get delivery per package and day since start_date, hourly for the current day.
+
+        Complete days come from one daily report and the current day from one hourly
+        report, both filtered like get_media_buy_deliveries (ORDER_ID IN (...), plus
+        LINE_ITEM_ID IN (...) for mb_ IDs), with line items mapped to media buys and
+        packages the same way. Dry-run adapters return None (no real delivery to store).
+
+        Args:
+            media_buy_ids: The media buy IDs (GAM order IDs or mb_ IDs)
+            start_date: First day to report
+            today: Current date for time-based calculations
+
+        Returns:
+            AdapterDeliveryFacts, complete up to the reports' data freshness
+        """
+        from src.adapters.gam_reporting_service import GAMReportingService
+        from src.core.schemas import AdapterDeliveryFact
+
+        if self.dry_run or not self.client:
+            return None
+
+        media_buys, line_items = self._load_media_buy_line_items(media_buy_ids)
+        order_ids, line_item_ids = self._delivery_report_filters(media_buys, line_items)
+        current_day = today.date()
+        # GAM reports are relative to now: this_month starts on the 1st, lifetime covers 90 days
+        range_type: Literal["lifetime", "this_month"] = (
+            "this_month" if start_date >= current_day.replace(day=1) else "lifetime"
+        )
+
+        reporting_service = GAMReportingService(self.client)
+        daily = reporting_service.get_order_delivery_data(
+            date_range=range_type, order_ids=order_ids, advertiser_id=self.advertiser_id, line_item_ids=line_item_ids
+        )
+        hourly = reporting_service.get_order_delivery_data(
+            date_range="today", order_ids=order_ids, advertiser_id=self.advertiser_id, line_item_ids=line_item_ids
+        )
+
+        facts: dict[tuple[str, str, date, int], dict[str, Any]] = {}
+        for rows, whole_day in ((daily.data, True), (hourly.data, False)):
+            for row in rows:
+                media_buy_id = self._row_media_buy_id(row, line_items)
+                if media_buy_id not in media_buys or not row.get("timestamp"):
+                    continue
+                timestamp = datetime.fromisoformat(row["timestamp"])
+                day = timestamp.date()
+                # The current day comes only from the hourly report, complete days only from the daily one
+                if day < start_date or (day >= current_day) == whole_day:
+                    continue
+                package_id = line_items.get(str(row.get("line_item_id", "")), ("", ""))[1]
+                key = (media_buy_id, package_id, day, -1 if whole_day else timestamp.hour)
+                fact = facts.setdefault(key, {"impressions": 0, "clicks": 0, "spend": 0.0})
+                fact["impressions"] += int(row.get("impressions", 0))
+                fact["clicks"] += int(row.get("clicks", 0))
+                fact["spend"] += float(row.get("spend", 0.0))
+
+        # Until yesterday's daily data is final, facts are only complete up to the daily freshness
+        data_valid_until = (
+            hourly.data_valid_until
+            if daily.data_valid_until.date() >= current_day - timedelta(days=1)
+            else daily.data_valid_until
+        )
+
+        return AdapterDeliveryFacts(
+            facts=[
+                AdapterDeliveryFact(media_buy_id=media_buy_id, package_id=package_id, day=day, hour=hour, **metrics)
+                for (media_buy_id, package_id, day, hour), metrics in facts.items()
+            ],
+            start_date=max(start_date, daily.start_date.date()),
+            data_valid_until=data_valid_until,
+        )
+
+    def _load_media_buy_line_items(self, media_buy_ids: list[str]) -> tuple[dict[str, Any], dict[str, tuple[str, str]]]:
+        """Media buys by ID and GAM line item ID -> (media_buy_id, package_id) for their packages.
+
+        One query for the media buys and one for their packages, whatever the batch size.
+        """
+        from sqlalchemy import select
+
+        from src.core.database.database_session import get_db_session
+        from src.core.database.models import MediaBuy, MediaPackage
+
+        line_items: dict[str, tuple[str, str]] = {}
+        with get_db_session() as session:
+            media_buys = {
+                media_buy.media_buy_id: media_buy
+                for media_buy in session.scalars(select(MediaBuy).where(MediaBuy.media_buy_id.in_(media_buy_ids))).all()
+            }
+            if media_buys:
+                packages = session.scalars(
+                    select(MediaPackage).where(MediaPackage.media_buy_id.in_(list(media_buys)))
+                ).all()
+                for package in packages:
+                    line_item_id = (package.package_config or {}).get("platform_line_item_id")
+                    if line_item_id:
+                        line_items[str(line_item_id)] = (package.media_buy_id, package.package_id)
+
+            # Older media buys only recorded line items in the original request
+            for media_buy_id, media_buy in media_buys.items():
+                for pkg_data in (media_buy.raw_request or {}).get("packages", []):
+                    if pkg_data.get("platform_line_item_id") and pkg_data.get("package_id"):
+                        line_items.setdefault(
+                            str(pkg_data["platform_line_item_id"]), (media_buy_id, pkg_data["package_id"])
+                        )
+
+        return media_buys, line_items
+
+    @staticmethod
+    def _delivery_report_filters(
+        media_buys: dict[str, Any], line_items: dict[str, tuple[str, str]]
+    ) -> tuple[list[str], list[str]]:
+        """Order IDs and line item IDs selecting the report rows for these media buys.
+
+        Media buys with numeric IDs are GAM orders. Manual-approval buys keep their mb_
+        ID, so they are reported through their packages' line items instead.
+        """
+        order_ids = [media_buy_id for media_buy_id in media_buys if media_buy_id.isdigit()]
+        line_item_ids = [
+            line_item_id
+            for line_item_id, (media_buy_id, _package_id) in line_items.items()
+            if not media_buy_id.isdigit()
+        ]
+        return order_ids, line_item_ids
+
+    @staticmethod
+    def _row_media_buy_id(row: dict[str, Any], line_items: dict[str, tuple[str, str]]) -> str:
+        """Media buy a report row belongs to: its order, or the mb_ buy owning its line item."""
+        owner = line_items.get(str(row.get("line_item_id", "")))
+        if owner and not owner[0].isdigit():
+            return owner[0]
+        return str(row.get("order_id", ""))
+
+    @staticmethod
+    def _reporting_range_type(date_range: ReportingPeriod) -> Literal["lifetime", "this_month", "today"]:
+        """GAM report range covering a reporting period."""
+        start_dt = datetime.fromisoformat(date_range.start.replace("Z", "+00:00"))
+        end_dt = datetime.fromisoformat(date_range.end.replace("Z", "+00:00"))
+        days_diff = (end_dt - start_dt).days
+        if days_diff <= 1:
+            return "today"
+        if days_diff <= 31:
+            return "this_month"
+        return "lifetime"
+
     def update_media_buy(
         self,
         media_buy_id: str,
@@ -1599,24 +1885,26 @@ class GoogleAdManager(AdServerAdapter):
                             ],
                         )
 
-                    # Pause/resume each package's line item
+                    # Pause/resume every package's line item with one batched GAM action
                     failed_packages = []
+                    line_item_packages: dict[str, str] = {}
                     for pkg in packages:
                         platform_line_item_id = pkg.package_config.get("platform_line_item_id")
                         if not platform_line_item_id:
                             failed_packages.append({"package_id": pkg.package_id, "reason": "No GAM line item ID"})
                             continue
+                        line_item_packages[str(platform_line_item_id)] = pkg.package_id
 
-                        self.log(f"[GAM] {action_verb} line item {platform_line_item_id} (package {pkg.package_id})")
-                        if is_pause:
-                            success = self.orders_manager.pause_line_item(platform_line_item_id)
-                        else:
-                            success = self.orders_manager.resume_line_item(platform_line_item_id)
-
-                        if not success:
-                            failed_packages.append(
-                                {"package_id": pkg.package_id, "line_item_id": platform_line_item_id}
-                            )
+                    if line_item_packages:
+                        self.log(f"[GAM] {action_verb} {len(line_item_packages)} line items")
+                        action_errors = self.orders_manager.perform_line_item_action(
+                            list(line_item_packages), "PauseLineItems" if is_pause else "ResumeLineItems"
+                        )
+                        for line_item_id, error in action_errors.items():
+                            if error:
+                                failed_packages.append(
+                                    {"package_id": line_item_packages[line_item_id], "line_item_id": line_item_id}
+                                )
 
                     if failed_packages:
                         return UpdateMediaBuyError(
@@ -1673,6 +1961,126 @@ class GoogleAdManager(AdServerAdapter):
             ],
         )
 
+    def update_packages(
+        self, media_buy_id: str, buyer_ref: str, updates: list[AdapterPackageUpdate], today: datetime
+    ) -> list[AdapterPackageUpdateResult]:
+        """Apply package pauses, resumes and budget changes with batched GAM calls.
+
+        All packages are loaded and validated in one query, budgets are written with
+        batched updateLineItems calls and pauses/resumes with one performLineItemAction
+        call each. Budgets are saved to the database once GAM has accepted them.
+        """
+        if self._requires_manual_approval("update_media_buy"):
+            # One approval workflow step per change, as update_media_buy creates them
+            return super().update_packages(media_buy_id, buyer_ref, updates, today)
+
+        from sqlalchemy import select
+        from sqlalchemy.orm import attributes
+
+        from src.core.database.database_session import get_db_session
+        from src.core.database.models import MediaBuy as MediaBuyModel
+        from src.core.database.models import MediaPackage
+
+        results = [AdapterPackageUpdateResult(package_id=u.package_id, action=u.action) for u in updates]
+
+        def reject(index: int, code: str, message: str, **details: Any) -> None:
+            details["package_id"] = updates[index].package_id
+            results[index].error = Error(code=code, message=message, details=details)
+
+        with get_db_session() as session:
+            # Security: Join with MediaBuy for tenant isolation
+            stmt = (
+                select(MediaPackage)
+                .join(MediaBuyModel, MediaPackage.media_buy_id == MediaBuyModel.media_buy_id)
+                .where(
+                    MediaPackage.package_id.in_({u.package_id for u in updates}),
+                    MediaPackage.media_buy_id == media_buy_id,
+                    MediaBuyModel.tenant_id == self.tenant_id,
+                )
+            )
+            packages = {pkg.package_id: pkg for pkg in session.scalars(stmt).all()}
+
+            budgets: dict[str, tuple[float, str]] = {}
+            budget_updates: dict[int, str] = {}  # update index -> line item ID
+            status_updates: dict[str, dict[int, str]] = {"PauseLineItems": {}, "ResumeLineItems": {}}
+            for index, update in enumerate(updates):
+                media_package = packages.get(update.package_id)
+                if media_package is None:
+                    reject(
+                        index,
+                        "package_not_found",
+                        f"Package {update.package_id} not found for media buy {media_buy_id}",
+                    )
+                    continue
+
+                platform_line_item_id = media_package.package_config.get("platform_line_item_id")
+                if not platform_line_item_id:
+                    reject(index, "missing_platform_id", f"Package {update.package_id} has no GAM line item ID")
+                    continue
+                line_item_id = str(platform_line_item_id)
+
+                if update.action == "update_package_budget":
+                    budget = update.budget
+                    if budget is None or budget <= 0:
+                        reject(index, "invalid_budget", f"Budget must be positive, got {budget}", budget=budget)
+                        continue
+
+                    # Validate budget isn't less than delivery to date
+                    current_spend = float(media_package.package_config.get("delivery_metrics", {}).get("spend", 0))
+                    if budget < current_spend:
+                        reject(
+                            index,
+                            "budget_below_delivery",
+                            f"Cannot set budget ${budget} below current spend ${current_spend}",
+                            requested_budget=budget,
+                            current_spend=current_spend,
+                        )
+                        continue
+
+                    pricing_model = media_package.package_config.get("pricing", {}).get("model", "cpm").lower()
+                    budgets[line_item_id] = (float(budget), pricing_model)
+                    budget_updates[index] = line_item_id
+                else:
+                    action = "PauseLineItems" if update.action == "pause_package" else "ResumeLineItems"
+                    status_updates[action][index] = line_item_id
+
+            if budgets:
+                self.log(f"[GAM] Updating budgets of {len(budgets)} line items")
+                budget_errors = self.orders_manager.update_line_item_budgets(budgets)
+                for index, line_item_id in budget_updates.items():
+                    if budget_errors.get(line_item_id):
+                        reject(
+                            index,
+                            "gam_update_failed",
+                            f"Failed to update budget in Google Ad Manager: {budget_errors[line_item_id]}",
+                            line_item_id=line_item_id,
+                        )
+                        continue
+                    # Update budget in package_config JSON after successful GAM sync
+                    media_package = packages[updates[index].package_id]
+                    media_package.package_config["budget"] = budgets[line_item_id][0]
+                    # Flag the JSON field as modified so SQLAlchemy persists it
+                    attributes.flag_modified(media_package, "package_config")
+                session.commit()
+
+        for action, line_items in status_updates.items():
+            if not line_items:
+                continue
+            self.log(f"[GAM] {action} for {len(line_items)} line items")
+            action_errors = self.orders_manager.perform_line_item_action(sorted(set(line_items.values())), action)
+            for index, line_item_id in line_items.items():
+                if action_errors.get(line_item_id):
+                    reject(
+                        index,
+                        "gam_update_failed",
+                        f"Failed to {updates[index].action.split('_')[0]} line item in GAM: {action_errors[line_item_id]}",
+                        line_item_id=line_item_id,
+                    )
+
+        applied = sum(1 for result in results if result.error is None)
+        self.log(f"✓ Applied {applied} of {len(updates)} package changes to media buy {media_buy_id} in GAM")
+        return results
+
     def update_media_buy_performance_index(self, media_buy_id: str, package_performance: list) -> bool:
         """Update the performance index for packages in a media buy."""
         # This would be implemented with appropriate manager delegation
@@ -0,0 +1,233 @@
+"""Shared pooled HTTP transport for the REST ad server adapters (Kevel, Xandr, Triton).
+
+The adapters used to call module-level ``requests.get/post/put`` for every
+campaign, flight, creative and report call: a new TCP/TLS connection per call,
+no timeouts, and every entity written one at a time. An AdapterHttpTransport
+wraps one ``requests.Session`` per network account and is shared by every
+adapter instance for that account (adapters are constructed per request):
+
+- Keep-alive connection pools per host (the session's urllib3 pool manager)
+- Default (connect, read) timeouts on every call
+- Retries with exponential backoff and full jitter on connection failures,
+  429 and 5xx. POST is only retried when the request was not processed
+  (connect timeout or 429), so creates are never duplicated. Retry-After is honored.
+- A token bucket rate limit per network account, shared by all threads
+- bulk(): issue independent entity calls (flights, creatives, line items)
+  concurrently with bounded parallelism
+
+Responses are plain ``requests.Response`` objects and failures raise the usual
+``requests`` exceptions, so callers keep using raise_for_status() and their
+existing ``except requests.exceptions.RequestException`` handling.
+
+Usage:
+    self.http = get_http_transport("kevel", network_id, rate_limit_per_second=config.get("rate_limit_per_second"))
+    response = self.http.post(f"{base_url}/campaign", headers=headers, json=payload)
+    flights = self.http.bulk(create_flight, packages)
+"""
+
+import contextvars
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_TIMEOUT = (5.0, 30.0)  # (connect, read) seconds
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 8.0
+DEFAULT_BULK_CONCURRENCY = 8
+HOST_POOLS = 4  # Distinct hosts kept alive per session (API, auth, report downloads)
+
+# Requests per second per network account, unless the adapter config sets rate_limit_per_second
+DEFAULT_RATE_LIMITS = {"kevel": 10.0, "xandr": 5.0, "triton": 10.0}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+
+class RateLimiter:
+    """Thread-safe token bucket; acquire() blocks until a request may be sent."""
+
+    def __init__(self, rate_per_second: float, burst: int | None = None):
+        self.rate = rate_per_second
+        self.burst = burst or max(1, int(rate_per_second))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token; a negative balance is the queue of callers ahead of us
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _backoff(attempt: int, base: float) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(MAX_BACKOFF_SECONDS, base * (2**attempt)))
+
+
+def _retry_after(response: requests.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return min(MAX_BACKOFF_SECONDS, max(0.0, float(value)))
+    except ValueError:
+        return None  # HTTP-date form; fall back to jittered backoff
+
+
+class AdapterHttpTransport:
+    """Pooled, rate-limited, retrying HTTP client for one ad server network account."""
+
+    def __init__(
+        self,
+        network: str,
+        rate_limit_per_second: float | None = None,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        bulk_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ):
+        self.network = network
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.bulk_concurrency = bulk_concurrency
+        rate = rate_limit_per_second or DEFAULT_RATE_LIMITS.get(network)
+        self.rate_limiter = RateLimiter(rate) if rate else None
+
+        self.session = requests.Session()
+        # Enough connections per host for a full bulk() fan-out to reuse kept-alive sockets
+        pool = HTTPAdapter(pool_connections=HOST_POOLS, pool_maxsize=bulk_concurrency)
+        self.session.mount("https://", pool)
+        self.session.mount("http://", pool)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request with the default timeout, rate limit and retries."""
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        retry_any_failure = method in IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.ConnectTimeout as e:
+                # Never reached the server: safe to retry any method
+                if attempt >= self.max_retries:
+                    raise
+                delay, reason = _backoff(attempt, self.backoff_seconds), str(e)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not retry_any_failure or attempt >= self.max_retries:
+                    raise
+                delay, reason = _backoff(attempt, self.backoff_seconds), str(e)
+            else:
+                status = response.status_code
+                retryable = status == 429 or (retry_any_failure and status in RETRY_STATUSES)
+                if not retryable or attempt >= self.max_retries:
+                    return response
+                delay = _retry_after(response) or _backoff(attempt, self.backoff_seconds)
+                reason = f"HTTP {status}"
+                response.close()
+
+            attempt += 1
+            logger.warning(
+                f"{self.network} {method} {url} failed ({reason}); retry {attempt}/{self.max_retries} in {delay:.2f}s"
+            )
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def bulk(
+        self,
+        fn: Callable[[T], R],
+        items: Iterable[T],
+        return_exceptions: bool = False,
+        max_concurrency: int | None = None,
+    ) -> list[Any]:
+        """Call ``fn`` for each item concurrently; results come back in item order.
+
+        Every call runs to completion. With ``return_exceptions`` a failed call's
+        exception takes its place in the results, otherwise the first failure
+        (in item order) is raised once all calls have finished.
+        """
+        items = list(items)
+        workers = min(max_concurrency or self.bulk_concurrency, len(items))
+        if workers <= 1:
+            outcomes: list[Any] = []
+            for item in items:
+                try:
+                    outcomes.append(fn(item))
+                except Exception as e:
+                    outcomes.append(e)
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{self.network}-bulk") as executor:
+                # Each call keeps the caller's context (request scope, tenant)
+                futures = [executor.submit(contextvars.copy_context().run, fn, item) for item in items]
+                outcomes = []
+                for future in futures:
+                    error = future.exception()
+                    outcomes.append(error if error is not None else future.result())
+
+        if not return_exceptions:
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    raise outcome
+        return outcomes
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_transports: dict[tuple[str, str], AdapterHttpTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_http_transport(
+    network: str, account: str | None = None, rate_limit_per_second: float | None = None
+) -> AdapterHttpTransport:
+    """Get the shared transport for a network account, creating it on first use."""
+    key = (network, account or "default")
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = AdapterHttpTransport(network, rate_limit_per_second=rate_limit_per_second)
+            _transports[key] = transport
+        return transport
+
+
+def close_http_transports() -> None:
+    """Close every pooled session (shutdown and tests)."""
+    with _transports_lock:
+        for transport in _transports.values():
+            transport.close()
+        _transports.clear()
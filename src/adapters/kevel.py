@@ -7,6 +7,7 @@ from adcp.types.aliases import Package as ResponsePackage
 
 from src.adapters.base import AdServerAdapter, CreativeEngineAdapter
 from src.adapters.constants import REQUIRED_UPDATE_ACTIONS
+from src.adapters.http_transport import get_http_transport
 from src.core.schemas import *
 
 
@@ -51,6 +52,9 @@ class Kevel(AdServerAdapter):
             raise ValueError("Kevel config is missing 'network_id' or 'api_key'")
         else:
             self.headers = {"X-Adzerk-ApiKey": self.api_key, "Content-Type": "application/json"}
+            self.http = get_http_transport(
+                "kevel", str(self.network_id), rate_limit_per_second=self.config.get("rate_limit_per_second")
+            )
 
     # Supported device types (Kevel doesn't support CTV)
     SUPPORTED_DEVICE_TYPES = {"mobile", "desktop", "tablet"}
@@ -308,15 +312,14 @@ class Kevel(AdServerAdapter):
                 "IsActive": True,
             }
 
-            response = requests.post(f"{self.base_url}/campaign", headers=self.headers, json=campaign_payload)
+            response = self.http.post(f"{self.base_url}/campaign", headers=self.headers, json=campaign_payload)
             response.raise_for_status()
             campaign_data = response.json()
             campaign_id = campaign_data["Id"]
             self.audit_logger.log_success(f"Created Kevel Campaign ID: {campaign_id}")
 
-            # Create flights for each package and track flight IDs
-            package_responses = []
-            for package in packages:
+            # Create flights for each package (independent of each other, so issued concurrently)
+            def create_flight(package):
                 # Get pricing for this package
                 pricing_info = package_pricing_info.get(package.package_id) if package_pricing_info else None
                 if pricing_info:
@@ -356,22 +359,24 @@ class Kevel(AdServerAdapter):
                             )  # Convert to hours, minimum 1
                             flight_payload["FreqCapType"] = 1  # 1 = per user (cookie-based)
 
-                flight_response = requests.post(f"{self.base_url}/flight", headers=self.headers, json=flight_payload)
+                flight_response = self.http.post(f"{self.base_url}/flight", headers=self.headers, json=flight_payload)
                 flight_response.raise_for_status()
-                flight_data = flight_response.json()
-                flight_id = flight_data.get("Id")
-
-                # Build package response - Per AdCP spec v2.9.0, CreateMediaBuyResponse.Package requires:
-                # - package_id (required)
-                # - status (required)
-                # MediaPackage has buyer_ref populated from request
-                package_responses.append(
-                    ResponsePackage(
-                        buyer_ref=package.buyer_ref or "unknown",
-                        package_id=package.package_id,
-                        paused=False,  # Default to not paused for created packages
-                    )
+                return flight_response.json().get("Id")
+
+            self.http.bulk(create_flight, packages)
+
+            # Build package responses - Per AdCP spec v2.9.0, CreateMediaBuyResponse.Package requires:
+            # - package_id (required)
+            # - status (required)
+            # MediaPackage has buyer_ref populated from request
+            package_responses = [
+                ResponsePackage(
+                    buyer_ref=package.buyer_ref or "unknown",
+                    package_id=package.package_id,
+                    paused=False,  # Default to not paused for created packages
                 )
+                for package in packages
+            ]
 
             # Use the actual campaign ID from Kevel
             media_buy_id = f"kevel_{campaign_id}"
@@ -438,61 +443,64 @@ class Kevel(AdServerAdapter):
         else:
             try:
                 # Get all flights for the campaign to map package names to flight IDs
-                flights_response = requests.get(
+                flights_response = self.http.get(
                     f"{self.base_url}/flight", headers=self.headers, params={"campaignId": media_buy_id}
                 )
                 flights_response.raise_for_status()
                 flights = flights_response.json().get("items", [])
                 flight_map = {flight["Name"]: flight["Id"] for flight in flights}
+            except requests.exceptions.RequestException as e:
+                self.log(f"Error loading Kevel flights: {e}")
+                return [AssetStatus(creative_id=asset["creative_id"], status="failed") for asset in assets]
 
-                for asset in assets:
-                    creative_payload = {
-                        "Name": asset["name"],
-                        "IsActive": True,
-                    }
-
-                    if asset["format"] == "custom" and asset.get("template_id"):
-                        creative_payload["TemplateId"] = asset["template_id"]
-                        creative_payload["Data"] = asset.get("template_data", {})
-                    elif asset["format"] == "image":
-                        creative_payload["Body"] = (
-                            f"<a href='{asset['click_url']}' target='_blank'><img src='{asset['media_url']}'/></a>"
-                        )
-                        creative_payload["Url"] = asset["click_url"]
-                    elif asset["format"] == "video":
-                        creative_payload["ThirdPartyUrl"] = asset["media_url"]
-                    else:
-                        self.log(
-                            f"Skipping asset {asset['creative_id']} with unsupported format for Kevel: {asset['format']}"
-                        )
-                        continue
+            def upload(asset: dict[str, Any]) -> AssetStatus | None:
+                creative_payload = {
+                    "Name": asset["name"],
+                    "IsActive": True,
+                }
+
+                if asset["format"] == "custom" and asset.get("template_id"):
+                    creative_payload["TemplateId"] = asset["template_id"]
+                    creative_payload["Data"] = asset.get("template_data", {})
+                elif asset["format"] == "image":
+                    creative_payload["Body"] = (
+                        f"<a href='{asset['click_url']}' target='_blank'><img src='{asset['media_url']}'/></a>"
+                    )
+                    creative_payload["Url"] = asset["click_url"]
+                elif asset["format"] == "video":
+                    creative_payload["ThirdPartyUrl"] = asset["media_url"]
+                else:
+                    self.log(
+                        f"Skipping asset {asset['creative_id']} with unsupported format for Kevel: {asset['format']}"
+                    )
+                    return None
 
+                try:
                     # Create the creative
-                    creative_response = requests.post(
+                    creative_response = self.http.post(
                         f"{self.base_url}/creative", headers=self.headers, json=creative_payload
                     )
                     creative_response.raise_for_status()
-                    creative_data = creative_response.json()
-                    creative_id = creative_data["Id"]
+                    creative_id = creative_response.json()["Id"]
 
                     # Associate the creative with the assigned flights
                     flight_ids_to_associate = [
                         flight_map[pkg_id] for pkg_id in asset.get("package_assignments", []) if pkg_id in flight_map
                     ]
+                    for flight_id in flight_ids_to_associate:
+                        ad_payload = {"CreativeId": creative_id, "FlightId": flight_id, "IsActive": True}
+                        ad_response = self.http.post(f"{self.base_url}/ad", headers=self.headers, json=ad_payload)
+                        ad_response.raise_for_status()
+                except requests.exceptions.RequestException as e:
+                    self.log(f"Error creating Kevel Creative or Ad for {asset['creative_id']}: {e}")
+                    return AssetStatus(creative_id=asset["creative_id"], status="failed")
 
-                    if flight_ids_to_associate:
-                        for flight_id in flight_ids_to_associate:
-                            ad_payload = {"CreativeId": creative_id, "FlightId": flight_id, "IsActive": True}
-                            ad_response = requests.post(f"{self.base_url}/ad", headers=self.headers, json=ad_payload)
-                            ad_response.raise_for_status()
-
-                    created_asset_statuses.append(AssetStatus(creative_id=asset["creative_id"], status="approved"))
+                return AssetStatus(creative_id=asset["creative_id"], status="approved")
 
-            except requests.exceptions.RequestException as e:
-                self.log(f"Error creating Kevel Creative or Ad: {e}")
-                for asset in assets:
-                    if not any(s.creative_id == asset["creative_id"] for s in created_asset_statuses):
-                        created_asset_statuses.append(AssetStatus(creative_id=asset["creative_id"], status="failed"))
+            # Each creative (and its ads) is independent: upload them concurrently;
+            # a failure only marks that asset as failed
+            statuses = self.http.bulk(upload, assets)
+            created_asset_statuses.extend(status for status in statuses if status is not None)
 
         return created_asset_statuses
 
@@ -588,7 +596,7 @@ class Kevel(AdServerAdapter):
                 "Filter": {"CampaignId": media_buy_id},
             }
 
-            response = requests.post(f"{self.base_url}/report/queue", headers=self.headers, json=report_request)
+            response = self.http.post(f"{self.base_url}/report/queue", headers=self.headers, json=report_request)
             response.raise_for_status()
             report_id = response.json()["Id"]
 
@@ -598,7 +606,7 @@ class Kevel(AdServerAdapter):
             time.sleep(1)
 
             # Get report results
-            results_response = requests.get(f"{self.base_url}/report/{report_id}/results", headers=self.headers)
+            results_response = self.http.get(f"{self.base_url}/report/{report_id}/results", headers=self.headers)
             results_response.raise_for_status()
 
             # Parse results and aggregate
@@ -741,14 +749,14 @@ class Kevel(AdServerAdapter):
                 if action in ["pause_media_buy", "resume_media_buy"]:
                     # Update campaign status
                     update_payload = {"IsActive": action == "resume_media_buy"}
-                    update_response = requests.put(
+                    update_response = self.http.put(
                         f"{self.base_url}/campaign/{campaign_id}", headers=self.headers, json=update_payload
                     )
                     update_response.raise_for_status()
 
                 elif action in ["pause_package", "resume_package"] and package_id:
                     # Get flight ID by name
-                    flights_response = requests.get(
+                    flights_response = self.http.get(
                         f"{self.base_url}/flight", headers=self.headers, params={"campaignId": campaign_id}
                     )
                     flights_response.raise_for_status()
@@ -765,7 +773,7 @@ class Kevel(AdServerAdapter):
                     # Update flight status
                     is_resume = action == "resume_package"
                     update_payload = {"IsActive": is_resume}
-                    update_response = requests.put(
+                    update_response = self.http.put(
                         f"{self.base_url}/flight/{flight['Id']}", headers=self.headers, json=update_payload
                     )
                     update_response.raise_for_status()
@@ -792,7 +800,7 @@ class Kevel(AdServerAdapter):
                     and budget is not None
                 ):
                     # Get flight ID by name
-                    flights_response = requests.get(
+                    flights_response = self.http.get(
                         f"{self.base_url}/flight", headers=self.headers, params={"campaignId": campaign_id}
                     )
                     flights_response.raise_for_status()
@@ -816,7 +824,7 @@ class Kevel(AdServerAdapter):
 
                     # Update flight impressions
                     impressions_payload: dict[str, int] = {"Impressions": new_impressions}
-                    update_response = requests.put(
+                    update_response = self.http.put(
                         f"{self.base_url}/flight/{flight['Id']}", headers=self.headers, json=impressions_payload
                     )
                     update_response.raise_for_status()
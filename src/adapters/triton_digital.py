@@ -7,6 +7,7 @@ from adcp.types.aliases import Package as ResponsePackage
 
 from src.adapters.base import AdServerAdapter, CreativeEngineAdapter
 from src.adapters.constants import REQUIRED_UPDATE_ACTIONS
+from src.adapters.http_transport import get_http_transport
 from src.core.schemas import *
 
 
@@ -46,6 +47,9 @@ class TritonDigital(AdServerAdapter):
             raise ValueError("Triton Digital config is missing 'auth_token'")
         else:
             self.headers = {"Authorization": f"Bearer {self.auth_token}", "Content-Type": "application/json"}
+            self.http = get_http_transport(
+                "triton", self.tenant_id, rate_limit_per_second=self.config.get("rate_limit_per_second")
+            )
 
     # Only audio device types supported
     SUPPORTED_DEVICE_TYPES = {"mobile", "desktop", "audio"}
@@ -230,14 +234,13 @@ class TritonDigital(AdServerAdapter):
                 "active": True,
             }
 
-            response = requests.post(f"{self.base_url}/campaigns", headers=self.headers, json=campaign_payload)
+            response = self.http.post(f"{self.base_url}/campaigns", headers=self.headers, json=campaign_payload)
             response.raise_for_status()
             campaign_data = response.json()
             campaign_id = campaign_data["id"]
 
-            # Create flights for each package and track flight IDs
-            package_responses = []
-            for package in packages:
+            # Create flights for each package (independent of each other, so issued concurrently)
+            def create_flight(package):
                 # Get pricing for this package
                 pricing_info = package_pricing_info.get(package.package_id) if package_pricing_info else None
                 if pricing_info:
@@ -266,22 +269,24 @@ class TritonDigital(AdServerAdapter):
                     if targeting and "stationIds" in targeting:
                         flight_payload["stationIds"] = targeting["stationIds"]
 
-                flight_response = requests.post(f"{self.base_url}/flights", headers=self.headers, json=flight_payload)
+                flight_response = self.http.post(f"{self.base_url}/flights", headers=self.headers, json=flight_payload)
                 flight_response.raise_for_status()
-                flight_data = flight_response.json()
-                flight_id = flight_data.get("id")
-
-                # Build package response - Per AdCP spec v2.9.0, CreateMediaBuyResponse.Package contains:
-                # - package_id (required)
-                # - status (required)
-                # MediaPackage has buyer_ref populated from request
-                package_responses.append(
-                    ResponsePackage(
-                        buyer_ref=package.buyer_ref or "unknown",
-                        package_id=package.package_id,
-                        paused=False,  # Default to not paused for created packages
-                    )
+                return flight_response.json().get("id")
+
+            self.http.bulk(create_flight, packages)
+
+            # Build package responses - Per AdCP spec v2.9.0, CreateMediaBuyResponse.Package contains:
+            # - package_id (required)
+            # - status (required)
+            # MediaPackage has buyer_ref populated from request
+            package_responses = [
+                ResponsePackage(
+                    buyer_ref=package.buyer_ref or "unknown",
+                    package_id=package.package_id,
+                    paused=False,  # Default to not paused for created packages
                 )
+                for package in packages
+            ]
 
             # Use the actual campaign ID from Triton
             media_buy_id = f"triton_{campaign_id}"
@@ -338,49 +343,51 @@ class TritonDigital(AdServerAdapter):
                 campaign_id = media_buy_id.replace("triton_", "")
 
                 # Get all flights for the campaign to map package names to flight IDs
-                flights_response = requests.get(
+                flights_response = self.http.get(
                     f"{self.base_url}/flights", headers=self.headers, params={"campaignId": campaign_id}
                 )
                 flights_response.raise_for_status()
                 flights = flights_response.json()
                 flight_map = {flight["name"]: flight["id"] for flight in flights}
+            except requests.exceptions.RequestException as e:
+                self.log(f"Error loading Triton flights: {e}")
+                return [AssetStatus(creative_id=asset["creative_id"], status="failed") for asset in assets]
 
-                for asset in assets:
-                    if asset["format"] != "audio":
-                        self.log(
-                            f"Skipping asset {asset['creative_id']} with unsupported format for Triton: {asset['format']}"
-                        )
-                        continue
+            def upload(asset: dict[str, Any]) -> AssetStatus | None:
+                if asset["format"] != "audio":
+                    self.log(
+                        f"Skipping asset {asset['creative_id']} with unsupported format for Triton: {asset['format']}"
+                    )
+                    return None
 
-                    creative_payload = {"name": asset["name"], "type": "AUDIO", "url": asset["media_url"]}
+                creative_payload = {"name": asset["name"], "type": "AUDIO", "url": asset["media_url"]}
 
-                    creative_response = requests.post(
+                try:
+                    creative_response = self.http.post(
                         f"{self.base_url}/creatives", headers=self.headers, json=creative_payload
                     )
                     creative_response.raise_for_status()
-                    creative_data = creative_response.json()
-                    creative_id = creative_data["id"]
+                    creative_id = creative_response.json()["id"]
 
                     # Associate the creative with the assigned flights
                     flight_ids_to_associate = [
                         flight_map[pkg_id] for pkg_id in asset.get("package_assignments", []) if pkg_id in flight_map
                     ]
+                    for flight_id in flight_ids_to_associate:
+                        association_payload = {"creativeIds": [creative_id]}
+                        assoc_response = self.http.put(
+                            f"{self.base_url}/flights/{flight_id}", headers=self.headers, json=association_payload
+                        )
+                        assoc_response.raise_for_status()
+                except requests.exceptions.RequestException as e:
+                    self.log(f"Error creating Triton Creative for {asset['creative_id']}: {e}")
+                    return AssetStatus(creative_id=asset["creative_id"], status="failed")
 
-                    if flight_ids_to_associate:
-                        for flight_id in flight_ids_to_associate:
-                            association_payload = {"creativeIds": [creative_id]}
-                            assoc_response = requests.put(
-                                f"{self.base_url}/flights/{flight_id}", headers=self.headers, json=association_payload
-                            )
-                            assoc_response.raise_for_status()
-
-                    created_asset_statuses.append(AssetStatus(creative_id=asset["creative_id"], status="approved"))
+                return AssetStatus(creative_id=asset["creative_id"], status="approved")
 
-            except requests.exceptions.RequestException as e:
-                self.log(f"Error creating Triton Creative: {e}")
-                for asset in assets:
-                    if not any(s.creative_id == asset["creative_id"] for s in created_asset_statuses):
-                        created_asset_statuses.append(AssetStatus(creative_id=asset["creative_id"], status="failed"))
+            # Creatives are independent of each other: upload them concurrently
+            statuses = self.http.bulk(upload, assets)
+            created_asset_statuses.extend(status for status in statuses if status is not None)
 
         return created_asset_statuses
 
@@ -418,7 +425,7 @@ class TritonDigital(AdServerAdapter):
                 # Extract campaign ID from media_buy_id
                 campaign_id = media_buy_id.replace("triton_", "")
 
-                response = requests.get(f"{self.base_url}/campaigns/{campaign_id}", headers=self.headers)
+                response = self.http.get(f"{self.base_url}/campaigns/{campaign_id}", headers=self.headers)
                 response.raise_for_status()
                 campaign_data = response.json()
 
@@ -490,7 +497,7 @@ class TritonDigital(AdServerAdapter):
             }
 
             try:
-                response = requests.post(f"{self.base_url}/reports", headers=self.headers, json=report_payload)
+                response = self.http.post(f"{self.base_url}/reports", headers=self.headers, json=report_payload)
                 response.raise_for_status()
                 report_job = response.json()
                 job_id = report_job["id"]
@@ -498,7 +505,7 @@ class TritonDigital(AdServerAdapter):
                 import time
 
                 for _ in range(10):  # Poll for up to 5 seconds
-                    status_response = requests.get(f"{self.base_url}/reports/{job_id}", headers=self.headers)
+                    status_response = self.http.get(f"{self.base_url}/reports/{job_id}", headers=self.headers)
                     status_response.raise_for_status()
                     status_data = status_response.json()
                     if status_data["status"] == "COMPLETED":
@@ -508,7 +515,7 @@ class TritonDigital(AdServerAdapter):
                 else:
                     raise Exception("Triton report did not complete in time.")
 
-                report_response = requests.get(report_url)
+                report_response = self.http.get(report_url)
                 report_response.raise_for_status()
 
                 import csv
@@ -671,14 +678,14 @@ class TritonDigital(AdServerAdapter):
                 if action in ["pause_media_buy", "resume_media_buy"]:
                     # Update campaign status
                     update_payload: dict[str, Any] = {"active": action == "resume_media_buy"}
-                    response = requests.put(
+                    response = self.http.put(
                         f"{self.base_url}/campaigns/{campaign_id}", headers=self.headers, json=update_payload
                     )
                     response.raise_for_status()
 
                 elif action in ["pause_package", "resume_package"] and package_id:
                     # Get flight ID by name
-                    flights_response = requests.get(
+                    flights_response = self.http.get(
                         f"{self.base_url}/flights", headers=self.headers, params={"campaignId": campaign_id}
                     )
                     flights_response.raise_for_status()
@@ -695,7 +702,7 @@ class TritonDigital(AdServerAdapter):
                     # Update flight status
                     is_resume = action == "resume_package"
                     flight_update_payload: dict[str, Any] = {"active": is_resume}
-                    response = requests.put(
+                    response = self.http.put(
                         f"{self.base_url}/flights/{flight['id']}", headers=self.headers, json=flight_update_payload
                     )
                     response.raise_for_status()
@@ -722,7 +729,7 @@ class TritonDigital(AdServerAdapter):
                     and budget is not None
                 ):
                     # Get flight and update goal
-                    flights_response = requests.get(
+                    flights_response = self.http.get(
                         f"{self.base_url}/flights", headers=self.headers, params={"campaignId": campaign_id}
                     )
                     flights_response.raise_for_status()
@@ -745,7 +752,7 @@ class TritonDigital(AdServerAdapter):
                         new_impressions = budget  # budget param contains impressions
 
                     goal_update_payload: dict[str, Any] = {"goal": {"type": "IMPRESSIONS", "value": new_impressions}}
-                    response = requests.put(
+                    response = self.http.put(
                         f"{self.base_url}/flights/{flight['id']}", headers=self.headers, json=goal_update_payload
                     )
                     response.raise_for_status()
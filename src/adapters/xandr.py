@@ -4,14 +4,18 @@ Xandr (Microsoft Monetize) adapter for AdCP.
 Implements the AdServerAdapter interface for Microsoft's Xandr platform.
 """
 
+import hashlib
 import logging
-from datetime import UTC, datetime, timedelta
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
 import requests
 
 from src.adapters.base import AdServerAdapter
-from src.core.retry_utils import api_retry
+from src.adapters.http_transport import get_http_transport
 from src.core.schemas import (
     AdapterGetMediaBuyDeliveryResponse,
     CreateMediaBuyRequest,
@@ -201,6 +205,88 @@ class CreativeAsset:
 
 logger = logging.getLogger(__name__)
 
+XANDR_TOKEN_TTL = timedelta(hours=2)  # Xandr tokens typically last 2 hours
+XANDR_TOKEN_REFRESH_MARGIN = timedelta(minutes=10)
+XANDR_PAGE_SIZE = 100  # Largest num_elements the API serves per page
+XANDR_REPORT_WINDOW_DAYS = 7
+XANDR_REPORT_TIMEOUT_SECONDS = 60
+
+
+class XandrTokenCache:
+    """Process-wide Xandr session tokens keyed by endpoint and credentials.
+
+    Adapters are created per tool call by get_adapter, so without a shared cache
+    every call posted credentials to /auth again. Tokens are renewed proactively
+    within XANDR_TOKEN_REFRESH_MARGIN of expiry: one caller renews (single flight)
+    while the others keep using the still-valid token. Callers only block when
+    there is no valid token, and then wait for that one renewal.
+    """
+
+    def __init__(self) -> None:
+        self._tokens: dict[tuple[str, str, str], tuple[str, datetime]] = {}
+        self._locks: dict[tuple[str, str, str], threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    @staticmethod
+    def key(api_endpoint: str, username: str | None, password: str | None) -> tuple[str, str, str]:
+        return (api_endpoint, username or "", hashlib.sha256((password or "").encode("utf-8")).hexdigest())
+
+    def get(self, key: tuple[str, str, str], authenticate: Callable[[], str]) -> tuple[str, datetime]:
+        """Return (token, expiry), calling ``authenticate`` only when this caller wins the renewal."""
+        entry = self._tokens.get(key)
+        if entry and datetime.now(UTC) < entry[1] - XANDR_TOKEN_REFRESH_MARGIN:
+            return entry
+
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        if entry is not None and datetime.now(UTC) < entry[1]:
+            if not lock.acquire(blocking=False):
+                return entry  # Another caller is renewing; the current token is still valid
+        else:
+            lock.acquire()
+
+        try:
+            # Renewed by another caller while we waited for the lock
+            current = self._tokens.get(key)
+            if current and datetime.now(UTC) < current[1] - XANDR_TOKEN_REFRESH_MARGIN:
+                return current
+            try:
+                token = authenticate()
+            except Exception:
+                if current and datetime.now(UTC) < current[1]:
+                    logger.warning("Xandr token renewal failed; using the current token until it expires")
+                    return current
+                raise
+            renewed = (token, datetime.now(UTC) + XANDR_TOKEN_TTL)
+            self._tokens[key] = renewed
+            return renewed
+        finally:
+            lock.release()
+
+    def invalidate(self, key: tuple[str, str, str], token: str | None) -> None:
+        """Forget ``token`` (e.g. after a 401) unless it has already been replaced."""
+        with self._guard:
+            entry = self._tokens.get(key)
+            if entry and entry[0] == token:
+                del self._tokens[key]
+
+    def clear(self) -> None:
+        with self._guard:
+            self._tokens.clear()
+
+
+_token_cache = XandrTokenCache()
+
+
+def _report_windows(start: date, end: date, days: int = XANDR_REPORT_WINDOW_DAYS) -> list[tuple[date, date]]:
+    """Split [start, end) into consecutive windows of at most ``days`` days."""
+    windows = []
+    while start < end:
+        window_end = min(start + timedelta(days=days), end)
+        windows.append((start, window_end))
+        start = window_end
+    return windows or [(start, end)]
+
 
 class XandrAdapter(AdServerAdapter):
     """Adapter for Microsoft Xandr (formerly AppNexus) platform."""
@@ -221,9 +307,13 @@ class XandrAdapter(AdServerAdapter):
             mapping = principal.platform_mappings["xandr"]
             self.advertiser_id = mapping.get("advertiser_id")
 
-        # Session management
-        self.token = None
-        self.token_expiry = None
+        # Session management (tokens are shared across instances through _token_cache)
+        self.token: str | None = None
+        self.token_expiry: datetime | None = None
+        self._credentials_key = XandrTokenCache.key(self.api_endpoint, self.username, self.password)
+        self.http = get_http_transport(
+            "xandr", str(self.member_id), rate_limit_per_second=config.get("rate_limit_per_second")
+        )
 
         # Manual approval mode
         self.manual_approval = config.get("manual_approval_required", False)
@@ -231,52 +321,52 @@ class XandrAdapter(AdServerAdapter):
 
         logger.info(f"Initialized Xandr adapter for principal {principal.name}")
 
-    @api_retry
     def _authenticate(self):
-        """Authenticate with Xandr API and get session token."""
-        if self.token and self.token_expiry and datetime.now(UTC) < self.token_expiry:
-            return  # Token still valid
+        """Ensure a valid session token (shared by all adapters using the same credentials)."""
+        self.token, self.token_expiry = _token_cache.get(self._credentials_key, self._request_token)
 
+    def _request_token(self) -> str:
+        """Post credentials to /auth and return a new session token."""
         auth_url = f"{self.api_endpoint}/auth"
         auth_data = {"auth": {"username": self.username, "password": self.password}}
 
         try:
-            response = requests.post(auth_url, json=auth_data)
+            response = self.http.post(auth_url, json=auth_data)
             response.raise_for_status()
 
             data = response.json()
             if data.get("response", {}).get("status") == "OK":
-                self.token = data["response"]["token"]
-                # Xandr tokens typically last 2 hours
-                self.token_expiry = datetime.now(UTC) + timedelta(hours=2)
                 logger.info("Successfully authenticated with Xandr")
-            else:
-                raise Exception(f"Authentication failed: {data}")
+                return data["response"]["token"]
+            raise Exception(f"Authentication failed: {data}")
 
         except Exception as e:
             logger.error(f"Xandr authentication error: {e}")
             raise
 
-    @api_retry
+    def _send(self, method: str, url: str, data: dict | None) -> requests.Response:
+        headers = {"Authorization": self.token, "Content-Type": "application/json"}
+        if method == "GET":
+            return self.http.get(url, headers=headers, params=data)
+        if method in ("POST", "PUT"):
+            return self.http.request(method, url, headers=headers, json=data)
+        if method == "DELETE":
+            return self.http.delete(url, headers=headers)
+        raise ValueError(f"Unsupported method: {method}")
+
     def _make_request(self, method: str, endpoint: str, data: dict | None = None) -> dict:
-        """Make authenticated request to Xandr API."""
+        """Make authenticated request to Xandr API (pooled, rate limited and retried by the shared transport)."""
         self._authenticate()
 
-        headers = {"Authorization": self.token, "Content-Type": "application/json"}
-
         url = f"{self.api_endpoint}{endpoint}"
 
         try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=data)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, json=data)
-            elif method == "PUT":
-                response = requests.put(url, headers=headers, json=data)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+            response = self._send(method, url, data)
+            if response.status_code == 401:
+                # Token revoked or expired early: renew once and replay (the request was not processed)
+                _token_cache.invalidate(self._credentials_key, self.token)
+                self._authenticate()
+                response = self._send(method, url, data)
 
             response.raise_for_status()
             return response.json()
@@ -285,6 +375,40 @@ class XandrAdapter(AdServerAdapter):
             logger.error(f"Xandr API request failed: {e}")
             raise
 
+    def _get_all(self, endpoint: str, collection: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        """GET every element of a paged collection; pages after the first are fetched concurrently."""
+        params = dict(params or {})
+
+        def page(start: int) -> dict[str, Any]:
+            response = self._make_request(
+                "GET", endpoint, {**params, "start_element": start, "num_elements": XANDR_PAGE_SIZE}
+            )
+            return response["response"]
+
+        first = page(0)
+        items = list(first.get(collection) or [])
+        total = int(first.get("count") or len(items))
+        for rest in self.http.bulk(page, range(XANDR_PAGE_SIZE, total, XANDR_PAGE_SIZE)):
+            items.extend(rest.get(collection) or [])
+        return items
+
+    def _run_report(self, report: dict[str, Any]) -> list[dict[str, Any]]:
+        """Request a report, wait until it is ready and return its rows."""
+        report_response = self._make_request("POST", "/report", {"report": report})
+        report_id = report_response["response"]["report_id"]
+
+        deadline = time.monotonic() + XANDR_REPORT_TIMEOUT_SECONDS
+        poll_interval = 1.0
+        while self._make_request("GET", f"/report?id={report_id}")["response"]["status"] != "ready":
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Xandr report {report_id} not ready after {XANDR_REPORT_TIMEOUT_SECONDS}s")
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, 5.0)
+
+        report_data = self._make_request("GET", f"/report-download?id={report_id}")
+        # Type guard: rows should be dict[str, Any]
+        return [row for row in report_data.get("data", []) if isinstance(row, dict)]
+
     def _requires_manual_approval(self, operation: str) -> bool:
         """Check if an operation requires manual approval."""
         return self.manual_approval and operation in self.manual_operations
@@ -558,13 +682,12 @@ class XandrAdapter(AdServerAdapter):
             io_response = self._make_request("POST", "/insertion-order", io_data)
             io_id = io_response["response"]["insertion-order"]["id"]
 
-            package_responses = []
-
-            # Create line items for each package
-            for _idx, package in enumerate(packages):
-                if not self.advertiser_id:
-                    raise ValueError("Advertiser ID is required for creating line items")
+            if not self.advertiser_id:
+                raise ValueError("Advertiser ID is required for creating line items")
+            advertiser_id = int(self.advertiser_id)
 
+            # Create line items for each package (independent of each other, so issued concurrently)
+            def create_line_item(package):
                 # Get pricing for this package
                 pricing_info = package_pricing_info.get(package.package_id) if package_pricing_info else None
                 if pricing_info:
@@ -578,7 +701,7 @@ class XandrAdapter(AdServerAdapter):
                     "line-item": {
                         "name": package.name,
                         "insertion_order_id": io_id,
-                        "advertiser_id": int(self.advertiser_id),
+                        "advertiser_id": advertiser_id,
                         "start_date": start_time.date().isoformat(),
                         "end_date": end_time.date().isoformat(),
                         "revenue_type": "cpm",
@@ -601,19 +724,22 @@ class XandrAdapter(AdServerAdapter):
                     li_data["line-item"]["profile_id"] = self._create_targeting_profile(targeting_dict)
 
                 li_response = self._make_request("POST", "/line-item", li_data)
-                li_id = li_response["response"]["line-item"]["id"]
+                return li_response["response"]["line-item"]["id"]
 
-                # Build package response - Per AdCP spec, CreateMediaBuyResponse.Package only contains:
-                # - buyer_ref (required)
-                # - package_id (required)
-                # MediaPackage has buyer_ref populated from request
-                package_responses.append(
-                    AdCPPackage(
-                        buyer_ref=package.buyer_ref or "unknown",
-                        package_id=package.package_id,
-                        paused=False,
-                    )
+            self.http.bulk(create_line_item, packages)
+
+            # Build package responses - Per AdCP spec, CreateMediaBuyResponse.Package only contains:
+            # - buyer_ref (required)
+            # - package_id (required)
+            # MediaPackage has buyer_ref populated from request
+            package_responses = [
+                AdCPPackage(
+                    buyer_ref=package.buyer_ref or "unknown",
+                    package_id=package.package_id,
+                    paused=False,
                 )
+                for package in packages
+            ]
 
             return CreateMediaBuySuccess(
                 buyer_ref=request.buyer_ref or "",
@@ -689,8 +815,7 @@ class XandrAdapter(AdServerAdapter):
             io = io_response["response"]["insertion-order"]
 
             # Get line items
-            li_response = self._make_request("GET", f"/line-item?insertion_order_id={io_id}")
-            line_items = li_response["response"]["line-items"]
+            line_items = self._get_all("/line-item", "line-items", {"insertion_order_id": io_id})
 
             # Calculate overall status
             total_budget = io["budget_intervals"][0]["lifetime_budget"]
@@ -739,13 +864,14 @@ class XandrAdapter(AdServerAdapter):
         try:
             if not self.advertiser_id:
                 raise ValueError("Advertiser ID is required for creating creatives")
+            advertiser_id = int(self.advertiser_id)
 
-            for asset in assets:
+            def upload(asset: CreativeAsset) -> tuple[str, str]:
                 # Create creative
                 creative_data = {
                     "creative": {
                         "name": asset.name,
-                        "advertiser_id": int(self.advertiser_id),
+                        "advertiser_id": advertiser_id,
                         "format": self._map_creative_format(asset.format),
                         "width": asset.width or 300,
                         "height": asset.height or 250,
@@ -760,7 +886,6 @@ class XandrAdapter(AdServerAdapter):
 
                 response = self._make_request("POST", "/creative", creative_data)
                 creative_id = response["response"]["creative"]["id"]
-                creative_mapping[asset.creative_id] = str(creative_id)
 
                 # Associate creative with line items
                 for package_id in asset.package_assignments:
@@ -768,6 +893,10 @@ class XandrAdapter(AdServerAdapter):
                         li_id = package_id.replace("xandr_li_", "")
                         self._make_request("POST", f"/line-item/{li_id}/creative/{creative_id}")
 
+                return asset.creative_id, str(creative_id)
+
+            # Creatives are independent of each other: upload them concurrently
+            creative_mapping.update(self.http.bulk(upload, assets))
             return creative_mapping
 
         except Exception as e:
@@ -797,9 +926,10 @@ class XandrAdapter(AdServerAdapter):
             self._make_request("PUT", f"/insertion-order?id={io_id}", update_data)
 
             # Also pause all line items
-            li_response = self._make_request("GET", f"/line-item?insertion_order_id={io_id}")
-            for li in li_response["response"]["line-items"]:
-                self._make_request("PUT", f"/line-item?id={li['id']}", {"line-item": {"state": "inactive"}})
+            self.http.bulk(
+                lambda li: self._make_request("PUT", f"/line-item?id={li['id']}", {"line-item": {"state": "inactive"}}),
+                self._get_all("/line-item", "line-items", {"insertion_order_id": io_id}),
+            )
 
             return True
 
@@ -810,11 +940,13 @@ class XandrAdapter(AdServerAdapter):
     def get_all_media_buys(self) -> list[MediaBuy]:
         """Get all insertion orders for the advertiser."""
         try:
-            # Get all IOs for advertiser
-            response = self._make_request("GET", f"/insertion-order?advertiser_id={self.advertiser_id}")
+            # Get all IOs for advertiser (every page, not just the first)
+            insertion_orders = self._get_all(
+                "/insertion-order", "insertion-orders", {"advertiser_id": self.advertiser_id}
+            )
 
             media_buys = []
-            for io in response["response"]["insertion-orders"]:
+            for io in insertion_orders:
                 media_buy = MediaBuy(
                     media_buy_id=f"xandr_io_{io['id']}",
                     platform_id=str(io["id"]),
@@ -840,12 +972,11 @@ class XandrAdapter(AdServerAdapter):
             return {"status": "accepted", "task_id": task_id, "detail": "Package updates require manual approval"}
 
         try:
-            updated_packages = []
 
-            for package_update in packages:
+            def apply_update(package_update: dict[str, Any]) -> str | None:
                 package_id = package_update.get("package_id")
                 if not package_id or not package_id.startswith("xandr_li_"):
-                    continue
+                    return None
 
                 li_id = package_id.replace("xandr_li_", "")
 
@@ -889,7 +1020,14 @@ class XandrAdapter(AdServerAdapter):
                             xandr_creative_id = creative_id.replace("xandr_creative_", "")
                             self._make_request("POST", f"/line-item/{li_id}/creative/{xandr_creative_id}")
 
-                updated_packages.append({"package_id": package_id, "status": "updated"})
+                return package_id
+
+            # Line items are independent of each other: update them concurrently
+            updated_packages = [
+                {"package_id": package_id, "status": "updated"}
+                for package_id in self.http.bulk(apply_update, packages)
+                if package_id is not None
+            ]
 
             return {
                 "status": "accepted",
@@ -913,9 +1051,10 @@ class XandrAdapter(AdServerAdapter):
             self._make_request("PUT", f"/insertion-order?id={io_id}", update_data)
 
             # Also resume all line items
-            li_response = self._make_request("GET", f"/line-item?insertion_order_id={io_id}")
-            for li in li_response["response"]["line-items"]:
-                self._make_request("PUT", f"/line-item?id={li['id']}", {"line-item": {"state": "active"}})
+            self.http.bulk(
+                lambda li: self._make_request("PUT", f"/line-item?id={li['id']}", {"line-item": {"state": "active"}}),
+                self._get_all("/line-item", "line-items", {"insertion_order_id": io_id}),
+            )
 
             return True
 
@@ -929,53 +1068,39 @@ class XandrAdapter(AdServerAdapter):
             if not self.advertiser_id:
                 raise ValueError("Advertiser ID is required for reporting")
 
-            # Create advertiser-level report
-            report_data = {
-                "report": {
-                    "report_type": "advertiser_analytics",
-                    "columns": [
-                        "day",
-                        "insertion_order_id",
-                        "insertion_order_name",
-                        "line_item_id",
-                        "line_item_name",
-                        "creative_id",
-                        "creative_name",
-                        "imps",
-                        "clicks",
-                        "media_cost",
-                        "booked_revenue",
-                        "video_starts",
-                        "video_completions",
-                    ],
-                    "filters": [{"advertiser_id": int(self.advertiser_id)}],
-                    "start_date": start_date.date().isoformat(),
-                    "end_date": end_date.date().isoformat(),
-                    "timezone": "UTC",
-                    "format": "json",
-                }
-            }
-
-            # Request report
-            report_response = self._make_request("POST", "/report", report_data)
-            report_id = report_response["response"]["report_id"]
+            # Advertiser-level report, split into day windows that Xandr builds in parallel.
+            # Rows are per day and end_date is exclusive, so the windows add up to the full range.
+            advertiser_id = int(self.advertiser_id)
 
-            # Poll for report completion
-            import time
-
-            max_wait = 60  # Max 60 seconds
-            poll_interval = 5
-            waited = 0
-
-            while waited < max_wait:
-                status_response = self._make_request("GET", f"/report?id={report_id}")
-                if status_response["response"]["status"] == "ready":
-                    break
-                time.sleep(poll_interval)
-                waited += poll_interval
+            def window_rows(window: tuple[date, date]) -> list[dict[str, Any]]:
+                return self._run_report(
+                    {
+                        "report_type": "advertiser_analytics",
+                        "columns": [
+                            "day",
+                            "insertion_order_id",
+                            "insertion_order_name",
+                            "line_item_id",
+                            "line_item_name",
+                            "creative_id",
+                            "creative_name",
+                            "imps",
+                            "clicks",
+                            "media_cost",
+                            "booked_revenue",
+                            "video_starts",
+                            "video_completions",
+                        ],
+                        "filters": [{"advertiser_id": advertiser_id}],
+                        "start_date": window[0].isoformat(),
+                        "end_date": window[1].isoformat(),
+                        "timezone": "UTC",
+                        "format": "json",
+                    }
+                )
 
-            # Download report
-            report_data = self._make_request("GET", f"/report-download?id={report_id}")
+            windows = _report_windows(start_date.date(), end_date.date())
+            rows = [row for window in self.http.bulk(window_rows, windows) for row in window]
 
             # Process and aggregate data
             summary: dict[str, Any] = {
@@ -989,10 +1114,7 @@ class XandrAdapter(AdServerAdapter):
                 "by_day": {},
             }
 
-            for row in report_data.get("data", []):
-                # Type guard: row should be dict[str, Any]
-                if not isinstance(row, dict):
-                    continue
+            for row in rows:
                 # Aggregate totals
                 summary["total_impressions"] += row.get("imps", 0)
                 summary["total_clicks"] += row.get("clicks", 0)
@@ -1052,9 +1174,9 @@ class XandrAdapter(AdServerAdapter):
         try:
             io_id = media_buy_id.replace("xandr_io_", "")
 
-            # Create creative performance report
-            report_data = {
-                "report": {
+            # Creative performance report (no day column, so one report for the whole range)
+            rows = self._run_report(
+                {
                     "report_type": "creative_analytics",
                     "columns": [
                         "creative_id",
@@ -1075,26 +1197,12 @@ class XandrAdapter(AdServerAdapter):
                     "timezone": "UTC",
                     "format": "json",
                 }
-            }
-
-            # Request and wait for report
-            report_response = self._make_request("POST", "/report", report_data)
-            report_id = report_response["response"]["report_id"]
-
-            import time
-
-            time.sleep(5)  # Simple wait - production would poll properly
-
-            # Download report
-            report_data = self._make_request("GET", f"/report-download?id={report_id}")
+            )
 
             # Process creative data
             creative_performance: list[dict[str, Any]] = []
 
-            for row in report_data.get("data", []):
-                # Type guard: row should be dict[str, Any]
-                if not isinstance(row, dict):
-                    continue
+            for row in rows:
                 impressions = row.get("imps", 0)
                 clicks = row.get("clicks", 0)
                 spend = row.get("media_cost", 0)
@@ -2,9 +2,9 @@
 
 import json
 import logging
-import time
 from collections import defaultdict
-from datetime import UTC, datetime, timedelta
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
 
 from flask import Blueprint, Response, jsonify, request
 from sqlalchemy import select
@@ -12,6 +12,7 @@ from sqlalchemy import select
 from src.admin.utils import require_tenant_access
 from src.core.database.database_session import get_db_session
 from src.core.database.models import AuditLog
+from src.services.activity_stream_hub import get_activity_stream_hub
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,8 @@ activity_stream_bp = Blueprint("activity_stream", __name__)
 
 # Rate limiting for SSE connections
 MAX_CONNECTIONS_PER_TENANT = 10
+# Idle time between heartbeats on an SSE stream
+SSE_HEARTBEAT_SECONDS = 15
 connection_counts: dict[str, int] = defaultdict(int)
 connection_timestamps: dict[str, list[float]] = defaultdict(list)
 
@@ -164,8 +167,20 @@ def format_activity_from_audit_log(audit_log: AuditLog) -> dict:
     }
 
 
+def _format_activities(audit_logs) -> list[dict]:
+    """Convert audit logs to activities, skipping any that fail to format."""
+    activities = []
+    for audit_log in audit_logs:
+        try:
+            activity = format_activity_from_audit_log(audit_log)
+            activities.append(activity)
+        except Exception as e:
+            logger.warning(f"Failed to format activity from audit log {audit_log.log_id}: {e}")
+    return activities
+
+
 def get_recent_activities(tenant_id: str, since: datetime = None, limit: int = 50) -> list[dict]:
-    """Get recent activities for a tenant from the database."""
+    """Get recent activities for a tenant from the database, newest first."""
     # Validate input parameters
     if not tenant_id or not isinstance(tenant_id, str) or len(tenant_id) > 50:
         logger.warning(f"Invalid tenant_id provided: {tenant_id}")
@@ -185,21 +200,50 @@ def get_recent_activities(tenant_id: str, since: datetime = None, limit: int = 5
             audit_logs = db_session.scalars(stmt.order_by(AuditLog.timestamp.desc()).limit(limit)).all()
 
             # Convert to activity format
-            activities = []
-            for audit_log in audit_logs:
-                try:
-                    activity = format_activity_from_audit_log(audit_log)
-                    activities.append(activity)
-                except Exception as e:
-                    logger.warning(f"Failed to format activity from audit log {audit_log.log_id}: {e}")
-
-            return activities
+            return _format_activities(audit_logs)
 
     except Exception as e:
         logger.error(f"Failed to query activities for tenant {tenant_id}: {e}")
         return []
 
 
+def iter_activities_after(tenant_id: str, after_id: int, page_size: int = 100) -> Iterator[list[dict]]:
+    """Yield a tenant's activities after audit log ``after_id`` in pages, oldest first, until caught up.
+
+    Used to resume an SSE stream whose Last-Event-ID is older than the hub's ring
+    buffer, so a client that missed more than one page still gets every event.
+    """
+    while True:
+        with get_db_session() as db_session:
+            audit_logs = db_session.scalars(
+                select(AuditLog)
+                .filter(AuditLog.tenant_id == tenant_id, AuditLog.log_id > after_id)
+                .order_by(AuditLog.log_id)
+                .limit(page_size)
+            ).all()
+            activities = _format_activities(audit_logs)
+            if audit_logs:
+                after_id = audit_logs[-1].log_id
+
+        if activities:
+            yield activities
+        if len(audit_logs) < page_size:
+            return
+
+
+def _parse_last_event_id(value: str | None) -> int | None:
+    """Parse an SSE Last-Event-ID (an audit log id); None if absent or malformed."""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def _format_sse_event(activity: dict) -> str:
+    """Format an activity as an SSE event; the id lets browsers resume with Last-Event-ID."""
+    return f"id: {activity['id']}\ndata: {json.dumps(activity)}\n\n"
+
+
 @activity_stream_bp.route("/tenant/<tenant_id>/activity", methods=["GET"])
 @require_tenant_access(api_mode=False)  # Use normal redirect auth for polling
 def activity_feed(tenant_id, **kwargs):
@@ -260,95 +304,65 @@ def activity_events(tenant_id, **kwargs):
         f"SSE GET request starting - tenant: {tenant_id}, active_connections: {active_connections + 1}, total_connections: {connection_counts[tenant_id]}"
     )
 
+    last_event_id = _parse_last_event_id(request.headers.get("Last-Event-ID") or request.args.get("last_event_id"))
+
     def generate():
         """Generator function that yields SSE formatted data."""
-        # Track resources for cleanup
-        cleanup_needed = False
+        hub = get_activity_stream_hub()
+        hub.subscribe()
 
         try:
-            # Send initial historical data
-            logger.info(f"Starting SSE stream for tenant {tenant_id}")
-            recent_activities = get_recent_activities(tenant_id, limit=50)
-
-            for activity in reversed(recent_activities):  # Reverse to show oldest first
-                data = json.dumps(activity)
-                yield f"data: {data}\n\n"
+            logger.info(f"Starting SSE stream for tenant {tenant_id} (last_event_id={last_event_id})")
+            # Take the cursor before loading the backlog so nothing published in between is lost
+            cursor = hub.cursor(tenant_id)
+
+            backlog_pages: Iterable[list[dict]]
+            if last_event_id is not None:
+                replayed = hub.replay(tenant_id, last_event_id)
+                if replayed is None:
+                    # Older than the ring buffer: catch up from the database, page by page
+                    backlog_pages = iter_activities_after(tenant_id, last_event_id)
+                else:
+                    backlog_pages = [replayed]
+            else:
+                backlog_pages = [list(reversed(get_recent_activities(tenant_id, limit=50)))]  # Oldest first
 
-            # Keep track of last check time
-            last_check = datetime.now(UTC)
-            cleanup_needed = True
+            sent_ids = set()
+            for page in backlog_pages:
+                for activity in page:
+                    sent_ids.add(activity.get("id"))
+                    yield _format_sse_event(activity)
 
-            # Poll for new activities every 2 seconds
             while True:
-                try:
-                    # Check for new activities since last check
-                    new_activities = get_recent_activities(
-                        tenant_id,
-                        since=last_check - timedelta(seconds=1),  # Small overlap to avoid missing events
-                        limit=10,
-                    )
-
-                    # Send new activities
-                    for activity in reversed(new_activities):  # Newest activities last
-                        data = json.dumps(activity)
-                        yield f"data: {data}\n\n"
-
-                    # Update last check time
-                    if new_activities:
-                        # Use timestamp of newest activity
-                        newest_timestamp_str = new_activities[0]["timestamp"]
-                        newest_timestamp = datetime.fromisoformat(newest_timestamp_str.replace("Z", "+00:00"))
-                        last_check = max(last_check, newest_timestamp)
-                    else:
-                        last_check = datetime.now(UTC)
-
-                    # Send heartbeat to keep connection alive
-                    yield ": heartbeat\n\n"
-
-                    # Wait before next poll
-                    time.sleep(2)
-
-                except GeneratorExit:
-                    logger.info(f"SSE client disconnected for tenant {tenant_id}")
-                    cleanup_needed = True
-                    break
-                except Exception as e:
-                    logger.error(f"Error in SSE stream for tenant {tenant_id}: {e}")
-                    cleanup_needed = True
-                    # Send error event
-                    error_data = json.dumps(
-                        {
-                            "type": "error",
-                            "message": "Stream error occurred",
-                            "timestamp": datetime.now(UTC).isoformat(),
-                        }
-                    )
-                    yield f"event: error\ndata: {error_data}\n\n"
-                    time.sleep(5)  # Wait longer after error
-
+                cursor, activities = hub.wait_for_activities(tenant_id, cursor, timeout=SSE_HEARTBEAT_SECONDS)
+                for activity in activities:
+                    if activity.get("id") in sent_ids:
+                        continue
+                    yield _format_sse_event(activity)
+                sent_ids.clear()
+
+                # Send heartbeat to keep connection alive
+                yield ": heartbeat\n\n"
+
+        except GeneratorExit:
+            logger.info(f"SSE client disconnected for tenant {tenant_id}")
         except Exception as e:
-            logger.error(f"Failed to start SSE stream for tenant {tenant_id}: {e}")
-            cleanup_needed = True
+            logger.error(f"Error in SSE stream for tenant {tenant_id}: {e}")
             error_data = json.dumps(
                 {
                     "type": "error",
-                    "message": "Failed to start activity stream",
+                    "message": "Stream error occurred",
                     "timestamp": datetime.now(UTC).isoformat(),
                 }
             )
             yield f"event: error\ndata: {error_data}\n\n"
         finally:
-            # Clean up resources
-            if cleanup_needed:
-                old_count = connection_counts[tenant_id]
-                connection_counts[tenant_id] = max(0, connection_counts[tenant_id] - 1)
-                logger.info(
-                    f"Cleaning up SSE stream resources for tenant {tenant_id} - connection count: {old_count} -> {connection_counts[tenant_id]}"
-                )
-                # Force garbage collection for any lingering resources
-                import gc
-
-                gc.collect()
+            hub.unsubscribe()
+            old_count = connection_counts[tenant_id]
+            connection_counts[tenant_id] = max(0, connection_counts[tenant_id] - 1)
+            logger.info(
+                f"Cleaning up SSE stream resources for tenant {tenant_id} - connection count: {old_count} -> {connection_counts[tenant_id]}"
+            )
 
     # Set appropriate headers for SSE
     response = Response(
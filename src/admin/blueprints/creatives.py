@@ -2,11 +2,9 @@
 
 import asyncio
 import logging
-import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import UTC, datetime
-from typing import Any
 
 from a2a.types import Task, TaskStatusUpdateEvent
 from adcp import create_a2a_webhook_payload, create_mcp_webhook_payload
@@ -39,10 +37,21 @@ def discover_creative_formats_from_url(url):
 
 
 from flask import Blueprint, jsonify, redirect, render_template, request, url_for
-from sqlalchemy import select
+from sqlalchemy import or_, select
 
 from src.admin.utils import require_tenant_access
 from src.admin.utils.audit_decorator import log_admin_action
+from src.admin.utils.listing import (
+    ListingError,
+    ListingSpec,
+    apply_filters,
+    count_by,
+    fetch_page,
+    listing_error_response,
+    next_page_url,
+    parse_listing_query,
+    wants_json,
+)
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Tenant
 
@@ -54,26 +63,6 @@ logger = logging.getLogger(__name__)
 # Create Blueprint
 creatives_bp = Blueprint("creatives", __name__)
 
-# Global ThreadPoolExecutor for async AI review (managed lifecycle)
-_ai_review_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ai_review_")
-_ai_review_tasks: dict[str, Any] = {}  # task_id -> Future mapping
-_ai_review_lock = threading.Lock()  # Protect _ai_review_tasks dict
-
-
-def _cleanup_completed_tasks():
-    """Clean up completed tasks older than 1 hour."""
-    import time
-
-    now = time.time()
-    with _ai_review_lock:
-        completed_tasks = []
-        for task_id, task_info in _ai_review_tasks.items():
-            if task_info["future"].done() and (now - task_info["created_at"]) > 3600:
-                completed_tasks.append(task_id)
-        for task_id in completed_tasks:
-            del _ai_review_tasks[task_id]
-            logger.debug(f"Cleaned up completed AI review task: {task_id}")
-
 
 def _compute_media_buy_status_from_flight_dates(media_buy) -> str:
     """Compute status based on flight dates: 'active' if within window, else 'scheduled'."""
@@ -105,13 +94,14 @@ async def _call_webhook_for_creative_status(
     creative_id,
     tenant_id: str | None = None,
 ):
-    """Send protocol-level push notification for creative status update.
+    """Queue protocol-level push notification for creative status update.
 
     Checks if all creatives in the sync_creatives task have been reviewed.
     Only fires the webhook when ALL creatives have been reviewed (approved or rejected).
+    The notification is written to the webhook outbox and delivered asynchronously.
 
     Returns:
-        bool: True if webhook delivered successfully, False otherwise (or if no config found)
+        bool: True if webhook queued successfully, False otherwise (or if no config found)
     """
     from src.core.schemas import CreativeStatusEnum
 
@@ -249,18 +239,20 @@ async def _call_webhook_for_creative_status(
                 # TODO: @yusuf - check if we want to make metadata typed
             }
 
-            await service.send_notification(
-                push_notification_config=push_notification_config, payload=payload, metadata=metadata
+            service.enqueue_notification(
+                db_session, push_notification_config=push_notification_config, payload=payload, metadata=metadata
             )
+            db_session.commit()
 
             logger.info(
-                f"Successfully sent protocol webhook for sync_creatives task {step.step_id} "
+                f"Queued protocol webhook for sync_creatives task {step.step_id} "
                 f"with {len(all_creatives)} reviewed creatives"
             )
 
             return True
         except Exception as send_e:
-            logger.error(f"Failed to send protocol webhook for creative {creative_id}: {send_e}")
+            db_session.rollback()
+            logger.error(f"Failed to queue protocol webhook for creative {creative_id}: {send_e}")
             return False
 
     except Exception as e:
@@ -275,12 +267,45 @@ def index(tenant_id, **kwargs):
     return redirect(url_for("creatives.review_creatives", tenant_id=tenant_id))
 
 
+# Statuses grouped under each review tab ("pending" covers both spellings in use)
+CREATIVE_STATUS_TABS = {
+    "pending": ("pending", "pending_review"),
+    "approved": ("approved",),
+    "rejected": ("rejected",),
+}
+
+
+def _creative_listing():
+    from src.core.database.models import Creative
+
+    return ListingSpec(
+        key=Creative.creative_id,
+        sorts={"created_at": Creative.created_at, "name": Creative.name, "status": Creative.status},
+        default_sort="-created_at",
+        filters={
+            "status": lambda value: Creative.status.in_(CREATIVE_STATUS_TABS.get(value, (value,))),
+            "principal_id": lambda value: Creative.principal_id == value,
+            "creative_format": lambda value: Creative.format == value,
+        },
+        search=lambda q: or_(Creative.name.icontains(q, autoescape=True), Creative.creative_id == q),
+    )
+
+
 @creatives_bp.route("/review", methods=["GET"])
 @require_tenant_access()
 def review_creatives(tenant_id, **kwargs):
-    """Unified creative management: view, review, and manage all creatives."""
+    """Unified creative management: view, review, and manage creatives, one page at a time.
+
+    Supports ?status=, ?principal_id=, ?creative_format=, ?q=, ?sort=, ?cursor= and ?format=json.
+    """
     from src.core.database.models import Creative, CreativeAssignment, MediaBuy, Principal, Product
 
+    listing_spec = _creative_listing()
+    try:
+        query = parse_listing_query(listing_spec)
+    except ListingError as e:
+        return listing_error_response(e)
+
     with get_db_session() as db_session:
         # Get tenant
         stmt = select(Tenant).filter_by(tenant_id=tenant_id)
@@ -288,27 +313,69 @@ def review_creatives(tenant_id, **kwargs):
         if not tenant:
             return "Tenant not found", 404
 
-        # Get all creatives ordered by status (pending first) then date
-        stmt = select(Creative).filter_by(tenant_id=tenant_id).order_by(Creative.status, Creative.created_at.desc())
-        creatives = db_session.scalars(stmt).all()
+        base_stmt = select(Creative).filter_by(tenant_id=tenant_id)
+        page = fetch_page(db_session, base_stmt, listing_spec, query)
+        creatives = page.items
+
+        # Load context for the page's creatives in one query per table
+        creative_ids = [creative.creative_id for creative in creatives]
+        principal_ids = {creative.principal_id for creative in creatives}
+        principal_names = {}
+        if principal_ids:
+            principal_names = dict(
+                db_session.execute(
+                    select(Principal.principal_id, Principal.name).where(
+                        Principal.tenant_id == tenant_id, Principal.principal_id.in_(principal_ids)
+                    )
+                ).all()
+            )
+
+        assignments_by_creative: dict[str, list] = {creative_id: [] for creative_id in creative_ids}
+        media_buys_by_id = {}
+        if creative_ids:
+            assignments = db_session.scalars(
+                select(CreativeAssignment).where(
+                    CreativeAssignment.tenant_id == tenant_id, CreativeAssignment.creative_id.in_(creative_ids)
+                )
+            ).all()
+            for assignment in assignments:
+                assignments_by_creative[assignment.creative_id].append(assignment)
+            media_buy_ids = {assignment.media_buy_id for assignment in assignments}
+            if media_buy_ids:
+                media_buys_by_id = {
+                    media_buy.media_buy_id: media_buy
+                    for media_buy in db_session.scalars(
+                        select(MediaBuy).where(MediaBuy.media_buy_id.in_(media_buy_ids))
+                    ).all()
+                }
+
+        # Promoted offering is the first product of the creative's first media buy
+        first_product_ids = {}
+        for creative_id, assignments in assignments_by_creative.items():
+            first_buy = next(
+                (media_buys_by_id[a.media_buy_id] for a in assignments if a.media_buy_id in media_buys_by_id), None
+            )
+            if first_buy and first_buy.raw_request:
+                packages = first_buy.raw_request.get("packages", [])
+                if packages and packages[0].get("product_id"):
+                    first_product_ids[creative_id] = packages[0]["product_id"]
+        product_names = {}
+        if first_product_ids:
+            product_names = dict(
+                db_session.execute(
+                    select(Product.product_id, Product.name).where(
+                        Product.product_id.in_(set(first_product_ids.values()))
+                    )
+                ).all()
+            )
 
         # Build creative data with context
         creative_list = []
         for creative in creatives:
-            # Get principal name
-            stmt = select(Principal).filter_by(tenant_id=tenant_id, principal_id=creative.principal_id)
-            principal = db_session.scalars(stmt).first()
-            principal_name = principal.name if principal else creative.principal_id
-
-            # Get all media buy assignments for this creative
-            stmt = select(CreativeAssignment).filter_by(tenant_id=tenant_id, creative_id=creative.creative_id)
-            assignments = db_session.scalars(stmt).all()
-
             # Get media buy details for each assignment
             media_buys = []
-            for assignment in assignments:
-                stmt = select(MediaBuy).filter_by(media_buy_id=assignment.media_buy_id)
-                media_buy = db_session.scalars(stmt).first()
+            for assignment in assignments_by_creative[creative.creative_id]:
+                media_buy = media_buys_by_id.get(assignment.media_buy_id)
                 if media_buy:
                     media_buys.append(
                         {
@@ -321,28 +388,13 @@ def review_creatives(tenant_id, **kwargs):
                         }
                     )
 
-            # Get promoted offering from first media buy (if any)
-            promoted_offering = None
-            if media_buys and media_buys[0]:
-                stmt = select(MediaBuy).filter_by(media_buy_id=media_buys[0]["media_buy_id"])
-                first_buy = db_session.scalars(stmt).first()
-                if first_buy and first_buy.raw_request:
-                    packages = first_buy.raw_request.get("packages", [])
-                    if packages:
-                        product_id = packages[0].get("product_id")
-                        if product_id:
-                            stmt = select(Product).filter_by(product_id=product_id)
-                            product = db_session.scalars(stmt).first()
-                            if product:
-                                promoted_offering = product.name
-
             creative_list.append(
                 {
                     "creative_id": creative.creative_id,
                     "name": creative.name,
                     "format": creative.format,
                     "status": creative.status,
-                    "principal_name": principal_name,
+                    "principal_name": principal_names.get(creative.principal_id, creative.principal_id),
                     "principal_id": creative.principal_id,
                     "group_id": creative.group_id,
                     "data": creative.data,
@@ -351,15 +403,30 @@ def review_creatives(tenant_id, **kwargs):
                     "approved_by": creative.approved_by,
                     "media_buys": media_buys,
                     "assignment_count": len(media_buys),
-                    "promoted_offering": promoted_offering,
+                    "promoted_offering": product_names.get(first_product_ids.get(creative.creative_id)),
                 }
             )
 
+        if wants_json():
+            return jsonify(page.to_json(creative_list))
+
+        # Tab counts honour every filter except the status tab itself
+        count_query = replace(query, filters={k: v for k, v in query.filters.items() if k != "status"})
+        counts_by_status = count_by(db_session, apply_filters(base_stmt, listing_spec, count_query), Creative.status)
+        status_counts = {
+            tab: sum(counts_by_status.get(status, 0) for status in statuses)
+            for tab, statuses in CREATIVE_STATUS_TABS.items()
+        }
+        status_counts["all"] = sum(counts_by_status.values())
+
     return render_template(
         "creative_management.html",
         tenant_id=tenant_id,
         tenant_name=tenant.name,
         creatives=creative_list,
+        status_counts=status_counts,
+        listing=query,
+        next_page_url=next_page_url(page),
         has_ai_review=bool(tenant.gemini_api_key and tenant.creative_review_criteria),
         approval_mode=tenant.approval_mode,
     )
@@ -720,14 +787,20 @@ async def _ai_review_creative_async(
     slack_webhook_url: str | None = None,
     principal_name: str | None = None,
 ):
-    """Background task to review creative with AI (thread-safe).
+    """Review a queued creative with AI (run by CreativeReviewWorkerPool).
+
+    This function:
+    1. Calls _ai_review_creative_impl_async() for the actual review
+    2. Updates creative status in database
+    3. Sends Slack notification if configured
+    4. Calls webhook if configured
+
+    Reviews run concurrently on the worker pool's event loop, so only the AI call is
+    awaited there; database and notification steps run in worker threads, each with
+    its own session.
 
-    This function runs in a background thread and:
-    1. Creates its own database session (thread-safe)
-    2. Calls _ai_review_creative_impl() for the actual review
-    3. Updates creative status in database
-    4. Sends Slack notification if configured
-    5. Calls webhook if configured
+    On unexpected errors the creative is marked pending_review and the error is
+    re-raised so the queue can retry the job.
 
     Args:
         creative_id: Creative to review
@@ -735,155 +808,153 @@ async def _ai_review_creative_async(
         webhook_url: Optional webhook to call on completion
         slack_webhook_url: Optional Slack webhook for notifications
         principal_name: Principal name for Slack notification
+
+    Returns:
+        The review result dict from _ai_review_creative_impl_async()
     """
     logger.info(f"[AI Review Async] Starting background review for creative {creative_id}")
 
-    # Get fresh DB session (thread-safe - each thread gets its own)
     try:
-        with get_db_session() as session:
-            # Run AI review
-            ai_result = _ai_review_creative_impl(
-                tenant_id=tenant_id, creative_id=creative_id, db_session=session, promoted_offering=None
-            )
+        # Run AI review
+        ai_result = await _ai_review_creative_impl_async(
+            tenant_id=tenant_id, creative_id=creative_id, promoted_offering=None
+        )
 
-            logger.info(f"[AI Review Async] Review completed for {creative_id}: {ai_result['status']}")
+        logger.info(f"[AI Review Async] Review completed for {creative_id}: {ai_result['status']}")
 
-            # Update creative status in database
-            from src.core.database.models import Creative
+        await asyncio.to_thread(
+            _store_ai_review_result, creative_id, tenant_id, ai_result, webhook_url, slack_webhook_url, principal_name
+        )
+        return ai_result
 
-            stmt = select(Creative).filter_by(tenant_id=tenant_id, creative_id=creative_id)
-            creative = session.scalars(stmt).first()
-
-            if creative:
-                creative.status = ai_result["status"]
-
-                # Store AI reasoning in creative data
-                if not isinstance(creative.data, dict):
-                    creative.data = {}
-                creative.data["ai_review"] = {
-                    "decision": ai_result["status"],
-                    "reason": ai_result.get("reason", ""),
-                    "ai_reason": ai_result.get("ai_reason"),  # Actual AI reasoning (if different from summary)
-                    "ai_recommendation": ai_result.get("ai_recommendation"),  # AI's original recommendation
-                    "confidence": ai_result.get("confidence", "medium"),
-                    "reviewed_at": datetime.now(UTC).isoformat(),
-                }
+    except Exception as e:
+        logger.error(f"[AI Review Async] Error reviewing creative {creative_id}: {e}", exc_info=True)
 
-                from sqlalchemy.orm import attributes
+        # Try to mark creative as pending with error
+        try:
+            await asyncio.to_thread(_mark_ai_review_failed, creative_id, tenant_id, str(e))
+        except Exception as inner_e:
+            logger.error(f"[AI Review Async] Failed to mark creative as pending: {inner_e}")
+        raise
 
-                attributes.flag_modified(creative, "data")
-                session.commit()
 
-                logger.info(f"[AI Review Async] Database updated for {creative_id}: status={ai_result['status']}")
+def _store_ai_review_result(
+    creative_id: str,
+    tenant_id: str,
+    ai_result: dict,
+    webhook_url: str | None,
+    slack_webhook_url: str | None,
+    principal_name: str | None,
+) -> None:
+    """Save a queued AI review on the creative and send its notifications (blocking)."""
+    from src.core.database.models import Creative
 
-                # Send Slack notification with AI review results if configured
-                if slack_webhook_url and principal_name:
-                    try:
-                        from src.services.slack_notifier import get_slack_notifier
+    with get_db_session() as session:
+        stmt = select(Creative).filter_by(tenant_id=tenant_id, creative_id=creative_id)
+        creative = session.scalars(stmt).first()
+
+        if not creative:
+            logger.error(f"[AI Review Async] Creative not found: {creative_id}")
+            return
+
+        creative.status = ai_result["status"]
+
+        # Store AI reasoning in creative data
+        if not isinstance(creative.data, dict):
+            creative.data = {}
+        creative.data["ai_review"] = {
+            "decision": ai_result["status"],
+            "reason": ai_result.get("reason", ""),
+            "ai_reason": ai_result.get("ai_reason"),  # Actual AI reasoning (if different from summary)
+            "ai_recommendation": ai_result.get("ai_recommendation"),  # AI's original recommendation
+            "confidence": ai_result.get("confidence", "medium"),
+            "reviewed_at": datetime.now(UTC).isoformat(),
+        }
 
-                        tenant_config = {"features": {"slack_webhook_url": slack_webhook_url}}
-                        notifier = get_slack_notifier(tenant_config)
+        from sqlalchemy.orm import attributes
 
-                        # Build comprehensive AI review reason
-                        ai_review_data = creative.data.get("ai_review", {})
-                        ai_review_reason = ai_review_data.get("reason", "")
+        attributes.flag_modified(creative, "data")
+        session.commit()
 
-                        # If there's a separate AI reason (actual AI's reasoning), include it
-                        if ai_review_data.get("ai_reason"):
-                            ai_review_reason = (
-                                f"{ai_review_reason}\n\n*AI's Reasoning:* {ai_review_data.get('ai_reason')}"
-                            )
+        logger.info(f"[AI Review Async] Database updated for {creative_id}: status={ai_result['status']}")
 
-                        # If AI made a different recommendation than final decision, note it
-                        if ai_review_data.get("ai_recommendation"):
-                            ai_recommendation = ai_review_data.get("ai_recommendation", "").title()
-                            ai_review_reason = f"{ai_review_reason}\n\n*AI Recommendation:* {ai_recommendation}"
-
-                        notifier.notify_creative_pending(
-                            creative_id=creative_id,  # Use function parameter (str) not ORM attribute
-                            principal_name=principal_name,
-                            format_type=str(creative.format),  # Cast Column to str for mypy
-                            media_buy_id=None,
-                            tenant_id=tenant_id,
-                            ai_review_reason=ai_review_reason,
-                        )
-                        logger.info(f"[AI Review Async] Slack notification sent for {creative_id}")
-                    except Exception as slack_e:
-                        logger.warning(f"[AI Review Async] Failed to send Slack notification: {slack_e}")
-
-                # Call webhook if configured
-                if webhook_url:
-                    result = {
-                        "creative_id": creative.creative_id,
-                        "name": creative.name,
-                        "format": creative.format,
-                        "status": creative.status,
-                        "ai_review": creative.data.get("ai_review"),
-                    }
-                    asyncio.run(
-                        _call_webhook_for_creative_status(
-                            db_session=session, creative_id=creative_id, tenant_id=tenant_id
-                        )
-                    )
-                    logger.info(f"[AI Review Async] Webhook called for {creative_id}")
-            else:
-                logger.error(f"[AI Review Async] Creative not found: {creative_id}")
+        # Send Slack notification with AI review results if configured
+        if slack_webhook_url and principal_name:
+            try:
+                from src.services.slack_notifier import get_slack_notifier
 
-    except Exception as e:
-        logger.error(f"[AI Review Async] Error reviewing creative {creative_id}: {e}", exc_info=True)
+                tenant_config = {"features": {"slack_webhook_url": slack_webhook_url}}
+                notifier = get_slack_notifier(tenant_config)
 
-        # Try to mark creative as pending with error
-        try:
-            with get_db_session() as session:
-                from src.core.database.models import Creative
-
-                stmt = select(Creative).filter_by(tenant_id=tenant_id, creative_id=creative_id)
-                creative = session.scalars(stmt).first()
-
-                if creative:
-                    creative.status = "pending_review"
-                    if not isinstance(creative.data, dict):
-                        creative.data = {}
-                    creative.data["ai_review_error"] = {
-                        "error": str(e),
-                        "timestamp": datetime.now(UTC).isoformat(),
-                    }
-                    from sqlalchemy.orm import attributes
-
-                    attributes.flag_modified(creative, "data")
-                    session.commit()
-                    logger.info(f"[AI Review Async] Creative {creative_id} marked as pending_review due to error")
-        except Exception as inner_e:
-            logger.error(f"[AI Review Async] Failed to mark creative as pending: {inner_e}")
+                # Build comprehensive AI review reason
+                ai_review_data = creative.data.get("ai_review", {})
+                ai_review_reason = ai_review_data.get("reason", "")
+
+                # If there's a separate AI reason (actual AI's reasoning), include it
+                if ai_review_data.get("ai_reason"):
+                    ai_review_reason = f"{ai_review_reason}\n\n*AI's Reasoning:* {ai_review_data.get('ai_reason')}"
+
+                # If AI made a different recommendation than final decision, note it
+                if ai_review_data.get("ai_recommendation"):
+                    ai_recommendation = ai_review_data.get("ai_recommendation", "").title()
+                    ai_review_reason = f"{ai_review_reason}\n\n*AI Recommendation:* {ai_recommendation}"
+
+                notifier.notify_creative_pending(
+                    creative_id=creative_id,  # Use function parameter (str) not ORM attribute
+                    principal_name=principal_name,
+                    format_type=str(creative.format),  # Cast Column to str for mypy
+                    media_buy_id=None,
+                    tenant_id=tenant_id,
+                    ai_review_reason=ai_review_reason,
+                )
+                logger.info(f"[AI Review Async] Slack notification sent for {creative_id}")
+            except Exception as slack_e:
+                logger.warning(f"[AI Review Async] Failed to send Slack notification: {slack_e}")
+
+        # Call webhook if configured (worker threads have no running loop)
+        if webhook_url:
+            asyncio.run(
+                _call_webhook_for_creative_status(db_session=session, creative_id=creative_id, tenant_id=tenant_id)
+            )
+            logger.info(f"[AI Review Async] Webhook called for {creative_id}")
+
+
+def _mark_ai_review_failed(creative_id: str, tenant_id: str, error: str) -> None:
+    """Put a creative whose queued AI review failed back into pending_review (blocking)."""
+    from src.core.database.models import Creative
+
+    with get_db_session() as session:
+        stmt = select(Creative).filter_by(tenant_id=tenant_id, creative_id=creative_id)
+        creative = session.scalars(stmt).first()
+
+        if creative:
+            creative.status = "pending_review"
+            if not isinstance(creative.data, dict):
+                creative.data = {}
+            creative.data["ai_review_error"] = {
+                "error": error,
+                "timestamp": datetime.now(UTC).isoformat(),
+            }
+            from sqlalchemy.orm import attributes
+
+            attributes.flag_modified(creative, "data")
+            session.commit()
+            logger.info(f"[AI Review Async] Creative {creative_id} marked as pending_review due to error")
 
 
 def get_ai_review_status(task_id: str) -> dict:
-    """Get status of an AI review background task.
+    """Get status of a queued AI review.
 
     Args:
-        task_id: Task identifier
+        task_id: Task identifier returned when the review was queued
 
     Returns:
-        Dict with keys: status (running|completed|failed), result (if completed), error (if failed)
+        Dict with keys: status (queued|running|completed|failed|not_found),
+        result (if completed), error (if failed)
     """
-    _cleanup_completed_tasks()
-
-    with _ai_review_lock:
-        if task_id not in _ai_review_tasks:
-            return {"status": "not_found", "error": "Task ID not found"}
+    from src.services.creative_review_queue import get_review_job_status
 
-        task_info = _ai_review_tasks[task_id]
-        future = task_info["future"]
-
-        if not future.done():
-            return {"status": "running", "creative_id": task_info["creative_id"]}
-
-        # Task is done - get result or exception
-        try:
-            result = future.result()
-            return {"status": "completed", "result": result, "creative_id": task_info["creative_id"]}
-        except Exception as e:
-            return {"status": "failed", "error": str(e), "creative_id": task_info["creative_id"]}
+    return get_review_job_status(task_id)
 
 
 def _create_review_record(db_session, creative_id: str, tenant_id: str, ai_result: dict):
@@ -934,19 +1005,226 @@ def _create_review_record(db_session, creative_id: str, tenant_id: str, ai_resul
 
 
 def _ai_review_creative_impl(tenant_id, creative_id, db_session=None, promoted_offering=None):
+    """Synchronous entry point for Flask views: run the AI review and return dict result.
+
+    See _ai_review_creative_impl_async() for the result keys. Async code must await
+    _ai_review_creative_impl_async() (or enqueue the review) instead.
+
+    Raises:
+        RuntimeError: If called from a running event loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # Flask request threads have no running loop
+        return asyncio.run(_ai_review_creative_impl_async(tenant_id, creative_id, db_session, promoted_offering))
+    raise RuntimeError("_ai_review_creative_impl() cannot run inside an event loop; await the async review instead")
+
+
+async def _run_review_db_step(db_session, step, *args):
+    """Run a blocking AI review DB step.
+
+    With a caller-provided session (Flask views, which run the review on a private
+    loop) the step runs in place; otherwise it runs in a worker thread with its own
+    session so concurrent queued reviews never share a session or block the loop.
+    """
+    if db_session is not None:
+        return step(db_session, *args)
+
+    def run():
+        with get_db_session() as session:
+            return step(session, *args)
+
+    return await asyncio.to_thread(run)
+
+
+def _load_review_inputs(db_session, factory, tenant_id: str, creative_id: str, promoted_offering: str | None) -> dict:
+    """Load what the AI review needs from the database.
+
+    Returns:
+        Dict with "error_result" set when the review cannot run, otherwise plain
+        values (no ORM objects) for the tenant's AI settings and the creative
+    """
+    from src.core.database.models import Creative
+
+    tenant_stmt = select(Tenant).filter_by(tenant_id=tenant_id)
+    tenant = db_session.scalars(tenant_stmt).first()
+    if not tenant:
+        return {
+            "error_result": {"status": "pending_review", "error": "Tenant not found", "reason": "Configuration error"}
+        }
+
+    # Build effective config from tenant settings
+    tenant_ai_config = tenant.ai_config if hasattr(tenant, "ai_config") else None
+
+    # Backward compatibility: use gemini_api_key if no ai_config
+    if not tenant_ai_config and tenant.gemini_api_key:
+        tenant_ai_config = {
+            "provider": "gemini",
+            "api_key": tenant.gemini_api_key,
+        }
+
+    # Check AI availability - use factory to check tenant + platform config
+    if not factory.is_ai_enabled(tenant_ai_config):
+        return {
+            "error_result": {
+                "status": "pending_review",
+                "error": "AI not configured",
+                "reason": "AI review unavailable - requires manual approval",
+            }
+        }
+
+    if not tenant.creative_review_criteria:
+        return {
+            "error_result": {
+                "status": "pending_review",
+                "error": "Creative review criteria not configured",
+                "reason": "AI review unavailable - requires manual approval",
+            }
+        }
+
+    creative_stmt = select(Creative).filter_by(tenant_id=tenant_id, creative_id=creative_id)
+    creative = db_session.scalars(creative_stmt).first()
+
+    if not creative:
+        return {
+            "error_result": {"status": "pending_review", "error": "Creative not found", "reason": "Configuration error"}
+        }
+
+    # Get media buy and promoted offering if not provided
+    if promoted_offering is None:
+        promoted_offering = "Unknown"
+        if creative.data.get("media_buy_id"):
+            from src.core.database.models import MediaBuy, Product
+
+            media_buy_stmt = select(MediaBuy).filter_by(media_buy_id=creative.data["media_buy_id"])
+            media_buy = db_session.scalars(media_buy_stmt).first()
+            if media_buy and media_buy.raw_request:
+                packages = media_buy.raw_request.get("packages", [])
+                if packages:
+                    product_id = packages[0].get("product_id")
+                    if product_id:
+                        product_stmt = select(Product).filter_by(product_id=product_id)
+                        product = db_session.scalars(product_stmt).first()
+                        if product:
+                            promoted_offering = product.name
+
+    return {
+        "ai_config": tenant_ai_config,
+        "review_criteria": tenant.creative_review_criteria,
+        "ai_policy": tenant.ai_policy if tenant.ai_policy else {},
+        "creative_name": creative.name,
+        "creative_format": creative.format,
+        "creative_data": dict(creative.data) if creative.data else {},
+        "promoted_offering": promoted_offering,
+    }
+
+
+def _decide_review_outcome(review_result, ai_policy_data: dict, creative_data: dict) -> dict:
+    """Apply the tenant's AI policy to the agent's review and return the result dict."""
+    from src.services.ai.agents.review_agent import parse_confidence_score
+
+    # Extract results from structured output
+    decision = review_result.decision
+    confidence_str = review_result.confidence
+    confidence_score = parse_confidence_score(confidence_str)
+
+    # Thresholds represent MINIMUM confidence required for automatic action
+    auto_approve_threshold = ai_policy_data.get("auto_approve_threshold", 0.90)  # Need 90%+ to auto-approve
+    auto_reject_threshold = ai_policy_data.get("auto_reject_threshold", 0.90)  # Need 90%+ to auto-reject
+    sensitive_categories = ai_policy_data.get("always_require_human_for", ["political", "healthcare", "financial"])
+
+    # Check if creative is in sensitive category (extract from data or infer from tags)
+    creative_category = None
+    if creative_data:
+        creative_category = creative_data.get("category")
+        # Also check tags if available
+        if not creative_category and "tags" in creative_data:
+            for tag in creative_data.get("tags", []):
+                if tag.lower() in [cat.lower() for cat in sensitive_categories]:
+                    creative_category = tag.lower()
+                    break
+
+    # Check if this creative requires human review by category
+    if creative_category and creative_category.lower() in [cat.lower() for cat in sensitive_categories]:
+        return {
+            "status": "pending_review",
+            "reason": f"Category '{creative_category}' requires human review per policy",
+            "confidence": confidence_str,
+            "confidence_score": confidence_score,
+            "policy_triggered": "sensitive_category",
+        }
+
+    # Apply confidence-based thresholds
+    if "APPROVE" in decision and "REQUIRE" not in decision:
+        # AI wants to approve - check confidence threshold
+        if confidence_score >= auto_approve_threshold:
+            return {
+                "status": "approved",
+                "reason": review_result.reason,
+                "confidence": confidence_str,
+                "confidence_score": confidence_score,
+                "policy_triggered": "auto_approve",
+            }
+        return {
+            "status": "pending_review",
+            "reason": f"AI recommended approval with {confidence_score:.0%} confidence (below {auto_approve_threshold:.0%} threshold). Human review recommended.",
+            "confidence": confidence_str,
+            "confidence_score": confidence_score,
+            "policy_triggered": "low_confidence_approval",
+            "ai_recommendation": "approve",
+            "ai_reason": review_result.reason,
+        }
+
+    if "REJECT" in decision:
+        # AI wants to reject - check confidence threshold
+        if confidence_score >= auto_reject_threshold:
+            return {
+                "status": "rejected",
+                "reason": review_result.reason,
+                "confidence": confidence_str,
+                "confidence_score": confidence_score,
+                "policy_triggered": "auto_reject",
+            }
+        return {
+            "status": "pending_review",
+            "reason": f"AI recommended rejection with {confidence_score:.0%} confidence (below {auto_reject_threshold:.0%} threshold). Human review recommended.",
+            "confidence": confidence_str,
+            "confidence_score": confidence_score,
+            "policy_triggered": "uncertain_rejection",
+            "ai_recommendation": "reject",
+            "ai_reason": review_result.reason,
+        }
+
+    # Default: uncertain or "REQUIRE HUMAN APPROVAL"
+    return {
+        "status": "pending_review",
+        "reason": "AI could not make confident decision. Human review required.",
+        "confidence": confidence_str,
+        "confidence_score": confidence_score,
+        "policy_triggered": "uncertain",
+        "ai_reason": review_result.reason,
+    }
+
+
+async def _ai_review_creative_impl_async(tenant_id, creative_id, db_session=None, promoted_offering=None):
     """Internal implementation: Run AI review and return dict result.
 
+    Without ``db_session`` each database step runs in a worker thread with its own
+    session, so only the AI call itself is awaited on the event loop.
+
     Returns dict with keys:
     - status: "approved", "pending", or "rejected"
     - reason: explanation from AI
     - confidence: "high", "medium", or "low"
-    - error: error message if failed
+    - error: set when the review cannot run (tenant/creative missing, AI not configured)
+
+    Raises:
+        Exception: If the review itself fails (AI timeout, provider error, database
+            error), so the review queue can retry the job
     """
     import time
 
-    from sqlalchemy import select
-
-    from src.core.database.models import Creative
     from src.core.metrics import (
         active_ai_reviews,
         ai_review_confidence,
@@ -955,279 +1233,57 @@ def _ai_review_creative_impl(tenant_id, creative_id, db_session=None, promoted_o
         ai_review_total,
     )
     from src.services.ai import AIServiceFactory
-    from src.services.ai.agents.review_agent import (
-        create_review_agent,
-        parse_confidence_score,
-        review_creative_async,
-    )
+    from src.services.ai.agents.review_agent import create_review_agent, review_creative_async
+    from src.services.creative_review_queue import get_provider_rate_limiter
 
     start_time = time.time()
     active_ai_reviews.labels(tenant_id=tenant_id).inc()
 
     try:
-        # Use provided session or create new one
-        should_close = False
-        if db_session is None:
-            db_session = get_db_session().__enter__()
-            should_close = True
-
-        try:
-            stmt = select(Tenant).filter_by(tenant_id=tenant_id)
-            tenant = db_session.scalars(stmt).first()
-            if not tenant:
-                return {"status": "pending_review", "error": "Tenant not found", "reason": "Configuration error"}
-
-            # Check AI availability - use factory to check tenant + platform config
-            factory = AIServiceFactory()
-
-            # Build effective config from tenant settings
-            tenant_ai_config = tenant.ai_config if hasattr(tenant, "ai_config") else None
-
-            # Backward compatibility: use gemini_api_key if no ai_config
-            if not tenant_ai_config and tenant.gemini_api_key:
-                tenant_ai_config = {
-                    "provider": "gemini",
-                    "api_key": tenant.gemini_api_key,
-                }
-
-            if not factory.is_ai_enabled(tenant_ai_config):
-                return {
-                    "status": "pending_review",
-                    "error": "AI not configured",
-                    "reason": "AI review unavailable - requires manual approval",
-                }
-
-            if not tenant.creative_review_criteria:
-                return {
-                    "status": "pending_review",
-                    "error": "Creative review criteria not configured",
-                    "reason": "AI review unavailable - requires manual approval",
-                }
-
-            stmt = select(Creative).filter_by(tenant_id=tenant_id, creative_id=creative_id)
-            creative = db_session.scalars(stmt).first()
-
-            if not creative:
-                return {"status": "pending_review", "error": "Creative not found", "reason": "Configuration error"}
-
-            # Get media buy and promoted offering if not provided
-            if promoted_offering is None:
-                promoted_offering = "Unknown"
-                if creative.data.get("media_buy_id"):
-                    from src.core.database.models import MediaBuy, Product
-
-                    stmt = select(MediaBuy).filter_by(media_buy_id=creative.data["media_buy_id"])
-                    media_buy = db_session.scalars(stmt).first()
-                    if media_buy and media_buy.raw_request:
-                        packages = media_buy.raw_request.get("packages", [])
-                        if packages:
-                            product_id = packages[0].get("product_id")
-                            if product_id:
-                                stmt = select(Product).filter_by(product_id=product_id)
-                                product = db_session.scalars(stmt).first()
-                                if product:
-                                    promoted_offering = product.name
-
-            # Create Pydantic AI agent and run review
-            model_string = factory.create_model(tenant_ai_config)
-            agent = create_review_agent(model_string)
-
-            # Run async agent in a separate thread to avoid event loop conflicts with Flask
-            def run_review_in_thread():
-                """Run async review code in a new thread with its own event loop."""
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    return loop.run_until_complete(
-                        review_creative_async(
-                            agent=agent,
-                            review_criteria=tenant.creative_review_criteria,
-                            creative_name=creative.name,
-                            creative_format=creative.format,
-                            promoted_offering=promoted_offering,
-                            creative_data=creative.data,
-                        )
-                    )
-                finally:
-                    loop.close()
-
-            with ThreadPoolExecutor() as executor:
-                future = executor.submit(run_review_in_thread)
-                review_result = future.result(timeout=60)
-
-            # Extract results from structured output
-            decision = review_result.decision
-            confidence_str = review_result.confidence
-            confidence_score = parse_confidence_score(confidence_str)
-
-            # Get AI policy from tenant (with defaults)
-            ai_policy_data = tenant.ai_policy if tenant.ai_policy else {}
-            # Thresholds represent MINIMUM confidence required for automatic action
-            auto_approve_threshold = ai_policy_data.get("auto_approve_threshold", 0.90)  # Need 90%+ to auto-approve
-            auto_reject_threshold = ai_policy_data.get("auto_reject_threshold", 0.90)  # Need 90%+ to auto-reject
-            sensitive_categories = ai_policy_data.get(
-                "always_require_human_for", ["political", "healthcare", "financial"]
-            )
-
-            # Check if creative is in sensitive category (extract from data or infer from tags)
-            creative_category = None
-            if creative.data:
-                creative_category = creative.data.get("category")
-                # Also check tags if available
-                if not creative_category and "tags" in creative.data:
-                    for tag in creative.data.get("tags", []):
-                        if tag.lower() in [cat.lower() for cat in sensitive_categories]:
-                            creative_category = tag.lower()
-                            break
-
-            # Check if this creative requires human review by category
-            if creative_category and creative_category.lower() in [cat.lower() for cat in sensitive_categories]:
-                result_dict = {
-                    "status": "pending_review",
-                    "reason": f"Category '{creative_category}' requires human review per policy",
-                    "confidence": confidence_str,
-                    "confidence_score": confidence_score,
-                    "policy_triggered": "sensitive_category",
-                }
-                _create_review_record(
-                    db_session,
-                    creative_id,
-                    tenant_id,
-                    result_dict,
-                )
-                # Record metrics
-                ai_review_total.labels(
-                    tenant_id=tenant_id, decision="pending_review", policy_triggered="sensitive_category"
-                ).inc()
-                ai_review_confidence.labels(tenant_id=tenant_id, decision="pending_review").observe(confidence_score)
-                return result_dict
-
-            # Apply confidence-based thresholds
-            # decision is already extracted from review_result.decision above
-
-            if "APPROVE" in decision and "REQUIRE" not in decision:
-                # AI wants to approve - check confidence threshold
-                if confidence_score >= auto_approve_threshold:
-                    result_dict = {
-                        "status": "approved",
-                        "reason": review_result.reason,
-                        "confidence": confidence_str,
-                        "confidence_score": confidence_score,
-                        "policy_triggered": "auto_approve",
-                    }
-                    _create_review_record(
-                        db_session,
-                        creative_id,
-                        tenant_id,
-                        result_dict,
-                    )
-                    # Record metrics
-                    ai_review_total.labels(
-                        tenant_id=tenant_id, decision="approved", policy_triggered="auto_approve"
-                    ).inc()
-                    ai_review_confidence.labels(tenant_id=tenant_id, decision="approved").observe(confidence_score)
-                    return result_dict
-                else:
-                    result_dict = {
-                        "status": "pending_review",
-                        "reason": f"AI recommended approval with {confidence_score:.0%} confidence (below {auto_approve_threshold:.0%} threshold). Human review recommended.",
-                        "confidence": confidence_str,
-                        "confidence_score": confidence_score,
-                        "policy_triggered": "low_confidence_approval",
-                        "ai_recommendation": "approve",
-                        "ai_reason": review_result.reason,
-                    }
-                    _create_review_record(
-                        db_session,
-                        creative_id,
-                        tenant_id,
-                        result_dict,
-                    )
-                    # Record metrics
-                    ai_review_total.labels(
-                        tenant_id=tenant_id, decision="pending_review", policy_triggered="low_confidence_approval"
-                    ).inc()
-                    ai_review_confidence.labels(tenant_id=tenant_id, decision="pending_review").observe(
-                        confidence_score
-                    )
-                    return result_dict
-
-            elif "REJECT" in decision:
-                # AI wants to reject - check confidence threshold
-                if confidence_score >= auto_reject_threshold:
-                    result_dict = {
-                        "status": "rejected",
-                        "reason": review_result.reason,
-                        "confidence": confidence_str,
-                        "confidence_score": confidence_score,
-                        "policy_triggered": "auto_reject",
-                    }
-                    _create_review_record(
-                        db_session,
-                        creative_id,
-                        tenant_id,
-                        result_dict,
-                    )
-                    # Record metrics
-                    ai_review_total.labels(
-                        tenant_id=tenant_id, decision="rejected", policy_triggered="auto_reject"
-                    ).inc()
-                    ai_review_confidence.labels(tenant_id=tenant_id, decision="rejected").observe(confidence_score)
-                    return result_dict
-                else:
-                    result_dict = {
-                        "status": "pending_review",
-                        "reason": f"AI recommended rejection with {confidence_score:.0%} confidence (below {auto_reject_threshold:.0%} threshold). Human review recommended.",
-                        "confidence": confidence_str,
-                        "confidence_score": confidence_score,
-                        "policy_triggered": "uncertain_rejection",
-                        "ai_recommendation": "reject",
-                        "ai_reason": review_result.reason,
-                    }
-                    _create_review_record(
-                        db_session,
-                        creative_id,
-                        tenant_id,
-                        result_dict,
-                    )
-                    # Record metrics
-                    ai_review_total.labels(
-                        tenant_id=tenant_id, decision="pending_review", policy_triggered="uncertain_rejection"
-                    ).inc()
-                    ai_review_confidence.labels(tenant_id=tenant_id, decision="pending_review").observe(
-                        confidence_score
-                    )
-                    return result_dict
+        factory = AIServiceFactory()
+        inputs = await _run_review_db_step(
+            db_session, _load_review_inputs, factory, tenant_id, creative_id, promoted_offering
+        )
+        if "error_result" in inputs:
+            return inputs["error_result"]
+
+        # Create Pydantic AI agent and run review
+        model_string = factory.create_model(inputs["ai_config"])
+        agent = create_review_agent(model_string)
+
+        # Space calls per provider so queued reviews stay within the provider's rate limit
+        provider = str(factory.get_effective_config(inputs["ai_config"])["provider"])
+        await get_provider_rate_limiter().acquire(provider)
+
+        review_result = await asyncio.wait_for(
+            review_creative_async(
+                agent=agent,
+                review_criteria=inputs["review_criteria"],
+                creative_name=inputs["creative_name"],
+                creative_format=inputs["creative_format"],
+                promoted_offering=inputs["promoted_offering"],
+                creative_data=inputs["creative_data"],
+            ),
+            timeout=60,
+        )
 
-            # Default: uncertain or "REQUIRE HUMAN APPROVAL"
-            result_dict = {
-                "status": "pending_review",
-                "reason": "AI could not make confident decision. Human review required.",
-                "confidence": confidence_str,
-                "confidence_score": confidence_score,
-                "policy_triggered": "uncertain",
-                "ai_reason": review_result.reason,
-            }
-            _create_review_record(
-                db_session,
-                creative_id,
-                tenant_id,
-                result_dict,
-            )
-            # Record metrics
-            ai_review_total.labels(tenant_id=tenant_id, decision="pending_review", policy_triggered="uncertain").inc()
-            ai_review_confidence.labels(tenant_id=tenant_id, decision="pending_review").observe(confidence_score)
-            return result_dict
+        result_dict = _decide_review_outcome(review_result, inputs["ai_policy"], inputs["creative_data"])
+        await _run_review_db_step(db_session, _create_review_record, creative_id, tenant_id, result_dict)
 
-        finally:
-            if should_close:
-                db_session.close()
+        # Record metrics
+        ai_review_total.labels(
+            tenant_id=tenant_id, decision=result_dict["status"], policy_triggered=result_dict["policy_triggered"]
+        ).inc()
+        ai_review_confidence.labels(tenant_id=tenant_id, decision=result_dict["status"]).observe(
+            result_dict["confidence_score"]
+        )
+        return result_dict
 
     except Exception as e:
         logger.error(f"Error running AI review: {e}", exc_info=True)
         # Record error metrics
         ai_review_errors.labels(tenant_id=tenant_id, error_type=type(e).__name__).inc()
-        return {"status": "pending_review", "error": str(e), "reason": "AI review failed - requires manual approval"}
+        raise
     finally:
         # Record duration and decrement active reviews
         duration = time.time() - start_time
@@ -1240,7 +1296,11 @@ def _ai_review_creative_impl(tenant_id, creative_id, db_session=None, promoted_o
 @require_tenant_access()
 def ai_review_creative(tenant_id, creative_id, **kwargs):
     """Flask endpoint wrapper for AI review."""
-    result = _ai_review_creative_impl(tenant_id, creative_id)
+    try:
+        result = _ai_review_creative_impl(tenant_id, creative_id)
+    except Exception as e:
+        # Already logged and counted by the review; the creative stays pending
+        return jsonify({"success": False, "error": f"AI review failed - requires manual approval: {e}"}), 400
 
     if "error" in result:
         return jsonify({"success": False, "error": result["error"]}), 400
@@ -210,6 +210,7 @@ def media_buy_detail(tenant_id, media_buy_id):
                     from src.core.helpers.adapter_helpers import get_adapter
                     from src.core.schemas import Principal as PrincipalSchema
                     from src.core.schemas import ReportingPeriod
+                    from src.services.delivery_facts import fetch_media_buy_deliveries
 
                     # Get adapter for this principal
                     if principal:
@@ -245,10 +246,10 @@ def media_buy_detail(tenant_id, media_buy_id):
 
                         reporting_period = ReportingPeriod(start=start_date.isoformat(), end=end_date.isoformat())
 
-                        # Fetch delivery metrics from adapter
-                        delivery_response = adapter.get_media_buy_delivery(
-                            media_buy_id=media_buy_id, date_range=reporting_period, today=datetime.now(UTC)
-                        )
+                        # Fetch delivery metrics (synced delivery facts, else live from the adapter)
+                        delivery_response = fetch_media_buy_deliveries(
+                            adapter, tenant_id, [media_buy_id], reporting_period, datetime.now(UTC)
+                        )[media_buy_id]
 
                         delivery_metrics = {
                             "impressions": delivery_response.totals.impressions,
@@ -498,16 +499,17 @@ def approve_media_buy(tenant_id, media_buy_id, **kwargs):
 
                         try:
                             service = get_protocol_webhook_service()
-                            asyncio.run(
-                                service.send_notification(
-                                    push_notification_config=webhook_config,
-                                    payload=create_media_buy_approved_payload,
-                                    metadata=metadata,
-                                )
+                            service.enqueue_notification(
+                                db_session,
+                                push_notification_config=webhook_config,
+                                payload=create_media_buy_approved_payload,
+                                metadata=metadata,
                             )
-                            logger.info(f"Sent webhook notification for approved media buy {media_buy_id}")
+                            db_session.commit()
+                            logger.info(f"Queued webhook notification for approved media buy {media_buy_id}")
                         except Exception as webhook_err:
-                            logger.warning(f"Failed to send webhook notification: {webhook_err}")
+                            db_session.rollback()
+                            logger.warning(f"Failed to queue webhook notification: {webhook_err}")
 
                     flash("Media buy approved and order created successfully", "success")
                 else:
@@ -588,17 +590,18 @@ def approve_media_buy(tenant_id, media_buy_id, **kwargs):
 
                     try:
                         service = get_protocol_webhook_service()
-                        asyncio.run(
-                            service.send_notification(
-                                push_notification_config=webhook_config,
-                                payload=create_media_buy_rejected_payload,
-                                metadata=metadata,
-                            )
+                        service.enqueue_notification(
+                            db_session,
+                            push_notification_config=webhook_config,
+                            payload=create_media_buy_rejected_payload,
+                            metadata=metadata,
                         )
-                        logger.info(f"Sent webhook notification for rejected media buy {media_buy_id}")
+                        db_session.commit()
+                        logger.info(f"Queued webhook notification for rejected media buy {media_buy_id}")
 
                     except Exception as webhook_err:
-                        logger.warning(f"Failed to send webhook notification: {webhook_err}")
+                        db_session.rollback()
+                        logger.warning(f"Failed to queue webhook notification: {webhook_err}")
 
                 flash("Media buy rejected", "info")
 
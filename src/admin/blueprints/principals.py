@@ -7,11 +7,20 @@ import uuid
 from datetime import UTC, datetime
 
 from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
-from sqlalchemy import func, select
+from sqlalchemy import func, or_, select
 
 from src.admin.services import DashboardService
 from src.admin.utils import require_tenant_access
 from src.admin.utils.audit_decorator import log_admin_action
+from src.admin.utils.listing import (
+    ListingError,
+    ListingSpec,
+    fetch_page,
+    listing_error_response,
+    next_page_url,
+    parse_listing_query,
+    wants_json,
+)
 from src.core.database.database_session import get_db_session
 from src.core.database.models import MediaBuy, Principal, PushNotificationConfig, Tenant
 
@@ -21,31 +30,51 @@ logger = logging.getLogger(__name__)
 principals_bp = Blueprint("principals", __name__)
 
 
+PRINCIPAL_LISTING = ListingSpec(
+    key=Principal.principal_id,
+    sorts={"name": Principal.name, "created_at": Principal.created_at},
+    default_sort="name",
+    search=lambda q: or_(Principal.name.icontains(q, autoescape=True), Principal.principal_id == q),
+)
+
+
 @principals_bp.route("/principals")
 @require_tenant_access()
 def list_principals(tenant_id):
-    """List all principals (advertisers) for a tenant."""
+    """List principals (advertisers) for a tenant, one page at a time (?sort=, ?q=, ?cursor=, ?format=json)."""
+    try:
+        query = parse_listing_query(PRINCIPAL_LISTING)
+    except ListingError as e:
+        return listing_error_response(e)
+
     try:
         with get_db_session() as db_session:
             tenant = db_session.scalars(select(Tenant).filter_by(tenant_id=tenant_id)).first()
             if not tenant:
+                if wants_json():
+                    return jsonify({"error": "Tenant not found"}), 404
                 flash("Tenant not found", "error")
                 return redirect(url_for("core.index"))
 
-            stmt = select(Principal).filter_by(tenant_id=tenant_id).order_by(Principal.name)
-            principals = db_session.scalars(stmt).all()
+            page = fetch_page(db_session, select(Principal).filter_by(tenant_id=tenant_id), PRINCIPAL_LISTING, query)
+
+            # Count media buys for the principals on this page
+            media_buy_counts = {}
+            if page.items:
+                media_buy_counts = dict(
+                    db_session.execute(
+                        select(MediaBuy.principal_id, func.count())
+                        .where(
+                            MediaBuy.tenant_id == tenant_id,
+                            MediaBuy.principal_id.in_([principal.principal_id for principal in page.items]),
+                        )
+                        .group_by(MediaBuy.principal_id)
+                    ).all()
+                )
 
             # Convert to dict format for template
             principals_list = []
-            for principal in principals:
-                # Count media buys for this principal
-                stmt = (
-                    select(func.count())
-                    .select_from(MediaBuy)
-                    .filter_by(tenant_id=tenant_id, principal_id=principal.principal_id)
-                )
-                media_buy_count = db_session.scalar(stmt)
-
+            for principal in page.items:
                 # Handle both string (SQLite) and dict (PostgreSQL JSONB) formats
                 mappings = principal.platform_mappings
                 if mappings and isinstance(mappings, str):
@@ -58,11 +87,17 @@ def list_principals(tenant_id):
                     "name": principal.name,
                     "access_token": principal.access_token,
                     "platform_mappings": mappings,
-                    "media_buy_count": media_buy_count,
+                    "media_buy_count": media_buy_counts.get(principal.principal_id, 0),
                     "created_at": principal.created_at,
                 }
                 principals_list.append(principal_dict)
 
+            if wants_json():
+                # Access tokens are only shown on the principal's own page
+                return jsonify(
+                    page.to_json([{k: v for k, v in p.items() if k != "access_token"} for p in principals_list])
+                )
+
             # Get dashboard metrics that the template expects
             dashboard_service = DashboardService(tenant_id)
             metrics = dashboard_service.get_dashboard_metrics()
@@ -86,6 +121,7 @@ def list_principals(tenant_id):
                 tenant=tenant,
                 tenant_id=tenant_id,
                 advertisers=principals_list,
+                next_page_url=next_page_url(page),
                 # Template variables to match main dashboard
                 active_campaigns=metrics.get("live_buys", 0),
                 total_spend=metrics.get("total_revenue", 0),
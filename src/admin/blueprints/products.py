@@ -7,11 +7,20 @@ import uuid
 
 from adcp.exceptions import ADCPConnectionError, ADCPError, ADCPTimeoutError
 from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
-from sqlalchemy import func, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import joinedload, selectinload
 
 from src.admin.utils import require_tenant_access
 from src.admin.utils.audit_decorator import log_admin_action
+from src.admin.utils.listing import (
+    ListingError,
+    ListingSpec,
+    fetch_page,
+    listing_error_response,
+    next_page_url,
+    parse_listing_query,
+    wants_json,
+)
 from src.core.database.database_session import get_db_session
 from src.core.database.models import PricingOption, Product, ProductInventoryMapping, Tenant
 from src.core.database.product_pricing import get_product_pricing_options
@@ -399,172 +408,195 @@ def create_custom_key_inventory_mappings(db_session, tenant_id: str, product_id:
     return mapping_count
 
 
+PRODUCT_LISTING = ListingSpec(
+    key=Product.product_id,
+    sorts={"name": Product.name, "product_id": Product.product_id},
+    default_sort="name",
+    filters={
+        "type": lambda value: {
+            "dynamic": Product.is_dynamic.is_(True),
+            "variant": Product.is_dynamic_variant.is_(True),
+            "standard": and_(Product.is_dynamic.is_(False), Product.is_dynamic_variant.is_(False)),
+        }.get(value),
+    },
+    search=lambda q: or_(Product.name.icontains(q, autoescape=True), Product.product_id.icontains(q, autoescape=True)),
+)
+
+
+def _inventory_details_by_product(db_session, tenant_id: str, product_ids: list[str]) -> dict[str, dict[str, int]]:
+    """Inventory mapping counts by type for the given products, in one query."""
+    details = {product_id: {"total": 0, "ad_units": 0, "placements": 0, "custom_keys": 0} for product_id in product_ids}
+    if not product_ids:
+        return details
+
+    rows = db_session.execute(
+        select(ProductInventoryMapping.product_id, ProductInventoryMapping.inventory_type, func.count())
+        .where(
+            ProductInventoryMapping.tenant_id == tenant_id,
+            ProductInventoryMapping.product_id.in_(product_ids),
+        )
+        .group_by(ProductInventoryMapping.product_id, ProductInventoryMapping.inventory_type)
+    ).all()
+    type_keys = {"ad_unit": "ad_units", "placement": "placements", "custom_key": "custom_keys"}
+    for product_id, inventory_type, count in rows:
+        details[product_id]["total"] += count
+        if inventory_type in type_keys:
+            details[product_id][type_keys[inventory_type]] += count
+    return details
+
+
+def _product_list_item(product: Product, inventory_details: dict[str, int]) -> dict:
+    """Template/JSON representation of a product in the products listing."""
+    # Use helper function to get pricing options (handles legacy fallback)
+    pricing_options_list = get_product_pricing_options(product)
+
+    # Parse formats and resolve names from creative agents
+    formats_data = (
+        product.format_ids
+        if isinstance(product.format_ids, list)
+        else json.loads(product.format_ids) if product.format_ids else []
+    )
+
+    # Debug: Log raw formats data
+    logger.debug(f"Product {product.product_id} raw product.format_ids from DB: {product.format_ids}")
+
+    # Display format IDs (like inventory profiles does)
+    # Don't resolve names during page rendering to avoid async issues
+    resolved_formats = []
+
+    for fmt in formats_data:
+        format_id = None
+
+        if isinstance(fmt, dict):
+            # Database JSONB: uses "id" per AdCP spec
+            format_id = fmt.get("id") or fmt.get("format_id")  # "id" is AdCP spec, "format_id" is legacy
+        elif hasattr(fmt, "format_id") or hasattr(fmt, "id"):
+            # Pydantic object: uses "format_id" attribute (serializes to "id" in JSON)
+            format_id = getattr(fmt, "format_id", None) or getattr(fmt, "id", None)
+        elif isinstance(fmt, str):
+            # Legacy: plain string format ID
+            format_id = fmt
+        else:
+            logger.warning(f"Product {product.product_id} has unexpected format type {type(fmt)}: {fmt}")
+            continue
+
+        # Validate format_id
+        if format_id:
+            resolved_formats.append({"format_id": format_id, "name": format_id})
+
+    if formats_data and not resolved_formats:
+        logger.error(
+            f"Product {product.product_id} ERROR: Had {len(formats_data)} formats but resolved 0! "
+            f"This means format resolution failed."
+        )
+
+    # Get inventory profile info if product uses one
+    inventory_profile_dict = None
+    if product.inventory_profile:
+        # Generate inventory summary from profile
+        inventory_config = product.inventory_profile.inventory_config or {}
+        ad_units = inventory_config.get("ad_units", [])
+        placements = inventory_config.get("placements", [])
+
+        summary_parts = []
+        if ad_units:
+            summary_parts.append(f"{len(ad_units)} ad unit{'s' if len(ad_units) != 1 else ''}")
+        if placements:
+            summary_parts.append(f"{len(placements)} placement{'s' if len(placements) != 1 else ''}")
+
+        inventory_summary = ", ".join(summary_parts) if summary_parts else "No inventory"
+
+        inventory_profile_dict = {
+            "id": product.inventory_profile.id,
+            "profile_id": product.inventory_profile.profile_id,
+            "name": product.inventory_profile.name,
+            "description": product.inventory_profile.description,
+            "inventory_summary": inventory_summary,
+        }
+
+    return {
+        "product_id": product.product_id,
+        "name": product.name,
+        "description": product.description,
+        "pricing_options": pricing_options_list,
+        "formats": resolved_formats,
+        "countries": (
+            product.countries
+            if isinstance(product.countries, list)
+            else json.loads(product.countries) if product.countries else []
+        ),
+        "implementation_config": (
+            product.implementation_config
+            if isinstance(product.implementation_config, dict)
+            else json.loads(product.implementation_config) if product.implementation_config else {}
+        ),
+        "created_at": product.created_at if hasattr(product, "created_at") else None,
+        "inventory_details": inventory_details,
+        "inventory_profile": inventory_profile_dict,
+        # Dynamic product fields
+        "is_dynamic": getattr(product, "is_dynamic", False),
+        "is_dynamic_variant": getattr(product, "is_dynamic_variant", False),
+        "activation_key": getattr(product, "activation_key", None),
+        "product_card": getattr(product, "product_card", None),
+    }
+
+
 @products_bp.route("/")
 @require_tenant_access()
 def list_products(tenant_id):
-    """List all products for a tenant."""
+    """List products for a tenant, one page at a time (?sort=, ?type=, ?q=, ?cursor=, ?format=json)."""
+    try:
+        query = parse_listing_query(PRODUCT_LISTING)
+    except ListingError as e:
+        return listing_error_response(e)
+
     try:
         with get_db_session() as db_session:
             tenant = db_session.scalars(select(Tenant).filter_by(tenant_id=tenant_id)).first()
             if not tenant:
+                if wants_json():
+                    return jsonify({"error": "Tenant not found"}), 404
                 flash("Tenant not found", "error")
                 return redirect(url_for("core.index"))
 
-            products = (
-                db_session.scalars(
-                    select(Product)
-                    .options(joinedload(Product.pricing_options))
-                    .options(joinedload(Product.inventory_profile))
-                    .filter_by(tenant_id=tenant_id)
-                    .order_by(Product.name)
-                )
-                .unique()
-                .all()
+            page = fetch_page(
+                db_session,
+                select(Product)
+                .options(selectinload(Product.pricing_options))
+                .options(joinedload(Product.inventory_profile))
+                .filter_by(tenant_id=tenant_id),
+                PRODUCT_LISTING,
+                query,
             )
 
-            # Get inventory details for all products (breakdown by type)
-            inventory_details = {}
-            for product in products:
-                # Get all mappings for this product
-                mappings = db_session.scalars(
-                    select(ProductInventoryMapping).where(
-                        ProductInventoryMapping.tenant_id == tenant_id,
-                        ProductInventoryMapping.product_id == product.product_id,
-                    )
-                ).all()
-
-                # Count by inventory type
-                ad_unit_count = sum(1 for m in mappings if m.inventory_type == "ad_unit")
-                placement_count = sum(1 for m in mappings if m.inventory_type == "placement")
-                custom_key_count = sum(1 for m in mappings if m.inventory_type == "custom_key")
-
-                inventory_details[product.product_id] = {
-                    "total": len(mappings),
-                    "ad_units": ad_unit_count,
-                    "placements": placement_count,
-                    "custom_keys": custom_key_count,
-                }
-
-            # Convert products to dict format for template
-            products_list = []
-            for product in products:
-                # Use helper function to get pricing options (handles legacy fallback)
-                pricing_options_list = get_product_pricing_options(product)
-
-                # Parse formats and resolve names from creative agents
-                formats_data = (
-                    product.format_ids
-                    if isinstance(product.format_ids, list)
-                    else json.loads(product.format_ids) if product.format_ids else []
-                )
-
-                # Debug: Log raw formats data
-                logger.info(
-                    f"[DEBUG] Product {product.product_id} raw product.format_ids from DB: {product.format_ids}"
-                )
-                logger.info(f"[DEBUG] Product {product.product_id} formats_data after parsing: {formats_data}")
-                logger.info(
-                    f"[DEBUG] Product {product.product_id} formats_data type: {type(formats_data)}, len: {len(formats_data)}"
-                )
-
-                # Display format IDs (like inventory profiles does)
-                # Don't resolve names during page rendering to avoid async issues
-                resolved_formats = []
-
-                for fmt in formats_data:
-                    format_id = None
-
-                    if isinstance(fmt, dict):
-                        # Database JSONB: uses "id" per AdCP spec
-                        format_id = fmt.get("id") or fmt.get("format_id")  # "id" is AdCP spec, "format_id" is legacy
-                    elif hasattr(fmt, "format_id") or hasattr(fmt, "id"):
-                        # Pydantic object: uses "format_id" attribute (serializes to "id" in JSON)
-                        format_id = getattr(fmt, "format_id", None) or getattr(fmt, "id", None)
-                    elif isinstance(fmt, str):
-                        # Legacy: plain string format ID
-                        format_id = fmt
-                    else:
-                        logger.warning(f"Product {product.product_id} has unexpected format type {type(fmt)}: {fmt}")
-                        continue
-
-                    # Validate format_id
-                    if format_id:
-                        resolved_formats.append({"format_id": format_id, "name": format_id})
-
-                logger.info(f"[DEBUG] Product {product.product_id} resolved {len(resolved_formats)} formats")
-                if formats_data and not resolved_formats:
-                    logger.error(
-                        f"[DEBUG] Product {product.product_id} ERROR: Had {len(formats_data)} formats but resolved 0! "
-                        f"This means format resolution failed."
-                    )
+            # Get inventory details for the products on this page (breakdown by type)
+            inventory_details = _inventory_details_by_product(
+                db_session, tenant_id, [product.product_id for product in page.items]
+            )
+            products_list = [
+                _product_list_item(product, inventory_details[product.product_id]) for product in page.items
+            ]
 
-                # Get inventory profile info if product uses one
-                inventory_profile_dict = None
-                if product.inventory_profile:
-                    # Generate inventory summary from profile
-                    inventory_config = product.inventory_profile.inventory_config or {}
-                    ad_units = inventory_config.get("ad_units", [])
-                    placements = inventory_config.get("placements", [])
-
-                    summary_parts = []
-                    if ad_units:
-                        summary_parts.append(f"{len(ad_units)} ad unit{'s' if len(ad_units) != 1 else ''}")
-                    if placements:
-                        summary_parts.append(f"{len(placements)} placement{'s' if len(placements) != 1 else ''}")
-
-                    inventory_summary = ", ".join(summary_parts) if summary_parts else "No inventory"
-
-                    inventory_profile_dict = {
-                        "id": product.inventory_profile.id,
-                        "profile_id": product.inventory_profile.profile_id,
-                        "name": product.inventory_profile.name,
-                        "description": product.inventory_profile.description,
-                        "inventory_summary": inventory_summary,
-                    }
+            if wants_json():
+                return jsonify(page.to_json(products_list))
 
-                product_dict = {
-                    "product_id": product.product_id,
-                    "name": product.name,
-                    "description": product.description,
-                    "pricing_options": pricing_options_list,
-                    "formats": resolved_formats,
-                    "countries": (
-                        product.countries
-                        if isinstance(product.countries, list)
-                        else json.loads(product.countries) if product.countries else []
-                    ),
-                    "implementation_config": (
-                        product.implementation_config
-                        if isinstance(product.implementation_config, dict)
-                        else json.loads(product.implementation_config) if product.implementation_config else {}
-                    ),
-                    "created_at": product.created_at if hasattr(product, "created_at") else None,
-                    "inventory_details": inventory_details.get(
-                        product.product_id,
-                        {
-                            "total": 0,
-                            "ad_units": 0,
-                            "placements": 0,
-                            "custom_keys": 0,
-                        },
-                    ),
-                    "inventory_profile": inventory_profile_dict,
-                    # Dynamic product fields
-                    "is_dynamic": getattr(product, "is_dynamic", False),
-                    "is_dynamic_variant": getattr(product, "is_dynamic_variant", False),
-                    "activation_key": getattr(product, "activation_key", None),
-                    "product_card": getattr(product, "product_card", None),
-                }
-                products_list.append(product_dict)
+            total_products = db_session.scalar(
+                select(func.count()).select_from(Product).where(Product.tenant_id == tenant_id)
+            )
             return render_template(
                 "products.html",
                 tenant=tenant,
                 tenant_id=tenant_id,
                 products=products_list,
+                total_products=total_products,
+                listing=query,
+                next_page_url=next_page_url(page),
             )
 
     except Exception as e:
         logger.error(f"Error loading products: {e}", exc_info=True)
+        if wants_json():
+            return jsonify({"error": "Error loading products"}), 500
         flash("Error loading products", "error")
         return redirect(url_for("tenants.dashboard", tenant_id=tenant_id))
 
@@ -1162,6 +1162,11 @@ def parse_form_data_to_policy_updates(form_data) -> dict[str, Any]:
         prompt_value = form_data.get("product_ranking_prompt", "").strip()
         updates["product_ranking_prompt"] = prompt_value if prompt_value else None
 
+    # Parse get_products latency budget (empty = platform default)
+    if "products_latency_budget_ms" in form_data:
+        budget_value = str(form_data.get("products_latency_budget_ms", "")).strip()
+        updates["products_latency_budget_ms"] = int(budget_value) if budget_value.isdigit() else None
+
     return updates
 
 
@@ -659,40 +659,48 @@ def media_buys_list(tenant_id):
             stmt = select(MediaBuy).filter_by(tenant_id=tenant_id).order_by(MediaBuy.created_at.desc())
             all_media_buys = db_session.scalars(stmt).all()
 
-            # Calculate readiness state for each and filter
+            # Principal and product names for the listing, loaded once
+            principal_names = dict(
+                db_session.execute(select(Principal.principal_id, Principal.name).filter_by(tenant_id=tenant_id)).all()
+            )
+            product_ids = {
+                package.get("product_id")
+                for media_buy in all_media_buys
+                for package in (media_buy.raw_request or {}).get("packages", [])
+                if package.get("product_id")
+            }
+            product_names_by_id = {}
+            if product_ids:
+                product_names_by_id = dict(
+                    db_session.execute(
+                        select(Product.product_id, Product.name).where(Product.product_id.in_(product_ids))
+                    ).all()
+                )
+
+            # Readiness comes from each media buy's stored snapshot
             media_buys_with_state = []
+            now = datetime.now(UTC)
             for media_buy in all_media_buys:
-                readiness = MediaBuyReadinessService.get_readiness_state(
-                    media_buy.media_buy_id, tenant_id, session=db_session
-                )
+                readiness = MediaBuyReadinessService.get_readiness_for_media_buy(media_buy, db_session, now=now)
 
                 # Apply status filter if specified
                 if status_filter and readiness["state"] != status_filter:
                     continue
 
-                # Get principal name
-                principal = None
-                if media_buy.principal_id:
-                    stmt = select(Principal).filter_by(tenant_id=tenant_id, principal_id=media_buy.principal_id)
-                    principal = db_session.scalars(stmt).first()
-
                 # Get product names from packages
                 product_names = []
                 if media_buy.raw_request and "packages" in media_buy.raw_request:
                     for package in media_buy.raw_request["packages"]:
-                        product_id = package.get("product_id")
-                        if product_id:
-                            stmt = select(Product).filter_by(product_id=product_id)
-                            product = db_session.scalars(stmt).first()
-                            if product:
-                                product_names.append(product.name)
+                        product_name = product_names_by_id.get(package.get("product_id"))
+                        if product_name:
+                            product_names.append(product_name)
 
                 media_buys_with_state.append(
                     {
                         "media_buy": media_buy,
                         "readiness_state": readiness["state"],
                         "is_ready": readiness["is_ready_to_activate"],
-                        "principal_name": principal.name if principal else "Unknown",
+                        "principal_name": principal_names.get(media_buy.principal_id, "Unknown"),
                         "product_names": product_names,
                         "packages_ready": readiness["packages_with_creatives"],
                         "packages_total": readiness["packages_total"],
@@ -5,11 +5,21 @@ import logging
 from datetime import UTC, datetime
 
 from flask import Blueprint, flash, jsonify, redirect, render_template, request, session, url_for
-from sqlalchemy import select
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import attributes
 
 from src.admin.utils import require_tenant_access
 from src.admin.utils.audit_decorator import log_admin_action
+from src.admin.utils.listing import (
+    ListingError,
+    ListingSpec,
+    fetch_page,
+    is_load_more,
+    listing_error_response,
+    next_page_url,
+    parse_listing_query,
+    wants_json,
+)
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Context, WorkflowStep
 from src.core.database.models import Principal as ModelPrincipal
@@ -19,52 +29,65 @@ logger = logging.getLogger(__name__)
 workflows_bp = Blueprint("workflows", __name__)
 
 
+# Task status filter values and the workflow step statuses they cover
+TASK_STATUS_FILTERS = {
+    "pending": ("pending", "pending_approval", "in_progress"),
+    "completed": ("completed",),
+    "failed": ("failed",),
+}
+
+WORKFLOW_STEP_LISTING = ListingSpec(
+    key=WorkflowStep.step_id,
+    sorts={"created_at": WorkflowStep.created_at, "status": WorkflowStep.status},
+    default_sort="-created_at",
+    filters={"status": lambda value: WorkflowStep.status.in_(TASK_STATUS_FILTERS.get(value, (value,)))},
+    search=lambda q: or_(WorkflowStep.step_id == q, WorkflowStep.tool_name.icontains(q, autoescape=True)),
+)
+
+
 @workflows_bp.route("/<tenant_id>/workflows")
 @require_tenant_access()
 def list_workflows(tenant_id, **kwargs):
-    """List all workflows and pending approvals."""
+    """List workflows and pending approvals; tasks are paginated (?status=, ?q=, ?sort=, ?cursor=, ?format=json)."""
     from src.core.database.models import AuditLog, MediaBuy, Tenant
 
+    try:
+        query = parse_listing_query(WORKFLOW_STEP_LISTING)
+    except ListingError as e:
+        return listing_error_response(e)
+
     with get_db_session() as db:
         # Get tenant
         tenant = db.scalars(select(Tenant).filter_by(tenant_id=tenant_id)).first()
         if not tenant:
             return "Tenant not found", 404
 
-        # Get all workflow steps (not just pending approval)
-        stmt = (
+        # One page of workflow steps (not just pending approval)
+        steps_stmt = (
             select(WorkflowStep)
             .join(Context, WorkflowStep.context_id == Context.context_id)
             .filter(Context.tenant_id == tenant_id)
-            .order_by(WorkflowStep.created_at.desc())
         )
-        all_steps = db.scalars(stmt).all()
-
-        # Separate pending approval steps for summary
-        pending_steps = [s for s in all_steps if s.status == "pending_approval"]
-
-        # Get media buys for context
-        stmt = select(MediaBuy).filter_by(tenant_id=tenant_id).order_by(MediaBuy.created_at.desc())
-        media_buys = db.scalars(stmt).all()
-
-        # Build summary stats
-        summary = {
-            "active_buys": len([mb for mb in media_buys if mb.status == "active"]),
-            "pending_tasks": len(pending_steps),
-            "completed_today": 0,  # TODO: Calculate from workflow history
-            "total_spend": sum(mb.budget or 0 for mb in media_buys if mb.status == "active"),
-        }
+        page = fetch_page(db, steps_stmt, WORKFLOW_STEP_LISTING, query)
+
+        # Principal names for the page's steps, via their contexts
+        context_ids = {step.context_id for step in page.items}
+        principal_names = {}
+        if context_ids:
+            principal_names = dict(
+                db.execute(
+                    select(Context.context_id, ModelPrincipal.name)
+                    .join(
+                        ModelPrincipal,
+                        (ModelPrincipal.principal_id == Context.principal_id) & (ModelPrincipal.tenant_id == tenant_id),
+                    )
+                    .where(Context.context_id.in_(context_ids))
+                ).all()
+            )
 
-        # Format all workflow steps for display in tasks tab
+        # Format workflow steps for display in tasks tab
         workflows_list = []
-        for step in all_steps:
-            context = db.scalars(select(Context).filter_by(context_id=step.context_id)).first()
-            principal = None
-            if context and context.principal_id:
-                principal = db.scalars(
-                    select(ModelPrincipal).filter_by(principal_id=context.principal_id, tenant_id=tenant_id)
-                ).first()
-
+        for step in page.items:
             workflows_list.append(
                 {
                     "step_id": step.step_id,
@@ -74,34 +97,63 @@ def list_workflows(tenant_id, **kwargs):
                     "status": step.status,
                     "created_at": step.created_at,
                     "completed_at": step.completed_at,
-                    "principal_name": principal.name if principal else "Unknown",
+                    "principal_name": principal_names.get(step.context_id, "Unknown"),
                     "assigned_to": step.assigned_to,
                     "error_message": step.error_message,
                     "request_data": step.request_data,
                 }
             )
 
-        # Get recent audit logs with enriched context
-        # Get raw audit logs for the template (it expects AuditLog objects)
-        stmt = select(AuditLog).filter(AuditLog.tenant_id == tenant_id).order_by(AuditLog.timestamp.desc()).limit(100)
-        audit_logs = db.scalars(stmt).all()
-
-        # Debug logging to understand why audit logs might be empty
-        logger.info(f"[workflows] Querying audit logs for tenant_id={tenant_id}")
-        logger.info(f"[workflows] Found {len(audit_logs)} audit logs")
-        if audit_logs:
-            logger.info(
-                f"[workflows] Latest audit log: operation={audit_logs[0].operation}, success={audit_logs[0].success}, timestamp={audit_logs[0].timestamp}"
+        if wants_json():
+            return jsonify(page.to_json(workflows_list))
+
+        # "Load more" requests only use the tasks table
+        media_buys: list = []
+        audit_logs: list = []
+        summary = {"active_buys": 0, "pending_tasks": 0, "completed_today": 0, "total_spend": 0}
+        if not is_load_more():
+            # Get media buys for context
+            stmt = select(MediaBuy).filter_by(tenant_id=tenant_id).order_by(MediaBuy.created_at.desc())
+            media_buys = list(db.scalars(stmt).all())
+
+            pending_tasks = db.scalar(
+                select(func.count())
+                .select_from(WorkflowStep)
+                .join(Context, WorkflowStep.context_id == Context.context_id)
+                .where(Context.tenant_id == tenant_id, WorkflowStep.status == "pending_approval")
             )
-        else:
-            # Check if there are ANY audit logs in the database
-            all_logs_stmt = select(AuditLog).order_by(AuditLog.timestamp.desc()).limit(5)
-            all_logs = db.scalars(all_logs_stmt).all()
-            logger.warning(
-                f"[workflows] No audit logs for tenant {tenant_id}, but found {len(all_logs)} logs total in database"
+
+            # Build summary stats
+            summary = {
+                "active_buys": len([mb for mb in media_buys if mb.status == "active"]),
+                "pending_tasks": pending_tasks,
+                "completed_today": 0,  # TODO: Calculate from workflow history
+                "total_spend": sum(mb.budget or 0 for mb in media_buys if mb.status == "active"),
+            }
+
+            # Get recent audit logs with enriched context
+            # Get raw audit logs for the template (it expects AuditLog objects)
+            stmt = (
+                select(AuditLog).filter(AuditLog.tenant_id == tenant_id).order_by(AuditLog.timestamp.desc()).limit(100)
             )
-            if all_logs:
-                logger.warning(f"[workflows] Sample log tenant_ids: {[log.tenant_id for log in all_logs]}")
+            audit_logs = list(db.scalars(stmt).all())
+
+            # Debug logging to understand why audit logs might be empty
+            logger.info(f"[workflows] Querying audit logs for tenant_id={tenant_id}")
+            logger.info(f"[workflows] Found {len(audit_logs)} audit logs")
+            if audit_logs:
+                logger.info(
+                    f"[workflows] Latest audit log: operation={audit_logs[0].operation}, success={audit_logs[0].success}, timestamp={audit_logs[0].timestamp}"
+                )
+            else:
+                # Check if there are ANY audit logs in the database
+                all_logs_stmt = select(AuditLog).order_by(AuditLog.timestamp.desc()).limit(5)
+                all_logs = db.scalars(all_logs_stmt).all()
+                logger.warning(
+                    f"[workflows] No audit logs for tenant {tenant_id}, but found {len(all_logs)} logs total in database"
+                )
+                if all_logs:
+                    logger.warning(f"[workflows] Sample log tenant_ids: {[log.tenant_id for log in all_logs]}")
 
         return render_template(
             "workflows.html",
@@ -112,6 +164,8 @@ def list_workflows(tenant_id, **kwargs):
             media_buys=media_buys,
             tasks=workflows_list,  # Using workflow_steps as tasks
             audit_logs=audit_logs,
+            listing=query,
+            next_page_url=next_page_url(page),
         )
 
 
@@ -14,6 +14,7 @@ from src.admin.services.media_buy_readiness_service import MediaBuyReadinessServ
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Creative, MediaBuy, Principal, Product, Tenant
 from src.core.schemas import CreativeStatusEnum
+from src.services.revenue_rollup_service import REVENUE_STATUSES, get_daily_revenue
 
 logger = logging.getLogger(__name__)
 
@@ -68,13 +69,14 @@ class DashboardService:
                 )
 
                 # Calculate total spend from live and completed media buys
-                stmt = (
-                    select(MediaBuy)
-                    .filter_by(tenant_id=self.tenant_id)
-                    .where(MediaBuy.status.in_(["active", "completed"]))
+                total_spend_amount = float(
+                    db_session.scalar(
+                        select(func.coalesce(func.sum(MediaBuy.budget), 0))
+                        .where(MediaBuy.tenant_id == self.tenant_id)
+                        .where(MediaBuy.status.in_(REVENUE_STATUSES))
+                    )
+                    or 0
                 )
-                total_spend_buys = db_session.scalars(stmt).all()
-                total_spend_amount = float(sum(buy.budget or 0 for buy in total_spend_buys))
 
                 # Revenue trend data (last 30 days)
                 revenue_data = self._calculate_revenue_trend(db_session)
@@ -173,9 +175,7 @@ class DashboardService:
                     media_buy.advertiser_name = media_buy.principal.name if media_buy.principal else "Unknown"
 
                     # Add readiness state and details
-                    readiness = MediaBuyReadinessService.get_readiness_state(
-                        media_buy.media_buy_id, self.tenant_id, db_session
-                    )
+                    readiness = MediaBuyReadinessService.get_readiness_for_media_buy(media_buy, db_session)
                     object.__setattr__(media_buy, "readiness_state", readiness["state"])
                     object.__setattr__(media_buy, "is_ready", readiness["is_ready_to_activate"])
                     object.__setattr__(media_buy, "readiness_details", readiness)
@@ -190,35 +190,18 @@ class DashboardService:
             return []
 
     def _calculate_revenue_trend(self, db_session, days: int = 30) -> list[dict[str, Any]]:
-        """Calculate daily revenue for the last N days."""
-        today = datetime.now(UTC).date()
-        revenue_data = []
-
-        for i in range(days):
-            date = today - timedelta(days=days - 1 - i)
+        """Calculate daily revenue for the last N days.
 
-            # Calculate revenue for this date
-            from sqlalchemy import select
-
-            stmt = (
-                select(MediaBuy)
-                .filter_by(tenant_id=self.tenant_id)
-                .where(MediaBuy.start_date <= date)
-                .where(MediaBuy.end_date >= date)
-                .where(MediaBuy.status.in_(["active", "completed"]))
-            )
-            daily_buys = db_session.scalars(stmt).all()
-
-            daily_revenue = 0
-            for buy in daily_buys:
-                if buy.start_date and buy.end_date:
-                    days_in_flight = (buy.end_date - buy.start_date).days + 1
-                    if days_in_flight > 0:
-                        daily_revenue += float(buy.budget or 0) / days_in_flight
-
-            revenue_data.append({"date": date.isoformat(), "revenue": round(daily_revenue, 2)})
+        Reads the tenant_daily_revenue rollup once it has been backfilled for this
+        tenant, otherwise computes the series from media_buys in one query.
+        """
+        today = datetime.now(UTC).date()
+        tenant = self.get_tenant()
+        use_rollup = tenant is not None and tenant.revenue_rollup_backfilled_at is not None
 
-        return revenue_data
+        return get_daily_revenue(
+            db_session, self.tenant_id, today - timedelta(days=days - 1), today, use_rollup=use_rollup
+        )
 
     def _calculate_revenue_change(self, revenue_data: list[dict[str, Any]]) -> float:
         """Calculate revenue change percentage (last 7 vs previous 7 days)."""
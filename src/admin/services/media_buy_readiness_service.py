@@ -7,15 +7,27 @@ This service determines the actual operational state of media buys by checking:
 - Flight timing
 - Blocking issues
 
-No database schema changes required - computes state from existing data.
+Everything except flight timing is stored on the media buy as a denormalized
+readiness snapshot (media_buys.readiness_snapshot), so listings and dashboards
+read readiness without per-buy queries. The snapshot is recomputed when its inputs
+change: refresh_readiness_after_flush() (a Session after_flush hook in models.py)
+covers creative assignments, creative status, packages and synced GAM orders and
+line items. The final state depends on the current time (scheduled -> live ->
+completed), so it is derived from the snapshot on read rather than stored.
+
+Use recompute_readiness() to rebuild snapshots in bulk and
+check_readiness_consistency() to verify stored snapshots against the source tables.
 """
 
 import logging
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
-from typing import TypedDict, cast
+from typing import Any, TypedDict, cast
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import InstanceState, Session
 
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Creative, CreativeAssignment, GAMLineItem, GAMOrder, MediaBuy, Tenant
@@ -41,6 +53,325 @@ class ReadinessDetails(TypedDict):
     gam_line_items_ready: int  # Number of approved/active line items
 
 
+class ReadinessSnapshot(TypedDict):
+    """Time-independent readiness inputs stored on media_buys.readiness_snapshot."""
+
+    packages_total: int
+    packages_with_creatives: int
+    creatives_total: int
+    creatives_approved: int
+    creatives_pending: int
+    creatives_rejected: int
+    blocking_issues: list[str]
+    warnings: list[str]
+    gam_order_status: str | None
+    gam_line_items_total: int
+    gam_line_items_ready: int
+
+
+@dataclass
+class ReadinessMismatch:
+    """A media buy whose stored readiness snapshot differs from its source data."""
+
+    media_buy_id: str
+    stored: ReadinessSnapshot | None
+    expected: ReadinessSnapshot
+
+
+READINESS_STATES = ("live", "scheduled", "needs_creatives", "needs_approval", "paused", "completed", "failed", "draft")
+
+# MediaBuy attributes that feed the readiness snapshot
+_SNAPSHOT_MEDIA_BUY_ATTRIBUTES = ("raw_request",)
+
+
+def _failed_readiness(blocking_issue: str) -> ReadinessDetails:
+    return {
+        "state": "failed",
+        "is_ready_to_activate": False,
+        "packages_total": 0,
+        "packages_with_creatives": 0,
+        "creatives_total": 0,
+        "creatives_approved": 0,
+        "creatives_pending": 0,
+        "creatives_rejected": 0,
+        "blocking_issues": [blocking_issue],
+        "warnings": [],
+        "gam_order_status": None,
+        "gam_line_items_total": 0,
+        "gam_line_items_ready": 0,
+    }
+
+
+def compute_readiness_snapshots(
+    bind: Session | Connection, tenant_id: str, media_buy_ids: list[str]
+) -> dict[str, ReadinessSnapshot]:
+    """Compute readiness snapshots for media buys of one tenant in a fixed number of queries.
+
+    Media buys that do not exist are omitted.
+    """
+    if not media_buy_ids:
+        return {}
+
+    packages_by_buy = {
+        media_buy_id: (raw_request or {}).get("packages", [])
+        for media_buy_id, raw_request in bind.execute(
+            select(MediaBuy.media_buy_id, MediaBuy.raw_request).where(
+                MediaBuy.tenant_id == tenant_id, MediaBuy.media_buy_id.in_(media_buy_ids)
+            )
+        ).all()
+    }
+    if not packages_by_buy:
+        return {}
+
+    # Creative assignments and the status of each assigned creative
+    assignments: dict[str, list[tuple[str, str]]] = defaultdict(list)
+    for media_buy_id, package_id, creative_id in bind.execute(
+        select(CreativeAssignment.media_buy_id, CreativeAssignment.package_id, CreativeAssignment.creative_id).where(
+            CreativeAssignment.tenant_id == tenant_id, CreativeAssignment.media_buy_id.in_(list(packages_by_buy))
+        )
+    ).all():
+        assignments[media_buy_id].append((package_id, creative_id))
+
+    creative_ids = {creative_id for rows in assignments.values() for _, creative_id in rows}
+    creative_status: dict[str, str] = {}
+    if creative_ids:
+        creative_status = {
+            row[0]: row[1]
+            for row in bind.execute(
+                select(Creative.creative_id, Creative.status).where(
+                    Creative.tenant_id == tenant_id, Creative.creative_id.in_(creative_ids)
+                )
+            ).all()
+        }
+
+    # GAM order and line item status (GAM order ids are media buy ids)
+    gam_orders: dict[str, str] = {}
+    gam_line_items: dict[str, list[str]] = defaultdict(list)
+    ad_server = bind.execute(select(Tenant.ad_server).where(Tenant.tenant_id == tenant_id)).scalar()
+    if ad_server == "google_ad_manager":
+        for order_id, status in bind.execute(
+            select(GAMOrder.order_id, GAMOrder.status).where(
+                GAMOrder.tenant_id == tenant_id, GAMOrder.order_id.in_(list(packages_by_buy))
+            )
+        ).all():
+            gam_orders.setdefault(order_id, status)
+        if gam_orders:
+            for order_id, status in bind.execute(
+                select(GAMLineItem.order_id, GAMLineItem.status).where(
+                    GAMLineItem.tenant_id == tenant_id, GAMLineItem.order_id.in_(list(gam_orders))
+                )
+            ).all():
+                gam_line_items[order_id].append(status)
+
+    return {
+        media_buy_id: _build_snapshot(
+            packages_total=len(packages),
+            assignments=assignments.get(media_buy_id, []),
+            creative_status=creative_status,
+            gam_order_status=gam_orders.get(media_buy_id),
+            gam_line_item_statuses=gam_line_items.get(media_buy_id, []) if media_buy_id in gam_orders else None,
+        )
+        for media_buy_id, packages in packages_by_buy.items()
+    }
+
+
+def _build_snapshot(
+    packages_total: int,
+    assignments: list[tuple[str, str]],
+    creative_status: dict[str, str],
+    gam_order_status: str | None,
+    gam_line_item_statuses: list[str] | None,
+) -> ReadinessSnapshot:
+    """Readiness snapshot from loaded inputs; gam_line_item_statuses is None when there is no GAM order."""
+    # Unique package IDs that have creative assignments
+    packages_with_creatives = len({package_id for package_id, _ in assignments})
+
+    creative_ids = {creative_id for _, creative_id in assignments}
+    creatives_total = len(creative_ids)
+    statuses = [creative_status[creative_id] for creative_id in creative_ids if creative_id in creative_status]
+    creatives_approved = statuses.count("approved")
+    creatives_pending = statuses.count("pending_review")
+    creatives_rejected = statuses.count("rejected")
+
+    # Build blocking issues and warnings
+    blocking_issues = []
+    warnings = []
+
+    # Check for packages without creatives
+    if packages_total > 0 and packages_with_creatives < packages_total:
+        missing_count = packages_total - packages_with_creatives
+        blocking_issues.append(f"{missing_count} package(s) missing creative assignments")
+
+    # Check for rejected creatives
+    if creatives_rejected > 0:
+        blocking_issues.append(f"{creatives_rejected} creative(s) rejected and need replacement")
+
+    # Check for pending creatives
+    if creatives_pending > 0:
+        warnings.append(f"{creatives_pending} creative(s) pending approval")
+
+    # Check if missing creatives entirely
+    if creatives_total == 0 and packages_total > 0:
+        blocking_issues.append("No creatives uploaded")
+
+    # Check GAM status if using GAM adapter
+    gam_line_items_total = 0
+    gam_line_items_ready = 0
+    if gam_order_status is not None and gam_line_item_statuses is not None:
+        # Check for blocking GAM statuses
+        if gam_order_status in ["DRAFT", "PENDING_APPROVAL"]:
+            warnings.append(f"GAM order is {gam_order_status.replace('_', ' ').lower()}")
+        elif gam_order_status in ["CANCELED", "DELETED"]:
+            blocking_issues.append(f"GAM order is {gam_order_status.lower()}")
+
+        gam_line_items_total = len(gam_line_item_statuses)
+        gam_line_items_ready = sum(
+            1 for status in gam_line_item_statuses if status in ["APPROVED", "DELIVERING", "READY"]
+        )
+
+        if gam_line_items_total > 0 and gam_line_items_ready < gam_line_items_total:
+            pending_count = gam_line_items_total - gam_line_items_ready
+            warnings.append(f"{pending_count} GAM line item(s) need approval")
+
+    return {
+        "packages_total": packages_total,
+        "packages_with_creatives": packages_with_creatives,
+        "creatives_total": creatives_total,
+        "creatives_approved": creatives_approved,
+        "creatives_pending": creatives_pending,
+        "creatives_rejected": creatives_rejected,
+        "blocking_issues": blocking_issues,
+        "warnings": warnings,
+        "gam_order_status": gam_order_status,
+        "gam_line_items_total": gam_line_items_total,
+        "gam_line_items_ready": gam_line_items_ready,
+    }
+
+
+def store_readiness_snapshots(bind: Session | Connection, tenant_id: str, media_buy_ids: list[str]) -> int:
+    """Recompute and store readiness snapshots for media buys of one tenant.
+
+    Runs on the caller's session or connection; the caller commits.
+
+    Returns:
+        Number of media buys updated.
+    """
+    snapshots = compute_readiness_snapshots(bind, tenant_id, media_buy_ids)
+    now = datetime.now(UTC)
+    for media_buy_id, snapshot in snapshots.items():
+        # Keep updated_at: a readiness refresh is not an edit of the media buy
+        bind.execute(
+            update(MediaBuy)
+            .where(MediaBuy.media_buy_id == media_buy_id)
+            .values(readiness_snapshot=snapshot, readiness_updated_at=now, updated_at=MediaBuy.updated_at)
+        )
+    return len(snapshots)
+
+
+def _status_changed(obj: Any) -> bool:
+    state: InstanceState = inspect(obj)
+    return state.attrs.status.history.has_changes()
+
+
+def refresh_readiness_after_flush(session: Session, flush_context: Any) -> None:
+    """Session after_flush hook: refresh snapshots of media buys whose readiness inputs were flushed."""
+    affected: dict[str, set[str]] = defaultdict(set)
+    changed_creatives: dict[str, set[str]] = defaultdict(set)
+
+    new, deleted = session.new, session.deleted
+    for obj in (*new, *session.dirty, *deleted):
+        if isinstance(obj, CreativeAssignment):
+            affected[obj.tenant_id].add(obj.media_buy_id)
+        elif isinstance(obj, MediaBuy):
+            if obj in deleted:
+                continue
+            state: InstanceState = inspect(obj)
+            if obj in new or any(state.attrs[name].history.has_changes() for name in _SNAPSHOT_MEDIA_BUY_ATTRIBUTES):
+                affected[obj.tenant_id].add(obj.media_buy_id)
+        elif isinstance(obj, Creative):
+            # New creatives have no assignments yet
+            if obj not in new and _status_changed(obj):
+                changed_creatives[obj.tenant_id].add(obj.creative_id)
+        elif isinstance(obj, GAMOrder | GAMLineItem):
+            # GAM order ids are media buy ids
+            if obj in new or obj in deleted or _status_changed(obj):
+                affected[obj.tenant_id].add(obj.order_id)
+
+    if not affected and not changed_creatives:
+        return
+
+    connection = session.connection()
+    for tenant_id, creative_ids in changed_creatives.items():
+        affected[tenant_id].update(
+            connection.execute(
+                select(CreativeAssignment.media_buy_id).where(
+                    CreativeAssignment.tenant_id == tenant_id, CreativeAssignment.creative_id.in_(creative_ids)
+                )
+            ).scalars()
+        )
+
+    for tenant_id, media_buy_ids in affected.items():
+        store_readiness_snapshots(connection, tenant_id, sorted(media_buy_ids))
+
+
+def recompute_readiness(tenant_id: str | None = None, batch_size: int = 500) -> int:
+    """Rebuild readiness snapshots for every media buy (optionally of one tenant).
+
+    Returns:
+        Number of media buys updated.
+    """
+    total = 0
+    with get_db_session() as session:
+        stmt = select(MediaBuy.tenant_id, MediaBuy.media_buy_id).order_by(MediaBuy.tenant_id, MediaBuy.media_buy_id)
+        if tenant_id:
+            stmt = stmt.where(MediaBuy.tenant_id == tenant_id)
+        by_tenant: dict[str, list[str]] = defaultdict(list)
+        for row_tenant_id, media_buy_id in session.execute(stmt).all():
+            by_tenant[row_tenant_id].append(media_buy_id)
+
+        for row_tenant_id, media_buy_ids in by_tenant.items():
+            for i in range(0, len(media_buy_ids), batch_size):
+                total += store_readiness_snapshots(session, row_tenant_id, media_buy_ids[i : i + batch_size])
+                session.commit()
+
+    logger.info(f"Recomputed readiness for {total} media buys")
+    return total
+
+
+def check_readiness_consistency(
+    tenant_id: str | None = None, session: Session | None = None
+) -> list[ReadinessMismatch]:
+    """Compare stored readiness snapshots with snapshots recomputed from the source tables.
+
+    Args:
+        tenant_id: Check one tenant only (default: all tenants)
+        session: Optional SQLAlchemy session (creates one if not provided)
+
+    Returns:
+        One entry per media buy whose snapshot is missing or stale.
+    """
+    if session is None:
+        with get_db_session() as new_session:
+            return check_readiness_consistency(tenant_id, new_session)
+
+    stmt = select(MediaBuy.tenant_id, MediaBuy.media_buy_id, MediaBuy.readiness_snapshot)
+    if tenant_id:
+        stmt = stmt.where(MediaBuy.tenant_id == tenant_id)
+    stored_by_tenant: dict[str, dict[str, ReadinessSnapshot | None]] = defaultdict(dict)
+    for row_tenant_id, media_buy_id, snapshot in session.execute(stmt).all():
+        stored_by_tenant[row_tenant_id][media_buy_id] = snapshot
+
+    mismatches: list[ReadinessMismatch] = []
+    for row_tenant_id, stored in stored_by_tenant.items():
+        expected = compute_readiness_snapshots(session, row_tenant_id, list(stored))
+        mismatches.extend(
+            ReadinessMismatch(media_buy_id=media_buy_id, stored=stored[media_buy_id], expected=snapshot)
+            for media_buy_id, snapshot in expected.items()
+            if stored[media_buy_id] != snapshot
+        )
+    return mismatches
+
+
 class MediaBuyReadinessService:
     """Service to compute operational readiness of media buys."""
 
@@ -66,169 +397,78 @@ class MediaBuyReadinessService:
             media_buy = session.scalars(stmt).first()
 
             if not media_buy:
-                return {
-                    "state": "failed",
-                    "is_ready_to_activate": False,
-                    "packages_total": 0,
-                    "packages_with_creatives": 0,
-                    "creatives_total": 0,
-                    "creatives_approved": 0,
-                    "creatives_pending": 0,
-                    "creatives_rejected": 0,
-                    "blocking_issues": ["Media buy not found"],
-                    "warnings": [],
-                    "gam_order_status": None,
-                    "gam_line_items_total": 0,
-                    "gam_line_items_ready": 0,
-                }
-
-            # Check if already failed
-            if media_buy.status == "failed":
-                return {
-                    "state": "failed",
-                    "is_ready_to_activate": False,
-                    "packages_total": 0,
-                    "packages_with_creatives": 0,
-                    "creatives_total": 0,
-                    "creatives_approved": 0,
-                    "creatives_pending": 0,
-                    "creatives_rejected": 0,
-                    "blocking_issues": ["Media buy creation failed"],
-                    "warnings": [],
-                    "gam_order_status": None,
-                    "gam_line_items_total": 0,
-                    "gam_line_items_ready": 0,
-                }
-
-            # Extract packages from raw_request
-            raw_request = media_buy.raw_request or {}
-            packages = raw_request.get("packages", [])
-            packages_total = len(packages)
-
-            # Get creative assignments for this media buy
-            from typing import cast
-
-            assignments_stmt = select(CreativeAssignment).filter_by(tenant_id=tenant_id, media_buy_id=media_buy_id)
-            assignments = cast(list, session.scalars(assignments_stmt).all())
-
-            # Get unique package IDs that have creative assignments
-            packages_with_assignments = {a.package_id for a in assignments}
-            packages_with_creatives = len(packages_with_assignments)
-
-            # Get all creative IDs
-            creative_ids = list({a.creative_id for a in assignments})
-            creatives_total = len(creative_ids)
-
-            # Get creative statuses
-            creatives: list[Creative] = []
-            if creative_ids:
-                creatives_stmt = select(Creative).filter(
-                    Creative.tenant_id == tenant_id, Creative.creative_id.in_(creative_ids)
-                )
-                creatives = list(session.scalars(creatives_stmt).all())
-
-            creatives_approved = sum(1 for c in creatives if c.status == "approved")
-            creatives_pending = sum(1 for c in creatives if c.status == "pending_review")
-            creatives_rejected = sum(1 for c in creatives if c.status == "rejected")
-
-            # Build blocking issues and warnings
-            blocking_issues = []
-            warnings = []
-
-            # Check for packages without creatives
-            if packages_total > 0 and packages_with_creatives < packages_total:
-                missing_count = packages_total - packages_with_creatives
-                blocking_issues.append(f"{missing_count} package(s) missing creative assignments")
-
-            # Check for rejected creatives
-            if creatives_rejected > 0:
-                blocking_issues.append(f"{creatives_rejected} creative(s) rejected and need replacement")
-
-            # Check for pending creatives
-            if creatives_pending > 0:
-                warnings.append(f"{creatives_pending} creative(s) pending approval")
-
-            # Check if missing creatives entirely
-            if creatives_total == 0 and packages_total > 0:
-                blocking_issues.append("No creatives uploaded")
-
-            # Check GAM status if using GAM adapter
-            gam_order_status: str | None = None
-            gam_line_items_total = 0
-            gam_line_items_ready = 0
-
-            # Determine if tenant uses GAM
-            tenant_stmt = select(Tenant).filter_by(tenant_id=tenant_id)
-            tenant = session.scalars(tenant_stmt).first()
-            if tenant and hasattr(tenant, "ad_server") and tenant.ad_server == "google_ad_manager":
-                # Check if we have GAM order data for this media buy
-                order_stmt = select(GAMOrder).filter_by(tenant_id=tenant_id, order_id=media_buy_id)
-                gam_order = session.scalars(order_stmt).first()
-
-                if gam_order:
-                    gam_order_status = gam_order.status
-                    # Check for blocking GAM statuses
-                    if gam_order.status in ["DRAFT", "PENDING_APPROVAL"]:
-                        warnings.append(f"GAM order is {gam_order.status.replace('_', ' ').lower()}")
-                    elif gam_order.status in ["CANCELED", "DELETED"]:
-                        blocking_issues.append(f"GAM order is {gam_order.status.lower()}")
-
-                    # Get line item statuses
-                    li_stmt = select(GAMLineItem).filter_by(tenant_id=tenant_id, order_id=media_buy_id)
-                    line_items = session.scalars(li_stmt).all()
-                    gam_line_items_total = len(line_items)
-                    gam_line_items_ready = sum(
-                        1 for li in line_items if li.status in ["APPROVED", "DELIVERING", "READY"]
-                    )
-
-                    if gam_line_items_total > 0 and gam_line_items_ready < gam_line_items_total:
-                        pending_count = gam_line_items_total - gam_line_items_ready
-                        warnings.append(f"{pending_count} GAM line item(s) need approval")
-
-            # Compute operational state
-            now = datetime.now(UTC)
-            state = MediaBuyReadinessService._compute_state(
-                media_buy=media_buy,
-                now=now,
-                packages_total=packages_total,
-                packages_with_creatives=packages_with_creatives,
-                creatives_total=creatives_total,
-                creatives_approved=creatives_approved,
-                creatives_pending=creatives_pending,
-                creatives_rejected=creatives_rejected,
-                blocking_issues=blocking_issues,
-            )
+                return _failed_readiness("Media buy not found")
 
-            # Determine if ready to activate
-            # Note: "live" campaigns are already activated, but we consider them "ready"
-            is_ready_to_activate = (
-                len(blocking_issues) == 0
-                and packages_total > 0
-                and packages_with_creatives == packages_total
-                and creatives_approved == creatives_total
-                and state in ["scheduled", "live"]
-            )
-
-            return {
-                "state": state,
-                "is_ready_to_activate": is_ready_to_activate,
-                "packages_total": packages_total,
-                "packages_with_creatives": packages_with_creatives,
-                "creatives_total": creatives_total,
-                "creatives_approved": creatives_approved,
-                "creatives_pending": creatives_pending,
-                "creatives_rejected": creatives_rejected,
-                "blocking_issues": blocking_issues,
-                "warnings": warnings,
-                "gam_order_status": gam_order_status,
-                "gam_line_items_total": gam_line_items_total,
-                "gam_line_items_ready": gam_line_items_ready,
-            }
+            return MediaBuyReadinessService.get_readiness_for_media_buy(media_buy, session)
 
         finally:
             if should_close:
                 session.close()
 
+    @staticmethod
+    def get_readiness_for_media_buy(
+        media_buy: MediaBuy, session: Session, now: datetime | None = None
+    ) -> ReadinessDetails:
+        """Readiness for a loaded media buy, from its stored snapshot when available.
+
+        Media buys without a snapshot (not yet recomputed) are computed from the
+        source tables.
+        """
+        # Check if already failed
+        if media_buy.status == "failed":
+            return _failed_readiness("Media buy creation failed")
+
+        snapshot = cast(ReadinessSnapshot | None, media_buy.readiness_snapshot)
+        if snapshot is None:
+            snapshot = compute_readiness_snapshots(session, media_buy.tenant_id, [media_buy.media_buy_id]).get(
+                media_buy.media_buy_id
+            )
+            if snapshot is None:
+                return _failed_readiness("Media buy not found")
+
+        return MediaBuyReadinessService._readiness_from_snapshot(media_buy, snapshot, now or datetime.now(UTC))
+
+    @staticmethod
+    def _readiness_from_snapshot(media_buy: MediaBuy, snapshot: ReadinessSnapshot, now: datetime) -> ReadinessDetails:
+        # Compute operational state
+        state = MediaBuyReadinessService._compute_state(
+            media_buy=media_buy,
+            now=now,
+            packages_total=snapshot["packages_total"],
+            packages_with_creatives=snapshot["packages_with_creatives"],
+            creatives_total=snapshot["creatives_total"],
+            creatives_approved=snapshot["creatives_approved"],
+            creatives_pending=snapshot["creatives_pending"],
+            creatives_rejected=snapshot["creatives_rejected"],
+            blocking_issues=snapshot["blocking_issues"],
+        )
+
+        # Determine if ready to activate
+        # Note: "live" campaigns are already activated, but we consider them "ready"
+        is_ready_to_activate = (
+            len(snapshot["blocking_issues"]) == 0
+            and snapshot["packages_total"] > 0
+            and snapshot["packages_with_creatives"] == snapshot["packages_total"]
+            and snapshot["creatives_approved"] == snapshot["creatives_total"]
+            and state in ["scheduled", "live"]
+        )
+
+        return {
+            "state": state,
+            "is_ready_to_activate": is_ready_to_activate,
+            "packages_total": snapshot["packages_total"],
+            "packages_with_creatives": snapshot["packages_with_creatives"],
+            "creatives_total": snapshot["creatives_total"],
+            "creatives_approved": snapshot["creatives_approved"],
+            "creatives_pending": snapshot["creatives_pending"],
+            "creatives_rejected": snapshot["creatives_rejected"],
+            "blocking_issues": list(snapshot["blocking_issues"]),
+            "warnings": list(snapshot["warnings"]),
+            "gam_order_status": snapshot["gam_order_status"],
+            "gam_line_items_total": snapshot["gam_line_items_total"],
+            "gam_line_items_ready": snapshot["gam_line_items_ready"],
+        }
+
     @staticmethod
     def _compute_state(
         media_buy: MediaBuy,
@@ -343,20 +583,12 @@ class MediaBuyReadinessService:
             media_buys = session.scalars(stmt).all()
 
             # Initialize counts
-            summary = {
-                "live": 0,
-                "scheduled": 0,
-                "needs_creatives": 0,
-                "needs_approval": 0,
-                "paused": 0,
-                "completed": 0,
-                "failed": 0,
-                "draft": 0,
-            }
+            summary = dict.fromkeys(READINESS_STATES, 0)
 
-            # Compute state for each media buy
+            # Compute state for each media buy from its stored snapshot
+            now = datetime.now(UTC)
             for media_buy in media_buys:
-                readiness = MediaBuyReadinessService.get_readiness_state(media_buy.media_buy_id, tenant_id, session)
+                readiness = MediaBuyReadinessService.get_readiness_for_media_buy(media_buy, session, now=now)
                 state = readiness["state"]
                 summary[state] = summary.get(state, 0) + 1
 
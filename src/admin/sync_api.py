@@ -21,6 +21,7 @@ from src.adapters.google_ad_manager import GoogleAdManager
 from src.core.database.database_session import get_db_session
 from src.core.database.models import AdapterConfig, SyncJob, Tenant, TenantManagementConfig
 from src.services.gam_inventory_service import db_session as gam_db_session
+from src.services.sync_orchestrator import get_lease_heartbeat, new_lease
 
 logger = logging.getLogger(__name__)
 
@@ -481,6 +482,20 @@ def get_sync_stats() -> tuple[Response, int]:
         db_session.remove()
 
 
+@sync_api.route("/orchestrator", methods=["GET"])
+@require_tenant_management_api_key
+def get_orchestrator_dashboard() -> tuple[Response, int]:
+    """Scheduled sync queue depth, running jobs and last-hour throughput."""
+    try:
+        from src.services.sync_orchestrator import get_sync_dashboard
+
+        with get_db_session() as session:
+            return jsonify(get_sync_dashboard(session)), 200
+    except Exception as e:
+        logger.error(f"Failed to get sync orchestrator dashboard: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+
 @sync_api.route("/tenant/<tenant_id>/orders/sync", methods=["POST"])
 @require_tenant_management_api_key
 def sync_tenant_orders(tenant_id: str) -> tuple[Response, int]:
@@ -502,6 +517,12 @@ def sync_tenant_orders(tenant_id: str) -> tuple[Response, int]:
                 400,
             )
 
+        # Incremental by default: only orders and line items modified since the last completed sync
+        data = request.get_json(silent=True) or {}
+        sync_mode = data.get("mode", "incremental")
+        if sync_mode not in ("incremental", "full"):
+            return jsonify({"error": "mode must be 'incremental' or 'full'"}), 400
+
         # Create sync job
         sync_id = f"orders_sync_{tenant_id}_{int(datetime.now().timestamp())}"
         sync_job = SyncJob(
@@ -513,17 +534,21 @@ def sync_tenant_orders(tenant_id: str) -> tuple[Response, int]:
             started_at=datetime.now(UTC),
             triggered_by="api",
             triggered_by_id="tenant_management_api",
+            progress={"phase": "Starting", "mode": sync_mode},
+            **new_lease(),
         )
 
         db_session.add(sync_job)
         db_session.commit()
 
+        # Heartbeat the lease while the sync runs in this request
+        heartbeat = get_lease_heartbeat()
+        heartbeat.hold(sync_id)
         try:
             # Initialize GAM client
-            from gam_orders_service import GAMOrdersService
-
             from src.adapters.google_ad_manager import GoogleAdManager
             from src.core.schemas import Principal
+            from src.services.gam_orders_service import GAMOrdersService
 
             # Create dummy principal for sync (no advertiser needed for order discovery)
             principal = Principal(
@@ -552,7 +577,7 @@ def sync_tenant_orders(tenant_id: str) -> tuple[Response, int]:
 
             # Perform sync
             service = GAMOrdersService(db_session)
-            summary = service.sync_tenant_orders(tenant_id, adapter.client)
+            summary = service.sync_tenant_orders(tenant_id, adapter.client, sync_id=sync_id, sync_mode=sync_mode)
 
             # Update sync job with results
             sync_job.status = "completed"
@@ -574,6 +599,8 @@ def sync_tenant_orders(tenant_id: str) -> tuple[Response, int]:
             db_session.commit()
 
             return jsonify({"sync_id": sync_id, "status": "failed", "error": str(e)}), 500
+        finally:
+            heartbeat.release(sync_id)
 
     except Exception as e:
         logger.error(f"Failed to trigger orders sync: {e}", exc_info=True)
@@ -590,7 +617,7 @@ def get_tenant_orders(tenant_id: str) -> tuple[Response, int]:
     try:
         db_session.remove()  # Start fresh
 
-        from gam_orders_service import GAMOrdersService
+        from src.services.gam_orders_service import GAMOrdersService
 
         # Validate tenant_id
         if not tenant_id or len(tenant_id) > 50:
@@ -653,7 +680,7 @@ def get_order_details(tenant_id: str, order_id: str) -> tuple[Response, int]:
         if not order_id or len(order_id) > 50:
             return jsonify({"error": "Invalid order_id"}), 400
 
-        from gam_orders_service import GAMOrdersService
+        from src.services.gam_orders_service import GAMOrdersService
 
         service = GAMOrdersService(db_session)
         order_details = service.get_order_details(tenant_id, order_id)
@@ -677,7 +704,7 @@ def get_tenant_line_items(tenant_id: str) -> tuple[Response, int]:
     try:
         db_session.remove()  # Start fresh
 
-        from gam_orders_service import GAMOrdersService
+        from src.services.gam_orders_service import GAMOrdersService
 
         # Parse filters from query params
         filters = {}
@@ -0,0 +1,278 @@
+"""Server-side listing support for admin pages: keyset pagination, sorting and filtering.
+
+Listing pages used to load every row for the tenant and filter in the browser. A
+ListingSpec declares which columns a page can be sorted and filtered by; the query
+string is parsed into a ListingQuery and fetch_page() pushes sort, filters and the
+page boundary into SQL:
+
+    /tenant/t1/products/?sort=-name&type=dynamic&q=video&limit=50&cursor=...
+
+Pagination is keyset-based ("rows after the last one shown") rather than OFFSET, so
+deep pages cost the same as the first one and rows inserted meanwhile do not shift
+pages. Each sort is paired with the table's unique key as a tie-breaker, and cursors
+are opaque tokens holding the last row's (sort value, key) for that sort.
+
+Pages render the first page server-side. The same route returns JSON for
+?format=json (items plus next_cursor), and static/js/listing.js appends further
+pages in place when "Load more" is clicked.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from flask import flash, jsonify, redirect, request, url_for
+from sqlalchemy import ColumnElement, Select, and_, func, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class ListingError(ValueError):
+    """Invalid listing parameters (unknown sort, malformed cursor, bad limit)."""
+
+
+@dataclass(frozen=True)
+class ListingSpec:
+    """What a listing page can be sorted and filtered by.
+
+    Attributes:
+        key: Unique column used as the tie-breaker (usually the primary key)
+        sorts: Sort name -> column or expression
+        default_sort: Sort applied without ?sort=; prefix with "-" for descending
+        filters: Query parameter -> function building a predicate from its value
+            (return None to ignore the value)
+        search: Function building the predicate for ?q=
+    """
+
+    key: Any
+    sorts: Mapping[str, Any]
+    default_sort: str
+    filters: Mapping[str, Callable[[str], ColumnElement[bool] | None]] = field(default_factory=dict)
+    search: Callable[[str], ColumnElement[bool]] | None = None
+    default_page_size: int = DEFAULT_PAGE_SIZE
+    max_page_size: int = MAX_PAGE_SIZE
+
+
+@dataclass
+class ListingQuery:
+    """Listing parameters parsed from a request."""
+
+    sort: str
+    descending: bool
+    limit: int
+    cursor: list[Any] | None = None
+    filters: dict[str, str] = field(default_factory=dict)
+    search: str | None = None
+
+    @property
+    def sort_param(self) -> str:
+        return f"-{self.sort}" if self.descending else self.sort
+
+    def url_params(self, cursor: str | None = None) -> dict[str, Any]:
+        """Query parameters reproducing this listing (for links and "Load more")."""
+        params: dict[str, Any] = dict(self.filters)
+        params["sort"] = self.sort_param
+        params["limit"] = self.limit
+        if self.search:
+            params["q"] = self.search
+        if cursor:
+            params["cursor"] = cursor
+        return params
+
+
+@dataclass
+class ListingPage:
+    """One page of a listing."""
+
+    items: list[Any]
+    query: ListingQuery
+    next_cursor: str | None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def next_params(self) -> dict[str, Any] | None:
+        """Query parameters for the next page, or None on the last page."""
+        if self.next_cursor is None:
+            return None
+        return self.query.url_params(cursor=self.next_cursor)
+
+    def to_json(self, items: list[dict[str, Any]]) -> dict[str, Any]:
+        """JSON body for the page; items are the page's items already serialized."""
+        return {
+            "items": items,
+            "next_cursor": self.next_cursor,
+            "has_more": self.has_more,
+            "sort": self.query.sort_param,
+        }
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+        raise ListingError("Invalid cursor")
+    return value
+
+
+def encode_cursor(sort_param: str, values: list[Any]) -> str:
+    """Opaque cursor for the row with the given (sort value, key) under sort_param."""
+    payload = json.dumps([sort_param, [_encode_value(v) for v in values]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort_param: str) -> list[Any]:
+    """Values stored in a cursor; raises ListingError if malformed or made for another sort."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        cursor_sort, values = payload
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ListingError("Invalid cursor") from e
+    if cursor_sort != sort_param or not isinstance(values, list) or len(values) != 2:
+        raise ListingError("Cursor does not match the requested sort")
+    try:
+        return [_decode_value(v) for v in values]
+    except ValueError as e:
+        raise ListingError("Invalid cursor") from e
+
+
+def parse_listing_query(spec: ListingSpec, args: Mapping[str, str] | None = None) -> ListingQuery:
+    """Parse sort, limit, cursor, search and filter parameters (default: current request)."""
+    if args is None:
+        args = request.args
+
+    sort_param = args.get("sort") or spec.default_sort
+    descending = sort_param.startswith("-")
+    sort = sort_param.lstrip("-")
+    if sort not in spec.sorts:
+        raise ListingError(f"Unknown sort '{sort}'")
+
+    try:
+        limit = int(args.get("limit") or spec.default_page_size)
+    except ValueError as e:
+        raise ListingError("limit must be an integer") from e
+    if limit < 1:
+        raise ListingError("limit must be positive")
+    limit = min(limit, spec.max_page_size)
+
+    query = ListingQuery(
+        sort=sort,
+        descending=descending,
+        limit=limit,
+        filters={name: args[name] for name in spec.filters if args.get(name)},
+        search=(args.get("q") or "").strip() or None,
+    )
+    if args.get("cursor"):
+        query.cursor = decode_cursor(args["cursor"], query.sort_param)
+    return query
+
+
+def apply_filters(stmt: Select, spec: ListingSpec, query: ListingQuery) -> Select:
+    """Add the query's filter and search predicates to stmt (also usable for counts)."""
+    for name, value in query.filters.items():
+        predicate = spec.filters[name](value)
+        if predicate is not None:
+            stmt = stmt.where(predicate)
+    if query.search and spec.search is not None:
+        stmt = stmt.where(spec.search(query.search))
+    return stmt
+
+
+def _after_cursor(sort_column: Any, key: Any, query: ListingQuery) -> ColumnElement[bool]:
+    """Rows strictly after the cursor row in (sort, key) order.
+
+    NULL sort values come last ascending and first descending (PostgreSQL defaults),
+    so they get their own branches; row comparison covers the rest and can use a
+    (sort, key) index.
+    """
+    cursor: list[Any] = query.cursor or [None, None]
+    sort_value, key_value = cursor
+    if query.descending:
+        if sort_value is None:
+            return or_(and_(sort_column.is_(None), key < key_value), sort_column.is_not(None))
+        return tuple_(sort_column, key) < tuple_(sort_value, key_value)
+    if sort_value is None:
+        return and_(sort_column.is_(None), key > key_value)
+    return or_(tuple_(sort_column, key) > tuple_(sort_value, key_value), sort_column.is_(None))
+
+
+def fetch_page(session: Session, stmt: Select, spec: ListingSpec, query: ListingQuery) -> ListingPage:
+    """Run stmt (a select of one entity) filtered, sorted and limited to one page."""
+    sort_column = spec.sorts[query.sort]
+    stmt = apply_filters(stmt, spec, query)
+    if query.cursor is not None:
+        stmt = stmt.where(_after_cursor(sort_column, spec.key, query))
+    if query.descending:
+        stmt = stmt.order_by(sort_column.desc().nulls_first(), spec.key.desc())
+    else:
+        stmt = stmt.order_by(sort_column.asc().nulls_last(), spec.key.asc())
+
+    # One extra row tells whether another page exists
+    rows = session.execute(stmt.add_columns(sort_column, spec.key).limit(query.limit + 1)).unique().all()
+    next_cursor = None
+    if len(rows) > query.limit:
+        rows = rows[: query.limit]
+        next_cursor = encode_cursor(query.sort_param, [rows[-1][1], rows[-1][2]])
+    return ListingPage(items=[row[0] for row in rows], query=query, next_cursor=next_cursor)
+
+
+def count_by(session: Session, stmt: Select, column: Any) -> dict[Any, int]:
+    """Row counts of stmt (with its filters) grouped by column, e.g. for status tabs."""
+    subquery = stmt.subquery()
+    grouped = select(subquery.c[column.key], func.count()).group_by(subquery.c[column.key])
+    return dict(session.execute(grouped).tuples().all())
+
+
+def next_page_url(page: ListingPage) -> str | None:
+    """URL of the current view for the page after this one, or None on the last page."""
+    params = page.next_params()
+    if params is None or request.endpoint is None:
+        return None
+    return url_for(request.endpoint, **(request.view_args or {}), **params)
+
+
+def is_load_more() -> bool:
+    """Whether the request is static/js/listing.js fetching a further page (only the listing is used)."""
+    return request.headers.get("X-Listing-Request") == "load-more"
+
+
+def wants_json() -> bool:
+    """Whether the current listing request asked for JSON instead of HTML."""
+    if request.args.get("format") == "json":
+        return True
+    best = request.accept_mimetypes.best_match(["text/html", "application/json"])
+    return best == "application/json" and request.accept_mimetypes[best] > request.accept_mimetypes["text/html"]
+
+
+def listing_error_response(error: ListingError) -> Any:
+    """Response for invalid listing parameters on the current page.
+
+    JSON requests get a 400 with the error; HTML requests flash it and are redirected
+    to the page with its default listing.
+    """
+    if wants_json():
+        return jsonify({"error": str(error)}), 400
+    flash(f"Invalid listing parameters: {error}", "error")
+    return redirect(url_for(request.endpoint or "core.index", **(request.view_args or {})))
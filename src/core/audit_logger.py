@@ -15,8 +15,6 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import select
-
 from src.core.database.database_session import get_db_session
 from src.core.database.models import AuditLog
 
@@ -53,6 +51,13 @@ if not os.environ.get("FLY_APP_NAME") and not os.environ.get("PRODUCTION"):
     audit_logger.addHandler(console_handler)
 
 
+def _get_tenant_dict(tenant_id: str) -> dict[str, Any] | None:
+    """Load a tenant as a dict for Slack notifications (memoized per tool call)."""
+    from src.core.config_loader import get_tenant_by_id
+
+    return get_tenant_by_id(tenant_id)
+
+
 class AuditLogger:
     """Provides security-compliant audit logging for AdCP operations."""
 
@@ -134,20 +139,6 @@ class AuditLogger:
 
         # Send to Slack audit channel if configured
         try:
-            # Get tenant name and config for context
-            tenant_name = None
-            if tenant_id:
-                try:
-                    with get_db_session() as db_session:
-                        from src.core.database.models import Tenant
-
-                        stmt = select(Tenant).filter_by(tenant_id=tenant_id)
-                        tenant = db_session.scalars(stmt).first()
-                        if tenant:
-                            tenant_name = tenant.name
-                except:
-                    pass
-
             # Send notification based on criteria
             should_notify = False
             security_alert = False
@@ -211,20 +202,16 @@ class AuditLogger:
                     should_notify = True
 
             if should_notify:
-                from src.core.utils.tenant_utils import serialize_tenant_to_dict
                 from src.services.slack_notifier import get_slack_notifier
 
-                # Get tenant config for Slack notifier
+                # Get tenant name and config for the Slack notifier (one lookup, only when notifying)
+                tenant_name = None
                 tenant_config = None
                 if tenant_id:
                     try:
-                        with get_db_session() as db_session:
-                            from src.core.database.models import Tenant
-
-                            stmt = select(Tenant).filter_by(tenant_id=tenant_id)
-                            tenant = db_session.scalars(stmt).first()
-                            if tenant:
-                                tenant_config = serialize_tenant_to_dict(tenant)
+                        tenant_config = _get_tenant_dict(tenant_id)
+                        if tenant_config:
+                            tenant_name = tenant_config.get("name")
                     except:
                         pass
 
@@ -282,7 +269,6 @@ class AuditLogger:
 
         # Send security alert to Slack
         try:
-            from src.core.utils.tenant_utils import serialize_tenant_to_dict
             from src.services.slack_notifier import get_slack_notifier
 
             # Get tenant name and config
@@ -290,14 +276,9 @@ class AuditLogger:
             tenant_config = None
             if tenant_id:
                 try:
-                    with get_db_session() as db_session:
-                        from src.core.database.models import Tenant
-
-                        stmt = select(Tenant).filter_by(tenant_id=tenant_id)
-                        tenant = db_session.scalars(stmt).first()
-                        if tenant:
-                            tenant_name = tenant.name
-                            tenant_config = serialize_tenant_to_dict(tenant)
+                    tenant_config = _get_tenant_dict(tenant_id)
+                    if tenant_config:
+                        tenant_name = tenant_config.get("name")
                 except:
                     pass
 
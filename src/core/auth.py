@@ -25,6 +25,7 @@ from src.core.config_loader import (
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Principal as ModelPrincipal
 from src.core.database.models import Tenant
+from src.core.request_scope import memoize
 from src.core.schemas import Principal
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,14 @@ def get_principal_from_token(token: str, tenant_id: str | None = None) -> str |
     If tenant_id is provided, only looks in that specific tenant.
     If not provided, searches globally by token and sets the tenant context.
     """
+    if tenant_id:
+        # Tenant-scoped lookups have no side effects, so repeats within a tool call are memoized
+        return memoize(("principal_token", tenant_id, token), lambda: _lookup_principal_from_token(token, tenant_id))
+    return _lookup_principal_from_token(token, tenant_id)
+
+
+def _lookup_principal_from_token(token: str, tenant_id: str | None) -> str | None:
+    """Database lookup behind get_principal_from_token()."""
     if _VERBOSE_AUTH_LOG:
         logger.info("Looking up principal: tenant_id=%s, token=***%s", tenant_id, token[-6:] if token else "None")
 
@@ -380,19 +389,26 @@ def get_principal_adapter_mapping(principal_id: str) -> dict[str, Any]:
 
 
 def get_principal_object(principal_id: str) -> Principal | None:
-    """Get a Principal object for the given principal_id."""
-    tenant = get_current_tenant()
-    with get_db_session() as session:
-        stmt = select(ModelPrincipal).filter_by(principal_id=principal_id, tenant_id=tenant["tenant_id"])
-        principal = session.scalars(stmt).first()
+    """Get a Principal object for the given principal_id.
 
-        if principal:
-            return Principal(
-                principal_id=principal.principal_id,
-                name=principal.name,
-                platform_mappings=principal.platform_mappings,
-            )
-    return None
+    Memoized for the duration of the current tool call (see src/core/request_scope.py).
+    """
+    tenant_id = get_current_tenant()["tenant_id"]
+
+    def _load() -> Principal | None:
+        with get_db_session() as session:
+            stmt = select(ModelPrincipal).filter_by(principal_id=principal_id, tenant_id=tenant_id)
+            principal = session.scalars(stmt).first()
+
+            if principal:
+                return Principal(
+                    principal_id=principal.principal_id,
+                    name=principal.name,
+                    platform_mappings=principal.platform_mappings,
+                )
+        return None
+
+    return memoize(("principal", tenant_id, principal_id), _load)
 
 
 def get_adapter_principal_id(principal_id: str, adapter: str) -> str | None:
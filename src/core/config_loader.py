@@ -17,6 +17,7 @@ from sqlalchemy import select
 
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Tenant
+from src.core.request_scope import memoize, seed_request_cache
 
 logger = logging.getLogger(__name__)
 
@@ -186,24 +187,23 @@ def set_current_tenant(tenant_dict: dict[str, Any]):
     current_tenant.set(tenant_dict)
 
 
-def get_tenant_by_subdomain(subdomain: str) -> dict[str, Any] | None:
-    """Get tenant by subdomain.
-
-    Args:
-        subdomain: The subdomain to look up (e.g., 'wonderstruck' from wonderstruck.sales-agent.example.com)
+def _load_active_tenant(**filters: Any) -> dict[str, Any] | None:
+    """Load the active tenant matching ``filters`` as a dict.
 
-    Returns:
-        Tenant dict if found, None otherwise
+    The result is also stored under ("tenant", tenant_id) in the current request
+    scope so later lookups by id within the same tool call reuse it.
     """
     try:
         with get_db_session() as db_session:
-            stmt = select(Tenant).filter_by(subdomain=subdomain, is_active=True)
+            stmt = select(Tenant).filter_by(**filters, is_active=True)
             tenant = db_session.scalars(stmt).first()
 
             if tenant:
                 from src.core.utils.tenant_utils import serialize_tenant_to_dict
 
-                return serialize_tenant_to_dict(tenant)
+                tenant_dict = serialize_tenant_to_dict(tenant)
+                seed_request_cache(("tenant", tenant_dict["tenant_id"]), tenant_dict)
+                return tenant_dict
             return None
     except Exception as e:
         # If table doesn't exist or other DB errors, return None
@@ -212,6 +212,18 @@ def get_tenant_by_subdomain(subdomain: str) -> dict[str, Any] | None:
         raise
 
 
+def get_tenant_by_subdomain(subdomain: str) -> dict[str, Any] | None:
+    """Get tenant by subdomain.
+
+    Args:
+        subdomain: The subdomain to look up (e.g., 'wonderstruck' from wonderstruck.sales-agent.example.com)
+
+    Returns:
+        Tenant dict if found, None otherwise
+    """
+    return memoize(("tenant_by_subdomain", subdomain), lambda: _load_active_tenant(subdomain=subdomain))
+
+
 def get_tenant_by_id(tenant_id: str) -> dict[str, Any] | None:
     """Get tenant by tenant_id.
 
@@ -221,40 +233,13 @@ def get_tenant_by_id(tenant_id: str) -> dict[str, Any] | None:
     Returns:
         Tenant dict if found, None otherwise
     """
-    try:
-        with get_db_session() as db_session:
-            stmt = select(Tenant).filter_by(tenant_id=tenant_id, is_active=True)
-            tenant = db_session.scalars(stmt).first()
-
-            if tenant:
-                from src.core.utils.tenant_utils import serialize_tenant_to_dict
-
-                return serialize_tenant_to_dict(tenant)
-            return None
-    except Exception as e:
-        # If table doesn't exist or other DB errors, return None
-        if "no such table" in str(e) or "does not exist" in str(e):
-            return None
-        raise
+    # Same key the request boundary seeds, so a tenant it already resolved costs no query
+    return memoize(("tenant", tenant_id), lambda: _load_active_tenant(tenant_id=tenant_id))
 
 
 def get_tenant_by_virtual_host(virtual_host: str) -> dict[str, Any] | None:
     """Get tenant by virtual host."""
-    try:
-        with get_db_session() as db_session:
-            stmt = select(Tenant).filter_by(virtual_host=virtual_host, is_active=True)
-            tenant = db_session.scalars(stmt).first()
-
-            if tenant:
-                from src.core.utils.tenant_utils import serialize_tenant_to_dict
-
-                return serialize_tenant_to_dict(tenant)
-            return None
-    except Exception as e:
-        # If table doesn't exist or other DB errors, return None
-        if "no such table" in str(e) or "does not exist" in str(e):
-            return None
-        raise
+    return memoize(("tenant_by_virtual_host", virtual_host), lambda: _load_active_tenant(virtual_host=virtual_host))
 
 
 def get_secret(key: str, default: str | None = None) -> str | None:
@@ -1,6 +1,5 @@
 """Context persistence manager for A2A protocol support."""
 
-import asyncio
 import logging
 import uuid
 from datetime import UTC, datetime
@@ -250,8 +249,6 @@ class ContextManager(DatabaseManager):
 
             step = session.scalars(stmt).first()
             if step:
-                old_status = step.status  # Capture old status before changing
-
                 if status:
                     step.status = status
                     if status in ["completed", "failed"] and not step.completed_at:
@@ -279,35 +276,14 @@ class ContextManager(DatabaseManager):
                     )
                     step.comments = new_comments
 
-                # DEBUG: Log the condition check values BEFORE commit
-                console.print("[magenta]🔍 PRE-COMMIT WEBHOOK DEBUG:[/magenta]")
-                console.print("[magenta]   update_workflow_step called with:[/magenta]")
-                console.print(f"[magenta]     step_id={step_id}[/magenta]")
-                console.print(f"[magenta]     status parameter={status}[/magenta]")
-                console.print("[magenta]   Database state BEFORE commit:[/magenta]")
-                console.print(f"[magenta]     old_status={old_status}[/magenta]")
-                console.print(f"[magenta]     new step.status={step.status}[/magenta]")
-                console.print("[magenta]   Condition evaluation:[/magenta]")
-                console.print(f"[magenta]     status parameter truthy? {bool(status)}[/magenta]")
-                console.print(f"[magenta]     step object exists? {step is not None}[/magenta]")
-                console.print(f"[magenta]     Will trigger webhook? {status and step}[/magenta]")
+                # Queue push notifications in the same transaction as the status change,
+                # so a notification is delivered if and only if the new status is committed
+                if status:
+                    console.print(f"[blue]🚀 WEBHOOK: Queuing push notifications for step {step_id}[/blue]")
+                    self._enqueue_push_notifications(step, status, session)
 
                 session.commit()
                 console.print(f"[green]✅ Updated workflow step {step_id} (committed to database)[/green]")
-
-                # DEBUG: Log the condition check values AFTER commit
-                console.print("[yellow]🔍 POST-COMMIT WEBHOOK DEBUG:[/yellow]")
-                console.print(f"[yellow]   status={status}[/yellow]")
-                console.print(f"[yellow]   old_status={old_status}[/yellow]")
-                console.print(f"[yellow]   step exists={step is not None}[/yellow]")
-                console.print(f"[yellow]   Webhook trigger condition (status and step): {status and step}[/yellow]")
-
-                # Send push notifications if status changed
-                if status and step:
-                    console.print(f"[blue]🚀 WEBHOOK: Calling _send_push_notifications for step {step_id}[/blue]")
-                    self._send_push_notifications(step, status, session)
-                else:
-                    console.print(f"[yellow]⚠️ WEBHOOK SKIPPED: status={status}, step={step is not None}[/yellow]")
         finally:
             session.close()
 
@@ -570,17 +546,18 @@ class ContextManager(DatabaseManager):
         finally:
             session.close()
 
-    def _send_push_notifications(self, step: WorkflowStep, new_status: str, session: Any) -> None:
-        """Send push notifications via registered webhooks for workflow step status changes.
+    def _enqueue_push_notifications(self, step: WorkflowStep, new_status: str, session: Any) -> None:
+        """Queue push notifications for a workflow step status change in the webhook outbox.
+
+        Rows are added to ``session`` and committed by the caller together with the
+        status change; WebhookOutboxDispatcher delivers them after commit.
 
         Args:
             step: The workflow step that was updated
             new_status: The new status value
-            session: Active database session
+            session: Active database session (not committed here)
         """
         try:
-            import requests
-
             from src.core.database.models import PushNotificationConfig
 
             # Get object mappings for this step
@@ -601,131 +578,85 @@ class ContextManager(DatabaseManager):
             tenant_id = context.tenant_id
             principal_id = context.principal_id
 
-            # Find registered webhooks for this principal
+            # Only principals with a registered, active webhook receive notifications
             # NOTE: PushNotificationConfig doesn't have object_type/object_id columns
             # Those are in ObjectWorkflowMapping which we already have via 'mappings'
-            webhook_stmt = select(PushNotificationConfig).filter_by(
+            webhook_stmt = select(PushNotificationConfig.id).filter_by(
                 tenant_id=tenant_id,
                 principal_id=principal_id,
                 is_active=True,
             )
-            webhooks = session.scalars(webhook_stmt).all()
+            if session.scalars(webhook_stmt).first() is None:
+                console.print(f"[yellow]No active webhook configs for principal {principal_id}[/yellow]")
+                return
+
+            # build push notification config from step request data
+            cfg_dict = (step.request_data or {}).get("push_notification_config") or {}
+            url = cfg_dict.get("url")
+            if not url:
+                console.print("[red]No push notification URL present; skipping webhook[/red]")
+                return
 
-            console.print(f"[cyan]🔍 Found {len(webhooks)} active webhook configs for principal {principal_id}[/cyan]")
+            authentication = cfg_dict.get("authentication") or {}
+            schemes = authentication.get("schemes") or []
+            auth_type = schemes[0] if isinstance(schemes, list) and schemes else None
+            auth_token = authentication.get("credentials")
 
-            # Send notifications for each mapping (media buy, creative, etc.)
+            push_notification_config = PushNotificationConfig(
+                id=cfg_dict.get("id") or f"pnc_{uuid.uuid4().hex[:16]}",
+                tenant_id=tenant_id,
+                principal_id=principal_id,
+                url=url,
+                authentication_type=auth_type,
+                authentication_token=auth_token,
+                is_active=True,
+            )
+
+            service = get_protocol_webhook_service()
+            protocol = (step.request_data or {}).get("protocol", "mcp")  # Default to MCP
+            try:
+                status_enum = GeneratedTaskStatus(new_status)
+            except ValueError:
+                status_enum = GeneratedTaskStatus.unknown
+
+            # Queue a notification for each mapping (media buy, creative, etc.)
             for mapping in mappings:
                 console.print(
-                    f"[cyan]📦 Processing mapping: {mapping.object_type} {mapping.object_id} action={mapping.action}[/cyan]"
+                    f"[cyan]📤 Queuing webhook to {url} for {mapping.object_type} {mapping.object_id} "
+                    f"action={mapping.action}[/cyan]"
                 )
 
-                for _webhook_config in webhooks:
-                    # build push notification config from step request data
-                    from uuid import uuid4
-
-                    cfg_dict = (step.request_data or {}).get("push_notification_config") or {}
-                    url = cfg_dict.get("url")
-                    if not url:
-                        console.print("[red]No push notification URL present; skipping webhook[/red]")
-                        continue
-
-                    authentication = cfg_dict.get("authentication") or {}
-                    schemes = authentication.get("schemes") or []
-                    auth_type = schemes[0] if isinstance(schemes, list) and schemes else None
-                    auth_token = authentication.get("credentials")
-
-                    # Derive principal/tenant from the step context if available
-                    context_obj = getattr(step, "context", None)
-                    derived_tenant_id = tenant_id or (getattr(context_obj, "tenant_id", None))
-                    derived_principal_id = getattr(context_obj, "principal_id", None)
-
-                    push_notification_config = PushNotificationConfig(
-                        id=cfg_dict.get("id") or f"pnc_{uuid4().hex[:16]}",
-                        tenant_id=derived_tenant_id,
-                        principal_id=derived_principal_id,
-                        url=url,
-                        authentication_type=auth_type,
-                        authentication_token=auth_token,
-                        is_active=True,
-                    )
-
-                    service = get_protocol_webhook_service()
-
-                    console.print(
-                        f"[cyan]📤 Sending webhook to {push_notification_config.url} for {mapping.object_type} {mapping.object_id}[/cyan]"
+                # Build webhook payload based on protocol type
+                payload: Task | TaskStatusUpdateEvent | McpWebhookPayload
+                if protocol == "a2a":
+                    payload = create_a2a_webhook_payload(
+                        task_id=step.step_id,
+                        status=status_enum,
+                        context_id=step.context_id,
+                        result=step.response_data or {},
                     )
-
-                    # Build webhook payload based on protocol type
-                    task_type_str = step.tool_name or mapping.action or "unknown"
-                    protocol = (step.request_data or {}).get("protocol", "mcp")  # Default to MCP
-                    try:
-                        status_enum = GeneratedTaskStatus(new_status)
-                    except ValueError:
-                        status_enum = GeneratedTaskStatus.unknown
-
-                    payload: Task | TaskStatusUpdateEvent | McpWebhookPayload
-                    if protocol == "a2a":
-                        payload = create_a2a_webhook_payload(
-                            task_id=step.step_id,
-                            status=status_enum,
-                            context_id=step.context_id,
-                            result=step.response_data or {},
-                        )
-                    else:
-                        # TODO: Fix in adcp python client - create_mcp_webhook_payload should return
-                        # McpWebhookPayload instead of dict[str, Any] for proper type safety
-                        mcp_payload_dict = create_mcp_webhook_payload(step.step_id, status_enum, step.response_data)
-                        payload = McpWebhookPayload.model_construct(**mcp_payload_dict)
-
-                    metadata: dict[str, Any] = {
-                        "task_type": task_type_str,
-                        "tenant_id": derived_tenant_id,
-                        "principal_id": derived_principal_id,
-                    }
-
-                    try:
-                        # If we're already in an event loop, schedule the send; otherwise run it directly
-                        try:
-                            loop = asyncio.get_running_loop()
-                            task = loop.create_task(
-                                service.send_notification(
-                                    push_notification_config=push_notification_config,
-                                    payload=payload,
-                                    metadata=metadata,
-                                )
-                            )
-
-                            def _log_task_result(
-                                t: asyncio.Task, config_url: str = push_notification_config.url
-                            ) -> None:
-                                try:
-                                    t.result()
-                                    console.print(f"[green]✅ Webhook sent successfully for {config_url}[/green]")
-                                except Exception as e:  # noqa: BLE001
-                                    console.print(f"[red]❌ Webhook failed for {config_url}: {str(e)}[/red]")
-
-                            task.add_done_callback(_log_task_result)
-                        except RuntimeError:
-                            # No running loop; safe to run synchronously
-                            asyncio.run(
-                                service.send_notification(
-                                    push_notification_config=push_notification_config,
-                                    payload=payload,
-                                    metadata=metadata,
-                                )
-                            )
-                            console.print(
-                                f"[green]✅ Webhook sent successfully for {push_notification_config.url}[/green]"
-                            )
-
-                    except requests.exceptions.Timeout:
-                        console.print(f"[red]❌ Webhook timeout for {push_notification_config.url}[/red]")
-                    except requests.exceptions.RequestException as e:
-                        console.print(f"[red]❌ Webhook failed for {push_notification_config.url}: {str(e)}[/red]")
+                else:
+                    # TODO: Fix in adcp python client - create_mcp_webhook_payload should return
+                    # McpWebhookPayload instead of dict[str, Any] for proper type safety
+                    mcp_payload_dict = create_mcp_webhook_payload(step.step_id, status_enum, step.response_data)
+                    payload = McpWebhookPayload.model_construct(**mcp_payload_dict)
+
+                metadata: dict[str, Any] = {
+                    "task_type": step.tool_name or mapping.action or "unknown",
+                    "tenant_id": tenant_id,
+                    "principal_id": principal_id,
+                }
+
+                service.enqueue_notification(
+                    session,
+                    push_notification_config=push_notification_config,
+                    payload=payload,
+                    metadata=metadata,
+                )
 
         except Exception as e:
-            console.print(f"[red]Error sending push notifications: {e}[/red]")
-            # Don't fail the workflow update if notifications fail
+            console.print(f"[red]Error queuing push notifications: {e}[/red]")
+            # Don't fail the workflow update if notifications can't be queued
             import traceback
 
             traceback.print_exc()
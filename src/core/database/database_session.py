@@ -7,6 +7,7 @@ management across the entire application.
 
 import logging
 import os
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
 from typing import Any
@@ -17,6 +18,8 @@ from sqlalchemy.exc import DisconnectionError, OperationalError, SQLAlchemyError
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from src.core.database.db_config import DatabaseConfig
+from src.core.metrics import db_query_duration
+from src.core.request_scope import record_db_query
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +134,27 @@ def get_engine():
             cursor.execute(f"SET statement_timeout = '{query_timeout * 1000}'")
             cursor.close()
 
+        # Count and time round trips per tool call (see src/core/request_scope.py)
+        @event.listens_for(_engine, "before_cursor_execute")
+        def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+            """Remember when the statement was sent."""
+            conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+        @event.listens_for(_engine, "after_cursor_execute")
+        def record_round_trip(conn, cursor, statement, parameters, context, executemany):
+            """Attribute the statement and its latency to the active request scope."""
+            started = conn.info["query_start_time"].pop()
+            elapsed = time.perf_counter() - started
+            db_query_duration.observe(elapsed)
+            record_db_query(elapsed)
+
+        @event.listens_for(_engine, "handle_error")
+        def discard_query_timer(exception_context):
+            """Drop the start time of a failed statement (after_cursor_execute does not fire)."""
+            conn = exception_context.connection
+            if conn is not None and conn.info.get("query_start_time"):
+                conn.info["query_start_time"].pop()
+
         # Create session factory
         _session_factory = sessionmaker(bind=_engine)
         _scoped_session = scoped_session(_session_factory)
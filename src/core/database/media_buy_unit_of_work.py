@@ -0,0 +1,171 @@
+"""Unit of work for persisting a new media buy in one transaction.
+
+create_media_buy used to open a session per table it wrote (media buy, packages,
+platform line item IDs, workflow mapping, creative assignments), committing each
+one and re-querying products per package for creative format checks. A
+MediaBuyUnitOfWork buffers those writes and flushes them on one session with a
+single commit: packages and creative assignments go out as one executemany
+INSERT each, and products/creatives are loaded in bulk once. Those bulk INSERTs
+bypass the session's readiness refresh hook, so the readiness snapshots of the
+affected media buys are recomputed before the commit.
+
+Writes are buffered rather than added to the session as they happen because
+get_db_session() hands out a scoped session: any nested get_db_session() (from
+an adapter or helper called mid-flow) closes it and would silently drop pending
+objects.
+
+Side effects that must only happen once the rows exist (ad server creative
+association, activity feed, audit log, Slack) are queued with after_commit()
+and run in order after the commit succeeds. A failing callback is logged and
+does not affect the others or the committed media buy. If the block exits
+without commit() (e.g. on an exception), nothing is written and no callback runs.
+
+Usage:
+    with media_buy_unit_of_work(tenant_id, products=product_map) as uow:
+        uow.add(MediaBuy(...))
+        uow.add_package(media_buy_id, package_id, package_config, budget=1000.0)
+        uow.add_assignment(media_buy_id, package_id, creative_id)
+        uow.after_commit("activity feed", lambda: activity_feed.log_media_buy(...))
+        uow.commit()
+"""
+
+import logging
+import uuid
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, attributes, selectinload
+
+from src.admin.services.media_buy_readiness_service import store_readiness_snapshots
+from src.core.database.database_session import get_db_session
+from src.core.database.models import Creative, CreativeAssignment, MediaPackage, Product
+
+logger = logging.getLogger(__name__)
+
+
+class MediaBuyUnitOfWork:
+    """Buffered writes and bulk lookups for one media buy creation."""
+
+    def __init__(self, session: Session, tenant_id: str, products: Mapping[str, Product] | None = None):
+        self.session = session
+        self.tenant_id = tenant_id
+        # Products may come preloaded from request validation (detached, read-only use)
+        self.products: dict[str, Product] = dict(products or {})
+        self.creatives: dict[str, Creative] = {}
+        self._objects: list[Any] = []
+        self._modified: list[tuple[Any, str]] = []
+        self._package_rows: list[dict[str, Any]] = []
+        self._assignment_rows: list[dict[str, Any]] = []
+        self._after_commit: list[tuple[str, Callable[[], Any]]] = []
+
+    def load_products(self, product_ids: Iterable[str]) -> dict[str, Product]:
+        """Products (with pricing options) by ID; only IDs not loaded yet are queried."""
+        missing = sorted({product_id for product_id in product_ids if product_id not in self.products})
+        if missing:
+            stmt = (
+                select(Product)
+                .where(Product.tenant_id == self.tenant_id, Product.product_id.in_(missing))
+                .options(selectinload(Product.pricing_options))
+            )
+            for product in self.session.scalars(stmt):
+                self.products[product.product_id] = product
+        return self.products
+
+    def load_creatives(self, creative_ids: Iterable[str]) -> dict[str, Creative]:
+        """Tenant creatives by ID; only IDs not loaded yet are queried."""
+        missing = sorted({creative_id for creative_id in creative_ids if creative_id not in self.creatives})
+        if missing:
+            stmt = select(Creative).where(Creative.tenant_id == self.tenant_id, Creative.creative_id.in_(missing))
+            for creative in self.session.scalars(stmt):
+                self.creatives[str(creative.creative_id)] = creative
+        return self.creatives
+
+    def add(self, obj: Any) -> None:
+        """Insert an ORM object (e.g. the MediaBuy or a workflow mapping) on commit."""
+        self._objects.append(obj)
+
+    def mark_modified(self, obj: Any, attribute: str) -> None:
+        """Persist an in-place change to a loaded object's JSON attribute on commit."""
+        self._modified.append((obj, attribute))
+
+    def add_package(
+        self,
+        media_buy_id: str,
+        package_id: str,
+        package_config: dict[str, Any],
+        budget: float | None = None,
+        bid_price: float | None = None,
+        pacing: str | None = None,
+    ) -> None:
+        """Queue a MediaPackage row (dual-write: dedicated pricing columns + package_config)."""
+        self._package_rows.append(
+            {
+                "media_buy_id": media_buy_id,
+                "package_id": package_id,
+                "package_config": package_config,
+                "budget": Decimal(str(budget)) if budget is not None else None,
+                "bid_price": Decimal(str(bid_price)) if bid_price is not None else None,
+                "pacing": pacing,
+            }
+        )
+
+    def add_assignment(self, media_buy_id: str, package_id: str, creative_id: str) -> str:
+        """Queue a CreativeAssignment row and return its generated assignment_id."""
+        assignment_id = f"assign_{uuid.uuid4().hex[:12]}"
+        self._assignment_rows.append(
+            {
+                "assignment_id": assignment_id,
+                "tenant_id": self.tenant_id,
+                "media_buy_id": media_buy_id,
+                "package_id": package_id,
+                "creative_id": creative_id,
+            }
+        )
+        return assignment_id
+
+    def after_commit(self, description: str, callback: Callable[[], Any]) -> None:
+        """Run callback once the transaction has committed."""
+        self._after_commit.append((description, callback))
+
+    def commit(self) -> None:
+        """Write everything queued in one transaction, then run the after-commit callbacks."""
+        for obj in self._objects:
+            self.session.add(obj)
+        for obj, attribute in self._modified:
+            self.session.add(obj)
+            attributes.flag_modified(obj, attribute)
+        # Parent rows (media buy) must exist before packages and assignments reference them
+        self.session.flush()
+        if self._package_rows:
+            self.session.execute(insert(MediaPackage), self._package_rows)
+        if self._assignment_rows:
+            self.session.execute(insert(CreativeAssignment), self._assignment_rows)
+        # Core INSERTs are invisible to the after_flush readiness hook
+        media_buy_ids = sorted({row["media_buy_id"] for row in (*self._package_rows, *self._assignment_rows)})
+        if media_buy_ids:
+            store_readiness_snapshots(self.session, self.tenant_id, media_buy_ids)
+        self.session.commit()
+        logger.info(
+            f"Committed media buy unit of work: {len(self._objects)} objects, "
+            f"{len(self._package_rows)} packages, {len(self._assignment_rows)} creative assignments"
+        )
+
+        self._objects, self._modified, self._package_rows, self._assignment_rows = [], [], [], []
+        callbacks, self._after_commit = self._after_commit, []
+        for description, callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Post-commit step '{description}' failed: {e}")
+
+
+@contextmanager
+def media_buy_unit_of_work(
+    tenant_id: str, products: Mapping[str, Product] | None = None
+) -> Iterator[MediaBuyUnitOfWork]:
+    """Open a session-backed MediaBuyUnitOfWork; queued writes are discarded unless committed."""
+    with get_db_session() as session:
+        yield MediaBuyUnitOfWork(session, tenant_id, products)
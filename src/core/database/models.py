@@ -1,7 +1,7 @@
 """SQLAlchemy models for database schema."""
 
 import logging
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import uuid4
 
@@ -20,9 +20,11 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
+    select,
     text,
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from src.core.database.json_type import JSONType
@@ -114,6 +116,13 @@ class Tenant(Base, JSONValidatorMixin):
     # When set, get_products will use AI to rank and filter products
     product_ranking_prompt: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # Overall get_products latency budget in milliseconds (None = platform default)
+    # Over budget, AI ranking and dynamic variants are skipped and flagged in the response
+    products_latency_budget_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # When tenant_daily_revenue was last rebuilt for this tenant (None = dashboard computes revenue live)
+    revenue_rollup_backfilled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
     # Favicon URL - custom favicon for the tenant's admin UI
     # Can be an absolute URL or a path to an uploaded file (e.g., /static/favicons/tenant_id/favicon.ico)
     favicon_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -469,6 +478,8 @@ class Product(Base, JSONValidatorMixin):
 
     __table_args__ = (
         Index("idx_products_tenant", "tenant_id"),
+        # Keyset pagination of the admin products listing
+        Index("idx_products_tenant_name", "tenant_id", "name", "product_id"),
         # Enforce AdCP spec: products must have EITHER properties OR property_tags (not both, not neither)
         CheckConstraint(
             "(properties IS NOT NULL AND property_tags IS NULL) OR (properties IS NULL AND property_tags IS NOT NULL)",
@@ -580,6 +591,8 @@ class Principal(Base, JSONValidatorMixin):
     __table_args__ = (
         Index("idx_principals_tenant", "tenant_id"),
         Index("idx_principals_token", "access_token"),
+        # Keyset pagination of the admin principals listing
+        Index("idx_principals_tenant_name", "tenant_id", "name", "principal_id"),
     )
 
 
@@ -705,6 +718,8 @@ class Creative(Base):
         Index("idx_creatives_principal", "tenant_id", "principal_id"),
         Index("idx_creatives_status", "status"),
         Index("idx_creatives_format_namespace", "agent_url", "format"),  # AdCP v2.4 format namespacing
+        # Keyset pagination of the admin creative review listing (scanned backward for newest first)
+        Index("idx_creatives_tenant_created", "tenant_id", "created_at", "creative_id"),
     )
 
 
@@ -820,6 +835,9 @@ class MediaBuy(Base):
     approved_by: Mapped[str | None] = mapped_column(String(255), nullable=True)
     raw_request: Mapped[dict] = mapped_column(JSONType, nullable=False)
     strategy_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Denormalized readiness inputs, maintained by MediaBuyReadinessService (None until first computed)
+    readiness_snapshot: Mapped[dict | None] = mapped_column(JSONType, nullable=True)
+    readiness_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     tenant = relationship("Tenant", back_populates="media_buys", overlaps="media_buys")
@@ -913,6 +931,13 @@ class MediaPackage(Base):
 
 
 class AuditLog(Base):
+    """Audit trail of tool calls and admin actions.
+
+    In migrated databases the table is range-partitioned by month on timestamp
+    (primary key (log_id, timestamp)); see src/services/audit_log_partitions.py.
+    log_id alone is unique (sequence-generated) and identifies rows in the ORM.
+    """
+
     __tablename__ = "audit_logs"
 
     log_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -938,7 +963,7 @@ class AuditLog(Base):
             ["strategies.strategy_id"],
             ondelete="SET NULL",
         ),
-        Index("idx_audit_logs_tenant", "tenant_id"),
+        Index("idx_audit_logs_tenant_timestamp", "tenant_id", text("timestamp DESC")),
         Index("idx_audit_logs_timestamp", "timestamp"),
         Index("idx_audit_logs_strategy", "strategy_id"),
     )
@@ -1334,6 +1359,86 @@ class FormatPerformanceMetrics(Base):
     )
 
 
+class FormatMetricsDaily(Base):
+    """Daily GAM reporting aggregates by country + creative size.
+
+    Ingested once per day by FormatMetricsAggregationService; the rolling-window rows in
+    format_performance_metrics are summed from these. cpm_sketch holds the day's line
+    item CPMs as mergeable histogram buckets (src/services/cpm_sketch.py).
+    """
+
+    __tablename__ = "format_metrics_daily"
+
+    tenant_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("tenants.tenant_id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    # Empty string when GAM reports no country
+    country_code: Mapped[str] = mapped_column(String(3), primary_key=True)
+    creative_size: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+    total_impressions: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_clicks: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_revenue_micros: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # Number of line item CPMs in cpm_sketch
+    line_item_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cpm_sketch: Mapped[dict] = mapped_column(JSONType, nullable=False, default=dict)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class DeliveryFact(Base):
+    """Delivery of a media buy package over one day, or one hour of a day.
+
+    Synced from the ad server by src/services/delivery_facts.py so delivery reporting
+    can be answered locally. A day is stored either as a single whole-day row
+    (hour = -1) or as hourly rows (hour 0-23, for the day in progress), never both.
+    """
+
+    __tablename__ = "delivery_facts"
+    __table_args__ = (
+        CheckConstraint("hour BETWEEN -1 AND 23", name="ck_delivery_facts_hour"),
+        Index("idx_delivery_facts_tenant_day", "tenant_id", "day"),
+    )
+
+    media_buy_id: Mapped[str] = mapped_column(
+        String(100), ForeignKey("media_buys.media_buy_id", ondelete="CASCADE"), primary_key=True
+    )
+    # Empty string for delivery the ad server could not attribute to a package
+    package_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    # -1 for a whole-day row
+    hour: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("tenants.tenant_id", ondelete="CASCADE"), nullable=False
+    )
+
+    impressions: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    clicks: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    spend: Mapped[Decimal] = mapped_column(DECIMAL(15, 4), nullable=False, default=0)
+    video_completions: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class DeliverySyncState(Base):
+    """How far delivery_facts are complete for a media buy.
+
+    Facts cover synced_from through synced_through (the ad server's data freshness at
+    the last sync); requests outside that range go to the ad server.
+    """
+
+    __tablename__ = "delivery_sync_state"
+
+    media_buy_id: Mapped[str] = mapped_column(
+        String(100), ForeignKey("media_buys.media_buy_id", ondelete="CASCADE"), primary_key=True
+    )
+    tenant_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("tenants.tenant_id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    synced_from: Mapped[date] = mapped_column(Date, nullable=False)
+    synced_through: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
 class GAMOrder(Base):
     __tablename__ = "gam_orders"
 
@@ -1482,6 +1587,11 @@ class SyncJob(Base):
     triggered_by: Mapped[str] = mapped_column(String(50), nullable=False)
     triggered_by_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     progress: Mapped[dict | None] = mapped_column(JSONType, nullable=True)  # Real-time progress tracking
+    # Lease: the worker running the job renews lease_expires_at on every heartbeat. A running
+    # job whose lease has lapsed is reclaimed (marked failed) by the sync orchestrator.
+    lease_owner: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     tenant = relationship("Tenant")
@@ -1490,9 +1600,29 @@ class SyncJob(Base):
         Index("idx_sync_jobs_tenant", "tenant_id"),
         Index("idx_sync_jobs_status", "status"),
         Index("idx_sync_jobs_started", "started_at"),
+        Index("idx_sync_jobs_status_lease", "status", "lease_expires_at"),
     )
 
 
+class SyncSchedule(Base):
+    """When the sync orchestrator next runs one sync type for a tenant."""
+
+    __tablename__ = "sync_schedules"
+
+    tenant_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("tenants.tenant_id", ondelete="CASCADE"), primary_key=True
+    )
+    sync_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default="true")
+    interval_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+    next_run_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_sync_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (Index("idx_sync_schedules_due", "next_run_at"),)
+
+
 class Context(Base):
     """Simple conversation tracker for asynchronous operations.
 
@@ -1580,7 +1710,8 @@ class WorkflowStep(Base, JSONValidatorMixin):
         Index("idx_workflow_steps_status", "status"),
         Index("idx_workflow_steps_owner", "owner"),
         Index("idx_workflow_steps_assigned", "assigned_to"),
-        Index("idx_workflow_steps_created", "created_at"),
+        # (created_at, step_id) for keyset pagination of the admin workflows task listing
+        Index("idx_workflow_steps_created", "created_at", "step_id"),
     )
 
 
@@ -1958,3 +2089,199 @@ class WebhookDeliveryLog(Base):
         Index("idx_webhook_log_status", "status"),
         Index("idx_webhook_log_created_at", "created_at"),
     )
+
+
+class WebhookOutbox(Base):
+    """Transactional outbox for outbound webhooks.
+
+    Rows are inserted in the same transaction as the state change that triggers
+    the webhook and drained by WebhookOutboxDispatcher workers. Delivery order is
+    preserved per endpoint (endpoint_key) by only dispatching the oldest
+    unfinished row for each endpoint.
+    """
+
+    __tablename__ = "webhook_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    tenant_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    principal_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    kind: Mapped[str] = mapped_column(String(30), nullable=False)  # "protocol", "delivery_report"
+    endpoint_url: Mapped[str] = mapped_column(Text, nullable=False)
+    endpoint_key: Mapped[str] = mapped_column(Text, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONType, nullable=False)
+    # Credential reference: push_notification_config_id, or an encrypted token for request-scoped configs
+    delivery_config: Mapped[dict | None] = mapped_column(JSONType, nullable=True)
+    # Sender metadata (task_type, media_buy_id, ...) passed through to the delivery service
+    event_metadata: Mapped[dict | None] = mapped_column(JSONType, nullable=True)
+
+    # Delivery state: "pending", "in_flight", "delivered", "failed"
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    attempt_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=8)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    locked_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    delivered_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("idx_webhook_outbox_due", "status", "next_attempt_at"),
+        Index("idx_webhook_outbox_endpoint", "endpoint_key", "id"),
+        Index("idx_webhook_outbox_tenant", "tenant_id"),
+    )
+
+
+class PolicyDecisionCache(Base):
+    """Cached AI policy decisions for advertising briefs.
+
+    Keyed by a content hash of the normalized brief, brand info, tenant
+    advertising policy and model (see src/services/policy_decision_cache.py),
+    so a policy or model change naturally misses the cache.
+    """
+
+    __tablename__ = "policy_decision_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    tenant_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("tenants.tenant_id", ondelete="CASCADE"), nullable=False
+    )
+    model: Mapped[str] = mapped_column(String(200), nullable=False)
+    # PolicyCheckResult fields
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    reason: Mapped[str | None] = mapped_column(Text, nullable=True)
+    restrictions: Mapped[list | None] = mapped_column(JSONType, nullable=True)
+    warnings: Mapped[list | None] = mapped_column(JSONType, nullable=True)
+    decided_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("idx_policy_decision_cache_tenant", "tenant_id"),
+        Index("idx_policy_decision_cache_expires", "expires_at"),
+    )
+
+
+class CreativeReviewJob(Base):
+    """Durable queue of AI creative reviews.
+
+    Rows are inserted in the same transaction as the creative (sync_creatives) and
+    consumed by CreativeReviewWorkerPool (src/services/creative_review_queue.py).
+    The row doubles as the task status returned by get_ai_review_status().
+    """
+
+    __tablename__ = "creative_review_jobs"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    task_id: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    tenant_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("tenants.tenant_id", ondelete="CASCADE"), nullable=False
+    )
+    creative_id: Mapped[str] = mapped_column(
+        String(100), ForeignKey("creatives.creative_id", ondelete="CASCADE"), nullable=False
+    )
+    # Notification settings captured at enqueue time
+    webhook_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    slack_webhook_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    principal_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    # Queue state: "pending", "in_flight", "completed", "failed"
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    attempt_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    locked_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Review outcome from _ai_review_creative_impl (status, reason, confidence, ...)
+    result: Mapped[dict | None] = mapped_column(JSONType, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("idx_creative_review_jobs_due", "status", "next_attempt_at"),
+        Index("idx_creative_review_jobs_tenant", "tenant_id", "status"),
+        Index("idx_creative_review_jobs_creative", "creative_id"),
+    )
+
+
+class IdempotencyRecord(Base):
+    """Stored outcome of a mutating tool call, keyed by its idempotency key.
+
+    Written by src/services/idempotency.py around create_media_buy, update_media_buy
+    and sync_creatives: the first call claims the row ("in_progress" with a lease),
+    concurrent duplicates wait for it to finish and retries get the stored response.
+    """
+
+    __tablename__ = "idempotency_records"
+
+    tenant_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("tenants.tenant_id", ondelete="CASCADE"), primary_key=True
+    )
+    principal_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    tool_name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    idempotency_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # SHA-256 of the request arguments; a key reused with different arguments is rejected
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # "in_progress" or "completed"
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    response: Mapped[dict | None] = mapped_column(JSONType, nullable=True)
+    # Lease of the executing call; an expired in-progress lease can be taken over
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (Index("idx_idempotency_records_expires", "expires_at"),)
+
+
+class TenantDailyRevenue(Base):
+    """Daily revenue rollup per tenant for the admin dashboard.
+
+    Maintained incrementally from media_buys (src/services/revenue_rollup_service.py):
+    revenue is the sum of live/completed media buy budgets prorated over their flights.
+    """
+
+    __tablename__ = "tenant_daily_revenue"
+
+    tenant_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("tenants.tenant_id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    revenue: Mapped[Decimal] = mapped_column(DECIMAL(18, 4), nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+@event.listens_for(MediaBuy, "after_insert")
+@event.listens_for(MediaBuy, "after_update")
+def _refresh_revenue_rollup_on_write(mapper, connection, target):
+    from src.services.revenue_rollup_service import refresh_rollup_for_media_buy
+
+    refresh_rollup_for_media_buy(connection, target)
+
+
+@event.listens_for(MediaBuy, "after_delete")
+def _refresh_revenue_rollup_on_delete(mapper, connection, target):
+    from src.services.revenue_rollup_service import refresh_rollup_for_media_buy
+
+    refresh_rollup_for_media_buy(connection, target, require_change=False)
+
+
+@event.listens_for(AuditLog, "after_insert")
+def _notify_activity_stream(mapper, connection, target):
+    from src.services.activity_stream_hub import ACTIVITY_CHANNEL, notification_payload
+
+    # Delivered to activity stream listeners when the transaction commits
+    connection.execute(select(func.pg_notify(ACTIVITY_CHANNEL, notification_payload(target.tenant_id, target.log_id))))
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_media_buy_readiness(session, flush_context):
+    from src.admin.services.media_buy_readiness_service import refresh_readiness_after_flush
+
+    refresh_readiness_after_flush(session, flush_context)
@@ -11,9 +11,24 @@ from src.adapters.triton_digital import TritonDigital
 from src.core.config_loader import get_current_tenant
 from src.core.database.database_session import get_db_session
 from src.core.database.models import AdapterConfig
+from src.core.request_scope import memoize
 from src.core.schemas import Principal
 
 
+def get_tenant_adapter_config(tenant_id: str) -> AdapterConfig | None:
+    """Get the tenant's AdapterConfig row, memoized for the current tool call.
+
+    The row is detached from its session; read its columns but do not modify it.
+    """
+
+    def _load() -> AdapterConfig | None:
+        with get_db_session() as session:
+            stmt = select(AdapterConfig).filter_by(tenant_id=tenant_id)
+            return session.scalars(stmt).first()
+
+    return memoize(("adapter_config", tenant_id), _load)
+
+
 def get_adapter(
     principal: Principal, dry_run: bool = False, testing_context: Any = None
 ) -> MockAdServerAdapter | GoogleAdManager | Kevel | TritonDigital:
@@ -28,70 +43,66 @@ def get_adapter(
     logger.info(f"[ADAPTER_SELECT] Initial selected_adapter from tenant.ad_server: {selected_adapter}")
 
     # Get adapter config from adapter_config table
-    with get_db_session() as session:
-        stmt = select(AdapterConfig).filter_by(tenant_id=tenant["tenant_id"])
-        config_row = session.scalars(stmt).first()
-
-        adapter_config: dict[str, Any] = {"enabled": True}
-        if config_row:
-            adapter_type = config_row.adapter_type
-            logger.info(f"[ADAPTER_SELECT] adapter_type from AdapterConfig: {adapter_type}")
-            # Use adapter_type from AdapterConfig as the source of truth
-            if adapter_type:
-                selected_adapter = adapter_type
-                logger.info(f"[ADAPTER_SELECT] Using AdapterConfig.adapter_type: {selected_adapter}")
-            if adapter_type == "mock":
-                adapter_config["dry_run"] = config_row.mock_dry_run or False
-                # Default to True (require approval) for safety
-                adapter_config["manual_approval_required"] = (
-                    config_row.mock_manual_approval_required
-                    if config_row.mock_manual_approval_required is not None
-                    else True
-                )
-            elif adapter_type == "google_ad_manager":
-                adapter_config["network_code"] = config_row.gam_network_code or ""
-                adapter_config["refresh_token"] = config_row.gam_refresh_token or ""
-                adapter_config["trafficker_id"] = config_row.gam_trafficker_id or ""
-                # Default to True (require approval) for safety
-                adapter_config["manual_approval_required"] = (
-                    config_row.gam_manual_approval_required
-                    if config_row.gam_manual_approval_required is not None
-                    else True
-                )
+    config_row = get_tenant_adapter_config(tenant["tenant_id"])
+
+    adapter_config: dict[str, Any] = {"enabled": True}
+    if config_row:
+        adapter_type = config_row.adapter_type
+        logger.info(f"[ADAPTER_SELECT] adapter_type from AdapterConfig: {adapter_type}")
+        # Use adapter_type from AdapterConfig as the source of truth
+        if adapter_type:
+            selected_adapter = adapter_type
+            logger.info(f"[ADAPTER_SELECT] Using AdapterConfig.adapter_type: {selected_adapter}")
+        if adapter_type == "mock":
+            adapter_config["dry_run"] = config_row.mock_dry_run or False
+            # Default to True (require approval) for safety
+            adapter_config["manual_approval_required"] = (
+                config_row.mock_manual_approval_required
+                if config_row.mock_manual_approval_required is not None
+                else True
+            )
+        elif adapter_type == "google_ad_manager":
+            adapter_config["network_code"] = config_row.gam_network_code or ""
+            adapter_config["refresh_token"] = config_row.gam_refresh_token or ""
+            adapter_config["trafficker_id"] = config_row.gam_trafficker_id or ""
+            # Default to True (require approval) for safety
+            adapter_config["manual_approval_required"] = (
+                config_row.gam_manual_approval_required if config_row.gam_manual_approval_required is not None else True
+            )
 
-                # Get advertiser_id from principal's platform_mappings (per-principal, not tenant-level)
-                # Support both old format (nested under "google_ad_manager") and new format (root "gam_advertiser_id")
-                advertiser_id: str | None = None
-                if principal.platform_mappings:
-                    # Try nested format first
-                    gam_mappings = principal.platform_mappings.get("google_ad_manager", {})
-                    advertiser_id = gam_mappings.get("advertiser_id")
-                    logger.info(
-                        f"[ADAPTER_CONFIG] principal_id={principal.principal_id}, platform_mappings={principal.platform_mappings}, gam_mappings={gam_mappings}, advertiser_id={advertiser_id}"
-                    )
-
-                    # Fall back to root-level format if nested not found
-                    if not advertiser_id:
-                        advertiser_id = principal.platform_mappings.get("gam_advertiser_id")
-                        logger.info(f"[ADAPTER_CONFIG] Fell back to root-level gam_advertiser_id: {advertiser_id}")
-
-                    adapter_config["company_id"] = advertiser_id
-                    logger.info(f"[ADAPTER_CONFIG] Set adapter_config['company_id']={advertiser_id}")
-                else:
-                    adapter_config["company_id"] = None
-                    logger.info("[ADAPTER_CONFIG] principal.platform_mappings is None/empty, set company_id=None")
-            elif adapter_type == "kevel":
-                adapter_config["network_id"] = config_row.kevel_network_id or ""
-                adapter_config["api_key"] = config_row.kevel_api_key or ""
-                # Default to True (require approval) for safety
-                adapter_config["manual_approval_required"] = (
-                    config_row.kevel_manual_approval_required
-                    if config_row.kevel_manual_approval_required is not None
-                    else True
+            # Get advertiser_id from principal's platform_mappings (per-principal, not tenant-level)
+            # Support both old format (nested under "google_ad_manager") and new format (root "gam_advertiser_id")
+            advertiser_id: str | None = None
+            if principal.platform_mappings:
+                # Try nested format first
+                gam_mappings = principal.platform_mappings.get("google_ad_manager", {})
+                advertiser_id = gam_mappings.get("advertiser_id")
+                logger.info(
+                    f"[ADAPTER_CONFIG] principal_id={principal.principal_id}, platform_mappings={principal.platform_mappings}, gam_mappings={gam_mappings}, advertiser_id={advertiser_id}"
                 )
-            elif adapter_type == "triton":
-                adapter_config["station_id"] = config_row.triton_station_id or ""
-                adapter_config["api_key"] = config_row.triton_api_key or ""
+
+                # Fall back to root-level format if nested not found
+                if not advertiser_id:
+                    advertiser_id = principal.platform_mappings.get("gam_advertiser_id")
+                    logger.info(f"[ADAPTER_CONFIG] Fell back to root-level gam_advertiser_id: {advertiser_id}")
+
+                adapter_config["company_id"] = advertiser_id
+                logger.info(f"[ADAPTER_CONFIG] Set adapter_config['company_id']={advertiser_id}")
+            else:
+                adapter_config["company_id"] = None
+                logger.info("[ADAPTER_CONFIG] principal.platform_mappings is None/empty, set company_id=None")
+        elif adapter_type == "kevel":
+            adapter_config["network_id"] = config_row.kevel_network_id or ""
+            adapter_config["api_key"] = config_row.kevel_api_key or ""
+            # Default to True (require approval) for safety
+            adapter_config["manual_approval_required"] = (
+                config_row.kevel_manual_approval_required
+                if config_row.kevel_manual_approval_required is not None
+                else True
+            )
+        elif adapter_type == "triton":
+            adapter_config["station_id"] = config_row.triton_station_id or ""
+            adapter_config["api_key"] = config_row.triton_api_key or ""
 
     if not selected_adapter:
         # Default to mock if no adapter specified
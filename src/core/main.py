@@ -135,8 +135,117 @@ async def lifespan_context(app):
     except Exception as e:
         logger.error(f"Failed to start media buy status scheduler: {e}", exc_info=True)
 
+    # Startup: Initialize webhook outbox dispatcher
+    from src.services.webhook_outbox import start_webhook_outbox_dispatcher
+
+    logger.info("Starting webhook outbox dispatcher...")
+    try:
+        await start_webhook_outbox_dispatcher()
+        logger.info("✅ Webhook outbox dispatcher started")
+    except Exception as e:
+        logger.error(f"Failed to start webhook outbox dispatcher: {e}", exc_info=True)
+
+    # Startup: Initialize creative review worker pool
+    from src.services.creative_review_queue import start_creative_review_worker_pool
+
+    logger.info("Starting creative review worker pool...")
+    try:
+        await start_creative_review_worker_pool()
+        logger.info("✅ Creative review worker pool started")
+    except Exception as e:
+        logger.error(f"Failed to start creative review worker pool: {e}", exc_info=True)
+
+    # Startup: Keep future audit_logs partitions created
+    from src.services.audit_log_partitions import start_audit_log_partition_scheduler
+
+    logger.info("Starting audit log partition scheduler...")
+    try:
+        await start_audit_log_partition_scheduler()
+        logger.info("✅ Audit log partition scheduler started")
+    except Exception as e:
+        logger.error(f"Failed to start audit log partition scheduler: {e}", exc_info=True)
+
+    # Startup: Keep local delivery facts synced from the ad servers
+    from src.services.delivery_facts import start_delivery_sync_scheduler
+
+    logger.info("Starting delivery sync scheduler...")
+    try:
+        await start_delivery_sync_scheduler()
+        logger.info("✅ Delivery sync scheduler started")
+    except Exception as e:
+        logger.error(f"Failed to start delivery sync scheduler: {e}", exc_info=True)
+
+    # Startup: Run scheduled tenant syncs (inventory, orders, format metrics)
+    from src.services.sync_orchestrator import start_sync_orchestrator
+
+    logger.info("Starting sync orchestrator...")
+    try:
+        await start_sync_orchestrator()
+        logger.info("✅ Sync orchestrator started")
+    except Exception as e:
+        logger.error(f"Failed to start sync orchestrator: {e}", exc_info=True)
+
+    # Startup: Sample event loop lag for the /metrics endpoint
+    import asyncio
+
+    from src.core.metrics import monitor_event_loop_lag
+
+    loop_lag_task = asyncio.create_task(monitor_event_loop_lag("mcp"))
+
     yield
 
+    loop_lag_task.cancel()
+
+    # Shutdown: Stop sync orchestrator
+    from src.services.sync_orchestrator import stop_sync_orchestrator
+
+    logger.info("Stopping sync orchestrator...")
+    try:
+        await stop_sync_orchestrator()
+        logger.info("✅ Sync orchestrator stopped")
+    except Exception as e:
+        logger.error(f"Failed to stop sync orchestrator: {e}", exc_info=True)
+
+    # Shutdown: Stop delivery sync scheduler
+    from src.services.delivery_facts import stop_delivery_sync_scheduler
+
+    logger.info("Stopping delivery sync scheduler...")
+    try:
+        await stop_delivery_sync_scheduler()
+        logger.info("✅ Delivery sync scheduler stopped")
+    except Exception as e:
+        logger.error(f"Failed to stop delivery sync scheduler: {e}", exc_info=True)
+
+    # Shutdown: Stop audit log partition scheduler
+    from src.services.audit_log_partitions import stop_audit_log_partition_scheduler
+
+    logger.info("Stopping audit log partition scheduler...")
+    try:
+        await stop_audit_log_partition_scheduler()
+        logger.info("✅ Audit log partition scheduler stopped")
+    except Exception as e:
+        logger.error(f"Failed to stop audit log partition scheduler: {e}", exc_info=True)
+
+    # Shutdown: Stop creative review worker pool
+    from src.services.creative_review_queue import stop_creative_review_worker_pool
+
+    logger.info("Stopping creative review worker pool...")
+    try:
+        await stop_creative_review_worker_pool()
+        logger.info("✅ Creative review worker pool stopped")
+    except Exception as e:
+        logger.error(f"Failed to stop creative review worker pool: {e}", exc_info=True)
+
+    # Shutdown: Stop webhook outbox dispatcher
+    from src.services.webhook_outbox import stop_webhook_outbox_dispatcher
+
+    logger.info("Stopping webhook outbox dispatcher...")
+    try:
+        await stop_webhook_outbox_dispatcher()
+        logger.info("✅ Webhook outbox dispatcher stopped")
+    except Exception as e:
+        logger.error(f"Failed to stop webhook outbox dispatcher: {e}", exc_info=True)
+
     # Shutdown: Stop media buy status scheduler
     from src.services.media_buy_status_scheduler import stop_media_buy_status_scheduler
 
@@ -335,6 +444,24 @@ async def health(request: Request):
     return JSONResponse({"status": "healthy", "service": "mcp"})
 
 
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request):
+    """Prometheus metrics endpoint (tool latency, DB queries, adapter calls)."""
+    from starlette.responses import Response
+
+    from src.core.metrics import METRICS_CONTENT_TYPE, get_metrics_text
+
+    return Response(get_metrics_text(), media_type=METRICS_CONTENT_TYPE)
+
+
+@mcp.custom_route("/debug/profiler", methods=["GET", "POST"])
+async def debug_profiler(request: Request):
+    """Start, stop and read the sampling profiler (requires ADCP_PROFILING_ENABLED=true)."""
+    from src.core.profiling import profiler_endpoint
+
+    return await profiler_endpoint(request)
+
+
 @mcp.custom_route("/admin/reset-db-pool", methods=["POST"])
 async def reset_db_pool(request: Request):
     """Reset database connection pool after external data changes.
@@ -8,6 +8,7 @@ Provides centralized:
 - Context persistence with database
 - Conversation history management
 - Response enhancement with context_id
+- Request scope for memoized tenant/principal/adapter lookups
 
 Note: Error logging is handled separately by the with_error_logging decorator
 in tool_error_logging.py to avoid duplicate logging.
@@ -28,6 +29,7 @@ from rich.console import Console
 
 from src.core.config_loader import set_current_tenant
 from src.core.context_manager import get_context_manager
+from src.core.request_scope import request_scope, seed_request_cache
 from src.core.testing_hooks import get_testing_context
 from src.core.tool_context import ToolContext
 
@@ -98,32 +100,34 @@ class MCPContextWrapper:
                 # No context found, call original function
                 return await tool_func(*args, **kwargs)
 
-            # Create ToolContext
-            tool_context = self._create_tool_context(fastmcp_context, tool_func.__name__)
+            # Memoize tenant/principal/adapter lookups for the rest of this call
+            with request_scope(tool_func.__name__):
+                # Create ToolContext
+                tool_context = self._create_tool_context(fastmcp_context, tool_func.__name__)
 
-            # Replace FastMCP context with ToolContext in arguments
-            args, kwargs = self._replace_context_in_args(args, kwargs, tool_context)
+                # Replace FastMCP context with ToolContext in arguments
+                args, kwargs = self._replace_context_in_args(args, kwargs, tool_context)
 
-            # Track start time
-            start_time = time.time()
+                # Track start time
+                start_time = time.time()
 
-            try:
-                # Call the original function with ToolContext
-                result = await tool_func(*args, **kwargs)
+                try:
+                    # Call the original function with ToolContext
+                    result = await tool_func(*args, **kwargs)
 
-                # Update conversation history
-                self._update_conversation_history(tool_context, result)
+                    # Update conversation history
+                    self._update_conversation_history(tool_context, result)
 
-                # Enhance response with context_id at protocol layer
-                result = self._enhance_response(result, tool_context)
+                    # Enhance response with context_id at protocol layer
+                    result = self._enhance_response(result, tool_context)
 
-                return result
+                    return result
 
-            finally:
-                # Log activity timing
-                # Note: Error logging is handled by with_error_logging decorator
-                elapsed = time.time() - start_time
-                console.print(f"[dim]Tool {tool_func.__name__} completed in {elapsed:.2f}s[/dim]")
+                finally:
+                    # Log activity timing
+                    # Note: Error logging is handled by with_error_logging decorator
+                    elapsed = time.time() - start_time
+                    console.print(f"[dim]Tool {tool_func.__name__} completed in {elapsed:.2f}s[/dim]")
 
         return wrapper
 
@@ -138,32 +142,34 @@ class MCPContextWrapper:
                 # No context found, call original function
                 return tool_func(*args, **kwargs)
 
-            # Create ToolContext
-            tool_context = self._create_tool_context(fastmcp_context, tool_func.__name__)
+            # Memoize tenant/principal/adapter lookups for the rest of this call
+            with request_scope(tool_func.__name__):
+                # Create ToolContext
+                tool_context = self._create_tool_context(fastmcp_context, tool_func.__name__)
 
-            # Replace FastMCP context with ToolContext in arguments
-            args, kwargs = self._replace_context_in_args(args, kwargs, tool_context)
+                # Replace FastMCP context with ToolContext in arguments
+                args, kwargs = self._replace_context_in_args(args, kwargs, tool_context)
 
-            # Track start time
-            start_time = time.time()
+                # Track start time
+                start_time = time.time()
 
-            try:
-                # Call the original function with ToolContext
-                result = tool_func(*args, **kwargs)
+                try:
+                    # Call the original function with ToolContext
+                    result = tool_func(*args, **kwargs)
 
-                # Update conversation history
-                self._update_conversation_history(tool_context, result)
+                    # Update conversation history
+                    self._update_conversation_history(tool_context, result)
 
-                # Enhance response with context_id at protocol layer
-                result = self._enhance_response(result, tool_context)
+                    # Enhance response with context_id at protocol layer
+                    result = self._enhance_response(result, tool_context)
 
-                return result
+                    return result
 
-            finally:
-                # Log activity timing
-                # Note: Error logging is handled by with_error_logging decorator
-                elapsed = time.time() - start_time
-                console.print(f"[dim]Tool {tool_func.__name__} completed in {elapsed:.2f}s[/dim]")
+                finally:
+                    # Log activity timing
+                    # Note: Error logging is handled by with_error_logging decorator
+                    elapsed = time.time() - start_time
+                    console.print(f"[dim]Tool {tool_func.__name__} completed in {elapsed:.2f}s[/dim]")
 
         return wrapper
 
@@ -221,6 +227,7 @@ class MCPContextWrapper:
 
         # Set the tenant context in the ContextVar
         set_current_tenant(tenant)
+        seed_request_cache(("tenant", tenant["tenant_id"]), tenant)
 
         # Extract or generate context_id
         headers = fastmcp_context.meta.get("headers", {}) if hasattr(fastmcp_context, "meta") else {}
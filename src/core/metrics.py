@@ -1,6 +1,16 @@
-"""Prometheus metrics for monitoring AI review and webhook operations."""
+"""Prometheus metrics for monitoring AI review, webhook, tool call and adapter operations."""
 
-from prometheus_client import REGISTRY, Counter, Gauge, Histogram, generate_latest
+import asyncio
+import functools
+import inspect
+import time
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
 
 # AI Review Metrics
 ai_review_total = Counter(
@@ -29,6 +39,19 @@ ai_review_confidence = Histogram(
     buckets=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
 )
 
+ai_review_queue_wait = Histogram(
+    "ai_review_queue_wait_seconds",
+    "Time AI review jobs wait in the queue before a worker picks them up",
+    buckets=[0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0],
+)
+
+ai_review_rate_limit_wait = Histogram(
+    "ai_review_rate_limit_wait_seconds",
+    "Time AI reviews wait for the provider rate limit",
+    ["provider"],
+    buckets=[0.0, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0],
+)
+
 # Webhook Metrics
 webhook_delivery_total = Counter(
     "webhook_delivery_total",
@@ -64,6 +87,167 @@ webhook_queue_size = Gauge(
 )
 
 
+# Tool call metrics (MCP tools and A2A skills, recorded when the request scope closes)
+tool_call_duration = Histogram(
+    "tool_call_duration_seconds",
+    "Tool call latency in seconds",
+    ["tool", "protocol", "status"],
+    buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+tool_call_db_queries = Histogram(
+    "tool_call_db_queries",
+    "Database round trips per tool call",
+    ["tool", "protocol"],
+    buckets=[0, 1, 2, 5, 10, 20, 50, 100, 250],
+)
+
+tool_call_db_seconds = Histogram(
+    "tool_call_db_seconds",
+    "Time spent in database round trips per tool call",
+    ["tool", "protocol"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+)
+
+db_query_duration = Histogram(
+    "db_query_duration_seconds",
+    "Latency of individual database statements in seconds",
+    buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0],
+)
+
+# get_products pipeline metrics
+get_products_stage_duration = Histogram(
+    "get_products_stage_duration_seconds",
+    "Duration of each get_products pipeline stage in seconds",
+    ["stage"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
+
+get_products_degraded = Counter(
+    "get_products_degraded_total",
+    "get_products stages skipped or deferred because the latency budget ran out",
+    ["stage"],
+)
+
+# Adapter metrics
+adapter_call_duration = Histogram(
+    "adapter_call_duration_seconds",
+    "Ad server adapter method latency in seconds",
+    ["adapter", "method", "status"],
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+)
+
+# Signals agent metrics
+signals_cache_requests = Counter(
+    "signals_cache_requests_total",
+    "Signals agent queries by cache outcome (hit, miss, coalesced)",
+    ["result"],
+)
+
+dynamic_variants_deferred = Counter(
+    "dynamic_variants_deferred_total",
+    "get_products calls that exceeded the dynamic variant latency budget",
+    ["tenant_id"],
+)
+
+# Policy check metrics
+policy_decision_cache_requests = Counter(
+    "policy_decision_cache_requests_total",
+    "AI policy decisions by cache outcome (memory_hit, db_hit, miss, coalesced)",
+    ["result"],
+)
+
+# Product ranking metrics
+product_ranking_cache_requests = Counter(
+    "product_ranking_cache_requests_total",
+    "AI product rankings by cache outcome (hit, miss, coalesced)",
+    ["result"],
+)
+
+product_ranking_chunks = Histogram(
+    "product_ranking_chunks",
+    "Parallel ranking calls per uncached product ranking",
+    buckets=(1, 2, 4, 8, 16, 32),
+)
+
+event_loop_lag = Gauge(
+    "event_loop_lag_seconds",
+    "Delay between when a periodic event loop callback was due and when it ran",
+    ["server"],
+)
+
+
+def observe_tool_call(
+    tool: str, protocol: str, status: str, duration: float, db_queries: int, db_seconds: float
+) -> None:
+    """Record latency and database usage for one tool call."""
+    tool_call_duration.labels(tool=tool, protocol=protocol, status=status).observe(duration)
+    tool_call_db_queries.labels(tool=tool, protocol=protocol).observe(db_queries)
+    tool_call_db_seconds.labels(tool=tool, protocol=protocol).observe(db_seconds)
+
+
+# Wrappers made by instrument_adapter_call, so re-decorating (e.g. an inherited method) is a no-op
+_instrumented_adapter_calls: "weakref.WeakSet[Callable[..., Any]]" = weakref.WeakSet()
+
+
+def instrument_adapter_call(adapter: str, method: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator recording adapter_call_duration_seconds for a sync or async adapter method."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if func in _instrumented_adapter_calls:
+            return func
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                status = "error"
+                try:
+                    result = await func(*args, **kwargs)
+                    status = "success"
+                    return result
+                finally:
+                    adapter_call_duration.labels(adapter=adapter, method=method, status=status).observe(
+                        time.perf_counter() - start
+                    )
+
+            _instrumented_adapter_calls.add(async_wrapper)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            status = "error"
+            try:
+                result = func(*args, **kwargs)
+                status = "success"
+                return result
+            finally:
+                adapter_call_duration.labels(adapter=adapter, method=method, status=status).observe(
+                    time.perf_counter() - start
+                )
+
+        _instrumented_adapter_calls.add(wrapper)
+        return wrapper
+
+    return decorator
+
+
+async def monitor_event_loop_lag(server: str, interval: float = 1.0) -> None:
+    """Sample event loop lag until cancelled.
+
+    A blocking call on the loop (synchronous DB or adapter I/O) delays every
+    coroutine; the gap between the requested and actual sleep exposes it.
+    """
+    loop = asyncio.get_running_loop()
+    gauge = event_loop_lag.labels(server=server)
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        gauge.set(max(0.0, loop.time() - start - interval))
+
+
 def get_metrics_text() -> str:
     """Return current metrics in Prometheus text format."""
     return generate_latest(REGISTRY).decode("utf-8")
@@ -0,0 +1,177 @@
+"""Runtime-toggleable sampling profiler.
+
+Samples the Python stacks of every thread at a fixed interval and aggregates them
+in collapsed-stack format (``frame;frame;frame count``), which flamegraph.pl and
+speedscope load directly. Sampling happens in a daemon thread via
+``sys._current_frames()``, so it needs no extra dependency and costs nothing
+while stopped.
+
+Both servers expose it at ``/debug/profiler`` when ``ADCP_PROFILING_ENABLED=true``:
+
+    POST /debug/profiler {"action": "start", "interval": 0.005, "max_seconds": 60}
+    GET  /debug/profiler          -> status and collapsed stacks
+    POST /debug/profiler {"action": "stop"}
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 0.01
+DEFAULT_MAX_SECONDS = 60.0
+MAX_STACK_DEPTH = 64
+
+
+class SamplingProfiler:
+    """Collects collapsed stack samples from all threads until stopped or max_seconds elapse."""
+
+    def __init__(self):
+        self._stacks: Counter[str] = Counter()
+        self._samples = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at: float | None = None
+        self.interval = DEFAULT_INTERVAL_SECONDS
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval: float = DEFAULT_INTERVAL_SECONDS, max_seconds: float = DEFAULT_MAX_SECONDS) -> bool:
+        """Start sampling. Returns False if the profiler is already running."""
+        with self._lock:
+            if self.is_running:
+                return False
+            self.interval = max(interval, 0.001)
+            self._stop_event.clear()
+            self._started_at = time.monotonic()
+            self._thread = threading.Thread(
+                target=self._run, args=(max_seconds,), name="sampling-profiler", daemon=True
+            )
+            self._thread.start()
+        logger.info(f"Sampling profiler started (interval={self.interval}s, max={max_seconds}s)")
+        return True
+
+    def stop(self) -> None:
+        """Stop sampling; collected stacks are kept until reset()."""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        logger.info(f"Sampling profiler stopped ({self._samples} samples)")
+
+    def reset(self) -> None:
+        """Discard collected samples."""
+        with self._lock:
+            self._stacks.clear()
+            self._samples = 0
+
+    def status(self) -> dict:
+        return {
+            "running": self.is_running,
+            "interval": self.interval,
+            "samples": self._samples,
+            "unique_stacks": len(self._stacks),
+            "elapsed_seconds": round(time.monotonic() - self._started_at, 3) if self._started_at else 0.0,
+        }
+
+    def collapsed_stacks(self) -> str:
+        """Return samples in collapsed-stack format, most frequent first."""
+        with self._lock:
+            items = self._stacks.most_common()
+        return "\n".join(f"{stack} {count}" for stack, count in items)
+
+    def sample(self) -> None:
+        """Record one sample of every thread except the profiler itself."""
+        own_ident = threading.get_ident()
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        collected = []
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            frames: list[str] = []
+            current: FrameType | None = frame
+            while current is not None and len(frames) < MAX_STACK_DEPTH:
+                code = current.f_code
+                frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{current.f_lineno})")
+                current = current.f_back
+            frames.append(thread_names.get(ident, str(ident)))
+            collected.append(";".join(reversed(frames)))
+
+        with self._lock:
+            self._stacks.update(collected)
+            self._samples += 1
+
+    def _run(self, max_seconds: float) -> None:
+        deadline = time.monotonic() + max_seconds
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+            if time.monotonic() >= deadline:
+                logger.info("Sampling profiler reached max_seconds, stopping")
+                break
+
+
+# Global profiler instance
+_profiler: SamplingProfiler | None = None
+
+
+def get_sampling_profiler() -> SamplingProfiler:
+    """Get or create the global sampling profiler."""
+    global _profiler
+    if _profiler is None:
+        _profiler = SamplingProfiler()
+    return _profiler
+
+
+def profiling_enabled() -> bool:
+    """Profiler endpoints are disabled unless ADCP_PROFILING_ENABLED=true."""
+    return os.getenv("ADCP_PROFILING_ENABLED", "").lower() == "true"
+
+
+async def profiler_endpoint(request: Request) -> Response:
+    """Starlette handler shared by the MCP and A2A servers for /debug/profiler."""
+    if not profiling_enabled():
+        return JSONResponse({"error": "Profiling is disabled (set ADCP_PROFILING_ENABLED=true)"}, status_code=403)
+
+    profiler = get_sampling_profiler()
+
+    if request.method == "GET":
+        if request.query_params.get("format") == "collapsed":
+            return PlainTextResponse(profiler.collapsed_stacks())
+        return JSONResponse({**profiler.status(), "stacks": profiler.collapsed_stacks().splitlines()[:50]})
+
+    try:
+        body = await request.json()
+    except ValueError:
+        body = {}
+    action = body.get("action")
+
+    if action == "start":
+        try:
+            interval = float(body.get("interval", DEFAULT_INTERVAL_SECONDS))
+            max_seconds = float(body.get("max_seconds", DEFAULT_MAX_SECONDS))
+        except (TypeError, ValueError):
+            return JSONResponse({"error": "interval and max_seconds must be numbers"}, status_code=400)
+        if body.get("reset", True):
+            profiler.reset()
+        if not profiler.start(interval=interval, max_seconds=max_seconds):
+            return JSONResponse({"error": "Profiler is already running"}, status_code=409)
+        return JSONResponse(profiler.status())
+    if action == "stop":
+        profiler.stop()
+        return JSONResponse(profiler.status())
+    if action == "reset":
+        profiler.reset()
+        return JSONResponse(profiler.status())
+
+    return JSONResponse({"error": "action must be one of: start, stop, reset"}, status_code=400)
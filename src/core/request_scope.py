@@ -0,0 +1,163 @@
+"""Request-scoped memoization for tool calls.
+
+A single MCP or A2A tool call resolves the same tenant, principal and adapter
+configuration several times (authentication, get_principal_object, get_adapter,
+AuditLogger, adapter managers). Each lookup used to be its own database round
+trip. A RequestScope is opened once at the protocol boundary and lives for the
+duration of the tool call; lookups go through memoize() so repeated calls within
+the request are served from memory.
+
+Outside a request scope (CLI scripts, background jobs, admin UI, unit tests)
+memoize() simply calls the loader, so behaviour is unchanged.
+
+The scope also counts and times database round trips (fed by SQLAlchemy cursor
+events registered in database_session.get_engine). When the scope closes the
+tool latency, status and database usage are recorded in the tool_call_*
+Prometheus histograms (src/core/metrics.py) and logged at DEBUG level, so query
+regressions in a tool are visible.
+
+Memoized values are shared by every caller in the request and must be treated
+as read-only. ORM rows are detached from their session; only read already
+loaded column attributes.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from src.core.metrics import observe_tool_call
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestScope:
+    """Per-request memo table and database round-trip counter."""
+
+    def __init__(self, tool_name: str, protocol: str = "mcp"):
+        self.tool_name = tool_name
+        self.protocol = protocol
+        self.started_at = time.perf_counter()
+        self.db_query_count = 0
+        self.db_query_seconds = 0.0
+        self.memo_hits = 0
+        self._memo: dict[Hashable, Any] = {}
+        # asyncio.to_thread copies the context, so worker threads share this scope
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Return the memoized value for ``key``, calling ``loader`` on first use."""
+        with self._lock:
+            if key in self._memo:
+                self.memo_hits += 1
+                return self._memo[key]
+
+        value = loader()
+
+        with self._lock:
+            # Keep the first stored value if another thread loaded concurrently
+            return self._memo.setdefault(key, value)
+
+    def seed(self, key: Hashable, value: Any) -> None:
+        """Store a value that was resolved outside memoize() (e.g. during authentication)."""
+        with self._lock:
+            self._memo[key] = value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a memoized value after the caller changed the underlying row."""
+        with self._lock:
+            self._memo.pop(key, None)
+
+    def record_db_query(self, duration: float = 0.0) -> None:
+        """Count one database round trip and the time it took."""
+        with self._lock:
+            self.db_query_count += 1
+            self.db_query_seconds += duration
+
+
+_current_scope: ContextVar[RequestScope | None] = ContextVar("request_scope", default=None)
+
+
+def get_request_scope() -> RequestScope | None:
+    """Get the active request scope, if any."""
+    return _current_scope.get()
+
+
+@contextmanager
+def request_scope(tool_name: str, protocol: str = "mcp") -> Iterator[RequestScope]:
+    """Open a request scope for a tool call.
+
+    Nested calls reuse the outer scope, so wrapping the same call at several
+    layers (protocol boundary, error logging, context wrapper) is harmless.
+
+    Args:
+        tool_name: Tool or skill name, used as the metrics label and in the debug summary
+        protocol: "mcp" or "a2a"
+
+    Yields:
+        The active RequestScope
+    """
+    existing = _current_scope.get()
+    if existing is not None:
+        yield existing
+        return
+
+    scope = RequestScope(tool_name, protocol)
+    token = _current_scope.set(scope)
+    status = "error"
+    try:
+        yield scope
+        status = "success"
+    finally:
+        _current_scope.reset(token)
+        elapsed = time.perf_counter() - scope.started_at
+        try:
+            observe_tool_call(
+                scope.tool_name, scope.protocol, status, elapsed, scope.db_query_count, scope.db_query_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record tool call metrics for {scope.tool_name}: {e}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[REQUEST_SCOPE] {scope.tool_name}: {scope.db_query_count} DB round trips "
+                f"({scope.db_query_seconds * 1000:.1f}ms), {scope.memo_hits} memoized lookups reused, "
+                f"{elapsed * 1000:.1f}ms"
+            )
+
+
+def memoize(key: Hashable, loader: Callable[[], T]) -> T:
+    """Memoize ``loader()`` under ``key`` for the current request.
+
+    Keys are tuples namespaced by entity, e.g. ``("principal", tenant_id, principal_id)``.
+    Without an active request scope the loader is called every time.
+    """
+    scope = _current_scope.get()
+    if scope is None:
+        return loader()
+    return scope.get_or_load(key, loader)
+
+
+def seed_request_cache(key: Hashable, value: Any) -> None:
+    """Store an already-resolved value in the current request scope (no-op outside a scope)."""
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.seed(key, value)
+
+
+def invalidate_request_cache(key: Hashable) -> None:
+    """Drop a memoized value from the current request scope (no-op outside a scope)."""
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.invalidate(key)
+
+
+def record_db_query(duration: float = 0.0) -> None:
+    """Count a database round trip against the current request scope, if any."""
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.record_db_query(duration)
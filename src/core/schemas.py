@@ -3030,6 +3030,44 @@ class AdapterGetMediaBuyDeliveryResponse(NestedModelSerializerMixin, AdCPBaseMod
     daily_breakdown: list[dict] | None = None  # Optional day-by-day delivery metrics
 
 
+class AdapterDeliveryFact(BaseModel):
+    """Delivery of one media buy package over a day (hour=-1) or one hour of it."""
+
+    media_buy_id: str
+    package_id: str = ""  # Empty when the ad server row maps to no package
+    day: date
+    hour: int = Field(-1, ge=-1, le=23)
+    impressions: int
+    clicks: int = 0
+    spend: float
+    video_completions: int | None = None
+
+
+class AdapterDeliveryFacts(BaseModel):
+    """Response from adapter's get_delivery_facts method"""
+
+    facts: list[AdapterDeliveryFact]
+    # Facts are complete for start_date (inclusive) up to data_valid_until
+    start_date: date
+    data_valid_until: datetime
+
+
+class AdapterPackageUpdate(BaseModel):
+    """One package change passed to adapter's update_packages method"""
+
+    package_id: str
+    action: Literal["pause_package", "resume_package", "update_package_budget"]
+    budget: float | None = None  # Required for update_package_budget
+
+
+class AdapterPackageUpdateResult(BaseModel):
+    """Outcome of one AdapterPackageUpdate; error is None when the change was applied"""
+
+    package_id: str
+    action: str
+    error: Error | None = None
+
+
 # --- Human-in-the-Loop Task Queue ---
 
 
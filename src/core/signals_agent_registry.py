@@ -15,6 +15,13 @@ Schema Version: AdCP v2.2.0
 - Uses deliver_to.platforms as array of strings ["all"] (not single string "all")
 - Supports custom auth headers via auth_header parameter
 
+Caching:
+- get_signals() responses are cached per tenant, keyed by the normalized brief
+  and deployment context, for SIGNALS_CACHE_TTL_SECONDS (default 60s)
+- Concurrent identical queries share one upstream fan-out (single-flight)
+- Responses with a failed agent are not cached, so a transient outage is retried
+- Agent config edits in the admin UI take effect once the TTL expires
+
 Security:
 - Auth credentials stored in database (tenant-specific)
 - Custom auth headers supported (e.g., Authorization, x-api-key)
@@ -27,7 +34,12 @@ Migration Note: Now uses official `adcp` library (v1.0.1) instead of custom MCP
 - Maintains backward compatibility with existing API
 """
 
+import asyncio
+import json
 import logging
+import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
@@ -35,8 +47,18 @@ from adcp import ADCPMultiAgentClient, AgentConfig, GetSignalsRequest, PlatformD
 from adcp.exceptions import ADCPAuthenticationError, ADCPConnectionError, ADCPError, ADCPTimeoutError
 from adcp.types import DeliverTo
 
+from src.core.metrics import signals_cache_requests
+
 logger = logging.getLogger(__name__)
 
+SIGNALS_CACHE_TTL_SECONDS = float(os.getenv("SIGNALS_CACHE_TTL_SECONDS", "60"))
+SIGNALS_CACHE_MAX_ENTRIES = 1000
+
+
+def normalize_brief(brief: str) -> str:
+    """Normalize a brief for cache lookups (case and whitespace insensitive)."""
+    return " ".join(brief.lower().split())
+
 
 @dataclass
 class SignalsAgent:
@@ -55,6 +77,19 @@ class SignalsAgent:
     timeout: int = 30
 
 
+@dataclass
+class CachedSignals:
+    """Cached get_signals() response for one tenant/brief/context."""
+
+    signals: list[dict[str, Any]]
+    fetched_at: float
+    ttl_seconds: float = SIGNALS_CACHE_TTL_SECONDS
+
+    def is_expired(self) -> bool:
+        """Check if cache has expired."""
+        return time.monotonic() > self.fetched_at + self.ttl_seconds
+
+
 class SignalsAgentRegistry:
     """Registry of signals discovery agents with dynamic discovery.
 
@@ -70,8 +105,24 @@ class SignalsAgentRegistry:
     """
 
     def __init__(self):
-        """Initialize registry."""
-        pass  # No cache needed - adcp library handles connection pooling
+        """Initialize registry with an empty signals cache.
+
+        The adcp library handles connection pooling; the registry caches responses.
+        """
+        self._signals_cache: OrderedDict[tuple[str, str, str], CachedSignals] = OrderedDict()
+        self._inflight: dict[tuple[str, str, str], asyncio.Task] = {}
+
+    @staticmethod
+    def _signals_cache_key(tenant_id: str, brief: str, context: dict[str, Any] | None) -> tuple[str, str, str]:
+        return (tenant_id, normalize_brief(brief), json.dumps(context or {}, sort_keys=True, default=str))
+
+    def clear_cache(self, tenant_id: str | None = None) -> None:
+        """Drop cached signals responses (for one tenant, or all)."""
+        if tenant_id is None:
+            self._signals_cache.clear()
+            return
+        for key in [k for k in self._signals_cache if k[0] == tenant_id]:
+            del self._signals_cache[key]
 
     def _get_tenant_agents(self, tenant_id: str) -> list[SignalsAgent]:
         """Get list of signals agents for a tenant.
@@ -273,26 +324,95 @@ class SignalsAgentRegistry:
         principal_id: str | None = None,
         context: dict[str, Any] | None = None,
         principal_data: dict[str, Any] | None = None,
+        force_refresh: bool = False,
     ) -> list[dict[str, Any]]:
         """Get signals from all registered agents for a tenant.
 
+        Responses are cached per tenant, normalized brief and context, and
+        concurrent identical queries are coalesced into one upstream fan-out.
+        The returned signal dicts are shared with other callers; treat them as
+        read-only.
+
         Args:
             brief: Search brief/query
             tenant_id: Tenant identifier
             principal_id: Optional principal identifier
             context: Optional context data (may include promoted_offering)
             principal_data: Optional principal information
+            force_refresh: Skip cache and fetch fresh data
 
         Returns:
             List of all signal objects across all agents
         """
+        key = self._signals_cache_key(tenant_id, brief, context)
+
+        cached = self._signals_cache.get(key)
+        if cached and not cached.is_expired() and not force_refresh:
+            signals_cache_requests.labels(result="hit").inc()
+            return list(cached.signals)
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is not None and not task.done() and task.get_loop() is loop:
+            signals_cache_requests.labels(result="coalesced").inc()
+        else:
+            signals_cache_requests.labels(result="miss").inc()
+            task = loop.create_task(
+                self._fetch_and_cache_signals(key, brief, tenant_id, principal_id, context, principal_data)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+
+        # Shield so a caller that gives up (latency budget) does not cancel the shared fetch
+        return list(await asyncio.shield(task))
+
+    def _finish_inflight(self, key: tuple[str, str, str], task: asyncio.Task) -> None:
+        """Forget a completed fan-out; its result now lives in the cache."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here so an abandoned fetch does not log "exception was never retrieved"
+            logger.warning(f"get_signals: Shared query for tenant {key[0]} failed: {task.exception()}")
+
+    async def _fetch_and_cache_signals(
+        self,
+        key: tuple[str, str, str],
+        brief: str,
+        tenant_id: str,
+        principal_id: str | None,
+        context: dict[str, Any] | None,
+        principal_data: dict[str, Any] | None,
+    ) -> list[dict[str, Any]]:
+        """Query all agents and cache the combined response if every agent answered."""
+        all_signals, complete = await self._query_all_agents(brief, tenant_id, principal_id, context, principal_data)
+        if complete:
+            self._signals_cache[key] = CachedSignals(signals=all_signals, fetched_at=time.monotonic())
+            self._signals_cache.move_to_end(key)
+            while len(self._signals_cache) > SIGNALS_CACHE_MAX_ENTRIES:
+                self._signals_cache.popitem(last=False)
+        return all_signals
+
+    async def _query_all_agents(
+        self,
+        brief: str,
+        tenant_id: str,
+        principal_id: str | None = None,
+        context: dict[str, Any] | None = None,
+        principal_data: dict[str, Any] | None = None,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Query every enabled agent for a tenant.
+
+        Returns:
+            Tuple of (all signals, whether every agent answered without error)
+        """
         agents = self._get_tenant_agents(tenant_id)
         all_signals: list[dict[str, Any]] = []
+        complete = True
 
         logger.info(f"get_signals: Found {len(agents)} agents for tenant {tenant_id}")
 
         if not agents:
-            return all_signals
+            return all_signals, complete
 
         # Build AdCP client for all agents and use as async context manager
         client = self._build_adcp_client(agents)
@@ -317,10 +437,11 @@ class SignalsAgentRegistry:
                 except Exception as e:
                     # Log error but continue with other agents (graceful degradation)
                     logger.error(f"Failed to fetch signals from {agent.agent_url}: {e}", exc_info=True)
+                    complete = False
                     continue
 
         logger.info(f"get_signals: Returning {len(all_signals)} total signals")
-        return all_signals
+        return all_signals, complete
 
     async def test_connection(
         self, agent_url: str, auth: dict[str, Any] | None = None, auth_header: str | None = None
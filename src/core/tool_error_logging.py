@@ -2,6 +2,8 @@
 
 This module provides a decorator that wraps MCP tools to automatically log errors
 to the activity feed and audit logs, giving tenants visibility into failures.
+The decorator also opens the request scope (see request_scope.py) that memoizes
+tenant/principal/adapter lookups for the duration of the tool call.
 """
 
 import functools
@@ -13,6 +15,8 @@ from typing import Any
 from fastmcp.exceptions import ToolError
 from fastmcp.server import Context as FastMCPContext
 
+from src.core.request_scope import request_scope
+
 logger = logging.getLogger(__name__)
 
 
@@ -161,49 +165,51 @@ def with_error_logging(tool_func: Callable) -> Callable:
 
         @functools.wraps(tool_func)
         async def async_wrapper(*args, **kwargs) -> Any:
-            try:
-                return await tool_func(*args, **kwargs)
-            except Exception as e:
-                # Extract context from args/kwargs
-                context = None
-                for arg in args:
-                    if isinstance(arg, FastMCPContext) or hasattr(arg, "tenant_id"):
-                        context = arg
-                        break
-                for v in kwargs.values():
-                    if isinstance(v, FastMCPContext) or hasattr(v, "tenant_id"):
-                        context = v
-                        break
-
-                # Extract tenant/principal and log error
-                tenant_id, principal_id = _extract_tenant_and_principal(context) if context else (None, None)
-                _log_tool_error(tool_func.__name__, e, tenant_id, principal_id)
-
-                raise
+            with request_scope(tool_func.__name__):
+                try:
+                    return await tool_func(*args, **kwargs)
+                except Exception as e:
+                    # Extract context from args/kwargs
+                    context = None
+                    for arg in args:
+                        if isinstance(arg, FastMCPContext) or hasattr(arg, "tenant_id"):
+                            context = arg
+                            break
+                    for v in kwargs.values():
+                        if isinstance(v, FastMCPContext) or hasattr(v, "tenant_id"):
+                            context = v
+                            break
+
+                    # Extract tenant/principal and log error
+                    tenant_id, principal_id = _extract_tenant_and_principal(context) if context else (None, None)
+                    _log_tool_error(tool_func.__name__, e, tenant_id, principal_id)
+
+                    raise
 
         return async_wrapper
     else:
 
         @functools.wraps(tool_func)
         def sync_wrapper(*args, **kwargs) -> Any:
-            try:
-                return tool_func(*args, **kwargs)
-            except Exception as e:
-                # Extract context from args/kwargs
-                context = None
-                for arg in args:
-                    if isinstance(arg, FastMCPContext) or hasattr(arg, "tenant_id"):
-                        context = arg
-                        break
-                for v in kwargs.values():
-                    if isinstance(v, FastMCPContext) or hasattr(v, "tenant_id"):
-                        context = v
-                        break
-
-                # Extract tenant/principal and log error
-                tenant_id, principal_id = _extract_tenant_and_principal(context) if context else (None, None)
-                _log_tool_error(tool_func.__name__, e, tenant_id, principal_id)
-
-                raise
+            with request_scope(tool_func.__name__):
+                try:
+                    return tool_func(*args, **kwargs)
+                except Exception as e:
+                    # Extract context from args/kwargs
+                    context = None
+                    for arg in args:
+                        if isinstance(arg, FastMCPContext) or hasattr(arg, "tenant_id"):
+                            context = arg
+                            break
+                    for v in kwargs.values():
+                        if isinstance(v, FastMCPContext) or hasattr(v, "tenant_id"):
+                            context = v
+                            break
+
+                    # Extract tenant/principal and log error
+                    tenant_id, principal_id = _extract_tenant_and_principal(context) if context else (None, None)
+                    _log_tool_error(tool_func.__name__, e, tenant_id, principal_id)
+
+                    raise
 
         return sync_wrapper
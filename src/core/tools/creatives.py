@@ -7,6 +7,7 @@ Handles creative operations including:
 - Creative discovery and filtering
 """
 
+import asyncio
 import logging
 import time
 import uuid
@@ -52,8 +53,11 @@ from src.core.schemas import (
     SyncCreativesResponse,
 )
 from src.core.validation_helpers import format_validation_error, run_async_in_sync_context
+from src.services.idempotency import idempotent, model_codec
 
 
+# Without a client Idempotency-Key, only concurrent duplicates are coalesced (replay TTL 0)
+@idempotent("sync_creatives", model_codec(SyncCreativesResponse), natural_key=lambda args: None, replay_ttl_seconds=0)
 def _sync_creatives_impl(
     creatives: list[dict],
     assignments: dict | None = None,
@@ -330,46 +334,24 @@ def _sync_creatives_impl(
                                 existing_creative.status = CreativeStatusEnum.approved.value
                                 needs_approval = False
                             elif approval_mode == "ai-powered":
-                                # Submit to background AI review (async)
-
-                                from src.admin.blueprints.creatives import (
-                                    _ai_review_executor,
-                                    _ai_review_lock,
-                                    _ai_review_tasks,
-                                )
+                                # Queue AI review (committed with the creative, run by the review worker pool)
+                                from src.services.creative_review_queue import enqueue_creative_review
 
                                 # Set status to pending_review for AI review
                                 existing_creative.status = CreativeStatusEnum.pending_review.value
                                 needs_approval = True
 
-                                # Submit background task
-                                task_id = f"ai_review_{existing_creative.creative_id}_{uuid.uuid4().hex[:8]}"
-
-                                # Need to flush to ensure creative_id is available
-                                session.flush()
-
-                                # Import the async function
-                                from src.admin.blueprints.creatives import _ai_review_creative_async
-
-                                future = _ai_review_executor.submit(
-                                    _ai_review_creative_async,
-                                    creative_id=existing_creative.creative_id,
+                                review_job = enqueue_creative_review(
+                                    session,
                                     tenant_id=tenant["tenant_id"],
+                                    creative_id=existing_creative.creative_id,
                                     webhook_url=webhook_url,
                                     slack_webhook_url=tenant.get("slack_webhook_url"),
                                     principal_name=principal_id,
                                 )
 
-                                # Track the task
-                                with _ai_review_lock:
-                                    _ai_review_tasks[task_id] = {
-                                        "future": future,
-                                        "creative_id": existing_creative.creative_id,
-                                        "created_at": time.time(),
-                                    }
-
                                 logger.info(
-                                    f"[sync_creatives] Submitted AI review for {existing_creative.creative_id} (task: {task_id})"
+                                    f"[sync_creatives] Queued AI review for {existing_creative.creative_id} (task: {review_job.task_id})"
                                 )
                             else:  # require-human
                                 existing_creative.status = CreativeStatusEnum.pending_review.value
@@ -1163,43 +1145,24 @@ def _sync_creatives_impl(
                             db_creative.status = CreativeStatusEnum.approved.value
                             needs_approval = False
                         elif approval_mode == "ai-powered":
-                            # Submit to background AI review (async)
-
-                            from src.admin.blueprints.creatives import (
-                                _ai_review_executor,
-                                _ai_review_lock,
-                                _ai_review_tasks,
-                            )
+                            # Queue AI review (committed with the creative, run by the review worker pool)
+                            from src.services.creative_review_queue import enqueue_creative_review
 
                             # Set status to pending_review for AI review
                             db_creative.status = CreativeStatusEnum.pending_review.value
                             needs_approval = True
 
-                            # Submit background task
-                            task_id = f"ai_review_{db_creative.creative_id}_{uuid.uuid4().hex[:8]}"
-
-                            # Import the async function
-                            from src.admin.blueprints.creatives import _ai_review_creative_async
-
-                            future = _ai_review_executor.submit(
-                                _ai_review_creative_async,
-                                creative_id=db_creative.creative_id,
+                            review_job = enqueue_creative_review(
+                                session,
                                 tenant_id=tenant["tenant_id"],
+                                creative_id=db_creative.creative_id,
                                 webhook_url=webhook_url,
                                 slack_webhook_url=tenant.get("slack_webhook_url"),
                                 principal_name=principal_id,
                             )
 
-                            # Track the task
-                            with _ai_review_lock:
-                                _ai_review_tasks[task_id] = {
-                                    "future": future,
-                                    "creative_id": db_creative.creative_id,
-                                    "created_at": time.time(),
-                                }
-
                             logger.info(
-                                f"[sync_creatives] Submitted AI review for new creative {db_creative.creative_id} (task: {task_id})"
+                                f"[sync_creatives] Queued AI review for new creative {db_creative.creative_id} (task: {review_job.task_id})"
                             )
                         else:  # require-human
                             db_creative.status = CreativeStatusEnum.pending_review.value
@@ -1721,7 +1684,10 @@ async def sync_creatives(
     context_dict = context.model_dump(mode="json") if context else None
     validation_mode_str = validation_mode.value if validation_mode else "strict"
 
-    response = _sync_creatives_impl(
+    # The impl is blocking (database work, and waiting up to IDEMPOTENCY_WAIT_SECONDS
+    # while a duplicate request holds the idempotency key), so keep it off the event loop
+    response = await asyncio.to_thread(
+        _sync_creatives_impl,
         creatives=creatives_dicts,
         assignments=assignments,
         creative_ids=creative_ids,
@@ -70,7 +70,6 @@ from src.core.auth import (
 from src.core.config_loader import get_current_tenant
 from src.core.context_manager import get_context_manager
 from src.core.database.models import MediaBuy
-from src.core.database.models import Principal as ModelPrincipal
 from src.core.database.models import Product as ModelProduct
 from src.core.helpers import get_principal_id_from_context, log_tool_activity
 from src.core.helpers.adapter_helpers import get_adapter
@@ -98,6 +97,7 @@ from src.core.tool_context import ToolContext
 # Import get_product_catalog from main (after refactor)
 from src.core.validation_helpers import format_validation_error
 from src.services.activity_feed import activity_feed
+from src.services.idempotency import ResponseCodec, idempotent, model_codec
 
 # --- Helper Functions ---
 
@@ -839,6 +839,20 @@ def execute_approved_media_buy(media_buy_id: str, tenant_id: str) -> tuple[bool,
 
         logger.info(f"[APPROVAL] Adapter creation succeeded for {media_buy_id}: {response.media_buy_id}")
 
+        # Store the created line items with the packages, as the auto-approval path does.
+        # The media buy keeps its mb_ ID, so delivery reporting finds its rows through them.
+        platform_line_item_ids = getattr(response, "_platform_line_item_ids", {})
+        if platform_line_item_ids:
+            with get_db_session() as session:
+                stmt_packages = select(DBMediaPackage).filter_by(media_buy_id=media_buy_id)
+                for db_pkg in session.scalars(stmt_packages).all():
+                    if db_pkg.package_id in platform_line_item_ids:
+                        db_pkg.package_config = {
+                            **(db_pkg.package_config or {}),
+                            "platform_line_item_id": str(platform_line_item_ids[db_pkg.package_id]),
+                        }
+                session.commit()
+
         # Upload and associate inline creatives if any exist
         # This handles inline creatives that were uploaded during initial media buy creation
         with get_db_session() as session:
@@ -1282,7 +1296,20 @@ async def _validate_and_convert_format_ids(
 from src.services.setup_checklist_service import SetupIncompleteError, validate_setup_complete
 from src.services.slack_notifier import get_slack_notifier
 
+_success_codec = model_codec(CreateMediaBuySuccess)
+
+# Only successful creations are replayed, together with their task status (e.g. submitted for approval)
+CREATE_MEDIA_BUY_CODEC = ResponseCodec(
+    encode=lambda result: (
+        {"response": encoded, "status": result[1].value}
+        if (encoded := _success_codec.encode(result[0])) is not None
+        else None
+    ),
+    decode=lambda data: (_success_codec.decode(data["response"]), AdcpTaskStatus(data["status"])),
+)
+
 
+@idempotent("create_media_buy", CREATE_MEDIA_BUY_CODEC, natural_key=lambda args: args.get("buyer_ref"))
 async def _create_media_buy_impl(
     buyer_ref: str,
     brand_manifest: Any,  # BrandManifest | str - REQUIRED per AdCP v2.2.0 spec
@@ -1603,10 +1630,12 @@ async def _create_media_buy_impl(
             # Get products from database
             from sqlalchemy.orm import selectinload
 
+            # Eager-load everything the rest of the flow reads (schema conversion, format checks)
+            # so the products stay usable after this session closes
             products_stmt = (
                 select(ProductModel)
                 .where(ProductModel.tenant_id == tenant["tenant_id"], ProductModel.product_id.in_(product_ids))
-                .options(selectinload(ProductModel.pricing_options))
+                .options(selectinload(ProductModel.pricing_options), selectinload(ProductModel.inventory_profile))
             )
             products = session.scalars(products_stmt).all()
 
@@ -1991,43 +2020,44 @@ async def _create_media_buy_impl(
             )
             ctx_manager.add_message(persistent_ctx.context_id, "assistant", response_msg)
 
-            # Send Slack notification for manual approval requirement
-            try:
-                # Get principal name for notification
-                principal_name = principal.name if principal else principal_id
-
-                # Build notifier config from tenant fields
-                notifier_config = {
-                    "features": {
-                        "slack_webhook_url": tenant.get("slack_webhook_url"),
-                        "slack_audit_webhook_url": tenant.get("slack_audit_webhook_url"),
+            # Slack notification for manual approval requirement (sent once the media buy is committed)
+            def notify_approval_required() -> None:
+                try:
+                    # Get principal name for notification
+                    principal_name = principal.name if principal else principal_id
+
+                    # Build notifier config from tenant fields
+                    notifier_config = {
+                        "features": {
+                            "slack_webhook_url": tenant.get("slack_webhook_url"),
+                            "slack_audit_webhook_url": tenant.get("slack_audit_webhook_url"),
+                        }
+                    }
+                    slack_notifier = get_slack_notifier(notifier_config)
+
+                    # Create notification details
+                    notification_details = {
+                        "total_budget": total_budget,
+                        "po_number": req.po_number,
+                        "start_time": start_time.isoformat(),  # Resolved from 'asap' if needed
+                        "end_time": end_time.isoformat(),
+                        "product_ids": req.get_product_ids(),
+                        "workflow_step_id": step.step_id,
+                        "context_id": persistent_ctx.context_id,
                     }
-                }
-                slack_notifier = get_slack_notifier(notifier_config)
-
-                # Create notification details
-                notification_details = {
-                    "total_budget": total_budget,
-                    "po_number": req.po_number,
-                    "start_time": start_time.isoformat(),  # Resolved from 'asap' if needed
-                    "end_time": end_time.isoformat(),
-                    "product_ids": req.get_product_ids(),
-                    "workflow_step_id": step.step_id,
-                    "context_id": persistent_ctx.context_id,
-                }
 
-                slack_notifier.notify_media_buy_event(
-                    event_type="approval_required",
-                    media_buy_id=media_buy_id,
-                    principal_name=principal_name,
-                    details=notification_details,
-                    tenant_name=tenant.get("name", "Unknown"),
-                    tenant_id=tenant.get("tenant_id"),
-                    success=True,
-                )
-                logger.info("📧 Sent manual approval notification to Slack")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to send manual approval Slack notification: {e}")
+                    slack_notifier.notify_media_buy_event(
+                        event_type="approval_required",
+                        media_buy_id=media_buy_id,
+                        principal_name=principal_name,
+                        details=notification_details,
+                        tenant_name=tenant.get("name", "Unknown"),
+                        tenant_id=tenant.get("tenant_id"),
+                        success=True,
+                    )
+                    logger.info("📧 Sent manual approval notification to Slack")
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to send manual approval Slack notification: {e}")
 
             # Generate permanent package IDs (not dependent on media buy ID)
             # These IDs will be used whether the media buy is pending or approved
@@ -2095,296 +2125,205 @@ async def _create_media_buy_impl(
                     logger.warning(f"No pricing info found for package index {pkg_idx}")
             logger.debug(f"[PRICING] Mapped {len(package_pricing_info)} package pricing info")
 
-            # Create media buy record in the database with permanent ID
-            # Status is "pending_approval" but the ID is final
-            with get_db_session() as session:
-                pending_buy = MediaBuy(
-                    media_buy_id=media_buy_id,
-                    buyer_ref=req.buyer_ref,
-                    principal_id=principal.principal_id,
-                    tenant_id=tenant["tenant_id"],
-                    status="pending_approval",
-                    order_name=f"{req.buyer_ref} - {start_time.strftime('%Y-%m-%d')}",
-                    advertiser_name=principal.name,
-                    budget=total_budget,
-                    currency=request_currency or "USD",  # Use request_currency from validation above
-                    start_date=start_time.date(),
-                    end_date=end_time.date(),
-                    start_time=start_time,
-                    end_time=end_time,
-                    raw_request=raw_request_dict,  # Now includes package_id in each package
-                    created_at=datetime.now(UTC),
-                )
-                session.add(pending_buy)
-                session.commit()
-                logger.info(f"✅ Created media buy {media_buy_id} with status=pending_approval")
+            # Persist the media buy, its packages, the workflow link and creative assignments in one
+            # transaction (status is "pending_approval" but the ID is final). Notifications and activity
+            # logging run only once it has committed.
+            from src.core.database.media_buy_unit_of_work import media_buy_unit_of_work
+            from src.core.database.models import ObjectWorkflowMapping
+            from src.core.helpers import validate_creative_format_against_product
 
-            # Log to activity feed for manual approval case
-            try:
-                principal_name = principal.name if principal else principal_id
-                duration_days = (end_time - start_time).days + 1
-                activity_feed.log_media_buy(
-                    tenant_id=tenant["tenant_id"],
-                    principal_name=principal_name,
-                    media_buy_id=media_buy_id,
-                    budget=total_budget,
-                    duration_days=duration_days,
-                    action="pending_approval",  # Different action to indicate awaiting approval
-                )
-            except Exception as e:
-                logger.warning(f"Failed to log media buy pending approval to activity feed: {e}")
+            assert req.packages is not None, "packages required - validated earlier"
+            principal_name = principal.name if principal else principal_id
 
-            # Log to audit log for manual approval case
-            try:
-                audit_logger = get_audit_logger("AdCP", tenant["tenant_id"])
-                audit_logger.log_operation(
-                    operation="create_media_buy_pending_approval",
-                    principal_name=principal_name,
-                    principal_id=principal_id or "anonymous",
-                    adapter_id="mcp_server",
-                    success=True,
-                    details={
-                        "media_buy_id": media_buy_id,
-                        "buyer_ref": req.buyer_ref,
-                        "budget": total_budget,
-                        "currency": request_currency or "USD",
-                        "workflow_step_id": step.step_id,
-                        "context_id": persistent_ctx.context_id,
-                    },
+            with media_buy_unit_of_work(tenant["tenant_id"], products=product_map) as uow:
+                uow.add(
+                    MediaBuy(
+                        media_buy_id=media_buy_id,
+                        buyer_ref=req.buyer_ref,
+                        principal_id=principal.principal_id,
+                        tenant_id=tenant["tenant_id"],
+                        status="pending_approval",
+                        order_name=f"{req.buyer_ref} - {start_time.strftime('%Y-%m-%d')}",
+                        advertiser_name=principal.name,
+                        budget=total_budget,
+                        currency=request_currency or "USD",  # Use request_currency from validation above
+                        start_date=start_time.date(),
+                        end_date=end_time.date(),
+                        start_time=start_time,
+                        end_time=end_time,
+                        raw_request=raw_request_dict,  # Now includes package_id in each package
+                        created_at=datetime.now(UTC),
+                    )
                 )
-            except Exception as e:
-                logger.warning(f"Failed to log media buy pending approval to audit log: {e}")
 
-            # Create MediaPackage records for structured querying
-            # This enables the UI to display packages and creative assignments to work properly
-            with get_db_session() as session:
-                from src.core.database.models import MediaPackage as DBMediaPackage
+                # MediaPackage records for structured querying
+                # This enables the UI to display packages and creative assignments to work properly
+                for pkg_obj, req_pkg in zip(pending_packages, req.packages, strict=True):
+                    assert pkg_obj.package_id is not None, "package_id generated above"
+                    # Get pricing info for this package if available
+                    pricing_info_for_package = package_pricing_info.get(pkg_obj.package_id)
+
+                    # Serialize budget: normalize to object format for database storage
+                    # ADCP 2.5.0 sends flat numbers, but we normalize to object with currency for DB
+                    budget_value: dict[str, Any] | None = None
+                    if req_pkg.budget is not None:
+                        if isinstance(req_pkg.budget, (int, float)):
+                            # ADCP 2.5.0 flat format: normalize to object with currency from pricing
+                            package_currency = request_currency  # Use request-level currency
+                            if pricing_info_for_package:
+                                package_currency = pricing_info_for_package.get("currency", request_currency)
+                            budget_value = {
+                                "total": float(req_pkg.budget),
+                                "currency": package_currency,
+                            }
+                        elif hasattr(req_pkg.budget, "model_dump"):
+                            # ADCP 2.3 object format: store as-is
+                            budget_value = req_pkg.budget.model_dump()
+                        else:
+                            # Fallback: treat as dict or convert to dict
+                            budget_value = (
+                                dict(req_pkg.budget)
+                                if isinstance(req_pkg.budget, dict)
+                                else {"total": float(req_pkg.budget), "currency": request_currency}
+                            )
 
-                for pkg_obj in pending_packages:
-                    # Get paused state from package (adcp 2.12.0: replaced status enum with paused bool)
-                    paused = getattr(pkg_obj, "paused", False)  # Default to False (not paused) if not present
+                    # Serialize format_ids to dicts for JSON storage
+                    # Use mode='json' to convert AnyUrl to string
+                    format_ids_serialized = None
+                    if hasattr(req_pkg, "format_ids") and req_pkg.format_ids:
+                        format_ids_serialized = [
+                            fmt.model_dump(mode="json") if hasattr(fmt, "model_dump") else fmt
+                            for fmt in req_pkg.format_ids
+                        ]
 
                     package_config = {
                         "package_id": pkg_obj.package_id,
                         "name": getattr(pkg_obj, "name", None),
-                        "paused": paused,  # Store paused state (adcp 2.12.0)
+                        # Get paused state from package (adcp 2.12.0: replaced status enum with paused bool)
+                        "paused": getattr(pkg_obj, "paused", False),
+                        "product_id": req_pkg.product_id,
+                        "budget": budget_value,
+                        "targeting_overlay": (
+                            req_pkg.targeting_overlay.model_dump() if req_pkg.targeting_overlay else None
+                        ),
+                        "creative_ids": _get_creative_ids(req_pkg),
+                        "format_ids": format_ids_serialized,
+                        "pricing_info": pricing_info_for_package,  # Store pricing info for UI display
+                        "impressions": getattr(req_pkg, "impressions", None),  # Legacy field, for display
                     }
-                    # Add full package data from raw_request
-                    assert req.packages is not None, "packages required - validated earlier"
-                    for idx, req_pkg in enumerate(req.packages):
-                        if idx == pending_packages.index(pkg_obj):
-                            # Get pricing info for this package if available
-                            pricing_info_for_package = (
-                                package_pricing_info.get(pkg_obj.package_id) if pkg_obj.package_id else None
-                            )
-
-                            # Serialize budget: normalize to object format for database storage
-                            # ADCP 2.5.0 sends flat numbers, but we normalize to object with currency for DB
-                            budget_value: dict[str, Any] | None = None
-                            if req_pkg.budget is not None:
-                                if isinstance(req_pkg.budget, (int, float)):
-                                    # ADCP 2.5.0 flat format: normalize to object with currency from pricing
-                                    package_currency = request_currency  # Use request-level currency
-                                    if pricing_info_for_package:
-                                        package_currency = pricing_info_for_package.get("currency", request_currency)
-                                    budget_value = {
-                                        "total": float(req_pkg.budget),
-                                        "currency": package_currency,
-                                    }
-                                elif hasattr(req_pkg.budget, "model_dump"):
-                                    # ADCP 2.3 object format: store as-is
-                                    budget_value = req_pkg.budget.model_dump()
-                                else:
-                                    # Fallback: treat as dict or convert to dict
-                                    budget_value = (
-                                        dict(req_pkg.budget)
-                                        if isinstance(req_pkg.budget, dict)
-                                        else {"total": float(req_pkg.budget), "currency": request_currency}
-                                    )
-
-                            # Serialize format_ids to dicts for JSON storage
-                            # Use mode='json' to convert AnyUrl to string
-                            format_ids_serialized = None
-                            if hasattr(req_pkg, "format_ids") and req_pkg.format_ids:
-                                format_ids_serialized = [
-                                    fmt.model_dump(mode="json") if hasattr(fmt, "model_dump") else fmt
-                                    for fmt in req_pkg.format_ids
-                                ]
-
-                            package_config.update(
-                                {
-                                    "product_id": req_pkg.product_id,
-                                    "budget": budget_value,
-                                    "targeting_overlay": (
-                                        req_pkg.targeting_overlay.model_dump() if req_pkg.targeting_overlay else None
-                                    ),
-                                    "creative_ids": _get_creative_ids(req_pkg),
-                                    "format_ids": format_ids_serialized,
-                                    "pricing_info": pricing_info_for_package,  # Store pricing info for UI display
-                                    "impressions": getattr(
-                                        req_pkg, "impressions", None
-                                    ),  # Store impressions for display (legacy field)
-                                }
-                            )
-                            break
 
-                    # Extract pricing fields for dual-write
-                    from decimal import Decimal
-
-                    budget_total = None
-                    if budget_value:
-                        if isinstance(budget_value, dict):
-                            budget_total = budget_value.get("total")
-                        elif isinstance(budget_value, (int, float)):
-                            budget_total = float(budget_value)
-
-                    bid_price_value = None
-                    pacing_value = None
-                    if pricing_info_for_package:
-                        bid_price_value = pricing_info_for_package.get("bid_price")
-                    if budget_value and isinstance(budget_value, dict):
-                        pacing_value = budget_value.get("pacing")
-
-                    # Create MediaPackage with dual-write: dedicated columns + JSON
-                    db_package = DBMediaPackage(
-                        media_buy_id=media_buy_id,
-                        package_id=pkg_data["package_id"],
-                        package_config=package_config,
-                        # Dual-write: populate dedicated columns
-                        budget=Decimal(str(budget_total)) if budget_total is not None else None,
-                        bid_price=Decimal(str(bid_price_value)) if bid_price_value is not None else None,
-                        pacing=pacing_value,
+                    # Dual-write: dedicated pricing columns + JSON
+                    uow.add_package(
+                        media_buy_id,
+                        pkg_obj.package_id,
+                        package_config,
+                        budget=budget_value.get("total") if budget_value else None,
+                        bid_price=pricing_info_for_package.get("bid_price") if pricing_info_for_package else None,
+                        pacing=budget_value.get("pacing") if budget_value else None,
                     )
-                    session.add(db_package)
-
-                session.commit()
-                logger.info(f"✅ Created {len(pending_packages)} MediaPackage records")
 
-            # Link the workflow step to the media buy so the approval button shows in UI
-            with get_db_session() as session:
-                from src.core.database.models import ObjectWorkflowMapping
-
-                mapping = ObjectWorkflowMapping(
-                    object_type="media_buy", object_id=media_buy_id, step_id=step.step_id, action="create"
+                # Link the workflow step to the media buy so the approval button shows in UI
+                uow.add(
+                    ObjectWorkflowMapping(
+                        object_type="media_buy", object_id=media_buy_id, step_id=step.step_id, action="create"
+                    )
                 )
-                session.add(mapping)
-                session.commit()
-                logger.info(f"✅ Linked workflow step {step.step_id} to media buy")
 
-            # Create creative assignments for manual approval flow
-            # This must happen AFTER media packages are created so we have package_ids
-            if req.packages:
-                with get_db_session() as session:
-                    from src.core.database.models import Creative as DBCreative
-                    from src.core.database.models import CreativeAssignment as DBAssignment
+                # Creative assignments for the manual approval flow, keyed by the package IDs generated above
+                creatives_map: dict[str, Any] = uow.load_creatives(
+                    creative_id for package in req.packages for creative_id in (_get_creative_ids(package) or [])
+                )
+                logger.info(f"[CREATIVE_ASSIGN_DEBUG] Loaded {len(creatives_map)} creatives from database")
 
-                    # Batch load all creatives upfront
-                    all_creative_ids = []
-                    for package in req.packages:
-                        pkg_cids = _get_creative_ids(package)
-                        if pkg_cids:
-                            all_creative_ids.extend(pkg_cids)
-
-                    creatives_map: dict[str, Any] = {}
-                    if all_creative_ids:
-                        creative_stmt = select(DBCreative).where(
-                            DBCreative.tenant_id == tenant["tenant_id"],
-                            DBCreative.creative_id.in_(all_creative_ids),
-                        )
-                        creatives_list = session.scalars(creative_stmt).all()
-                        creatives_map = {str(c.creative_id): c for c in creatives_list}
-                        logger.info(f"[CREATIVE_ASSIGN_DEBUG] Loaded {len(creatives_map)} creatives from database")
-
-                        # Validate creative formats against product formats BEFORE creating assignments
-                        # This ensures creatives match the product's supported formats
-                        # Validation happens at assignment time (not sync time) because:
-                        # - Creatives may be synced before being assigned to products
-                        # - A creative may be valid for product A but not product B
-                        # - Same creative can be reused across packages if formats align
-                        from src.core.helpers import validate_creative_format_against_product
+                for package, pkg_obj in zip(req.packages, pending_packages, strict=True):
+                    pkg_cids = _get_creative_ids(package)
+                    if not pkg_cids:
+                        continue
 
-                        for package in req.packages:
-                            pkg_cids = _get_creative_ids(package)
-                            if pkg_cids and package.product_id:
-                                # Load product to check supported formats
-                                product_for_format_validation_stmt = select(ModelProduct).where(
-                                    ModelProduct.tenant_id == tenant["tenant_id"],
-                                    ModelProduct.product_id == package.product_id,
-                                )
-                                product_for_format_validation: ModelProduct | None = session.scalars(
-                                    product_for_format_validation_stmt
-                                ).first()
-
-                                if product_for_format_validation:
-                                    # Validate each creative against this product
-                                    for creative_id in pkg_cids:
-                                        creative = creatives_map.get(creative_id)
-                                        if creative:
-                                            # Simple binary check: does creative's format_id match product?
-                                            # Construct FormatId from database creative's agent_url and format columns
-                                            # (DBCreative stores these as separate string columns, not a FormatId object)
-                                            creative_format_id = FormatId(
-                                                agent_url=creative.agent_url, id=creative.format
-                                            )
-                                            format_is_valid, format_error = validate_creative_format_against_product(
-                                                creative_format_id=creative_format_id,
-                                                product=product_for_format_validation,
-                                            )
-
-                                            if not format_is_valid:
-                                                logger.error(f"[CREATIVE_ASSIGN_DEBUG] {format_error}")
-                                                logger.warning(
-                                                    "Creative format validation failure",
-                                                    extra={
-                                                        "creative_id": creative_id,
-                                                        "product_id": package.product_id,
-                                                        "creative_format": creative.format,
-                                                        "validation_error": format_error,
-                                                    },
-                                                )
-                                                raise ToolError(format_error)
-
-                                            logger.info(
-                                                f"[CREATIVE_ASSIGN_DEBUG] Creative {creative_id} format "
-                                                f"validated against product {package.product_id}"
-                                            )
-
-                    # Create assignments for each package
-                    for i, package in enumerate(req.packages):
-                        pkg_cids = _get_creative_ids(package)
-                        if pkg_cids:
-                            # Get package_id from pending_packages (already generated)
-                            pkg_id: str | None = pending_packages[i].package_id if i < len(pending_packages) else None
-                            if not pkg_id:
-                                logger.error(f"Cannot assign creatives: No package_id for package {i}")
+                    # Validate creative formats against the product's formats BEFORE creating assignments.
+                    # Validation happens at assignment time (not sync time) because:
+                    # - Creatives may be synced before being assigned to products
+                    # - A creative may be valid for product A but not product B
+                    # - Same creative can be reused across packages if formats align
+                    product_for_format_validation = (
+                        uow.load_products([package.product_id]).get(package.product_id) if package.product_id else None
+                    )
+                    if product_for_format_validation:
+                        for creative_id in pkg_cids:
+                            creative = creatives_map.get(creative_id)
+                            if not creative:
                                 continue
-
-                            logger.info(
-                                f"[CREATIVE_ASSIGN_DEBUG] Creating assignments for package {pkg_id}, creative_ids: {pkg_cids}"
+                            # Construct FormatId from database creative's agent_url and format columns
+                            # (DBCreative stores these as separate string columns, not a FormatId object)
+                            creative_format_id = FormatId(agent_url=creative.agent_url, id=creative.format)
+                            format_is_valid, format_error = validate_creative_format_against_product(
+                                creative_format_id=creative_format_id,
+                                product=product_for_format_validation,
                             )
+                            if not format_is_valid:
+                                logger.error(f"[CREATIVE_ASSIGN_DEBUG] {format_error}")
+                                logger.warning(
+                                    "Creative format validation failure",
+                                    extra={
+                                        "creative_id": creative_id,
+                                        "product_id": package.product_id,
+                                        "creative_format": creative.format,
+                                        "validation_error": format_error,
+                                    },
+                                )
+                                raise ToolError(format_error)
 
-                            for creative_id in pkg_cids:
-                                creative = creatives_map.get(creative_id)
-                                if not creative:
-                                    logger.warning(f"Creative {creative_id} not found in database, skipping assignment")
-                                    continue
+                    pkg_id = pkg_obj.package_id
+                    if not pkg_id:
+                        logger.error(f"Cannot assign creatives: No package_id for package {package.product_id}")
+                        continue
 
-                                # Create database assignment
-                                assignment_id = f"assign_{uuid.uuid4().hex[:12]}"
-                                assignment = DBAssignment(
-                                    assignment_id=assignment_id,
-                                    tenant_id=tenant["tenant_id"],
-                                    media_buy_id=media_buy_id,
-                                    package_id=pkg_id,
-                                    creative_id=creative_id,
-                                )
-                                session.add(assignment)
-                                logger.info(
-                                    f"[CREATIVE_ASSIGN_DEBUG] Created assignment {assignment_id} for creative {creative_id}"
-                                )
+                    for creative_id in pkg_cids:
+                        if creative_id not in creatives_map:
+                            logger.warning(f"Creative {creative_id} not found in database, skipping assignment")
+                            continue
+                        assignment_id = uow.add_assignment(media_buy_id, pkg_id, creative_id)
+                        logger.info(
+                            f"[CREATIVE_ASSIGN_DEBUG] Created assignment {assignment_id} for creative {creative_id}"
+                        )
 
-                            session.commit()
-                            logger.info(f"✅ Created creative assignments for package {pkg_id}")
+                def log_pending_activity() -> None:
+                    duration_days = (end_time - start_time).days + 1
+                    activity_feed.log_media_buy(
+                        tenant_id=tenant["tenant_id"],
+                        principal_name=principal_name,
+                        media_buy_id=media_buy_id,
+                        budget=total_budget,
+                        duration_days=duration_days,
+                        action="pending_approval",  # Different action to indicate awaiting approval
+                    )
+
+                def log_pending_audit() -> None:
+                    audit_logger = get_audit_logger("AdCP", tenant["tenant_id"])
+                    audit_logger.log_operation(
+                        operation="create_media_buy_pending_approval",
+                        principal_name=principal_name,
+                        principal_id=principal_id or "anonymous",
+                        adapter_id="mcp_server",
+                        success=True,
+                        details={
+                            "media_buy_id": media_buy_id,
+                            "buyer_ref": req.buyer_ref,
+                            "budget": total_budget,
+                            "currency": request_currency or "USD",
+                            "workflow_step_id": step.step_id,
+                            "context_id": persistent_ctx.context_id,
+                        },
+                    )
+
+                uow.after_commit("Slack approval notification", notify_approval_required)
+                uow.after_commit("activity feed", log_pending_activity)
+                uow.after_commit("audit log", log_pending_audit)
+                uow.commit()
+                logger.info(
+                    f"✅ Created media buy {media_buy_id} with status=pending_approval "
+                    f"and {len(pending_packages)} MediaPackage records"
+                )
 
             # Return success response with packages awaiting approval
             # The workflow_step_id in packages indicates approval is required
@@ -2403,12 +2342,15 @@ async def _create_media_buy_impl(
             )
 
         # Get products for the media buy to check product-level auto-creation settings
-        # Lazy import to avoid circular dependency with main.py
-        from src.core.main import get_product_catalog
+        # Converted from the products loaded during validation rather than reloading the catalog
+        from src.core.product_conversion import convert_product_model_to_schema
 
-        catalog = get_product_catalog()
         product_ids = req.get_product_ids()
-        products_in_buy = [p for p in catalog if p.product_id in product_ids]
+        products_in_buy = [
+            convert_product_model_to_schema(product_map[product_id])
+            for product_id in dict.fromkeys(product_ids)
+            if product_id in product_map
+        ]
 
         # Validate and auto-generate GAM implementation_config for each product if needed
         if adapter.__class__.__name__ == "GoogleAdManager":
@@ -2416,6 +2358,7 @@ async def _create_media_buy_impl(
 
             gam_validator = GAMProductConfigService()
             config_errors = []
+            generated_configs: dict[str, dict[str, Any]] = {}
 
             for schema_product in products_in_buy:
                 # Auto-generate default config if missing
@@ -2437,15 +2380,7 @@ async def _create_media_buy_impl(
                     schema_product.implementation_config = gam_validator.generate_default_config(
                         delivery_type=delivery_type_str, formats=formats_list
                     )
-
-                    # Persist the auto-generated config to database
-                    with get_db_session() as db_session:
-                        product_stmt = select(ModelProduct).filter_by(product_id=schema_product.product_id)
-                        db_product = db_session.scalars(product_stmt).first()
-                        if db_product:
-                            db_product.implementation_config = schema_product.implementation_config
-                            db_session.commit()
-                            logger.info(f"Saved auto-generated GAM config for product {schema_product.product_id}")
+                    generated_configs[schema_product.product_id] = schema_product.implementation_config
 
                 # Validate the config (whether existing or auto-generated)
                 impl_config = schema_product.implementation_config if schema_product.implementation_config else {}
@@ -2456,6 +2391,18 @@ async def _create_media_buy_impl(
                         f"Product '{schema_product.name}' ({schema_product.product_id}) has invalid GAM configuration: {error_msg}"
                     )
 
+            # Persist the auto-generated configs to database in one transaction
+            if generated_configs:
+                with get_db_session() as db_session:
+                    product_stmt = select(ModelProduct).where(
+                        ModelProduct.tenant_id == tenant["tenant_id"],
+                        ModelProduct.product_id.in_(list(generated_configs)),
+                    )
+                    for db_product in db_session.scalars(product_stmt):
+                        db_product.implementation_config = generated_configs[db_product.product_id]
+                    db_session.commit()
+                    logger.info(f"Saved auto-generated GAM config for products {sorted(generated_configs)}")
+
             if config_errors:
                 error_detail = "GAM configuration validation failed:\n" + "\n".join(
                     f"  • {err}" for err in config_errors
@@ -2886,425 +2833,322 @@ async def _create_media_buy_impl(
             f"has_creatives={has_creatives}, creatives_approved={creatives_approved} → status={media_buy_status}"
         )
 
-        # Store the media buy in database (context_id is NULL for synchronous operations)
+        # Store the media buy, its packages and creative assignments in one transaction
+        # (context_id is NULL for synchronous operations). Ad server creative association
+        # runs once the rows are committed.
+        from src.core.database.media_buy_unit_of_work import media_buy_unit_of_work
+        from src.core.helpers import validate_creative_format_against_product
+
         tenant = get_current_tenant()
-        with get_db_session() as session:
-            new_media_buy = MediaBuy(
-                media_buy_id=response.media_buy_id,
-                tenant_id=tenant["tenant_id"],
-                principal_id=principal_id,
-                buyer_ref=req.buyer_ref,  # AdCP v2.4 buyer reference
-                order_name=req.po_number or f"Order-{response.media_buy_id}",
-                advertiser_name=principal.name,
-                campaign_objective=getattr(req, "campaign_objective", ""),  # Optional field
-                kpi_goal=getattr(req, "kpi_goal", ""),  # Optional field
-                budget=total_budget,  # Extract total budget
-                currency=request_currency,  # AdCP v2.4 currency field (resolved above)
-                start_date=start_time.date(),  # Legacy field for compatibility
-                end_date=end_time.date(),  # Legacy field for compatibility
-                start_time=start_time,  # AdCP v2.4 datetime scheduling (resolved from 'asap' if needed)
-                end_time=end_time,  # AdCP v2.4 datetime scheduling
-                status=media_buy_status,
-                raw_request=req.model_dump(mode="json"),
+        with media_buy_unit_of_work(tenant["tenant_id"], products=product_map) as uow:
+            uow.add(
+                MediaBuy(
+                    media_buy_id=response.media_buy_id,
+                    tenant_id=tenant["tenant_id"],
+                    principal_id=principal_id,
+                    buyer_ref=req.buyer_ref,  # AdCP v2.4 buyer reference
+                    order_name=req.po_number or f"Order-{response.media_buy_id}",
+                    advertiser_name=principal.name,
+                    campaign_objective=getattr(req, "campaign_objective", ""),  # Optional field
+                    kpi_goal=getattr(req, "kpi_goal", ""),  # Optional field
+                    budget=total_budget,  # Extract total budget
+                    currency=request_currency,  # AdCP v2.4 currency field (resolved above)
+                    start_date=start_time.date(),  # Legacy field for compatibility
+                    end_date=end_time.date(),  # Legacy field for compatibility
+                    start_time=start_time,  # AdCP v2.4 datetime scheduling (resolved from 'asap' if needed)
+                    end_time=end_time,  # AdCP v2.4 datetime scheduling
+                    status=media_buy_status,
+                    raw_request=req.model_dump(mode="json"),
+                )
             )
-            session.add(new_media_buy)
-            session.commit()
 
-        # Populate media_packages table for structured querying
-        # This enables creative_assignments to work properly
-        if req.packages or (response.packages and len(response.packages) > 0):
-            with get_db_session() as session:
-                from src.core.database.models import MediaPackage as DBMediaPackage
-
-                # Use response packages if available (has package_ids), otherwise generate from request
-                packages_to_save = response.packages if response.packages else []
-                logger.info(f"[DEBUG] Saving {len(packages_to_save)} packages to media_packages table")
-
-                for i, resp_package in enumerate(packages_to_save):
-                    # resp_package is always a Package object (adapters no longer return dicts)
-                    def serialize_for_json(value):
-                        """Serialize Pydantic models to dicts for JSON storage."""
-                        from pydantic import BaseModel
-
-                        if value is None:
-                            return None
-                        if isinstance(value, BaseModel):
-                            return value.model_dump(exclude_none=True)
-                        if isinstance(value, list):
-                            return [serialize_for_json(item) for item in value]
-                        if isinstance(value, dict):
-                            return {k: serialize_for_json(v) for k, v in value.items()}
-                        return value
-
-                    # Extract package_id from response - MUST be present, no fallback allowed
-                    resp_package_id: str | None = resp_package.package_id
-
-                    if not resp_package_id:
-                        error_msg = (
-                            f"Adapter did not return package_id for package {i}. This is a critical bug in the adapter."
-                        )
-                        logger.error(error_msg)
-                        raise ValueError(error_msg)
-
-                    # Store full package config as JSON
-                    # Get paused state from adapter response (adcp 2.12.0: replaced status enum with paused bool)
-                    paused = getattr(resp_package, "paused", False)  # Default to False (not paused) if not present
-
-                    # Get pricing info for this package if available
-                    pricing_info_for_package = package_pricing_info.get(resp_package_id)
-
-                    # Get impressions from request package if available (legacy field)
-                    request_pkg = req.packages[i] if req.packages and i < len(req.packages) else None
-                    impressions = getattr(request_pkg, "impressions", None) if request_pkg else None
-
-                    package_config = {
-                        "package_id": resp_package_id,
-                        "name": getattr(resp_package, "name", None),  # Include package name from adapter response
-                        "product_id": getattr(resp_package, "product_id", None),
-                        "budget": serialize_for_json(getattr(resp_package, "budget", None)),
-                        "targeting_overlay": serialize_for_json(getattr(resp_package, "targeting_overlay", None)),
-                        "creative_ids": getattr(resp_package, "creative_ids", None),
-                        "creative_assignments": serialize_for_json(getattr(resp_package, "creative_assignments", None)),
-                        "format_ids_to_provide": getattr(resp_package, "format_ids_to_provide", None),
-                        "paused": paused,  # Store paused state (adcp 2.12.0)
-                        "pricing_info": pricing_info_for_package,  # Store pricing info for UI display
-                        "impressions": impressions,  # Store impressions for display
-                    }
-
-                    # Extract pricing fields for dual-write from adapter response
-                    from decimal import Decimal
-
-                    budget_total = None
-                    budget_data = getattr(resp_package, "budget", None)
-                    if budget_data:
-                        if isinstance(budget_data, dict):
-                            budget_total = budget_data.get("total")
-                        elif isinstance(budget_data, (int, float)):
-                            budget_total = float(budget_data)
-
-                    bid_price_value = None
-                    pacing_value = None
-                    if pricing_info_for_package:
-                        bid_price_value = pricing_info_for_package.get("bid_price")
-                    if budget_data and isinstance(budget_data, dict):
-                        pacing_value = budget_data.get("pacing")
-
-                    # Create MediaPackage with dual-write: dedicated columns + JSON
-                    db_package = DBMediaPackage(
-                        media_buy_id=response.media_buy_id,
-                        package_id=resp_package_id,
-                        package_config=package_config,
-                        # Dual-write: populate dedicated columns
-                        budget=Decimal(str(budget_total)) if budget_total is not None else None,
-                        bid_price=Decimal(str(bid_price_value)) if bid_price_value is not None else None,
-                        pacing=pacing_value,
+            # Populate media_packages table for structured querying
+            # This enables creative_assignments to work properly
+            def serialize_for_json(value):
+                """Serialize Pydantic models to dicts for JSON storage."""
+                from pydantic import BaseModel
+
+                if value is None:
+                    return None
+                if isinstance(value, BaseModel):
+                    return value.model_dump(exclude_none=True)
+                if isinstance(value, list):
+                    return [serialize_for_json(item) for item in value]
+                if isinstance(value, dict):
+                    return {k: serialize_for_json(v) for k, v in value.items()}
+                return value
+
+            # Adapters (like GAM) attach a _platform_line_item_ids mapping to the response object.
+            # update_media_buy needs it (budget updates, pause/resume), so it is stored with the package.
+            platform_line_item_ids = getattr(response, "_platform_line_item_ids", {})
+            if platform_line_item_ids:
+                logger.info(f"[DEBUG] Found platform_line_item_ids mapping: {platform_line_item_ids}")
+
+            # Use response packages (have package_ids)
+            packages_to_save = response.packages if response.packages else []
+            logger.info(f"[DEBUG] Saving {len(packages_to_save)} packages to media_packages table")
+
+            for i, resp_package in enumerate(packages_to_save):
+                # Extract package_id from response - MUST be present, no fallback allowed
+                resp_package_id: str | None = resp_package.package_id
+                if not resp_package_id:
+                    error_msg = (
+                        f"Adapter did not return package_id for package {i}. This is a critical bug in the adapter."
                     )
-                    session.add(db_package)
-
-                session.commit()
-                logger.info(
-                    f"Saved {len(packages_to_save)} packages to media_packages table for media_buy {response.media_buy_id}"
-                )
+                    logger.error(error_msg)
+                    raise ValueError(error_msg)
 
-                # Update packages with platform_line_item_id from adapter response
-                # This is required for update_media_buy operations (budget updates, pause/resume)
-                # Adapters (like GAM) attach a _platform_line_item_ids mapping to the response object
-                platform_line_item_ids = getattr(response, "_platform_line_item_ids", {})
+                # Get pricing info for this package if available
+                pricing_info_for_package = package_pricing_info.get(resp_package_id)
+
+                # Get impressions from request package if available (legacy field)
+                request_pkg = req.packages[i] if req.packages and i < len(req.packages) else None
+                impressions = getattr(request_pkg, "impressions", None) if request_pkg else None
+
+                # Store full package config as JSON
+                package_config = {
+                    "package_id": resp_package_id,
+                    "name": getattr(resp_package, "name", None),  # Include package name from adapter response
+                    "product_id": getattr(resp_package, "product_id", None),
+                    "budget": serialize_for_json(getattr(resp_package, "budget", None)),
+                    "targeting_overlay": serialize_for_json(getattr(resp_package, "targeting_overlay", None)),
+                    "creative_ids": getattr(resp_package, "creative_ids", None),
+                    "creative_assignments": serialize_for_json(getattr(resp_package, "creative_assignments", None)),
+                    "format_ids_to_provide": getattr(resp_package, "format_ids_to_provide", None),
+                    # Paused state from adapter response (adcp 2.12.0: replaced status enum with paused bool)
+                    "paused": getattr(resp_package, "paused", False),
+                    "pricing_info": pricing_info_for_package,  # Store pricing info for UI display
+                    "impressions": impressions,  # Store impressions for display
+                }
+                if resp_package_id in platform_line_item_ids:
+                    package_config["platform_line_item_id"] = str(platform_line_item_ids[resp_package_id])
 
-                if platform_line_item_ids:
-                    logger.info(f"[DEBUG] Found platform_line_item_ids mapping: {platform_line_item_ids}")
+                # Extract pricing fields for dual-write from adapter response
+                budget_total = None
+                budget_data = getattr(resp_package, "budget", None)
+                if budget_data:
+                    if isinstance(budget_data, dict):
+                        budget_total = budget_data.get("total")
+                    elif isinstance(budget_data, (int, float)):
+                        budget_total = float(budget_data)
+
+                uow.add_package(
+                    response.media_buy_id,
+                    resp_package_id,
+                    package_config,
+                    budget=budget_total,
+                    bid_price=pricing_info_for_package.get("bid_price") if pricing_info_for_package else None,
+                    pacing=budget_data.get("pacing") if isinstance(budget_data, dict) else None,
+                )
 
-                    for pkg_id, line_item_id in platform_line_item_ids.items():
-                        # Update the package_config with platform_line_item_id
-                        from sqlalchemy import select
+            unsaved_line_item_ids = set(platform_line_item_ids) - {p.package_id for p in packages_to_save}
+            if unsaved_line_item_ids:
+                logger.warning(
+                    f"⚠️  Could not find packages {sorted(unsaved_line_item_ids)} to save platform_line_item_id"
+                )
 
-                        from src.core.database.models import MediaPackage as DBMediaPackage
+            # Handle creative_ids in packages if provided (immediate association)
+            all_creative_ids = [
+                creative_id for package in req.packages or [] for creative_id in (_get_creative_ids(package) or [])
+            ]
+            creatives_by_id: dict[str, Any] = uow.load_creatives(all_creative_ids)
+
+            if all_creative_ids:
+                # Validate all creative IDs exist (match update_media_buy behavior)
+                missing_ids = set(all_creative_ids) - set(creatives_by_id)
+                if missing_ids:
+                    error_msg = f"Creative IDs not found: {', '.join(sorted(missing_ids))}"
+                    logger.error(error_msg)
+                    ctx_manager.update_workflow_step(step.step_id, status="failed", error_message=error_msg)
+                    raise ToolError("CREATIVES_NOT_FOUND", error_msg)
+
+            for i, package in enumerate(req.packages or []):
+                pkg_cids = _get_creative_ids(package)
+                if not pkg_cids:
+                    continue
 
-                        package_stmt = select(DBMediaPackage).filter_by(
-                            media_buy_id=response.media_buy_id, package_id=pkg_id
+                # Validate creative formats against the product's formats BEFORE creating assignments.
+                # Validation happens at assignment time (not sync time) because:
+                # - Creatives may be synced before being assigned to products
+                # - A creative may be valid for product A but not product B
+                # - Same creative can be reused across packages if formats align
+                product_format_check = (
+                    uow.load_products([package.product_id]).get(package.product_id) if package.product_id else None
+                )
+                if product_format_check:
+                    for creative_id in pkg_cids:
+                        creative = creatives_by_id[creative_id]
+                        # Construct FormatId from database creative's agent_url and format columns
+                        # (DBCreative stores these as separate string columns, not a FormatId object)
+                        creative_format_id = FormatId(agent_url=creative.agent_url, id=creative.format)
+                        format_is_valid, format_error = validate_creative_format_against_product(
+                            creative_format_id=creative_format_id,
+                            product=product_format_check,
                         )
-                        pkg_record: DBMediaPackage | None = session.scalars(package_stmt).first()
-                        if pkg_record:
-                            # Update package_config JSON with platform_line_item_id
-                            pkg_record.package_config["platform_line_item_id"] = str(line_item_id)
-                            from sqlalchemy.orm import attributes
-
-                            attributes.flag_modified(pkg_record, "package_config")
-                            logger.info(f"✓ Updated package {pkg_id} with platform_line_item_id: {line_item_id}")
-                        else:
-                            logger.warning(f"⚠️  Could not find DB package {pkg_id} to save platform_line_item_id")
-
-                    session.commit()
-                    logger.info("✓ Saved platform_line_item_ids to database")
-                else:
-                    logger.info("[DEBUG] No platform_line_item_ids found on response object")
-
-        # Handle creative_ids in packages if provided (immediate association)
-        if req.packages:
-            with get_db_session() as session:
-                from src.core.database.models import Creative as DBCreative
-                from src.core.database.models import CreativeAssignment as DBAssignment
-
-                # Batch load all creatives upfront to avoid N+1 queries
-                all_creative_ids = []
-                for package in req.packages:
-                    pkg_cids = _get_creative_ids(package)
-                    if pkg_cids:
-                        all_creative_ids.extend(pkg_cids)
-
-                creatives_by_id: dict[str, Any] = {}
-                if all_creative_ids:
-                    creative_stmt = select(DBCreative).where(
-                        DBCreative.tenant_id == tenant["tenant_id"],
-                        DBCreative.creative_id.in_(all_creative_ids),
-                    )
-                    creatives_list = session.scalars(creative_stmt).all()
-                    creatives_by_id = {str(c.creative_id): c for c in creatives_list}
-
-                    # Validate all creative IDs exist (match update_media_buy behavior)
-                    found_creative_ids = set(creatives_by_id.keys())
-                    requested_creative_ids = set(all_creative_ids)
-                    missing_ids = requested_creative_ids - found_creative_ids
-
-                    if missing_ids:
-                        error_msg = f"Creative IDs not found: {', '.join(sorted(missing_ids))}"
-                        logger.error(error_msg)
-                        ctx_manager.update_workflow_step(step.step_id, status="failed", error_message=error_msg)
-                        raise ToolError("CREATIVES_NOT_FOUND", error_msg)
-
-                    # Validate creative formats against product formats BEFORE creating assignments
-                    # This ensures creatives match the product's supported formats
-                    # Validation happens at assignment time (not sync time) because:
-                    # - Creatives may be synced before being assigned to products
-                    # - A creative may be valid for product A but not product B
-                    # - Same creative can be reused across packages if formats align
-                    from src.core.helpers import validate_creative_format_against_product
-
-                    for package in req.packages:
-                        pkg_cids = _get_creative_ids(package)
-                        if pkg_cids and package.product_id:
-                            # Load product to check supported formats
-                            product_format_check_stmt = select(ModelProduct).where(
-                                ModelProduct.tenant_id == tenant["tenant_id"],
-                                ModelProduct.product_id == package.product_id,
+                        if not format_is_valid:
+                            logger.error(format_error)
+                            logger.warning(
+                                "Creative format validation failure",
+                                extra={
+                                    "creative_id": creative_id,
+                                    "product_id": package.product_id,
+                                    "creative_format": creative.format,
+                                    "validation_error": format_error,
+                                },
                             )
-                            product_format_check: ModelProduct | None = session.scalars(
-                                product_format_check_stmt
-                            ).first()
-
-                            if product_format_check:
-                                # Validate each creative against this product
-                                for creative_id in pkg_cids:
-                                    creative = creatives_by_id.get(creative_id)
-                                    if creative:
-                                        # Simple binary check: does creative's format_id match product?
-                                        # Construct FormatId from database creative's agent_url and format columns
-                                        # (DBCreative stores these as separate string columns, not a FormatId object)
-                                        creative_format_id = FormatId(agent_url=creative.agent_url, id=creative.format)
-                                        format_is_valid, format_error = validate_creative_format_against_product(
-                                            creative_format_id=creative_format_id,
-                                            product=product_format_check,
-                                        )
-
-                                        if not format_is_valid:
-                                            logger.error(format_error)
-                                            logger.warning(
-                                                "Creative format validation failure",
-                                                extra={
-                                                    "creative_id": creative_id,
-                                                    "product_id": package.product_id,
-                                                    "creative_format": creative.format,
-                                                    "validation_error": format_error,
-                                                },
-                                            )
-                                            ctx_manager.update_workflow_step(
-                                                step.step_id, status="failed", error_message=format_error
-                                            )
-                                            raise ToolError("CREATIVE_FORMAT_MISMATCH", format_error)
-
-                                        logger.info(
-                                            f"Creative {creative_id} format validated against product {package.product_id}"
-                                        )
-
-                for i, package in enumerate(req.packages):
-                    pkg_cids = _get_creative_ids(package)
-                    if pkg_cids:
-                        # Use package_id from response (matches what's in media_packages table)
-                        # NO FALLBACK - if adapter doesn't return package_id, fail loudly
-                        response_package_id = None
-                        if response.packages and i < len(response.packages):
-                            # Package is a Pydantic model, use attribute access
-                            response_package_id = getattr(response.packages[i], "package_id", None)
-                            logger.info(f"[DEBUG] Package {i}: response.packages[i] = {response.packages[i]}")
-                            logger.info(f"[DEBUG] Package {i}: extracted package_id = {response_package_id}")
-
-                        if not response_package_id:
-                            error_msg = f"Cannot assign creatives: Adapter did not return package_id for package {i}"
-                            logger.error(error_msg)
-                            raise ValueError(error_msg)
+                            ctx_manager.update_workflow_step(step.step_id, status="failed", error_message=format_error)
+                            raise ToolError("CREATIVE_FORMAT_MISMATCH", format_error)
+
+                        logger.info(f"Creative {creative_id} format validated against product {package.product_id}")
+
+                # Use package_id from response (matches what's in media_packages table)
+                # NO FALLBACK - if adapter doesn't return package_id, fail loudly
+                response_package_id = None
+                platform_line_item_id = None
+                if response.packages and i < len(response.packages):
+                    # Package is a Pydantic model, use attribute access
+                    response_package_id = getattr(response.packages[i], "package_id", None)
+                    platform_line_item_id = getattr(response.packages[i], "platform_line_item_id", None)
+                    logger.info(f"[DEBUG] Package {i}: extracted package_id = {response_package_id}")
+
+                if not response_package_id:
+                    error_msg = f"Cannot assign creatives: Adapter did not return package_id for package {i}"
+                    logger.error(error_msg)
+                    raise ValueError(error_msg)
 
-                        # Get platform_line_item_id from response if available
-                        platform_line_item_id = None
-                        if response.packages and i < len(response.packages):
-                            platform_line_item_id = getattr(response.packages[i], "platform_line_item_id", None)
+                # Collect platform creative IDs for association
+                platform_creative_ids = []
 
-                        # Collect platform creative IDs for association
-                        platform_creative_ids = []
+                for creative_id in pkg_cids:
+                    creative = creatives_by_id[creative_id]
 
-                        for creative_id in pkg_cids:
-                            # Get creative from batch-loaded map
-                            creative = creatives_by_id.get(creative_id)
+                    # Get platform_creative_id from creative.data JSON
+                    platform_creative_id = creative.data.get("platform_creative_id") if creative.data else None
+                    if platform_creative_id:
+                        # Add to association list for immediate GAM association
+                        platform_creative_ids.append(platform_creative_id)
+                    else:
+                        # Creative not uploaded to GAM yet - upload it now
+                        # Use the same simple asset dict approach as manual approval (execute_approved_media_buy)
+                        logger.info(f"Creative {creative_id} has no platform_creative_id - uploading to GAM now")
+                        try:
+                            creative_data = creative.data or {}
+
+                            # Get format spec for proper extraction
+                            # Uses shared helper with in-memory cache (30min TTL)
+                            format_spec = None
+                            if creative.format:
+                                format_spec = _get_format_spec_sync(creative.agent_url, str(creative.format))
+                                if not format_spec:
+                                    logger.warning(
+                                        f"[AUTO-APPROVAL] Could not fetch format {creative.format} "
+                                        f"from {creative.agent_url}"
+                                    )
 
-                            # This should never happen now due to validation above
-                            if not creative:
-                                logger.error(f"Creative {creative_id} not in map despite validation - this is a bug")
-                                continue
+                            # Extract URL and dimensions using shared helper
+                            url, width, height = _extract_creative_url_and_dimensions(creative_data, format_spec)
+
+                            # Build simple asset dict (same as manual approval flow)
+                            asset = {
+                                "creative_id": creative.creative_id,
+                                "package_assignments": [response_package_id],  # This specific package
+                                "width": width,
+                                "height": height,
+                                "url": url,
+                                "asset_type": creative_data.get("asset_type", "image"),
+                                "name": creative.name or f"Creative {creative.creative_id}",
+                            }
+
+                            # Validate required fields - FAIL FAST, do not skip
+                            validation_errors = []
+                            if not asset["width"] or not asset["height"]:
+                                validation_errors.append(
+                                    f"Creative {creative_id} missing dimensions (width={asset['width']}, height={asset['height']})"
+                                )
+                            if not asset["url"]:
+                                validation_errors.append(f"Creative {creative_id} missing required URL field")
 
-                            # Create database assignment (always create, even if not yet uploaded to GAM)
-                            # Get platform_creative_id from creative.data JSON
-                            platform_creative_id = creative.data.get("platform_creative_id") if creative.data else None
-                            if platform_creative_id:
-                                # Add to association list for immediate GAM association
-                                platform_creative_ids.append(platform_creative_id)
-                            else:
-                                # Creative not uploaded to GAM yet - upload it now
-                                # Use the same simple asset dict approach as manual approval (execute_approved_media_buy)
-                                logger.info(
-                                    f"Creative {creative_id} has no platform_creative_id - uploading to GAM now"
+                            if validation_errors:
+                                error_msg = (
+                                    "Cannot create media buy with invalid creatives. "
+                                    "The following creatives are missing required fields:\n"
+                                    + "\n".join(f"  • {err}" for err in validation_errors)
+                                    + "\n\nAll creatives must have dimensions (width/height) and a content URL. "
+                                    "Please ensure creatives are properly synced before creating media buys."
                                 )
-                                try:
-                                    creative_data = creative.data or {}
-
-                                    # Get format spec for proper extraction
-                                    # Uses shared helper with in-memory cache (30min TTL)
-                                    format_spec = None
-                                    if creative.format:
-                                        format_spec = _get_format_spec_sync(creative.agent_url, str(creative.format))
-                                        if not format_spec:
-                                            logger.warning(
-                                                f"[AUTO-APPROVAL] Could not fetch format {creative.format} "
-                                                f"from {creative.agent_url}"
-                                            )
-
-                                    # Extract URL and dimensions using shared helper
-                                    url, width, height = _extract_creative_url_and_dimensions(
-                                        creative_data, format_spec
+                                logger.error(f"[AUTO-APPROVAL] {error_msg}")
+                                # Raise exception for MCP - this will be caught and returned as error response
+                                raise ToolError("INVALID_CREATIVES", error_msg, {"creative_errors": validation_errors})
+
+                            # Upload to GAM using adapter's add_creative_assets method
+                            upload_result = adapter.add_creative_assets(
+                                response.media_buy_id if response.media_buy_id else "",
+                                [asset],
+                                datetime.now(UTC),
+                            )
+                            logger.info(f"Successfully uploaded creative {creative_id} to GAM: {upload_result}")
+
+                            # Update creative in database with platform_creative_id
+                            if upload_result and len(upload_result) > 0:
+                                uploaded_status = upload_result[0]
+                                # Only set platform_creative_id if not already set
+                                if uploaded_status.creative_id and not creative.data.get("platform_creative_id"):
+                                    creative.data["platform_creative_id"] = uploaded_status.creative_id
+                                    uow.mark_modified(creative, "data")
+                                    platform_creative_ids.append(uploaded_status.creative_id)
+                                    logger.info(
+                                        f"Updated creative {creative_id} with platform_creative_id={uploaded_status.creative_id}"
                                     )
-
-                                    # Build simple asset dict (same as manual approval flow)
-                                    asset = {
-                                        "creative_id": creative.creative_id,
-                                        "package_assignments": [package_id],  # This specific package
-                                        "width": width,
-                                        "height": height,
-                                        "url": url,
-                                        "asset_type": creative_data.get("asset_type", "image"),
-                                        "name": creative.name or f"Creative {creative.creative_id}",
-                                    }
-
-                                    # Validate required fields - FAIL FAST, do not skip
-                                    validation_errors = []
-                                    if not asset["width"] or not asset["height"]:
-                                        validation_errors.append(
-                                            f"Creative {creative_id} missing dimensions (width={asset['width']}, height={asset['height']})"
-                                        )
-                                    if not asset["url"]:
-                                        validation_errors.append(f"Creative {creative_id} missing required URL field")
-
-                                    if validation_errors:
-                                        error_msg = (
-                                            "Cannot create media buy with invalid creatives. "
-                                            "The following creatives are missing required fields:\n"
-                                            + "\n".join(f"  • {err}" for err in validation_errors)
-                                            + "\n\nAll creatives must have dimensions (width/height) and a content URL. "
-                                            "Please ensure creatives are properly synced before creating media buys."
-                                        )
-                                        logger.error(f"[AUTO-APPROVAL] {error_msg}")
-                                        # Raise exception for MCP - this will be caught and returned as error response
-                                        raise ToolError(
-                                            "INVALID_CREATIVES", error_msg, {"creative_errors": validation_errors}
-                                        )
-
-                                    # Upload to GAM using adapter's add_creative_assets method
-                                    upload_result = adapter.add_creative_assets(
-                                        response.media_buy_id if response.media_buy_id else "",
-                                        [asset],
-                                        datetime.now(UTC),
+                                elif creative.data.get("platform_creative_id"):
+                                    logger.info(
+                                        f"Preserving existing platform_creative_id={creative.data.get('platform_creative_id')} "
+                                        f"for creative {creative_id}, not overwriting with upload result"
                                     )
-                                    logger.info(f"Successfully uploaded creative {creative_id} to GAM: {upload_result}")
-
-                                    # Update creative in database with platform_creative_id
-                                    if upload_result and len(upload_result) > 0:
-                                        uploaded_status = upload_result[0]
-                                        # Only set platform_creative_id if not already set
-                                        if uploaded_status.creative_id and not creative.data.get(
-                                            "platform_creative_id"
-                                        ):
-                                            creative.data["platform_creative_id"] = uploaded_status.creative_id
-                                            session.add(creative)
-                                            platform_creative_ids.append(uploaded_status.creative_id)
-                                            logger.info(
-                                                f"Updated creative {creative_id} with platform_creative_id={uploaded_status.creative_id}"
-                                            )
-                                        elif creative.data.get("platform_creative_id"):
-                                            logger.info(
-                                                f"Preserving existing platform_creative_id={creative.data.get('platform_creative_id')} "
-                                                f"for creative {creative_id}, not overwriting with upload result"
-                                            )
-                                            platform_creative_ids.append(creative.data["platform_creative_id"])
-                                except ToolError:
-                                    # Re-raise ToolError - validation failures should fail the entire operation
-                                    raise
-                                except Exception as upload_error:
-                                    # Other exceptions (network errors, etc.) - log and fail
-                                    logger.error(f"Failed to upload creative {creative_id} to GAM: {upload_error}")
-                                    raise ToolError(
-                                        "CREATIVE_UPLOAD_FAILED",
-                                        f"Failed to upload creative {creative_id} to GAM: {str(upload_error)}",
-                                    ) from upload_error
-
-                            # Create database assignment
-                            assignment_id = f"assign_{uuid.uuid4().hex[:12]}"
-                            assignment = DBAssignment(
-                                assignment_id=assignment_id,
-                                tenant_id=tenant["tenant_id"],
-                                media_buy_id=response.media_buy_id,
-                                package_id=response_package_id,
-                                creative_id=creative_id,
-                            )
-                            session.add(assignment)
-
-                        session.commit()
-
-                        # Associate creatives with line items in ad server immediately
-                        if platform_line_item_id and platform_creative_ids:
-                            try:
+                                    platform_creative_ids.append(creative.data["platform_creative_id"])
+                        except ToolError:
+                            # Re-raise ToolError - validation failures should fail the entire operation
+                            raise
+                        except Exception as upload_error:
+                            # Other exceptions (network errors, etc.) - log and fail
+                            logger.error(f"Failed to upload creative {creative_id} to GAM: {upload_error}")
+                            raise ToolError(
+                                "CREATIVE_UPLOAD_FAILED",
+                                f"Failed to upload creative {creative_id} to GAM: {str(upload_error)}",
+                            ) from upload_error
+
+                    # Create database assignment (always, even if not yet uploaded to GAM)
+                    uow.add_assignment(response.media_buy_id, response_package_id, creative_id)
+
+                # Associate creatives with line items in ad server once the assignments are committed
+                if platform_line_item_id and platform_creative_ids:
+
+                    def associate_creatives(
+                        line_item_id: str = str(platform_line_item_id), creative_ids: list[str] = platform_creative_ids
+                    ) -> None:
+                        logger.info(
+                            f"[cyan]Associating {len(creative_ids)} pre-synced creatives with line item {line_item_id}[/cyan]"
+                        )
+                        for result in adapter.associate_creatives([line_item_id], creative_ids):
+                            if result.get("status") == "success":
                                 logger.info(
-                                    f"[cyan]Associating {len(platform_creative_ids)} pre-synced creatives with line item {platform_line_item_id}[/cyan]"
+                                    f"  ✓ Associated creative {result['creative_id']} with line item {result['line_item_id']}"
                                 )
-                                association_results = adapter.associate_creatives(
-                                    [platform_line_item_id], platform_creative_ids
+                            else:
+                                logger.info(
+                                    f"  ✗ Failed to associate creative {result['creative_id']}: {result.get('error', 'Unknown error')}"
                                 )
 
-                                # Log results
-                                for result in association_results:
-                                    if result.get("status") == "success":
-                                        logger.info(
-                                            f"  ✓ Associated creative {result['creative_id']} with line item {result['line_item_id']}"
-                                        )
-                                    else:
-                                        logger.info(
-                                            f"  ✗ Failed to associate creative {result['creative_id']}: {result.get('error', 'Unknown error')}"
-                                        )
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to associate creatives with line item {platform_line_item_id}: {e}"
-                                )
-                        elif platform_creative_ids:
-                            logger.warning(
-                                f"Package {response_package_id} has {len(platform_creative_ids)} creatives but no platform_line_item_id from adapter. "
-                                f"Creatives will need to be associated via sync_creatives."
-                            )
+                    uow.after_commit(f"associate creatives with line item {platform_line_item_id}", associate_creatives)
+                elif platform_creative_ids:
+                    logger.warning(
+                        f"Package {response_package_id} has {len(platform_creative_ids)} creatives but no platform_line_item_id from adapter. "
+                        f"Creatives will need to be associated via sync_creatives."
+                    )
+
+            uow.commit()
+            logger.info(
+                f"Saved media buy {response.media_buy_id} with {len(packages_to_save)} packages to media_packages table"
+            )
 
         # Handle creatives if provided
         # Note: creatives field no longer exists on CreateMediaBuyRequest per AdCP spec
@@ -3469,14 +3313,7 @@ async def _create_media_buy_impl(
 
         # Also log specific media buy activity
         try:
-            principal_name = "Unknown"
-            with get_db_session() as session:
-                principal_stmt = select(ModelPrincipal).filter_by(
-                    principal_id=principal_id, tenant_id=tenant["tenant_id"]
-                )
-                principal_db = session.scalars(principal_stmt).first()
-                if principal_db:
-                    principal_name = principal_db.name
+            principal_name = principal.name
 
             # Calculate duration using new datetime fields (resolved from 'asap' if needed)
             duration_days = (end_time_val - start_time_val).days + 1
@@ -3536,15 +3373,8 @@ async def _create_media_buy_impl(
 
         # Send Slack notification for successful media buy creation
         try:
-            # Get principal name for notification (reuse from activity logging above)
-            principal_name = "Unknown"
-            with get_db_session() as session:
-                principal_stmt2 = select(ModelPrincipal).filter_by(
-                    principal_id=principal_id, tenant_id=tenant["tenant_id"]
-                )
-                principal_db = session.scalars(principal_stmt2).first()
-                if principal_db:
-                    principal_name = principal_db.name
+            # Principal was loaded (and validated) at the start of the request
+            principal_name = principal.name
 
             # Build notifier config from tenant fields
             notifier_config = {
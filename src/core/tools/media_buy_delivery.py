@@ -47,6 +47,7 @@ from src.core.schemas import (
 )
 from src.core.testing_hooks import DeliverySimulator, TimeSimulator, apply_testing_hooks, get_testing_context
 from src.core.validation_helpers import format_validation_error
+from src.services.delivery_facts import fetch_media_buy_deliveries
 
 
 def _context_to_dict(context: ContextObject | None) -> dict[str, Any] | None:
@@ -166,6 +167,49 @@ def _get_media_buy_delivery_impl(
     ]
     pricing_options = _get_pricing_options(pricing_option_ids)
 
+    # Real delivery comes from the synced delivery facts where they cover the period;
+    # the remaining media buys are fetched with one adapter call, so adapters that can
+    # report on many orders at once (GAM) run a single report job
+    use_adapter_delivery = not any(
+        [testing_ctx.dry_run, testing_ctx.mock_time, testing_ctx.jump_to_event, testing_ctx.test_session_id]
+    )
+    adapter_responses = {}
+    if use_adapter_delivery and target_media_buys:
+        media_buy_ids = [media_buy_id for media_buy_id, _ in target_media_buys]
+        try:
+            adapter_responses = fetch_media_buy_deliveries(
+                adapter, tenant["tenant_id"], media_buy_ids, reporting_period, end_dt
+            )
+        except Exception as e:
+            logger.error(f"Error getting delivery for {', '.join(media_buy_ids)}: {e}")
+            context_dict = _context_to_dict(req.context)
+            return GetMediaBuyDeliveryResponse(
+                reporting_period=reporting_period,
+                currency=target_media_buys[0][1].currency,
+                aggregated_totals=AggregatedTotals(
+                    impressions=0.0,
+                    spend=0.0,
+                    clicks=None,
+                    video_completions=None,
+                    media_buy_count=0,
+                ),
+                media_buy_deliveries=[],
+                errors=[{"code": "adapter_error", "message": f"Error getting delivery for {', '.join(media_buy_ids)}"}],
+                context=context_dict,
+            )
+
+    # Pricing info from MediaPackage.package_config, for all media buys at once
+    package_pricing_by_buy: dict[str, dict[str, Any]] = {}
+    if target_media_buys:
+        with get_db_session() as session:
+            media_package_stmt = select(MediaPackage).where(
+                MediaPackage.media_buy_id.in_([media_buy_id for media_buy_id, _ in target_media_buys])
+            )
+            for media_pkg in session.scalars(media_package_stmt).all():
+                pricing_info = (media_pkg.package_config or {}).get("pricing_info")
+                if pricing_info:
+                    package_pricing_by_buy.setdefault(media_pkg.media_buy_id, {})[media_pkg.package_id] = pricing_info
+
     # Collect delivery data for each media buy
     deliveries = []
     total_spend = 0.0
@@ -210,18 +254,14 @@ def _get_media_buy_delivery_impl(
             total_spend_from_adapter = 0.0
             total_impressions_from_adapter = 0
 
-            if not any(
-                [testing_ctx.dry_run, testing_ctx.mock_time, testing_ctx.jump_to_event, testing_ctx.test_session_id]
-            ):
-                # Call adapter to get per-package delivery metrics
+            if use_adapter_delivery:
+                # Per-package delivery metrics from the batched adapter call
                 # Note: Mock adapter returns simulated data, GAM adapter returns real data from Reporting API
-                try:
-                    adapter_response = adapter.get_media_buy_delivery(
-                        media_buy_id=media_buy_id,
-                        date_range=reporting_period,
-                        today=simulation_datetime,
-                    )
-
+                adapter_response = adapter_responses.get(media_buy_id)
+                if adapter_response is None:
+                    spend = 0.0
+                    impressions = 0
+                else:
                     # Map adapter's by_package to package_id -> metrics
                     for adapter_pkg in adapter_response.by_package:
                         adapter_package_metrics[adapter_pkg.package_id] = {
@@ -239,24 +279,6 @@ def _get_media_buy_delivery_impl(
                     else:
                         spend = total_spend_from_adapter
                         impressions = total_impressions_from_adapter
-
-                except Exception as e:
-                    logger.error(f"Error getting delivery for {media_buy_id}: {e}")
-                    context_dict = _context_to_dict(req.context)
-                    return GetMediaBuyDeliveryResponse(
-                        reporting_period=reporting_period,
-                        currency=buy.currency,
-                        aggregated_totals=AggregatedTotals(
-                            impressions=0.0,
-                            spend=0.0,
-                            clicks=None,
-                            video_completions=None,
-                            media_buy_count=0,
-                        ),
-                        media_buy_deliveries=[],
-                        errors=[{"code": "adapter_error", "message": f"Error getting delivery for {media_buy_id}"}],
-                        context=context_dict,
-                    )
             else:
                 # Use simulation for testing
                 # Cast to date to satisfy mypy (SQLAlchemy returns Python date at runtime)
@@ -279,15 +301,7 @@ def _get_media_buy_delivery_impl(
             package_deliveries = []
 
             # Get pricing info from MediaPackage.package_config
-            package_pricing_map = {}
-            with get_db_session() as session:
-                media_package_stmt = select(MediaPackage).where(MediaPackage.media_buy_id == media_buy_id)
-                media_packages = session.scalars(media_package_stmt).all()
-                for media_pkg in media_packages:
-                    package_config = media_pkg.package_config or {}
-                    pricing_info = package_config.get("pricing_info")
-                    if pricing_info:
-                        package_pricing_map[media_pkg.package_id] = pricing_info
+            package_pricing_map = package_pricing_by_buy.get(media_buy_id, {})
 
             # Get packages from raw_request
             if buy.raw_request and isinstance(buy.raw_request, dict):
@@ -9,6 +9,9 @@ Handles media buy updates including:
 """
 
 import logging
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 from typing import Any, cast
 
@@ -22,6 +25,7 @@ from fastmcp.server.context import Context
 from fastmcp.tools.tool import ToolResult
 from pydantic import ValidationError
 from sqlalchemy import select
+from sqlalchemy.orm import attributes
 
 from src.core.tool_context import ToolContext
 
@@ -38,6 +42,7 @@ from src.core.helpers import get_principal_id_from_context
 from src.core.helpers.adapter_helpers import get_adapter
 from src.core.schema_helpers import to_context_object
 from src.core.schemas import (
+    AdapterPackageUpdate,
     AffectedPackage,
     UpdateMediaBuyError,
     UpdateMediaBuyRequest,
@@ -45,6 +50,7 @@ from src.core.schemas import (
 )
 from src.core.testing_hooks import get_testing_context
 from src.core.validation_helpers import format_validation_error
+from src.services.idempotency import idempotent, model_codec
 
 
 def _verify_principal(media_buy_id: str, context: Context | ToolContext):
@@ -111,6 +117,386 @@ def _verify_principal(media_buy_id: str, context: Context | ToolContext):
             raise PermissionError(f"Principal '{principal_id}' does not own media buy '{media_buy_id}'.")
 
 
+# Package changes that need a package_id, in the order their errors are reported
+_PACKAGE_ID_REQUIRED_FOR = (
+    ("paused", "package_id is required when pausing or resuming a package"),
+    ("budget", "package_id is required when updating package budget"),
+    ("creative_ids", "package_id is required when updating creative_ids"),
+    ("creatives", "package_id is required when uploading creatives"),
+    ("creative_assignments", "package_id is required when updating creative_assignments"),
+    ("targeting_overlay", "package_id is required when updating targeting_overlay"),
+)
+
+
+@dataclass
+class _PackageUpdatePlan:
+    """Package-level changes of one update_media_buy request that passed validation."""
+
+    media_buy_id: str  # Internal ID (the request may identify the media buy by buyer_ref)
+    creative_ids: dict[str, list[str]] = field(default_factory=dict)  # package_id -> creative IDs to assign
+
+
+def _fail_update(ctx_manager, step, req: UpdateMediaBuyRequest, errors: list[Error]) -> UpdateMediaBuyError:
+    """Build an error response and record it on the workflow step."""
+    response_data = UpdateMediaBuyError(errors=errors, context=to_context_object(req.context))
+    ctx_manager.update_workflow_step(
+        step.step_id,
+        status="failed",
+        response_data=response_data.model_dump(mode="json"),
+        error_message=errors[0].message,
+    )
+    return response_data
+
+
+def _normalize_agent_url(url: str | None) -> str | None:
+    # Allow /mcp URL variant
+    if not url:
+        return None
+    return url.rstrip("/").removesuffix("/mcp")
+
+
+def _creative_assignment_errors(creatives: list[Any], product: Any) -> list[str]:
+    """Reasons the creatives can't be assigned to a package of the product (None: no restrictions)."""
+    errors = []
+    for creative in creatives:
+        # Creatives in "error" or "rejected" state should not be assignable
+        if creative.status in ["error", "rejected"]:
+            errors.append(f"Creative {creative.creative_id} cannot be assigned (status={creative.status})")
+
+    if not product or not product.format_ids:
+        return errors
+
+    # Build set of supported formats (agent_url, format_id) tuples
+    supported_formats = set()
+    for fmt in product.format_ids:
+        if isinstance(fmt, dict):
+            agent_url = fmt.get("agent_url")
+            format_id = fmt.get("id") or fmt.get("format_id")
+            if agent_url and format_id:
+                supported_formats.add((agent_url, format_id))
+    if not supported_formats:
+        # Product has no format restrictions - allow all
+        return errors
+
+    for creative in creatives:
+        normalized_creative_url = _normalize_agent_url(creative.agent_url)
+        is_supported = any(
+            normalized_creative_url == _normalize_agent_url(supported_url) and creative.format == supported_format_id
+            for supported_url, supported_format_id in supported_formats
+        )
+        if not is_supported:
+            creative_format_display = (
+                f"{creative.agent_url}/{creative.format}" if creative.agent_url else creative.format
+            )
+            supported_formats_display = ", ".join(
+                [f"{url}/{fmt_id}" if url else fmt_id for url, fmt_id in supported_formats]
+            )
+            errors.append(
+                f"Creative {creative.creative_id} format '{creative_format_display}' "
+                f"is not supported by product '{product.name}'. "
+                f"Supported formats: {supported_formats_display}"
+            )
+    return errors
+
+
+def _plan_package_updates(tenant_id: str, media_buy_id: str, packages: list[Any]) -> _PackageUpdatePlan | Error:
+    """Validate the package-level changes of a request in one database session.
+
+    The media buy, its packages, their products and the referenced creatives are loaded
+    with one query each for the whole request rather than per package. Nothing is written.
+
+    Returns:
+        The validated plan, or the first Error found
+
+    Raises:
+        ToolError: INVALID_CREATIVES when creatives can't be assigned to their packages
+    """
+    from src.core.database.models import Creative as DBCreative
+    from src.core.database.models import MediaBuy as MediaBuyModel
+    from src.core.database.models import MediaPackage as MediaPackageModel
+    from src.core.database.models import Product
+
+    package_ids = {pkg_update.package_id for pkg_update in packages if pkg_update.package_id}
+    creative_ids = {creative_id for pkg_update in packages for creative_id in pkg_update.creative_ids or []}
+
+    with get_db_session() as session:
+        # Resolve media_buy_id (might be buyer_ref)
+        mb_stmt = select(MediaBuyModel).where(
+            MediaBuyModel.media_buy_id == media_buy_id, MediaBuyModel.tenant_id == tenant_id
+        )
+        media_buy = session.scalars(mb_stmt).first()
+        if not media_buy:
+            mb_stmt = select(MediaBuyModel).where(
+                MediaBuyModel.buyer_ref == media_buy_id, MediaBuyModel.tenant_id == tenant_id
+            )
+            media_buy = session.scalars(mb_stmt).first()
+        if not media_buy:
+            return Error(code="media_buy_not_found", message=f"Media buy '{media_buy_id}' not found")
+        plan = _PackageUpdatePlan(media_buy_id=media_buy.media_buy_id)
+
+        package_stmt = select(MediaPackageModel).where(
+            MediaPackageModel.media_buy_id == plan.media_buy_id, MediaPackageModel.package_id.in_(package_ids)
+        )
+        db_packages = {pkg.package_id: pkg for pkg in session.scalars(package_stmt).all()}
+
+        product_ids = {pkg.package_config.get("product_id") for pkg in db_packages.values() if pkg.package_config} - {
+            None
+        }
+        products = {}
+        if product_ids:
+            product_stmt = select(Product).where(Product.tenant_id == tenant_id, Product.product_id.in_(product_ids))
+            products = {product.product_id: product for product in session.scalars(product_stmt).all()}
+
+        creatives = {}
+        if creative_ids:
+            creative_stmt = select(DBCreative).where(
+                DBCreative.tenant_id == tenant_id, DBCreative.creative_id.in_(creative_ids)
+            )
+            creatives = {creative.creative_id: creative for creative in session.scalars(creative_stmt).all()}
+
+        validation_errors: list[str] = []
+        for pkg_update in packages:
+            package_id = pkg_update.package_id or ""
+            db_package = db_packages.get(package_id)
+            product_id = (
+                db_package.package_config.get("product_id") if db_package and db_package.package_config else None
+            )
+            product = products.get(product_id) if product_id else None
+
+            if pkg_update.creative_ids is not None:
+                missing_ids = set(pkg_update.creative_ids) - creatives.keys()
+                if missing_ids:
+                    return Error(
+                        code="creatives_not_found", message=f"Creative IDs not found: {', '.join(missing_ids)}"
+                    )
+                # Existence is checked here and status/format below; structure was validated by sync_creatives
+                package_creatives = [creatives[creative_id] for creative_id in dict.fromkeys(pkg_update.creative_ids)]
+                validation_errors.extend(_creative_assignment_errors(package_creatives, product))
+                plan.creative_ids[package_id] = pkg_update.creative_ids
+
+            if pkg_update.creative_assignments:
+                # Validate placement_ids against product's available placements (adcp#208)
+                all_requested_placement_ids: set[str] = set()
+                for ca in pkg_update.creative_assignments:
+                    if ca.placement_ids:
+                        all_requested_placement_ids.update(ca.placement_ids)
+
+                if all_requested_placement_ids:
+                    if not db_package:
+                        return Error(
+                            code="package_not_found",
+                            message=f"Package '{package_id}' not found for media buy '{plan.media_buy_id}'",
+                        )
+                    if product and product.placements:
+                        available_placement_ids = {
+                            str(p.get("placement_id")) for p in product.placements if p.get("placement_id")
+                        }
+                        invalid_ids = all_requested_placement_ids - available_placement_ids
+                        if invalid_ids:
+                            return Error(
+                                code="invalid_placement_ids",
+                                message=f"Invalid placement_ids: {sorted(invalid_ids)}. Available: {sorted(available_placement_ids)}",
+                            )
+                    elif product:
+                        # Product doesn't define placements, so placement targeting not supported
+                        return Error(
+                            code="placement_targeting_not_supported",
+                            message=f"Product '{product_id}' does not support placement targeting (no placements defined)",
+                        )
+
+            if pkg_update.targeting_overlay is not None and not db_package:
+                return Error(
+                    code="package_not_found",
+                    message=f"Package {package_id} not found for media buy {plan.media_buy_id}",
+                )
+
+    if validation_errors:
+        error_msg = (
+            "Cannot update media buy with invalid creatives. "
+            "The following creatives cannot be assigned:\n" + "\n".join(f"  • {err}" for err in validation_errors)
+        )
+        logger.error(f"[UPDATE] {error_msg}")
+        raise ToolError("INVALID_CREATIVES", error_msg, {"creative_errors": validation_errors})
+    return plan
+
+
+def _mark_pending_creatives(session, tenant_id: str, media_buy_id: str, reason: str) -> None:
+    """Move a media buy approved without creatives (draft with approved_at) to pending_creatives."""
+    from src.core.database.models import MediaBuy as MediaBuyModel
+
+    media_buy = session.scalars(
+        select(MediaBuyModel).where(MediaBuyModel.media_buy_id == media_buy_id, MediaBuyModel.tenant_id == tenant_id)
+    ).first()
+    if media_buy and media_buy.status == "draft" and media_buy.approved_at is not None:
+        media_buy.status = "pending_creatives"
+        logger.info(f"[UPDATE] Media buy {media_buy_id} transitioned from draft to pending_creatives ({reason})")
+
+
+def _save_creative_ids_and_targeting(
+    tenant_id: str, plan: _PackageUpdatePlan, packages: list[Any], buyer_ref: str
+) -> list[AffectedPackage]:
+    """Write creative_ids assignments and targeting overlays of all packages in one transaction."""
+    from src.core.database.models import CreativeAssignment as DBAssignment
+    from src.core.database.models import MediaPackage as MediaPackageModel
+
+    targeting_updates = [pkg_update for pkg_update in packages if pkg_update.targeting_overlay is not None]
+    if not plan.creative_ids and not targeting_updates:
+        return []
+
+    affected: list[AffectedPackage] = []
+    with get_db_session() as session:
+        if plan.creative_ids:
+            assignment_stmt = select(DBAssignment).where(
+                DBAssignment.tenant_id == tenant_id,
+                DBAssignment.media_buy_id == plan.media_buy_id,
+                DBAssignment.package_id.in_(plan.creative_ids),
+            )
+            existing_assignments: dict[str, list[Any]] = defaultdict(list)
+            for assignment in session.scalars(assignment_stmt).all():
+                existing_assignments[assignment.package_id].append(assignment)
+
+            for package_id, creative_ids in plan.creative_ids.items():
+                existing_creative_ids = {a.creative_id for a in existing_assignments[package_id]}
+                requested_ids = set(creative_ids)
+                added_ids = requested_ids - existing_creative_ids
+                removed_ids = existing_creative_ids - requested_ids
+
+                for assignment in existing_assignments[package_id]:
+                    if assignment.creative_id in removed_ids:
+                        session.delete(assignment)
+                for creative_id in added_ids:
+                    session.add(
+                        DBAssignment(
+                            assignment_id=f"assign_{uuid.uuid4().hex[:12]}",
+                            tenant_id=tenant_id,
+                            media_buy_id=plan.media_buy_id,
+                            package_id=package_id,
+                            creative_id=creative_id,
+                        )
+                    )
+
+                affected.append(
+                    AffectedPackage(
+                        buyer_ref=buyer_ref,  # Required by AdCP
+                        package_id=package_id,  # Required by AdCP
+                        paused=False,  # Package not paused (active)
+                        buyer_package_ref=package_id,  # Internal field (for backward compat)
+                        changes_applied={  # Internal field
+                            "creative_ids": {
+                                "added": list(added_ids),
+                                "removed": list(removed_ids),
+                                "current": creative_ids,
+                            }
+                        },
+                    )
+                )
+
+            # Check whenever creative_ids are being set (not just when new ones added)
+            if any(plan.creative_ids.values()):
+                _mark_pending_creatives(session, tenant_id, plan.media_buy_id, "creative_ids assigned")
+
+        if targeting_updates:
+            package_stmt = select(MediaPackageModel).where(
+                MediaPackageModel.media_buy_id == plan.media_buy_id,
+                MediaPackageModel.package_id.in_({pkg_update.package_id for pkg_update in targeting_updates}),
+            )
+            media_packages = {pkg.package_id: pkg for pkg in session.scalars(package_stmt).all()}
+
+            for pkg_update in targeting_updates:
+                media_package = media_packages[pkg_update.package_id]
+                # Convert Targeting Pydantic model to dict
+                targeting_dict = (
+                    pkg_update.targeting_overlay.model_dump(exclude_none=True)
+                    if hasattr(pkg_update.targeting_overlay, "model_dump")
+                    else pkg_update.targeting_overlay
+                )
+                media_package.package_config["targeting"] = targeting_dict
+                # Flag the JSON field as modified so SQLAlchemy persists it
+                attributes.flag_modified(media_package, "package_config")
+                logger.info(f"[update_media_buy] Updated package {pkg_update.package_id} targeting: {targeting_dict}")
+
+                affected.append(
+                    AffectedPackage(
+                        buyer_ref=pkg_update.package_id,
+                        package_id=pkg_update.package_id,
+                        paused=False,  # Package not paused (active)
+                        changes_applied={"targeting": targeting_dict},
+                        buyer_package_ref=pkg_update.package_id,  # Legacy compatibility
+                    )
+                )
+
+        session.commit()
+    return affected
+
+
+def _save_creative_assignments(
+    tenant_id: str, plan: _PackageUpdatePlan, packages: list[Any], buyer_ref: str
+) -> list[AffectedPackage]:
+    """Write creative_assignments (weight/placement updates, adcp#208) of all packages in one transaction."""
+    from src.core.database.models import CreativeAssignment as DBAssignment
+
+    assignment_updates = [pkg_update for pkg_update in packages if pkg_update.creative_assignments]
+    if not assignment_updates:
+        return []
+
+    affected: list[AffectedPackage] = []
+    with get_db_session() as session:
+        assignment_stmt = select(DBAssignment).where(
+            DBAssignment.tenant_id == tenant_id,
+            DBAssignment.media_buy_id == plan.media_buy_id,
+            DBAssignment.package_id.in_({pkg_update.package_id for pkg_update in assignment_updates}),
+        )
+        assignments = {(a.package_id, a.creative_id): a for a in session.scalars(assignment_stmt).all()}
+
+        for pkg_update in assignment_updates:
+            updated_assignments = []
+            for ca in pkg_update.creative_assignments:
+                # Schema validates and coerces dict inputs to LibraryCreativeAssignment
+                db_assignment = assignments.get((pkg_update.package_id, ca.creative_id))
+                if db_assignment:
+                    if ca.weight is not None:
+                        db_assignment.weight = int(ca.weight)
+                    # adcp#208: persist placement_ids for placement-specific targeting
+                    if ca.placement_ids is not None:
+                        db_assignment.placement_ids = ca.placement_ids
+                else:
+                    db_assignment = DBAssignment(
+                        assignment_id=f"assign_{uuid.uuid4().hex[:12]}",
+                        tenant_id=tenant_id,
+                        media_buy_id=plan.media_buy_id,
+                        package_id=pkg_update.package_id,
+                        creative_id=ca.creative_id,
+                        weight=int(ca.weight) if ca.weight is not None else 100,
+                        # adcp#208: placement-specific targeting
+                        placement_ids=ca.placement_ids,
+                    )
+                    session.add(db_assignment)
+                    assignments[(pkg_update.package_id, ca.creative_id)] = db_assignment
+                updated_assignments.append(ca.creative_id)
+
+            affected.append(
+                AffectedPackage(
+                    buyer_ref=buyer_ref,
+                    package_id=pkg_update.package_id,
+                    paused=False,
+                    buyer_package_ref=pkg_update.package_id,
+                    changes_applied={"creative_assignments_updated": updated_assignments},
+                )
+            )
+
+        _mark_pending_creatives(session, tenant_id, plan.media_buy_id, "creative_assignments processed")
+        session.commit()
+    return affected
+
+
+# Without a client Idempotency-Key, only concurrent duplicates are coalesced (replay TTL 0):
+# re-sending an earlier update later (pause, resume, pause) must apply it again
+@idempotent(
+    "update_media_buy",
+    model_codec(UpdateMediaBuySuccess),
+    natural_key=lambda args: args.get("media_buy_id") or args.get("buyer_ref"),
+    replay_ttl_seconds=0,
+)
 def _update_media_buy_impl(
     media_buy_id: str | None = None,
     buyer_ref: str | None = None,
@@ -518,52 +904,34 @@ def _update_media_buy_impl(
             )
             return success_response
 
-    # Handle package-level updates
+    # Handle package-level updates: every change is validated first in one database pass,
+    # pauses/resumes/budgets go to the ad server in one batched adapter call, and the
+    # database changes are written afterwards, so a rejected package leaves nothing half-applied
     if req.packages:
         for pkg_update in req.packages:
-            # Handle paused state
+            if pkg_update.package_id:
+                continue
+            for field_name, error_msg in _PACKAGE_ID_REQUIRED_FOR:
+                if getattr(pkg_update, field_name, None) not in (None, []):
+                    return _fail_update(ctx_manager, step, req, [Error(code="missing_package_id", message=error_msg)])
+
+        plan = _plan_package_updates(tenant["tenant_id"], req.media_buy_id, req.packages)
+        if isinstance(plan, Error):
+            return _fail_update(ctx_manager, step, req, [plan])
+
+        adapter_updates: list[AdapterPackageUpdate] = []
+        budget_changes: dict[str, tuple[float, str]] = {}
+        for pkg_update in req.packages:
+            package_id = pkg_update.package_id or ""
             if pkg_update.paused is not None:
                 # adcp 2.12.0+: paused=True means pause, paused=False means resume
-                action = "pause_package" if pkg_update.paused else "resume_package"
-                result = adapter.update_media_buy(
-                    media_buy_id=req.media_buy_id,
-                    buyer_ref=req.buyer_ref or "",
-                    action=action,
-                    package_id=pkg_update.package_id,
-                    budget=None,
-                    today=datetime.combine(today, datetime.min.time(), tzinfo=UTC),
-                )
-                # adcp v1.2.1 oneOf pattern: Check if result is Error variant
-                if hasattr(result, "errors") and result.errors:
-                    error_message = (
-                        result.errors[0].message if (result.errors and len(result.errors) > 0) else "Update failed"
-                    )
-                    response_data = UpdateMediaBuyError(errors=result.errors)
-                    ctx_manager.update_workflow_step(
-                        step.step_id,
-                        status="failed",
-                        response_data=response_data.model_dump(mode="json"),
-                        error_message=error_message,
+                adapter_updates.append(
+                    AdapterPackageUpdate(
+                        package_id=package_id, action="pause_package" if pkg_update.paused else "resume_package"
                     )
-                    return response_data
+                )
 
-            # Handle budget updates
             if pkg_update.budget is not None:
-                # Validate package_id is provided (required for budget updates)
-                if not pkg_update.package_id:
-                    error_msg = "package_id is required when updating package budget"
-                    response_data = UpdateMediaBuyError(
-                        errors=[Error(code="missing_package_id", message=error_msg)],
-                        context=to_context_object(req.context),
-                    )
-                    ctx_manager.update_workflow_step(
-                        step.step_id,
-                        status="failed",
-                        response_data=response_data.model_dump(mode="json"),
-                        error_message=error_msg,
-                    )
-                    return response_data
-
                 # Extract budget amount - handle both float and Budget object
                 budget_amount: float
                 currency: str
@@ -574,587 +942,92 @@ def _update_media_buy_impl(
                     # Budget object with .total and .currency attributes
                     budget_amount = float(pkg_update.budget.total)
                     currency = pkg_update.budget.currency if hasattr(pkg_update.budget, "currency") else "USD"
-
-                result = adapter.update_media_buy(
-                    media_buy_id=req.media_buy_id,
-                    buyer_ref=req.buyer_ref or "",
-                    action="update_package_budget",
-                    package_id=pkg_update.package_id,
-                    budget=int(budget_amount),
-                    today=datetime.combine(today, datetime.min.time(), tzinfo=UTC),
+                adapter_updates.append(
+                    AdapterPackageUpdate(package_id=package_id, action="update_package_budget", budget=budget_amount)
                 )
-                # adcp v1.2.1 oneOf pattern: Check if result is Error variant
-                if hasattr(result, "errors") and result.errors:
-                    error_message = (
-                        result.errors[0].message if (result.errors and len(result.errors) > 0) else "Update failed"
-                    )
-                    response_data = UpdateMediaBuyError(errors=result.errors)
-                    ctx_manager.update_workflow_step(
-                        step.step_id,
-                        status="failed",
-                        response_data=response_data.model_dump(mode="json"),
-                        error_message=error_message,
-                    )
-                    return response_data
+                budget_changes[package_id] = (budget_amount, currency)
+
+        if adapter_updates:
+            results = adapter.update_packages(
+                media_buy_id=req.media_buy_id,
+                buyer_ref=req.buyer_ref or "",
+                updates=adapter_updates,
+                today=datetime.combine(today, datetime.min.time(), tzinfo=UTC),
+            )
+            errors = [result.error for result in results if result.error is not None]
+            if errors:
+                logger.warning(
+                    f"[update_media_buy] {len(errors)} of {len(results)} package changes rejected for "
+                    f"{req.media_buy_id}: {[(r.package_id, r.action) for r in results if r.error is not None]}"
+                )
+                return _fail_update(ctx_manager, step, req, errors)
 
-                # Track budget update in affected_packages
-                # At this point, pkg_update.package_id is guaranteed to be str (checked above)
+            for update in adapter_updates:
+                if update.action == "update_package_budget":
+                    budget_amount, currency = budget_changes[update.package_id]
+                    changes_applied: dict[str, Any] = {"budget": {"updated": budget_amount, "currency": currency}}
+                else:
+                    changes_applied = {"paused": update.action == "pause_package"}
                 affected_packages_list.append(
                     AffectedPackage(
                         buyer_ref=req.buyer_ref or "",  # Required by AdCP
-                        package_id=pkg_update.package_id,  # Required by AdCP (guaranteed str)
-                        paused=False,  # Package not paused (active)
-                        buyer_package_ref=pkg_update.package_id,  # Internal field (for backward compat)
-                        changes_applied={"budget": {"updated": budget_amount, "currency": currency}},  # Internal field
+                        package_id=update.package_id,  # Required by AdCP
+                        paused=update.action == "pause_package",
+                        buyer_package_ref=update.package_id,  # Internal field (for backward compat)
+                        changes_applied=changes_applied,  # Internal field
                     )
                 )
 
-            # Handle creative_ids updates (AdCP v2.2.0+)
-            if pkg_update.creative_ids is not None:
-                # Validate package_id is provided
-                if not pkg_update.package_id:
-                    error_msg = "package_id is required when updating creative_ids"
-                    response_data = UpdateMediaBuyError(
-                        errors=[Error(code="missing_package_id", message=error_msg)],
-                        context=to_context_object(req.context),
-                    )
-                    ctx_manager.update_workflow_step(
-                        step.step_id,
-                        status="failed",
-                        response_data=response_data.model_dump(mode="json"),
-                        error_message=error_msg,
-                    )
-                    return response_data
-
-                from src.core.database.database_session import get_db_session
-                from src.core.database.models import Creative as DBCreative
-                from src.core.database.models import CreativeAssignment as DBAssignment
-                from src.core.database.models import MediaBuy as MediaBuyModel
-
-                with get_db_session() as session:
-                    # Resolve media_buy_id (might be buyer_ref)
-                    mb_stmt = select(MediaBuyModel).where(
-                        MediaBuyModel.media_buy_id == req.media_buy_id, MediaBuyModel.tenant_id == tenant["tenant_id"]
-                    )
-                    media_buy_obj = session.scalars(mb_stmt).first()
-
-                    # Try buyer_ref if not found
-                    if not media_buy_obj:
-                        mb_stmt = select(MediaBuyModel).where(
-                            MediaBuyModel.buyer_ref == req.media_buy_id, MediaBuyModel.tenant_id == tenant["tenant_id"]
-                        )
-                        media_buy_obj = session.scalars(mb_stmt).first()
-
-                    if not media_buy_obj:
-                        error_msg = f"Media buy '{req.media_buy_id}' not found"
-                        response_data = UpdateMediaBuyError(
-                            errors=[Error(code="media_buy_not_found", message=error_msg)],
-                            context=to_context_object(req.context),
-                        )
-                        ctx_manager.update_workflow_step(
-                            step.step_id,
-                            status="failed",
-                            response_data=response_data.model_dump(mode="json"),
-                            error_message=error_msg,
-                        )
-                        return response_data
-
-                    # Use the actual internal media_buy_id
-                    actual_media_buy_id = media_buy_obj.media_buy_id
-
-                    # Validate all creative IDs exist
-                    creative_stmt = select(DBCreative).where(
-                        DBCreative.tenant_id == tenant["tenant_id"],
-                        DBCreative.creative_id.in_(pkg_update.creative_ids),
-                    )
-                    creatives_list = session.scalars(creative_stmt).all()
-                    found_creative_ids = {c.creative_id for c in creatives_list}
-                    missing_ids = set(pkg_update.creative_ids) - found_creative_ids
-
-                    if missing_ids:
-                        error_msg = f"Creative IDs not found: {', '.join(missing_ids)}"
-                        response_data = UpdateMediaBuyError(
-                            errors=[Error(code="creatives_not_found", message=error_msg)],
-                            context=to_context_object(req.context),
-                        )
-                        ctx_manager.update_workflow_step(
-                            step.step_id,
-                            status="failed",
-                            response_data=response_data.model_dump(mode="json"),
-                            error_message=error_msg,
-                        )
-                        return response_data
-
-                    # Validate creatives are in usable state before updating
-                    # Note: We validate existence (already done above) and status, not structure
-                    # Structure validation happens during sync_creatives - here we just assign
-                    validation_errors = []
-                    for creative in creatives_list:
-                        # Check if creative is in a valid state for assignment
-                        # Creatives in "error" or "rejected" state should not be assignable
-                        if creative.status in ["error", "rejected"]:
-                            validation_errors.append(
-                                f"Creative {creative.creative_id} cannot be assigned (status={creative.status})"
-                            )
-
-                    # Validate creative formats against package product formats
-                    # Get package and product to check supported formats
-                    from src.core.database.models import MediaPackage as MediaPackageModel
-                    from src.core.database.models import Product
-
-                    package_stmt = select(MediaPackageModel).where(
-                        MediaPackageModel.package_id == pkg_update.package_id,
-                        MediaPackageModel.media_buy_id == actual_media_buy_id,
-                    )
-                    db_package = session.scalars(package_stmt).first()
-
-                    # Get product_id from package_config
-                    product_id = (
-                        db_package.package_config.get("product_id")
-                        if db_package and db_package.package_config
-                        else None
-                    )
-
-                    if product_id:
-                        # Get product to check supported formats
-                        product_stmt = select(Product).where(
-                            Product.tenant_id == tenant["tenant_id"], Product.product_id == product_id
-                        )
-                        product = session.scalars(product_stmt).first()
-
-                        if product and product.format_ids:
-                            # Build set of supported formats (agent_url, format_id) tuples
-                            supported_formats = set()
-                            for fmt in product.format_ids:
-                                if isinstance(fmt, dict):
-                                    agent_url = fmt.get("agent_url")
-                                    format_id = fmt.get("id") or fmt.get("format_id")
-                                    if agent_url and format_id:
-                                        supported_formats.add((agent_url, format_id))
-
-                            # Check each creative's format
-                            for creative in creatives_list:
-                                creative_agent_url = creative.agent_url
-                                creative_format_id = creative.format
-
-                                # Allow /mcp URL variant
-                                def normalize_url(url: str | None) -> str | None:
-                                    if not url:
-                                        return None
-                                    return url.rstrip("/").removesuffix("/mcp")
-
-                                normalized_creative_url = normalize_url(creative_agent_url)
-                                is_supported = False
-
-                                for supported_url, supported_format_id in supported_formats:
-                                    normalized_supported_url = normalize_url(supported_url)
-                                    if (
-                                        normalized_creative_url == normalized_supported_url
-                                        and creative_format_id == supported_format_id
-                                    ):
-                                        is_supported = True
-                                        break
-
-                                if not supported_formats:
-                                    # Product has no format restrictions - allow all
-                                    is_supported = True
-
-                                if not is_supported:
-                                    creative_format_display = (
-                                        f"{creative_agent_url}/{creative_format_id}"
-                                        if creative_agent_url
-                                        else creative_format_id
-                                    )
-                                    supported_formats_display = ", ".join(
-                                        [f"{url}/{fmt_id}" if url else fmt_id for url, fmt_id in supported_formats]
-                                    )
-                                    validation_errors.append(
-                                        f"Creative {creative.creative_id} format '{creative_format_display}' "
-                                        f"is not supported by product '{product.name}'. "
-                                        f"Supported formats: {supported_formats_display}"
-                                    )
-
-                    if validation_errors:
-                        error_msg = (
-                            "Cannot update media buy with invalid creatives. "
-                            "The following creatives cannot be assigned:\n"
-                            + "\n".join(f"  • {err}" for err in validation_errors)
-                        )
-                        logger.error(f"[UPDATE] {error_msg}")
-                        raise ToolError("INVALID_CREATIVES", error_msg, {"creative_errors": validation_errors})
-
-                    # Get existing assignments for this package
-                    assignment_stmt = select(DBAssignment).where(
-                        DBAssignment.tenant_id == tenant["tenant_id"],
-                        DBAssignment.media_buy_id == actual_media_buy_id,
-                        DBAssignment.package_id == pkg_update.package_id,
-                    )
-                    existing_assignments = session.scalars(assignment_stmt).all()
-                    existing_creative_ids = {a.creative_id for a in existing_assignments}
-
-                    # Determine added and removed creative IDs
-                    requested_ids = set(pkg_update.creative_ids)
-                    added_ids = requested_ids - existing_creative_ids
-                    removed_ids = existing_creative_ids - requested_ids
-
-                    # Remove old assignments
-                    for assignment in existing_assignments:
-                        if assignment.creative_id in removed_ids:
-                            session.delete(assignment)
-
-                    # Add new assignments
-                    import uuid
-
-                    for creative_id in added_ids:
-                        assignment_id = f"assign_{uuid.uuid4().hex[:12]}"
-                        assignment = DBAssignment(
-                            assignment_id=assignment_id,
-                            tenant_id=tenant["tenant_id"],
-                            media_buy_id=actual_media_buy_id,
-                            package_id=pkg_update.package_id,
-                            creative_id=creative_id,
-                        )
-                        session.add(assignment)
-
-                    # If media buy was approved (approved_at set) but is in draft status
-                    # (meaning it was approved without creatives), transition to pending_creatives
-                    # Check whenever creative_ids are being set (not just when new ones added)
-                    if (
-                        pkg_update.creative_ids
-                        and media_buy_obj.status == "draft"
-                        and media_buy_obj.approved_at is not None
-                    ):
-                        media_buy_obj.status = "pending_creatives"
-                        logger.info(
-                            f"[UPDATE] Media buy {actual_media_buy_id} transitioned from draft to pending_creatives "
-                            f"(creative_ids: {pkg_update.creative_ids})"
-                        )
-
-                    session.commit()
-
-                    # Store results for affected_packages response
-                    affected_packages_list.append(
-                        AffectedPackage(
-                            buyer_ref=req.buyer_ref or "",  # Required by AdCP
-                            package_id=pkg_update.package_id,  # Required by AdCP
-                            paused=False,  # Package not paused (active)
-                            buyer_package_ref=pkg_update.package_id,  # Internal field (for backward compat)
-                            changes_applied={  # Internal field
-                                "creative_ids": {
-                                    "added": list(added_ids),
-                                    "removed": list(removed_ids),
-                                    "current": pkg_update.creative_ids,
-                                }
-                            },
-                        )
-                    )
+        affected_packages_list.extend(
+            _save_creative_ids_and_targeting(tenant["tenant_id"], plan, req.packages, req.buyer_ref or "")
+        )
 
-            # Handle creatives (inline upload) - AdCP 2.5
-            if hasattr(pkg_update, "creatives") and pkg_update.creatives:
-                # Validate package_id is provided
-                if not pkg_update.package_id:
-                    error_msg = "package_id is required when uploading creatives"
-                    response_data = UpdateMediaBuyError(
-                        errors=[Error(code="missing_package_id", message=error_msg)],
-                        context=to_context_object(req.context),
-                    )
-                    ctx_manager.update_workflow_step(
-                        step.step_id,
-                        status="failed",
-                        response_data=response_data.model_dump(mode="json"),
-                        error_message=error_msg,
-                    )
-                    return response_data
+        # Handle creatives (inline upload) - AdCP 2.5
+        for pkg_update in req.packages:
+            if not (hasattr(pkg_update, "creatives") and pkg_update.creatives):
+                continue
 
-                from src.core.tools.creatives import _sync_creatives_impl
+            from src.core.tools.creatives import _sync_creatives_impl
 
-                # Sync creatives (upload/update)
-                creative_dicts: list[dict[str, Any]] = []
-                for c in pkg_update.creatives:
-                    if hasattr(c, "model_dump"):
-                        creative_dicts.append(c.model_dump(mode="json"))
-                    else:
-                        creative_dicts.append(cast(dict[str, Any], c))
-                sync_response = _sync_creatives_impl(
-                    creatives=creative_dicts,
-                    assignments={
-                        (c.get("creative_id") if isinstance(c, dict) else c.creative_id): [pkg_update.package_id]
-                        for c in pkg_update.creatives
-                        if (c.get("creative_id") if isinstance(c, dict) else getattr(c, "creative_id", None))
-                    },
-                    ctx=ctx,
-                )
-
-                # Check for sync errors
-                failed_creatives = [r for r in sync_response.creatives if r.action == "failed"]
-                if failed_creatives:
-                    error_msgs = [f"{r.creative_id}: {', '.join(r.errors or [])}" for r in failed_creatives]
-                    error_msg = f"Failed to sync creatives: {'; '.join(error_msgs)}"
-                    response_data = UpdateMediaBuyError(
-                        errors=[Error(code="creative_sync_failed", message=error_msg)],
-                        context=to_context_object(req.context),
-                    )
-                    ctx_manager.update_workflow_step(
-                        step.step_id,
-                        status="failed",
-                        response_data=response_data.model_dump(mode="json"),
-                        error_message=error_msg,
-                    )
-                    return response_data
+            # Sync creatives (upload/update)
+            creative_dicts: list[dict[str, Any]] = []
+            for c in pkg_update.creatives:
+                if hasattr(c, "model_dump"):
+                    creative_dicts.append(c.model_dump(mode="json"))
+                else:
+                    creative_dicts.append(cast(dict[str, Any], c))
+            sync_response = _sync_creatives_impl(
+                creatives=creative_dicts,
+                assignments={
+                    (c.get("creative_id") if isinstance(c, dict) else c.creative_id): [pkg_update.package_id]
+                    for c in pkg_update.creatives
+                    if (c.get("creative_id") if isinstance(c, dict) else getattr(c, "creative_id", None))
+                },
+                ctx=ctx,
+            )
 
-                # Track in affected_packages
-                synced_ids = [r.creative_id for r in sync_response.creatives if r.action in ["created", "updated"]]
-                affected_packages_list.append(
-                    AffectedPackage(
-                        buyer_ref=req.buyer_ref or "",
-                        package_id=pkg_update.package_id,
-                        paused=False,
-                        buyer_package_ref=pkg_update.package_id,
-                        changes_applied={"creatives_uploaded": synced_ids},
-                    )
+            # Check for sync errors
+            failed_creatives = [r for r in sync_response.creatives if r.action == "failed"]
+            if failed_creatives:
+                error_msgs = [f"{r.creative_id}: {', '.join(r.errors or [])}" for r in failed_creatives]
+                error_msg = f"Failed to sync creatives: {'; '.join(error_msgs)}"
+                return _fail_update(ctx_manager, step, req, [Error(code="creative_sync_failed", message=error_msg)])
+
+            # Track in affected_packages
+            synced_ids = [r.creative_id for r in sync_response.creatives if r.action in ["created", "updated"]]
+            affected_packages_list.append(
+                AffectedPackage(
+                    buyer_ref=req.buyer_ref or "",
+                    package_id=pkg_update.package_id or "",
+                    paused=False,
+                    buyer_package_ref=pkg_update.package_id,
+                    changes_applied={"creatives_uploaded": synced_ids},
                 )
+            )
 
-            # Handle creative_assignments (weight/placement updates) - adcp#208
-            if pkg_update.creative_assignments:
-                # Validate package_id is provided
-                if not pkg_update.package_id:
-                    error_msg = "package_id is required when updating creative_assignments"
-                    response_data = UpdateMediaBuyError(
-                        errors=[Error(code="missing_package_id", message=error_msg)],
-                        context=to_context_object(req.context),
-                    )
-                    ctx_manager.update_workflow_step(
-                        step.step_id,
-                        status="failed",
-                        response_data=response_data.model_dump(mode="json"),
-                        error_message=error_msg,
-                    )
-                    return response_data
-
-                from src.core.database.database_session import get_db_session
-                from src.core.database.models import CreativeAssignment as DBAssignment
-                from src.core.database.models import MediaBuy as MediaBuyModel
-                from src.core.database.models import MediaPackage as MediaPackageModel
-                from src.core.database.models import Product as ProductModel
-
-                with get_db_session() as session:
-                    # Resolve media_buy_id
-                    mb_stmt = select(MediaBuyModel).where(
-                        MediaBuyModel.media_buy_id == req.media_buy_id, MediaBuyModel.tenant_id == tenant["tenant_id"]
-                    )
-                    media_buy_obj = session.scalars(mb_stmt).first()
-                    if not media_buy_obj:
-                        mb_stmt = select(MediaBuyModel).where(
-                            MediaBuyModel.buyer_ref == req.media_buy_id, MediaBuyModel.tenant_id == tenant["tenant_id"]
-                        )
-                        media_buy_obj = session.scalars(mb_stmt).first()
-
-                    if not media_buy_obj:
-                        error_msg = f"Media buy '{req.media_buy_id}' not found"
-                        response_data = UpdateMediaBuyError(
-                            errors=[Error(code="media_buy_not_found", message=error_msg)],
-                            context=to_context_object(req.context),
-                        )
-                        return response_data
-
-                    actual_media_buy_id = media_buy_obj.media_buy_id
-
-                    # Validate placement_ids against product's available placements (adcp#208)
-                    # Build set of placement_ids from all creative_assignments
-                    all_requested_placement_ids: set[str] = set()
-                    for ca in pkg_update.creative_assignments:
-                        if ca.placement_ids:
-                            all_requested_placement_ids.update(ca.placement_ids)
-
-                    if all_requested_placement_ids:
-                        # Get package to find product_id
-                        pkg_stmt = select(MediaPackageModel).where(
-                            MediaPackageModel.media_buy_id == actual_media_buy_id,
-                            MediaPackageModel.package_id == pkg_update.package_id,
-                        )
-                        pkg_record = session.scalars(pkg_stmt).first()
-
-                        if not pkg_record:
-                            error_msg = (
-                                f"Package '{pkg_update.package_id}' not found for media buy '{actual_media_buy_id}'"
-                            )
-                            response_data = UpdateMediaBuyError(
-                                errors=[Error(code="package_not_found", message=error_msg)],
-                                context=to_context_object(req.context),
-                            )
-                            return response_data
-
-                        product_id = pkg_record.package_config.get("product_id") if pkg_record.package_config else None
-
-                        if product_id:
-                            # Get product's placements
-                            prod_stmt = select(ProductModel).where(
-                                ProductModel.tenant_id == tenant["tenant_id"],
-                                ProductModel.product_id == product_id,
-                            )
-                            product_obj = session.scalars(prod_stmt).first()
-
-                            if product_obj and product_obj.placements:
-                                available_placement_ids: set[str] = {
-                                    str(p.get("placement_id")) for p in product_obj.placements if p.get("placement_id")
-                                }
-                                invalid_ids = all_requested_placement_ids - available_placement_ids
-                                if invalid_ids:
-                                    error_msg = f"Invalid placement_ids: {sorted(invalid_ids)}. Available: {sorted(available_placement_ids)}"
-                                    response_data = UpdateMediaBuyError(
-                                        errors=[Error(code="invalid_placement_ids", message=error_msg)],
-                                        context=to_context_object(req.context),
-                                    )
-                                    return response_data
-                            elif product_obj and not product_obj.placements:
-                                # Product doesn't define placements, so placement targeting not supported
-                                error_msg = f"Product '{product_id}' does not support placement targeting (no placements defined)"
-                                response_data = UpdateMediaBuyError(
-                                    errors=[Error(code="placement_targeting_not_supported", message=error_msg)],
-                                    context=to_context_object(req.context),
-                                )
-                                return response_data
-
-                    updated_assignments = []
-                    new_assignments_created = []
-
-                    for ca in pkg_update.creative_assignments:
-                        # Schema validates and coerces dict inputs to LibraryCreativeAssignment
-                        creative_id = ca.creative_id
-                        weight = ca.weight
-                        placement_ids = ca.placement_ids
-
-                        # Find or create assignment record
-                        assign_stmt = select(DBAssignment).where(
-                            DBAssignment.tenant_id == tenant["tenant_id"],
-                            DBAssignment.media_buy_id == actual_media_buy_id,
-                            DBAssignment.package_id == pkg_update.package_id,
-                            DBAssignment.creative_id == creative_id,
-                        )
-                        db_assignment = session.scalars(assign_stmt).first()
-
-                        if db_assignment:
-                            # Update existing assignment
-                            if weight is not None:
-                                db_assignment.weight = int(weight)
-                            # adcp#208: persist placement_ids for placement-specific targeting
-                            if placement_ids is not None:
-                                db_assignment.placement_ids = placement_ids
-                            updated_assignments.append(creative_id)
-                        else:
-                            # Create new assignment with weight and placement_ids
-                            import uuid as uuid_module
-
-                            assignment_id = f"assign_{uuid_module.uuid4().hex[:12]}"
-                            new_assignment = DBAssignment(
-                                assignment_id=assignment_id,
-                                tenant_id=tenant["tenant_id"],
-                                media_buy_id=actual_media_buy_id,
-                                package_id=pkg_update.package_id,
-                                creative_id=creative_id,
-                                weight=int(weight) if weight is not None else 100,
-                                # adcp#208: placement-specific targeting
-                                placement_ids=placement_ids,
-                            )
-                            session.add(new_assignment)
-                            updated_assignments.append(creative_id)
-                            new_assignments_created.append(creative_id)
-
-                    # If media buy was approved (approved_at set) but is in draft status
-                    # (meaning it was approved without creatives), transition to pending_creatives
-                    # Check whenever creative_assignments are being set (not just when new ones created)
-                    if (
-                        pkg_update.creative_assignments
-                        and media_buy_obj.status == "draft"
-                        and media_buy_obj.approved_at is not None
-                    ):
-                        media_buy_obj.status = "pending_creatives"
-                        logger.info(
-                            f"[UPDATE] Media buy {actual_media_buy_id} transitioned from draft to pending_creatives "
-                            f"(creative_assignments processed: {updated_assignments})"
-                        )
-
-                    session.commit()
-
-                    # Track in affected_packages
-                    affected_packages_list.append(
-                        AffectedPackage(
-                            buyer_ref=req.buyer_ref or "",
-                            package_id=pkg_update.package_id,
-                            paused=False,
-                            buyer_package_ref=pkg_update.package_id,
-                            changes_applied={"creative_assignments_updated": updated_assignments},
-                        )
-                    )
-
-            # Handle targeting_overlay updates
-            if pkg_update.targeting_overlay is not None:
-                # Validate package_id is provided
-                if not pkg_update.package_id:
-                    error_msg = "package_id is required when updating targeting_overlay"
-                    response_data = UpdateMediaBuyError(
-                        errors=[Error(code="missing_package_id", message=error_msg)],
-                    )
-                    ctx_manager.update_workflow_step(
-                        step.step_id,
-                        status="failed",
-                        response_data=response_data.model_dump(mode="json"),
-                        error_message=error_msg,
-                    )
-                    return response_data
-
-                from sqlalchemy.orm import attributes
-
-                from src.core.database.database_session import get_db_session
-                from src.core.database.models import MediaPackage as MediaPackageModel
-
-                with get_db_session() as session:
-                    # Get the package
-                    package_stmt = select(MediaPackageModel).where(
-                        MediaPackageModel.package_id == pkg_update.package_id,
-                        MediaPackageModel.media_buy_id == req.media_buy_id,
-                    )
-                    media_package = session.scalars(package_stmt).first()
-
-                    if not media_package:
-                        error_msg = f"Package {pkg_update.package_id} not found for media buy {req.media_buy_id}"
-                        response_data = UpdateMediaBuyError(
-                            errors=[Error(code="package_not_found", message=error_msg)],
-                        )
-                        ctx_manager.update_workflow_step(
-                            step.step_id,
-                            status="failed",
-                            response_data=response_data.model_dump(mode="json"),
-                            error_message=error_msg,
-                        )
-                        return response_data
-
-                    # Update targeting in package_config JSON
-                    # Convert Targeting Pydantic model to dict
-                    targeting_dict = (
-                        pkg_update.targeting_overlay.model_dump(exclude_none=True)
-                        if hasattr(pkg_update.targeting_overlay, "model_dump")
-                        else pkg_update.targeting_overlay
-                    )
-
-                    media_package.package_config["targeting"] = targeting_dict
-                    # Flag the JSON field as modified so SQLAlchemy persists it
-                    attributes.flag_modified(media_package, "package_config")
-                    session.commit()
-                    logger.info(
-                        f"[update_media_buy] Updated package {pkg_update.package_id} targeting: {targeting_dict}"
-                    )
-
-                    # Track targeting update in affected_packages
-                    affected_packages_list.append(
-                        AffectedPackage(
-                            buyer_ref=pkg_update.package_id,
-                            package_id=pkg_update.package_id,
-                            paused=False,  # Package not paused (active)
-                            changes_applied={"targeting": targeting_dict},
-                            buyer_package_ref=pkg_update.package_id,  # Legacy compatibility
-                        )
-                    )
+        affected_packages_list.extend(
+            _save_creative_assignments(tenant["tenant_id"], plan, req.packages, req.buyer_ref or "")
+        )
 
     # Handle budget updates (handle both float and Budget object)
     if req.budget is not None:
@@ -1195,6 +1068,7 @@ def _update_media_buy_impl(
             from sqlalchemy import update as sqlalchemy_update
 
             from src.core.database.models import MediaBuy
+            from src.services.revenue_rollup_service import refresh_media_buy_revenue
 
             with get_db_session() as db_session:
                 update_stmt = (
@@ -1203,6 +1077,8 @@ def _update_media_buy_impl(
                     .values(budget=total_budget, currency=budget_currency)
                 )
                 db_session.execute(update_stmt)
+                # Bulk update() bypasses the MediaBuy mapper events that maintain the rollup
+                refresh_media_buy_revenue(db_session, req.media_buy_id)
                 db_session.commit()
                 logger.warning(
                     f"⚠️  Updated MediaBuy {req.media_buy_id} budget to {total_budget} {budget_currency} in database ONLY"
@@ -4,17 +4,21 @@ This module contains the get_products tool implementation following the MCP/A2A
 shared implementation pattern from CLAUDE.md.
 """
 
+import asyncio
 import logging
 import os
 import time
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 from adcp import BrandManifest, ProductFilters
 from adcp import GetProductsRequest as GetProductsRequestGenerated
 from adcp import Product as LibraryProduct
 from adcp.types import PushNotificationConfig
 from adcp.types.generated_poc.core.context import ContextObject
+from adcp.types.generated_poc.core.ext import ExtensionObject
 from fastmcp.exceptions import ToolError
 from fastmcp.server.context import Context
 from fastmcp.tools.tool import ToolResult
@@ -28,6 +32,7 @@ from src.core.audit_logger import get_audit_logger
 from src.core.auth import get_principal_from_context, get_principal_object
 from src.core.config_loader import set_current_tenant
 from src.core.database.database_session import get_db_session
+from src.core.metrics import get_products_degraded, get_products_stage_duration
 from src.core.product_conversion import add_v2_compat_to_products
 from src.core.schema_helpers import create_get_products_request
 from src.core.schemas import (
@@ -37,10 +42,12 @@ from src.core.schemas import (
 from src.core.testing_hooks import apply_testing_hooks, get_testing_context
 from src.core.tool_context import ToolContext
 from src.core.validation_helpers import format_validation_error, safe_parse_json_field
-from src.services.policy_check_service import PolicyCheckService, PolicyStatus
+from src.services.policy_check_service import PolicyCheckResult, PolicyCheckService, PolicyStatus
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def get_adapter_default_channels(adapter_type: str) -> list[str]:
     """Get default advertising channels for an adapter type.
@@ -117,138 +124,53 @@ def get_recommended_cpm(product: Product) -> float | None:
 # Import conversion utilities from dedicated module to avoid circular imports
 from src.core.product_conversion import convert_product_model_to_schema
 
+# Platform default for the overall get_products latency budget (tenants override via
+# products_latency_budget_ms). Optional stages are skipped once the budget is spent.
+DEFAULT_PRODUCTS_LATENCY_BUDGET_MS = int(os.getenv("GET_PRODUCTS_BUDGET_MS", "8000"))
 
-async def _get_products_impl(
-    req: GetProductsRequestGenerated, context: Context | ToolContext | None
-) -> GetProductsResponse:
-    """Shared implementation for get_products.
-
-    Contains all business logic for product discovery including policy checks,
-    product catalog providers, dynamic pricing, and filtering.
-
-    Args:
-        req: GetProductsRequest from generated schemas
-        context: FastMCP Context for tenant/principal resolution
-
-    Returns:
-        GetProductsResponse containing matching products
-    """
-    from src.core.tool_context import ToolContext
-
-    start_time = time.time()
-
-    # Handle both old Context and new ToolContext
-    if isinstance(context, ToolContext):
-        # New context management - everything is already extracted
-        testing_ctx_raw = context.testing_context
-        # Convert dict testing context back to TestContext object if needed
-        if isinstance(testing_ctx_raw, dict):
-            from src.core.testing_hooks import AdCPTestContext
-
-            testing_ctx: AdCPTestContext | None = AdCPTestContext(**testing_ctx_raw)
-        else:
-            testing_ctx = testing_ctx_raw
-        principal_id: str | None = context.principal_id
-        tenant: dict[str, Any] = {"tenant_id": context.tenant_id}  # Simplified tenant info
-        # Ensure ContextVar is populated for helpers that require tenant context
-        set_current_tenant(tenant)
-    else:
-        # Legacy path - extract from FastMCP Context
-        if context is None:
-            raise ToolError("Context is required")
-        testing_ctx = get_testing_context(context)
-        # For discovery endpoints, authentication is optional
-        # require_valid_token=False means invalid tokens are treated like missing tokens (discovery endpoint behavior)
-        logger.info("[GET_PRODUCTS] About to call get_principal_from_context")
-        principal_id_temp, tenant_temp = get_principal_from_context(
-            context, require_valid_token=False
-        )  # Returns (None, tenant) if no/invalid auth
-        principal_id = principal_id_temp
-        tenant = tenant_temp if tenant_temp else {}
-        logger.info(f"[GET_PRODUCTS] principal_id returned: {principal_id}, tenant: {tenant}")
-
-        # Set tenant context explicitly in this async context (ContextVar propagation fix)
-        if tenant:
-            set_current_tenant(tenant)
-            logger.info(f"[GET_PRODUCTS] Set tenant context: {tenant['tenant_id']}")
-        elif principal_id:
-            # If we have principal but no tenant, something went wrong
-            logger.error(f"[GET_PRODUCTS] Principal found but no tenant context: principal_id={principal_id}")
-            raise ToolError(
-                f"Authentication succeeded but tenant context missing. This is a bug. principal_id={principal_id}"
-            )
-        else:
-            # No tenant context and no principal - cannot determine which tenant's products to return
-            logger.error("[GET_PRODUCTS] No tenant context available - cannot determine which products to return")
-            raise ToolError(
-                "Cannot determine tenant context. Please provide valid authentication or ensure tenant can be identified from request headers."
-            )
 
-    # Get the Principal object with ad server mappings
-    principal = get_principal_object(principal_id) if principal_id else None
-    principal_data = principal.model_dump() if principal else None
+class _StageTimings:
+    """Wall-clock timings of get_products pipeline stages, mirrored to Prometheus."""
 
-    # Handle RootModel wrappers for brand_manifest (e.g., BrandManifestReference wraps BrandManifest)
-    # adcp library uses RootModel for union types, so we need to unwrap
-    # This unwrapped value is used for both offering extraction and policy checks
-    brand_manifest_unwrapped: Any = None
-    if req.brand_manifest:
-        brand_manifest_unwrapped = req.brand_manifest
-        if hasattr(brand_manifest_unwrapped, "root"):
-            brand_manifest_unwrapped = brand_manifest_unwrapped.root
+    def __init__(self):
+        self.ms: dict[str, float] = {}
 
-    # Extract offering text from brand_manifest
-    offering = None
-    if brand_manifest_unwrapped:
-        if isinstance(brand_manifest_unwrapped, str):
-            # brand_manifest is a URL string - use it as-is for now
-            offering = f"Brand at {brand_manifest_unwrapped}"
-        elif hasattr(brand_manifest_unwrapped, "__str__") and str(brand_manifest_unwrapped).startswith("http"):
-            # brand_manifest is AnyUrl object from Pydantic
-            offering = f"Brand at {brand_manifest_unwrapped}"
-        else:
-            # brand_manifest is a BrandManifest object or dict
-            # Per AdCP spec: either name OR url is required
-            if hasattr(brand_manifest_unwrapped, "name") and brand_manifest_unwrapped.name:
-                offering = brand_manifest_unwrapped.name
-            elif hasattr(brand_manifest_unwrapped, "url") and brand_manifest_unwrapped.url:
-                offering = f"Brand at {brand_manifest_unwrapped.url}"
-            elif isinstance(brand_manifest_unwrapped, dict):
-                offering = brand_manifest_unwrapped.get("name") or brand_manifest_unwrapped.get("url", "")
-
-    # Check brand_manifest_policy from tenant settings
-    brand_manifest_policy = tenant.get("brand_manifest_policy", "require_auth")
-
-    # Enforce policy-based validation
-    if brand_manifest_policy == "require_brand" and not offering:
-        raise ToolError("Brand manifest required by tenant policy")
-    elif brand_manifest_policy == "require_auth" and not principal_id:
-        raise ToolError("Authentication required by tenant policy")
-    # public policy allows all requests (no brand_manifest or auth required)
-
-    # For non-public policies, we need offering for policy checks and product matching
-    # Use a generic offering if not provided
-    if not offering:
-        offering = "Generic product inquiry"
-
-    # Skip strict validation in test environments (allow simple test values)
-
-    is_test_mode = (testing_ctx and testing_ctx.test_session_id is not None) or os.getenv("ADCP_TESTING") == "true"
-
-    # Note: brand_manifest validation is handled by Pydantic schema, no need for runtime validation here
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.ms[stage] = round(elapsed * 1000, 1)
+            get_products_stage_duration.labels(stage=stage).observe(elapsed)
+
+    async def run(self, stage: str, awaitable: Awaitable[T]) -> T:
+        with self.measure(stage):
+            return await awaitable
+
+
+async def _check_brief_policy(
+    req: GetProductsRequestGenerated,
+    tenant: dict[str, Any],
+    advertising_policy: dict[str, Any],
+    policy_check_enabled: bool,
+    brief_text: str,
+    offering: str,
+    brand_manifest_unwrapped: Any,
+    principal_id: str | None,
+) -> tuple[PolicyCheckResult | None, PolicyCheckService | None]:
+    """Run the tenant's AI policy check on the brief.
 
-    # Check policy compliance first (if enabled)
-    advertising_policy = safe_parse_json_field(
-        tenant.get("advertising_policy"), field_name="advertising_policy", default={}
-    )
+    Returns:
+        Tuple of (policy result or None if not checked, the PolicyCheckService used)
 
-    # Only run policy checks if enabled in tenant settings
-    policy_check_enabled = advertising_policy.get("enabled", False)  # Default to False for new tenants
+    Raises:
+        ToolError: If the brief is blocked, or restricted with manual review required
+    """
+    policy_service: PolicyCheckService | None = None
     policy_disabled_reason = None
 
-    # Extract brief text early - needed for policy checks, dynamic variants, and AI ranking
-    brief_text = req.brief if req.brief else ""
-
     if not policy_check_enabled:
         # Skip policy checks if disabled
         policy_result = None
@@ -285,6 +207,7 @@ async def _get_products_impl(
                     promoted_offering=offering,  # Use extracted offering from brand_manifest
                     brand_manifest=brand_manifest_dict,
                     tenant_policies=tenant_policies if tenant_policies else None,
+                    tenant_id=tenant["tenant_id"],
                 )
 
                 # Log successful policy check
@@ -368,6 +291,14 @@ async def _get_products_impl(
             f"Request violates content policy: {policy_result.reason}. Restrictions: {', '.join(restrictions_list)}",
         )
 
+    return policy_result, policy_service
+
+
+def _load_tenant_products(tenant_id: str) -> list[Product]:
+    """Load a tenant's products and convert them to AdCP schema.
+
+    Runs in a worker thread so the query overlaps with the policy check.
+    """
     # Query products directly from database
     # This replaces the product_catalog_providers abstraction with simple direct access
     from src.core.database.models import Product as ProductModel
@@ -376,14 +307,14 @@ async def _get_products_impl(
         stmt = (
             select(ProductModel)
             .options(joinedload(ProductModel.pricing_options), joinedload(ProductModel.tenant))
-            .filter_by(tenant_id=tenant["tenant_id"])
+            .filter_by(tenant_id=tenant_id)
             .order_by(ProductModel.product_id)
         )
         result = db_session.execute(stmt).unique()
         db_products = list(result.scalars().all())
 
         # Convert database Product models to AdCP Product schema
-        products = []
+        products: list[Product] = []
         for product_obj in db_products:
             try:
                 validated_product = convert_product_model_to_schema(product_obj)
@@ -397,6 +328,249 @@ async def _get_products_impl(
                 logger.error(error_msg)
                 raise ValueError(error_msg) from e
 
+    return products
+
+
+async def _rank_products(
+    eligible_products: list[Product], product_ranking_prompt: str, brief_text: str
+) -> list[Product]:
+    """Rank products against the brief with the tenant's ranking prompt.
+
+    Returns:
+        Products sorted by relevance, with products scoring below 0.1 removed
+    """
+    from src.services.ai.agents.ranking_agent import create_ranking_agent
+    from src.services.ai.factory import get_factory
+    from src.services.product_ranking_service import get_product_ranking_service, product_digest
+
+    factory = get_factory()
+    if not factory.is_ai_enabled():
+        logger.debug("[GET_PRODUCTS] AI ranking configured but AI not enabled (no API key)")
+        return eligible_products
+
+    effective_config = factory.get_effective_config()
+    model_id = f"{effective_config['provider']}:{effective_config['model']}"
+
+    # Compact digests, chunked and cached by the ranking service
+    ranking_map = await get_product_ranking_service().rank(
+        [product_digest(p) for p in eligible_products],
+        brief=brief_text,
+        prompt=product_ranking_prompt,
+        model=model_id,
+        create_agent=lambda: create_ranking_agent(factory.create_model()),
+    )
+
+    # Sort products by relevance score (highest first)
+    # Products not in ranking_map get score 0
+    ranked = sorted(
+        eligible_products,
+        key=lambda p: ranking_map.get(p.product_id, (0.0, ""))[0],
+        reverse=True,
+    )
+
+    # Filter out products with very low relevance (score < 0.1)
+    ranked = [p for p in ranked if ranking_map.get(p.product_id, (0.0, ""))[0] >= 0.1]
+
+    # Log the ranking results
+    for product_id, (score, reason) in ranking_map.items():
+        logger.debug(f"[AI_RANKING] {product_id}: score={score:.2f}, reason={reason}")
+
+    logger.info(
+        f"[GET_PRODUCTS] AI ranking applied: {len(ranking_map)} products ranked, {len(ranked)} products above threshold"
+    )
+    return ranked
+
+
+async def _get_products_impl(
+    req: GetProductsRequestGenerated, context: Context | ToolContext | None
+) -> GetProductsResponse:
+    """Shared implementation for get_products.
+
+    Contains all business logic for product discovery including policy checks,
+    product catalog providers, dynamic pricing, and filtering.
+
+    Args:
+        req: GetProductsRequest from generated schemas
+        context: FastMCP Context for tenant/principal resolution
+
+    Returns:
+        GetProductsResponse containing matching products
+    """
+    from src.core.tool_context import ToolContext
+
+    start_time = time.monotonic()
+
+    # Handle both old Context and new ToolContext
+    if isinstance(context, ToolContext):
+        # New context management - everything is already extracted
+        testing_ctx_raw = context.testing_context
+        # Convert dict testing context back to TestContext object if needed
+        if isinstance(testing_ctx_raw, dict):
+            from src.core.testing_hooks import AdCPTestContext
+
+            testing_ctx: AdCPTestContext | None = AdCPTestContext(**testing_ctx_raw)
+        else:
+            testing_ctx = testing_ctx_raw
+        principal_id: str | None = context.principal_id
+        tenant: dict[str, Any] = {"tenant_id": context.tenant_id}  # Simplified tenant info
+        # Ensure ContextVar is populated for helpers that require tenant context
+        set_current_tenant(tenant)
+    else:
+        # Legacy path - extract from FastMCP Context
+        if context is None:
+            raise ToolError("Context is required")
+        testing_ctx = get_testing_context(context)
+        # For discovery endpoints, authentication is optional
+        # require_valid_token=False means invalid tokens are treated like missing tokens (discovery endpoint behavior)
+        logger.info("[GET_PRODUCTS] About to call get_principal_from_context")
+        principal_id_temp, tenant_temp = get_principal_from_context(
+            context, require_valid_token=False
+        )  # Returns (None, tenant) if no/invalid auth
+        principal_id = principal_id_temp
+        tenant = tenant_temp if tenant_temp else {}
+        logger.info(f"[GET_PRODUCTS] principal_id returned: {principal_id}, tenant: {tenant}")
+
+        # Set tenant context explicitly in this async context (ContextVar propagation fix)
+        if tenant:
+            set_current_tenant(tenant)
+            logger.info(f"[GET_PRODUCTS] Set tenant context: {tenant['tenant_id']}")
+        elif principal_id:
+            # If we have principal but no tenant, something went wrong
+            logger.error(f"[GET_PRODUCTS] Principal found but no tenant context: principal_id={principal_id}")
+            raise ToolError(
+                f"Authentication succeeded but tenant context missing. This is a bug. principal_id={principal_id}"
+            )
+        else:
+            # No tenant context and no principal - cannot determine which tenant's products to return
+            logger.error("[GET_PRODUCTS] No tenant context available - cannot determine which products to return")
+            raise ToolError(
+                "Cannot determine tenant context. Please provide valid authentication or ensure tenant can be identified from request headers."
+            )
+
+    # Get the Principal object with ad server mappings
+    principal = get_principal_object(principal_id) if principal_id else None
+    principal_data = principal.model_dump() if principal else None
+
+    # Handle RootModel wrappers for brand_manifest (e.g., BrandManifestReference wraps BrandManifest)
+    # adcp library uses RootModel for union types, so we need to unwrap
+    # This unwrapped value is used for both offering extraction and policy checks
+    brand_manifest_unwrapped: Any = None
+    if req.brand_manifest:
+        brand_manifest_unwrapped = req.brand_manifest
+        if hasattr(brand_manifest_unwrapped, "root"):
+            brand_manifest_unwrapped = brand_manifest_unwrapped.root
+
+    # Extract offering text from brand_manifest
+    offering = None
+    if brand_manifest_unwrapped:
+        if isinstance(brand_manifest_unwrapped, str):
+            # brand_manifest is a URL string - use it as-is for now
+            offering = f"Brand at {brand_manifest_unwrapped}"
+        elif hasattr(brand_manifest_unwrapped, "__str__") and str(brand_manifest_unwrapped).startswith("http"):
+            # brand_manifest is AnyUrl object from Pydantic
+            offering = f"Brand at {brand_manifest_unwrapped}"
+        else:
+            # brand_manifest is a BrandManifest object or dict
+            # Per AdCP spec: either name OR url is required
+            if hasattr(brand_manifest_unwrapped, "name") and brand_manifest_unwrapped.name:
+                offering = brand_manifest_unwrapped.name
+            elif hasattr(brand_manifest_unwrapped, "url") and brand_manifest_unwrapped.url:
+                offering = f"Brand at {brand_manifest_unwrapped.url}"
+            elif isinstance(brand_manifest_unwrapped, dict):
+                offering = brand_manifest_unwrapped.get("name") or brand_manifest_unwrapped.get("url", "")
+
+    # Check brand_manifest_policy from tenant settings
+    brand_manifest_policy = tenant.get("brand_manifest_policy", "require_auth")
+
+    # Enforce policy-based validation
+    if brand_manifest_policy == "require_brand" and not offering:
+        raise ToolError("Brand manifest required by tenant policy")
+    elif brand_manifest_policy == "require_auth" and not principal_id:
+        raise ToolError("Authentication required by tenant policy")
+    # public policy allows all requests (no brand_manifest or auth required)
+
+    # For non-public policies, we need offering for policy checks and product matching
+    # Use a generic offering if not provided
+    if not offering:
+        offering = "Generic product inquiry"
+
+    # Skip strict validation in test environments (allow simple test values)
+
+    is_test_mode = (testing_ctx and testing_ctx.test_session_id is not None) or os.getenv("ADCP_TESTING") == "true"
+
+    # Note: brand_manifest validation is handled by Pydantic schema, no need for runtime validation here
+
+    # Check policy compliance first (if enabled)
+    advertising_policy = safe_parse_json_field(
+        tenant.get("advertising_policy"), field_name="advertising_policy", default={}
+    )
+
+    # Only run policy checks if enabled in tenant settings
+    policy_check_enabled = advertising_policy.get("enabled", False)  # Default to False for new tenants
+
+    # Extract brief text early - needed for policy checks, dynamic variants, and AI ranking
+    brief_text = req.brief if req.brief else ""
+
+    # The product load (DB, in a worker thread) doesn't depend on the policy decision,
+    # so it runs concurrently with the policy LLM call. Variant generation sends the
+    # brief to third-party signals agents, so it only starts once the brief is allowed.
+    # The whole pipeline runs against the tenant's latency budget.
+    from src.services.dynamic_products import DYNAMIC_VARIANTS_BUDGET_SECONDS, generate_variants_within_budget
+
+    budget_ms = tenant.get("products_latency_budget_ms") or DEFAULT_PRODUCTS_LATENCY_BUDGET_MS
+    deadline = start_time + budget_ms / 1000
+    timings = _StageTimings()
+    degraded_stages: list[str] = []
+
+    # Get our agent URL for deployment specification
+    our_agent_url = tenant.get("virtual_host")  # Our sales agent URL (e.g., https://sales.example.com)
+
+    async def load_products() -> list[Product]:
+        # Stage coroutines are built inside their tasks, so cancelling a task before it starts
+        # leaves no unawaited coroutine behind
+        return await timings.run("product_load", asyncio.to_thread(_load_tenant_products, tenant["tenant_id"]))
+
+    load_task = asyncio.create_task(load_products())
+    try:
+        policy_result, policy_service = await timings.run(
+            "policy_check",
+            _check_brief_policy(
+                req,
+                tenant,
+                advertising_policy,
+                policy_check_enabled,
+                brief_text,
+                offering,
+                brand_manifest_unwrapped,
+                principal_id,
+            ),
+        )
+    except BaseException:
+        # Blocked brief: stop the concurrent product load for this request
+        load_task.cancel()
+        raise
+
+    # Slow signals agents must not hold up the response; past the variant budget we return
+    # static products and variants finish generating in the background
+    async def generate_variants() -> tuple[list[Any], bool]:
+        return await timings.run(
+            "dynamic_variants",
+            generate_variants_within_budget(
+                tenant["tenant_id"],
+                brief_text,
+                our_agent_url,
+                budget_seconds=min(DYNAMIC_VARIANTS_BUDGET_SECONDS, deadline - time.monotonic()),
+            ),
+        )
+
+    variants_task = asyncio.create_task(generate_variants())
+
+    try:
+        products = await load_task
+    except BaseException:
+        variants_task.cancel()
+        raise
+
     logger.info(f"[GET_PRODUCTS] Got {len(products)} products from database for tenant {tenant['tenant_id']}")
 
     # Filter products by principal access control
@@ -433,14 +607,11 @@ async def _get_products_impl(
         products = filtered_by_access
         logger.info(f"[GET_PRODUCTS] After anonymous access filtering: {len(products)} products")
 
-    # Generate dynamic product variants from signals agents
+    # Add dynamic product variants from signals agents (generation started above)
     try:
-        from src.services.dynamic_products import generate_variants_for_brief
-
-        # Get our agent URL for deployment specification
-        our_agent_url = tenant.get("virtual_host")  # Our sales agent URL (e.g., https://sales.example.com)
-
-        dynamic_variants = await generate_variants_for_brief(tenant["tenant_id"], brief_text, our_agent_url)
+        dynamic_variants, variants_deferred = await variants_task
+        if variants_deferred:
+            degraded_stages.append("dynamic_variants")
         if dynamic_variants:
             # Convert Product models to Product schemas for response
 
@@ -465,7 +636,7 @@ async def _get_products_impl(
         # Extract country from request if available (future enhancement: parse from targeting)
         country_code = None  # TODO: Extract from targeting if provided
 
-        with get_db_session() as pricing_session:
+        with timings.measure("dynamic_pricing"), get_db_session() as pricing_session:
             pricing_service = DynamicPricingService(pricing_session)
             products = pricing_service.enrich_products_with_pricing(
                 products,
@@ -637,7 +808,7 @@ async def _get_products_impl(
 
     # Filter products based on policy compliance (if policy checks are enabled)
     eligible_products = []
-    if policy_result and policy_check_enabled:
+    if policy_result and policy_service and policy_check_enabled:
         # Policy checks are enabled - filter products based on policy compliance
         for product in products:
             is_eligible, reason = policy_service.check_product_eligibility(policy_result, product.model_dump())
@@ -679,85 +850,58 @@ async def _get_products_impl(
         eligible_products = filtered_products
 
     # AI-powered product ranking (when tenant has product_ranking_prompt configured)
+    # Optional stage: skipped when the latency budget is already spent and cut off when it runs out
     product_ranking_prompt = tenant.get("product_ranking_prompt")
     if product_ranking_prompt and brief_text and eligible_products:
-        try:
-            from src.services.ai.agents.ranking_agent import (
-                create_ranking_agent,
-                rank_products_async,
-            )
-            from src.services.ai.factory import get_factory
-
-            factory = get_factory()
-            if factory.is_ai_enabled():
-                model = factory.create_model()
-                agent = create_ranking_agent(model)
-
-                # Convert products to dicts for ranking
-                products_for_ranking = [p.model_dump() for p in eligible_products]
-
-                # Run AI ranking
-                ranking_result = await rank_products_async(
-                    agent=agent,
-                    custom_prompt=product_ranking_prompt,
-                    brief=brief_text,
-                    products=products_for_ranking,
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            degraded_stages.append("ai_ranking")
+            logger.info(f"[GET_PRODUCTS] {budget_ms}ms latency budget spent, skipping AI ranking")
+        else:
+            try:
+                eligible_products = await timings.run(
+                    "ai_ranking",
+                    asyncio.wait_for(
+                        _rank_products(eligible_products, product_ranking_prompt, brief_text), timeout=remaining
+                    ),
                 )
-
-                # Build a map of product_id -> (score, reason)
-                ranking_map = {r.product_id: (r.relevance_score, r.reason) for r in ranking_result.rankings}
-
-                # Sort products by relevance score (highest first)
-                # Products not in ranking_map get score 0
-                eligible_products.sort(
-                    key=lambda p: ranking_map.get(p.product_id, (0.0, ""))[0],
-                    reverse=True,
+            except TimeoutError:
+                degraded_stages.append("ai_ranking")
+                logger.warning(
+                    f"[GET_PRODUCTS] AI ranking exceeded the {budget_ms}ms latency budget. Returning unranked products."
                 )
-
-                # Filter out products with very low relevance (score < 0.1)
-                eligible_products = [p for p in eligible_products if ranking_map.get(p.product_id, (0.0, ""))[0] >= 0.1]
-
-                # Log the ranking results
-                for r in ranking_result.rankings:
-                    logger.info(f"[AI_RANKING] {r.product_id}: score={r.relevance_score:.2f}, reason={r.reason}")
-
-                logger.info(
-                    f"[GET_PRODUCTS] AI ranking applied: {len(ranking_result.rankings)} products ranked, "
-                    f"{len(eligible_products)} products above threshold"
-                )
-            else:
-                logger.debug("[GET_PRODUCTS] AI ranking configured but AI not enabled (no API key)")
-        except Exception as e:
-            logger.warning(f"Failed to apply AI product ranking: {e}. Returning unranked products.")
+            except Exception as e:
+                logger.warning(f"Failed to apply AI product ranking: {e}. Returning unranked products.")
 
     # Annotate pricing options with adapter support (AdCP PR #88)
     # Do this BEFORE serialization to avoid reconstruction issues
     if principal and eligible_products:
-        try:
-            # Use correct get_adapter from adapter_helpers (accepts Principal and dry_run)
-            from src.core.helpers.adapter_helpers import get_adapter
-
-            # Get adapter in dry-run mode (no actual ad server calls)
-            adapter = get_adapter(principal, dry_run=True)
-
-            supported_models = adapter.get_supported_pricing_models()
-
-            for product in eligible_products:
-                if product.pricing_options:
-                    # Annotate each pricing option with "supported" flag
-                    for option in product.pricing_options:
-                        # adcp 2.14.0+ uses RootModel wrapper - access via .root
-                        inner = getattr(option, "root", option)
-                        # Get pricing model as string (handle both enum and literal)
-                        pricing_model = getattr(inner.pricing_model, "value", inner.pricing_model)  # type: ignore[union-attr]
-                        # Add supported annotation (will be included in response)
-                        # Dynamic attributes on discriminated union types
-                        is_supported = pricing_model in supported_models
-                        inner.supported = is_supported  # type: ignore[union-attr]
-                        if not is_supported:
-                            inner.unsupported_reason = f"Current adapter does not support {pricing_model.upper()} pricing"  # type: ignore[union-attr]
-        except Exception as e:
-            logger.warning(f"Failed to annotate pricing options with adapter support: {e}")
+        with timings.measure("adapter_annotation"):
+            try:
+                # Use correct get_adapter from adapter_helpers (accepts Principal and dry_run)
+                from src.core.helpers.adapter_helpers import get_adapter
+
+                # Get adapter in dry-run mode (no actual ad server calls)
+                adapter = get_adapter(principal, dry_run=True)
+
+                supported_models = adapter.get_supported_pricing_models()
+
+                for product in eligible_products:
+                    if product.pricing_options:
+                        # Annotate each pricing option with "supported" flag
+                        for option in product.pricing_options:
+                            # adcp 2.14.0+ uses RootModel wrapper - access via .root
+                            inner = getattr(option, "root", option)
+                            # Get pricing model as string (handle both enum and literal)
+                            pricing_model = getattr(inner.pricing_model, "value", inner.pricing_model)  # type: ignore[union-attr]
+                            # Add supported annotation (will be included in response)
+                            # Dynamic attributes on discriminated union types
+                            is_supported = pricing_model in supported_models
+                            inner.supported = is_supported  # type: ignore[union-attr]
+                            if not is_supported:
+                                inner.unsupported_reason = f"Current adapter does not support {pricing_model.upper()} pricing"  # type: ignore[union-attr]
+            except Exception as e:
+                logger.warning(f"Failed to annotate pricing options with adapter support: {e}")
 
     # Filter pricing data for anonymous users
     # Do this BEFORE serialization to avoid reconstruction issues
@@ -785,8 +929,31 @@ async def _get_products_impl(
         products=cast(list[LibraryProduct], eligible_products),
         errors=None,
         context=req.context,
+        # Tell the buyer which optional stages were skipped to stay within the latency budget
+        ext=ExtensionObject.model_validate({"degraded_stages": degraded_stages}) if degraded_stages else None,
     )
 
+    total_ms = round((time.monotonic() - start_time) * 1000, 1)
+    logger.info(f"[GET_PRODUCTS] {total_ms}ms total, stage timings (ms): {timings.ms}")
+    for stage in degraded_stages:
+        get_products_degraded.labels(stage=stage).inc()
+    if degraded_stages or total_ms > budget_ms:
+        # Only budget overruns are audited; get_products is too hot to audit every call
+        audit_logger = get_audit_logger("AdCP", tenant["tenant_id"])
+        audit_logger.log_operation(
+            operation="get_products_latency_budget",
+            principal_name=principal_id or "anonymous",
+            principal_id=principal_id or "anonymous",
+            adapter_id="get_products",
+            success=True,
+            details={
+                "budget_ms": budget_ms,
+                "total_ms": total_ms,
+                "stage_timings_ms": timings.ms,
+                "degraded_stages": degraded_stages,
+            },
+        )
+
     return resp
 
 
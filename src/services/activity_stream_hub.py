@@ -0,0 +1,285 @@
+"""Fan-out hub for the admin activity stream.
+
+Every SSE client used to poll audit_logs every 2 seconds and re-format the rows
+it got back. Instead:
+
+1. Inserting an AuditLog row sends pg_notify(ACTIVITY_CHANNEL, "<tenant_id>:<log_id>")
+   from the same transaction (AuditLog mapper event in models.py), so the
+   notification is delivered on commit and never for rolled-back rows.
+2. One listener thread per process LISTENs on a dedicated connection, loads the
+   notified rows in one query, formats each activity once and appends it to the
+   tenant's ring buffer.
+3. SSE generators block on the tenant's condition variable and stream whatever
+   was appended after their cursor.
+
+The ring buffer (ACTIVITY_STREAM_BUFFER_SIZE per tenant) also serves reconnects:
+a client that sends Last-Event-ID gets the buffered activities after that id;
+older ids are resumed from audit_logs.
+
+When the listener is idle it runs one catch-up query for rows newer than the last
+one it saw, which covers notifications lost while reconnecting and deployments
+where LISTEN is unavailable (PgBouncer transaction pooling).
+"""
+
+import logging
+import os
+import select as select_module
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import func, select
+
+from src.core.database.database_session import get_db_session, get_engine
+from src.core.database.models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+ACTIVITY_CHANNEL = "audit_log_activity"
+ACTIVITY_STREAM_BUFFER_SIZE = int(os.getenv("ACTIVITY_STREAM_BUFFER_SIZE", "200"))
+# Idle time before the listener runs a catch-up query
+ACTIVITY_STREAM_CATCHUP_SECONDS = float(os.getenv("ACTIVITY_STREAM_CATCHUP_SECONDS", "5"))
+MAX_CATCHUP_ROWS = 500
+# Published audit log ids remembered to drop duplicates (catch-up racing a late notification)
+MAX_RECENT_LOG_IDS = 5000
+RECONNECT_DELAY_SECONDS = (1, 2, 5, 10, 30)
+
+
+def notification_payload(tenant_id: str, log_id: int) -> str:
+    """NOTIFY payload for an audit log row (payloads are limited to 8000 bytes)."""
+    return f"{tenant_id}:{log_id}"
+
+
+def parse_notification_payload(payload: str) -> int | None:
+    """Audit log id from a NOTIFY payload, or None if malformed."""
+    _, _, log_id = payload.rpartition(":")
+    try:
+        return int(log_id)
+    except ValueError:
+        return None
+
+
+@dataclass
+class _TenantStream:
+    """Ring buffer of formatted activities for one tenant."""
+
+    buffer: deque[tuple[int, dict[str, Any]]]
+    condition: threading.Condition = field(default_factory=threading.Condition)
+    # Sequence number of the last appended activity (monotonic per process)
+    last_seq: int = 0
+
+
+class ActivityStreamHub:
+    """Per-process fan-out of audit log activities to SSE subscribers."""
+
+    def __init__(
+        self,
+        buffer_size: int = ACTIVITY_STREAM_BUFFER_SIZE,
+        catchup_interval_seconds: float = ACTIVITY_STREAM_CATCHUP_SECONDS,
+    ):
+        self.buffer_size = buffer_size
+        self.catchup_interval_seconds = catchup_interval_seconds
+        self._streams: dict[str, _TenantStream] = {}
+        self._streams_lock = threading.Lock()
+        self._seq = 0
+        # Highest audit log id published; catch-up queries start after it
+        self._last_log_id: int | None = None
+        self._recent_log_ids: deque[int] = deque()
+        self._recent_log_id_set: set[int] = set()
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._subscribers = 0
+
+    def _stream(self, tenant_id: str) -> _TenantStream:
+        with self._streams_lock:
+            stream = self._streams.get(tenant_id)
+            if stream is None:
+                stream = _TenantStream(buffer=deque(maxlen=self.buffer_size))
+                self._streams[tenant_id] = stream
+            return stream
+
+    def publish(self, tenant_id: str, activity: dict[str, Any]) -> None:
+        """Append a formatted activity to the tenant's buffer and wake its subscribers."""
+        stream = self._stream(tenant_id)
+        with stream.condition:
+            with self._streams_lock:
+                self._seq += 1
+                seq = self._seq
+            stream.buffer.append((seq, activity))
+            stream.last_seq = seq
+            stream.condition.notify_all()
+
+    def cursor(self, tenant_id: str) -> int:
+        """Current position in the tenant's stream; wait_for_activities() returns what follows it."""
+        stream = self._stream(tenant_id)
+        with stream.condition:
+            return stream.last_seq
+
+    def wait_for_activities(self, tenant_id: str, cursor: int, timeout: float) -> tuple[int, list[dict[str, Any]]]:
+        """Block until activities newer than cursor exist or timeout elapses.
+
+        Returns:
+            (new cursor, activities oldest first). A subscriber that fell more than
+            buffer_size activities behind skips the evicted ones.
+        """
+        stream = self._stream(tenant_id)
+        with stream.condition:
+            stream.condition.wait_for(lambda: stream.last_seq > cursor or self._stopped.is_set(), timeout=timeout)
+            activities = [activity for seq, activity in stream.buffer if seq > cursor]
+            return stream.last_seq, activities
+
+    def replay(self, tenant_id: str, last_event_id: int) -> list[dict[str, Any]] | None:
+        """Buffered activities published after the one with id last_event_id.
+
+        Returns None if that activity is no longer buffered; the caller should
+        resume from the database instead.
+        """
+        stream = self._stream(tenant_id)
+        with stream.condition:
+            buffered = [activity for _, activity in stream.buffer]
+        for index, activity in enumerate(buffered):
+            if activity.get("id") == last_event_id:
+                return buffered[index + 1 :]
+        return None
+
+    def publish_audit_logs(self, audit_logs: list[AuditLog]) -> None:
+        """Format audit log rows once and publish them to their tenants' streams."""
+        from src.admin.blueprints.activity_stream import format_activity_from_audit_log
+
+        for audit_log in audit_logs:
+            if audit_log.log_id in self._recent_log_id_set:
+                continue
+            self._recent_log_ids.append(audit_log.log_id)
+            self._recent_log_id_set.add(audit_log.log_id)
+            if len(self._recent_log_ids) > MAX_RECENT_LOG_IDS:
+                self._recent_log_id_set.discard(self._recent_log_ids.popleft())
+            if self._last_log_id is None or audit_log.log_id > self._last_log_id:
+                self._last_log_id = audit_log.log_id
+            try:
+                activity = format_activity_from_audit_log(audit_log)
+            except Exception as e:
+                logger.warning(f"Failed to format activity from audit log {audit_log.log_id}: {e}")
+                continue
+            self.publish(audit_log.tenant_id, activity)
+
+    def subscribe(self) -> None:
+        """Register an SSE client; starts the listener on first use."""
+        with self._streams_lock:
+            self._subscribers += 1
+        self.ensure_listening()
+
+    def unsubscribe(self) -> None:
+        with self._streams_lock:
+            self._subscribers = max(0, self._subscribers - 1)
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._subscribers
+
+    def ensure_listening(self) -> None:
+        """Start the listener thread if it is not running."""
+        with self._streams_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._run, name="activity-stream-listener", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the listener thread and release waiting subscribers."""
+        self._stopped.set()
+        with self._streams_lock:
+            streams = list(self._streams.values())
+        for stream in streams:
+            with stream.condition:
+                stream.condition.notify_all()
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def _run(self) -> None:
+        """Listener loop: LISTEN, dispatch notifications, reconnect with backoff on failure."""
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+                failures = 0
+            except Exception as e:
+                delay = RECONNECT_DELAY_SECONDS[min(failures, len(RECONNECT_DELAY_SECONDS) - 1)]
+                failures += 1
+                logger.warning(f"Activity stream listener disconnected ({e}); reconnecting in {delay}s")
+                self._stopped.wait(delay)
+
+    def _listen(self) -> None:
+        # Dedicated connection, detached from the pool so it does not hold a pooled slot
+        raw_connection = get_engine().raw_connection()
+        raw_connection.detach()
+        connection = raw_connection.driver_connection
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {ACTIVITY_CHANNEL}")
+
+            if self._last_log_id is None:
+                with get_db_session() as session:
+                    self._last_log_id = session.scalar(select(func.max(AuditLog.log_id))) or 0
+            else:
+                # Rows committed while we were disconnected
+                self._catch_up()
+            logger.info(f"Activity stream listener connected (channel {ACTIVITY_CHANNEL})")
+
+            last_activity = time.monotonic()
+            while not self._stopped.is_set():
+                readable, _, _ = select_module.select([connection], [], [], self.catchup_interval_seconds)
+                if readable:
+                    connection.poll()
+                    log_ids = [parse_notification_payload(n.payload) for n in connection.notifies]
+                    connection.notifies.clear()
+                    self._publish_ids([log_id for log_id in log_ids if log_id is not None])
+                    last_activity = time.monotonic()
+                elif time.monotonic() - last_activity >= self.catchup_interval_seconds:
+                    self._catch_up()
+                    last_activity = time.monotonic()
+        finally:
+            raw_connection.close()
+
+    def _publish_ids(self, log_ids: list[int]) -> None:
+        if not log_ids:
+            return
+        with get_db_session() as session:
+            audit_logs = list(
+                session.scalars(select(AuditLog).where(AuditLog.log_id.in_(log_ids)).order_by(AuditLog.log_id)).all()
+            )
+            self.publish_audit_logs(audit_logs)
+
+    def _catch_up(self) -> None:
+        """Publish rows committed after the last one seen (missed or undelivered notifications)."""
+        if self._subscribers == 0 or self._last_log_id is None:
+            return
+        with get_db_session() as session:
+            audit_logs = list(
+                session.scalars(
+                    select(AuditLog)
+                    .where(AuditLog.log_id > self._last_log_id)
+                    .order_by(AuditLog.log_id)
+                    .limit(MAX_CATCHUP_ROWS)
+                ).all()
+            )
+            if audit_logs:
+                logger.debug(f"Activity stream catch-up published {len(audit_logs)} audit log rows")
+            self.publish_audit_logs(audit_logs)
+
+
+# Global hub instance
+_hub: ActivityStreamHub | None = None
+_hub_lock = threading.Lock()
+
+
+def get_activity_stream_hub() -> ActivityStreamHub:
+    """Get or create the global activity stream hub."""
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = ActivityStreamHub()
+        return _hub
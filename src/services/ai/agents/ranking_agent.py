@@ -68,41 +68,15 @@ def build_ranking_prompt(
     Args:
         custom_prompt: Tenant's custom ranking prompt
         brief: The buyer's brief/requirements
-        products: List of product dictionaries to rank
+        products: Compact product digests (see product_ranking_service.product_digest)
 
     Returns:
         Formatted prompt string
     """
     import json
 
-    def make_json_serializable(obj: Any) -> Any:
-        """Convert objects to JSON-serializable format."""
-        # Handle enums
-        if hasattr(obj, "value"):
-            return obj.value
-        # Handle Pydantic URLs and other objects with __str__
-        if hasattr(obj, "__str__") and not isinstance(obj, (dict, list, str, int, float, bool, type(None))):
-            return str(obj)
-        if isinstance(obj, dict):
-            return {k: make_json_serializable(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [make_json_serializable(item) for item in obj]
-        return obj
-
-    # Simplify product data for the prompt (only include relevant fields)
-    simplified_products = []
-    for p in products:
-        simplified = {
-            "product_id": p.get("product_id"),
-            "name": p.get("name"),
-            "description": p.get("description"),
-            "format_ids": make_json_serializable(p.get("format_ids", [])),
-            "channels": make_json_serializable(p.get("channels", [])),
-            "delivery_type": make_json_serializable(p.get("delivery_type")),
-        }
-        simplified_products.append(simplified)
-
-    products_str = json.dumps(simplified_products, indent=2)
+    # Digests are already reduced to the relevant fields; compact separators keep the prompt small
+    products_str = json.dumps(products, separators=(",", ":"), default=str)
 
     return f"""Rank these products based on relevance to the buyer's brief.
 
@@ -129,7 +103,7 @@ async def rank_products_async(
         agent: The ranking agent
         custom_prompt: Tenant's custom ranking prompt
         brief: The buyer's brief
-        products: List of product dictionaries
+        products: Compact product digests
 
     Returns:
         ProductRankingResult with rankings for each product
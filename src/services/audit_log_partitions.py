@@ -0,0 +1,301 @@
+"""Monthly partition management for audit_logs.
+
+audit_logs is range-partitioned by month on "timestamp" (migration f4b8d2a6c9e3):
+partitions are named audit_logs_pYYYYMM, and audit_logs_default catches rows for
+months that have no partition yet so inserts never fail.
+
+- ensure_audit_log_partitions() creates partitions for the current month and the
+  next AUDIT_LOG_PARTITION_MONTHS_AHEAD months. Rows that landed in the default
+  partition for a month being created are moved into it. Run periodically by
+  AuditLogPartitionScheduler.
+- archive_audit_log_partitions() exports every partition older than
+  AUDIT_LOG_RETENTION_MONTHS to a gzip-compressed CSV in AUDIT_LOG_ARCHIVE_DIR,
+  then detaches and drops it. Dropping a partition is instant and leaves no bloat,
+  unlike DELETE. Run by scripts/ops/audit_log_maintenance.py.
+
+Both are no-ops on an unpartitioned audit_logs (databases built with create_all).
+"""
+
+import asyncio
+import gzip
+import logging
+import os
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.core.database.database_session import get_db_session, get_engine
+
+logger = logging.getLogger(__name__)
+
+AUDIT_LOG_PARTITION_MONTHS_AHEAD = int(os.getenv("AUDIT_LOG_PARTITION_MONTHS_AHEAD", "3"))
+# Months of audit logs kept in the database (0 = keep forever)
+AUDIT_LOG_RETENTION_MONTHS = int(os.getenv("AUDIT_LOG_RETENTION_MONTHS", "12"))
+AUDIT_LOG_ARCHIVE_DIR = os.getenv("AUDIT_LOG_ARCHIVE_DIR", "archives/audit_logs")
+AUDIT_LOG_PARTITION_CHECK_INTERVAL_SECONDS = int(os.getenv("AUDIT_LOG_PARTITION_CHECK_INTERVAL_SECONDS", "21600"))
+
+PARENT_TABLE = "audit_logs"
+DEFAULT_PARTITION = "audit_logs_default"
+_PARTITION_NAME = re.compile(r"^audit_logs_p(\d{4})(\d{2})$")
+# Serializes partition DDL across processes (arbitrary application-wide key)
+_PARTITION_LOCK_KEY = 74_201_337
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month `months` after month (negative goes back)."""
+    index = month.year * 12 + (month.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month.year:04d}{month.month:02d}"
+
+
+def partition_month(name: str) -> date | None:
+    """Month covered by a partition name, or None for the default/unknown tables."""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+@dataclass
+class ArchivedPartition:
+    """Result of archiving one monthly partition."""
+
+    name: str
+    rows: int
+    path: Path | None
+    dropped: bool
+
+
+def is_partitioned(session: Session) -> bool:
+    relkind = session.execute(
+        text("SELECT c.relkind FROM pg_class c WHERE c.oid = to_regclass(:table)"), {"table": PARENT_TABLE}
+    ).scalar()
+    return relkind == "p"
+
+
+def list_partitions(session: Session) -> dict[date, str]:
+    """Monthly partitions attached to audit_logs, keyed by month."""
+    names = session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table)"
+        ),
+        {"table": PARENT_TABLE},
+    ).scalars()
+    partitions = {}
+    for name in names:
+        month = partition_month(name)
+        if month is not None:
+            partitions[month] = name
+    return partitions
+
+
+def _create_partition(session: Session, month: date) -> None:
+    """Create one monthly partition, moving matching rows out of the default partition."""
+    name = partition_name(month)
+    lower, upper = month.isoformat(), add_months(month, 1).isoformat()
+
+    # Build it detached so rows already in the default partition can be moved in first;
+    # ATTACH then validates that the default partition holds nothing in this range.
+    session.execute(text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS)"))
+    result = session.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f'WHERE "timestamp" >= :lower AND "timestamp" < :upper RETURNING *) '
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ),
+        {"lower": lower, "upper": upper},
+    )
+    moved = getattr(result, "rowcount", 0) or 0
+    session.execute(
+        text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{lower}') TO ('{upper}')")
+    )
+    if moved:
+        logger.warning(f"Moved {moved} audit log rows from {DEFAULT_PARTITION} into new partition {name}")
+
+
+def ensure_audit_log_partitions(
+    months_ahead: int = AUDIT_LOG_PARTITION_MONTHS_AHEAD, today: date | None = None
+) -> list[str]:
+    """Create missing partitions for the current month and the next months_ahead months.
+
+    Returns:
+        Names of the partitions created.
+    """
+    current = month_start(today or datetime.now(UTC).date())
+    created = []
+    with get_db_session() as session:
+        if not is_partitioned(session):
+            return []
+        session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _PARTITION_LOCK_KEY})
+        existing = list_partitions(session)
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if month not in existing:
+                _create_partition(session, month)
+                created.append(partition_name(month))
+        session.commit()
+
+    if created:
+        logger.info(f"Created audit log partitions: {', '.join(created)}")
+    return created
+
+
+def _export_partition(name: str, path: Path) -> int:
+    """COPY a partition to a gzip-compressed CSV; returns the number of rows written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+    raw_connection = get_engine().raw_connection()
+    try:
+        cursor = raw_connection.cursor()
+        # One snapshot for the export and the row count
+        cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")
+        with gzip.open(partial, "wt", encoding="utf-8", newline="") as archive:
+            cursor.copy_expert(
+                f"COPY (SELECT * FROM {name} ORDER BY log_id) TO STDOUT WITH (FORMAT csv, HEADER)", archive
+            )
+        cursor.execute(f"SELECT count(*) FROM {name}")
+        rows = cursor.fetchone()[0]
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
+    partial.replace(path)
+    return rows
+
+
+def archive_audit_log_partitions(
+    retention_months: int = AUDIT_LOG_RETENTION_MONTHS,
+    archive_dir: str | Path = AUDIT_LOG_ARCHIVE_DIR,
+    export: bool = True,
+    dry_run: bool = False,
+    today: date | None = None,
+) -> list[ArchivedPartition]:
+    """Archive and drop partitions whose month ended more than retention_months ago.
+
+    Args:
+        retention_months: Months kept in the database, including the current one (0 = keep all)
+        archive_dir: Directory for audit_logs_pYYYYMM.csv.gz files
+        export: Write the archive before dropping; False drops without exporting
+        dry_run: Only report which partitions would be archived
+
+    Returns:
+        One entry per expired partition.
+    """
+    if retention_months <= 0:
+        return []
+
+    cutoff = add_months(month_start(today or datetime.now(UTC).date()), -(retention_months - 1))
+    with get_db_session() as session:
+        if not is_partitioned(session):
+            return []
+        expired = sorted((month, name) for month, name in list_partitions(session).items() if month < cutoff)
+
+    results = []
+    for _, name in expired:
+        if dry_run:
+            results.append(ArchivedPartition(name=name, rows=0, path=None, dropped=False))
+            continue
+
+        path = None
+        rows = 0
+        if export:
+            path = Path(archive_dir) / f"{name}.csv.gz"
+            rows = _export_partition(name, path)
+            logger.info(f"Archived {rows} audit log rows from {name} to {path}")
+
+        with get_db_session() as session:
+            session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _PARTITION_LOCK_KEY})
+            if export:
+                # Block writes to the partition between the count and the detach
+                session.execute(text(f"LOCK TABLE {name} IN SHARE MODE"))
+                current_rows = session.execute(text(f"SELECT count(*) FROM {name}")).scalar()
+                if current_rows != rows:
+                    # Late writes for an expired month; keep the partition and retry next run
+                    logger.error(f"{name} changed during export ({rows} -> {current_rows} rows); not dropping")
+                    results.append(ArchivedPartition(name=name, rows=rows, path=path, dropped=False))
+                    continue
+            session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+            session.execute(text(f"DROP TABLE {name}"))
+            session.commit()
+        results.append(ArchivedPartition(name=name, rows=rows, path=path, dropped=True))
+        logger.info(f"Dropped audit log partition {name}")
+
+    return results
+
+
+class AuditLogPartitionScheduler:
+    """Background task that keeps future audit_logs partitions created."""
+
+    def __init__(self, interval_seconds: int = AUDIT_LOG_PARTITION_CHECK_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self.is_running = False
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Start the scheduler background task."""
+        async with self._lock:
+            if self.is_running:
+                logger.warning("Audit log partition scheduler is already running")
+                return
+
+            self.is_running = True
+            self._task = asyncio.create_task(self._run_scheduler())
+            logger.info(f"Audit log partition scheduler started (checking every {self.interval_seconds}s)")
+
+    async def stop(self) -> None:
+        """Stop the scheduler background task."""
+        async with self._lock:
+            if not self.is_running:
+                return
+
+            self.is_running = False
+            if self._task:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            logger.info("Audit log partition scheduler stopped")
+
+    async def _run_scheduler(self) -> None:
+        while self.is_running:
+            try:
+                await asyncio.to_thread(ensure_audit_log_partitions)
+            except Exception as e:
+                logger.error(f"Error creating audit log partitions: {e}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
+
+
+# Global scheduler instance
+_scheduler: AuditLogPartitionScheduler | None = None
+
+
+def get_audit_log_partition_scheduler() -> AuditLogPartitionScheduler:
+    """Get the global audit log partition scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = AuditLogPartitionScheduler()
+    return _scheduler
+
+
+async def start_audit_log_partition_scheduler() -> None:
+    """Start the global audit log partition scheduler."""
+    await get_audit_log_partition_scheduler().start()
+
+
+async def stop_audit_log_partition_scheduler() -> None:
+    """Stop the global audit log partition scheduler."""
+    await get_audit_log_partition_scheduler().stop()
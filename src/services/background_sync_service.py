@@ -65,6 +65,8 @@ def start_inventory_sync_background(
             # Check if sync is stale (running for >1 hour with no progress updates)
             from datetime import timedelta
 
+            from src.services.sync_orchestrator import lease_expired
+
             # Get started_at as datetime (SQLAlchemy returns datetime for DateTime columns)
             started_at_value: datetime = existing_sync.started_at
 
@@ -73,7 +75,12 @@ def start_inventory_sync_background(
                 started_at_value = started_at_value.replace(tzinfo=UTC)
 
             time_running = datetime.now(UTC) - started_at_value
-            is_stale = time_running > timedelta(hours=1) and not existing_sync.progress
+            # Leased jobs are stale once their worker stops heartbeating
+            is_stale = lease_expired(existing_sync) or (
+                existing_sync.lease_expires_at is None
+                and time_running > timedelta(hours=1)
+                and not existing_sync.progress
+            )
 
             if is_stale:
                 # Mark stale sync as failed and allow new sync to start
@@ -81,7 +88,8 @@ def start_inventory_sync_background(
                 # SQLAlchemy DateTime column accepts datetime objects
                 existing_sync.completed_at = datetime.now(UTC)
                 existing_sync.error_message = (
-                    "Sync thread died (stale after 1+ hour with no progress) - marked as failed to allow fresh sync"
+                    "Sync thread died (lease expired, or stale after 1+ hour with no progress) - "
+                    "marked as failed to allow fresh sync"
                 )
                 db.commit()
                 logger.warning(
@@ -93,7 +101,9 @@ def start_inventory_sync_background(
                     f"Sync already running for tenant {tenant_id}: {existing_sync.sync_id} (started {started_at_value})"
                 )
 
-        # Create new sync job
+        # Create new sync job, leased to this process (the sync thread heartbeats it)
+        from src.services.sync_orchestrator import new_lease
+
         sync_id = f"sync_{tenant_id}_{int(datetime.now(UTC).timestamp())}"
 
         sync_job = SyncJob(
@@ -111,6 +121,7 @@ def start_inventory_sync_background(
                 "custom_targeting_limit": custom_targeting_limit,
                 "audience_segment_limit": audience_segment_limit,
             },
+            **new_lease(),
         )
         db.add(sync_job)
         db.commit()
@@ -144,8 +155,9 @@ def _run_sync_thread(
     Run the actual sync in a background thread with detailed phase-by-phase progress.
 
     This function runs in a separate thread and updates the SyncJob record
-    as it progresses. If the thread is interrupted (container restart), the
-    job will remain in 'running' state until cleaned up.
+    as it progresses. While it runs, the process heartbeats the job's lease; if
+    the thread is interrupted (container restart), the lease lapses and the
+    sync orchestrator marks the job failed.
 
     Progress tracking:
     - Phase 0 (full mode only): Deleting existing inventory (1/7)
@@ -156,16 +168,13 @@ def _run_sync_thread(
     - Phase 5: Discovering Audience Segments (6/7 or 5/6)
     - Phase 6: Marking Stale Inventory (7/7 or 6/6)
     """
+    from src.services.sync_orchestrator import get_lease_heartbeat
+
+    get_lease_heartbeat().hold(sync_id)
     try:
         logger.info(f"[{sync_id}] Starting inventory sync for {tenant_id}")
 
         # Import here to avoid circular dependencies
-        import os
-        import tempfile
-
-        import google.oauth2.service_account
-        from googleads import ad_manager, oauth2
-
         from src.adapters.gam_inventory_discovery import GAMInventoryDiscovery
         from src.core.database.models import AdapterConfig, Tenant
         from src.services.gam_inventory_service import GAMInventoryService
@@ -185,50 +194,11 @@ def _run_sync_thread(
                 _mark_sync_failed(sync_id, "GAM not configured")
                 return
 
-            # Determine auth method
-            auth_method = getattr(adapter_config, "gam_auth_method", None)
-            if not auth_method:
-                if adapter_config.gam_refresh_token:
-                    auth_method = "oauth"
-                elif hasattr(adapter_config, "gam_service_account_json") and adapter_config.gam_service_account_json:
-                    auth_method = "service_account"
-                else:
-                    _mark_sync_failed(sync_id, "No GAM authentication configured")
-                    return
-
-            # Create GAM client based on auth method
-            if auth_method == "service_account":
-                service_account_json_str = adapter_config.gam_service_account_json
-                if not service_account_json_str:
-                    _mark_sync_failed(sync_id, "Service account JSON not found")
-                    return
-
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-                    f.write(service_account_json_str)
-                    temp_keyfile = f.name
-
-                try:
-                    credentials = google.oauth2.service_account.Credentials.from_service_account_file(
-                        temp_keyfile, scopes=["https://www.googleapis.com/auth/dfp"]
-                    )
-                    oauth2_client = oauth2.GoogleCredentialsClient(credentials)
-                    client = ad_manager.AdManagerClient(
-                        oauth2_client, "AdCP Sales Agent", network_code=adapter_config.gam_network_code
-                    )
-                finally:
-                    try:
-                        os.unlink(temp_keyfile)
-                    except Exception:
-                        pass
-            else:  # OAuth
-                oauth2_client = oauth2.GoogleRefreshTokenClient(
-                    client_id=os.environ.get("GAM_OAUTH_CLIENT_ID"),
-                    client_secret=os.environ.get("GAM_OAUTH_CLIENT_SECRET"),
-                    refresh_token=adapter_config.gam_refresh_token,
-                )
-                client = ad_manager.AdManagerClient(
-                    oauth2_client, "AdCP Sales Agent", network_code=adapter_config.gam_network_code
-                )
+            try:
+                client = _build_gam_client(adapter_config)
+            except ValueError as e:
+                _mark_sync_failed(sync_id, str(e))
+                return
 
         # Get last successful sync time for incremental mode
         last_sync_time = None
@@ -296,47 +266,38 @@ def _run_sync_thread(
             inventory_service = GAMInventoryService(db)
             sync_time = datetime.now()
 
-            # Phase 1: Ad Units (fetch → write → clear memory)
+            # Each phase streams GAM pages straight into the writer, so only one page is held in memory
+
+            # Phase 1: Ad Units
             update_progress("Discovering Ad Units", 1 + phase_offset)
-            ad_units = discovery.discover_ad_units(since=last_sync_time)
-            update_progress("Writing Ad Units to DB", 1 + phase_offset, len(ad_units))
-            inventory_service._write_inventory_batch(tenant_id, "ad_unit", ad_units, sync_time)
-            ad_units_count = len(ad_units)
-            discovery.ad_units.clear()  # Clear from memory
+            ad_units_count = inventory_service._write_inventory_pages(
+                tenant_id, "ad_unit", discovery.iter_ad_units(since=last_sync_time), sync_time
+            )
+            update_progress("Wrote Ad Units to DB", 1 + phase_offset, ad_units_count)
             logger.info(f"[{sync_id}] Wrote {ad_units_count} ad units to database")
 
-            # Phase 2: Placements (fetch → write → clear memory)
+            # Phase 2: Placements
             update_progress("Discovering Placements", 2 + phase_offset)
-            placements = discovery.discover_placements(since=last_sync_time)
-            update_progress("Writing Placements to DB", 2 + phase_offset, len(placements))
-            inventory_service._write_inventory_batch(tenant_id, "placement", placements, sync_time)
-            placements_count = len(placements)
-            discovery.placements.clear()  # Clear from memory
+            placements_count = inventory_service._write_inventory_pages(
+                tenant_id, "placement", discovery.iter_placements(since=last_sync_time), sync_time
+            )
+            update_progress("Wrote Placements to DB", 2 + phase_offset, placements_count)
             logger.info(f"[{sync_id}] Wrote {placements_count} placements to database")
 
-            # Phase 3: Labels (fetch → write → clear memory)
+            # Phase 3: Labels (GAM can't filter labels by lastModifiedDateTime, so always all of them)
             update_progress("Discovering Labels", 3 + phase_offset)
-            labels = discovery.discover_labels(since=last_sync_time)
-            update_progress("Writing Labels to DB", 3 + phase_offset, len(labels))
-            inventory_service._write_inventory_batch(tenant_id, "label", labels, sync_time)
-            labels_count = len(labels)
-            discovery.labels.clear()  # Clear from memory
+            labels_count = inventory_service._write_inventory_pages(
+                tenant_id, "label", discovery.iter_labels(), sync_time
+            )
+            update_progress("Wrote Labels to DB", 3 + phase_offset, labels_count)
             logger.info(f"[{sync_id}] Wrote {labels_count} labels to database")
 
-            # Phase 4: Custom Targeting Keys (fetch → write → clear memory)
+            # Phase 4: Custom Targeting Keys (values are lazy loaded; keys are few, so collect them)
             update_progress("Discovering Targeting Keys", 4 + phase_offset)
-            custom_targeting = discovery.discover_custom_targeting(fetch_values=False, since=last_sync_time)
-            update_progress(
-                "Writing Targeting Keys to DB",
-                4 + phase_offset,
-                custom_targeting.get("total_keys", 0),
-            )
-            inventory_service._write_custom_targeting_keys(
-                tenant_id, list(discovery.custom_targeting_keys.values()), sync_time
-            )
-            targeting_count = len(discovery.custom_targeting_keys)
-            discovery.custom_targeting_keys.clear()  # Clear from memory
-            discovery.custom_targeting_values.clear()  # Clear from memory
+            targeting_keys = [key for page in discovery.iter_custom_targeting_keys() for key in page]
+            targeting_count = len(targeting_keys)
+            update_progress("Writing Targeting Keys to DB", 4 + phase_offset, targeting_count)
+            inventory_service._write_custom_targeting_keys(tenant_id, targeting_keys, sync_time)
             logger.info(f"[{sync_id}] Wrote {targeting_count} targeting keys to database")
 
             # Also update adapter_config.custom_targeting_keys for GAMTargetingManager
@@ -344,16 +305,15 @@ def _run_sync_thread(
             inventory_service._update_adapter_config_targeting_keys(tenant_id)
             logger.info(f"[{sync_id}] Updated adapter_config targeting key mapping")
 
-            # Phase 5: Audience Segments (fetch → write → clear memory)
+            # Phase 5: Audience Segments
             # NOTE: Audience segments ALWAYS use full sync because GAM API doesn't support
             # lastModifiedDateTime filtering (returns ParseError.UNPARSABLE).
             # This is a known GAM API limitation, not a bug in our code.
             update_progress("Discovering Audience Segments", 5 + phase_offset)
-            audience_segments = discovery.discover_audience_segments(since=None)  # Always None = full sync
-            update_progress("Writing Audience Segments to DB", 5 + phase_offset, len(audience_segments))
-            inventory_service._write_inventory_batch(tenant_id, "audience_segment", audience_segments, sync_time)
-            segments_count = len(audience_segments)
-            discovery.audience_segments.clear()  # Clear from memory
+            segments_count = inventory_service._write_inventory_pages(
+                tenant_id, "audience_segment", discovery.iter_audience_segments(since=None), sync_time
+            )  # Always None = full sync
+            update_progress("Wrote Audience Segments to DB", 5 + phase_offset, segments_count)
             logger.info(
                 f"[{sync_id}] Wrote {segments_count} audience segments to database (always full sync - GAM API limitation)"
             )
@@ -481,11 +441,68 @@ def _run_sync_thread(
         _mark_sync_failed(sync_id, str(e))
 
     finally:
+        get_lease_heartbeat().release(sync_id)
         # Remove from active syncs
         with _sync_lock:
             _active_syncs.pop(sync_id, None)
 
 
+def _build_gam_client(adapter_config: Any) -> Any:
+    """Create a GAM client from a tenant's adapter config (OAuth or service account).
+
+    Raises ValueError when the config has no usable credentials.
+    """
+    import os
+    import tempfile
+
+    import google.oauth2.service_account
+    from googleads import ad_manager, oauth2
+
+    # Determine auth method
+    auth_method = getattr(adapter_config, "gam_auth_method", None)
+    if not auth_method:
+        if adapter_config.gam_refresh_token:
+            auth_method = "oauth"
+        elif hasattr(adapter_config, "gam_service_account_json") and adapter_config.gam_service_account_json:
+            auth_method = "service_account"
+        else:
+            raise ValueError("No GAM authentication configured")
+
+    # Create GAM client based on auth method
+    if auth_method == "service_account":
+        service_account_json_str = adapter_config.gam_service_account_json
+        if not service_account_json_str:
+            raise ValueError("Service account JSON not found")
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write(service_account_json_str)
+            temp_keyfile = f.name
+
+        try:
+            credentials = google.oauth2.service_account.Credentials.from_service_account_file(
+                temp_keyfile, scopes=["https://www.googleapis.com/auth/dfp"]
+            )
+            oauth2_client = oauth2.GoogleCredentialsClient(credentials)
+            client = ad_manager.AdManagerClient(
+                oauth2_client, "AdCP Sales Agent", network_code=adapter_config.gam_network_code
+            )
+        finally:
+            try:
+                os.unlink(temp_keyfile)
+            except Exception:
+                pass
+    else:  # OAuth
+        oauth2_client = oauth2.GoogleRefreshTokenClient(
+            client_id=os.environ.get("GAM_OAUTH_CLIENT_ID"),
+            client_secret=os.environ.get("GAM_OAUTH_CLIENT_SECRET"),
+            refresh_token=adapter_config.gam_refresh_token,
+        )
+        client = ad_manager.AdManagerClient(
+            oauth2_client, "AdCP Sales Agent", network_code=adapter_config.gam_network_code
+        )
+    return client
+
+
 def _update_sync_progress(sync_id: str, progress_data: dict[str, Any]):
     """Update sync job progress in database."""
     try:
@@ -0,0 +1,105 @@
+"""Mergeable CPM distribution sketch for format performance metrics.
+
+A log-bucketed histogram (the DDSketch scheme): a value v > 0 is counted in bucket
+ceil(log(v) / log(gamma)) with gamma = (1 + a) / (1 - a), so every bucket spans a
+fixed relative range and any quantile read back is within a relative error a of a
+value present in the data. Zero and negative CPMs share one extra bucket.
+
+Sketches merge by adding bucket counts, which is what makes rolling windows cheap:
+format_metrics_daily stores one sketch per (day, country, size) as JSON
+{bucket: count}, and a 30-day window is the SQL sum of its days' buckets.
+"""
+
+import math
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# Relative accuracy of quantiles read from a sketch (1%)
+CPM_SKETCH_RELATIVE_ACCURACY = 0.01
+
+# Bucket key for CPMs <= 0
+ZERO_BUCKET = "zero"
+
+_GAMMA = (1 + CPM_SKETCH_RELATIVE_ACCURACY) / (1 - CPM_SKETCH_RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+
+
+def bucket_key(value: float) -> str:
+    """JSON key of the bucket holding value."""
+    if value <= 0:
+        return ZERO_BUCKET
+    return str(math.ceil(math.log(value) / _LOG_GAMMA))
+
+
+def bucket_value(key: str) -> float:
+    """Representative value of a bucket (within the relative accuracy of all its members)."""
+    if key == ZERO_BUCKET:
+        return 0.0
+    return 2 * _GAMMA ** int(key) / (_GAMMA + 1)
+
+
+def _sort_key(key: str) -> float:
+    return -math.inf if key == ZERO_BUCKET else int(key)
+
+
+class CpmSketch:
+    """Approximate distribution of CPM values that can be merged and serialized."""
+
+    def __init__(self, buckets: Mapping[str, int] | None = None):
+        self.buckets: dict[str, int] = {}
+        if buckets:
+            self.merge_buckets(buckets)
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> "CpmSketch":
+        sketch = cls()
+        for value in values:
+            sketch.add(value)
+        return sketch
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def add(self, value: float, count: int = 1) -> None:
+        key = bucket_key(value)
+        self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def merge_buckets(self, buckets: Mapping[str, Any]) -> None:
+        """Add serialized bucket counts (values may be strings, as from jsonb_each_text)."""
+        for key, count in buckets.items():
+            self.buckets[str(key)] = self.buckets.get(str(key), 0) + int(count)
+
+    def merge(self, other: "CpmSketch") -> None:
+        self.merge_buckets(other.buckets)
+
+    def to_dict(self) -> dict[str, int]:
+        return dict(self.buckets)
+
+    def _value_at_rank(self, ordered: list[tuple[str, int]], rank: int) -> float:
+        seen = 0
+        for key, count in ordered:
+            seen += count
+            if seen > rank:
+                return bucket_value(key)
+        return bucket_value(ordered[-1][0])
+
+    def quantile(self, percentile: float) -> float | None:
+        """Value at percentile (0-100), interpolating between neighbouring ranks.
+
+        Matches linear interpolation over the sorted values, up to the bucket accuracy.
+        Returns None for an empty sketch.
+        """
+        total = self.count
+        if total == 0:
+            return None
+
+        ordered = sorted(((k, c) for k, c in self.buckets.items() if c > 0), key=lambda item: _sort_key(item[0]))
+        rank = (percentile / 100) * (total - 1)
+        lower_rank = int(rank)
+        weight = rank - lower_rank
+        lower = self._value_at_rank(ordered, lower_rank)
+        if weight == 0:
+            return lower
+        upper = self._value_at_rank(ordered, min(lower_rank + 1, total - 1))
+        return lower * (1 - weight) + upper * weight
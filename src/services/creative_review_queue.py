@@ -0,0 +1,334 @@
+"""Durable AI creative review queue.
+
+sync_creatives used to hand AI reviews to a four-thread executor in the admin
+blueprint and track them in a process-local dict, and every review started yet
+another thread to run its own event loop. Queued reviews were lost on restart
+and throughput was capped at four.
+
+Reviews are now CreativeReviewJob rows written in the same transaction as the
+creative and consumed by CreativeReviewWorkerPool, a pool of asyncio workers:
+
+- Jobs are claimed with ``FOR UPDATE SKIP LOCKED`` so several processes can
+  share the queue.
+- Claims are fair across tenants: each claim takes the oldest job of every
+  tenant before the second-oldest of any, and never puts more than
+  AI_REVIEW_TENANT_CONCURRENCY jobs of one tenant in flight, so one bulk upload
+  cannot starve other tenants.
+- LLM calls go through ProviderRateLimiter, which spaces calls per provider to
+  AI_REVIEW_PROVIDER_RPM (e.g. ``gemini=60,openai=500``).
+- Claims are leases: jobs stuck "in_flight" past locked_until (crashed worker)
+  become claimable again. Failed jobs are retried with backoff up to
+  max_attempts. The claim loop, workers, lease release and purge are shared
+  with the webhook outbox (LeasedQueueWorkerPool).
+- The job row doubles as the task status reported by get_ai_review_status().
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import CreativeReviewJob
+from src.core.metrics import ai_review_queue_wait, ai_review_rate_limit_wait
+from src.services.leased_queue import LeasedQueueWorkerPool
+
+logger = logging.getLogger(__name__)
+
+# Delay before attempt N+1 after N failed attempts (last value repeats)
+RETRY_SCHEDULE_SECONDS = (30, 120, 600)
+
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Worker pool tuning - configurable via env vars
+AI_REVIEW_WORKERS = int(os.getenv("AI_REVIEW_WORKERS") or "8")
+AI_REVIEW_TENANT_CONCURRENCY = int(os.getenv("AI_REVIEW_TENANT_CONCURRENCY") or "4")
+AI_REVIEW_POLL_INTERVAL_SECONDS = float(os.getenv("AI_REVIEW_POLL_INTERVAL") or "1.0")
+AI_REVIEW_LEASE_SECONDS = int(os.getenv("AI_REVIEW_LEASE_SECONDS") or "300")
+AI_REVIEW_RETENTION_DAYS = int(os.getenv("AI_REVIEW_RETENTION_DAYS") or "7")
+AI_REVIEW_DEFAULT_RPM = int(os.getenv("AI_REVIEW_DEFAULT_RPM") or "60")
+
+ReviewHandler = Callable[[dict[str, Any]], Awaitable[dict[str, Any] | None]]
+
+
+def parse_provider_rpm(value: str | None) -> dict[str, int]:
+    """Parse ``"gemini=60,openai=500"`` into a requests-per-minute map."""
+    limits: dict[str, int] = {}
+    for item in (value or "").split(","):
+        provider, _, rpm = item.partition("=")
+        if provider.strip() and rpm.strip().isdigit():
+            limits[provider.strip()] = int(rpm)
+    return limits
+
+
+class ProviderRateLimiter:
+    """Spaces LLM calls per provider to a requests-per-minute limit.
+
+    Slots are reserved under a thread lock and waited out with asyncio.sleep, so
+    one limiter serves every event loop and thread in the process (the worker
+    pool and synchronous admin UI reviews).
+    """
+
+    def __init__(self, default_rpm: int = AI_REVIEW_DEFAULT_RPM, provider_rpm: dict[str, int] | None = None):
+        self.default_rpm = default_rpm
+        self.provider_rpm = provider_rpm or {}
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, provider: str) -> float:
+        """Reserve the next call slot for ``provider``; returns seconds to wait for it."""
+        rpm = self.provider_rpm.get(provider, self.default_rpm)
+        if rpm <= 0:
+            return 0.0
+        now = time.monotonic()
+        with self._lock:
+            slot = max(now, self._next_slot.get(provider, now))
+            self._next_slot[provider] = slot + 60.0 / rpm
+        return slot - now
+
+    async def acquire(self, provider: str) -> float:
+        """Wait for a call slot; returns the time waited."""
+        wait = self.reserve(provider)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        ai_review_rate_limit_wait.labels(provider=provider).observe(wait)
+        return wait
+
+
+def enqueue_creative_review(
+    session: Session,
+    *,
+    tenant_id: str,
+    creative_id: str,
+    webhook_url: str | None = None,
+    slack_webhook_url: str | None = None,
+    principal_name: str | None = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> CreativeReviewJob:
+    """Queue an AI review in the caller's transaction.
+
+    The caller owns the session and commits it together with the creative, so
+    workers never see a job for a creative that was rolled back.
+
+    Args:
+        session: Active database session (not committed here)
+        tenant_id: Tenant that owns the creative
+        creative_id: Creative to review
+        webhook_url: Optional webhook to call when the review completes
+        slack_webhook_url: Optional Slack webhook for notifications
+        principal_name: Principal name for Slack notification
+        max_attempts: Attempts before the job is parked as failed
+
+    Returns:
+        The pending CreativeReviewJob row (task_id identifies it to callers)
+    """
+    job = CreativeReviewJob(
+        task_id=f"ai_review_{creative_id}_{uuid.uuid4().hex[:8]}",
+        tenant_id=tenant_id,
+        creative_id=creative_id,
+        webhook_url=webhook_url,
+        slack_webhook_url=slack_webhook_url,
+        principal_name=principal_name,
+        status="pending",
+        attempt_count=0,
+        max_attempts=max_attempts,
+        next_attempt_at=datetime.now(UTC),
+    )
+    session.add(job)
+    return job
+
+
+def get_review_job_status(task_id: str) -> dict[str, Any]:
+    """Report a queued review's state in the shape get_ai_review_status() returns."""
+    with get_db_session() as session:
+        job = session.scalars(select(CreativeReviewJob).filter_by(task_id=task_id)).first()
+        if job is None:
+            return {"status": "not_found", "error": "Task ID not found"}
+
+        if job.status == "pending":
+            return {"status": "queued", "creative_id": job.creative_id, "attempt_count": job.attempt_count}
+        if job.status == "in_flight":
+            return {"status": "running", "creative_id": job.creative_id}
+        if job.status == "completed":
+            return {"status": "completed", "result": job.result, "creative_id": job.creative_id}
+        return {"status": "failed", "error": job.last_error, "creative_id": job.creative_id}
+
+
+async def run_creative_review(job: dict[str, Any]) -> dict[str, Any] | None:
+    """Default review handler: review the creative, update it and notify."""
+    from src.admin.blueprints.creatives import _ai_review_creative_async
+
+    return await _ai_review_creative_async(
+        creative_id=job["creative_id"],
+        tenant_id=job["tenant_id"],
+        webhook_url=job["webhook_url"],
+        slack_webhook_url=job["slack_webhook_url"],
+        principal_name=job["principal_name"],
+    )
+
+
+class CreativeReviewWorkerPool(LeasedQueueWorkerPool):
+    """Drains the creative review queue with a pool of async review workers."""
+
+    model = CreativeReviewJob
+    description = "Creative review worker pool"
+    retry_schedule_seconds = RETRY_SCHEDULE_SECONDS
+    purge_statuses = ("completed", "failed")
+    finished_at_attribute = "completed_at"
+    retention_days = AI_REVIEW_RETENTION_DAYS
+    # Claimed jobs count against their tenant's in-flight cap, so only claim what workers can start
+    claim_ahead = 1
+
+    def __init__(
+        self,
+        worker_count: int = AI_REVIEW_WORKERS,
+        tenant_concurrency: int = AI_REVIEW_TENANT_CONCURRENCY,
+        poll_interval_seconds: float = AI_REVIEW_POLL_INTERVAL_SECONDS,
+        lease_seconds: int = AI_REVIEW_LEASE_SECONDS,
+        review_handler: ReviewHandler | None = None,
+    ) -> None:
+        super().__init__(worker_count, poll_interval_seconds, lease_seconds)
+        self.tenant_concurrency = tenant_concurrency
+        self.review_handler = review_handler or run_creative_review
+
+    def claim_batch(self, limit: int) -> list[dict[str, Any]]:
+        """Lease up to ``limit`` due jobs, round-robin across tenants within the per-tenant cap.
+
+        Returns:
+            Plain-dict snapshots of the claimed jobs, in fair order
+        """
+        now = datetime.now(UTC)
+        job = CreativeReviewJob
+        claimable = or_(
+            and_(job.status == "pending", job.next_attempt_at <= now),
+            and_(job.status == "in_flight", job.locked_until < now),
+        )
+        in_flight = (
+            select(job.tenant_id, func.count().label("running"))
+            .where(job.status == "in_flight", job.locked_until >= now)
+            .group_by(job.tenant_id)
+            .subquery()
+        )
+        ranked = (
+            select(
+                job.id,
+                job.tenant_id,
+                func.row_number().over(partition_by=job.tenant_id, order_by=job.id).label("position"),
+            )
+            .where(claimable)
+            .subquery()
+        )
+        fair_order = (
+            select(ranked.c.id)
+            .outerjoin(in_flight, in_flight.c.tenant_id == ranked.c.tenant_id)
+            .where(ranked.c.position + func.coalesce(in_flight.c.running, 0) <= self.tenant_concurrency)
+            .order_by(ranked.c.position, ranked.c.id)
+            .limit(limit)
+        )
+
+        with get_db_session() as session:
+            candidate_ids = list(session.scalars(fair_order).all())
+            if not candidate_ids:
+                return []
+
+            # Another process may have claimed some candidates meanwhile; skip those
+            rows = session.scalars(
+                select(job).where(job.id.in_(candidate_ids), claimable).with_for_update(skip_locked=True)
+            ).all()
+            rows = sorted(rows, key=lambda row: candidate_ids.index(row.id))
+
+            claimed = []
+            for row in rows:
+                row.status = "in_flight"
+                row.locked_by = self.worker_id
+                row.locked_until = self.lease_expiry(now)
+                claimed.append(
+                    {
+                        "id": row.id,
+                        "task_id": row.task_id,
+                        "tenant_id": row.tenant_id,
+                        "creative_id": row.creative_id,
+                        "webhook_url": row.webhook_url,
+                        "slack_webhook_url": row.slack_webhook_url,
+                        "principal_name": row.principal_name,
+                        "attempt_count": row.attempt_count,
+                        "max_attempts": row.max_attempts,
+                        "created_at": row.created_at,
+                    }
+                )
+            session.commit()
+
+        if claimed:
+            logger.debug(f"Claimed {len(claimed)} creative review jobs")
+        return claimed
+
+    async def process_item(self, job: dict[str, Any]) -> None:
+        """Run one claimed review and record the outcome."""
+        if job["attempt_count"] == 0 and job.get("created_at"):
+            ai_review_queue_wait.observe(max((datetime.now(UTC) - job["created_at"]).total_seconds(), 0.0))
+
+        try:
+            result = await self.review_handler(job)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            attempt_count = job["attempt_count"] + 1
+            if attempt_count >= job["max_attempts"]:
+                logger.error(f"❌ Review job {job['task_id']} failed after {attempt_count} attempts: {error}")
+                await asyncio.to_thread(self._mark_failed, job["id"], error)
+            else:
+                delay = self.retry_delay(attempt_count)
+                logger.warning(
+                    f"Review job {job['task_id']} failed (attempt {attempt_count}/{job['max_attempts']}), "
+                    f"retrying in {delay.total_seconds():.0f}s: {error}"
+                )
+                await asyncio.to_thread(self._reschedule, job["id"], delay, error)
+            return
+
+        await asyncio.to_thread(self._mark_completed, job["id"], result)
+
+    def _mark_completed(self, job_id: int, result: dict[str, Any] | None) -> None:
+        self._release(job_id, "completed", result=result, completed_at=datetime.now(UTC), last_error=None)
+
+    def _mark_failed(self, job_id: int, error: str) -> None:
+        self._release(job_id, "failed", completed_at=datetime.now(UTC), last_error=error)
+
+
+# Global instances
+_rate_limiter: ProviderRateLimiter | None = None
+_worker_pool: CreativeReviewWorkerPool | None = None
+
+
+def get_provider_rate_limiter() -> ProviderRateLimiter:
+    """Get or create the process-wide provider rate limiter."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = ProviderRateLimiter(provider_rpm=parse_provider_rpm(os.getenv("AI_REVIEW_PROVIDER_RPM")))
+    return _rate_limiter
+
+
+def get_creative_review_worker_pool() -> CreativeReviewWorkerPool:
+    """Get or create global worker pool instance."""
+    global _worker_pool
+    if _worker_pool is None:
+        _worker_pool = CreativeReviewWorkerPool()
+    return _worker_pool
+
+
+async def start_creative_review_worker_pool():
+    """Start the creative review worker pool (called at application startup)."""
+    pool = get_creative_review_worker_pool()
+    await pool.start()
+
+
+async def stop_creative_review_worker_pool():
+    """Stop the creative review worker pool (called at application shutdown)."""
+    pool = get_creative_review_worker_pool()
+    await pool.stop()
@@ -0,0 +1,436 @@
+"""Local delivery fact store synced from the ad servers.
+
+Delivery reporting used to go to the ad server on every request (a GAM report job
+per get_media_buy_delivery call, webhook and admin page view). delivery_facts holds
+delivery per media buy package and day, hourly for the day in progress, and
+delivery_sync_state records per media buy the range the facts are complete for:
+
+- sync_tenant_delivery() asks the tenant's adapter for facts since each media buy's
+  last sync, going back DELIVERY_SYNC_RESTATEMENT_DAYS because ad servers restate
+  recent days. It replaces those days and advances the sync state.
+  DeliverySyncScheduler runs it for every active tenant.
+- fetch_media_buy_deliveries() answers delivery requests from delivery_facts for
+  the media buys whose facts cover the requested period. The rest go to the adapter
+  in one batched call.
+
+Facts count as covering a period when they reach its end, or the ad server's
+freshness horizon if that is earlier (GAMDataFreshnessValidator.STANDARD_DELAY_HOURS:
+newer data is not available live either), less DELIVERY_FACTS_MAX_LAG_SECONDS of
+slack for the time between syncs. Adapters that cannot report delivery by day
+(get_delivery_facts() returns None) are never synced and always answered live.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, cast
+
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.adapters.gam_data_freshness import GAMDataFreshnessValidator
+from src.core.database.database_session import get_db_session
+from src.core.database.models import DeliveryFact, DeliverySyncState, MediaBuy, Tenant
+from src.core.database.models import Principal as PrincipalModel
+from src.core.schemas import (
+    AdapterDeliveryFacts,
+    AdapterGetMediaBuyDeliveryResponse,
+    AdapterPackageDelivery,
+    DeliveryTotals,
+    ReportingPeriod,
+)
+
+logger = logging.getLogger(__name__)
+
+DELIVERY_SYNC_INTERVAL_SECONDS = int(os.getenv("DELIVERY_SYNC_INTERVAL_SECONDS", "3600"))
+# Days before the last synced day that are re-read on each sync
+DELIVERY_SYNC_RESTATEMENT_DAYS = int(os.getenv("DELIVERY_SYNC_RESTATEMENT_DAYS", "2"))
+# How far facts may trail the ad server's freshness horizon and still answer requests
+DELIVERY_FACTS_MAX_LAG_SECONDS = int(os.getenv("DELIVERY_FACTS_MAX_LAG_SECONDS", str(2 * 3600)))
+
+# Media buys that can still be delivering; completed ones are synced through the restatement window
+SYNCED_STATUSES = ("active", "approved", "paused")
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _period_bounds(date_range: ReportingPeriod) -> tuple[datetime, datetime]:
+    start = datetime.fromisoformat(date_range.start.replace("Z", "+00:00"))
+    end = datetime.fromisoformat(date_range.end.replace("Z", "+00:00"))
+    return _as_utc(start), _as_utc(end)
+
+
+def store_delivery_facts(
+    session: Session, tenant_id: str, media_buy_ids: Sequence[str], delivery: AdapterDeliveryFacts, now: datetime
+) -> int:
+    """Replace the media buys' facts from delivery.start_date on and advance their sync state.
+
+    Runs on the caller's session; the caller commits. Returns the number of facts stored.
+    """
+    if not media_buy_ids:
+        return 0
+
+    session.execute(
+        delete(DeliveryFact).where(
+            DeliveryFact.media_buy_id.in_(media_buy_ids), DeliveryFact.day >= delivery.start_date
+        )
+    )
+    wanted = set(media_buy_ids)
+    rows = [
+        {
+            "media_buy_id": fact.media_buy_id,
+            "package_id": fact.package_id,
+            "day": fact.day,
+            "hour": fact.hour,
+            "tenant_id": tenant_id,
+            "impressions": fact.impressions,
+            "clicks": fact.clicks,
+            "spend": fact.spend,
+            "video_completions": fact.video_completions,
+            "updated_at": now,
+        }
+        for fact in delivery.facts
+        if fact.media_buy_id in wanted and fact.day >= delivery.start_date
+    ]
+    if rows:
+        session.execute(insert(DeliveryFact), rows)
+
+    stmt = insert(DeliverySyncState).values(
+        [
+            {
+                "media_buy_id": media_buy_id,
+                "tenant_id": tenant_id,
+                "synced_from": delivery.start_date,
+                "synced_through": delivery.data_valid_until,
+                "last_synced_at": now,
+            }
+            for media_buy_id in media_buy_ids
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["media_buy_id"],
+        set_={
+            "synced_from": func.least(DeliverySyncState.synced_from, stmt.excluded.synced_from),
+            "synced_through": stmt.excluded.synced_through,
+            "last_synced_at": stmt.excluded.last_synced_at,
+        },
+    )
+    session.execute(stmt)
+    return len(rows)
+
+
+def sync_media_buy_delivery(
+    session: Session, adapter: Any, tenant_id: str, media_buys: Sequence[MediaBuy], today: datetime
+) -> int | None:
+    """Sync facts for media buys sharing one adapter with a single get_delivery_facts call.
+
+    Starts at the earliest day any of them needs: its flight start when never synced,
+    otherwise its last synced day less the restatement window. Returns the number of
+    facts stored, or None when the adapter does not report delivery by day.
+    """
+    media_buy_ids = [media_buy.media_buy_id for media_buy in media_buys]
+    if not media_buy_ids:
+        return 0
+
+    synced_through = {
+        row[0]: row[1]
+        for row in session.execute(
+            select(DeliverySyncState.media_buy_id, DeliverySyncState.synced_through).where(
+                DeliverySyncState.media_buy_id.in_(media_buy_ids)
+            )
+        ).all()
+    }
+    start_dates = [today.date()]
+    for media_buy in media_buys:
+        if media_buy.media_buy_id in synced_through:
+            last_synced = _as_utc(synced_through[media_buy.media_buy_id]).date()
+            start_dates.append(last_synced - timedelta(days=DELIVERY_SYNC_RESTATEMENT_DAYS))
+        else:
+            # SQLAlchemy returns a Python date at runtime
+            start_dates.append(cast(date, media_buy.start_date))
+    start_date = min(start_dates)
+
+    delivery = adapter.get_delivery_facts(media_buy_ids, start_date, today)
+    if delivery is None:
+        return None
+    return store_delivery_facts(session, tenant_id, media_buy_ids, delivery, datetime.now(UTC))
+
+
+def sync_tenant_delivery(tenant_id: str, today: datetime | None = None) -> dict[str, Any]:
+    """Sync delivery facts for a tenant's delivering media buys, one adapter call per principal.
+
+    Each principal's facts are committed separately, so one failing principal does
+    not discard the others.
+    """
+    from src.core.config_loader import get_tenant_by_id, set_current_tenant
+    from src.core.helpers.adapter_helpers import get_adapter
+    from src.core.schemas import Principal as PrincipalSchema
+
+    today = today or datetime.now(UTC)
+    summary: dict[str, Any] = {"tenant_id": tenant_id, "media_buys": 0, "facts": 0, "failed_principals": 0}
+
+    tenant = get_tenant_by_id(tenant_id)
+    if not tenant:
+        return summary
+    set_current_tenant(tenant)
+
+    completed_since = today.date() - timedelta(days=DELIVERY_SYNC_RESTATEMENT_DAYS)
+    with get_db_session() as session:
+        media_buys = session.scalars(
+            select(MediaBuy).where(
+                MediaBuy.tenant_id == tenant_id,
+                MediaBuy.start_date <= today.date(),
+                or_(
+                    MediaBuy.status.in_(SYNCED_STATUSES),
+                    and_(MediaBuy.status == "completed", MediaBuy.end_date >= completed_since),
+                ),
+            )
+        ).all()
+
+        by_principal: dict[str, list[MediaBuy]] = {}
+        for media_buy in media_buys:
+            by_principal.setdefault(media_buy.principal_id, []).append(media_buy)
+        principals = {
+            principal.principal_id: principal
+            for principal in session.scalars(
+                select(PrincipalModel).where(
+                    PrincipalModel.tenant_id == tenant_id, PrincipalModel.principal_id.in_(list(by_principal))
+                )
+            ).all()
+        }
+
+        for principal_id, principal_media_buys in by_principal.items():
+            principal = principals.get(principal_id)
+            if principal is None:
+                continue
+            try:
+                adapter = get_adapter(
+                    PrincipalSchema(
+                        principal_id=principal.principal_id,
+                        name=principal.name,
+                        platform_mappings=principal.platform_mappings or {},
+                    ),
+                    dry_run=False,
+                )
+                stored = sync_media_buy_delivery(session, adapter, tenant_id, principal_media_buys, today)
+                if stored is None:
+                    # The adapter reports no per-day delivery; the tenant stays on live reporting
+                    return summary
+                session.commit()
+                summary["media_buys"] += len(principal_media_buys)
+                summary["facts"] += stored
+            except Exception as e:
+                session.rollback()
+                summary["failed_principals"] += 1
+                logger.error(
+                    f"Delivery sync failed for tenant {tenant_id}, principal {principal_id}: {e}", exc_info=True
+                )
+
+    return summary
+
+
+def sync_all_tenants_delivery() -> list[dict[str, Any]]:
+    """Sync delivery facts for every active tenant."""
+    with get_db_session() as session:
+        tenant_ids = list(session.scalars(select(Tenant.tenant_id).where(Tenant.is_active.is_(True))).all())
+
+    summaries = []
+    for tenant_id in tenant_ids:
+        try:
+            summaries.append(sync_tenant_delivery(tenant_id))
+        except Exception as e:
+            logger.error(f"Delivery sync failed for tenant {tenant_id}: {e}", exc_info=True)
+    return summaries
+
+
+def read_local_deliveries(
+    session: Session, tenant_id: str, media_buy_ids: Sequence[str], date_range: ReportingPeriod, now: datetime
+) -> dict[str, AdapterGetMediaBuyDeliveryResponse]:
+    """Delivery for the media buys whose synced facts cover date_range, keyed by media buy ID.
+
+    Media buys whose facts do not cover the period are left out.
+    """
+    start, end = _period_bounds(date_range)
+    horizon = _as_utc(now) - timedelta(hours=GAMDataFreshnessValidator.STANDARD_DELAY_HOURS)
+    required_through = min(end, horizon) - timedelta(seconds=DELIVERY_FACTS_MAX_LAG_SECONDS)
+
+    currencies = {
+        row[0]: row[1]
+        for row in session.execute(
+            select(DeliverySyncState.media_buy_id, MediaBuy.currency)
+            .join(MediaBuy, MediaBuy.media_buy_id == DeliverySyncState.media_buy_id)
+            .where(
+                DeliverySyncState.tenant_id == tenant_id,
+                DeliverySyncState.media_buy_id.in_(media_buy_ids),
+                DeliverySyncState.synced_from <= start.date(),
+                DeliverySyncState.synced_through >= required_through,
+            )
+        ).all()
+    }
+    if not currencies:
+        return {}
+
+    facts = session.execute(
+        select(
+            DeliveryFact.media_buy_id,
+            DeliveryFact.package_id,
+            DeliveryFact.day,
+            func.sum(DeliveryFact.impressions),
+            func.sum(DeliveryFact.clicks),
+            func.sum(DeliveryFact.spend),
+        )
+        .where(
+            DeliveryFact.media_buy_id.in_(list(currencies)),
+            DeliveryFact.day >= start.date(),
+            DeliveryFact.day <= end.date(),
+        )
+        .group_by(DeliveryFact.media_buy_id, DeliveryFact.package_id, DeliveryFact.day)
+    ).all()
+
+    totals: dict[str, dict[str, float]] = {}
+    packages: dict[str, dict[str, dict[str, float]]] = {}
+    days: dict[str, dict[date, dict[str, float]]] = {}
+    for media_buy_id, package_id, day, impressions, clicks, spend in facts:
+        for bucket in (
+            totals.setdefault(media_buy_id, {"impressions": 0, "clicks": 0, "spend": 0.0}),
+            days.setdefault(media_buy_id, {}).setdefault(day, {"impressions": 0, "clicks": 0, "spend": 0.0}),
+        ):
+            bucket["impressions"] += int(impressions or 0)
+            bucket["clicks"] += int(clicks or 0)
+            bucket["spend"] += float(spend or 0)
+        if package_id:
+            package = packages.setdefault(media_buy_id, {}).setdefault(
+                package_id, {"impressions": 0, "clicks": 0, "spend": 0.0}
+            )
+            package["impressions"] += int(impressions or 0)
+            package["spend"] += float(spend or 0)
+
+    results = {}
+    for media_buy_id, currency in currencies.items():
+        total = totals.get(media_buy_id, {"impressions": 0, "clicks": 0, "spend": 0.0})
+        impressions, clicks = int(total["impressions"]), int(total["clicks"])
+        results[media_buy_id] = AdapterGetMediaBuyDeliveryResponse(
+            media_buy_id=media_buy_id,
+            reporting_period=date_range,
+            by_package=[
+                AdapterPackageDelivery(
+                    package_id=package_id, impressions=int(metrics["impressions"]), spend=round(metrics["spend"], 2)
+                )
+                for package_id, metrics in packages.get(media_buy_id, {}).items()
+            ],
+            totals=DeliveryTotals(
+                impressions=impressions,
+                spend=round(total["spend"], 2),
+                clicks=clicks if clicks > 0 else None,
+                ctr=(clicks / impressions) if clicks > 0 and impressions > 0 else None,
+                video_completions=None,
+                completion_rate=None,
+            ),
+            currency=str(currency or "USD"),
+            daily_breakdown=[
+                {
+                    "date": day.isoformat(),
+                    "impressions": float(metrics["impressions"]),
+                    "spend": round(metrics["spend"], 2),
+                }
+                for day, metrics in sorted(days.get(media_buy_id, {}).items())
+            ]
+            or None,
+        )
+    return results
+
+
+def fetch_media_buy_deliveries(
+    adapter: Any, tenant_id: str, media_buy_ids: list[str], date_range: ReportingPeriod, today: datetime
+) -> dict[str, AdapterGetMediaBuyDeliveryResponse]:
+    """Delivery for media buys: from delivery_facts where synced, otherwise live from the adapter.
+
+    Live requests for the uncovered media buys are made with one batched adapter call.
+    If the local store cannot be read, everything is fetched live.
+    """
+    results: dict[str, AdapterGetMediaBuyDeliveryResponse] = {}
+    try:
+        with get_db_session() as session:
+            results = read_local_deliveries(session, tenant_id, media_buy_ids, date_range, datetime.now(UTC))
+    except Exception as e:
+        logger.warning(f"Could not read local delivery facts, querying the ad server: {e}")
+
+    uncovered = [media_buy_id for media_buy_id in media_buy_ids if media_buy_id not in results]
+    if uncovered:
+        results.update(adapter.get_media_buy_deliveries(media_buy_ids=uncovered, date_range=date_range, today=today))
+    return results
+
+
+class DeliverySyncScheduler:
+    """Background task that keeps delivery_facts synced for all tenants."""
+
+    def __init__(self, interval_seconds: int = DELIVERY_SYNC_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self.is_running = False
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Start the scheduler background task."""
+        async with self._lock:
+            if self.is_running:
+                logger.warning("Delivery sync scheduler is already running")
+                return
+
+            self.is_running = True
+            self._task = asyncio.create_task(self._run_scheduler())
+            logger.info(f"Delivery sync scheduler started (syncing every {self.interval_seconds}s)")
+
+    async def stop(self) -> None:
+        """Stop the scheduler background task."""
+        async with self._lock:
+            if not self.is_running:
+                return
+
+            self.is_running = False
+            if self._task:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            logger.info("Delivery sync scheduler stopped")
+
+    async def _run_scheduler(self) -> None:
+        while self.is_running:
+            try:
+                summaries = await asyncio.to_thread(sync_all_tenants_delivery)
+                logger.info(
+                    f"Delivery sync complete: {sum(s['media_buys'] for s in summaries)} media buys, "
+                    f"{sum(s['facts'] for s in summaries)} facts"
+                )
+            except Exception as e:
+                logger.error(f"Error syncing delivery facts: {e}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
+
+
+# Global scheduler instance
+_scheduler: DeliverySyncScheduler | None = None
+
+
+def get_delivery_sync_scheduler() -> DeliverySyncScheduler:
+    """Get the global delivery sync scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = DeliverySyncScheduler()
+    return _scheduler
+
+
+async def start_delivery_sync_scheduler() -> None:
+    """Start the global delivery sync scheduler."""
+    await get_delivery_sync_scheduler().start()
+
+
+async def stop_delivery_sync_scheduler() -> None:
+    """Stop the global delivery sync scheduler."""
+    await get_delivery_sync_scheduler().stop()
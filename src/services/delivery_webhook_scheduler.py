@@ -20,7 +20,7 @@ from sqlalchemy import func, select
 from src.core.database.database_session import get_db_session
 from src.core.database.models import MediaBuy, WebhookDeliveryLog
 from src.core.database.models import PushNotificationConfig as DBPushNotificationConfig
-from src.core.schemas import GetMediaBuyDeliveryRequest, GetMediaBuyDeliveryResponse
+from src.core.schemas import AggregatedTotals, GetMediaBuyDeliveryRequest, GetMediaBuyDeliveryResponse
 from src.core.tool_context import ToolContext
 from src.core.tools.media_buy_delivery import _get_media_buy_delivery_impl
 from src.services.protocol_webhook_service import get_protocol_webhook_service
@@ -97,17 +97,23 @@ class DeliveryWebhookScheduler:
                 reports_sent = 0
                 errors = 0
 
-                for media_buy in media_buys:
-                    try:
-                        # Check if this media buy has a reporting webhook configured
-                        raw_request = media_buy.raw_request or {}
-                        reporting_webhook = raw_request.get("reporting_webhook")
+                # Only media buys with a reporting webhook configured get reports
+                webhook_media_buys = [
+                    media_buy for media_buy in media_buys if (media_buy.raw_request or {}).get("reporting_webhook")
+                ]
+                deliveries = self._fetch_deliveries(webhook_media_buys, session)
 
-                        if not reporting_webhook:
-                            continue
+                for media_buy in webhook_media_buys:
+                    try:
+                        reporting_webhook = media_buy.raw_request["reporting_webhook"]
 
                         # Send delivery report
-                        await self._send_report_for_media_buy(media_buy, reporting_webhook, session)
+                        await self._send_report_for_media_buy(
+                            media_buy,
+                            reporting_webhook,
+                            session,
+                            delivery_response=deliveries.get(media_buy.media_buy_id),
+                        )
                         reports_sent += 1
 
                     except Exception as e:
@@ -119,6 +125,83 @@ class DeliveryWebhookScheduler:
         except Exception as e:
             logger.error(f"Error in daily delivery report batch: {e}", exc_info=True)
 
+    def _fetch_deliveries(self, media_buys: list[Any], session: Any) -> dict[str, GetMediaBuyDeliveryResponse]:
+        """Fetch delivery for the batch's due media buys with one request per principal.
+
+        Media buys of the same tenant and principal share an adapter, so a single
+        _get_media_buy_delivery_impl call covers all of them (one GAM report job for
+        GAM tenants). Media buys missing from the result, or whose group failed, are
+        fetched individually by _send_report_for_media_buy.
+
+        Returns:
+            Media buy ID -> delivery response containing only that media buy
+        """
+        # Skip media buys whose daily report was already sent (one query for the batch)
+        one_day_ago = datetime.now(UTC) - timedelta(hours=24)
+        sent_stmt = select(WebhookDeliveryLog.media_buy_id).where(
+            WebhookDeliveryLog.media_buy_id.in_([media_buy.media_buy_id for media_buy in media_buys]),
+            WebhookDeliveryLog.task_type == "media_buy_delivery",
+            WebhookDeliveryLog.notification_type == "scheduled",
+            WebhookDeliveryLog.status == "success",
+            WebhookDeliveryLog.created_at > one_day_ago,
+        )
+        already_sent = set(session.scalars(sent_stmt).all()) if media_buys else set()
+
+        groups: dict[tuple[str, str], list[str]] = {}
+        for media_buy in media_buys:
+            frequency = str(media_buy.raw_request["reporting_webhook"].get("frequency") or "daily").lower()
+            if frequency != "daily" or media_buy.media_buy_id in already_sent:
+                continue
+            groups.setdefault((media_buy.tenant_id, media_buy.principal_id), []).append(media_buy.media_buy_id)
+
+        deliveries: dict[str, GetMediaBuyDeliveryResponse] = {}
+        for (tenant_id, principal_id), media_buy_ids in groups.items():
+            try:
+                response = _get_media_buy_delivery_impl(
+                    self._delivery_request(media_buy_ids), self._delivery_context(tenant_id, principal_id)
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batched delivery fetch failed for principal {principal_id} ({len(media_buy_ids)} media buys): {e}"
+                )
+                continue
+
+            if not isinstance(response, GetMediaBuyDeliveryResponse) or response.errors is not None:
+                logger.warning(
+                    f"Batched delivery fetch returned errors for principal {principal_id}, fetching media buys individually"
+                )
+                continue
+
+            for media_buy_id in media_buy_ids:
+                deliveries[media_buy_id] = _delivery_for_media_buy(response, media_buy_id)
+
+        return deliveries
+
+    @staticmethod
+    def _delivery_request(media_buy_ids: list[str]) -> GetMediaBuyDeliveryRequest:
+        """Delivery request for the daily report period: yesterday (full day) until now."""
+        start_date_obj = datetime.now(UTC).date() - timedelta(days=1)
+        end_date_obj = datetime.now(UTC)
+        return GetMediaBuyDeliveryRequest(
+            media_buy_ids=media_buy_ids,
+            buyer_refs=None,
+            status_filter=None,
+            start_date=start_date_obj.strftime("%Y-%m-%d"),
+            end_date=end_date_obj.strftime("%Y-%m-%d"),
+            context=None,
+        )
+
+    @staticmethod
+    def _delivery_context(tenant_id: str, principal_id: str) -> ToolContext:
+        """Minimal tool context for fetching delivery on behalf of a principal."""
+        return ToolContext(
+            context_id=str(uuid.uuid4()),
+            tenant_id=tenant_id,
+            principal_id=principal_id,
+            tool_name="get_media_buy_delivery",
+            request_timestamp=datetime.now(UTC),
+        )
+
     async def trigger_report_for_media_buy_by_id(self, media_buy_id: str, tenant_id: str) -> bool:
         """Manually trigger a delivery report for a single media buy by ID.
 
@@ -155,7 +238,12 @@ class DeliveryWebhookScheduler:
             return False
 
     async def _send_report_for_media_buy(
-        self, media_buy: Any, reporting_webhook: dict, session: Any, force: bool = False
+        self,
+        media_buy: Any,
+        reporting_webhook: dict,
+        session: Any,
+        force: bool = False,
+        delivery_response: GetMediaBuyDeliveryResponse | None = None,
     ) -> None:
         """Send a delivery report for a single media buy.
 
@@ -164,6 +252,8 @@ class DeliveryWebhookScheduler:
             reporting_webhook: Webhook configuration dict
             session: Database session
             force: If True, bypass frequency checks and duplicate checks
+            delivery_response: Delivery already fetched for this media buy by the batch;
+                fetched here when not provided
         """
         try:
             # Determine reporting frequency from AdCP config (hourly, daily, monthly)
@@ -178,8 +268,6 @@ class DeliveryWebhookScheduler:
                 )
                 return
 
-            # Calculate reporting period for daily frequency: yesterday (full day)
-            start_date_obj = datetime.now(UTC).date() - timedelta(days=1)
             end_date_obj = datetime.now(UTC)
 
             # Check if we've already sent a scheduled delivery_report webhook for this media buy
@@ -204,27 +292,12 @@ class DeliveryWebhookScheduler:
                     )
                     return
 
-            # Fetch delivery metrics
-            # Create a minimal context object for the delivery call
-
-            context = ToolContext(
-                context_id=str(uuid.uuid4()),
-                tenant_id=media_buy.tenant_id,
-                principal_id=media_buy.principal_id,
-                tool_name="get_media_buy_delivery",
-                request_timestamp=datetime.now(UTC),
-            )
-
-            req = GetMediaBuyDeliveryRequest(
-                media_buy_ids=[media_buy.media_buy_id],
-                buyer_refs=None,
-                status_filter=None,
-                start_date=start_date_obj.strftime("%Y-%m-%d"),
-                end_date=end_date_obj.strftime("%Y-%m-%d"),
-                context=None,
-            )
-
-            delivery_response = _get_media_buy_delivery_impl(req, context)
+            # Fetch delivery metrics unless the batch already did
+            if delivery_response is None:
+                delivery_response = _get_media_buy_delivery_impl(
+                    self._delivery_request([media_buy.media_buy_id]),
+                    self._delivery_context(media_buy.tenant_id, media_buy.principal_id),
+                )
 
             if not isinstance(delivery_response, GetMediaBuyDeliveryResponse):
                 logger.warning(
@@ -336,6 +409,24 @@ class DeliveryWebhookScheduler:
             raise
 
 
+def _delivery_for_media_buy(response: GetMediaBuyDeliveryResponse, media_buy_id: str) -> GetMediaBuyDeliveryResponse:
+    """Copy of a multi-media-buy delivery response narrowed to one media buy."""
+    media_buy_deliveries = [d for d in response.media_buy_deliveries if d.media_buy_id == media_buy_id]
+    clicks = sum(d.totals.clicks or 0 for d in media_buy_deliveries)
+    return response.model_copy(
+        update={
+            "media_buy_deliveries": media_buy_deliveries,
+            "aggregated_totals": AggregatedTotals(
+                impressions=float(sum(d.totals.impressions for d in media_buy_deliveries)),
+                spend=sum(d.totals.spend for d in media_buy_deliveries),
+                clicks=float(clicks) if clicks else None,
+                video_completions=None,
+                media_buy_count=len(media_buy_deliveries),
+            ),
+        }
+    )
+
+
 # Global scheduler instance
 _scheduler: DeliveryWebhookScheduler | None = None
 
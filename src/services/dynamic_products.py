@@ -9,10 +9,16 @@ Architecture:
 - Uses singleton SignalsAgentRegistry for all signal queries
 - Registry handles multi-agent calls, auth, and MCP client management
 - Deployment specified per AdCP spec (our agent_url as destination)
+- Registry caches and coalesces identical signals queries per tenant
+- get_products waits at most DYNAMIC_VARIANTS_BUDGET_SECONDS for variants; slower
+  generation finishes in the background so the next identical brief is served
+  from the signals cache and the variants already persisted
 """
 
+import asyncio
 import hashlib
 import logging
+import os
 from datetime import datetime, timedelta
 
 from sqlalchemy import select
@@ -20,10 +26,68 @@ from sqlalchemy.orm import attributes
 
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Product
+from src.core.metrics import dynamic_variants_deferred
 from src.core.signals_agent_registry import get_signals_agent_registry
 
 logger = logging.getLogger(__name__)
 
+DYNAMIC_VARIANTS_BUDGET_SECONDS = float(os.getenv("DYNAMIC_VARIANTS_BUDGET_SECONDS", "2.0"))
+
+# Strong references to variant generation that outlived its latency budget
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def generate_variants_within_budget(
+    tenant_id: str, brief: str, our_agent_url: str | None = None, budget_seconds: float | None = None
+) -> tuple[list[Product], bool]:
+    """Generate variants, giving up after ``budget_seconds`` without cancelling the work.
+
+    If generation does not finish in time no variants are returned (the caller
+    serves static products only) and generation continues in the background,
+    persisting the variants and warming the signals cache for the next request.
+    Cancelling the caller while it is still waiting cancels generation; once deferred,
+    generation is detached from the request, so only call this for briefs that have
+    already passed the policy check.
+
+    Args:
+        tenant_id: Tenant ID
+        brief: Buyer's brief text
+        our_agent_url: Our sales agent URL for deployment specification (optional)
+        budget_seconds: Maximum wait; defaults to DYNAMIC_VARIANTS_BUDGET_SECONDS
+
+    Returns:
+        Tuple of (Product variants, whether generation was deferred to the background)
+    """
+    budget = DYNAMIC_VARIANTS_BUDGET_SECONDS if budget_seconds is None else budget_seconds
+    task = asyncio.create_task(generate_variants_for_brief(tenant_id, brief, our_agent_url))
+
+    try:
+        done, _ = await asyncio.wait({task}, timeout=max(budget, 0.0))
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    if done:
+        return task.result(), False
+
+    logger.info(
+        f"[TIMING] Dynamic variants for tenant {tenant_id} exceeded {budget:.2f}s budget, finishing in background"
+    )
+    dynamic_variants_deferred.labels(tenant_id=tenant_id).inc()
+    _background_tasks.add(task)
+    task.add_done_callback(_finish_background_generation)
+    return [], True
+
+
+def _finish_background_generation(task: asyncio.Task) -> None:
+    """Log the outcome of variant generation that outlived its request."""
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    if task.exception() is not None:
+        logger.error(f"Background dynamic variant generation failed: {task.exception()}")
+    else:
+        logger.info(f"Background dynamic variant generation finished with {len(task.result())} variants")
+
 
 async def generate_variants_for_brief(tenant_id: str, brief: str, our_agent_url: str | None = None) -> list[Product]:
     """Generate product variants from signals agents based on buyer's brief.
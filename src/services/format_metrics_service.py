@@ -2,26 +2,50 @@
 Format Performance Metrics Aggregation Service
 
 Aggregates GAM reporting data by country + creative format for dynamic pricing.
-Queries GAM ReportService with COUNTRY_CODE + CREATIVE_SIZE dimensions.
+Queries GAM ReportService with DATE + COUNTRY_CODE + CREATIVE_SIZE + LINE_ITEM_ID dimensions.
 Stores results in format_performance_metrics table for fast lookup.
 
+Each day of reporting is ingested once into format_metrics_daily: totals per
+(day, country, size) plus a mergeable sketch of the line item CPMs (see
+src/services/cpm_sketch.py). A run only queries GAM for the days after the last
+ingested one (re-reading the last FORMAT_METRICS_RESTATEMENT_DAYS, which GAM may
+still restate), and the rolling-window row is summed from the daily rows in SQL.
+
 Used by DynamicPricingService to calculate price_guidance (floor, recommended) and estimated_exposures.
 """
 
 import logging
-from datetime import datetime, timedelta
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import and_, select
+from sqlalchemy import BigInteger, and_, cast, delete, func, insert, select, true
 from sqlalchemy.orm import Session
 
 from src.adapters.gam_reporting_service import GAMReportingService
 from src.core.database.database_session import get_db_session
-from src.core.database.models import FormatPerformanceMetrics, Tenant
+from src.core.database.models import FormatMetricsDaily, FormatPerformanceMetrics, Tenant
+from src.services.cpm_sketch import CpmSketch
 
 logger = logging.getLogger(__name__)
 
+# Recent days re-ingested on every run because GAM can still restate them
+FORMAT_METRICS_RESTATEMENT_DAYS = int(os.getenv("FORMAT_METRICS_RESTATEMENT_DAYS", "2"))
+# Days of format_metrics_daily kept (must cover the longest aggregation period)
+FORMAT_METRICS_DAILY_RETENTION_DAYS = int(os.getenv("FORMAT_METRICS_DAILY_RETENTION_DAYS", "90"))
+# Worker processes for aggregate_all_tenants
+FORMAT_METRICS_WORKERS = int(os.getenv("FORMAT_METRICS_WORKERS", "4"))
+
+# format_metrics_daily.country_code for rows GAM reports without a country
+UNKNOWN_COUNTRY = ""
+
+
+def _to_decimal(value: float | None) -> Decimal | None:
+    return Decimal(str(value)) if value is not None else None
+
 
 class FormatMetricsAggregationService:
     """Service for aggregating GAM reporting data by country + format."""
@@ -29,61 +53,87 @@ class FormatMetricsAggregationService:
     def __init__(self, db_session: Session):
         self.db = db_session
 
-    def aggregate_metrics_for_tenant(self, tenant_id: str, gam_client, period_days: int = 30) -> dict[str, Any]:
+    def aggregate_metrics_for_tenant(
+        self,
+        tenant_id: str,
+        gam_client,
+        period_days: int = 30,
+        rebuild: bool = False,
+        today: date | None = None,
+    ) -> dict[str, Any]:
         """
         Aggregate format metrics for a tenant from GAM reporting.
 
+        Ingests the days missing from format_metrics_daily, then recomputes the
+        rolling window of the last period_days complete days.
+
         Args:
             tenant_id: Tenant ID
             gam_client: Initialized GAM client
             period_days: Number of days to aggregate (default 30)
+            rebuild: Re-ingest every day of the window instead of only new days
 
         Returns:
             Summary of aggregation (rows processed, formats found, etc.)
         """
         logger.info(f"Starting format metrics aggregation for tenant {tenant_id}")
 
-        # Initialize GAM reporting service
-        reporting_service = GAMReportingService(gam_client)
-
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=period_days)
-
-        # Query GAM with COUNTRY_CODE + CREATIVE_SIZE dimensions
-        # Note: We'll use the existing reporting service but need to extend it
-        # For now, let's use a direct query approach
-        logger.info(f"Querying GAM for date range: {start_date.date()} to {end_date.date()}")
+        # Window of complete days ending yesterday
+        end_date = (today or datetime.now().date()) - timedelta(days=1)
+        start_date = end_date - timedelta(days=period_days - 1)
+        ingest_start = start_date if rebuild else self._ingest_start(tenant_id, start_date)
 
         try:
-            # Build custom report query for format metrics
-            report_data = self._query_format_metrics(reporting_service, start_date, end_date)
-
-            # Process and store in database
-            summary = self._process_and_store_metrics(tenant_id, report_data, start_date, end_date)
+            days_ingested = 0
+            daily_rows = 0
+            if ingest_start <= end_date:
+                logger.info(f"Querying GAM for date range: {ingest_start} to {end_date}")
+                reporting_service = GAMReportingService(gam_client)
+                report_data = self._query_format_metrics(reporting_service, ingest_start, end_date)
+                daily_rows = self._store_daily_metrics(tenant_id, report_data, ingest_start, end_date)
+                days_ingested = (end_date - ingest_start).days + 1
+
+            self._prune_daily_metrics(tenant_id, end_date)
+
+            # Recompute the rolling window from the daily rows
+            summary = self._process_and_store_metrics(tenant_id, start_date, end_date)
+            summary["days_ingested"] = days_ingested
+            summary["daily_rows_ingested"] = daily_rows
 
             logger.info(f"Completed format metrics aggregation for tenant {tenant_id}: {summary}")
             return summary
 
         except Exception as e:
+            self.db.rollback()
             logger.error(
                 f"Failed to aggregate format metrics for tenant {tenant_id}: {e}",
                 exc_info=True,
             )
             raise
 
+    def _ingest_start(self, tenant_id: str, window_start: date) -> date:
+        """First day to query from GAM: after the last ingested day, minus the restatement days."""
+        last_day = self.db.scalar(
+            select(func.max(FormatMetricsDaily.day)).where(FormatMetricsDaily.tenant_id == tenant_id)
+        )
+        if last_day is None:
+            return window_start
+        return max(window_start, last_day + timedelta(days=1 - FORMAT_METRICS_RESTATEMENT_DAYS))
+
     def _query_format_metrics(
-        self, reporting_service: GAMReportingService, start_date: datetime, end_date: datetime
+        self, reporting_service: GAMReportingService, start_date: date, end_date: date
     ) -> list[dict[str, Any]]:
         """
         Query GAM for format metrics using ReportService.
 
-        Returns list of rows with: country_code, creative_size, impressions, revenue, clicks
+        Returns list of rows with: day, country_code, creative_size, impressions, revenue, clicks
+        (one row per line item per day)
         """
-        # Build the report query with COUNTRY_CODE + CREATIVE_SIZE dimensions
+        # Build the report query with DATE + COUNTRY_CODE + CREATIVE_SIZE dimensions;
+        # LINE_ITEM_ID splits each day into the line item CPMs the percentiles are taken over
         report_job = {
             "reportQuery": {
-                "dimensions": ["COUNTRY_CODE", "CREATIVE_SIZE"],
+                "dimensions": ["DATE", "COUNTRY_CODE", "CREATIVE_SIZE", "LINE_ITEM_ID"],
                 "columns": [
                     "AD_SERVER_IMPRESSIONS",
                     "AD_SERVER_CLICKS",
@@ -110,126 +160,197 @@ class FormatMetricsAggregationService:
         processed_data = []
         for row in report_data:
             # GAM returns data with dimension/column prefixes
-            country_code = row.get("Dimension.COUNTRY_CODE")
-            creative_size = row.get("Dimension.CREATIVE_SIZE")
             impressions = int(row.get("Column.AD_SERVER_IMPRESSIONS", 0) or 0)
-            clicks = int(row.get("Column.AD_SERVER_CLICKS", 0) or 0)
-            revenue_micros = float(row.get("Column.AD_SERVER_CPM_AND_CPC_REVENUE", 0) or 0)
 
             # Skip rows with no impressions
             if impressions == 0:
                 continue
 
+            try:
+                day = date.fromisoformat(row.get("Dimension.DATE", ""))
+            except ValueError:
+                logger.warning(f"Skipping format metrics row with invalid date: {row.get('Dimension.DATE')}")
+                continue
+
             processed_data.append(
                 {
-                    "country_code": country_code,
-                    "creative_size": creative_size,
+                    "day": day,
+                    "country_code": row.get("Dimension.COUNTRY_CODE"),
+                    "creative_size": row.get("Dimension.CREATIVE_SIZE"),
                     "impressions": impressions,
-                    "clicks": clicks,
-                    "revenue_micros": revenue_micros,
+                    "clicks": int(row.get("Column.AD_SERVER_CLICKS", 0) or 0),
+                    "revenue_micros": float(row.get("Column.AD_SERVER_CPM_AND_CPC_REVENUE", 0) or 0),
                 }
             )
 
         logger.info(f"Processed {len(processed_data)} format metric rows from GAM")
         return processed_data
 
-    def _process_and_store_metrics(
-        self,
-        tenant_id: str,
-        report_data: list[dict[str, Any]],
-        start_date: datetime,
-        end_date: datetime,
-    ) -> dict[str, Any]:
+    def _store_daily_metrics(
+        self, tenant_id: str, report_data: list[dict[str, Any]], start_date: date, end_date: date
+    ) -> int:
         """
-        Process report data and store in format_performance_metrics table.
+        Replace the tenant's format_metrics_daily rows for [start_date, end_date].
 
-        Calculates CPM percentiles and aggregates by country + format.
+        Returns the number of daily rows written.
         """
-        # Group by country + creative_size
-        metrics_by_format: dict[tuple[str, str], dict[str, Any]] = {}
+        daily: dict[tuple[date, str, str], dict[str, Any]] = {}
         for row in report_data:
-            key = (row["country_code"], row["creative_size"])
-            if key not in metrics_by_format:
-                metrics_by_format[key] = {
-                    "impressions": 0,
-                    "clicks": 0,
-                    "revenue_micros": 0.0,
-                    "line_items": [],
-                }
-
-            metrics_by_format[key]["impressions"] += row["impressions"]
-            metrics_by_format[key]["clicks"] += row["clicks"]
-            metrics_by_format[key]["revenue_micros"] += row["revenue_micros"]
-            # Track individual line item CPMs for percentile calculation
+            key = (row["day"], row["country_code"] or UNKNOWN_COUNTRY, row["creative_size"])
+            if key not in daily:
+                daily[key] = {"impressions": 0, "clicks": 0, "revenue_micros": 0.0, "sketch": CpmSketch()}
+
+            entry = daily[key]
+            entry["impressions"] += row["impressions"]
+            entry["clicks"] += row["clicks"]
+            entry["revenue_micros"] += row["revenue_micros"]
             # Revenue is in micros (1/1,000,000 dollar), so convert to dollars first
-            if row["impressions"] > 0:
-                cpm = (row["revenue_micros"] / 1_000_000 / row["impressions"]) * 1000
-                metrics_by_format[key]["line_items"].append(cpm)
+            entry["sketch"].add((row["revenue_micros"] / 1_000_000 / row["impressions"]) * 1000)
+
+        # Days are replaced whole, so sizes/countries GAM no longer reports disappear
+        self.db.execute(
+            delete(FormatMetricsDaily).where(
+                FormatMetricsDaily.tenant_id == tenant_id,
+                FormatMetricsDaily.day >= start_date,
+                FormatMetricsDaily.day <= end_date,
+            )
+        )
+        if daily:
+            self.db.execute(
+                insert(FormatMetricsDaily),
+                [
+                    {
+                        "tenant_id": tenant_id,
+                        "day": day,
+                        "country_code": country_code,
+                        "creative_size": creative_size,
+                        "total_impressions": entry["impressions"],
+                        "total_clicks": entry["clicks"],
+                        "total_revenue_micros": int(entry["revenue_micros"]),
+                        "line_item_count": entry["sketch"].count,
+                        "cpm_sketch": entry["sketch"].to_dict(),
+                    }
+                    for (day, country_code, creative_size), entry in daily.items()
+                ],
+            )
+        return len(daily)
+
+    def _prune_daily_metrics(self, tenant_id: str, end_date: date) -> None:
+        cutoff = end_date - timedelta(days=FORMAT_METRICS_DAILY_RETENTION_DAYS)
+        self.db.execute(
+            delete(FormatMetricsDaily).where(FormatMetricsDaily.tenant_id == tenant_id, FormatMetricsDaily.day < cutoff)
+        )
+
+    def _window_metrics(self, tenant_id: str, start_date: date, end_date: date) -> dict[tuple[str, str], dict]:
+        """Totals and merged CPM sketch per (country, size) over [start_date, end_date], summed in SQL."""
+        in_window = and_(
+            FormatMetricsDaily.tenant_id == tenant_id,
+            FormatMetricsDaily.day >= start_date,
+            FormatMetricsDaily.day <= end_date,
+        )
+        totals = self.db.execute(
+            select(
+                FormatMetricsDaily.country_code,
+                FormatMetricsDaily.creative_size,
+                func.sum(FormatMetricsDaily.total_impressions),
+                func.sum(FormatMetricsDaily.total_clicks),
+                func.sum(FormatMetricsDaily.total_revenue_micros),
+            )
+            .where(in_window)
+            .group_by(FormatMetricsDaily.country_code, FormatMetricsDaily.creative_size)
+        ).all()
+
+        metrics: dict[tuple[str, str], dict] = {
+            (country_code, creative_size): {
+                "impressions": int(impressions or 0),
+                "clicks": int(clicks or 0),
+                "revenue_micros": int(revenue_micros or 0),
+                "sketch": CpmSketch(),
+            }
+            for country_code, creative_size, impressions, clicks, revenue_micros in totals
+        }
+
+        # Merge the daily sketches: sum bucket counts across the window
+        buckets = func.jsonb_each_text(FormatMetricsDaily.cpm_sketch).table_valued("key", "value")
+        bucket_rows = self.db.execute(
+            select(
+                FormatMetricsDaily.country_code,
+                FormatMetricsDaily.creative_size,
+                buckets.c.key,
+                func.sum(cast(buckets.c.value, BigInteger)),
+            )
+            .select_from(FormatMetricsDaily)
+            .join(buckets, true())
+            .where(in_window)
+            .group_by(FormatMetricsDaily.country_code, FormatMetricsDaily.creative_size, buckets.c.key)
+        ).all()
+        for country_code, creative_size, key, count in bucket_rows:
+            entry = metrics.get((country_code, creative_size))
+            if entry is not None:
+                entry["sketch"].merge_buckets({key: count})
+
+        return metrics
+
+    def _process_and_store_metrics(self, tenant_id: str, start_date: date, end_date: date) -> dict[str, Any]:
+        """
+        Compute the window's metrics from format_metrics_daily and store them in format_performance_metrics.
+
+        Calculates CPM percentiles from the merged sketches.
+        """
+        metrics_by_format = self._window_metrics(tenant_id, start_date, end_date)
+
+        existing_rows = {
+            (row.country_code or UNKNOWN_COUNTRY, row.creative_size): row
+            for row in self.db.scalars(
+                select(FormatPerformanceMetrics).where(
+                    FormatPerformanceMetrics.tenant_id == tenant_id,
+                    FormatPerformanceMetrics.period_start == start_date,
+                    FormatPerformanceMetrics.period_end == end_date,
+                )
+            )
+        }
 
         # Store or update metrics in database
         rows_created = 0
         rows_updated = 0
 
         for (country_code, creative_size), data in metrics_by_format.items():
-            # Calculate CPM metrics
             total_impressions: int = data["impressions"]
-            total_clicks: int = data["clicks"]
-            total_revenue_micros: float = data["revenue_micros"]
-            line_item_list: list[float] = data["line_items"]
+            sketch: CpmSketch = data["sketch"]
 
             # Revenue is in micros (1/1,000,000 dollar), convert to dollars then to CPM
             average_cpm: float | None = (
-                (total_revenue_micros / 1_000_000 / total_impressions) * 1000 if total_impressions > 0 else None
+                (data["revenue_micros"] / 1_000_000 / total_impressions) * 1000 if total_impressions > 0 else None
             )
 
-            # Calculate percentiles from line item CPMs
-            line_item_cpms: list[float] = sorted(line_item_list)
-            median_cpm = self._calculate_percentile(line_item_cpms, 50)
-            p75_cpm = self._calculate_percentile(line_item_cpms, 75)
-            p90_cpm = self._calculate_percentile(line_item_cpms, 90)
-
-            # Upsert to database
-            stmt = select(FormatPerformanceMetrics).where(
-                and_(
-                    FormatPerformanceMetrics.tenant_id == tenant_id,
-                    FormatPerformanceMetrics.country_code == country_code,
-                    FormatPerformanceMetrics.creative_size == creative_size,
-                    FormatPerformanceMetrics.period_start == start_date.date(),
-                    FormatPerformanceMetrics.period_end == end_date.date(),
-                )
-            )
-            existing = self.db.scalars(stmt).first()
+            values = {
+                "total_impressions": total_impressions,
+                "total_clicks": data["clicks"],
+                "total_revenue_micros": data["revenue_micros"],
+                "average_cpm": _to_decimal(average_cpm),
+                "median_cpm": _to_decimal(sketch.quantile(50)),
+                "p75_cpm": _to_decimal(sketch.quantile(75)),
+                "p90_cpm": _to_decimal(sketch.quantile(90)),
+                "line_item_count": sketch.count,
+            }
 
+            existing = existing_rows.get((country_code, creative_size))
             if existing:
-                # Update existing record
-                existing.total_impressions = total_impressions
-                existing.total_clicks = total_clicks
-                existing.total_revenue_micros = int(total_revenue_micros)
-                existing.average_cpm = Decimal(str(average_cpm)) if average_cpm is not None else None
-                existing.median_cpm = Decimal(str(median_cpm)) if median_cpm is not None else None
-                existing.p75_cpm = Decimal(str(p75_cpm)) if p75_cpm is not None else None
-                existing.p90_cpm = Decimal(str(p90_cpm)) if p90_cpm is not None else None
-                existing.line_item_count = len(line_item_cpms)
+                for name, value in values.items():
+                    setattr(existing, name, value)
                 existing.last_updated = datetime.now()
                 rows_updated += 1
             else:
-                # Create new record
-                metric = FormatPerformanceMetrics(
-                    tenant_id=tenant_id,
-                    country_code=country_code,
-                    creative_size=creative_size,
-                    period_start=start_date.date(),
-                    period_end=end_date.date(),
-                    total_impressions=total_impressions,
-                    total_clicks=total_clicks,
-                    total_revenue_micros=int(total_revenue_micros),
-                    average_cpm=Decimal(str(average_cpm)) if average_cpm is not None else None,
-                    median_cpm=Decimal(str(median_cpm)) if median_cpm is not None else None,
-                    p75_cpm=Decimal(str(p75_cpm)) if p75_cpm is not None else None,
-                    p90_cpm=Decimal(str(p90_cpm)) if p90_cpm is not None else None,
-                    line_item_count=len(line_item_cpms),
+                self.db.add(
+                    FormatPerformanceMetrics(
+                        tenant_id=tenant_id,
+                        country_code=country_code or None,
+                        creative_size=creative_size,
+                        period_start=start_date,
+                        period_end=end_date,
+                        **values,
+                    )
                 )
-                self.db.add(metric)
                 rows_created += 1
 
         self.db.commit()
@@ -241,35 +362,46 @@ class FormatMetricsAggregationService:
             "total_impressions": sum(m["impressions"] for m in metrics_by_format.values()),
         }
 
-    def _calculate_percentile(self, sorted_values: list[float], percentile: int) -> float | None:
-        """Calculate percentile from sorted list of values."""
-        if not sorted_values:
-            return None
 
-        if len(sorted_values) == 1:
-            return sorted_values[0]
+def aggregate_tenant_metrics(
+    tenant_id: str, network_code: str, refresh_token: str, period_days: int = 30, rebuild: bool = False
+) -> dict[str, Any]:
+    """
+    Aggregate format metrics for one tenant with its own GAM client and database session.
+
+    Module-level so aggregate_all_tenants can run it in worker processes.
+    """
+    from src.adapters.gam.client import GAMClientManager
+
+    client_manager = GAMClientManager({"refresh_token": refresh_token}, network_code)
+    gam_client = client_manager.get_client()
+
+    with get_db_session() as db_session:
+        service = FormatMetricsAggregationService(db_session)
+        return service.aggregate_metrics_for_tenant(tenant_id, gam_client, period_days, rebuild=rebuild)
 
-        # Use linear interpolation
-        index = (percentile / 100) * (len(sorted_values) - 1)
-        lower_index = int(index)
-        upper_index = min(lower_index + 1, len(sorted_values) - 1)
-        weight = index - lower_index
 
-        return sorted_values[lower_index] * (1 - weight) + sorted_values[upper_index] * weight
+def _configure_worker_logging(level: int) -> None:
+    logging.basicConfig(level=level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
 
-def aggregate_all_tenants(period_days: int = 30) -> dict[str, Any]:
+def aggregate_all_tenants(
+    period_days: int = 30, max_workers: int = FORMAT_METRICS_WORKERS, rebuild: bool = False
+) -> dict[str, Any]:
     """
     Aggregate format metrics for all active tenants with GAM configured.
 
+    Tenants are processed in parallel worker processes (report download and parsing
+    are CPU-bound and hold the GIL); each worker opens its own database connections.
+
     Args:
         period_days: Number of days to aggregate
+        max_workers: Worker processes (1 runs tenants sequentially in this process)
+        rebuild: Re-ingest every day of the window instead of only new days
 
     Returns:
         Summary of aggregation across all tenants
     """
-    from src.adapters.gam.auth import GAMAuthManager
-    from src.adapters.gam.client import GAMClientManager
     from src.core.database.models import AdapterConfig
 
     logger.info("Starting format metrics aggregation for all tenants")
@@ -277,7 +409,7 @@ def aggregate_all_tenants(period_days: int = 30) -> dict[str, Any]:
     with get_db_session() as db_session:
         # Get all active tenants with GAM configured
         stmt = (
-            select(Tenant, AdapterConfig)
+            select(Tenant.tenant_id, Tenant.name, AdapterConfig.gam_network_code, AdapterConfig.gam_refresh_token)
             .join(AdapterConfig, Tenant.tenant_id == AdapterConfig.tenant_id)
             .where(
                 Tenant.ad_server == "google_ad_manager",
@@ -286,59 +418,75 @@ def aggregate_all_tenants(period_days: int = 30) -> dict[str, Any]:
                 AdapterConfig.gam_refresh_token.isnot(None),
             )
         )
-        tenants = db_session.execute(stmt).all()
-
-        summary: dict[str, Any] = {
-            "total_tenants": len(tenants),
-            "successful": 0,
-            "failed": 0,
-            "details": [],
-        }
-
-        for tenant, adapter_config in tenants:
-            tenant_id = tenant.tenant_id
-            logger.info(f"Processing tenant: {tenant.name} ({tenant_id})")
-
-            try:
-                # Initialize GAM client
-                auth_config = {
-                    "refresh_token": adapter_config.gam_refresh_token,
+        tenants = [tuple(row) for row in db_session.execute(stmt).all()]
+
+    summary: dict[str, Any] = {
+        "total_tenants": len(tenants),
+        "successful": 0,
+        "failed": 0,
+        "details": [],
+    }
+
+    def record(tenant_id: str, tenant_name: str, tenant_summary: dict | None, error: Exception | None) -> None:
+        if error is None:
+            summary["successful"] += 1
+            summary["details"].append(
+                {
+                    "tenant_id": tenant_id,
+                    "tenant_name": tenant_name,
+                    "status": "success",
+                    "summary": tenant_summary,
                 }
-                auth_manager = GAMAuthManager(auth_config)
-                client_manager = GAMClientManager(auth_config, adapter_config.gam_network_code)
-                gam_client = client_manager.get_client()
-
-                # Aggregate metrics
-                service = FormatMetricsAggregationService(db_session)
-                tenant_summary = service.aggregate_metrics_for_tenant(tenant_id, gam_client, period_days)
+            )
+        else:
+            logger.error(f"Failed to aggregate metrics for tenant {tenant_id}: {error}")
+            summary["failed"] += 1
+            summary["details"].append(
+                {
+                    "tenant_id": tenant_id,
+                    "tenant_name": tenant_name,
+                    "status": "failed",
+                    "error": str(error),
+                }
+            )
 
-                summary["successful"] += 1
-                summary["details"].append(
-                    {
-                        "tenant_id": tenant_id,
-                        "tenant_name": tenant.name,
-                        "status": "success",
-                        "summary": tenant_summary,
-                    }
+    workers = min(max_workers, len(tenants))
+    if workers <= 1:
+        for tenant_id, tenant_name, network_code, refresh_token in tenants:
+            logger.info(f"Processing tenant: {tenant_name} ({tenant_id})")
+            try:
+                record(
+                    tenant_id,
+                    tenant_name,
+                    aggregate_tenant_metrics(tenant_id, network_code, refresh_token, period_days, rebuild),
+                    None,
                 )
-
             except Exception as e:
-                logger.error(
-                    f"Failed to aggregate metrics for tenant {tenant_id}: {e}",
-                    exc_info=True,
-                )
-                summary["failed"] += 1
-                summary["details"].append(
-                    {
-                        "tenant_id": tenant_id,
-                        "tenant_name": tenant.name,
-                        "status": "failed",
-                        "error": str(e),
-                    }
+                record(tenant_id, tenant_name, None, e)
+    else:
+        # spawn: forked children would inherit the parent's pooled database connections
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_configure_worker_logging,
+            initargs=(logging.getLogger().getEffectiveLevel(),),
+        ) as pool:
+            futures = {
+                pool.submit(aggregate_tenant_metrics, tenant_id, network_code, refresh_token, period_days, rebuild): (
+                    tenant_id,
+                    tenant_name,
                 )
-
-        logger.info(
-            f"Completed format metrics aggregation: {summary['successful']} successful, "
-            f"{summary['failed']} failed out of {summary['total_tenants']} tenants"
-        )
-        return summary
+                for tenant_id, tenant_name, network_code, refresh_token in tenants
+            }
+            for future in as_completed(futures):
+                tenant_id, tenant_name = futures[future]
+                try:
+                    record(tenant_id, tenant_name, future.result(), None)
+                except Exception as e:
+                    record(tenant_id, tenant_name, None, e)
+
+    logger.info(
+        f"Completed format metrics aggregation: {summary['successful']} successful, "
+        f"{summary['failed']} failed out of {summary['total_tenants']} tenants"
+    )
+    return summary
@@ -9,6 +9,7 @@ This service:
 """
 
 import logging
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -351,12 +352,13 @@ class GAMInventoryService:
         """
         Stream inventory sync: fetch and write each type separately to minimize memory.
 
-        This method syncs inventory types one at a time:
-        1. Fetch ad units from GAM → write to DB → clear from memory
-        2. Fetch placements from GAM → write to DB → clear from memory
-        3. Fetch labels from GAM → write to DB → clear from memory
-        4. Fetch custom targeting keys (values lazy loaded) → write to DB → clear from memory
-        5. Fetch audience segments → write to DB → clear from memory
+        This method syncs inventory types one at a time, writing each GAM page to the
+        DB as it arrives (nothing is kept on the discovery instance):
+        1. Stream ad units from GAM → write to DB
+        2. Stream placements from GAM → write to DB
+        3. Stream labels from GAM → write to DB
+        4. Stream custom targeting keys (values lazy loaded) → write to DB
+        5. Stream audience segments → write to DB
 
         Memory usage stays bounded regardless of inventory size.
 
@@ -386,19 +388,15 @@ class GAMInventoryService:
 
         # 1. Sync ad units (stream and write)
         logger.info("Streaming ad units...")
-        ad_units = discovery.discover_ad_units()
-        self._write_inventory_batch(tenant_id, "ad_unit", ad_units, sync_time)
-        counts["ad_units"] = len(ad_units)
-        discovery.ad_units.clear()  # Clear from memory immediately
+        counts["ad_units"] = self._write_inventory_pages(tenant_id, "ad_unit", discovery.iter_ad_units(), sync_time)
         logger.info(f"Synced {counts['ad_units']} ad units")
 
         # 2. Sync placements (stream and write)
         logger.info("Streaming placements...")
         try:
-            placements = discovery.discover_placements()
-            self._write_inventory_batch(tenant_id, "placement", placements, sync_time)
-            counts["placements"] = len(placements)
-            discovery.placements.clear()  # Clear from memory
+            counts["placements"] = self._write_inventory_pages(
+                tenant_id, "placement", discovery.iter_placements(), sync_time
+            )
             logger.info(f"Synced {counts['placements']} placements")
         except Exception as e:
             logger.error(f"⏰ Placements sync timed out or failed: {e}. Continuing with other inventory types...")
@@ -407,10 +405,7 @@ class GAMInventoryService:
         # 3. Sync labels (stream and write)
         logger.info("Streaming labels...")
         try:
-            labels = discovery.discover_labels()
-            self._write_inventory_batch(tenant_id, "label", labels, sync_time)
-            counts["labels"] = len(labels)
-            discovery.labels.clear()  # Clear from memory
+            counts["labels"] = self._write_inventory_pages(tenant_id, "label", discovery.iter_labels(), sync_time)
             logger.info(f"Synced {counts['labels']} labels")
         except Exception as e:
             logger.error(f"⏰ Labels sync timed out or failed: {e}. Continuing with other inventory types...")
@@ -419,15 +414,10 @@ class GAMInventoryService:
         # 4. Sync custom targeting KEYS ONLY (values lazy loaded on demand)
         logger.info("Streaming custom targeting keys (values lazy loaded)...")
         try:
-            custom_targeting = discovery.discover_custom_targeting(
-                max_values_per_key=None,
-                fetch_values=False,  # Don't fetch values  # Lazy load values on demand
-            )
-            self._write_custom_targeting_keys(tenant_id, list(discovery.custom_targeting_keys.values()), sync_time)
-            counts["custom_targeting_keys"] = len(discovery.custom_targeting_keys)
-            counts["custom_targeting_values"] = custom_targeting.get("total_values", 0)
-            discovery.custom_targeting_keys.clear()  # Clear from memory
-            discovery.custom_targeting_values.clear()  # Clear from memory
+            # Don't fetch values - lazy load values on demand
+            keys = [key for page in discovery.iter_custom_targeting_keys() for key in page]
+            self._write_custom_targeting_keys(tenant_id, keys, sync_time)
+            counts["custom_targeting_keys"] = len(keys)
             logger.info(f"Synced {counts['custom_targeting_keys']} custom targeting keys (values lazy loaded)")
         except Exception as e:
             logger.error(f"⏰ Custom targeting sync timed out or failed: {e}. Continuing with other inventory types...")
@@ -436,10 +426,9 @@ class GAMInventoryService:
 
         # 5. Sync audience segments (first-party only)
         logger.info("Streaming audience segments...")
-        audience_segments = discovery.discover_audience_segments()
-        self._write_inventory_batch(tenant_id, "audience_segment", audience_segments, sync_time)
-        counts["audience_segments"] = len(audience_segments)
-        discovery.audience_segments.clear()  # Clear from memory
+        counts["audience_segments"] = self._write_inventory_pages(
+            tenant_id, "audience_segment", discovery.iter_audience_segments(), sync_time
+        )
         logger.info(f"Synced {counts['audience_segments']} audience segments")
 
         # Mark old items as stale
@@ -480,40 +469,63 @@ class GAMInventoryService:
         if not items:
             return
 
-        logger.info(f"📊 Writing {len(items)} {inventory_type} items to database...")
+        self._write_inventory_pages(tenant_id, inventory_type, [items], sync_time)
 
-        BATCH_SIZE = 500
+    def _write_inventory_pages(
+        self, tenant_id: str, inventory_type: str, pages: Iterable[list], sync_time: datetime
+    ) -> int:
+        """Write inventory to database as pages arrive from a GAMInventoryDiscovery ``iter_*`` stream.
 
-        # Load existing inventory IDs once
-        logger.info(f"🔍 Loading existing {inventory_type} IDs from database...")
-        stmt = select(GAMInventory.inventory_id, GAMInventory.id).where(
-            and_(GAMInventory.tenant_id == tenant_id, GAMInventory.inventory_type == inventory_type)
-        )
-        existing = self.db.execute(stmt).all()
-        existing_ids = {row.inventory_id: row.id for row in existing}
-        logger.info(f"✅ Found {len(existing_ids)} existing {inventory_type} items")
+        Existing IDs are loaded once, then each page is converted, flushed in batches and
+        dropped, so memory stays bounded by a page rather than the whole inventory type.
+
+        Args:
+            tenant_id: Tenant ID
+            inventory_type: Type of inventory (ad_unit, placement, label, audience_segment)
+            pages: Iterable of inventory item pages
+            sync_time: Sync timestamp
+
+        Returns:
+            Number of items written
+        """
+        BATCH_SIZE = 500
 
+        existing_ids: dict[str, int] | None = None
         to_insert: list[dict[str, Any]] = []
         to_update: list[dict[str, Any]] = []
         batch_num = 0
+        written = 0
 
-        logger.info(f"🔄 Processing {len(items)} items (batch size: {BATCH_SIZE})...")
-        for idx, item in enumerate(items):
-            item_data = self._convert_item_to_db_format(tenant_id, inventory_type, item, sync_time)
+        for page in pages:
+            if not page:
+                continue
 
-            if item.id in existing_ids:
-                item_data["id"] = existing_ids[item.id]
-                to_update.append(item_data)
-            else:
-                to_insert.append(item_data)
+            if existing_ids is None:
+                # Load existing inventory IDs once, on the first non-empty page
+                logger.info(f"🔍 Loading existing {inventory_type} IDs from database...")
+                stmt = select(GAMInventory.inventory_id, GAMInventory.id).where(
+                    and_(GAMInventory.tenant_id == tenant_id, GAMInventory.inventory_type == inventory_type)
+                )
+                existing_ids = {row.inventory_id: row.id for row in self.db.execute(stmt).all()}
+                logger.info(f"✅ Found {len(existing_ids)} existing {inventory_type} items")
 
-            # Flush batch
-            if (len(to_insert) + len(to_update)) >= BATCH_SIZE:
-                batch_num += 1
-                logger.info(f"💾 Flushing batch {batch_num} (processed {idx + 1}/{len(items)} items)...")
-                self._flush_batch(to_insert, to_update)
-                to_insert.clear()
-                to_update.clear()
+            for item in page:
+                item_data = self._convert_item_to_db_format(tenant_id, inventory_type, item, sync_time)
+                written += 1
+
+                if item.id in existing_ids:
+                    item_data["id"] = existing_ids[item.id]
+                    to_update.append(item_data)
+                else:
+                    to_insert.append(item_data)
+
+                # Flush batch
+                if (len(to_insert) + len(to_update)) >= BATCH_SIZE:
+                    batch_num += 1
+                    logger.info(f"💾 Flushing batch {batch_num} (processed {written} {inventory_type} items)...")
+                    self._flush_batch(to_insert, to_update)
+                    to_insert.clear()
+                    to_update.clear()
 
         # Flush remaining
         if to_insert or to_update:
@@ -521,7 +533,9 @@ class GAMInventoryService:
             logger.info(f"💾 Flushing final batch {batch_num} ({len(to_insert)} new, {len(to_update)} updates)...")
             self._flush_batch(to_insert, to_update)
 
-        logger.info(f"✅ Completed writing {len(items)} {inventory_type} items in {batch_num} batch(es)")
+        if written:
+            logger.info(f"✅ Completed writing {written} {inventory_type} items in {batch_num} batch(es)")
+        return written
 
     def _write_custom_targeting_keys(self, tenant_id: str, keys: list, sync_time: datetime):
         """Write custom targeting keys to database (values are lazy loaded separately).
@@ -9,15 +9,20 @@ This service:
 """
 
 import logging
-from datetime import UTC, date, datetime
+import time
+from collections import defaultdict
+from datetime import UTC, date, datetime, timedelta
 from typing import Any, cast
 
-from sqlalchemy import create_engine, or_, select
+from sqlalchemy import create_engine, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session, joinedload, scoped_session, sessionmaker
 
 from src.adapters.gam_orders_discovery import GAMOrdersDiscovery, LineItem, Order
+from src.admin.services.media_buy_readiness_service import store_readiness_snapshots
 from src.core.database.db_config import DatabaseConfig
-from src.core.database.models import GAMLineItem, GAMOrder
+from src.core.database.models import GAMLineItem, GAMOrder, SyncJob
+from src.services.background_sync_service import _update_sync_progress
 
 # Create database session factory
 engine = create_engine(DatabaseConfig.get_connection_string())
@@ -28,227 +33,270 @@ db_session = scoped_session(SessionLocal)
 logger = logging.getLogger(__name__)
 
 
+# Re-read this much before the watermark: covers GAM clock skew and writes
+# committed while the previous sync was paging
+ORDERS_SYNC_OVERLAP = timedelta(minutes=5)
+UPSERT_BATCH_SIZE = 500
+ORDERS_SYNC_PHASES = 4
+
+# Delivery stats are only written when GAM returned them, as before
+_LINE_ITEM_STATS_COLUMNS = (
+    "stats_impressions",
+    "stats_clicks",
+    "stats_ctr",
+    "stats_video_completions",
+    "stats_video_starts",
+    "stats_viewable_impressions",
+)
+
+
+class _SyncProgress:
+    """Orders sync progress on the SyncJob: the inventory sync's shape plus write throughput."""
+
+    def __init__(self, sync_id: str | None, mode: str):
+        self.sync_id = sync_id
+        self.mode = mode
+        self.started = time.monotonic()
+        self.rows = 0
+        self.phase: tuple[str, int, int] = ("Starting", 0, 0)
+
+    def rows_per_second(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return round(self.rows / elapsed, 1) if elapsed > 0 else 0.0
+
+    def update(self, phase: str, phase_num: int, count: int = 0) -> None:
+        self.phase = (phase, phase_num, count)
+        if self.sync_id:
+            _update_sync_progress(
+                self.sync_id,
+                {
+                    "phase": phase,
+                    "phase_num": phase_num,
+                    "total_phases": ORDERS_SYNC_PHASES,
+                    "count": count,
+                    "mode": self.mode,
+                    "rows_written": self.rows,
+                    "rows_per_second": self.rows_per_second(),
+                },
+            )
+
+    def rows_written(self, rows: int) -> None:
+        self.rows += rows
+        self.update(*self.phase)
+
+
 class GAMOrdersService:
     """Service for managing GAM orders and line items data."""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session | scoped_session[Session]):
         self.db = db_session
 
-    def sync_tenant_orders(self, tenant_id: str, gam_client) -> dict[str, Any]:
+    def sync_tenant_orders(
+        self, tenant_id: str, gam_client, sync_id: str | None = None, sync_mode: str = "incremental"
+    ) -> dict[str, Any]:
         """
-        Sync all orders and line items for a tenant from GAM to database.
+        Sync orders and line items for a tenant from GAM to database.
+
+        An incremental sync only fetches what GAM reports as modified since the
+        tenant's last completed orders sync (falling back to full when there is
+        none). Progress is written to the SyncJob in the inventory sync's shape.
 
         Args:
             tenant_id: Tenant ID
             gam_client: Initialized GAM client
+            sync_id: SyncJob to report progress on
+            sync_mode: "incremental" or "full"
 
         Returns:
             Sync summary with counts and timing
         """
-        logger.info(f"Starting orders sync for tenant {tenant_id}")
-
-        # Create discovery instance
+        since = self._get_sync_watermark(tenant_id) if sync_mode == "incremental" else None
+        if sync_mode == "incremental" and since is None:
+            logger.info(f"No completed orders sync for tenant {tenant_id} - falling back to full sync")
+        sync_mode = "incremental" if since else "full"
+        logger.info(f"Starting {sync_mode} orders sync for tenant {tenant_id}")
+
+        start_time = datetime.now()
+        progress = _SyncProgress(sync_id, sync_mode)
         discovery = GAMOrdersDiscovery(gam_client, tenant_id)
-
-        # Perform discovery
-        sync_summary = discovery.sync_all()
-
-        # Save to database
-        self._save_orders_to_db(tenant_id, discovery)
-
-        return sync_summary
-
-    def _save_orders_to_db(self, tenant_id: str, discovery: GAMOrdersDiscovery):
-        """Save discovered orders and line items to database."""
         sync_time = datetime.now(UTC)
 
-        # Process orders
-        for order in discovery.orders.values():
-            self._upsert_order(tenant_id, order, sync_time)
-
-        # Process line items
-        for line_item in discovery.line_items.values():
-            self._upsert_line_item(tenant_id, line_item, sync_time)
+        progress.update("Discovering Orders", 1)
+        orders = discovery.discover_orders(since=since)
+        progress.update("Writing Orders to DB", 2, len(orders))
+        self._write_orders(tenant_id, orders, sync_time, progress)
+
+        progress.update("Discovering Line Items", 3)
+        line_items = discovery.discover_line_items(since=since)
+        progress.update("Writing Line Items to DB", 4, len(line_items))
+        self._write_line_items(tenant_id, line_items, sync_time, progress)
+
+        sync_summary = discovery.build_summary(orders, line_items, start_time, since)
+        sync_summary["rows_per_second"] = progress.rows_per_second()
+        logger.info(
+            f"Orders sync completed for tenant {tenant_id}: {len(orders)} orders, {len(line_items)} line items "
+            f"({sync_summary['rows_per_second']} rows/sec)"
+        )
+        return sync_summary
 
-        # Commit all changes
+    def _get_sync_watermark(self, tenant_id: str) -> datetime | None:
+        """lastModifiedDateTime to sync from: the start of the last completed orders sync."""
+        last_sync = self.db.scalars(
+            select(SyncJob)
+            .where(SyncJob.tenant_id == tenant_id, SyncJob.sync_type == "orders", SyncJob.status == "completed")
+            .order_by(SyncJob.started_at.desc())
+            .limit(1)
+        ).first()
+        if not last_sync or not last_sync.started_at:
+            return None
+        # started_at (not completed_at) so nothing modified during that sync is missed
+        started_at = last_sync.started_at
+        if started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=UTC)
+        return started_at - ORDERS_SYNC_OVERLAP
+
+    def _write_orders(
+        self, tenant_id: str, orders: list[Order], sync_time: datetime, progress: "_SyncProgress | None" = None
+    ) -> None:
+        rows = [self._order_row(tenant_id, order, sync_time) for order in orders]
+        self._upsert_rows(GAMOrder, ["tenant_id", "order_id"], rows, progress)
         self.db.commit()
-        logger.info(f"Saved {len(discovery.orders)} orders and {len(discovery.line_items)} line items to database")
-
-    def _upsert_order(self, tenant_id: str, order: Order, sync_time: datetime):
-        """Insert or update an order."""
-        stmt = select(GAMOrder).filter_by(tenant_id=tenant_id, order_id=order.order_id)
-        existing = self.db.scalars(stmt).first()
-
-        if existing:
-            # Update existing order
-            existing.name = order.name
-            existing.advertiser_id = order.advertiser_id
-            existing.advertiser_name = order.advertiser_name
-            existing.agency_id = order.agency_id
-            existing.agency_name = order.agency_name
-            existing.trafficker_id = order.trafficker_id
-            existing.trafficker_name = order.trafficker_name
-            existing.salesperson_id = order.salesperson_id
-            existing.salesperson_name = order.salesperson_name
-            existing.status = order.status.value
-            existing.start_date = cast(Any, order.start_date)
-            existing.end_date = cast(Any, order.end_date)
-            existing.unlimited_end_date = order.unlimited_end_date
-            existing.total_budget = order.total_budget
-            existing.currency_code = order.currency_code
-            existing.external_order_id = order.external_order_id
-            existing.po_number = order.po_number
-            existing.notes = order.notes
-            existing.last_modified_date = cast(Any, order.last_modified_date)
-            existing.is_programmatic = order.is_programmatic
-            existing.applied_labels = order.applied_labels
-            existing.effective_applied_labels = order.effective_applied_labels
-            existing.custom_field_values = order.custom_field_values
-            existing.order_metadata = order.order_metadata
-            existing.last_synced = cast(Any, sync_time)
-        else:
-            # Create new order
-            new_order = GAMOrder(
-                tenant_id=tenant_id,
-                order_id=order.order_id,
-                name=order.name,
-                advertiser_id=order.advertiser_id,
-                advertiser_name=order.advertiser_name,
-                agency_id=order.agency_id,
-                agency_name=order.agency_name,
-                trafficker_id=order.trafficker_id,
-                trafficker_name=order.trafficker_name,
-                salesperson_id=order.salesperson_id,
-                salesperson_name=order.salesperson_name,
-                status=order.status.value,
-                start_date=order.start_date,
-                end_date=order.end_date,
-                unlimited_end_date=order.unlimited_end_date,
-                total_budget=order.total_budget,
-                currency_code=order.currency_code,
-                external_order_id=order.external_order_id,
-                po_number=order.po_number,
-                notes=order.notes,
-                last_modified_date=order.last_modified_date,
-                is_programmatic=order.is_programmatic,
-                applied_labels=order.applied_labels,
-                effective_applied_labels=order.effective_applied_labels,
-                custom_field_values=order.custom_field_values,
-                order_metadata=order.order_metadata,
-                last_synced=sync_time,
-            )
-            self.db.add(new_order)
-
-    def _upsert_line_item(self, tenant_id: str, line_item: LineItem, sync_time: datetime):
-        """Insert or update a line item."""
-        stmt = select(GAMLineItem).filter_by(tenant_id=tenant_id, line_item_id=line_item.line_item_id)
-        existing = self.db.scalars(stmt).first()
-
-        if existing:
-            # Update existing line item
-            existing.order_id = line_item.order_id
-            existing.name = line_item.name
-            existing.status = line_item.status.value
-            existing.line_item_type = line_item.line_item_type
-            existing.priority = line_item.priority
-            existing.start_date = cast(Any, line_item.start_date)
-            existing.end_date = cast(Any, line_item.end_date)
-            existing.unlimited_end_date = line_item.unlimited_end_date
-            existing.auto_extension_days = line_item.auto_extension_days
-            existing.cost_type = line_item.cost_type
-            existing.cost_per_unit = line_item.cost_per_unit
-            existing.discount_type = line_item.discount_type
-            existing.discount = line_item.discount
-            existing.contracted_units_bought = line_item.contracted_units_bought
-            existing.delivery_rate_type = line_item.delivery_rate_type
-            existing.goal_type = line_item.goal_type
-            existing.primary_goal_type = line_item.primary_goal_type
-            existing.primary_goal_units = line_item.primary_goal_units
-            existing.impression_limit = line_item.impression_limit
-            existing.click_limit = line_item.click_limit
-            existing.target_platform = line_item.target_platform
-            existing.environment_type = line_item.environment_type
-            existing.allow_overbook = line_item.allow_overbook
-            existing.skip_inventory_check = line_item.skip_inventory_check
-            existing.reserve_at_creation = line_item.reserve_at_creation
-
-            # Update stats if available
-            if line_item.stats:
-                existing.stats_impressions = line_item.stats.get("impressions")
-                existing.stats_clicks = line_item.stats.get("clicks")
-                existing.stats_ctr = line_item.stats.get("ctr")
-                existing.stats_video_completions = line_item.stats.get("video_completions")
-                existing.stats_video_starts = line_item.stats.get("video_starts")
-                existing.stats_viewable_impressions = line_item.stats.get("viewable_impressions")
-
-            existing.delivery_indicator_type = line_item.delivery_indicator_type
-            existing.delivery_data = line_item.delivery_data
-            existing.targeting = line_item.targeting
-            existing.creative_placeholders = line_item.creative_placeholders
-            existing.frequency_caps = line_item.frequency_caps
-            existing.applied_labels = line_item.applied_labels
-            existing.effective_applied_labels = line_item.effective_applied_labels
-            existing.custom_field_values = line_item.custom_field_values
-            existing.third_party_measurement_settings = line_item.third_party_measurement_settings
-            existing.video_max_duration = line_item.video_max_duration
-            existing.line_item_metadata = line_item.line_item_metadata
-            existing.last_modified_date = cast(Any, line_item.last_modified_date)
-            existing.creation_date = cast(Any, line_item.creation_date)
-            existing.external_id = line_item.external_id
-            existing.last_synced = cast(Any, sync_time)
-        else:
-            # Create new line item
-            new_line_item = GAMLineItem(
-                tenant_id=tenant_id,
-                line_item_id=line_item.line_item_id,
-                order_id=line_item.order_id,
-                name=line_item.name,
-                status=line_item.status.value,
-                line_item_type=line_item.line_item_type,
-                priority=line_item.priority,
-                start_date=line_item.start_date,
-                end_date=line_item.end_date,
-                unlimited_end_date=line_item.unlimited_end_date,
-                auto_extension_days=line_item.auto_extension_days,
-                cost_type=line_item.cost_type,
-                cost_per_unit=line_item.cost_per_unit,
-                discount_type=line_item.discount_type,
-                discount=line_item.discount,
-                contracted_units_bought=line_item.contracted_units_bought,
-                delivery_rate_type=line_item.delivery_rate_type,
-                goal_type=line_item.goal_type,
-                primary_goal_type=line_item.primary_goal_type,
-                primary_goal_units=line_item.primary_goal_units,
-                impression_limit=line_item.impression_limit,
-                click_limit=line_item.click_limit,
-                target_platform=line_item.target_platform,
-                environment_type=line_item.environment_type,
-                allow_overbook=line_item.allow_overbook,
-                skip_inventory_check=line_item.skip_inventory_check,
-                reserve_at_creation=line_item.reserve_at_creation,
-                stats_impressions=line_item.stats.get("impressions") if line_item.stats else None,
-                stats_clicks=line_item.stats.get("clicks") if line_item.stats else None,
-                stats_ctr=line_item.stats.get("ctr") if line_item.stats else None,
-                stats_video_completions=line_item.stats.get("video_completions") if line_item.stats else None,
-                stats_video_starts=line_item.stats.get("video_starts") if line_item.stats else None,
-                stats_viewable_impressions=line_item.stats.get("viewable_impressions") if line_item.stats else None,
-                delivery_indicator_type=line_item.delivery_indicator_type,
-                delivery_data=line_item.delivery_data,
-                targeting=line_item.targeting,
-                creative_placeholders=line_item.creative_placeholders,
-                frequency_caps=line_item.frequency_caps,
-                applied_labels=line_item.applied_labels,
-                effective_applied_labels=line_item.effective_applied_labels,
-                custom_field_values=line_item.custom_field_values,
-                third_party_measurement_settings=line_item.third_party_measurement_settings,
-                video_max_duration=line_item.video_max_duration,
-                line_item_metadata=line_item.line_item_metadata,
-                last_modified_date=line_item.last_modified_date,
-                creation_date=line_item.creation_date,
-                external_id=line_item.external_id,
-                last_synced=sync_time,
-            )
-            self.db.add(new_line_item)
+        logger.info(f"Saved {len(rows)} orders to database")
+
+    def _write_line_items(
+        self,
+        tenant_id: str,
+        line_items: list[LineItem],
+        sync_time: datetime,
+        progress: "_SyncProgress | None" = None,
+    ) -> None:
+        rows = [self._line_item_row(tenant_id, line_item, sync_time) for line_item in line_items]
+        self._upsert_rows(GAMLineItem, ["tenant_id", "line_item_id"], rows, progress, _LINE_ITEM_STATS_COLUMNS)
+        self.db.commit()
+        logger.info(f"Saved {len(rows)} line items to database")
+
+    def _upsert_rows(
+        self,
+        model: type[GAMOrder] | type[GAMLineItem],
+        index_elements: list[str],
+        rows: list[dict[str, Any]],
+        progress: "_SyncProgress | None" = None,
+        keep_existing_when_null: tuple[str, ...] = (),
+    ) -> None:
+        """INSERT ... ON CONFLICT DO UPDATE in batches (one round trip per batch).
+
+        Core upserts skip the session's readiness refresh hook, so the readiness
+        snapshots of the media buys behind each batch's orders are refreshed here.
+        """
+        # A batch may not touch the same row twice; GAM ids are unique, keep the last seen
+        unique_rows = list({tuple(row[key] for key in index_elements): row for row in rows}.values())
+        table = model.__table__
+        for start in range(0, len(unique_rows), UPSERT_BATCH_SIZE):
+            batch = unique_rows[start : start + UPSERT_BATCH_SIZE]
+            stmt = insert(model).values(batch)
+            set_: dict[str, Any] = {
+                column: stmt.excluded[column] for column in batch[0] if column not in index_elements
+            }
+            for column in keep_existing_when_null:
+                set_[column] = func.coalesce(stmt.excluded[column], table.c[column])
+            set_["updated_at"] = func.now()
+            self.db.execute(stmt.on_conflict_do_update(index_elements=index_elements, set_=set_))
+
+            # GAM order ids are media buy ids
+            affected: dict[str, set[str]] = defaultdict(set)
+            for row in batch:
+                if row.get("order_id"):
+                    affected[row["tenant_id"]].add(str(row["order_id"]))
+            for tenant_id, media_buy_ids in affected.items():
+                store_readiness_snapshots(cast(Session, self.db), tenant_id, sorted(media_buy_ids))
+            if progress:
+                progress.rows_written(len(batch))
+
+    @staticmethod
+    def _order_row(tenant_id: str, order: Order, sync_time: datetime) -> dict[str, Any]:
+        return {
+            "tenant_id": tenant_id,
+            "order_id": order.order_id,
+            "name": order.name,
+            "advertiser_id": order.advertiser_id,
+            "advertiser_name": order.advertiser_name,
+            "agency_id": order.agency_id,
+            "agency_name": order.agency_name,
+            "trafficker_id": order.trafficker_id,
+            "trafficker_name": order.trafficker_name,
+            "salesperson_id": order.salesperson_id,
+            "salesperson_name": order.salesperson_name,
+            "status": order.status.value,
+            "start_date": order.start_date,
+            "end_date": order.end_date,
+            "unlimited_end_date": order.unlimited_end_date,
+            "total_budget": order.total_budget,
+            "currency_code": order.currency_code,
+            "external_order_id": order.external_order_id,
+            "po_number": order.po_number,
+            "notes": order.notes,
+            "last_modified_date": order.last_modified_date,
+            "is_programmatic": order.is_programmatic,
+            "applied_labels": order.applied_labels,
+            "effective_applied_labels": order.effective_applied_labels,
+            "custom_field_values": order.custom_field_values,
+            "order_metadata": order.order_metadata,
+            "last_synced": sync_time,
+        }
+
+    @staticmethod
+    def _line_item_row(tenant_id: str, line_item: LineItem, sync_time: datetime) -> dict[str, Any]:
+        stats = line_item.stats or {}
+        return {
+            "tenant_id": tenant_id,
+            "line_item_id": line_item.line_item_id,
+            "order_id": line_item.order_id,
+            "name": line_item.name,
+            "status": line_item.status.value,
+            "line_item_type": line_item.line_item_type,
+            "priority": line_item.priority,
+            "start_date": line_item.start_date,
+            "end_date": line_item.end_date,
+            "unlimited_end_date": line_item.unlimited_end_date,
+            "auto_extension_days": line_item.auto_extension_days,
+            "cost_type": line_item.cost_type,
+            "cost_per_unit": line_item.cost_per_unit,
+            "discount_type": line_item.discount_type,
+            "discount": line_item.discount,
+            "contracted_units_bought": line_item.contracted_units_bought,
+            "delivery_rate_type": line_item.delivery_rate_type,
+            "goal_type": line_item.goal_type,
+            "primary_goal_type": line_item.primary_goal_type,
+            "primary_goal_units": line_item.primary_goal_units,
+            "impression_limit": line_item.impression_limit,
+            "click_limit": line_item.click_limit,
+            "target_platform": line_item.target_platform,
+            "environment_type": line_item.environment_type,
+            "allow_overbook": line_item.allow_overbook,
+            "skip_inventory_check": line_item.skip_inventory_check,
+            "reserve_at_creation": line_item.reserve_at_creation,
+            "stats_impressions": stats.get("impressions"),
+            "stats_clicks": stats.get("clicks"),
+            "stats_ctr": stats.get("ctr"),
+            "stats_video_completions": stats.get("video_completions"),
+            "stats_video_starts": stats.get("video_starts"),
+            "stats_viewable_impressions": stats.get("viewable_impressions"),
+            "delivery_indicator_type": line_item.delivery_indicator_type,
+            "delivery_data": line_item.delivery_data,
+            "targeting": line_item.targeting,
+            "creative_placeholders": line_item.creative_placeholders,
+            "frequency_caps": line_item.frequency_caps,
+            "applied_labels": line_item.applied_labels,
+            "effective_applied_labels": line_item.effective_applied_labels,
+            "custom_field_values": line_item.custom_field_values,
+            "third_party_measurement_settings": line_item.third_party_measurement_settings,
+            "video_max_duration": line_item.video_max_duration,
+            "line_item_metadata": line_item.line_item_metadata,
+            "last_modified_date": line_item.last_modified_date,
+            "creation_date": line_item.creation_date,
+            "external_id": line_item.external_id,
+            "last_synced": sync_time,
+        }
 
     def get_orders(self, tenant_id: str, filters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """
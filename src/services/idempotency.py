@@ -0,0 +1,515 @@
+"""Idempotency keys for the mutating tools (create_media_buy, update_media_buy, sync_creatives).
+
+Buyers retry mutating calls when they time out. Without protection a retry runs
+the whole flow again (including ad server order creation) and races with the
+first attempt. The @idempotent decorator sits on a tool's shared ``_impl`` (the
+boundary both MCP and A2A go through) and keys every call by
+(tenant, principal, tool, idempotency key):
+
+- The key is the client's ``Idempotency-Key`` header when one is sent. Otherwise
+  it is derived from the tool's natural reference (buyer_ref / media_buy_id)
+  plus a SHA-256 of the request arguments.
+- The first call claims a row in idempotency_records ("in_progress", with a
+  lease) and runs the tool. A successful response is stored on the row.
+- Concurrent duplicates wait for that execution: within the process they share
+  its task, across processes they poll the row. Retries within the TTL get the
+  stored response without running the tool again.
+- A client key reused with different arguments is rejected (IDEMPOTENCY_KEY_REUSED).
+- Failures (exceptions and error responses) are not stored. The claim is
+  released so a retry runs again.
+
+Derived keys only replay for ``replay_ttl_seconds``. update_media_buy and
+sync_creatives use 0, so they only coalesce concurrent duplicates: sending the
+same update again later (pause, resume, pause) must run again.
+
+If the idempotency store is unavailable the tool runs unprotected rather than
+failing the request.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar, cast
+
+from fastmcp.exceptions import ToolError
+from pydantic import BaseModel
+from sqlalchemy import and_, delete, or_, update
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import IdempotencyRecord
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", str(24 * 3600)))
+IDEMPOTENCY_LEASE_SECONDS = int(os.getenv("IDEMPOTENCY_LEASE_SECONDS", "300"))
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "120"))
+IDEMPOTENCY_POLL_INTERVAL_SECONDS = 0.5
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_COMPLETED = "completed"
+
+MAX_KEY_LENGTH = 255
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Set while an idempotent tool runs, so tools it calls internally
+# (update_media_buy -> sync_creatives) are not keyed a second time
+_executing: ContextVar[bool] = ContextVar("idempotent_tool_executing", default=False)
+
+
+def request_hash(arguments: dict[str, Any]) -> str:
+    """Hash the tool arguments that identify a request."""
+    material = json.dumps(arguments, sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class IdempotencyScope:
+    """One idempotency record: who called which tool with which key."""
+
+    tenant_id: str
+    principal_id: str
+    tool_name: str
+    key: str
+    request_hash: str
+    ttl_seconds: int
+
+    @property
+    def identity(self) -> tuple[str, str, str, str]:
+        return (self.tenant_id, self.principal_id, self.tool_name, self.key)
+
+
+@dataclass(frozen=True)
+class StoredRecord:
+    """Snapshot of an idempotency record owned by another execution."""
+
+    status: str
+    request_hash: str
+    response: dict[str, Any] | None
+
+
+@dataclass(frozen=True)
+class ResponseCodec:
+    """How a tool's result is stored and replayed.
+
+    ``encode`` returns None for results that must not be replayed (error responses).
+    """
+
+    encode: Callable[[Any], dict[str, Any] | None]
+    decode: Callable[[dict[str, Any]], Any]
+
+
+def jsonable(data: Any) -> Any:
+    """Coerce a model dump to plain JSON types for the JSONB response column."""
+    return json.loads(json.dumps(data, default=str))
+
+
+def _dump(response: Any) -> dict[str, Any]:
+    dump = getattr(response, "model_dump_internal", None) or response.model_dump
+    return jsonable(dump(mode="json"))
+
+
+def model_codec(success_type: type[BaseModel]) -> ResponseCodec:
+    """Codec for tools returning a pydantic response; only ``success_type`` is replayed."""
+    return ResponseCodec(
+        encode=lambda response: _dump(response) if isinstance(response, success_type) else None,
+        decode=lambda data: success_type.model_validate(data),
+    )
+
+
+class IdempotencyStore:
+    """idempotency_records access: claim, complete, release and purge."""
+
+    def __init__(self, lease_seconds: int = IDEMPOTENCY_LEASE_SECONDS):
+        self.lease_seconds = lease_seconds
+        self._last_purge = 0.0
+
+    def claim_statement(self, scope: IdempotencyScope, now: datetime):
+        """INSERT the in-progress record, taking over expired records and abandoned leases."""
+        values: dict[str, Any] = {
+            "tenant_id": scope.tenant_id,
+            "principal_id": scope.principal_id,
+            "tool_name": scope.tool_name,
+            "idempotency_key": scope.key,
+            "request_hash": scope.request_hash,
+            "status": STATUS_IN_PROGRESS,
+            "response": None,
+            "locked_until": now + timedelta(seconds=self.lease_seconds),
+            "created_at": now,
+            "completed_at": None,
+            # An in-progress record must outlive its lease, or duplicates would take it over as expired
+            "expires_at": now + timedelta(seconds=max(scope.ttl_seconds, self.lease_seconds)),
+        }
+        stmt = insert(IdempotencyRecord).values(**values)
+        return stmt.on_conflict_do_update(
+            index_elements=["tenant_id", "principal_id", "tool_name", "idempotency_key"],
+            set_={
+                k: stmt.excluded[k]
+                for k in values
+                if k not in ("tenant_id", "principal_id", "tool_name", "idempotency_key")
+            },
+            where=or_(
+                IdempotencyRecord.expires_at <= now,
+                and_(IdempotencyRecord.status == STATUS_IN_PROGRESS, IdempotencyRecord.locked_until < now),
+            ),
+        ).returning(IdempotencyRecord.tenant_id)
+
+    def claim(self, scope: IdempotencyScope) -> StoredRecord | None:
+        """Claim the record for this execution; returns None if claimed, else the existing record."""
+        now = datetime.now(UTC)
+        with get_db_session() as session:
+            claimed = session.execute(self.claim_statement(scope, now)).first() is not None
+            session.commit()
+            if claimed:
+                self._maybe_purge(session, now)
+                return None
+            row = session.get(IdempotencyRecord, scope.identity)
+            if row is None:
+                # Released between our insert and this read; the next claim attempt wins it
+                return StoredRecord(status=STATUS_IN_PROGRESS, request_hash=scope.request_hash, response=None)
+            return StoredRecord(status=row.status, request_hash=row.request_hash, response=row.response)
+
+    def complete(self, scope: IdempotencyScope, response: dict[str, Any]) -> None:
+        """Store the response and start the replay TTL."""
+        now = datetime.now(UTC)
+        with get_db_session() as session:
+            session.execute(
+                update(IdempotencyRecord)
+                .where(*self._where(scope), IdempotencyRecord.status == STATUS_IN_PROGRESS)
+                .values(
+                    status=STATUS_COMPLETED,
+                    response=response,
+                    locked_until=None,
+                    completed_at=now,
+                    expires_at=now + timedelta(seconds=scope.ttl_seconds),
+                )
+            )
+            session.commit()
+
+    def release(self, scope: IdempotencyScope) -> None:
+        """Drop an in-progress claim so the request can run again."""
+        with get_db_session() as session:
+            session.execute(
+                delete(IdempotencyRecord).where(*self._where(scope), IdempotencyRecord.status == STATUS_IN_PROGRESS)
+            )
+            session.commit()
+
+    @staticmethod
+    def _where(scope: IdempotencyScope) -> list[Any]:
+        return [
+            IdempotencyRecord.tenant_id == scope.tenant_id,
+            IdempotencyRecord.principal_id == scope.principal_id,
+            IdempotencyRecord.tool_name == scope.tool_name,
+            IdempotencyRecord.idempotency_key == scope.key,
+        ]
+
+    def _maybe_purge(self, session, now: datetime) -> None:
+        """Delete expired records, at most once an hour per process."""
+        if time.monotonic() - self._last_purge < 3600:
+            return
+        self._last_purge = time.monotonic()
+        result = session.execute(
+            delete(IdempotencyRecord).where(
+                IdempotencyRecord.expires_at <= now,
+                or_(IdempotencyRecord.locked_until.is_(None), IdempotencyRecord.locked_until < now),
+            )
+        )
+        session.commit()
+        purged = getattr(result, "rowcount", 0) or 0
+        if purged:
+            logger.info(f"Purged {purged} expired idempotency records")
+
+
+_store: IdempotencyStore | None = None
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Get the global idempotency store."""
+    global _store
+    if _store is None:
+        _store = IdempotencyStore()
+    return _store
+
+
+def get_client_idempotency_key(ctx: Any) -> str | None:
+    """The Idempotency-Key the client sent with this request, if any."""
+    from src.core.tool_context import ToolContext
+
+    if isinstance(ctx, ToolContext):
+        return ctx.metadata.get("idempotency_key") or None
+
+    from fastmcp.server.dependencies import get_http_headers
+
+    from src.core.auth import _get_header_case_insensitive
+
+    headers: dict | None = None
+    try:
+        headers = get_http_headers(include_all=True)
+    except Exception:
+        pass
+    if not headers and ctx is not None:
+        meta = getattr(ctx, "meta", None)
+        if isinstance(meta, dict):
+            headers = meta.get("headers")
+    if not isinstance(headers, dict):
+        return None
+    return _get_header_case_insensitive(headers, IDEMPOTENCY_HEADER) or None
+
+
+def _resolve_identity(ctx: Any) -> tuple[str, str] | None:
+    """(tenant_id, principal_id) for the caller, or None if unauthenticated."""
+    from src.core.auth import get_principal_from_context
+
+    try:
+        principal_id, tenant = get_principal_from_context(ctx)
+    except Exception as e:
+        # The tool reports authentication errors itself
+        logger.debug(f"Idempotency skipped, caller not resolved: {e}")
+        return None
+    if not principal_id or not tenant or not isinstance(tenant.get("tenant_id"), str):
+        return None
+    return tenant["tenant_id"], principal_id
+
+
+def build_scope(
+    tool_name: str,
+    arguments: dict[str, Any],
+    ctx: Any,
+    natural_key: Callable[[dict[str, Any]], str | None],
+    replay_ttl_seconds: int,
+) -> IdempotencyScope | None:
+    """Idempotency scope for a tool call, or None when the call cannot be keyed."""
+    identity = _resolve_identity(ctx)
+    if identity is None:
+        return None
+    tenant_id, principal_id = identity
+    digest = request_hash(arguments)
+
+    client_key = get_client_idempotency_key(ctx)
+    if client_key:
+        key, ttl_seconds = client_key, IDEMPOTENCY_TTL_SECONDS
+    else:
+        key, ttl_seconds = f"{natural_key(arguments) or ''}:{digest}", replay_ttl_seconds
+    if len(key) > MAX_KEY_LENGTH:
+        key = hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    return IdempotencyScope(
+        tenant_id=tenant_id,
+        principal_id=principal_id,
+        tool_name=tool_name,
+        key=key,
+        request_hash=digest,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+_PENDING = object()
+
+
+def _key_reused(scope: IdempotencyScope) -> ToolError:
+    return ToolError(
+        "IDEMPOTENCY_KEY_REUSED",
+        f"Idempotency key '{scope.key}' was already used for a different {scope.tool_name} request",
+    )
+
+
+def _replay(scope: IdempotencyScope, record: StoredRecord, codec: ResponseCodec) -> Any:
+    """The stored response, or _PENDING while the first execution is still running."""
+    if record.request_hash != scope.request_hash:
+        raise _key_reused(scope)
+    if record.status == STATUS_COMPLETED and record.response is not None:
+        logger.info(f"Replaying stored {scope.tool_name} response for idempotency key '{scope.key}'")
+        return codec.decode(record.response)
+    return _PENDING
+
+
+def _wait_timeout(scope: IdempotencyScope) -> ToolError:
+    return ToolError(
+        "IDEMPOTENCY_IN_PROGRESS",
+        f"A {scope.tool_name} request with idempotency key '{scope.key}' is still being processed; retry later",
+    )
+
+
+class IdempotentExecutor:
+    """Runs a keyed tool call at most once, coalescing duplicates onto the first execution."""
+
+    def __init__(self, store: IdempotencyStore | None = None):
+        self._store = store
+        self._inflight: dict[tuple[str, str, str, str], tuple[str, asyncio.Task]] = {}
+
+    @property
+    def store(self) -> IdempotencyStore:
+        return self._store or get_idempotency_store()
+
+    async def run_async(self, scope: IdempotencyScope, codec: ResponseCodec, call: Callable[[], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(scope.identity)
+        if inflight is not None and not inflight[1].done() and inflight[1].get_loop() is loop:
+            digest, task = inflight
+            if digest != scope.request_hash:
+                raise _key_reused(scope)
+            logger.info(f"Waiting on in-flight {scope.tool_name} for idempotency key '{scope.key}'")
+            return await asyncio.shield(task)
+
+        # Registered before claiming, so duplicates in this process never reach the database
+        task = loop.create_task(self._claim_and_execute(scope, codec, call))
+        self._inflight[scope.identity] = (scope.request_hash, task)
+        task.add_done_callback(lambda t: self._finish_inflight(scope, t))
+        return await asyncio.shield(task)
+
+    async def _claim_and_execute(self, scope: IdempotencyScope, codec: ResponseCodec, call: Callable[[], Any]) -> Any:
+        deadline = time.monotonic() + IDEMPOTENCY_WAIT_SECONDS
+        protected = True
+        while True:
+            try:
+                record = await asyncio.to_thread(self.store.claim, scope)
+            except Exception as e:
+                logger.warning(f"Idempotency store unavailable, running {scope.tool_name} unprotected: {e}")
+                protected = False
+                break
+            if record is None:
+                break
+            result = _replay(scope, record, codec)
+            if result is not _PENDING:
+                return result
+            if time.monotonic() >= deadline:
+                raise _wait_timeout(scope)
+            await asyncio.sleep(IDEMPOTENCY_POLL_INTERVAL_SECONDS)
+
+        _executing.set(True)  # Task-local: this task runs in its own context copy
+        try:
+            result = await call()
+        except BaseException:
+            if protected:
+                await asyncio.to_thread(self._release, scope)
+            raise
+        if protected:
+            await asyncio.to_thread(self._complete, scope, codec, result)
+        return result
+
+    def _finish_inflight(self, scope: IdempotencyScope, task: asyncio.Task) -> None:
+        entry = self._inflight.get(scope.identity)
+        if entry is not None and entry[1] is task:
+            del self._inflight[scope.identity]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Idempotent {scope.tool_name} for key '{scope.key}' failed: {task.exception()}")
+
+    def run_sync(self, scope: IdempotencyScope, codec: ResponseCodec, call: Callable[[], Any]) -> Any:
+        deadline = time.monotonic() + IDEMPOTENCY_WAIT_SECONDS
+        while True:
+            try:
+                record = self.store.claim(scope)
+            except Exception as e:
+                logger.warning(f"Idempotency store unavailable, running {scope.tool_name} unprotected: {e}")
+                return call()
+            if record is None:
+                break
+            result = _replay(scope, record, codec)
+            if result is not _PENDING:
+                return result
+            if time.monotonic() >= deadline:
+                raise _wait_timeout(scope)
+            time.sleep(IDEMPOTENCY_POLL_INTERVAL_SECONDS)
+
+        token = _executing.set(True)
+        try:
+            result = call()
+        except BaseException:
+            self._release(scope)
+            raise
+        finally:
+            _executing.reset(token)
+        self._complete(scope, codec, result)
+        return result
+
+    def _complete(self, scope: IdempotencyScope, codec: ResponseCodec, result: Any) -> None:
+        try:
+            encoded = codec.encode(result)
+        except Exception as e:
+            logger.warning(f"Could not encode {scope.tool_name} response for replay: {e}")
+            encoded = None
+        if encoded is None:
+            self._release(scope)
+            return
+        try:
+            self.store.complete(scope, encoded)
+        except Exception as e:
+            logger.warning(f"Failed to store {scope.tool_name} response for idempotency key '{scope.key}': {e}")
+
+    def _release(self, scope: IdempotencyScope) -> None:
+        try:
+            self.store.release(scope)
+        except Exception as e:
+            # The lease expires on its own; duplicates take the record over then
+            logger.warning(f"Failed to release idempotency key '{scope.key}': {e}")
+
+
+_executor = IdempotentExecutor()
+
+
+def get_idempotent_executor() -> IdempotentExecutor:
+    """Get the global idempotent executor."""
+    return _executor
+
+
+def idempotent(
+    tool_name: str,
+    codec: ResponseCodec,
+    natural_key: Callable[[dict[str, Any]], str | None],
+    replay_ttl_seconds: int = IDEMPOTENCY_TTL_SECONDS,
+) -> Callable[[F], F]:
+    """Make a tool ``_impl`` idempotent (sync or async); it must take the caller context as ``ctx``.
+
+    Args:
+        tool_name: Tool name recorded with the key
+        codec: How successful responses are stored and replayed
+        natural_key: Request reference used in derived keys (e.g. buyer_ref)
+        replay_ttl_seconds: How long derived keys replay a completed response
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        def scope_for(args: tuple, kwargs: dict) -> IdempotencyScope | None:
+            if _executing.get():
+                return None
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            ctx = arguments.pop("ctx", None)
+            if ctx is None:
+                return None
+            return build_scope(tool_name, arguments, ctx, natural_key, replay_ttl_seconds)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                scope = scope_for(args, kwargs)
+                if scope is None:
+                    return await func(*args, **kwargs)
+                return await get_idempotent_executor().run_async(scope, codec, lambda: func(*args, **kwargs))
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            scope = scope_for(args, kwargs)
+            if scope is None:
+                return func(*args, **kwargs)
+            return get_idempotent_executor().run_sync(scope, codec, lambda: func(*args, **kwargs))
+
+        return cast(F, sync_wrapper)
+
+    return decorator
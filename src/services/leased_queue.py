@@ -0,0 +1,197 @@
+"""Shared worker loop for database-backed job queues.
+
+The webhook outbox and the creative review queue both drain a table of leased
+rows with a pool of asyncio workers. LeasedQueueWorkerPool owns the parts they
+have in common:
+
+- A claim loop that leases due rows (via the subclass's claim_batch) whenever
+  workers have capacity, and keeps draining without sleeping while there is a
+  backlog.
+- Workers that hand each claimed row to the subclass's process_item.
+- Lease release, retry rescheduling from the subclass's retry schedule (with
+  jitter), and an hourly purge of finished rows past the retention window.
+
+Rows must have ``id``, ``status``, ``attempt_count``, ``next_attempt_at``,
+``locked_by``, ``locked_until`` and ``last_error`` columns.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, update
+
+from src.core.database.database_session import get_db_session
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay_seconds(attempt_count: int, schedule: Sequence[float]) -> float:
+    """Delay before the next attempt after ``attempt_count`` failures, with up to 10% jitter.
+
+    ``schedule[n - 1]`` is the delay after the n-th failure; its last value repeats.
+    """
+    base = schedule[min(max(attempt_count, 1), len(schedule)) - 1]
+    return base + random.uniform(0, base * 0.1)
+
+
+class LeasedQueueWorkerPool:
+    """Drains a leased queue table with a pool of async workers.
+
+    Subclasses set the class attributes below and implement claim_batch() and
+    process_item().
+    """
+
+    # ORM model of the queue table
+    model: Any = None
+    # Human-readable name used in log messages
+    description = "leased queue"
+    # Delay before attempt N+1 after N failed attempts (last value repeats)
+    retry_schedule_seconds: Sequence[float] = (30,)
+    # Finished rows in these statuses are deleted once finished_at_attribute is older than retention_days
+    purge_statuses: tuple[str, ...] = ()
+    finished_at_attribute = "completed_at"
+    retention_days = 7
+    # Claimed-but-unstarted rows allowed per worker (more keeps workers busy, fewer keeps claims fair)
+    claim_ahead = 1
+
+    def __init__(self, worker_count: int, poll_interval_seconds: float, lease_seconds: int) -> None:
+        self.worker_count = worker_count
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease_seconds = lease_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self.is_running = False
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._lock = asyncio.Lock()
+        self._active_items = 0
+        self._last_purge: datetime | None = None
+
+    def claim_batch(self, limit: int) -> list[dict[str, Any]]:
+        """Lease up to ``limit`` due rows; returns plain-dict snapshots (each with ``id``)."""
+        raise NotImplementedError
+
+    async def process_item(self, item: dict[str, Any]) -> None:
+        """Handle one claimed row and record the outcome."""
+        raise NotImplementedError
+
+    async def start(self) -> None:
+        """Start the claim loop and workers."""
+        async with self._lock:
+            if self.is_running:
+                logger.warning(f"{self.description} is already running")
+                return
+
+            self.is_running = True
+            self._queue = asyncio.Queue()
+            self._tasks = [asyncio.create_task(self._run_claim_loop())]
+            self._tasks.extend(asyncio.create_task(self._run_worker()) for _ in range(self.worker_count))
+            logger.info(f"{self.description} started ({self.worker_count} workers, id={self.worker_id})")
+
+    async def stop(self) -> None:
+        """Stop all tasks. Rows still in flight are reclaimed after their lease expires."""
+        async with self._lock:
+            if not self.is_running:
+                return
+
+            self.is_running = False
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+            logger.info(f"{self.description} stopped")
+
+    def retry_delay(self, attempt_count: int) -> timedelta:
+        """Delay before the next attempt after ``attempt_count`` failures."""
+        return timedelta(seconds=retry_delay_seconds(attempt_count, self.retry_schedule_seconds))
+
+    def lease_expiry(self, now: datetime) -> datetime:
+        """locked_until for a row claimed at ``now``."""
+        return now + timedelta(seconds=self.lease_seconds)
+
+    async def _run_claim_loop(self) -> None:
+        """Claim due rows whenever workers have capacity."""
+        assert self._queue is not None
+        while self.is_running:
+            try:
+                capacity = self.worker_count * self.claim_ahead - self._queue.qsize() - self._active_items
+                claimed: list[dict[str, Any]] = []
+                if capacity > 0:
+                    claimed = await asyncio.to_thread(self.claim_batch, capacity)
+                    for item in claimed:
+                        self._queue.put_nowait(item)
+
+                await asyncio.to_thread(self._maybe_purge)
+
+                # Keep draining without sleeping while there is a backlog
+                if len(claimed) < capacity or capacity <= 0:
+                    await asyncio.sleep(self.poll_interval_seconds)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in {self.description} claim loop: {e}", exc_info=True)
+                await asyncio.sleep(self.poll_interval_seconds)
+
+    async def _run_worker(self) -> None:
+        """Process claimed rows one at a time."""
+        assert self._queue is not None
+        while self.is_running:
+            try:
+                item = await self._queue.get()
+            except asyncio.CancelledError:
+                break
+
+            self._active_items += 1
+            try:
+                await self.process_item(item)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Unexpected error in {self.description} processing row {item['id']}: {e}", exc_info=True)
+            finally:
+                self._active_items -= 1
+                self._queue.task_done()
+
+    def _release(self, item_id: int, status: str, *, count_attempt: bool = True, **values: Any) -> None:
+        """Drop a row's lease and move it to ``status``, setting any extra column ``values``."""
+        values.update(status=status, locked_by=None, locked_until=None)
+        if count_attempt:
+            values["attempt_count"] = self.model.attempt_count + 1
+
+        with get_db_session() as session:
+            session.execute(update(self.model).where(self.model.id == item_id).values(**values))
+            session.commit()
+
+    def _reschedule(self, item_id: int, delay: timedelta, error: str | None, count_attempt: bool = True) -> None:
+        """Return a row to the queue after ``delay``; uncounted reschedules keep attempts and last_error."""
+        values: dict[str, Any] = {"next_attempt_at": datetime.now(UTC) + delay}
+        if count_attempt:
+            values["last_error"] = error
+        self._release(item_id, "pending", count_attempt=count_attempt, **values)
+
+    def _maybe_purge(self) -> None:
+        """Delete finished rows past the retention window (at most hourly)."""
+        now = datetime.now(UTC)
+        if self._last_purge and now - self._last_purge < timedelta(hours=1):
+            return
+        self._last_purge = now
+
+        cutoff = now - timedelta(days=self.retention_days)
+        finished_at = getattr(self.model, self.finished_at_attribute)
+        with get_db_session() as session:
+            result = session.execute(
+                delete(self.model).where(self.model.status.in_(self.purge_statuses), finished_at < cutoff)
+            )
+            session.commit()
+            purged = getattr(result, "rowcount", 0) or 0
+        if purged:
+            logger.info(
+                f"Purged {purged} finished {self.model.__tablename__} rows older than {self.retention_days} days"
+            )
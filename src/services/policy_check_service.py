@@ -1,8 +1,10 @@
 """Policy check service for analyzing advertising briefs."""
 
+import hashlib
 import logging
 from datetime import UTC, datetime
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -17,6 +19,9 @@ logger = logging.getLogger(__name__)
 # Sentinel value to distinguish "not provided" from "explicitly None"
 _UNSET = object()
 
+# Policy agents reused across requests, keyed by a hash of the tenant AI config
+_policy_agents: dict[str, Any] = {}
+
 
 class PolicyStatus(str, Enum):
     """Policy compliance status options."""
@@ -75,28 +80,47 @@ class PolicyCheckService:
         # Get effective configuration
         effective_config = self._factory.get_effective_config(tenant_ai_config)
         self.ai_enabled = effective_config["has_api_key"]
+        self.model_id = f"{effective_config['provider']}:{effective_config['model']}"
 
         if self.ai_enabled:
-            model_string = self._factory.create_model(tenant_ai_config)
-            self._agent = create_policy_agent(model_string)
+            self._agent = self._get_policy_agent(tenant_ai_config)
         else:
             logger.warning("No AI API key configured. Policy checks will use basic rules only.")
             self._agent = None
 
+    def _get_policy_agent(self, tenant_ai_config: dict | TenantAIConfig | None) -> Any:
+        """Return the policy agent for this AI config, creating it on first use."""
+        if isinstance(tenant_ai_config, TenantAIConfig):
+            config_json = tenant_ai_config.model_dump_json()
+        else:
+            config_json = TenantAIConfig.model_validate(tenant_ai_config or {}).model_dump_json()
+        agent_key = hashlib.sha256(f"{self.model_id}|{config_json}".encode()).hexdigest()
+
+        agent = _policy_agents.get(agent_key)
+        if agent is None:
+            model_string = self._factory.create_model(tenant_ai_config)
+            agent = _policy_agents[agent_key] = create_policy_agent(model_string)
+        return agent
+
     async def check_brief_compliance(
         self,
         brief: str,
         promoted_offering: str | None = None,
         brand_manifest: dict | str | None = None,
         tenant_policies: dict | None = None,
+        tenant_id: str | None = None,
     ) -> PolicyCheckResult:
         """Check if an advertising brief complies with policies.
 
+        When ``tenant_id`` is given, AI decisions are served from and stored in
+        the policy decision cache (src/services/policy_decision_cache.py).
+
         Args:
             brief: The advertising brief description
             promoted_offering: DEPRECATED: Use brand_manifest instead (still supported)
             brand_manifest: Brand manifest dict or URL string (preferred over promoted_offering)
             tenant_policies: Optional tenant-specific policy overrides
+            tenant_id: Tenant the decision is cached for (no caching if omitted)
 
         Returns:
             PolicyCheckResult with compliance status and details
@@ -123,14 +147,25 @@ class PolicyCheckService:
             full_context = f"Brief: {brief}\n\nAdvertiser/Product: {brand_info}"
 
         # Use AI analysis when available
-        if self.ai_enabled and self._agent:
-            analysis = await check_policy_compliance(self._agent, full_context, tenant_policies)
-            return PolicyCheckResult(
-                status=PolicyStatus(analysis.status),
-                reason=analysis.reason,
-                restrictions=analysis.restrictions,
-                warnings=analysis.warnings,
-            )
+        agent = self._agent
+        if self.ai_enabled and agent:
+
+            async def analyze() -> PolicyCheckResult:
+                analysis = await check_policy_compliance(agent, full_context, tenant_policies)
+                return PolicyCheckResult(
+                    status=PolicyStatus(analysis.status),
+                    reason=analysis.reason,
+                    restrictions=analysis.restrictions,
+                    warnings=analysis.warnings,
+                )
+
+            if not tenant_id:
+                return await analyze()
+
+            from src.services.policy_decision_cache import get_policy_decision_cache, policy_decision_key
+
+            key = policy_decision_key(brief, brand_info, tenant_policies, self.model_id)
+            return await get_policy_decision_cache().get_or_check(key, tenant_id, self.model_id, analyze)
         else:
             # Fallback if no AI is available - allow with warning
             return PolicyCheckResult(
@@ -0,0 +1,198 @@
+"""Content-addressed cache for AI policy decisions.
+
+A policy decision depends only on the brief, the brand info, the tenant's
+advertising policy and the model that evaluated it. PolicyDecisionCache keys
+decisions by a SHA-256 of those inputs (brief normalized for case and
+whitespace), so editing the tenant policy or switching models changes the key
+and old decisions are simply never read again.
+
+Lookups go through three layers:
+1. In-process LRU (per server process)
+2. policy_decision_cache table in PostgreSQL (shared across processes, TTL)
+3. The LLM, with concurrent identical checks coalesced into one call
+
+Only AI decisions are cached; failures propagate to the caller uncached.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import PolicyDecisionCache as PolicyDecisionCacheModel
+from src.core.metrics import policy_decision_cache_requests
+
+if TYPE_CHECKING:
+    from src.services.policy_check_service import PolicyCheckResult
+
+logger = logging.getLogger(__name__)
+
+POLICY_DECISION_TTL_SECONDS = int(os.getenv("POLICY_DECISION_TTL_SECONDS", str(24 * 3600)))
+POLICY_DECISION_LRU_SIZE = 2048
+
+
+def policy_decision_key(brief: str, brand_info: str | None, tenant_policies: dict | None, model: str) -> str:
+    """Hash the inputs that determine a policy decision."""
+    material = json.dumps(
+        {
+            "brief": " ".join(brief.lower().split()),
+            "brand": " ".join((brand_info or "").lower().split()),
+            "policy": tenant_policies or {},
+            "model": model,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class PolicyDecisionCache:
+    """LRU front, PostgreSQL back, single-flight policy decision cache."""
+
+    def __init__(self, ttl_seconds: int = POLICY_DECISION_TTL_SECONDS, max_entries: int = POLICY_DECISION_LRU_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (result, monotonic expiry)
+        self._lru: OrderedDict[str, tuple[PolicyCheckResult, float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def get_or_check(
+        self,
+        key: str,
+        tenant_id: str,
+        model: str,
+        check: Callable[[], Awaitable["PolicyCheckResult"]],
+    ) -> "PolicyCheckResult":
+        """Return the cached decision for ``key``, running ``check()`` at most once per key."""
+        entry = self._lru.get(key)
+        if entry is not None:
+            result, expires = entry
+            if time.monotonic() < expires:
+                self._lru.move_to_end(key)
+                policy_decision_cache_requests.labels(result="memory_hit").inc()
+                return result
+            del self._lru[key]
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._load_or_check(key, tenant_id, model, check))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        else:
+            policy_decision_cache_requests.labels(result="coalesced").inc()
+
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """Drop the in-process layer (the database layer expires by TTL)."""
+        self._lru.clear()
+
+    def _finish_inflight(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Policy check for key {key[:12]} failed: {task.exception()}")
+
+    async def _load_or_check(
+        self,
+        key: str,
+        tenant_id: str,
+        model: str,
+        check: Callable[[], Awaitable["PolicyCheckResult"]],
+    ) -> "PolicyCheckResult":
+        result = None
+        try:
+            result = await asyncio.to_thread(self._load, key)
+        except Exception as e:
+            logger.warning(f"Policy decision cache lookup failed, evaluating brief: {e}")
+
+        if result is not None:
+            policy_decision_cache_requests.labels(result="db_hit").inc()
+        else:
+            policy_decision_cache_requests.labels(result="miss").inc()
+            result = await check()
+            try:
+                await asyncio.to_thread(self._store, key, tenant_id, model, result)
+            except Exception as e:
+                logger.warning(f"Failed to persist policy decision: {e}")
+
+        self._remember(key, result)
+        return result
+
+    def _remember(self, key: str, result: "PolicyCheckResult") -> None:
+        self._lru[key] = (result, time.monotonic() + self.ttl_seconds)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _load(self, key: str) -> "PolicyCheckResult | None":
+        from src.services.policy_check_service import PolicyCheckResult, PolicyStatus
+
+        with get_db_session() as session:
+            row = session.scalars(
+                select(PolicyDecisionCacheModel).where(
+                    PolicyDecisionCacheModel.cache_key == key,
+                    PolicyDecisionCacheModel.expires_at > datetime.now(UTC),
+                )
+            ).first()
+            if row is None:
+                return None
+            return PolicyCheckResult(
+                status=PolicyStatus(row.status),
+                reason=row.reason,
+                restrictions=row.restrictions or [],
+                warnings=row.warnings or [],
+                timestamp=row.decided_at,
+            )
+
+    def _store(self, key: str, tenant_id: str, model: str, result: "PolicyCheckResult") -> None:
+        now = datetime.now(UTC)
+        values: dict[str, Any] = {
+            "cache_key": key,
+            "tenant_id": tenant_id,
+            "model": model[:200],
+            "status": result.status.value,
+            "reason": result.reason,
+            "restrictions": result.restrictions or [],
+            "warnings": result.warnings or [],
+            "decided_at": result.timestamp,
+            "expires_at": now + timedelta(seconds=self.ttl_seconds),
+        }
+        stmt = insert(PolicyDecisionCacheModel).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["cache_key"],
+            set_={k: stmt.excluded[k] for k in values if k != "cache_key"},
+        )
+        with get_db_session() as session:
+            session.execute(stmt)
+            # Decisions for superseded policies/models are never read again; drop them once expired
+            session.execute(
+                delete(PolicyDecisionCacheModel).where(
+                    PolicyDecisionCacheModel.tenant_id == tenant_id,
+                    PolicyDecisionCacheModel.expires_at <= now,
+                )
+            )
+            session.commit()
+
+
+# Global cache instance
+_cache: PolicyDecisionCache | None = None
+
+
+def get_policy_decision_cache() -> PolicyDecisionCache:
+    """Get the global policy decision cache."""
+    global _cache
+    if _cache is None:
+        _cache = PolicyDecisionCache()
+    return _cache
@@ -408,6 +408,10 @@ class PolicyService:
             if "product_ranking_prompt" in updates:
                 tenant.product_ranking_prompt = updates["product_ranking_prompt"]
 
+            # Update get_products latency budget
+            if "products_latency_budget_ms" in updates:
+                tenant.products_latency_budget_ms = updates["products_latency_budget_ms"]
+
             # Commit all changes
             session.commit()
 
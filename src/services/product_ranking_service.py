@@ -0,0 +1,209 @@
+"""Cached, batched AI product ranking for get_products.
+
+Ranking used to send every eligible product's full model_dump() to the LLM on
+each request. ProductRankingService instead:
+
+1. Sends a compact digest per product (id, name, description, channels, formats)
+2. Splits catalogs larger than PRODUCT_RANKING_CHUNK_SIZE into chunks that are
+   ranked concurrently and merged by score. Scores are absolute (0.0-1.0), so
+   rankings from different chunks are comparable.
+3. Caches the merged ranking per (brief hash, catalog version, prompt hash,
+   model). The catalog version is a hash of the digests, so any product edit,
+   or a principal seeing a different set of products, changes the key.
+   Concurrent identical rankings are coalesced into one set of LLM calls.
+
+The cache is per process and expires by TTL. Failed rankings are not cached.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.metrics import product_ranking_cache_requests, product_ranking_chunks
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_RANKING_CACHE_TTL_SECONDS = int(os.getenv("PRODUCT_RANKING_CACHE_TTL_SECONDS", "3600"))
+PRODUCT_RANKING_CACHE_MAX_ENTRIES = 1000
+PRODUCT_RANKING_CHUNK_SIZE = int(os.getenv("PRODUCT_RANKING_CHUNK_SIZE", "25"))
+MAX_DIGEST_DESCRIPTION_CHARS = 500
+
+# product_id -> (relevance_score, reason)
+Scores = dict[str, tuple[float, str]]
+
+
+def product_digest(product: Any) -> dict[str, Any]:
+    """Reduce a Product to the fields the ranking prompt needs."""
+    formats = []
+    for format_id in getattr(product, "format_ids", None) or []:
+        if isinstance(format_id, str):
+            formats.append(format_id)
+        elif isinstance(format_id, dict):
+            formats.append(str(format_id.get("id", "")))
+        else:
+            formats.append(getattr(format_id, "id", str(format_id)))
+
+    channels = [getattr(channel, "value", channel) for channel in getattr(product, "channels", None) or []]
+
+    return {
+        "product_id": product.product_id,
+        "name": product.name,
+        "description": (product.description or "")[:MAX_DIGEST_DESCRIPTION_CHARS],
+        "channels": channels,
+        "formats": formats,
+    }
+
+
+def catalog_version(digests: list[dict[str, Any]]) -> str:
+    """Content hash of the digests being ranked (order-insensitive)."""
+    material = json.dumps(sorted(digests, key=lambda d: d["product_id"]), sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def ranking_cache_key(brief: str, catalog: str, prompt: str, model: str) -> str:
+    """Hash of the inputs that determine a ranking."""
+    parts = [
+        hashlib.sha256(" ".join(brief.lower().split()).encode("utf-8")).hexdigest(),
+        catalog,
+        hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        model,
+    ]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedRanking:
+    """Merged ranking for one brief/catalog/prompt/model."""
+
+    scores: Scores
+    fetched_at: float
+    ttl_seconds: float = PRODUCT_RANKING_CACHE_TTL_SECONDS
+
+    def is_expired(self) -> bool:
+        """Check if cache has expired."""
+        return time.monotonic() > self.fetched_at + self.ttl_seconds
+
+
+class ProductRankingService:
+    """Ranks product digests in parallel chunks and caches the merged scores."""
+
+    def __init__(
+        self,
+        chunk_size: int = PRODUCT_RANKING_CHUNK_SIZE,
+        ttl_seconds: float = PRODUCT_RANKING_CACHE_TTL_SECONDS,
+        max_entries: int = PRODUCT_RANKING_CACHE_MAX_ENTRIES,
+    ):
+        self.chunk_size = max(chunk_size, 1)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._cache: OrderedDict[str, CachedRanking] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def clear_cache(self) -> None:
+        """Drop all cached rankings."""
+        self._cache.clear()
+
+    async def rank(
+        self,
+        digests: list[dict[str, Any]],
+        brief: str,
+        prompt: str,
+        model: str,
+        create_agent: Callable[[], Any],
+    ) -> Scores:
+        """Score product digests against the brief.
+
+        Args:
+            digests: Output of product_digest() for each product to rank
+            brief: The buyer's brief
+            prompt: Tenant's custom ranking prompt
+            model: Model identifier ("provider:model"), part of the cache key
+            create_agent: Returns a ranking agent; only called on a cache miss
+
+        Returns:
+            Map of product_id to (relevance_score, reason). Products the model did
+            not score are absent. The dict is shared with other callers; treat it
+            as read-only.
+        """
+        key = ranking_cache_key(brief, catalog_version(digests), prompt, model)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            if not cached.is_expired():
+                self._cache.move_to_end(key)
+                product_ranking_cache_requests.labels(result="hit").inc()
+                return cached.scores
+            del self._cache[key]
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            product_ranking_cache_requests.labels(result="miss").inc()
+            task = loop.create_task(self._rank_and_cache(key, digests, brief, prompt, create_agent))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        else:
+            product_ranking_cache_requests.labels(result="coalesced").inc()
+
+        # Shielded so one caller timing out does not cancel the ranking for the others
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here so an abandoned ranking does not log "exception was never retrieved"
+            logger.debug(f"Product ranking for key {key[:12]} failed: {task.exception()}")
+
+    async def _rank_and_cache(
+        self,
+        key: str,
+        digests: list[dict[str, Any]],
+        brief: str,
+        prompt: str,
+        create_agent: Callable[[], Any],
+    ) -> Scores:
+        from src.services.ai.agents.ranking_agent import rank_products_async
+
+        agent = create_agent()
+        chunks = [digests[i : i + self.chunk_size] for i in range(0, len(digests), self.chunk_size)]
+        product_ranking_chunks.observe(len(chunks))
+
+        results = await asyncio.gather(
+            *(rank_products_async(agent=agent, custom_prompt=prompt, brief=brief, products=chunk) for chunk in chunks)
+        )
+
+        scores: Scores = {}
+        for chunk, result in zip(chunks, results, strict=True):
+            chunk_ids = {d["product_id"] for d in chunk}
+            for ranking in result.rankings:
+                # Ignore ids the model invented or copied from another chunk
+                if ranking.product_id in chunk_ids:
+                    scores[ranking.product_id] = (ranking.relevance_score, ranking.reason)
+
+        self._cache[key] = CachedRanking(scores=scores, fetched_at=time.monotonic(), ttl_seconds=self.ttl_seconds)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+        logger.info(f"[AI_RANKING] Ranked {len(digests)} products in {len(chunks)} parallel call(s)")
+        return scores
+
+
+# Global service instance
+_service: ProductRankingService | None = None
+
+
+def get_product_ranking_service() -> ProductRankingService:
+    """Get the global product ranking service."""
+    global _service
+    if _service is None:
+        _service = ProductRankingService()
+    return _service
@@ -15,23 +15,43 @@ Application-level webhooks are configured via:
 import asyncio
 import json
 import logging
+import threading
 import time
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 from urllib.parse import urlparse, urlunparse
 from uuid import uuid4
 
-import requests
+import aiohttp
 from a2a.types import Task, TaskStatusUpdateEvent
 from adcp import extract_webhook_result_data, get_adcp_signed_headers_for_webhook
 from adcp.types import McpWebhookPayload
+from sqlalchemy.orm import Session
 
 from src.core.audit_logger import get_audit_logger
-from src.core.database.database_session import get_db_session
-from src.core.database.models import PushNotificationConfig, WebhookDeliveryLog
+from src.core.database.models import PushNotificationConfig, WebhookOutbox
+from src.services.webhook_delivery_log_writer import get_webhook_delivery_log_writer
+from src.services.webhook_delivery_service import WebhookRejectedError, is_permanent_rejection
+from src.services.webhook_outbox import OUTBOX_KIND_PROTOCOL, delivery_config_for, enqueue_webhook
 
 logger = logging.getLogger(__name__)
 
+# Task types whose deliveries are recorded in webhook_delivery_log
+_DELIVERY_LOG_TASK_TYPES = ("delivery_report", "media_buy_delivery")
+
+
+def _serialize_payload(payload: Task | TaskStatusUpdateEvent | McpWebhookPayload | dict[str, Any]) -> dict[str, Any]:
+    """Serialize payload to dict for signing and sending.
+
+    Task/TaskStatusUpdateEvent need serialization; McpWebhookPayload is already AdCPBaseModel.
+    Payloads replayed from the webhook outbox are already dicts.
+    """
+    if isinstance(payload, (Task, TaskStatusUpdateEvent)):
+        return payload.model_dump(mode="json", exclude_none=True)
+    elif isinstance(payload, McpWebhookPayload):
+        return payload.model_dump(mode="json", exclude_none=True)
+    return payload
+
 
 def _normalize_localhost_for_docker(url: str) -> str:
     """Replace localhost host with host.docker.internal while preserving userinfo and port."""
@@ -61,16 +81,64 @@ class ProtocolWebhookService:
     - HMAC-SHA256: Signs payload with shared secret
     - Bearer: Sends credentials as Bearer token
     - None: No authentication
+
+    Deliveries run on a dedicated I/O event loop owned by the service, using one
+    aiohttp session whose connector keeps a bounded keep-alive pool per receiving
+    host. Callers may await send_notification from any loop (including short-lived
+    ``asyncio.run`` loops in admin blueprints and scheduler threads) and still share
+    warm connections.
     """
 
-    def __init__(self):
-        self._session = requests.Session()
+    def __init__(
+        self,
+        max_connections_per_host: int = 20,
+        max_connections: int = 200,
+        keepalive_timeout_seconds: float = 30.0,
+        timeout_seconds: float = 10.0,
+    ):
+        self._max_connections_per_host = max_connections_per_host
+        self._max_connections = max_connections
+        self._keepalive_timeout_seconds = keepalive_timeout_seconds
+        self._timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+        self._http: aiohttp.ClientSession | None = None
+        self._log_writer = get_webhook_delivery_log_writer()
+
+    def _get_io_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the service's I/O loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="protocol-webhook-io", daemon=True)
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    async def _run_on_io_loop(self, coro: Any) -> Any:
+        """Run a coroutine on the I/O loop and await its result from the caller's loop."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_io_loop())
+        return await asyncio.wrap_future(future)
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session (must be called on the I/O loop)."""
+        if self._http is None or self._http.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                limit_per_host=self._max_connections_per_host,
+                keepalive_timeout=self._keepalive_timeout_seconds,
+            )
+            self._http = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+        return self._http
 
     async def send_notification(
         self,
         push_notification_config: PushNotificationConfig,
-        payload: Task | TaskStatusUpdateEvent | McpWebhookPayload,
+        payload: Task | TaskStatusUpdateEvent | McpWebhookPayload | dict[str, Any],
         metadata: dict[str, Any],
+        max_attempts: int = 3,
+        raise_on_rejection: bool = False,
     ) -> bool:
         """
         Send a protocol-level push notification to the configured webhook.
@@ -80,6 +148,10 @@ class ProtocolWebhookService:
             payload: For A2A it can be Task or TaskStatusUpdateEvent types for MCP it wil be McpWebhookPayload.
                 Use create_a2a_webhook_payload or create_mcp_webhook_payload from adcp's official python client to get the payload for particular task and status
             metadata: Contains app specific metadata's such as task_type, tenant_id, principal_id
+            max_attempts: In-process attempts before giving up (the webhook outbox passes 1 and
+                applies its own retry schedule)
+            raise_on_rejection: Raise WebhookRejectedError when the receiver permanently rejects
+                the notification (4xx), so callers with their own retries can tell it apart
 
         Returns:
             True if notification sent successfully, False otherwise
@@ -108,15 +180,10 @@ class ProtocolWebhookService:
         }
         logger.info(f"push_notification_config (sanitized): {safe_config}")
 
-        # Serialize payload to dict for signing and sending
-        # Task/TaskStatusUpdateEvent need serialization; McpWebhookPayload is already AdCPBaseModel
-        payload_dict: dict[str, Any]
-        if isinstance(payload, (Task, TaskStatusUpdateEvent)):
-            payload_dict = payload.model_dump(mode="json", exclude_none=True)
-        elif isinstance(payload, McpWebhookPayload):
-            payload_dict = payload.model_dump(mode="json", exclude_none=True)
-        else:
-            payload_dict = payload
+        payload_dict = _serialize_payload(payload)
+
+        # Encode the request body once; the same bytes are sent on every attempt and used for size metrics
+        body = json.dumps(payload_dict, separators=(",", ":")).encode("utf-8")
 
         # Apply authentication based on schemes
         if (
@@ -134,8 +201,48 @@ class ProtocolWebhookService:
             headers["Authorization"] = f"Bearer {push_notification_config.authentication_token}"
 
         # Send notification with retry logic and logging
-        return await self._send_with_retry_and_logging(
-            url=url, payload=payload_dict, headers=headers, metadata=metadata
+        return await self._run_on_io_loop(
+            self._send_with_retry_and_logging(
+                url=url,
+                payload=payload_dict,
+                headers=headers,
+                metadata=metadata,
+                max_attempts=max_attempts,
+                body=body,
+                raise_on_rejection=raise_on_rejection,
+            )
+        )
+
+    def enqueue_notification(
+        self,
+        session: Session,
+        push_notification_config: PushNotificationConfig,
+        payload: Task | TaskStatusUpdateEvent | McpWebhookPayload | dict[str, Any],
+        metadata: dict[str, Any],
+    ) -> WebhookOutbox | None:
+        """
+        Queue a push notification in the webhook outbox instead of sending it inline.
+
+        The row is added to the caller's session, so it commits (or rolls back) with the
+        state change that triggered it. WebhookOutboxDispatcher delivers it through
+        send_notification after commit.
+
+        Returns:
+            The pending outbox row, or None if no webhook URL is configured
+        """
+        if not push_notification_config or not push_notification_config.url:
+            logger.debug("No webhook URL configured in the push notification, skipping enqueue")
+            return None
+
+        return enqueue_webhook(
+            session,
+            kind=OUTBOX_KIND_PROTOCOL,
+            url=push_notification_config.url,
+            payload=_serialize_payload(payload),
+            tenant_id=metadata.get("tenant_id") or push_notification_config.tenant_id or None,
+            principal_id=metadata.get("principal_id") or push_notification_config.principal_id or None,
+            delivery_config=delivery_config_for(push_notification_config),
+            event_metadata=metadata,
         )
 
     async def _send_with_retry_and_logging(
@@ -145,10 +252,16 @@ class ProtocolWebhookService:
         headers: dict,
         metadata: dict[str, Any],
         max_attempts: int = 3,
+        body: bytes | None = None,
+        raise_on_rejection: bool = False,
     ) -> bool:
-        """Send webhook with exponential backoff retry logic, logging, and audit trail."""
-        # Calculate payload size for metrics
-        payload_size_bytes = len(json.dumps(payload).encode("utf-8"))
+        """Send webhook with exponential backoff retry logic, logging, and audit trail.
+
+        Runs on the service's I/O loop (see send_notification).
+        """
+        if body is None:
+            body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        payload_size_bytes = len(body)
 
         task_type = metadata["task_type"] if "task_type" in metadata else None
         tenant_id = metadata["tenant_id"] if "tenant_id" in metadata else None
@@ -171,111 +284,99 @@ class ProtocolWebhookService:
         # Create webhook delivery log entry
         log_id = str(uuid4())
         start_time = time.time()
+        should_log_delivery = bool(
+            task_type in _DELIVERY_LOG_TASK_TYPES and media_buy_id and tenant_id and principal_id
+        )
+
+        def record_delivery(**fields: Any) -> None:
+            """Queue this delivery's log row; the batched writer persists the latest state."""
+            if not should_log_delivery:
+                return
+            self._log_writer.record(
+                id=log_id,
+                tenant_id=tenant_id,
+                principal_id=principal_id,
+                media_buy_id=media_buy_id,
+                webhook_url=url,
+                task_type=task_type,
+                sequence_number=sequence_number,
+                notification_type=notification_type,
+                payload_size_bytes=payload_size_bytes,
+                **fields,
+            )
 
-        # Log to audit system (start)
+        # Log to audit system (start). Audit writes hit the log files synchronously, so they run
+        # in a worker thread rather than stalling every delivery sharing this I/O loop.
         audit_logger = None
         if tenant_id:
             audit_logger = get_audit_logger("webhook", tenant_id)
-            audit_logger.log_info(f"Sending {task_type} webhook for task {task_id} (sequence #{sequence_number})")
+            await asyncio.to_thread(
+                audit_logger.log_info, f"Sending {task_type} webhook for task {task_id} (sequence #{sequence_number})"
+            )
+
+        http = self._get_http_session()
 
         for attempt in range(max_attempts):
             try:
                 logger.info(f"Sending webhook for task {task_id} to {url} (attempt {attempt + 1}/{max_attempts})")
 
-                def _post() -> requests.Response:
-                    return self._session.post(url, json=payload, headers=headers, timeout=10.0)
-
-                response = await asyncio.to_thread(_post)
-                response.raise_for_status()
+                async with http.post(url, data=body, headers=headers) as response:
+                    # Drain the body so the connection goes back to the keep-alive pool
+                    await response.read()
+                    response.raise_for_status()
+                    status_code = response.status
 
                 # Calculate response time
                 response_time_ms = int((time.time() - start_time) * 1000)
 
-                logger.info(f"Successfully sent webhook for task {task_id} (status: {response.status_code})")
+                logger.info(f"Successfully sent webhook for task {task_id} (status: {status_code})")
 
                 # Write to webhook_delivery_log (success)
-                if (
-                    task_type in ("delivery_report", "media_buy_delivery")
-                    and media_buy_id
-                    and tenant_id
-                    and principal_id
-                ):
-                    try:
-                        with get_db_session() as session:
-                            log_entry = WebhookDeliveryLog(
-                                id=log_id,
-                                tenant_id=tenant_id,
-                                principal_id=principal_id,
-                                media_buy_id=media_buy_id,
-                                webhook_url=url,
-                                task_type=task_type,
-                                sequence_number=sequence_number,
-                                notification_type=notification_type,
-                                attempt_count=attempt + 1,
-                                status="success",
-                                http_status_code=response.status_code,
-                                payload_size_bytes=payload_size_bytes,
-                                response_time_ms=response_time_ms,
-                                completed_at=datetime.now(UTC),
-                            )
-                            session.merge(log_entry)
-                            session.commit()
-                    except Exception as e:
-                        logger.error(f"Failed to write webhook delivery log: {e}")
+                record_delivery(
+                    attempt_count=attempt + 1,
+                    status="success",
+                    http_status_code=status_code,
+                    response_time_ms=response_time_ms,
+                    completed_at=datetime.now(UTC),
+                )
 
                 # Log to audit system (success)
                 if audit_logger:
-                    audit_logger.log_success(
+                    await asyncio.to_thread(
+                        audit_logger.log_success,
                         f"{task_type} webhook delivered successfully (sequence #{sequence_number}, "
-                        f"{response_time_ms}ms, {payload_size_bytes} bytes)"
+                        f"{response_time_ms}ms, {payload_size_bytes} bytes)",
                     )
 
                 return True
 
-            except requests.HTTPError as e:
-                status_code = e.response.status_code if e.response else None
+            except aiohttp.ClientResponseError as e:
+                status_code = e.status
                 response_time_ms = int((time.time() - start_time) * 1000)
                 error_message = f"HTTP {status_code}: {str(e)}"
 
                 # Don't retry on 4xx errors (client errors - permanent failures)
-                if status_code and 400 <= status_code < 500:
+                if 400 <= status_code < 500:
                     logger.error(f"Webhook failed for task {task_id} with client error {status_code} - not retrying")
 
                     # Write to webhook_delivery_log (failed)
-                    if (
-                        task_type in ("delivery_report", "media_buy_delivery")
-                        and media_buy_id
-                        and tenant_id
-                        and principal_id
-                    ):
-                        try:
-                            with get_db_session() as session:
-                                log_entry = WebhookDeliveryLog(
-                                    id=log_id,
-                                    tenant_id=tenant_id,
-                                    principal_id=principal_id,
-                                    media_buy_id=media_buy_id,
-                                    webhook_url=url,
-                                    task_type=task_type,
-                                    sequence_number=sequence_number,
-                                    notification_type=notification_type,
-                                    attempt_count=attempt + 1,
-                                    status="failed",
-                                    http_status_code=status_code,
-                                    error_message=error_message,
-                                    payload_size_bytes=payload_size_bytes,
-                                    response_time_ms=response_time_ms,
-                                    completed_at=datetime.now(UTC),
-                                )
-                                session.merge(log_entry)
-                                session.commit()
-                        except Exception as e:
-                            logger.error(f"Failed to write webhook delivery log: {e}")
+                    record_delivery(
+                        attempt_count=attempt + 1,
+                        status="failed",
+                        http_status_code=status_code,
+                        error_message=error_message,
+                        response_time_ms=response_time_ms,
+                        completed_at=datetime.now(UTC),
+                    )
 
                     # Log to audit system (failure)
                     if audit_logger:
-                        audit_logger.log_warning(f"{task_type} webhook failed with client error {status_code}")
+                        await asyncio.to_thread(
+                            audit_logger.log_warning, f"{task_type} webhook failed with client error {status_code}"
+                        )
 
+                    if raise_on_rejection and is_permanent_rejection(status_code):
+                        raise WebhookRejectedError(status_code, error_message) from e
                     return False
 
                 # Retry on 5xx errors (server errors - transient)
@@ -287,81 +388,38 @@ class ProtocolWebhookService:
                     )
 
                     # Write to webhook_delivery_log (retrying)
-                    if (
-                        task_type in ("delivery_report", "media_buy_delivery")
-                        and media_buy_id
-                        and tenant_id
-                        and principal_id
-                    ):
-                        try:
-                            with get_db_session() as session:
-                                next_retry = datetime.now(UTC).replace(microsecond=0)
-                                next_retry = next_retry.replace(second=next_retry.second + int(wait_seconds))
-
-                                log_entry = WebhookDeliveryLog(
-                                    id=log_id,
-                                    tenant_id=tenant_id,
-                                    principal_id=principal_id,
-                                    media_buy_id=media_buy_id,
-                                    webhook_url=url,
-                                    task_type=task_type,
-                                    sequence_number=sequence_number,
-                                    notification_type=notification_type,
-                                    attempt_count=attempt + 1,
-                                    status="retrying",
-                                    http_status_code=status_code,
-                                    error_message=error_message,
-                                    payload_size_bytes=payload_size_bytes,
-                                    response_time_ms=response_time_ms,
-                                    next_retry_at=next_retry,
-                                )
-                                session.merge(log_entry)
-                                session.commit()
-                        except Exception as e:
-                            logger.error(f"Failed to write webhook delivery log: {e}")
+                    record_delivery(
+                        attempt_count=attempt + 1,
+                        status="retrying",
+                        http_status_code=status_code,
+                        error_message=error_message,
+                        response_time_ms=response_time_ms,
+                        next_retry_at=datetime.now(UTC).replace(microsecond=0) + timedelta(seconds=wait_seconds),
+                    )
 
                     await asyncio.sleep(wait_seconds)
                 else:
                     logger.error(f"Webhook failed for task {task_id} after {max_attempts} attempts: HTTP {status_code}")
 
                     # Write to webhook_delivery_log (failed after all retries)
-                    if (
-                        task_type in ("delivery_report", "media_buy_delivery")
-                        and media_buy_id
-                        and tenant_id
-                        and principal_id
-                    ):
-                        try:
-                            with get_db_session() as session:
-                                log_entry = WebhookDeliveryLog(
-                                    id=log_id,
-                                    tenant_id=tenant_id,
-                                    principal_id=principal_id,
-                                    media_buy_id=media_buy_id,
-                                    webhook_url=url,
-                                    task_type=task_type,
-                                    sequence_number=sequence_number,
-                                    notification_type=notification_type,
-                                    attempt_count=max_attempts,
-                                    status="failed",
-                                    http_status_code=status_code,
-                                    error_message=error_message,
-                                    payload_size_bytes=payload_size_bytes,
-                                    response_time_ms=response_time_ms,
-                                    completed_at=datetime.now(UTC),
-                                )
-                                session.merge(log_entry)
-                                session.commit()
-                        except Exception as e:
-                            logger.error(f"Failed to write webhook delivery log: {e}")
+                    record_delivery(
+                        attempt_count=max_attempts,
+                        status="failed",
+                        http_status_code=status_code,
+                        error_message=error_message,
+                        response_time_ms=response_time_ms,
+                        completed_at=datetime.now(UTC),
+                    )
 
                     # Log to audit system (failure after all retries)
                     if audit_logger:
-                        audit_logger.log_warning(f"{task_type} webhook failed after {max_attempts} attempts")
+                        await asyncio.to_thread(
+                            audit_logger.log_warning, f"{task_type} webhook failed after {max_attempts} attempts"
+                        )
 
                     return False
 
-            except requests.RequestException as e:
+            except (aiohttp.ClientError, TimeoutError) as e:
                 response_time_ms = int((time.time() - start_time) * 1000)
                 error_message = f"{type(e).__name__}: {str(e)}"
 
@@ -379,38 +437,20 @@ class ProtocolWebhookService:
                     )
 
                     # Write to webhook_delivery_log (failed)
-                    if (
-                        task_type in ("delivery_report", "media_buy_delivery")
-                        and media_buy_id
-                        and tenant_id
-                        and principal_id
-                    ):
-                        try:
-                            with get_db_session() as session:
-                                log_entry = WebhookDeliveryLog(
-                                    id=log_id,
-                                    tenant_id=tenant_id,
-                                    principal_id=principal_id,
-                                    media_buy_id=media_buy_id,
-                                    webhook_url=url,
-                                    task_type=task_type,
-                                    sequence_number=sequence_number,
-                                    notification_type=notification_type,
-                                    attempt_count=max_attempts,
-                                    status="failed",
-                                    error_message=error_message,
-                                    payload_size_bytes=payload_size_bytes,
-                                    response_time_ms=response_time_ms,
-                                    completed_at=datetime.now(UTC),
-                                )
-                                session.merge(log_entry)
-                                session.commit()
-                        except Exception as log_err:
-                            logger.error(f"Failed to write webhook delivery log: {log_err}")
+                    record_delivery(
+                        attempt_count=max_attempts,
+                        status="failed",
+                        error_message=error_message,
+                        response_time_ms=response_time_ms,
+                        completed_at=datetime.now(UTC),
+                    )
 
                     # Log to audit system (network failure)
                     if audit_logger:
-                        audit_logger.log_warning(f"{task_type} webhook failed with network error: {type(e).__name__}")
+                        await asyncio.to_thread(
+                            audit_logger.log_warning,
+                            f"{task_type} webhook failed with network error: {type(e).__name__}",
+                        )
 
                     return False
 
@@ -418,42 +458,28 @@ class ProtocolWebhookService:
                 logger.error(f"Unexpected error sending webhook for task {task_id}: {e}")
 
                 # Write to webhook_delivery_log (unexpected failure)
-                if (
-                    task_type in ("delivery_report", "media_buy_delivery")
-                    and media_buy_id
-                    and tenant_id
-                    and principal_id
-                ):
-                    try:
-                        with get_db_session() as session:
-                            log_entry = WebhookDeliveryLog(
-                                id=log_id,
-                                tenant_id=tenant_id,
-                                principal_id=principal_id,
-                                media_buy_id=media_buy_id,
-                                webhook_url=url,
-                                task_type=task_type,
-                                sequence_number=sequence_number,
-                                notification_type=notification_type,
-                                attempt_count=attempt + 1,
-                                status="failed",
-                                error_message=f"Unexpected error: {str(e)}",
-                                payload_size_bytes=payload_size_bytes,
-                                completed_at=datetime.now(UTC),
-                            )
-                            session.merge(log_entry)
-                            session.commit()
-                    except Exception as log_err:
-                        logger.error(f"Failed to write webhook delivery log: {log_err}")
+                record_delivery(
+                    attempt_count=attempt + 1,
+                    status="failed",
+                    error_message=f"Unexpected error: {str(e)}",
+                    completed_at=datetime.now(UTC),
+                )
 
                 return False
 
         # Should never reach here
         return False
 
+    async def _close_http_session(self) -> None:
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
     async def close(self):
-        """Close HTTP client."""
-        self._session.close()
+        """Close the pooled HTTP session and flush pending delivery logs."""
+        if self._loop is not None and not self._loop.is_closed():
+            await self._run_on_io_loop(self._close_http_session())
+        await asyncio.to_thread(self._log_writer.flush)
 
 
 # Global service instance
@@ -0,0 +1,230 @@
+"""Per-tenant daily revenue rollup for the admin dashboard.
+
+Daily revenue is each live or completed media buy's budget prorated evenly across
+its flight days. The dashboard used to compute it with one query per day, loading
+full MediaBuy rows and prorating in Python. tenant_daily_revenue stores the result
+instead, so the revenue chart is a single range scan on (tenant_id, day).
+
+Maintenance is incremental: when a media buy's budget, flight dates or status
+change, the days it covers (before and after the change) are recomputed from
+media_buys in the same transaction. ORM writes are picked up by the MediaBuy
+mapper events in models.py; bulk update() statements must call
+refresh_media_buy_revenue() themselves. Recomputes store absolute day totals,
+so writers for the same tenant take turns on a transaction-scoped advisory
+lock; each recompute then sees every earlier writer's committed buys.
+
+The rollup only covers days some media buy touched since it was enabled, so a
+tenant's rows are trusted once backfill_tenant_revenue_rollup() has run and set
+Tenant.revenue_rollup_backfilled_at. Until then the dashboard falls back to
+computing the series in one generate_series query.
+"""
+
+import logging
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Date, and_, cast, delete, func, inspect, literal, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import MediaBuy, Tenant, TenantDailyRevenue
+
+logger = logging.getLogger(__name__)
+
+# Media buy statuses that count as revenue
+REVENUE_STATUSES = ("active", "completed")
+
+# MediaBuy attributes that affect the rollup
+_ROLLUP_ATTRIBUTES = ("budget", "start_date", "end_date", "status")
+
+
+def daily_revenue_query(tenant_id: str, start: date, end: date):
+    """Select (day, revenue) for every day in [start, end], computed from media_buys."""
+    days = select(
+        cast(
+            func.generate_series(literal(start, Date), literal(end, Date), literal_column("interval '1 day'")), Date
+        ).label("day")
+    ).subquery("days")
+    flight_days = (MediaBuy.end_date - MediaBuy.start_date) + 1
+
+    return (
+        select(days.c.day, func.coalesce(func.sum(MediaBuy.budget / flight_days), 0).label("revenue"))
+        .select_from(days)
+        .outerjoin(
+            MediaBuy,
+            and_(
+                MediaBuy.tenant_id == tenant_id,
+                MediaBuy.status.in_(REVENUE_STATUSES),
+                MediaBuy.start_date <= days.c.day,
+                MediaBuy.end_date >= days.c.day,
+            ),
+        )
+        .group_by(days.c.day)
+        .order_by(days.c.day)
+    )
+
+
+def lock_tenant_rollup(bind: Session | Connection, tenant_id: str) -> None:
+    """Hold the tenant's rollup lock until the caller's transaction ends.
+
+    Without it two transactions changing overlapping days would each recompute
+    totals that miss the other's uncommitted buys, and the later upsert would win.
+    """
+    bind.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"tenant_daily_revenue:{tenant_id}"))))
+
+
+def refresh_revenue_rollup(bind: Session | Connection, tenant_id: str, start: date, end: date) -> None:
+    """Recompute and upsert the tenant's rollup rows for [start, end].
+
+    Runs on the caller's session or connection; the caller commits. Takes the
+    tenant's rollup lock first, so the recompute sees all committed buys.
+    """
+    if end < start:
+        return
+
+    lock_tenant_rollup(bind, tenant_id)
+    query = daily_revenue_query(tenant_id, start, end).subquery("daily")
+    stmt = insert(TenantDailyRevenue).from_select(
+        ["tenant_id", "day", "revenue", "updated_at"],
+        select(literal(tenant_id), query.c.day, query.c.revenue, func.now()),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["tenant_id", "day"],
+        set_={"revenue": stmt.excluded.revenue, "updated_at": stmt.excluded.updated_at},
+    )
+    bind.execute(stmt)
+
+
+def media_buy_rollup_range(media_buy: MediaBuy, require_change: bool = True) -> tuple[date, date] | None:
+    """Days whose revenue may differ after this flush of media_buy, or None.
+
+    Covers both the old and new flight dates, so moving or shortening a flight clears
+    the days it no longer covers. Returns None when no rollup input changed or the
+    buy was not counted as revenue before or after the change.
+    """
+    state = inspect(media_buy)
+    history = {name: state.attrs[name].history for name in _ROLLUP_ATTRIBUTES}
+
+    if require_change and not any(h.has_changes() for h in history.values()):
+        return None
+
+    def values(name: str) -> list[Any]:
+        h = history[name]
+        return [v for v in (*h.added, *h.unchanged, *h.deleted) if v is not None]
+
+    if not any(status in REVENUE_STATUSES for status in values("status")):
+        return None
+
+    dates = values("start_date") + values("end_date")
+    if not dates:
+        return None
+    return min(dates), max(dates)
+
+
+def refresh_rollup_for_media_buy(connection: Connection, media_buy: MediaBuy, require_change: bool = True) -> None:
+    """Mapper event hook: refresh the rollup for the days a flushed media buy covers."""
+    day_range = media_buy_rollup_range(media_buy, require_change=require_change)
+    if day_range is None:
+        return
+    refresh_revenue_rollup(connection, media_buy.tenant_id, *day_range)
+
+
+def refresh_media_buy_revenue(session: Session, media_buy_id: str) -> None:
+    """Refresh the rollup for a media buy changed with a bulk update() statement.
+
+    Call after the update and before commit. Bulk updates bypass the mapper events,
+    and must not change flight dates (the old range would not be refreshed).
+    """
+    row = session.execute(
+        select(MediaBuy.tenant_id, MediaBuy.start_date, MediaBuy.end_date).where(MediaBuy.media_buy_id == media_buy_id)
+    ).first()
+    if row is None:
+        return
+    refresh_revenue_rollup(session, row.tenant_id, row.start_date, row.end_date)
+
+
+def get_daily_revenue(session: Session, tenant_id: str, start: date, end: date, use_rollup: bool) -> list[dict]:
+    """Daily revenue for [start, end] as [{"date": "YYYY-MM-DD", "revenue": float}, ...].
+
+    Reads tenant_daily_revenue when use_rollup is set (days without a row are zero),
+    otherwise computes the series from media_buys in one query.
+    """
+    if use_rollup:
+        rows = session.execute(
+            select(TenantDailyRevenue.day, TenantDailyRevenue.revenue).where(
+                TenantDailyRevenue.tenant_id == tenant_id,
+                TenantDailyRevenue.day >= start,
+                TenantDailyRevenue.day <= end,
+            )
+        ).all()
+    else:
+        rows = session.execute(daily_revenue_query(tenant_id, start, end)).all()
+
+    revenue_by_day: dict[date, Any] = {row[0]: row[1] for row in rows}
+    return [
+        {
+            "date": (start + timedelta(days=i)).isoformat(),
+            "revenue": round(float(revenue_by_day.get(start + timedelta(days=i)) or 0), 2),
+        }
+        for i in range((end - start).days + 1)
+    ]
+
+
+def backfill_tenant_revenue_rollup(tenant_id: str) -> int:
+    """Rebuild a tenant's rollup from media_buys and mark it as backfilled.
+
+    Safe to re-run; also repairs drift from writes that bypassed the hooks.
+
+    Returns:
+        Number of days covered by the rebuilt rollup.
+    """
+    with get_db_session() as session:
+        # Serialize with concurrent backfills and incremental refreshes of the same tenant
+        lock_tenant_rollup(session, tenant_id)
+
+        bounds = session.execute(
+            select(func.min(MediaBuy.start_date), func.max(MediaBuy.end_date)).where(
+                MediaBuy.tenant_id == tenant_id,
+                MediaBuy.status.in_(REVENUE_STATUSES),
+            )
+        ).one()
+
+        session.execute(delete(TenantDailyRevenue).where(TenantDailyRevenue.tenant_id == tenant_id))
+        days = 0
+        if bounds[0] is not None and bounds[1] is not None:
+            refresh_revenue_rollup(session, tenant_id, bounds[0], bounds[1])
+            days = (bounds[1] - bounds[0]).days + 1
+
+        session.execute(
+            update(Tenant).where(Tenant.tenant_id == tenant_id).values(revenue_rollup_backfilled_at=datetime.now(UTC))
+        )
+        session.commit()
+
+    logger.info(f"Backfilled revenue rollup for tenant {tenant_id} ({days} days)")
+    return days
+
+
+def backfill_all_tenants(only_missing: bool = False) -> dict[str, int]:
+    """Backfill the revenue rollup for every active tenant.
+
+    Args:
+        only_missing: Skip tenants whose rollup has already been backfilled
+
+    Returns:
+        Map of tenant_id to days covered; tenants that failed are omitted.
+    """
+    with get_db_session() as session:
+        stmt = select(Tenant.tenant_id).where(Tenant.is_active.is_(True))
+        if only_missing:
+            stmt = stmt.where(Tenant.revenue_rollup_backfilled_at.is_(None))
+        tenant_ids = list(session.scalars(stmt).all())
+
+    results = {}
+    for tenant_id in tenant_ids:
+        try:
+            results[tenant_id] = backfill_tenant_revenue_rollup(tenant_id)
+        except Exception as e:
+            logger.error(f"Failed to backfill revenue rollup for tenant {tenant_id}: {e}", exc_info=True)
+    return results
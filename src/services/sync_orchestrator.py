@@ -0,0 +1,538 @@
+"""
+Central scheduler for tenant sync jobs (inventory, orders, format metrics).
+
+Syncs used to be started ad hoc: one raw thread per sync, jobs left 'running'
+forever when their process died, and every GAM tenant synced at the same times,
+starving the database pool. The orchestrator:
+
+- Keeps a persisted schedule per tenant and sync type (sync_schedules), seeded
+  for every GAM tenant with the first run jittered across the interval and each
+  next run jittered around it, so tenants spread out instead of piling up
+- Runs due jobs on a bounded worker pool, under a global limit on running jobs
+  (across all processes) and a per-tenant limit
+- Owns jobs by lease: the worker renews SyncJob.lease_expires_at on a heartbeat,
+  and a running job whose lease lapsed (crashed or restarted worker) is marked
+  failed and its schedule made due again
+- Reports queue depth and throughput for the sync dashboard
+
+Claims are serialized across processes with a transaction-level advisory lock,
+so the running-job count behind the global limit cannot be raced, and due
+schedules are taken with SELECT ... FOR UPDATE SKIP LOCKED. Any number of
+processes can run an orchestrator.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, extract, func, or_, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import AdapterConfig, SyncJob, SyncSchedule, Tenant
+from src.services.background_sync_service import (
+    _build_gam_client,
+    _mark_sync_complete,
+    _mark_sync_failed,
+    _run_sync_thread,
+)
+
+logger = logging.getLogger(__name__)
+
+SYNC_ORCHESTRATOR_TICK_SECONDS = int(os.getenv("SYNC_ORCHESTRATOR_TICK_SECONDS", "15"))
+# Worker threads per process
+SYNC_ORCHESTRATOR_WORKERS = int(os.getenv("SYNC_ORCHESTRATOR_WORKERS", "4"))
+# Running sync jobs across all processes, ad hoc syncs included
+SYNC_GLOBAL_CONCURRENCY = int(os.getenv("SYNC_GLOBAL_CONCURRENCY", "8"))
+SYNC_PER_TENANT_CONCURRENCY = int(os.getenv("SYNC_PER_TENANT_CONCURRENCY", "1"))
+SYNC_LEASE_SECONDS = int(os.getenv("SYNC_LEASE_SECONDS", "300"))
+SYNC_HEARTBEAT_SECONDS = int(os.getenv("SYNC_HEARTBEAT_SECONDS", "60"))
+# Each next run lands within +/- this fraction of the interval
+SYNC_SCHEDULE_JITTER = 0.1
+# Running jobs without a lease (started before leases existed) are reclaimed after this
+UNLEASED_JOB_TIMEOUT = timedelta(hours=6)
+SCHEDULE_SEED_INTERVAL = timedelta(minutes=10)
+# Serializes job claims across processes (arbitrary application-wide key)
+_CLAIM_LOCK_KEY = 58_310_442
+
+DEFAULT_SYNC_INTERVALS = {
+    "inventory": 24 * 3600,
+    "orders": 3600,
+    "format_metrics": 24 * 3600,
+}
+
+RECLAIMED_ERROR = "Sync worker stopped heartbeating (lease expired); reclaimed by the sync orchestrator"
+
+
+def worker_id() -> str:
+    """Lease owner name for this process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def new_lease() -> dict[str, Any]:
+    """SyncJob lease columns for a job this process is about to run."""
+    now = datetime.now(UTC)
+    return {
+        "lease_owner": worker_id(),
+        "lease_expires_at": now + timedelta(seconds=SYNC_LEASE_SECONDS),
+        "heartbeat_at": now,
+    }
+
+
+def lease_expired(sync_job: SyncJob) -> bool:
+    expires_at = sync_job.lease_expires_at
+    if expires_at is None:
+        return False
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=UTC)
+    return expires_at < datetime.now(UTC)
+
+
+class SyncLeaseHeartbeat:
+    """Renews the leases of every sync job this process runs, one UPDATE per beat."""
+
+    def __init__(self, interval_seconds: int = SYNC_HEARTBEAT_SECONDS):
+        self.interval_seconds = interval_seconds
+        self._sync_ids: set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def hold(self, sync_id: str) -> None:
+        with self._lock:
+            self._sync_ids.add(sync_id)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="sync-lease-heartbeat")
+                self._thread.start()
+
+    def release(self, sync_id: str) -> None:
+        with self._lock:
+            self._sync_ids.discard(sync_id)
+
+    def beat(self) -> set[str]:
+        """Renew held leases; returns the sync ids whose lease this process no longer owns."""
+        with self._lock:
+            sync_ids = set(self._sync_ids)
+        if not sync_ids:
+            return set()
+
+        with get_db_session() as db:
+            renewed = set(
+                db.scalars(
+                    update(SyncJob)
+                    .where(
+                        SyncJob.sync_id.in_(sync_ids),
+                        SyncJob.status == "running",
+                        SyncJob.lease_owner == worker_id(),
+                    )
+                    .values(
+                        heartbeat_at=func.now(),
+                        lease_expires_at=func.now() + timedelta(seconds=SYNC_LEASE_SECONDS),
+                    )
+                    .returning(SyncJob.sync_id)
+                    .execution_options(synchronize_session=False)
+                )
+            )
+            db.commit()
+
+        lost = sync_ids - renewed
+        for sync_id in lost:
+            logger.warning(f"[{sync_id}] Sync lease lost (job finished elsewhere or was reclaimed)")
+            self.release(sync_id)
+        return lost
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval_seconds)
+            try:
+                self.beat()
+            except Exception as e:
+                logger.warning(f"Sync lease heartbeat failed: {e}")
+
+
+_heartbeat = SyncLeaseHeartbeat()
+
+
+def get_lease_heartbeat() -> SyncLeaseHeartbeat:
+    """Get the process-wide lease heartbeat."""
+    return _heartbeat
+
+
+def reclaim_expired_leases(session: Session) -> list[str]:
+    """Fail running jobs whose lease lapsed and make their schedules due again.
+
+    Returns the reclaimed sync ids. The caller commits.
+    """
+    reclaimed = session.execute(
+        update(SyncJob)
+        .where(
+            SyncJob.status == "running",
+            or_(
+                SyncJob.lease_expires_at < func.now(),
+                and_(
+                    SyncJob.lease_expires_at.is_(None),
+                    SyncJob.started_at < datetime.now(UTC) - UNLEASED_JOB_TIMEOUT,
+                ),
+            ),
+        )
+        .values(status="failed", completed_at=datetime.now(UTC), error_message=RECLAIMED_ERROR)
+        .returning(SyncJob.sync_id, SyncJob.tenant_id, SyncJob.sync_type)
+        .execution_options(synchronize_session=False)
+    ).all()
+    if not reclaimed:
+        return []
+
+    session.execute(
+        update(SyncSchedule)
+        .where(tuple_(SyncSchedule.tenant_id, SyncSchedule.sync_type).in_([(r[1], r[2]) for r in reclaimed]))
+        .values(next_run_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    logger.warning(f"Reclaimed {len(reclaimed)} sync jobs with expired leases: {[r[0] for r in reclaimed]}")
+    return [r[0] for r in reclaimed]
+
+
+def _jittered(interval_seconds: int) -> timedelta:
+    return timedelta(seconds=interval_seconds * (1 + random.uniform(-SYNC_SCHEDULE_JITTER, SYNC_SCHEDULE_JITTER)))
+
+
+def seed_default_schedules(session: Session, intervals: dict[str, int] | None = None) -> int:
+    """Create missing schedules for GAM tenants, first runs spread across the interval.
+
+    Existing schedules (including disabled ones and edited intervals) are left alone.
+    Returns the number of schedules created. The caller commits.
+    """
+    intervals = intervals or DEFAULT_SYNC_INTERVALS
+    tenants = session.execute(
+        select(Tenant.tenant_id, AdapterConfig.gam_refresh_token)
+        .join(AdapterConfig, Tenant.tenant_id == AdapterConfig.tenant_id)
+        .where(
+            Tenant.ad_server == "google_ad_manager",
+            Tenant.is_active,
+            AdapterConfig.gam_network_code.isnot(None),
+        )
+    ).all()
+    existing = set(session.execute(select(SyncSchedule.tenant_id, SyncSchedule.sync_type)).tuples().all())
+
+    now = datetime.now(UTC)
+    rows = [
+        {
+            "tenant_id": tenant_id,
+            "sync_type": sync_type,
+            "interval_seconds": interval,
+            "next_run_at": now + timedelta(seconds=random.uniform(0, interval)),
+        }
+        for tenant_id, refresh_token in tenants
+        for sync_type, interval in intervals.items()
+        if (tenant_id, sync_type) not in existing
+        # Format metrics reports are fetched with the tenant's OAuth refresh token
+        and (sync_type != "format_metrics" or refresh_token)
+    ]
+    if rows:
+        session.execute(insert(SyncSchedule).values(rows).on_conflict_do_nothing())
+        logger.info(f"Created {len(rows)} sync schedules")
+    return len(rows)
+
+
+@dataclass
+class ClaimedJob:
+    sync_id: str
+    tenant_id: str
+    sync_type: str
+
+
+def claim_due_jobs(
+    session: Session,
+    capacity: int,
+    global_limit: int = SYNC_GLOBAL_CONCURRENCY,
+    per_tenant_limit: int = SYNC_PER_TENANT_CONCURRENCY,
+) -> list[ClaimedJob]:
+    """Start up to ``capacity`` due schedules as leased SyncJobs owned by this process.
+
+    Due schedules are taken in next_run_at order; a tenant at its limit (or already
+    running that sync type) keeps its schedule due for a later tick. The caller commits,
+    which also releases the claim lock held while counting running jobs.
+    """
+    # Without it, orchestrators counting running jobs at the same time could all claim the same free slots
+    session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _CLAIM_LOCK_KEY})
+    running = session.execute(select(SyncJob.tenant_id, SyncJob.sync_type).where(SyncJob.status == "running")).all()
+    capacity = min(capacity, global_limit - len(running))
+    if capacity <= 0:
+        return []
+
+    running_by_tenant: dict[str, int] = {}
+    for tenant_id, _ in running:
+        running_by_tenant[tenant_id] = running_by_tenant.get(tenant_id, 0) + 1
+    running_types = {(tenant_id, sync_type) for tenant_id, sync_type in running}
+
+    due = session.scalars(
+        select(SyncSchedule)
+        .where(SyncSchedule.enabled, SyncSchedule.next_run_at <= func.now())
+        .order_by(SyncSchedule.next_run_at)
+        # Headroom for schedules skipped by the per-tenant limit
+        .limit(capacity * 4)
+        .with_for_update(skip_locked=True)
+    ).all()
+
+    now = datetime.now(UTC)
+    claimed: list[ClaimedJob] = []
+    for schedule in due:
+        if len(claimed) >= capacity:
+            break
+        tenant_id, sync_type = schedule.tenant_id, schedule.sync_type
+        if running_by_tenant.get(tenant_id, 0) >= per_tenant_limit or (tenant_id, sync_type) in running_types:
+            continue
+
+        sync_id = f"{sync_type}_{tenant_id}_{uuid.uuid4().hex[:12]}"
+        session.add(
+            SyncJob(
+                sync_id=sync_id,
+                tenant_id=tenant_id,
+                adapter_type="google_ad_manager",
+                sync_type=sync_type,
+                status="running",
+                started_at=now,
+                triggered_by="scheduler",
+                triggered_by_id=worker_id(),
+                progress={"phase": "Starting", "mode": "incremental"},
+                **new_lease(),
+            )
+        )
+        schedule.last_started_at = now
+        schedule.last_sync_id = sync_id
+        schedule.next_run_at = now + _jittered(schedule.interval_seconds)
+
+        running_by_tenant[tenant_id] = running_by_tenant.get(tenant_id, 0) + 1
+        running_types.add((tenant_id, sync_type))
+        claimed.append(ClaimedJob(sync_id, tenant_id, sync_type))
+    return claimed
+
+
+def _gam_adapter_config(session: Session, tenant_id: str) -> AdapterConfig:
+    adapter_config = session.scalars(
+        select(AdapterConfig).filter_by(tenant_id=tenant_id, adapter_type="google_ad_manager")
+    ).first()
+    if not adapter_config or not adapter_config.gam_network_code:
+        raise ValueError("GAM not configured")
+    return adapter_config
+
+
+def _run_inventory_sync(tenant_id: str, sync_id: str) -> None:
+    # Records its own completion or failure on the SyncJob
+    _run_sync_thread(tenant_id, sync_id, "incremental", None, None, None)
+
+
+def _run_orders_sync(tenant_id: str, sync_id: str) -> None:
+    from src.services.gam_orders_service import GAMOrdersService
+
+    with get_db_session() as db:
+        client = _build_gam_client(_gam_adapter_config(db, tenant_id))
+        summary = GAMOrdersService(db).sync_tenant_orders(tenant_id, client, sync_id=sync_id)
+    _mark_sync_complete(sync_id, summary)
+
+
+def _run_format_metrics_sync(tenant_id: str, sync_id: str) -> None:
+    from src.services.format_metrics_service import aggregate_tenant_metrics
+
+    with get_db_session() as db:
+        adapter_config = _gam_adapter_config(db, tenant_id)
+        network_code, refresh_token = adapter_config.gam_network_code, adapter_config.gam_refresh_token
+    if not refresh_token:
+        raise ValueError("Format metrics require GAM OAuth (no refresh token configured)")
+    _mark_sync_complete(sync_id, aggregate_tenant_metrics(tenant_id, network_code or "", refresh_token))
+
+
+SYNC_RUNNERS: dict[str, Callable[[str, str], None]] = {
+    "inventory": _run_inventory_sync,
+    "orders": _run_orders_sync,
+    "format_metrics": _run_format_metrics_sync,
+}
+
+
+class SyncOrchestrator:
+    """Background task that starts due tenant syncs on a bounded worker pool."""
+
+    def __init__(self, workers: int = SYNC_ORCHESTRATOR_WORKERS, tick_seconds: int = SYNC_ORCHESTRATOR_TICK_SECONDS):
+        self.workers = workers
+        self.tick_seconds = tick_seconds
+        self.is_running = False
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight: dict[str, Future] = {}
+        self._in_flight_lock = threading.Lock()
+        self._last_seeded: datetime | None = None
+
+    async def start(self) -> None:
+        """Start the orchestrator background task."""
+        async with self._lock:
+            if self.is_running:
+                logger.warning("Sync orchestrator is already running")
+                return
+
+            self.is_running = True
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sync-worker")
+            self._task = asyncio.create_task(self._run_scheduler())
+            logger.info(f"Sync orchestrator started ({self.workers} workers, worker id {worker_id()})")
+
+    async def stop(self) -> None:
+        """Stop scheduling; jobs still running keep their lease until they finish or it lapses."""
+        async with self._lock:
+            if not self.is_running:
+                return
+
+            self.is_running = False
+            if self._task:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            if self._executor:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            logger.info("Sync orchestrator stopped")
+
+    async def _run_scheduler(self) -> None:
+        while self.is_running:
+            try:
+                await asyncio.to_thread(self.tick)
+            except Exception as e:
+                logger.error(f"Error in sync orchestrator: {e}", exc_info=True)
+            await asyncio.sleep(self.tick_seconds)
+
+    def busy_workers(self) -> int:
+        with self._in_flight_lock:
+            return len(self._in_flight)
+
+    def tick(self) -> list[str]:
+        """Reclaim expired leases, seed schedules, and start due jobs. Returns started sync ids."""
+        with get_db_session() as db:
+            reclaim_expired_leases(db)
+            now = datetime.now(UTC)
+            if self._last_seeded is None or now - self._last_seeded >= SCHEDULE_SEED_INTERVAL:
+                seed_default_schedules(db)
+                self._last_seeded = now
+            capacity = self.workers - self.busy_workers()
+            jobs = claim_due_jobs(db, capacity) if capacity > 0 else []
+            db.commit()
+
+        for job in jobs:
+            self._submit(job)
+        return [job.sync_id for job in jobs]
+
+    def _submit(self, job: ClaimedJob) -> None:
+        if self._executor is None:
+            raise RuntimeError("Sync orchestrator is not started")
+        get_lease_heartbeat().hold(job.sync_id)
+        with self._in_flight_lock:
+            self._in_flight[job.sync_id] = self._executor.submit(self._run_job, job)
+
+    def _run_job(self, job: ClaimedJob) -> None:
+        logger.info(f"[{job.sync_id}] Starting scheduled {job.sync_type} sync for {job.tenant_id}")
+        try:
+            SYNC_RUNNERS[job.sync_type](job.tenant_id, job.sync_id)
+        except Exception as e:
+            logger.error(f"[{job.sync_id}] Scheduled {job.sync_type} sync failed: {e}", exc_info=True)
+            _mark_sync_failed(job.sync_id, str(e))
+        finally:
+            get_lease_heartbeat().release(job.sync_id)
+            with self._in_flight_lock:
+                self._in_flight.pop(job.sync_id, None)
+
+
+def get_sync_dashboard(session: Session) -> dict[str, Any]:
+    """Queue depth, running jobs and last-hour throughput for the sync dashboard."""
+    hour_ago = datetime.now(UTC) - timedelta(hours=1)
+
+    queue = session.execute(
+        select(SyncSchedule.sync_type, func.count(), func.min(SyncSchedule.next_run_at))
+        .where(SyncSchedule.enabled, SyncSchedule.next_run_at <= func.now())
+        .group_by(SyncSchedule.sync_type)
+    ).all()
+    oldest_due = min((row[2] for row in queue), default=None)
+    if oldest_due is not None and oldest_due.tzinfo is None:
+        oldest_due = oldest_due.replace(tzinfo=UTC)
+
+    running = session.execute(
+        select(SyncJob.sync_type, func.count()).where(SyncJob.status == "running").group_by(SyncJob.sync_type)
+    ).all()
+
+    finished = session.execute(
+        select(
+            SyncJob.sync_type,
+            SyncJob.status,
+            func.count(),
+            func.avg(extract("epoch", SyncJob.completed_at - SyncJob.started_at)),
+            func.count().filter(SyncJob.error_message == RECLAIMED_ERROR),
+        )
+        .where(SyncJob.completed_at >= hour_ago, SyncJob.status.in_(["completed", "failed"]))
+        .group_by(SyncJob.sync_type, SyncJob.status)
+    ).all()
+
+    throughput: dict[str, dict[str, Any]] = {}
+    for sync_type, status, count, avg_seconds, reclaimed in finished:
+        entry = throughput.setdefault(sync_type, {"completed": 0, "failed": 0, "reclaimed": 0})
+        entry[status] = count
+        entry["reclaimed"] += reclaimed
+        if status == "completed":
+            entry["avg_duration_seconds"] = round(float(avg_seconds or 0), 1)
+
+    orchestrator = get_sync_orchestrator()
+    return {
+        "queue_depth": sum(row[1] for row in queue),
+        "queue_by_type": {row[0]: row[1] for row in queue},
+        "oldest_due_seconds": (
+            round((datetime.now(UTC) - oldest_due).total_seconds(), 1) if oldest_due is not None else None
+        ),
+        "running": sum(row[1] for row in running),
+        "running_by_type": {row[0]: row[1] for row in running},
+        "last_hour": {
+            "completed": sum(t["completed"] for t in throughput.values()),
+            "failed": sum(t["failed"] for t in throughput.values()),
+            "reclaimed": sum(t["reclaimed"] for t in throughput.values()),
+            "by_type": throughput,
+        },
+        "limits": {
+            "global_concurrency": SYNC_GLOBAL_CONCURRENCY,
+            "per_tenant_concurrency": SYNC_PER_TENANT_CONCURRENCY,
+            "lease_seconds": SYNC_LEASE_SECONDS,
+        },
+        "worker": {
+            "id": worker_id(),
+            "orchestrator_running": orchestrator.is_running,
+            "busy": orchestrator.busy_workers(),
+            "capacity": orchestrator.workers,
+        },
+    }
+
+
+# Global orchestrator instance
+_orchestrator: SyncOrchestrator | None = None
+
+
+def get_sync_orchestrator() -> SyncOrchestrator:
+    """Get the global sync orchestrator."""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = SyncOrchestrator()
+    return _orchestrator
+
+
+async def start_sync_orchestrator() -> None:
+    """Start the global sync orchestrator."""
+    await get_sync_orchestrator().start()
+
+
+async def stop_sync_orchestrator() -> None:
+    """Stop the global sync orchestrator."""
+    await get_sync_orchestrator().stop()
@@ -0,0 +1,150 @@
+"""Batched writer for webhook_delivery_log rows.
+
+Webhook senders used to open a database session per delivery attempt just to
+merge one WebhookDeliveryLog row. Under load that costs one round trip (plus a
+SELECT from ``session.merge``) per attempt. This writer buffers rows in memory,
+keyed by log id so that later states of the same delivery ("retrying" followed
+by "success") overwrite earlier ones, and flushes them with a single
+``INSERT ... ON CONFLICT DO UPDATE`` per batch from a background thread.
+"""
+
+import atexit
+import logging
+import threading
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import WebhookDeliveryLog
+
+logger = logging.getLogger(__name__)
+
+# Columns written by the writer. created_at is left to the server default.
+_LOG_COLUMNS = (
+    "id",
+    "tenant_id",
+    "principal_id",
+    "media_buy_id",
+    "webhook_url",
+    "task_type",
+    "sequence_number",
+    "notification_type",
+    "attempt_count",
+    "status",
+    "http_status_code",
+    "error_message",
+    "payload_size_bytes",
+    "response_time_ms",
+    "completed_at",
+    "next_retry_at",
+)
+
+
+class WebhookDeliveryLogWriter:
+    """Thread-safe buffer that writes WebhookDeliveryLog rows in batches."""
+
+    def __init__(self, batch_size: int = 100, flush_interval_seconds: float = 1.0):
+        """Initialize writer.
+
+        Args:
+            batch_size: Number of pending rows that triggers an immediate flush
+            flush_interval_seconds: Maximum time a row waits in the buffer
+        """
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+        atexit.register(self.close)
+
+    def record(self, **fields: Any) -> None:
+        """Queue a log row for writing.
+
+        Rows sharing an ``id`` are coalesced; the most recent state wins.
+
+        Args:
+            **fields: WebhookDeliveryLog column values (``id`` is required)
+        """
+        row: dict[str, Any] = {column: fields.get(column) for column in _LOG_COLUMNS}
+        with self._lock:
+            self._pending[row["id"]] = row
+            pending_count = len(self._pending)
+            self._ensure_thread()
+
+        if pending_count >= self.batch_size:
+            self._wakeup.set()
+
+    def pending_count(self) -> int:
+        """Return the number of rows waiting to be written."""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """Write all pending rows in one statement.
+
+        Returns:
+            Number of rows written (0 if nothing was pending or the write failed)
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                rows = list(self._pending.values())
+                self._pending.clear()
+
+            try:
+                stmt = insert(WebhookDeliveryLog)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[WebhookDeliveryLog.id],
+                    set_={column: stmt.excluded[column] for column in _LOG_COLUMNS if column != "id"},
+                )
+                with get_db_session() as session:
+                    session.execute(stmt, rows)
+                    session.commit()
+                return len(rows)
+            except Exception as e:
+                logger.error(f"Failed to write {len(rows)} webhook delivery log rows: {e}")
+                return 0
+
+    def close(self) -> None:
+        """Stop the background thread and write anything still pending."""
+        self._stopped = True
+        self._wakeup.set()
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self.flush()
+
+    def _ensure_thread(self) -> None:
+        """Start the flush thread on first use (caller holds ``self._lock``)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="webhook-delivery-log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Background loop: flush on interval or when the batch fills up."""
+        while not self._stopped:
+            self._wakeup.wait(timeout=self.flush_interval_seconds)
+            self._wakeup.clear()
+            self.flush()
+
+
+# Global writer instance
+_log_writer: WebhookDeliveryLogWriter | None = None
+_log_writer_lock = threading.Lock()
+
+
+def get_webhook_delivery_log_writer() -> WebhookDeliveryLogWriter:
+    """Get or create the global webhook delivery log writer."""
+    global _log_writer
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = WebhookDeliveryLogWriter()
+        return _log_writer
@@ -5,7 +5,7 @@ This service implements the AdCP webhook specification from PR #86:
 - Circuit breaker pattern (CLOSED/OPEN/HALF_OPEN states) for fault tolerance
 - Exponential backoff with jitter for retry logic
 - Replay attack prevention with 5-minute timestamp window
-- Bounded queues (1000 webhooks per endpoint)
+- Durable delivery through the webhook outbox (see webhook_outbox.py)
 - Support for is_adjusted flag for late-arriving data
 - Per-endpoint isolation to prevent cascading failures
 """
@@ -15,10 +15,7 @@ import hashlib
 import hmac
 import json
 import logging
-import random
 import threading
-import time
-from collections import deque
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
@@ -29,6 +26,19 @@ from adcp import get_adcp_version
 logger = logging.getLogger(__name__)
 
 
+class WebhookRejectedError(Exception):
+    """The endpoint permanently rejected a delivery, so retrying it cannot succeed."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def is_permanent_rejection(status_code: int) -> bool:
+    """True for 4xx responses except 408 and 429, which ask the sender to try again later."""
+    return 400 <= status_code < 500 and status_code not in (408, 429)
+
+
 class CircuitState(Enum):
     """Circuit breaker states."""
 
@@ -121,74 +131,21 @@ class CircuitBreaker:
                 logger.warning("Circuit breaker reopened (recovery test failed)")
 
 
-class WebhookQueue:
-    """Bounded queue for webhook delivery per endpoint."""
-
-    def __init__(self, max_size: int = 1000):
-        """Initialize webhook queue.
-
-        Args:
-            max_size: Maximum number of webhooks in queue
-        """
-        self.max_size = max_size
-        self.queue: deque = deque(maxlen=max_size)
-        self._lock = threading.Lock()
-        self._dropped_count = 0
-
-    def enqueue(self, webhook_data: dict[str, Any]) -> bool:
-        """Add webhook to queue.
-
-        Args:
-            webhook_data: Webhook payload and metadata
-
-        Returns:
-            True if enqueued, False if queue is full
-        """
-        with self._lock:
-            if len(self.queue) >= self.max_size:
-                self._dropped_count += 1
-                logger.warning(
-                    f"Webhook queue full ({self.max_size}), dropping webhook (total dropped: {self._dropped_count})"
-                )
-                return False
-
-            self.queue.append(webhook_data)
-            return True
-
-    def dequeue(self) -> dict[str, Any] | None:
-        """Remove and return oldest webhook from queue.
-
-        Returns:
-            Webhook data or None if queue is empty
-        """
-        with self._lock:
-            if self.queue:
-                return self.queue.popleft()
-            return None
-
-    def size(self) -> int:
-        """Get current queue size.
-
-        Returns:
-            Number of webhooks in queue
-        """
-        with self._lock:
-            return len(self.queue)
-
-
 class WebhookDeliveryService:
     """Webhook delivery service with enhanced security and reliability features.
 
     Implements AdCP webhook specification from PR #86 with HMAC-SHA256 signatures,
     circuit breakers, exponential backoff, and replay attack prevention.
+
+    send_delivery_webhook writes one webhook outbox row per configured endpoint;
+    WebhookOutboxDispatcher owns retries and circuit breakers and calls back into
+    deliver_payload for each attempt.
     """
 
     def __init__(self) -> None:
         """Initialize enhanced webhook delivery service."""
         self._sequence_numbers: dict[str, int] = {}  # Track sequence per media buy
         self._lock = threading.Lock()  # Protect shared state
-        self._circuit_breakers: dict[str, CircuitBreaker] = {}  # Per-endpoint circuit breakers
-        self._queues: dict[str, WebhookQueue] = {}  # Per-endpoint bounded queues
 
         # Register graceful shutdown
         atexit.register(self._shutdown)
@@ -297,7 +254,7 @@ class WebhookDeliveryService:
                 f"[{notification_type}{'|adjusted' if is_adjusted else ''}]"
             )
 
-            # Send webhook with enhanced security and reliability
+            # Queue webhook for durable delivery
             success = self._send_webhook_enhanced(
                 tenant_id=tenant_id,
                 principal_id=principal_id,
@@ -352,7 +309,7 @@ class WebhookDeliveryService:
         media_buy_id: str,
         delivery_payload: dict[str, Any],
     ) -> bool:
-        """Send webhook with enhanced security and reliability features.
+        """Queue webhook in the outbox for every active endpoint of the principal.
 
         Args:
             tenant_id: Tenant identifier
@@ -361,7 +318,7 @@ class WebhookDeliveryService:
             delivery_payload: AdCP delivery payload
 
         Returns:
-            True if sent successfully, False otherwise
+            True if queued for at least one endpoint, False otherwise
         """
         try:
             # Get webhook configurations
@@ -369,6 +326,7 @@ class WebhookDeliveryService:
 
             from src.core.database.database_session import get_db_session
             from src.core.database.models import PushNotificationConfig
+            from src.services.webhook_outbox import OUTBOX_KIND_DELIVERY_REPORT, enqueue_webhook
 
             with get_db_session() as db:
                 stmt = select(PushNotificationConfig).filter_by(
@@ -380,82 +338,52 @@ class WebhookDeliveryService:
                     logger.debug(f"⚠️ No webhooks configured for {tenant_id}/{principal_id}")
                     return False
 
-                # Send to all configured webhooks
-                sent_count = 0
                 for config in configs:
-                    endpoint_key = f"{tenant_id}:{config.url}"
-
-                    # Get or create circuit breaker for this endpoint
-                    if endpoint_key not in self._circuit_breakers:
-                        self._circuit_breakers[endpoint_key] = CircuitBreaker()
-
-                    # Get or create queue for this endpoint
-                    if endpoint_key not in self._queues:
-                        self._queues[endpoint_key] = WebhookQueue(max_size=1000)
-
-                    circuit_breaker = self._circuit_breakers[endpoint_key]
-                    queue = self._queues[endpoint_key]
-
-                    # Check circuit breaker
-                    if not circuit_breaker.can_attempt():
-                        logger.warning(f"⚠️ Circuit breaker OPEN for {config.url}, skipping webhook delivery")
-                        continue
-
-                    # Add to queue (bounded)
-                    webhook_data = {
-                        "config": config,
-                        "payload": delivery_payload,
-                        "timestamp": datetime.now(UTC),
-                    }
-
-                    if not queue.enqueue(webhook_data):
-                        logger.warning(f"⚠️ Queue full for {config.url}, webhook dropped")
-                        continue
-
-                    # Deliver from queue with enhanced features
-                    if self._deliver_with_backoff(endpoint_key, circuit_breaker, queue):
-                        sent_count += 1
+                    enqueue_webhook(
+                        db,
+                        kind=OUTBOX_KIND_DELIVERY_REPORT,
+                        url=config.url,
+                        payload=delivery_payload,
+                        tenant_id=tenant_id,
+                        principal_id=principal_id,
+                        # Credentials are read from the config when the row is sent
+                        delivery_config={"push_notification_config_id": config.id},
+                        event_metadata={"task_type": "delivery_report", "media_buy_id": media_buy_id},
+                    )
+                db.commit()
 
-                if sent_count > 0:
-                    logger.debug(f"✅ Delivery webhook sent to {sent_count} endpoint(s)")
-                    return True
-                else:
-                    logger.warning("⚠️ Failed to deliver webhook to any endpoint")
-                    return False
+                logger.debug(f"✅ Delivery webhook queued for {len(configs)} endpoint(s)")
+                return True
 
         except Exception as e:
             logger.error(f"❌ Error in webhook delivery: {e}", exc_info=True)
             return False
 
-    def _deliver_with_backoff(
+    def deliver_payload(
         self,
-        endpoint_key: str,
-        circuit_breaker: CircuitBreaker,
-        queue: WebhookQueue,
+        url: str,
+        payload: dict[str, Any],
+        authentication_type: str | None = None,
+        authentication_token: str | None = None,
+        webhook_secret: str | None = None,
     ) -> bool:
-        """Deliver webhook with exponential backoff and jitter.
+        """Make a single signed delivery attempt (called by the webhook outbox dispatcher).
 
         Args:
-            endpoint_key: Unique endpoint identifier
-            circuit_breaker: Circuit breaker for this endpoint
-            queue: Webhook queue for this endpoint
+            url: Webhook endpoint URL
+            payload: AdCP delivery payload
+            authentication_type: "bearer" to send authentication_token as a Bearer token
+            authentication_token: Bearer token
+            webhook_secret: HMAC-SHA256 secret (min 32 characters)
 
         Returns:
-            True if delivered successfully, False otherwise
-        """
-        max_retries = 3
-        base_delay = 1.0  # Initial delay in seconds
+            True if the endpoint returned 2xx, False for failures worth retrying
 
-        webhook_data = queue.dequeue()
-        if not webhook_data:
-            return False
-
-        config = webhook_data["config"]
-        payload = webhook_data["payload"]
-        timestamp = webhook_data["timestamp"].isoformat()
-
-        # Generate HMAC signature if webhook secret is configured
-        webhook_secret = getattr(config, "webhook_secret", None)
+        Raises:
+            WebhookRejectedError: If the endpoint permanently rejected the delivery (4xx)
+        """
+        # Signed at send time so X-ADCP-Timestamp stays inside the receiver's replay window
+        timestamp = datetime.now(UTC).isoformat()
         headers = {
             "Content-Type": "application/json",
             "User-Agent": "AdCP-Sales-Agent/2.3 (Enhanced Webhooks)",
@@ -464,54 +392,32 @@ class WebhookDeliveryService:
 
         if webhook_secret:
             if not self._verify_secret_strength(webhook_secret):
-                logger.warning(f"⚠️ Webhook secret for {config.url} is too weak (min 32 characters required)")
+                logger.warning(f"⚠️ Webhook secret for {url} is too weak (min 32 characters required)")
             else:
                 signature = self._generate_hmac_signature(payload, webhook_secret, timestamp)
                 headers["X-ADCP-Signature"] = signature
 
         # Add authentication
-        if config.authentication_type == "bearer" and config.authentication_token:
-            headers["Authorization"] = f"Bearer {config.authentication_token}"
-
-        # Exponential backoff with jitter
-        for attempt in range(max_retries):
-            try:
-                # Calculate delay with exponential backoff and jitter
-                if attempt > 0:
-                    # Base delay * 2^attempt + random jitter (0-1 seconds)
-                    delay = (base_delay * (2**attempt)) + random.uniform(0, 1)
-                    logger.debug(f"Retrying webhook delivery after {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(delay)
-
-                # Send webhook
-                with httpx.Client(timeout=10.0) as client:
-                    response = client.post(
-                        config.url,
-                        json=payload,
-                        headers=headers,
-                    )
+        if authentication_type == "bearer" and authentication_token:
+            headers["Authorization"] = f"Bearer {authentication_token}"
 
-                    if 200 <= response.status_code < 300:
-                        logger.debug(f"Webhook delivered to {config.url} (status: {response.status_code})")
-                        circuit_breaker.record_success()
-                        return True
+        try:
+            with httpx.Client(timeout=10.0) as client:
+                response = client.post(url, json=payload, headers=headers)
 
-                    logger.warning(
-                        f"Webhook delivery to {config.url} returned "
-                        f"status {response.status_code} "
-                        f"(attempt: {attempt + 1}/{max_retries})"
-                    )
+            if 200 <= response.status_code < 300:
+                logger.debug(f"Webhook delivered to {url} (status: {response.status_code})")
+                return True
 
-            except httpx.TimeoutException:
-                logger.warning(f"Webhook delivery to {config.url} timed out (attempt: {attempt + 1}/{max_retries})")
-            except httpx.RequestError as e:
-                logger.warning(f"Webhook delivery to {config.url} failed: {e} (attempt: {attempt + 1}/{max_retries})")
-            except Exception as e:
-                logger.error(f"Unexpected error delivering to {config.url}: {e}", exc_info=True)
-                break
+            logger.warning(f"Webhook delivery to {url} returned status {response.status_code}")
+            if is_permanent_rejection(response.status_code):
+                raise WebhookRejectedError(response.status_code, f"HTTP {response.status_code}")
+
+        except httpx.TimeoutException:
+            logger.warning(f"Webhook delivery to {url} timed out")
+        except httpx.RequestError as e:
+            logger.warning(f"Webhook delivery to {url} failed: {e}")
 
-        # All retries failed
-        circuit_breaker.record_failure()
         return False
 
     def reset_sequence(self, media_buy_id: str):
@@ -530,15 +436,9 @@ class WebhookDeliveryService:
         Args:
             endpoint_url: Webhook endpoint URL
         """
-        # Find matching endpoint keys
-        for key in list(self._circuit_breakers.keys()):
-            if endpoint_url in key:
-                circuit_breaker = self._circuit_breakers[key]
-                with circuit_breaker._lock:
-                    circuit_breaker.state = CircuitState.CLOSED
-                    circuit_breaker.failure_count = 0
-                    circuit_breaker.success_count = 0
-                logger.info(f"Circuit breaker reset for {endpoint_url}")
+        from src.services.webhook_outbox import get_webhook_outbox_dispatcher
+
+        get_webhook_outbox_dispatcher().reset_circuit_breaker(endpoint_url)
 
     def get_circuit_breaker_state(self, endpoint_url: str) -> tuple[CircuitState, int]:
         """Get circuit breaker state for an endpoint.
@@ -549,11 +449,9 @@ class WebhookDeliveryService:
         Returns:
             Tuple of (state, failure_count)
         """
-        for key in self._circuit_breakers.keys():
-            if endpoint_url in key:
-                circuit_breaker = self._circuit_breakers[key]
-                return (circuit_breaker.state, circuit_breaker.failure_count)
-        return (CircuitState.CLOSED, 0)
+        from src.services.webhook_outbox import get_webhook_outbox_dispatcher
+
+        return get_webhook_outbox_dispatcher().get_circuit_breaker_state(endpoint_url)
 
     def _shutdown(self):
         """Graceful shutdown handler."""
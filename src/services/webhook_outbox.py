@@ -0,0 +1,373 @@
+"""Durable transactional outbox for outbound webhooks.
+
+Webhooks used to be sent from three places with three different durability
+stories: WebhookDeliveryService kept in-memory per-endpoint deques that dropped
+on overflow and vanished on restart, ProtocolWebhookService posted inline, and
+ContextManager posted while holding the workflow session. All of them now write
+a WebhookOutbox row in the same transaction as the state change and this
+module's dispatcher delivers it:
+
+- Rows are claimed with ``FOR UPDATE SKIP LOCKED`` so several dispatchers
+  (processes) can drain the table concurrently.
+- Only the oldest unfinished row per endpoint is claimable, which preserves
+  delivery order per endpoint while different endpoints proceed in parallel.
+- Each endpoint has a CircuitBreaker; while it is open, the endpoint's head row
+  is pushed back without consuming an attempt.
+- Failed attempts are rescheduled from RETRY_SCHEDULE_SECONDS (with jitter)
+  until max_attempts, after which the row is parked as "failed".
+- Claims are leases: rows stuck "in_flight" past locked_until (crashed worker)
+  become claimable again. The claim loop, workers, lease release and purge
+  are shared with the creative review queue (LeasedQueueWorkerPool).
+- Credentials are never copied into the outbox in plaintext: saved push
+  notification configs are referenced by id and re-read at send time, and
+  tokens from request-scoped configs are stored encrypted.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, inspect, or_, select
+from sqlalchemy.orm import Session, aliased
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import PushNotificationConfig, WebhookOutbox
+from src.core.utils.encryption import decrypt_api_key, encrypt_api_key
+from src.services.leased_queue import LeasedQueueWorkerPool
+from src.services.webhook_delivery_service import CircuitBreaker, CircuitState, WebhookRejectedError
+
+logger = logging.getLogger(__name__)
+
+# Outbox row kinds - determine which service formats and signs the request
+OUTBOX_KIND_PROTOCOL = "protocol"  # A2A/MCP push notifications (ProtocolWebhookService)
+OUTBOX_KIND_DELIVERY_REPORT = "delivery_report"  # AdCP delivery webhooks (WebhookDeliveryService)
+
+# Delay before attempt N+1 after N failed attempts (last value repeats)
+RETRY_SCHEDULE_SECONDS = (5, 30, 120, 600, 1800, 3600)
+
+DEFAULT_MAX_ATTEMPTS = 8
+
+# Dispatcher tuning - configurable via env vars
+OUTBOX_WORKERS = int(os.getenv("WEBHOOK_OUTBOX_WORKERS") or "16")
+OUTBOX_POLL_INTERVAL_SECONDS = float(os.getenv("WEBHOOK_OUTBOX_POLL_INTERVAL") or "1.0")
+OUTBOX_LEASE_SECONDS = int(os.getenv("WEBHOOK_OUTBOX_LEASE_SECONDS") or "120")
+OUTBOX_RETENTION_DAYS = int(os.getenv("WEBHOOK_OUTBOX_RETENTION_DAYS") or "7")
+
+
+def make_endpoint_key(tenant_id: str | None, url: str) -> str:
+    """Build the per-endpoint key used for ordering and circuit breaking."""
+    return f"{tenant_id or ''}:{url}"
+
+
+def delivery_config_for(push_notification_config: PushNotificationConfig) -> dict[str, Any]:
+    """Build an outbox delivery_config that carries no plaintext credentials.
+
+    A saved config is referenced by id, so its credentials are read (and any
+    rotation or deactivation honoured) when the row is sent. A config built from
+    request data has no row to reference; its token is stored encrypted.
+    """
+    state = inspect(push_notification_config, raiseerr=False)
+    if state is not None and state.persistent:
+        return {"push_notification_config_id": push_notification_config.id}
+
+    token = push_notification_config.authentication_token
+    return {
+        "authentication_type": push_notification_config.authentication_type,
+        "authentication_token_encrypted": encrypt_api_key(token) if token else None,
+    }
+
+
+def load_delivery_credentials(delivery_config: dict[str, Any]) -> dict[str, str | None]:
+    """Resolve a row's delivery_config into authentication_type, authentication_token and webhook_secret.
+
+    Raises:
+        ValueError: If the referenced push notification config was deleted or deactivated
+    """
+    config_id = delivery_config.get("push_notification_config_id")
+    if config_id:
+        with get_db_session() as session:
+            config = session.get(PushNotificationConfig, config_id)
+            if config is None or not config.is_active:
+                raise ValueError(f"Push notification config {config_id} is no longer active")
+            return {
+                "authentication_type": config.authentication_type,
+                "authentication_token": config.authentication_token,
+                "webhook_secret": config.webhook_secret,
+            }
+
+    encrypted_token = delivery_config.get("authentication_token_encrypted")
+    return {
+        "authentication_type": delivery_config.get("authentication_type"),
+        "authentication_token": decrypt_api_key(encrypted_token) if encrypted_token else None,
+        "webhook_secret": None,
+    }
+
+
+def enqueue_webhook(
+    session: Session,
+    *,
+    kind: str,
+    url: str,
+    payload: dict[str, Any],
+    tenant_id: str | None = None,
+    principal_id: str | None = None,
+    delivery_config: dict[str, Any] | None = None,
+    event_metadata: dict[str, Any] | None = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> WebhookOutbox:
+    """Add a webhook to the outbox in the caller's transaction.
+
+    The caller owns the session and commits it together with the state change
+    that produced the webhook; nothing is sent until that commit succeeds.
+
+    Args:
+        session: Active database session (not committed here)
+        kind: OUTBOX_KIND_PROTOCOL or OUTBOX_KIND_DELIVERY_REPORT
+        url: Destination webhook URL
+        payload: JSON-serializable request body
+        tenant_id: Owning tenant (part of the endpoint key)
+        principal_id: Owning principal
+        delivery_config: Credential reference from delivery_config_for (never plaintext secrets)
+        event_metadata: Sender metadata passed back to the delivering service
+        max_attempts: Attempts before the row is parked as failed
+
+    Returns:
+        The pending WebhookOutbox row
+    """
+    entry = WebhookOutbox(
+        tenant_id=tenant_id,
+        principal_id=principal_id,
+        kind=kind,
+        endpoint_url=url,
+        endpoint_key=make_endpoint_key(tenant_id, url),
+        payload=payload,
+        delivery_config=delivery_config,
+        event_metadata=event_metadata,
+        status="pending",
+        attempt_count=0,
+        max_attempts=max_attempts,
+        next_attempt_at=datetime.now(UTC),
+    )
+    session.add(entry)
+    return entry
+
+
+class WebhookOutboxDispatcher(LeasedQueueWorkerPool):
+    """Drains the webhook outbox with a pool of async delivery workers."""
+
+    model = WebhookOutbox
+    description = "Webhook outbox dispatcher"
+    retry_schedule_seconds = RETRY_SCHEDULE_SECONDS
+    purge_statuses = ("delivered",)
+    finished_at_attribute = "delivered_at"
+    retention_days = OUTBOX_RETENTION_DAYS
+    # Rows are already serialized per endpoint, so keep a second row per worker ready
+    claim_ahead = 2
+
+    def __init__(
+        self,
+        worker_count: int = OUTBOX_WORKERS,
+        poll_interval_seconds: float = OUTBOX_POLL_INTERVAL_SECONDS,
+        lease_seconds: int = OUTBOX_LEASE_SECONDS,
+    ) -> None:
+        super().__init__(worker_count, poll_interval_seconds, lease_seconds)
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+
+    def get_circuit_breaker(self, endpoint_key: str) -> CircuitBreaker:
+        """Get or create the circuit breaker for an endpoint."""
+        if endpoint_key not in self._circuit_breakers:
+            self._circuit_breakers[endpoint_key] = CircuitBreaker()
+        return self._circuit_breakers[endpoint_key]
+
+    def reset_circuit_breaker(self, endpoint_url: str) -> None:
+        """Manually close the circuit breaker(s) for an endpoint URL."""
+        for key, circuit_breaker in self._circuit_breakers.items():
+            if endpoint_url in key:
+                with circuit_breaker._lock:
+                    circuit_breaker.state = CircuitState.CLOSED
+                    circuit_breaker.failure_count = 0
+                    circuit_breaker.success_count = 0
+                logger.info(f"Circuit breaker reset for {endpoint_url}")
+
+    def get_circuit_breaker_state(self, endpoint_url: str) -> tuple[CircuitState, int]:
+        """Get (state, failure_count) for the first circuit breaker matching an endpoint URL."""
+        for key, circuit_breaker in self._circuit_breakers.items():
+            if endpoint_url in key:
+                return (circuit_breaker.state, circuit_breaker.failure_count)
+        return (CircuitState.CLOSED, 0)
+
+    def claim_batch(self, limit: int) -> list[dict[str, Any]]:
+        """Lease up to ``limit`` due rows, at most one (the oldest) per endpoint.
+
+        Returns:
+            Plain-dict snapshots of the claimed rows
+        """
+        now = datetime.now(UTC)
+        older = aliased(WebhookOutbox)
+        blocked_by_older = (
+            select(older.id)
+            .where(
+                older.endpoint_key == WebhookOutbox.endpoint_key,
+                older.id < WebhookOutbox.id,
+                older.status.in_(("pending", "in_flight")),
+            )
+            .exists()
+        )
+        claimable = or_(
+            and_(WebhookOutbox.status == "pending", WebhookOutbox.next_attempt_at <= now),
+            and_(WebhookOutbox.status == "in_flight", WebhookOutbox.locked_until < now),
+        )
+
+        with get_db_session() as session:
+            stmt = (
+                select(WebhookOutbox)
+                .where(claimable, ~blocked_by_older)
+                .order_by(WebhookOutbox.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            rows = session.scalars(stmt).all()
+
+            claimed = []
+            for row in rows:
+                row.status = "in_flight"
+                row.locked_by = self.worker_id
+                row.locked_until = self.lease_expiry(now)
+                claimed.append(
+                    {
+                        "id": row.id,
+                        "kind": row.kind,
+                        "tenant_id": row.tenant_id,
+                        "principal_id": row.principal_id,
+                        "endpoint_url": row.endpoint_url,
+                        "endpoint_key": row.endpoint_key,
+                        "payload": row.payload,
+                        "delivery_config": row.delivery_config or {},
+                        "event_metadata": row.event_metadata or {},
+                        "attempt_count": row.attempt_count,
+                        "max_attempts": row.max_attempts,
+                    }
+                )
+            session.commit()
+
+        if claimed:
+            logger.debug(f"Claimed {len(claimed)} webhook outbox rows")
+        return claimed
+
+    async def process_item(self, row: dict[str, Any]) -> None:
+        """Deliver one claimed row and record the outcome."""
+        circuit_breaker = self.get_circuit_breaker(row["endpoint_key"])
+
+        if not circuit_breaker.can_attempt():
+            logger.warning(f"⚠️ Circuit breaker OPEN for {row['endpoint_url']}, deferring outbox row {row['id']}")
+            await asyncio.to_thread(
+                self._reschedule, row["id"], timedelta(seconds=circuit_breaker.timeout_seconds), None, False
+            )
+            return
+
+        try:
+            delivered = await self._deliver(row)
+            error = None if delivered else "Delivery attempt failed"
+        except WebhookRejectedError as e:
+            # The endpoint answered, so the circuit breaker is left alone; retrying cannot help
+            logger.error(
+                f"❌ Webhook outbox row {row['id']} to {row['endpoint_url']} rejected with HTTP {e.status_code}, "
+                "not retrying"
+            )
+            await asyncio.to_thread(self._mark_failed, row["id"], f"{type(e).__name__}: {e}")
+            return
+        except Exception as e:
+            delivered = False
+            error = f"{type(e).__name__}: {e}"
+
+        if delivered:
+            circuit_breaker.record_success()
+            await asyncio.to_thread(self._mark_delivered, row["id"])
+            return
+
+        circuit_breaker.record_failure()
+        attempt_count = row["attempt_count"] + 1
+        if attempt_count >= row["max_attempts"]:
+            logger.error(
+                f"❌ Webhook outbox row {row['id']} to {row['endpoint_url']} failed after {attempt_count} attempts"
+            )
+            await asyncio.to_thread(self._mark_failed, row["id"], error)
+        else:
+            delay = self.retry_delay(attempt_count)
+            logger.warning(
+                f"Webhook outbox row {row['id']} to {row['endpoint_url']} failed "
+                f"(attempt {attempt_count}/{row['max_attempts']}), retrying in {delay.total_seconds():.0f}s"
+            )
+            await asyncio.to_thread(self._reschedule, row["id"], delay, error, True)
+
+    async def _deliver(self, row: dict[str, Any]) -> bool:
+        """Send a row through the service that owns its payload format.
+
+        Returns False for failures worth retrying; raises WebhookRejectedError when the
+        endpoint permanently rejected the payload.
+        """
+        credentials = await asyncio.to_thread(load_delivery_credentials, row["delivery_config"])
+
+        if row["kind"] == OUTBOX_KIND_PROTOCOL:
+            from src.services.protocol_webhook_service import get_protocol_webhook_service
+
+            push_notification_config = PushNotificationConfig(
+                id=f"outbox_{row['id']}",
+                tenant_id=row["tenant_id"] or "",
+                principal_id=row["principal_id"] or "",
+                url=row["endpoint_url"],
+                authentication_type=credentials["authentication_type"],
+                authentication_token=credentials["authentication_token"],
+                is_active=True,
+            )
+            return await get_protocol_webhook_service().send_notification(
+                push_notification_config=push_notification_config,
+                payload=row["payload"],
+                metadata=row["event_metadata"],
+                max_attempts=1,
+                raise_on_rejection=True,
+            )
+
+        if row["kind"] == OUTBOX_KIND_DELIVERY_REPORT:
+            from src.services.webhook_delivery_service import webhook_delivery_service
+
+            return await asyncio.to_thread(
+                webhook_delivery_service.deliver_payload,
+                url=row["endpoint_url"],
+                payload=row["payload"],
+                **credentials,
+            )
+
+        raise ValueError(f"Unknown webhook outbox kind: {row['kind']}")
+
+    def _mark_delivered(self, row_id: int) -> None:
+        self._release(row_id, "delivered", delivered_at=datetime.now(UTC), last_error=None)
+
+    def _mark_failed(self, row_id: int, error: str | None) -> None:
+        self._release(row_id, "failed", last_error=error)
+
+
+# Global dispatcher instance
+_dispatcher: WebhookOutboxDispatcher | None = None
+
+
+def get_webhook_outbox_dispatcher() -> WebhookOutboxDispatcher:
+    """Get or create global dispatcher instance."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = WebhookOutboxDispatcher()
+    return _dispatcher
+
+
+async def start_webhook_outbox_dispatcher():
+    """Start the webhook outbox dispatcher (called at application startup)."""
+    dispatcher = get_webhook_outbox_dispatcher()
+    await dispatcher.start()
+
+
+async def stop_webhook_outbox_dispatcher():
+    """Stop the webhook outbox dispatcher (called at application shutdown)."""
+    dispatcher = get_webhook_outbox_dispatcher()
+    await dispatcher.stop()
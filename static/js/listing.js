@@ -0,0 +1,63 @@
+/**
+ * Incremental loading for server-side paginated admin listings.
+ *
+ * Markup (see templates/components/listing_pagination.html):
+ * - [data-listing-body="<name>"]: container whose children are listing items
+ * - a[data-listing-more]: link to the next page (works without JavaScript)
+ *
+ * Clicking "Load more" fetches the next page, appends the children of every
+ * [data-listing-body] in it to the matching container on this page, and replaces
+ * the link with the next page's link (or removes it on the last page).
+ */
+
+(function() {
+    async function loadMore(link) {
+        if (link.dataset.loading === 'true') {
+            return;
+        }
+        link.dataset.loading = 'true';
+        const label = link.textContent;
+        link.textContent = 'Loading…';
+
+        try {
+            // The header lets views skip data that only the full page needs
+            const response = await fetch(link.href, {
+                credentials: 'same-origin',
+                headers: { 'X-Listing-Request': 'load-more' }
+            });
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            const page = new DOMParser().parseFromString(await response.text(), 'text/html');
+
+            page.querySelectorAll('[data-listing-body]').forEach(body => {
+                const target = document.querySelector(`[data-listing-body="${body.dataset.listingBody}"]`);
+                if (target) {
+                    target.append(...Array.from(body.children).map(child => document.importNode(child, true)));
+                }
+            });
+
+            const next = page.querySelector('a[data-listing-more]');
+            if (next) {
+                link.href = next.href;
+                link.textContent = label;
+                delete link.dataset.loading;
+            } else {
+                link.closest('.listing-pagination').remove();
+            }
+            document.dispatchEvent(new CustomEvent('listing:loaded'));
+        } catch (error) {
+            console.error('Failed to load more items:', error);
+            // Fall back to regular navigation
+            window.location.href = link.href;
+        }
+    }
+
+    document.addEventListener('click', event => {
+        const link = event.target.closest('a[data-listing-more]');
+        if (link) {
+            event.preventDefault();
+            loadMore(link);
+        }
+    });
+})();
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Benchmark the keyset-paginated admin listing pages against a seeded tenant.
+
+Seeds one tenant with thousands of products, principals, creatives and workflow
+tasks, then requests each listing through the Flask test client: the first page,
+a page deep into the listing (following next_cursor), a filtered page and the
+JSON endpoint used for incremental loading. Reports p50/p95 latency and response
+size against the target, and exits non-zero if any p95 misses it.
+
+Requires a PostgreSQL database with the current schema (alembic upgrade head);
+the seeded tenant is deleted afterwards.
+
+Usage:
+    DATABASE_URL=postgresql://... python tests/benchmarks/benchmark_admin_listings.py \
+        [--rows 5000] [--iterations 20] [--target-ms 300]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import delete, insert
+
+from src.core.database.database_session import get_db_session
+from src.core.database.models import Context, Creative, Principal, Product, Tenant, WorkflowStep
+
+CREATIVE_STATUSES = ("pending_review", "approved", "rejected")
+STEP_STATUSES = ("pending", "requires_approval", "completed", "failed")
+
+
+def seed_tenant(rows: int) -> str:
+    """Create a tenant with `rows` products, creatives and workflow tasks (rows // 10 principals)."""
+    tenant_id = f"bench_{uuid.uuid4().hex[:8]}"
+    now = datetime.now(UTC)
+    principals = max(rows // 10, 1)
+
+    with get_db_session() as session:
+        session.add(
+            Tenant(
+                tenant_id=tenant_id,
+                name="Listing Benchmark",
+                subdomain=tenant_id,
+                is_active=True,
+                ad_server="mock",
+                auth_setup_mode=False,
+                auto_approve_format_ids=[],
+                human_review_required=False,
+                policy_settings={},
+                authorized_emails=["test@example.com"],
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        session.flush()
+
+        session.execute(
+            insert(Product),
+            [
+                {
+                    "tenant_id": tenant_id,
+                    "product_id": f"prod_{i:06d}",
+                    "name": f"Product {i:06d} {'video' if i % 3 == 0 else 'display'}",
+                    "format_ids": [{"agent_url": "https://creative.adcontextprotocol.org", "id": "display_300x250"}],
+                    "targeting_template": {},
+                    "delivery_type": "guaranteed" if i % 2 else "non_guaranteed",
+                    "property_tags": ["all_inventory"],
+                    "is_dynamic": i % 7 == 0,
+                }
+                for i in range(rows)
+            ],
+        )
+        session.execute(
+            insert(Principal),
+            [
+                {
+                    "tenant_id": tenant_id,
+                    "principal_id": f"prin_{i:05d}",
+                    "name": f"Advertiser {i:05d}",
+                    "platform_mappings": {"mock": {"advertiser_id": f"adv_{i}"}},
+                    "access_token": f"{tenant_id}_token_{i}",
+                }
+                for i in range(principals)
+            ],
+        )
+        session.execute(
+            insert(Creative),
+            [
+                {
+                    "tenant_id": tenant_id,
+                    "creative_id": f"cr_{i:06d}",
+                    "principal_id": f"prin_{i % principals:05d}",
+                    "name": f"Creative {i:06d}",
+                    "agent_url": "https://creative.adcontextprotocol.org",
+                    "format": "display_300x250",
+                    "status": CREATIVE_STATUSES[i % len(CREATIVE_STATUSES)],
+                    "data": {"url": f"https://example.com/{i}.png", "width": 300, "height": 250},
+                    "created_at": now - timedelta(minutes=i),
+                }
+                for i in range(rows)
+            ],
+        )
+        session.execute(
+            insert(Context),
+            [
+                {"context_id": f"{tenant_id}_ctx_{i:05d}", "tenant_id": tenant_id, "principal_id": f"prin_{i:05d}"}
+                for i in range(principals)
+            ],
+        )
+        session.execute(
+            insert(WorkflowStep),
+            [
+                {
+                    "step_id": f"{tenant_id}_step_{i:06d}",
+                    "context_id": f"{tenant_id}_ctx_{i % principals:05d}",
+                    "step_type": "approval",
+                    "tool_name": "create_media_buy",
+                    "status": STEP_STATUSES[i % len(STEP_STATUSES)],
+                    "owner": "publisher",
+                    "created_at": now - timedelta(minutes=i),
+                }
+                for i in range(rows)
+            ],
+        )
+        session.commit()
+    return tenant_id
+
+
+def delete_tenant(tenant_id: str) -> None:
+    with get_db_session() as session:
+        session.execute(delete(WorkflowStep).where(WorkflowStep.step_id.like(f"{tenant_id}_step_%")))
+        for model in (Context, Creative, Principal, Product):
+            session.execute(delete(model).where(model.tenant_id == tenant_id))
+        session.execute(delete(Tenant).where(Tenant.tenant_id == tenant_id))
+        session.commit()
+
+
+def make_client():
+    """Admin test client authenticated as a super admin (test auth mode)."""
+    os.environ["ADCP_AUTH_TEST_MODE"] = "true"
+    from src.admin.app import create_app
+
+    app, _ = create_app({"TESTING": True, "SECRET_KEY": "benchmark", "WTF_CSRF_ENABLED": False})
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["authenticated"] = True
+        sess["role"] = "super_admin"
+        sess["email"] = "test@example.com"
+        sess["user"] = {"email": "test@example.com", "role": "super_admin"}
+        sess["is_super_admin"] = True
+        sess["test_user"] = "test@example.com"
+        sess["test_user_role"] = "super_admin"
+        sess["test_user_name"] = "Benchmark Admin"
+    return client
+
+
+def deep_cursor(client, url: str, pages: int) -> str:
+    """Cursor `pages` pages into a listing, followed through the JSON endpoint."""
+    cursor = None
+    for _ in range(pages):
+        separator = "&" if "?" in url else "?"
+        response = client.get(f"{url}{separator}format=json" + (f"&cursor={cursor}" if cursor else ""))
+        cursor = response.get_json()["next_cursor"]
+        if cursor is None:
+            break
+    return cursor or ""
+
+
+def measure(client, url: str, iterations: int) -> tuple[list[float], int]:
+    """Latencies in ms and the response size of the last request."""
+    client.get(url)  # warm-up (template compilation, connection pool)
+    latencies = []
+    size = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = client.get(url)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {url} returned {response.status_code}")
+        size = len(response.data)
+    return latencies, size
+
+
+def report(label: str, latencies: list[float], size: int, target_ms: float) -> bool:
+    """Print one result line and return whether p95 met the target."""
+    p50 = statistics.median(latencies)
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    ok = p95 <= target_ms
+    print(f"  {'✅' if ok else '❌'} {label:<42} p50 {p50:7.1f}ms  p95 {p95:7.1f}ms  {size / 1024:8.1f} KB")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000, help="Products, creatives and tasks to seed")
+    parser.add_argument("--iterations", type=int, default=20, help="Requests per measured URL")
+    parser.add_argument("--target-ms", type=float, default=300.0, help="p95 latency target per request")
+    parser.add_argument("--deep-pages", type=int, default=20, help="Pages to skip for the deep-page measurement")
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("DATABASE_URL must point at a PostgreSQL database with the current schema")
+        sys.exit(1)
+
+    print(f"\n{'=' * 70}")
+    print(f"📋 ADMIN LISTINGS - {args.rows} rows per listing, target p95 {args.target_ms:.0f}ms")
+    print(f"{'=' * 70}")
+
+    start = time.perf_counter()
+    tenant_id = seed_tenant(args.rows)
+    print(f"  Seeded tenant {tenant_id} in {time.perf_counter() - start:.1f}s\n")
+
+    all_ok = True
+    try:
+        client = make_client()
+        listings = {
+            "products": f"/tenant/{tenant_id}/products/",
+            "creatives": f"/tenant/{tenant_id}/creatives/review",
+            "principals": f"/tenant/{tenant_id}/principals",
+            "workflows": f"/tenant/{tenant_id}/workflows",
+        }
+        filtered = {
+            "products": "type=dynamic&q=video",
+            "creatives": "status=approved&sort=name",
+            "principals": "q=Advertiser+004",
+            "workflows": "status=pending",
+        }
+        for name, url in listings.items():
+            cursor = deep_cursor(client, url, args.deep_pages)
+            cases = {
+                f"{name}: first page": url,
+                f"{name}: page {args.deep_pages + 1} (cursor)": f"{url}?cursor={cursor}",
+                f"{name}: filtered": f"{url}?{filtered[name]}",
+                f"{name}: JSON next page": f"{url}?format=json&cursor={cursor}",
+            }
+            for label, case_url in cases.items():
+                all_ok &= report(label, *measure(client, case_url, args.iterations), args.target_ms)
+    finally:
+        delete_tenant(tenant_id)
+
+    print(f"\n📊 Result: {'all listings within target' if all_ok else 'some listings missed the target'}")
+    sys.exit(0 if all_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
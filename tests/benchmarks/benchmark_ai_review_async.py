@@ -1,14 +1,25 @@
 #!/usr/bin/env python3
 """Benchmark script to demonstrate async AI review performance improvement.
 
-This script simulates the difference between synchronous and asynchronous AI review.
+This script simulates the difference between synchronous and asynchronous AI review,
+then measures reviews/minute through the durable review queue's asyncio worker pool
+(CreativeReviewWorkerPool) against a stub model with fixed latency.
 
 Usage:
     python tests/benchmarks/benchmark_ai_review_async.py
+    python tests/benchmarks/benchmark_ai_review_async.py --pool-only
 """
 
+import asyncio
+import sys
 import time
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# Allow running as a plain script from the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 
 def simulate_ai_review_sync(creative_id: str) -> dict:
@@ -123,8 +134,182 @@ def benchmark_async_mode(creative_count: int) -> dict:
     }
 
 
+# Stub model latency for the worker pool benchmark (scaled down like the simulations above)
+STUB_MODEL_LATENCY_SECONDS = 0.5
+
+
+def create_stub_review_model(latency: float = STUB_MODEL_LATENCY_SECONDS):
+    """Pydantic AI model that answers every review with APPROVE after ``latency`` seconds."""
+    from pydantic_ai.messages import ModelResponse, ToolCallPart
+    from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+    async def respond(messages, info: AgentInfo) -> ModelResponse:
+        await asyncio.sleep(latency)
+        return ModelResponse(
+            parts=[
+                ToolCallPart(
+                    tool_name=info.output_tools[0].name,
+                    args={"decision": "APPROVE", "reason": "Meets all criteria", "confidence": "high"},
+                )
+            ]
+        )
+
+    return FunctionModel(respond)
+
+
+def build_in_memory_pool(jobs: list[dict[str, Any]], **kwargs):
+    """CreativeReviewWorkerPool draining a list instead of the creative_review_jobs table.
+
+    claim_batch() applies the same rules as the SQL claim: round-robin across
+    tenants, at most tenant_concurrency jobs of one tenant in flight.
+    """
+    from src.services.creative_review_queue import CreativeReviewWorkerPool
+
+    class InMemoryReviewPool(CreativeReviewWorkerPool):
+        def __init__(self):
+            super().__init__(**kwargs)
+            self.pending = list(jobs)
+            self.running: dict[str, int] = defaultdict(int)
+            self.completed_at: dict[int, float] = {}
+
+        def claim_batch(self, limit: int) -> list[dict[str, Any]]:
+            position: dict[str, int] = defaultdict(int)
+            ranked = []
+            for job in self.pending:
+                position[job["tenant_id"]] += 1
+                if position[job["tenant_id"]] + self.running[job["tenant_id"]] <= self.tenant_concurrency:
+                    ranked.append((position[job["tenant_id"]], job["id"], job))
+            claimed = [job for _, _, job in sorted(ranked, key=lambda item: item[:2])[:limit]]
+            for job in claimed:
+                self.pending.remove(job)
+                self.running[job["tenant_id"]] += 1
+            return claimed
+
+        def _finish(self, job_id: int) -> None:
+            job = next(j for j in jobs if j["id"] == job_id)
+            self.running[job["tenant_id"]] -= 1
+            self.completed_at[job_id] = time.perf_counter()
+
+        def _mark_completed(self, job_id, result):
+            self._finish(job_id)
+
+        def _mark_failed(self, job_id, error):
+            self._finish(job_id)
+
+        def _reschedule(self, job_id, delay, error):
+            self._finish(job_id)
+
+        def _maybe_purge(self):
+            pass
+
+    return InMemoryReviewPool()
+
+
+async def run_worker_pool(
+    tenant_counts: dict[str, int], worker_count: int, tenant_concurrency: int, rpm: int
+) -> dict[str, Any]:
+    """Review every queued creative through the worker pool and the stub model."""
+    from src.services.ai.agents.review_agent import create_review_agent, review_creative_async
+    from src.services.creative_review_queue import ProviderRateLimiter
+
+    agent = create_review_agent(create_stub_review_model())  # type: ignore[arg-type]
+    limiter = ProviderRateLimiter(default_rpm=rpm)
+
+    async def review(job: dict[str, Any]) -> dict[str, Any]:
+        await limiter.acquire("stub")
+        result = await review_creative_async(
+            agent=agent,
+            review_criteria="Approve if brand-safe.",
+            creative_name=job["creative_id"],
+            creative_format="display_300x250",
+            promoted_offering="Running shoes",
+        )
+        return {"status": "approved" if result.decision == "APPROVE" else "pending_review"}
+
+    # Tenants queue in order, so the first tenant's bulk upload is ahead of everyone else
+    jobs = []
+    for tenant_id, count in tenant_counts.items():
+        for i in range(count):
+            job_id = len(jobs) + 1
+            jobs.append(
+                {
+                    "id": job_id,
+                    "task_id": f"task_{job_id}",
+                    "tenant_id": tenant_id,
+                    "creative_id": f"{tenant_id}_creative_{i + 1}",
+                    "attempt_count": 0,
+                    "max_attempts": 3,
+                    "created_at": None,
+                }
+            )
+
+    pool = build_in_memory_pool(
+        jobs,
+        worker_count=worker_count,
+        tenant_concurrency=tenant_concurrency,
+        poll_interval_seconds=0.01,
+        review_handler=review,
+    )
+
+    start = time.perf_counter()
+    await pool.start()
+    while len(pool.completed_at) < len(jobs):
+        await asyncio.sleep(0.01)
+    await pool.stop()
+    elapsed = time.perf_counter() - start
+
+    last_done: dict[str, float] = {}
+    for job in jobs:
+        last_done[job["tenant_id"]] = max(last_done.get(job["tenant_id"], 0.0), pool.completed_at[job["id"]] - start)
+
+    return {
+        "count": len(jobs),
+        "elapsed": elapsed,
+        "reviews_per_minute": len(jobs) / elapsed * 60,
+        "tenant_done_seconds": last_done,
+    }
+
+
+def benchmark_worker_pool() -> list[dict[str, Any]]:
+    """Benchmark the durable queue's worker pool against a stub model."""
+    print(f"\n{'=' * 70}")
+    print("🧵 WORKER POOL MODE - durable queue + asyncio workers + stub model")
+    print(f"{'=' * 70}")
+    print(f"  Stub model latency: {STUB_MODEL_LATENCY_SECONDS}s per review")
+
+    # One tenant bulk-uploads 40 creatives just before two tenants submit 3 each
+    tenant_counts = {"bulk_tenant": 40, "tenant_b": 3, "tenant_c": 3}
+    scenarios = [
+        ("4 workers (old executor size)", 4, 4, 0),
+        ("16 workers", 16, 16, 0),
+        ("16 workers, at most 4 in flight per tenant", 16, 4, 0),
+        ("16 workers, 600 rpm provider limit", 16, 16, 600),
+    ]
+
+    results = []
+    for label, workers, tenant_concurrency, rpm in scenarios:
+        result = asyncio.run(run_worker_pool(tenant_counts, workers, tenant_concurrency, rpm))
+        result["label"] = label
+        results.append(result)
+        done = result["tenant_done_seconds"]
+        print(f"\n  {label}")
+        print(
+            f"    {result['count']} reviews in {result['elapsed']:.2f}s → {result['reviews_per_minute']:.0f} reviews/minute"
+        )
+        print(
+            f"    Small tenants done after: tenant_b {done['tenant_b']:.2f}s, tenant_c {done['tenant_c']:.2f}s "
+            f"(bulk tenant {done['bulk_tenant']:.2f}s)"
+        )
+
+    return results
+
+
 def main():
     """Run benchmarks and compare results."""
+    if "--pool-only" in sys.argv:
+        benchmark_worker_pool()
+        return
+
     print("=" * 70)
     print("AI Review Performance Benchmark")
     print("=" * 70)
@@ -164,6 +349,8 @@ def main():
             print(f"  ⚠️  Synchronous mode TIMEOUT (>{60}s)")
         print("  ✅ Asynchronous mode: NO TIMEOUT (immediate response)")
 
+    benchmark_worker_pool()
+
     # Final summary
     print(f"\n{'=' * 70}")
     print("🎯 SUMMARY")
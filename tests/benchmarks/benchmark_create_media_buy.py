@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""Benchmark persisting a new media buy: one session per step vs. one unit of work.
+
+create_media_buy used to write the media buy, its packages, the workflow link and
+the creative assignments in separate sessions, re-querying each package's product
+for creative format checks and committing per package. It now buffers them in a
+MediaBuyUnitOfWork (src/core/database/media_buy_unit_of_work.py) that loads
+products and creatives in bulk, inserts packages and assignments with one
+executemany each and commits once.
+
+Both write patterns are run against a seeded tenant for media buys with 1, 10 and
+50 packages (two creatives per package). Reports p50/p95 latency, SQL statements
+and commits per media buy.
+
+Requires a PostgreSQL database with the current schema (alembic upgrade head);
+the seeded tenant and the media buys it creates are deleted afterwards.
+
+Usage:
+    DATABASE_URL=postgresql://... python tests/benchmarks/benchmark_create_media_buy.py \
+        [--packages 1,10,50] [--iterations 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import delete, event, insert, select
+
+from src.core.database.database_session import get_db_session, get_engine
+from src.core.database.media_buy_unit_of_work import media_buy_unit_of_work
+from src.core.database.models import (
+    Creative,
+    CreativeAssignment,
+    MediaBuy,
+    MediaPackage,
+    Principal,
+    Product,
+    Tenant,
+)
+
+AGENT_URL = "https://creative.adcontextprotocol.org"
+CREATIVES_PER_PACKAGE = 2
+
+
+class StatementCounter:
+    """Counts SQL statements and commits issued on the engine."""
+
+    def __init__(self):
+        self.statements = 0
+        self.commits = 0
+        engine = get_engine()
+        event.listen(engine, "before_cursor_execute", self._on_statement)
+        event.listen(engine, "commit", self._on_commit)
+
+    def _on_statement(self, *args):
+        self.statements += 1
+
+    def _on_commit(self, *args):
+        self.commits += 1
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+
+def seed_tenant(max_packages: int) -> str:
+    """Create a tenant with one principal, one product per package and two creatives per product."""
+    tenant_id = f"bench_{uuid.uuid4().hex[:8]}"
+    now = datetime.now(UTC)
+    with get_db_session() as session:
+        session.add(
+            Tenant(
+                tenant_id=tenant_id,
+                name="Create Media Buy Benchmark",
+                subdomain=tenant_id,
+                is_active=True,
+                ad_server="mock",
+                auth_setup_mode=False,
+                auto_approve_format_ids=[],
+                human_review_required=False,
+                policy_settings={},
+                authorized_emails=["test@example.com"],
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        session.flush()
+        session.add(
+            Principal(
+                tenant_id=tenant_id,
+                principal_id="prin_bench",
+                name="Benchmark Advertiser",
+                platform_mappings={"mock": {"advertiser_id": "adv_bench"}},
+                access_token=f"{tenant_id}_token",
+            )
+        )
+        session.execute(
+            insert(Product),
+            [
+                {
+                    "tenant_id": tenant_id,
+                    "product_id": f"prod_{i:03d}",
+                    "name": f"Product {i:03d}",
+                    "format_ids": [{"agent_url": AGENT_URL, "id": "display_300x250"}],
+                    "targeting_template": {},
+                    "delivery_type": "guaranteed",
+                    "property_tags": ["all_inventory"],
+                }
+                for i in range(max_packages)
+            ],
+        )
+        session.execute(
+            insert(Creative),
+            [
+                {
+                    "tenant_id": tenant_id,
+                    "creative_id": f"cr_{i:03d}_{j}",
+                    "principal_id": "prin_bench",
+                    "name": f"Creative {i:03d}/{j}",
+                    "agent_url": AGENT_URL,
+                    "format": "display_300x250",
+                    "status": "approved",
+                    "data": {"url": f"https://example.com/{i}_{j}.png", "width": 300, "height": 250},
+                }
+                for i in range(max_packages)
+                for j in range(CREATIVES_PER_PACKAGE)
+            ],
+        )
+        session.commit()
+    return tenant_id
+
+
+def delete_tenant(tenant_id: str) -> None:
+    with get_db_session() as session:
+        media_buy_ids = select(MediaBuy.media_buy_id).where(MediaBuy.tenant_id == tenant_id)
+        session.execute(delete(CreativeAssignment).where(CreativeAssignment.tenant_id == tenant_id))
+        session.execute(delete(MediaPackage).where(MediaPackage.media_buy_id.in_(media_buy_ids)))
+        for model in (MediaBuy, Creative, Principal, Product):
+            session.execute(delete(model).where(model.tenant_id == tenant_id))
+        session.execute(delete(Tenant).where(Tenant.tenant_id == tenant_id))
+        session.commit()
+
+
+def _media_buy(tenant_id: str, media_buy_id: str) -> MediaBuy:
+    start = date.today() + timedelta(days=1)
+    return MediaBuy(
+        media_buy_id=media_buy_id,
+        tenant_id=tenant_id,
+        principal_id="prin_bench",
+        order_name=f"Order-{media_buy_id}",
+        advertiser_name="Benchmark Advertiser",
+        budget=1000.0,
+        currency="USD",
+        start_date=start,
+        end_date=start + timedelta(days=30),
+        status="pending_approval",
+        raw_request={},
+    )
+
+
+def _plan(packages: int) -> list[tuple[str, str, list[str]]]:
+    """(package_id, product_id, creative_ids) for each package of one media buy."""
+    return [
+        (
+            f"pkg_{i:03d}_{uuid.uuid4().hex[:6]}",
+            f"prod_{i:03d}",
+            [f"cr_{i:03d}_{j}" for j in range(CREATIVES_PER_PACKAGE)],
+        )
+        for i in range(packages)
+    ]
+
+
+def write_per_step(tenant_id: str, packages: int) -> None:
+    """The previous pattern: one session and commit per step, product re-queried per package."""
+    media_buy_id = f"mb_{uuid.uuid4().hex[:12]}"
+    plan = _plan(packages)
+    with get_db_session() as session:
+        session.add(_media_buy(tenant_id, media_buy_id))
+        session.commit()
+    with get_db_session() as session:
+        for package_id, product_id, _ in plan:
+            session.add(
+                MediaPackage(
+                    media_buy_id=media_buy_id, package_id=package_id, package_config={"product_id": product_id}
+                )
+            )
+        session.commit()
+    with get_db_session() as session:
+        creative_ids = [creative_id for _, _, ids in plan for creative_id in ids]
+        creatives = {
+            c.creative_id: c
+            for c in session.scalars(
+                select(Creative).where(Creative.tenant_id == tenant_id, Creative.creative_id.in_(creative_ids))
+            )
+        }
+        for package_id, product_id, ids in plan:
+            session.scalars(
+                select(Product).where(Product.tenant_id == tenant_id, Product.product_id == product_id)
+            ).first()
+            for creative_id in ids:
+                if creative_id in creatives:
+                    session.add(
+                        CreativeAssignment(
+                            assignment_id=f"assign_{uuid.uuid4().hex[:12]}",
+                            tenant_id=tenant_id,
+                            media_buy_id=media_buy_id,
+                            package_id=package_id,
+                            creative_id=creative_id,
+                        )
+                    )
+            session.commit()
+
+
+def write_unit_of_work(tenant_id: str, packages: int) -> None:
+    """The current pattern: buffered writes, bulk lookups and bulk inserts, one commit."""
+    media_buy_id = f"mb_{uuid.uuid4().hex[:12]}"
+    plan = _plan(packages)
+    with media_buy_unit_of_work(tenant_id) as uow:
+        uow.add(_media_buy(tenant_id, media_buy_id))
+        for package_id, product_id, _ in plan:
+            uow.add_package(media_buy_id, package_id, {"product_id": product_id})
+        uow.load_products([product_id for _, product_id, _ in plan])
+        creatives = uow.load_creatives([creative_id for _, _, ids in plan for creative_id in ids])
+        for package_id, _, ids in plan:
+            for creative_id in ids:
+                if creative_id in creatives:
+                    uow.add_assignment(media_buy_id, package_id, creative_id)
+        uow.commit()
+
+
+def measure(
+    write: Callable[[str, int], None], tenant_id: str, packages: int, iterations: int, counter: StatementCounter
+) -> tuple[list[float], float, float]:
+    """Latencies in ms, plus statements and commits per media buy."""
+    write(tenant_id, packages)  # warm-up (connection pool, statement cache)
+    counter.reset()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        write(tenant_id, packages)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies, counter.statements / iterations, counter.commits / iterations
+
+
+def report(label: str, latencies: list[float], statements: float, commits: float) -> float:
+    """Print one result line and return p50."""
+    p50 = statistics.median(latencies)
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    print(f"  {label:<28} p50 {p50:7.1f}ms  p95 {p95:7.1f}ms  {statements:6.1f} statements  {commits:4.1f} commits")
+    return p50
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packages", default="1,10,50", help="Comma-separated package counts per media buy")
+    parser.add_argument("--iterations", type=int, default=20, help="Media buys written per case")
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("DATABASE_URL must point at a PostgreSQL database with the current schema")
+        sys.exit(1)
+
+    package_counts = [int(n) for n in args.packages.split(",")]
+
+    print(f"\n{'=' * 70}")
+    print(f"🛒 CREATE MEDIA BUY PERSISTENCE - packages {package_counts}, {args.iterations} buys per case")
+    print(f"{'=' * 70}")
+
+    tenant_id = seed_tenant(max(package_counts))
+    counter = StatementCounter()
+    try:
+        for packages in package_counts:
+            print(f"\n📦 {packages} package(s), {packages * CREATIVES_PER_PACKAGE} creative assignments")
+            before = report("session per step", *measure(write_per_step, tenant_id, packages, args.iterations, counter))
+            after = report("unit of work", *measure(write_unit_of_work, tenant_id, packages, args.iterations, counter))
+            print(f"  ⚡ {before / after:.1f}x faster (p50)")
+    finally:
+        delete_tenant(tenant_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Benchmark GAM inventory discovery memory on a synthetic network with a million targeting values.
+
+A stub CustomTargetingService pages a synthetic network's keys and values back as
+real zeep objects (built one page at a time, like the SOAP client does). The
+benchmark compares the in-memory discovery model (``discover_custom_targeting``
+with values, which keeps every record on the GAMInventoryDiscovery instance)
+against the streaming API (``iter_custom_targeting_values``), whose pages go
+straight into a writer-shaped sink and are dropped. Each mode runs in a fresh
+process; reports its peak RSS growth and throughput, and exits non-zero if the
+streaming peak misses the target.
+
+No GAM credentials or database are needed.
+
+Usage:
+    python tests/benchmarks/benchmark_gam_discovery_memory.py \
+        [--values 1000000] [--keys 20] [--target-mb 64]
+"""
+
+import argparse
+import logging
+import multiprocessing
+import re
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from zeep import xsd
+
+from src.adapters.gam_inventory_discovery import CustomTargetingValue, GAMInventoryDiscovery
+
+KEY_ID_BASE = 10_000
+
+CUSTOM_TARGETING_KEY = xsd.ComplexType(
+    xsd.Sequence(
+        [
+            xsd.Element("id", xsd.Long()),
+            xsd.Element("name", xsd.String()),
+            xsd.Element("displayName", xsd.String()),
+            xsd.Element("type", xsd.String()),
+            xsd.Element("status", xsd.String()),
+            xsd.Element("reportableType", xsd.String()),
+        ]
+    )
+)
+
+CUSTOM_TARGETING_VALUE = xsd.ComplexType(
+    xsd.Sequence(
+        [
+            xsd.Element("customTargetingKeyId", xsd.Long()),
+            xsd.Element("id", xsd.Long()),
+            xsd.Element("name", xsd.String()),
+            xsd.Element("displayName", xsd.String()),
+            xsd.Element("matchType", xsd.String()),
+            xsd.Element("status", xsd.String()),
+        ]
+    )
+)
+
+
+def page_window(statement: dict) -> tuple[int, int]:
+    """Return (limit, offset) from a PQL statement built by googleads' StatementBuilder."""
+    match = re.search(r"LIMIT (\d+) OFFSET (\d+)", statement["query"])
+    assert match, statement["query"]
+    return int(match.group(1)), int(match.group(2))
+
+
+class StubCustomTargetingService:
+    """Pages a synthetic network's keys and values the way CustomTargetingService does."""
+
+    def __init__(self, keys: int, values: int):
+        self.keys = keys
+        self.values_per_key = values // keys
+
+    def getCustomTargetingKeysByStatement(self, statement):  # noqa: N802 - GAM SOAP API
+        limit, offset = page_window(statement)
+        return {
+            "results": [
+                CUSTOM_TARGETING_KEY(
+                    id=KEY_ID_BASE + i,
+                    name=f"key_{i}",
+                    displayName=f"Key {i}",
+                    type="PREDEFINED",
+                    status="ACTIVE",
+                    reportableType="OFF",
+                )
+                for i in range(offset, min(offset + limit, self.keys))
+            ]
+        }
+
+    def getCustomTargetingValuesByStatement(self, statement):  # noqa: N802 - GAM SOAP API
+        limit, offset = page_window(statement)
+        key_id = statement["values"][0]["value"]["value"]
+        first_id = (key_id - KEY_ID_BASE) * self.values_per_key
+        return {
+            "results": [
+                CUSTOM_TARGETING_VALUE(
+                    customTargetingKeyId=key_id,
+                    id=first_id + i,
+                    name=f"value_{first_id + i}",
+                    displayName=f"Value {first_id + i}",
+                    matchType="EXACT",
+                    status="ACTIVE",
+                )
+                for i in range(offset, min(offset + limit, self.values_per_key))
+            ]
+        }
+
+
+class StubAdManagerClient:
+    """Just enough of AdManagerClient for GAMInventoryDiscovery."""
+
+    def __init__(self, keys: int, values: int):
+        self.service = StubCustomTargetingService(keys, values)
+
+    def GetService(self, name, version=None):  # noqa: N802 - googleads API
+        assert name == "CustomTargetingService", name
+        return self.service
+
+
+def write_page(key_display_name: str, page: list[CustomTargetingValue]) -> int:
+    """Shape a page into gam_inventory rows like the DB writer does, then drop it."""
+    rows = [
+        {
+            "inventory_type": "custom_targeting_value",
+            "inventory_id": value.id,
+            "name": value.name,
+            "path": [key_display_name, value.display_name],
+            "status": value.status,
+        }
+        for value in page
+    ]
+    return len(rows)
+
+
+def run_in_memory(client: StubAdManagerClient) -> int:
+    """In-memory model: every key and value is kept on the discovery instance."""
+    discovery = GAMInventoryDiscovery(client, "bench_tenant")
+    result = discovery.discover_custom_targeting(fetch_values=True)
+    return result["total_values"]
+
+
+def run_streaming(client: StubAdManagerClient) -> int:
+    """Streaming shape: each value page goes to the writer and is released."""
+    discovery = GAMInventoryDiscovery(client, "bench_tenant")
+    written = 0
+    for key_page in discovery.iter_custom_targeting_keys():
+        for key in key_page:
+            for page in discovery.iter_custom_targeting_values(key.id):
+                written += write_page(key.display_name, page)
+    return written
+
+
+MODES = {"streaming": run_streaming, "in_memory": run_in_memory}
+
+
+def run_mode(mode: str, keys: int, values: int, results) -> None:
+    """Child process: run one discovery mode and report (count, seconds, peak RSS growth in MB)."""
+    # Per-key discovery logging would dominate the output
+    logging.disable(logging.INFO)
+    client = StubAdManagerClient(keys, values)
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    count = MODES[mode](client)
+    elapsed = time.perf_counter() - start
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((count, elapsed, (peak_kb - baseline_kb) / 1024))
+
+
+def measure(label: str, mode: str, keys: int, values: int) -> float:
+    """Run one discovery mode in a fresh process and print its peak memory and rate."""
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run_mode, args=(mode, keys, values, results))
+    process.start()
+    count, elapsed, peak_mb = results.get()
+    process.join()
+
+    assert count == values, f"{label}: discovered {count} of {values} values"
+    print(f"  {label:<44} peak +{peak_mb:7.1f} MB  {elapsed:6.1f}s  {count / elapsed:9.0f} values/second")
+    return max(peak_mb, 0.1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--values", type=int, default=1_000_000, help="Total custom targeting values")
+    parser.add_argument("--keys", type=int, default=20, help="Custom targeting keys the values are spread over")
+    parser.add_argument("--target-mb", type=float, default=64.0, help="Maximum streaming peak RSS growth")
+    args = parser.parse_args()
+
+    values = args.values // args.keys * args.keys
+
+    print(f"\n{'=' * 70}")
+    print(f"🧠 GAM DISCOVERY MEMORY - {values:,} custom targeting values across {args.keys} keys")
+    print(f"{'=' * 70}")
+
+    streaming_mb = measure("Streaming (iter_custom_targeting_values)", "streaming", args.keys, values)
+    in_memory_mb = measure("In-memory (discover_custom_targeting)", "in_memory", args.keys, values)
+
+    print("\n📊 Results:")
+    print(f"  Peak memory reduction: {in_memory_mb / streaming_mb:.1f}x")
+    print(f"  In-memory cost per value: {in_memory_mb * 1024 * 1024 / values:.0f} bytes")
+
+    if streaming_mb > args.target_mb:
+        print(f"\n❌ Streaming peak {streaming_mb:.1f} MB exceeds target {args.target_mb:.1f} MB")
+        sys.exit(1)
+    print(f"\n✅ Streaming peak within {args.target_mb:.1f} MB target")
+
+
+if __name__ == "__main__":
+    main()
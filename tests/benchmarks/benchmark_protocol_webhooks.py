@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Benchmark protocol webhook delivery throughput against a local stub receiver.
+
+Compares the previous delivery path (blocking ``requests.Session.post`` wrapped in
+``asyncio.to_thread`` with the payload serialized twice) against the pooled aiohttp
+path used by ProtocolWebhookService (per-host keep-alive pool, payload encoded once).
+The receiver runs in a separate process so it does not compete with the sender for
+the GIL.
+
+Usage:
+    python tests/benchmarks/benchmark_protocol_webhooks.py [--count 2000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import aiohttp
+import requests
+
+
+class StubReceiverHandler(BaseHTTPRequestHandler):
+    """Accepts any POST and replies 200 with keep-alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):  # noqa: N802 - BaseHTTPRequestHandler API
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):  # noqa: A002 - silence per-request logging
+        pass
+
+
+class StubReceiver(ThreadingHTTPServer):
+    """Threaded HTTP server with a listen backlog large enough for the benchmark concurrency."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def _serve_stub_receiver(port_queue: multiprocessing.Queue) -> None:
+    server = StubReceiver(("127.0.0.1", 0), StubReceiverHandler)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+def start_stub_receiver() -> tuple[multiprocessing.Process, str]:
+    """Start the stub receiver in a child process and return (process, url)."""
+    port_queue: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve_stub_receiver, args=(port_queue,), daemon=True)
+    process.start()
+    return process, f"http://127.0.0.1:{port_queue.get(timeout=10)}/webhook"
+
+
+def make_payload(i: int) -> dict:
+    """Build a delivery-report sized payload."""
+    return {
+        "task_id": f"task_{i}",
+        "status": "completed",
+        "result": {
+            "notification_type": "scheduled",
+            "sequence_number": i,
+            "media_buy_deliveries": [
+                {
+                    "media_buy_id": f"mb_{i}",
+                    "totals": {"impressions": 125000, "spend": 1875.5, "clicks": 250},
+                    "by_package": [
+                        {"package_id": f"pkg_{j}", "impressions": 12500, "spend": 187.55} for j in range(10)
+                    ],
+                }
+            ],
+        },
+    }
+
+
+async def run_threaded_requests(url: str, count: int, concurrency: int) -> float:
+    """Previous path: requests.Session in a worker thread per attempt."""
+    session = requests.Session()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(i: int) -> None:
+        payload = make_payload(i)
+        async with semaphore:
+            len(json.dumps(payload).encode("utf-8"))  # size metric serialization
+            response = await asyncio.to_thread(session.post, url, json=payload, timeout=10.0)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(i) for i in range(count)))
+    elapsed = time.perf_counter() - start
+    session.close()
+    return elapsed
+
+
+async def run_pooled_aiohttp(url: str, count: int, concurrency: int) -> float:
+    """Current path: one keep-alive pool per host, payload encoded once."""
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit_per_host=20, keepalive_timeout=30)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10)) as http:
+
+        async def send(i: int) -> None:
+            body = json.dumps(make_payload(i), separators=(",", ":")).encode("utf-8")
+            async with semaphore:
+                async with http.post(url, data=body, headers={"Content-Type": "application/json"}) as response:
+                    await response.read()
+                    response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(send(i) for i in range(count)))
+        return time.perf_counter() - start
+
+
+def report(label: str, count: int, elapsed: float) -> float:
+    """Print and return webhooks/second."""
+    rate = count / elapsed
+    print(f"  {label:<40} {elapsed:7.2f}s  {rate:9.1f} webhooks/second")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000, help="Webhooks to send per mode")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent in-flight deliveries")
+    args = parser.parse_args()
+
+    receiver, url = start_stub_receiver()
+    print(f"\n{'=' * 70}")
+    print(f"📡 PROTOCOL WEBHOOK THROUGHPUT - {args.count} webhooks, concurrency {args.concurrency}")
+    print(f"{'=' * 70}")
+
+    try:
+        threaded_rate = report(
+            "requests + asyncio.to_thread",
+            args.count,
+            asyncio.run(run_threaded_requests(url, args.count, args.concurrency)),
+        )
+        pooled_rate = report(
+            "pooled aiohttp (per-host keep-alive)",
+            args.count,
+            asyncio.run(run_pooled_aiohttp(url, args.count, args.concurrency)),
+        )
+    finally:
+        receiver.terminate()
+
+    print("\n📊 Results:")
+    print(f"  Speedup: {pooled_rate / threaded_rate:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ pytestmark = [pytest.mark.integration, pytest.mark.requires_db]
 
 from sqlalchemy import delete
 
-from src.admin.services.media_buy_readiness_service import MediaBuyReadinessService
+from src.admin.services.media_buy_readiness_service import MediaBuyReadinessService, check_readiness_consistency
 from src.core.database.database_session import get_db_session
 from src.core.database.models import Creative, CreativeAssignment, MediaBuy, Principal, Tenant
 
@@ -379,3 +379,73 @@ class TestMediaBuyReadinessService:
         with get_db_session() as session:
             session.execute(delete(MediaBuy).where(MediaBuy.tenant_id == test_tenant))
             session.commit()
+
+    def test_snapshot_follows_assignment_and_approval(self, test_tenant, test_principal):
+        """Stored readiness is refreshed when creatives are assigned and approved."""
+        media_buy_id = "mb_snapshot"
+        creative_id = "cr_snapshot"
+        now = datetime.now(UTC)
+
+        with get_db_session() as session:
+            session.add(
+                MediaBuy(
+                    media_buy_id=media_buy_id,
+                    tenant_id=test_tenant,
+                    principal_id=test_principal,
+                    order_name="Snapshot Order",
+                    advertiser_name="Test Advertiser",
+                    budget=1000.0,
+                    start_date=(now + timedelta(days=1)).date(),
+                    end_date=(now + timedelta(days=7)).date(),
+                    status="active",
+                    raw_request={"packages": [{"package_id": "pkg_1", "product_id": "prod_1"}]},
+                )
+            )
+            session.add(
+                Creative(
+                    creative_id=creative_id,
+                    tenant_id=test_tenant,
+                    principal_id=test_principal,
+                    name="Pending Creative",
+                    agent_url="https://test-agent.example.com",
+                    format="display_300x250",
+                    status="pending_review",
+                    data={},
+                )
+            )
+            session.commit()
+
+        with get_db_session() as session:
+            media_buy = session.get(MediaBuy, media_buy_id)
+            assert media_buy.readiness_snapshot["blocking_issues"] == [
+                "1 package(s) missing creative assignments",
+                "No creatives uploaded",
+            ]
+
+            session.add(
+                CreativeAssignment(
+                    assignment_id="assign_snapshot",
+                    tenant_id=test_tenant,
+                    creative_id=creative_id,
+                    media_buy_id=media_buy_id,
+                    package_id="pkg_1",
+                )
+            )
+            session.commit()
+            assert media_buy.readiness_snapshot["creatives_pending"] == 1
+
+            session.get(Creative, creative_id).status = "approved"
+            session.commit()
+            assert media_buy.readiness_snapshot["creatives_approved"] == 1
+
+        assert check_readiness_consistency(test_tenant) == []
+        readiness = MediaBuyReadinessService.get_readiness_state(media_buy_id, test_tenant)
+        assert readiness["state"] == "scheduled"
+        assert readiness["is_ready_to_activate"]
+
+        # Cleanup
+        with get_db_session() as session:
+            session.execute(delete(CreativeAssignment).where(CreativeAssignment.media_buy_id == media_buy_id))
+            session.execute(delete(Creative).where(Creative.creative_id == creative_id))
+            session.execute(delete(MediaBuy).where(MediaBuy.media_buy_id == media_buy_id))
+            session.commit()
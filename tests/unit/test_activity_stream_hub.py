@@ -0,0 +1,181 @@
+"""Tests for the activity stream fan-out hub."""
+
+import threading
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from src.core.database.models import AuditLog
+from src.services.activity_stream_hub import (
+    ActivityStreamHub,
+    notification_payload,
+    parse_notification_payload,
+)
+
+
+def _audit_log(log_id: int, tenant_id: str = "tenant1") -> AuditLog:
+    return AuditLog(
+        log_id=log_id,
+        tenant_id=tenant_id,
+        timestamp=datetime.now(UTC),
+        operation="MCP.get_products",
+        principal_name="Buyer",
+        success=True,
+        details={"product_count": 3},
+    )
+
+
+def test_notification_payload_round_trip():
+    assert parse_notification_payload(notification_payload("tenant:with:colons", 42)) == 42
+    assert parse_notification_payload("garbage") is None
+
+
+def test_subscriber_receives_activities_after_its_cursor():
+    hub = ActivityStreamHub()
+    hub.publish("tenant1", {"id": 1})
+    cursor = hub.cursor("tenant1")
+    hub.publish("tenant1", {"id": 2})
+    hub.publish("tenant2", {"id": 3})
+
+    cursor, activities = hub.wait_for_activities("tenant1", cursor, timeout=0)
+
+    assert activities == [{"id": 2}]
+    assert hub.wait_for_activities("tenant1", cursor, timeout=0) == (cursor, [])
+
+
+def test_waiting_subscribers_are_woken_by_publish():
+    hub = ActivityStreamHub()
+    cursor = hub.cursor("tenant1")
+    received = []
+
+    def subscriber():
+        received.append(hub.wait_for_activities("tenant1", cursor, timeout=5)[1])
+
+    threads = [threading.Thread(target=subscriber) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    hub.publish("tenant1", {"id": 7})
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert received == [[{"id": 7}]] * 3
+
+
+def test_ring_buffer_is_bounded():
+    hub = ActivityStreamHub(buffer_size=3)
+    for log_id in range(1, 6):
+        hub.publish("tenant1", {"id": log_id})
+
+    _, activities = hub.wait_for_activities("tenant1", 0, timeout=0)
+
+    assert [a["id"] for a in activities] == [3, 4, 5]
+
+
+def test_replay_resumes_after_last_event_id():
+    hub = ActivityStreamHub(buffer_size=3)
+    for log_id in range(1, 6):
+        hub.publish("tenant1", {"id": log_id})
+
+    assert [a["id"] for a in hub.replay("tenant1", 3)] == [4, 5]
+    assert hub.replay("tenant1", 5) == []
+    assert hub.replay("tenant1", 1) is None  # Evicted: resume from the database
+
+
+def test_audit_logs_are_formatted_once_and_deduplicated():
+    hub = ActivityStreamHub()
+
+    with patch(
+        "src.admin.blueprints.activity_stream.format_activity_from_audit_log",
+        side_effect=lambda log: {"id": log.log_id},
+    ) as mock_format:
+        hub.publish_audit_logs([_audit_log(1), _audit_log(2, tenant_id="tenant2")])
+        # Catch-up query racing the notification for the same row
+        hub.publish_audit_logs([_audit_log(2, tenant_id="tenant2")])
+
+    assert mock_format.call_count == 2
+    assert hub.wait_for_activities("tenant1", 0, timeout=0)[1] == [{"id": 1}]
+    assert hub.wait_for_activities("tenant2", 0, timeout=0)[1] == [{"id": 2}]
+    assert hub._last_log_id == 2
+
+
+def test_published_activity_uses_audit_log_format():
+    hub = ActivityStreamHub()
+
+    hub.publish_audit_logs([_audit_log(9)])
+
+    _, activities = hub.wait_for_activities("tenant1", 0, timeout=0)
+    assert activities[0]["id"] == 9
+    assert activities[0]["details"]["primary"] == "Found 3 products"
+
+
+def test_sse_stream_resumes_from_ring_buffer():
+    """A reconnecting browser gets buffered activities after Last-Event-ID, with SSE ids."""
+    from flask import Flask
+
+    from src.admin.blueprints import activity_stream
+
+    hub = ActivityStreamHub()
+    for log_id in (10, 11, 12):
+        hub.publish("tenant1", {"id": log_id, "type": "api-call"})
+
+    app = Flask(__name__)
+    view = activity_stream.activity_events.__wrapped__
+    with (
+        patch("src.admin.blueprints.activity_stream.get_activity_stream_hub", return_value=hub),
+        patch.object(hub, "ensure_listening"),
+        patch("src.admin.blueprints.activity_stream.get_recent_activities") as mock_recent,
+        app.test_request_context("/tenant/tenant1/events", headers={"Last-Event-ID": "10"}),
+    ):
+        stream = view("tenant1").response
+        events = [next(stream), next(stream)]
+        assert hub.subscriber_count == 1
+        stream.close()
+
+    assert events[0].startswith("id: 11\n") and events[1].startswith("id: 12\n")
+    mock_recent.assert_not_called()
+    assert hub.subscriber_count == 0
+
+
+def test_catch_up_pages_oldest_first_until_caught_up():
+    """A client that missed more than a page gets every activity, in order."""
+    from sqlalchemy.dialects import postgresql
+
+    from src.admin.blueprints.activity_stream import iter_activities_after
+
+    pages = [[_audit_log(i) for i in range(11, 13)], [_audit_log(13)]]
+    with patch("src.admin.blueprints.activity_stream.get_db_session") as mock_db:
+        session = mock_db.return_value.__enter__.return_value
+        session.scalars.return_value.all.side_effect = pages
+
+        catch_up = list(iter_activities_after("tenant1", 10, page_size=2))
+
+    assert [[activity["id"] for activity in page] for page in catch_up] == [[11, 12], [13]]
+    queries = [str(call.args[0].compile(dialect=postgresql.dialect())) for call in session.scalars.call_args_list]
+    assert all("ORDER BY audit_logs.log_id" in sql for sql in queries)
+    cursors = [call.args[0].compile().params["log_id_1"] for call in session.scalars.call_args_list]
+    assert cursors == [10, 12]
+
+
+def test_sse_stream_resumes_from_database_past_ring_buffer():
+    """Last-Event-ID older than the ring buffer is caught up from the database, oldest first."""
+    from flask import Flask
+
+    from src.admin.blueprints import activity_stream
+
+    hub = ActivityStreamHub()
+    app = Flask(__name__)
+    view = activity_stream.activity_events.__wrapped__
+    with (
+        patch("src.admin.blueprints.activity_stream.get_activity_stream_hub", return_value=hub),
+        patch.object(hub, "ensure_listening"),
+        patch(
+            "src.admin.blueprints.activity_stream.iter_activities_after",
+            return_value=iter([[{"id": 4}, {"id": 5}], [{"id": 6}]]),
+        ) as mock_catch_up,
+        app.test_request_context("/tenant/tenant1/events", headers={"Last-Event-ID": "3"}),
+    ):
+        stream = view("tenant1").response
+        events = [next(stream) for _ in range(3)]
+        stream.close()
+
+    mock_catch_up.assert_called_once_with("tenant1", 3)
+    assert [event.split("\n", 1)[0] for event in events] == ["id: 4", "id: 5", "id: 6"]
@@ -133,8 +133,8 @@ class TestKevelAdapterPackages:
             tenant_id="tenant_123",
         )
 
-        # Mock requests.post to simulate campaign and flight creation
-        with patch("src.adapters.kevel.requests.post") as mock_post:
+        # Mock the shared HTTP transport to simulate campaign and flight creation
+        with patch.object(adapter.http, "post") as mock_post:
             # Mock campaign creation
             campaign_response = Mock()
             campaign_response.json.return_value = {"Id": 999}
@@ -234,8 +234,8 @@ class TestTritonAdapterPackages:
             tenant_id="tenant_123",
         )
 
-        # Mock requests.post to simulate campaign and flight creation
-        with patch("src.adapters.triton_digital.requests.post") as mock_post:
+        # Mock the shared HTTP transport to simulate campaign and flight creation
+        with patch.object(adapter.http, "post") as mock_post:
             # Mock campaign creation
             campaign_response = Mock()
             campaign_response.json.return_value = {"id": 888}
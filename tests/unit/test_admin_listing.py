@@ -0,0 +1,154 @@
+"""Tests for the keyset-paginated admin listing helpers."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask, get_flashed_messages
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.admin.utils.listing import (
+    ListingError,
+    ListingSpec,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    listing_error_response,
+    parse_listing_query,
+)
+from src.core.database.models import Creative
+
+SPEC = ListingSpec(
+    key=Creative.creative_id,
+    sorts={"created_at": Creative.created_at, "name": Creative.name},
+    default_sort="-created_at",
+    filters={"status": lambda value: Creative.status == value},
+    search=lambda term: Creative.name.icontains(term, autoescape=True),
+    max_page_size=100,
+)
+
+
+def _sql(session: MagicMock) -> str:
+    stmt = session.execute.call_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _session(rows):
+    session = MagicMock()
+    session.execute.return_value.unique.return_value.all.return_value = rows
+    return session
+
+
+def test_cursor_round_trips_typed_values():
+    created = datetime(2026, 5, 1, 12, 30, tzinfo=UTC)
+    token = encode_cursor("-created_at", [created, "c_1"])
+    assert decode_cursor(token, "-created_at") == [created, "c_1"]
+    assert decode_cursor(encode_cursor("price", [Decimal("1.50"), "p"]), "price") == [Decimal("1.50"), "p"]
+
+
+def test_cursor_rejects_other_sort_and_garbage():
+    token = encode_cursor("name", ["a", "c_1"])
+    with pytest.raises(ListingError):
+        decode_cursor(token, "-name")
+    with pytest.raises(ListingError):
+        decode_cursor("not-a-cursor", "name")
+
+
+def test_parse_defaults_filters_and_limit_cap():
+    query = parse_listing_query(SPEC, {"status": "approved", "unknown": "x", "q": " banner ", "limit": "500"})
+
+    assert query.sort == "created_at"
+    assert query.descending
+    assert query.limit == 100
+    assert query.filters == {"status": "approved"}
+    assert query.search == "banner"
+    assert query.url_params(cursor="abc") == {
+        "status": "approved",
+        "sort": "-created_at",
+        "limit": 100,
+        "q": "banner",
+        "cursor": "abc",
+    }
+
+
+@pytest.mark.parametrize("args", [{"sort": "budget"}, {"limit": "ten"}, {"limit": "0"}, {"cursor": "%%%"}])
+def test_parse_rejects_invalid_parameters(args):
+    with pytest.raises(ListingError):
+        parse_listing_query(SPEC, args)
+
+
+def test_fetch_page_pushes_filters_sort_and_limit_into_sql():
+    query = parse_listing_query(SPEC, {"sort": "name", "status": "approved", "q": "100%", "limit": "2"})
+    session = _session([])
+
+    page = fetch_page(session, select(Creative), SPEC, query)
+
+    sql = _sql(session)
+    assert "creatives.status = 'approved'" in sql
+    assert "ILIKE" in sql.upper()
+    assert "ORDER BY creatives.name ASC NULLS LAST, creatives.creative_id ASC" in sql
+    assert "LIMIT 3" in sql
+    assert page.items == []
+    assert not page.has_more
+
+
+def test_fetch_page_returns_cursor_for_next_page():
+    rows = [(f"creative{i}", f"name{i}", f"c_{i}") for i in range(3)]
+    query = parse_listing_query(SPEC, {"sort": "name", "limit": "2"})
+
+    page = fetch_page(_session(rows), select(Creative), SPEC, query)
+
+    assert page.items == ["creative0", "creative1"]
+    assert page.has_more
+    assert decode_cursor(page.next_cursor, "name") == ["name1", "c_1"]
+    assert page.next_params()["cursor"] == page.next_cursor
+
+
+def test_fetch_page_after_cursor_uses_row_comparison():
+    created = datetime(2026, 5, 1, tzinfo=UTC)
+    query = parse_listing_query(SPEC, {"cursor": encode_cursor("-created_at", [created, "c_9"])})
+    session = _session([])
+
+    fetch_page(session, select(Creative), SPEC, query)
+
+    sql = _sql(session)
+    assert "(creatives.created_at, creatives.creative_id) < (" in sql
+    assert "ORDER BY creatives.created_at DESC NULLS FIRST, creatives.creative_id DESC" in sql
+
+
+def test_fetch_page_after_null_sort_value_stays_within_nulls():
+    query = parse_listing_query(SPEC, {"sort": "name", "cursor": encode_cursor("name", [None, "c_9"])})
+    session = _session([])
+
+    fetch_page(session, select(Creative), SPEC, query)
+
+    sql = _sql(session)
+    assert "creatives.name IS NULL AND creatives.creative_id > 'c_9'" in sql
+
+
+def _listing_app() -> Flask:
+    app = Flask(__name__)
+    app.secret_key = "test"
+    app.add_url_rule("/tenant/<tenant_id>/things", "things", lambda tenant_id: "")
+    return app
+
+
+def test_listing_error_flashes_and_redirects_html_requests():
+    with _listing_app().test_request_context("/tenant/t1/things?sort=bogus"):
+        response = listing_error_response(ListingError("Unknown sort 'bogus'"))
+
+        assert response.status_code == 302
+        assert response.location == "/tenant/t1/things"
+        assert get_flashed_messages(with_categories=True) == [
+            ("error", "Invalid listing parameters: Unknown sort 'bogus'")
+        ]
+
+
+def test_listing_error_returns_json_400_when_json_is_requested():
+    with _listing_app().test_request_context("/tenant/t1/things?sort=bogus&format=json"):
+        response, status = listing_error_response(ListingError("Unknown sort 'bogus'"))
+
+    assert status == 400
+    assert response.get_json() == {"error": "Unknown sort 'bogus'"}
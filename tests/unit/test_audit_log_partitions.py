@@ -0,0 +1,129 @@
+"""Tests for monthly audit_logs partition management."""
+
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from src.services.audit_log_partitions import (
+    AuditLogPartitionScheduler,
+    add_months,
+    archive_audit_log_partitions,
+    ensure_audit_log_partitions,
+    partition_month,
+    partition_name,
+)
+
+
+@pytest.fixture
+def mock_session():
+    with patch("src.services.audit_log_partitions.get_db_session") as mock_db:
+        yield mock_db.return_value.__enter__.return_value
+
+
+def _executed_sql(session) -> list[str]:
+    return [str(call.args[0]) for call in session.execute.call_args_list]
+
+
+def test_month_arithmetic_crosses_years():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_partition_names_round_trip():
+    assert partition_name(date(2026, 3, 1)) == "audit_logs_p202603"
+    assert partition_month("audit_logs_p202603") == date(2026, 3, 1)
+    assert partition_month("audit_logs_default") is None
+
+
+def test_ensure_creates_only_missing_months(mock_session):
+    with (
+        patch("src.services.audit_log_partitions.is_partitioned", return_value=True),
+        patch(
+            "src.services.audit_log_partitions.list_partitions",
+            return_value={date(2026, 10, 1): "audit_logs_p202610", date(2026, 11, 1): "audit_logs_p202611"},
+        ),
+    ):
+        created = ensure_audit_log_partitions(months_ahead=3, today=date(2026, 10, 18))
+
+    assert created == ["audit_logs_p202612", "audit_logs_p202701"]
+    sql = _executed_sql(mock_session)
+    assert "pg_advisory_xact_lock" in sql[0]
+    attach = [s for s in sql if "ATTACH PARTITION" in s]
+    assert attach[0].endswith("FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')")
+    # Rows that fell into the default partition are moved before attaching
+    assert any("DELETE FROM audit_logs_default" in s for s in sql)
+    mock_session.commit.assert_called_once()
+
+
+def test_ensure_is_noop_on_unpartitioned_table(mock_session):
+    with patch("src.services.audit_log_partitions.is_partitioned", return_value=False):
+        assert ensure_audit_log_partitions(today=date(2026, 10, 18)) == []
+
+    mock_session.commit.assert_not_called()
+
+
+def test_archive_selects_partitions_past_retention(mock_session):
+    partitions = {date(2025, month, 1): f"audit_logs_p2025{month:02d}" for month in range(9, 13)}
+    with (
+        patch("src.services.audit_log_partitions.is_partitioned", return_value=True),
+        patch("src.services.audit_log_partitions.list_partitions", return_value=partitions),
+    ):
+        results = archive_audit_log_partitions(retention_months=12, dry_run=True, today=date(2026, 10, 18))
+
+    # Keeps 2025-11 through 2026-10
+    assert [r.name for r in results] == ["audit_logs_p202509", "audit_logs_p202510"]
+    assert not any(r.dropped for r in results)
+
+
+def test_archive_drops_partition_after_verified_export(mock_session, tmp_path):
+    mock_session.execute.return_value.scalar.return_value = 42
+    with (
+        patch("src.services.audit_log_partitions.is_partitioned", return_value=True),
+        patch(
+            "src.services.audit_log_partitions.list_partitions",
+            return_value={date(2024, 1, 1): "audit_logs_p202401"},
+        ),
+        patch("src.services.audit_log_partitions._export_partition", return_value=42) as mock_export,
+    ):
+        results = archive_audit_log_partitions(retention_months=12, archive_dir=tmp_path, today=date(2026, 10, 18))
+
+    mock_export.assert_called_once_with("audit_logs_p202401", tmp_path / "audit_logs_p202401.csv.gz")
+    assert results[0].dropped is True
+    sql = _executed_sql(mock_session)
+    assert "ALTER TABLE audit_logs DETACH PARTITION audit_logs_p202401" in sql
+    assert "DROP TABLE audit_logs_p202401" in sql
+
+
+def test_archive_keeps_partition_written_during_export(mock_session, tmp_path):
+    mock_session.execute.return_value.scalar.return_value = 43
+    with (
+        patch("src.services.audit_log_partitions.is_partitioned", return_value=True),
+        patch(
+            "src.services.audit_log_partitions.list_partitions",
+            return_value={date(2024, 1, 1): "audit_logs_p202401"},
+        ),
+        patch("src.services.audit_log_partitions._export_partition", return_value=42),
+    ):
+        results = archive_audit_log_partitions(retention_months=12, archive_dir=tmp_path, today=date(2026, 10, 18))
+
+    assert results[0].dropped is False
+    assert not any("DROP TABLE" in s for s in _executed_sql(mock_session))
+
+
+@pytest.mark.asyncio
+async def test_scheduler_creates_partitions_on_start():
+    scheduler = AuditLogPartitionScheduler(interval_seconds=3600)
+
+    with patch("src.services.audit_log_partitions.ensure_audit_log_partitions") as mock_ensure:
+        await scheduler.start()
+        await scheduler.start()  # Idempotent
+        for _ in range(50):
+            if mock_ensure.called:
+                break
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+    mock_ensure.assert_called_once()
+    assert scheduler.is_running is False
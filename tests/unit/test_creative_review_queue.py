@@ -0,0 +1,171 @@
+"""Unit tests for the durable creative review queue and its worker pool."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.creative_review_queue import (
+    RETRY_SCHEDULE_SECONDS,
+    CreativeReviewWorkerPool,
+    ProviderRateLimiter,
+    enqueue_creative_review,
+    get_review_job_status,
+    parse_provider_rpm,
+)
+
+
+def _job(**overrides):
+    job = {
+        "id": 1,
+        "task_id": "ai_review_creative_1_abcd1234",
+        "tenant_id": "tenant1",
+        "creative_id": "creative_1",
+        "webhook_url": None,
+        "slack_webhook_url": None,
+        "principal_name": "principal1",
+        "attempt_count": 0,
+        "max_attempts": 3,
+        "created_at": datetime.now(UTC),
+    }
+    job.update(overrides)
+    return job
+
+
+@pytest.fixture
+def pool():
+    """Worker pool with database writes mocked out."""
+    pool = CreativeReviewWorkerPool(worker_count=1, review_handler=AsyncMock(return_value={"status": "approved"}))
+    pool._mark_completed = MagicMock()
+    pool._mark_failed = MagicMock()
+    pool._reschedule = MagicMock()
+    return pool
+
+
+def test_parse_provider_rpm_ignores_malformed_entries():
+    assert parse_provider_rpm("gemini=60, openai=500,bad,anthropic=x") == {"gemini": 60, "openai": 500}
+    assert parse_provider_rpm(None) == {}
+
+
+def test_rate_limiter_spaces_calls_per_provider():
+    """Each provider gets its own schedule of 60/rpm second slots."""
+    limiter = ProviderRateLimiter(default_rpm=60, provider_rpm={"openai": 600})
+
+    assert limiter.reserve("gemini") == 0.0
+    assert limiter.reserve("gemini") == pytest.approx(1.0, abs=0.05)
+    assert limiter.reserve("gemini") == pytest.approx(2.0, abs=0.05)
+    assert limiter.reserve("openai") == 0.0
+    assert limiter.reserve("openai") == pytest.approx(0.1, abs=0.05)
+
+
+def test_rate_limiter_disabled_with_zero_rpm():
+    limiter = ProviderRateLimiter(default_rpm=0)
+
+    assert [limiter.reserve("gemini") for _ in range(5)] == [0.0] * 5
+
+
+def test_enqueue_adds_pending_job_without_committing():
+    """Enqueueing joins the caller's transaction; the caller commits with the creative."""
+    session = MagicMock()
+
+    job = enqueue_creative_review(session, tenant_id="tenant1", creative_id="creative_1", principal_name="p1")
+
+    session.add.assert_called_once_with(job)
+    session.commit.assert_not_called()
+    assert job.status == "pending"
+    assert job.attempt_count == 0
+    assert job.task_id.startswith("ai_review_creative_1_")
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [("pending", "queued"), ("in_flight", "running"), ("completed", "completed"), ("failed", "failed")],
+)
+def test_job_status_maps_queue_state(status, expected):
+    job = MagicMock(status=status, creative_id="creative_1", result={"status": "approved"}, last_error="boom")
+    with patch("src.services.creative_review_queue.get_db_session") as mock_db:
+        mock_db.return_value.__enter__.return_value.scalars.return_value.first.return_value = job
+
+        result = get_review_job_status("task_1")
+
+    assert result["status"] == expected
+    assert result["creative_id"] == "creative_1"
+
+
+def test_job_status_not_found():
+    with patch("src.services.creative_review_queue.get_db_session") as mock_db:
+        mock_db.return_value.__enter__.return_value.scalars.return_value.first.return_value = None
+
+        assert get_review_job_status("missing")["status"] == "not_found"
+
+
+@pytest.mark.asyncio
+async def test_successful_review_marks_job_completed(pool):
+    await pool.process_item(_job())
+
+    pool.review_handler.assert_awaited_once()
+    pool._mark_completed.assert_called_once_with(1, {"status": "approved"})
+    pool._reschedule.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failed_review_is_rescheduled_with_backoff(pool):
+    pool.review_handler.side_effect = RuntimeError("database unavailable")
+
+    await pool.process_item(_job())
+
+    pool._mark_completed.assert_not_called()
+    job_id, delay, error = pool._reschedule.call_args.args
+    assert job_id == 1
+    assert RETRY_SCHEDULE_SECONDS[0] <= delay.total_seconds() <= RETRY_SCHEDULE_SECONDS[0] * 1.1
+    assert "database unavailable" in error
+
+
+@pytest.mark.asyncio
+async def test_final_failed_attempt_parks_job(pool):
+    pool.review_handler.side_effect = RuntimeError("database unavailable")
+
+    await pool.process_item(_job(attempt_count=2, max_attempts=3))
+
+    pool._mark_failed.assert_called_once()
+    pool._reschedule.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_reviews_claimed_jobs_concurrently():
+    """Claimed jobs are reviewed by up to worker_count concurrent workers."""
+    running = 0
+    peak = 0
+    reviewed = []
+
+    async def review(job):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        reviewed.append(job["id"])
+        return {"status": "approved"}
+
+    jobs = [_job(id=i, task_id=f"task_{i}") for i in range(6)]
+    pool = CreativeReviewWorkerPool(worker_count=3, poll_interval_seconds=0.01, review_handler=review)
+    pool._mark_completed = MagicMock()
+    pool._maybe_purge = MagicMock()
+
+    def claim_batch(limit):
+        claimed, jobs[:] = jobs[:limit], jobs[limit:]
+        return claimed
+
+    pool.claim_batch = claim_batch
+
+    await pool.start()
+    for _ in range(500):
+        if len(reviewed) == 6:
+            break
+        await asyncio.sleep(0.01)
+    await pool.stop()
+
+    assert sorted(reviewed) == list(range(6))
+    assert peak == 3
+    assert pool._mark_completed.call_count == 6
@@ -2,6 +2,7 @@
 
 # ruff: noqa: PLR0913
 
+from datetime import UTC, datetime
 from unittest.mock import Mock, patch
 
 import pytest
@@ -73,6 +74,7 @@ class TestDashboardService:
         mock_scalars.all.return_value = []
         mock_session.scalars.return_value = mock_scalars
         mock_session.scalar.return_value = 5  # For count queries
+        mock_session.execute.return_value.all.return_value = []  # Revenue trend rows
 
         # Mock readiness summary
         mock_readiness_summary = {
@@ -133,6 +135,21 @@ class TestDashboardService:
         change = service._calculate_revenue_change(revenue_data)
         assert change == 0.0
 
+    @pytest.mark.parametrize("backfilled_at", [None, datetime(2026, 1, 1, tzinfo=UTC)])
+    def test_revenue_trend_uses_rollup_once_backfilled(self, backfilled_at):
+        """Revenue trend reads the rollup only for tenants that have been backfilled."""
+        service = DashboardService("test_tenant")
+        service._tenant = Mock(spec=Tenant, revenue_rollup_backfilled_at=backfilled_at)
+        db_session = Mock()
+
+        with patch("src.admin.services.dashboard_service.get_daily_revenue") as mock_daily_revenue:
+            service._calculate_revenue_trend(db_session, days=30)
+
+        args, kwargs = mock_daily_revenue.call_args
+        assert args[0] is db_session
+        assert (args[3] - args[2]).days == 29
+        assert kwargs["use_rollup"] is (backfilled_at is not None)
+
     def test_get_chart_data_format(self):
         """Test that chart data is formatted correctly for frontend."""
         service = DashboardService("test_tenant")
@@ -0,0 +1,181 @@
+"""Tests for the local delivery fact store and its sync from the ad servers."""
+
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import MagicMock, Mock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from src.adapters.gam_reporting_service import ReportingData
+from src.adapters.google_ad_manager import GoogleAdManager
+from src.core.schemas import (
+    AdapterDeliveryFact,
+    AdapterDeliveryFacts,
+    AdapterGetMediaBuyDeliveryResponse,
+    DeliveryTotals,
+    Principal,
+    ReportingPeriod,
+)
+from src.services.delivery_facts import (
+    DELIVERY_SYNC_RESTATEMENT_DAYS,
+    fetch_media_buy_deliveries,
+    read_local_deliveries,
+    store_delivery_facts,
+    sync_media_buy_delivery,
+)
+
+TODAY = datetime(2026, 3, 10, 15, 0, tzinfo=UTC)
+PERIOD = ReportingPeriod(start="2026-03-01T00:00:00", end="2026-03-09T00:00:00")
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def _reporting_data(rows, valid_until, start=datetime(2026, 3, 1)):
+    return ReportingData(
+        data=rows,
+        start_date=start,
+        end_date=TODAY,
+        requested_timezone="America/New_York",
+        data_timezone="America/New_York",
+        data_valid_until=valid_until,
+        query_type="this_month",
+        dimensions=[],
+        metrics={},
+    )
+
+
+def _row(timestamp, line_item_id, impressions, spend, order_id="111"):
+    return {
+        "timestamp": timestamp,
+        "order_id": order_id,
+        "line_item_id": line_item_id,
+        "impressions": impressions,
+        "clicks": 1,
+        "spend": spend,
+    }
+
+
+def test_gam_facts_are_daily_for_past_days_and_hourly_for_today():
+    principal = Mock(spec=Principal)
+    principal.principal_id = "p1"
+    principal.platform_mappings = {}
+    adapter = GoogleAdManager(
+        config={"network_code": "1", "refresh_token": "t", "enabled": True},
+        principal=principal,
+        network_code="1",
+        advertiser_id="789",
+        trafficker_id="101112",
+        dry_run=False,
+        tenant_id="t1",
+    )
+    adapter.client = Mock()
+    daily = _reporting_data(
+        [
+            _row("2026-03-08T00:00:00", "901", 100, 1.0),
+            _row("2026-03-09T00:00:00", "999", 50, 0.5),
+            # Today's partial day comes from the hourly report instead
+            _row("2026-03-10T00:00:00", "901", 70, 0.7),
+        ],
+        valid_until=datetime(2026, 3, 9, 23, 59, 59),
+    )
+    hourly = _reporting_data(
+        [_row("2026-03-10T09:00:00", "901", 30, 0.3), _row("2026-03-10T09:00:00", "901", 5, 0.05, order_id="404")],
+        valid_until=datetime(2026, 3, 10, 11, 0),
+    )
+
+    with (
+        patch.object(adapter, "_load_media_buy_line_items", return_value=({"111": Mock()}, {"901": ("111", "pkg_1")})),
+        patch("src.adapters.gam_reporting_service.GAMReportingService") as service_class,
+    ):
+        service_class.return_value.get_order_delivery_data.side_effect = [daily, hourly]
+        result = adapter.get_delivery_facts(["111"], date(2026, 3, 8), TODAY)
+
+    assert service_class.return_value.get_order_delivery_data.call_args_list[0].kwargs["date_range"] == "this_month"
+    assert {(f.package_id, f.day, f.hour, f.impressions) for f in result.facts} == {
+        ("pkg_1", date(2026, 3, 8), -1, 100),
+        ("", date(2026, 3, 9), -1, 50),
+        ("pkg_1", date(2026, 3, 10), 9, 30),
+    }
+    assert result.start_date == date(2026, 3, 8)
+    assert result.data_valid_until == datetime(2026, 3, 10, 11, 0)
+
+
+def test_store_replaces_days_and_upserts_sync_state():
+    session = MagicMock()
+    delivery = AdapterDeliveryFacts(
+        facts=[
+            AdapterDeliveryFact(media_buy_id="mb_1", package_id="p1", day=date(2026, 3, 8), impressions=10, spend=1.0),
+            AdapterDeliveryFact(media_buy_id="mb_other", day=date(2026, 3, 8), impressions=5, spend=0.5),
+        ],
+        start_date=date(2026, 3, 8),
+        data_valid_until=datetime(2026, 3, 9, 23, 59, tzinfo=UTC),
+    )
+
+    assert store_delivery_facts(session, "t1", ["mb_1", "mb_2"], delivery, TODAY) == 1
+
+    delete_stmt, insert_call, upsert_stmt = session.execute.call_args_list
+    assert "DELETE FROM delivery_facts" in str(delete_stmt.args[0])
+    assert [row["media_buy_id"] for row in insert_call.args[1]] == ["mb_1"]
+    upsert_sql = str(upsert_stmt.args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (media_buy_id) DO UPDATE" in upsert_sql
+    assert "least(delivery_sync_state.synced_from, excluded.synced_from)" in upsert_sql
+
+
+def test_sync_starts_at_flight_start_or_restatement_window():
+    session = MagicMock()
+    session.execute.return_value = _result([("mb_synced", datetime(2026, 3, 9, 11, 0, tzinfo=UTC))])
+    adapter = MagicMock()
+    adapter.get_delivery_facts.return_value = None
+    media_buys = [Mock(media_buy_id="mb_synced"), Mock(media_buy_id="mb_new", start_date=date(2026, 3, 8))]
+
+    assert sync_media_buy_delivery(session, adapter, "t1", media_buys, TODAY) is None
+
+    start = adapter.get_delivery_facts.call_args.args[1]
+    assert start == min(date(2026, 3, 8), date(2026, 3, 9) - timedelta(days=DELIVERY_SYNC_RESTATEMENT_DAYS))
+
+
+def test_local_deliveries_sum_facts_for_covered_media_buys():
+    session = MagicMock()
+    session.execute.side_effect = [
+        _result([("mb_1", "EUR")]),
+        _result(
+            [
+                ("mb_1", "p1", date(2026, 3, 2), 100, 2, 1.5),
+                ("mb_1", "", date(2026, 3, 2), 10, 0, 0.1),
+                ("mb_1", "p1", date(2026, 3, 3), 300, 1, 4.5),
+            ]
+        ),
+    ]
+
+    results = read_local_deliveries(session, "t1", ["mb_1", "mb_2"], PERIOD, TODAY)
+
+    assert set(results) == {"mb_1"}
+    delivery = results["mb_1"]
+    assert (delivery.totals.impressions, delivery.totals.clicks, delivery.totals.spend) == (410, 3, 6.1)
+    assert delivery.currency == "EUR"
+    assert [(p.package_id, p.impressions, p.spend) for p in delivery.by_package] == [("p1", 400, 6.0)]
+    assert [d["date"] for d in delivery.daily_breakdown] == ["2026-03-02", "2026-03-03"]
+
+
+def test_fetch_goes_live_only_for_uncovered_media_buys():
+    local = AdapterGetMediaBuyDeliveryResponse(
+        media_buy_id="mb_1",
+        reporting_period=PERIOD,
+        totals=DeliveryTotals(impressions=1, spend=1.0),
+        by_package=[],
+        currency="USD",
+    )
+    adapter = MagicMock()
+    adapter.get_media_buy_deliveries.return_value = {"mb_2": local.model_copy(update={"media_buy_id": "mb_2"})}
+
+    with (
+        patch("src.services.delivery_facts.get_db_session"),
+        patch("src.services.delivery_facts.read_local_deliveries", return_value={"mb_1": local}),
+    ):
+        results = fetch_media_buy_deliveries(adapter, "t1", ["mb_1", "mb_2"], PERIOD, TODAY)
+
+    assert set(results) == {"mb_1", "mb_2"}
+    assert adapter.get_media_buy_deliveries.call_args.kwargs["media_buy_ids"] == ["mb_2"]
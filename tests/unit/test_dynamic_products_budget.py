@@ -0,0 +1,61 @@
+"""Unit tests for the dynamic variant latency budget used by get_products."""
+
+import asyncio
+from unittest.mock import patch
+
+from src.services import dynamic_products
+from src.services.dynamic_products import generate_variants_within_budget
+
+
+class TestVariantLatencyBudget:
+    """Test cases for generate_variants_within_budget()."""
+
+    async def test_returns_variants_within_budget(self):
+        """Fast generation returns its variants directly."""
+        with patch("src.services.dynamic_products.generate_variants_for_brief", return_value=["variant"]) as generate:
+            variants, deferred = await generate_variants_within_budget("t1", "sports fans", budget_seconds=1.0)
+
+        assert variants == ["variant"]
+        assert deferred is False
+        generate.assert_awaited_once_with("t1", "sports fans", None)
+
+    async def test_slow_generation_continues_in_background(self):
+        """Past the budget the caller gets [] and generation still completes."""
+        finished = asyncio.Event()
+
+        async def slow_generate(tenant_id, brief, our_agent_url):
+            await asyncio.sleep(0.05)
+            finished.set()
+            return ["variant"]
+
+        with patch("src.services.dynamic_products.generate_variants_for_brief", side_effect=slow_generate):
+            variants, deferred = await generate_variants_within_budget("t1", "sports fans", budget_seconds=0.001)
+            assert variants == []
+            assert deferred is True
+            assert len(dynamic_products._background_tasks) == 1
+
+            await asyncio.wait_for(finished.wait(), timeout=1)
+            await asyncio.sleep(0)
+
+        assert dynamic_products._background_tasks == set()
+
+    async def test_cancelling_caller_cancels_generation(self):
+        """If get_products gives up while still waiting, generation is cancelled."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_generate(tenant_id, brief, our_agent_url):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with patch("src.services.dynamic_products.generate_variants_for_brief", side_effect=slow_generate):
+            caller = asyncio.create_task(generate_variants_within_budget("t1", "sports fans", budget_seconds=5))
+            await started.wait()
+            caller.cancel()
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        assert caller.cancelled()
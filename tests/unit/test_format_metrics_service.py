@@ -0,0 +1,180 @@
+"""Tests for incremental format metrics aggregation and the mergeable CPM sketch."""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.database.models import FormatPerformanceMetrics
+from src.services.cpm_sketch import CPM_SKETCH_RELATIVE_ACCURACY, CpmSketch
+from src.services.format_metrics_service import (
+    FORMAT_METRICS_RESTATEMENT_DAYS,
+    FormatMetricsAggregationService,
+    aggregate_all_tenants,
+)
+
+TODAY = date(2026, 3, 31)
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+def _exact_percentile(values: list[float], percentile: int) -> float:
+    ordered = sorted(values)
+    index = (percentile / 100) * (len(ordered) - 1)
+    lower = int(index)
+    upper = min(lower + 1, len(ordered) - 1)
+    weight = index - lower
+    return ordered[lower] * (1 - weight) + ordered[upper] * weight
+
+
+@pytest.mark.parametrize("percentile", [50, 75, 90])
+def test_sketch_quantiles_within_relative_accuracy(percentile):
+    rng = random.Random(7)
+    values = [rng.lognormvariate(1.5, 0.8) for _ in range(2000)]
+
+    estimate = CpmSketch.from_values(values).quantile(percentile)
+
+    exact = _exact_percentile(values, percentile)
+    # Interpolation between neighbouring ranks keeps the bucket accuracy bound
+    assert abs(estimate - exact) <= exact * CPM_SKETCH_RELATIVE_ACCURACY * 1.01
+
+
+def test_merged_sketches_equal_sketch_of_all_values():
+    days = [[1.0, 2.5, 3.0], [0.0, 4.2], [10.0, 2.5]]
+    merged = CpmSketch()
+    for values in days:
+        # Round-trip through the stored JSON form, with string counts as read by jsonb_each_text
+        merged.merge_buckets({key: str(count) for key, count in CpmSketch.from_values(values).to_dict().items()})
+
+    combined = CpmSketch.from_values([v for values in days for v in values])
+    assert merged.buckets == combined.buckets
+    assert merged.count == 7
+    assert merged.quantile(0) == 0.0
+
+
+def test_empty_sketch_has_no_quantiles():
+    assert CpmSketch().quantile(50) is None
+
+
+def _service(last_day=None):
+    db = MagicMock()
+    db.scalar.return_value = last_day
+    return FormatMetricsAggregationService(db), db
+
+
+def test_ingest_starts_at_window_start_without_history():
+    service, _ = _service(last_day=None)
+    assert service._ingest_start("t1", date(2026, 3, 1)) == date(2026, 3, 1)
+
+
+def test_ingest_restates_recent_days_after_last_ingested_day():
+    service, _ = _service(last_day=date(2026, 3, 20))
+    expected = date(2026, 3, 21) - timedelta(days=FORMAT_METRICS_RESTATEMENT_DAYS)
+    assert service._ingest_start("t1", date(2026, 3, 1)) == expected
+
+
+def test_aggregate_only_queries_gam_for_missing_days():
+    service, _ = _service(last_day=date(2026, 3, 25))
+    with (
+        patch("src.services.format_metrics_service.GAMReportingService"),
+        patch.object(service, "_query_format_metrics", return_value=[]) as query,
+        patch.object(service, "_store_daily_metrics", return_value=0),
+        patch.object(service, "_process_and_store_metrics", return_value={"formats_processed": 0}) as process,
+    ):
+        summary = service.aggregate_metrics_for_tenant("t1", MagicMock(), period_days=30, today=TODAY)
+
+    ingest_start = date(2026, 3, 26) - timedelta(days=FORMAT_METRICS_RESTATEMENT_DAYS)
+    assert query.call_args.args[1:] == (ingest_start, YESTERDAY)
+    assert summary["days_ingested"] == (YESTERDAY - ingest_start).days + 1
+    # The window is still the full period of complete days
+    process.assert_called_once_with("t1", YESTERDAY - timedelta(days=29), YESTERDAY)
+
+
+def test_store_daily_metrics_groups_rows_and_sketches_line_item_cpms():
+    service, db = _service()
+    rows = [
+        {
+            "day": YESTERDAY,
+            "country_code": "US",
+            "creative_size": "300x250",
+            "impressions": 1000,
+            "clicks": 5,
+            "revenue_micros": 2_000_000,
+        },
+        {
+            "day": YESTERDAY,
+            "country_code": "US",
+            "creative_size": "300x250",
+            "impressions": 500,
+            "clicks": 1,
+            "revenue_micros": 2_000_000,
+        },
+        {
+            "day": YESTERDAY,
+            "country_code": None,
+            "creative_size": "728x90",
+            "impressions": 100,
+            "clicks": 0,
+            "revenue_micros": 0,
+        },
+    ]
+
+    assert service._store_daily_metrics("t1", rows, YESTERDAY, YESTERDAY) == 2
+
+    inserted = {(r["country_code"], r["creative_size"]): r for r in db.execute.call_args_list[-1].args[1]}
+    us = inserted[("US", "300x250")]
+    assert (us["total_impressions"], us["total_clicks"], us["total_revenue_micros"]) == (1500, 6, 4_000_000)
+    assert us["line_item_count"] == 2
+    assert CpmSketch(us["cpm_sketch"]).quantile(100) == pytest.approx(4.0, rel=CPM_SKETCH_RELATIVE_ACCURACY)
+    assert inserted[("", "728x90")]["cpm_sketch"] == {"zero": 1}
+
+
+def test_process_updates_existing_window_rows_and_creates_new_ones():
+    service, db = _service()
+    start = YESTERDAY - timedelta(days=29)
+    existing = FormatPerformanceMetrics(
+        tenant_id="t1", country_code="US", creative_size="300x250", period_start=start, period_end=YESTERDAY
+    )
+    db.scalars.return_value = [existing]
+    window = {
+        ("US", "300x250"): {
+            "impressions": 3000,
+            "clicks": 3,
+            "revenue_micros": 6_000_000,
+            "sketch": CpmSketch.from_values([1.0, 2.0, 3.0]),
+        },
+        ("", "728x90"): {"impressions": 10, "clicks": 0, "revenue_micros": 0, "sketch": CpmSketch.from_values([0.0])},
+    }
+
+    with patch.object(service, "_window_metrics", return_value=window):
+        summary = service._process_and_store_metrics("t1", start, YESTERDAY)
+
+    assert (summary["rows_updated"], summary["rows_created"]) == (1, 1)
+    assert existing.average_cpm == Decimal("2.0")
+    assert float(existing.median_cpm) == pytest.approx(2.0, rel=CPM_SKETCH_RELATIVE_ACCURACY)
+    assert existing.line_item_count == 3
+    created = db.add.call_args.args[0]
+    assert created.country_code is None
+    assert created.period_start == start
+
+
+def test_aggregate_all_tenants_records_failures_when_sequential():
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [("t1", "One", "123", "tok1"), ("t2", "Two", "456", "tok2")]
+    session_cm = MagicMock()
+    session_cm.__enter__.return_value = session
+
+    def aggregate(tenant_id, *args):
+        if tenant_id == "t2":
+            raise RuntimeError("GAM unavailable")
+        return {"formats_processed": 4}
+
+    with (
+        patch("src.services.format_metrics_service.get_db_session", return_value=session_cm),
+        patch("src.services.format_metrics_service.aggregate_tenant_metrics", side_effect=aggregate),
+    ):
+        summary = aggregate_all_tenants(period_days=30, max_workers=1)
+
+    assert (summary["successful"], summary["failed"]) == (1, 1)
+    assert {d["tenant_id"]: d["status"] for d in summary["details"]} == {"t1": "success", "t2": "failed"}
@@ -0,0 +1,256 @@
+"""Tests for multi-media-buy delivery reporting with one GAM report job."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.adapters.gam_reporting_service import GAMReportingService, ReportingConfig, ReportingData
+from src.adapters.google_ad_manager import GoogleAdManager
+from src.core.schemas import (
+    AggregatedTotals,
+    DeliveryTotals,
+    GetMediaBuyDeliveryResponse,
+    MediaBuyDeliveryData,
+    Principal,
+    ReportingPeriod,
+)
+from src.services.delivery_webhook_scheduler import DeliveryWebhookScheduler
+
+DATE_RANGE = ReportingPeriod(start="2026-03-01T00:00:00", end="2026-03-10T00:00:00")
+
+
+def test_report_query_filters_orders_with_in_clause():
+    service = GAMReportingService(MagicMock(), network_timezone="America/New_York")
+
+    job = service._build_report_query(
+        ["DATE", "ORDER_ID", "LINE_ITEM_ID"], datetime(2026, 3, 1), datetime(2026, 3, 10), order_ids=["11", "x", "22"]
+    )
+
+    assert job["reportQuery"]["statement"]["query"] == "WHERE ORDER_ID IN (11, 22)"
+
+
+def test_order_delivery_data_splits_large_batches_into_jobs(monkeypatch):
+    monkeypatch.setattr(ReportingConfig, "MAX_ORDER_IDS_PER_REPORT", 2)
+    service = GAMReportingService(MagicMock(), network_timezone="America/New_York")
+
+    with patch.object(service, "_run_report", return_value=[]) as run_report:
+        data = service.get_order_delivery_data("this_month", ["1", "2", "2", "3", "bad"])
+
+    queries = [call.args[0]["reportQuery"]["statement"]["query"] for call in run_report.call_args_list]
+    assert queries == ["WHERE ORDER_ID IN (1, 2)", "WHERE ORDER_ID IN (3)"]
+    assert data.data == []
+
+
+def test_order_delivery_data_also_reports_line_items():
+    service = GAMReportingService(MagicMock(), network_timezone="America/New_York")
+
+    with patch.object(service, "_run_report", return_value=[]) as run_report:
+        service.get_order_delivery_data("this_month", ["1"], line_item_ids=["901", "mb_x", "902"])
+
+    queries = [call.args[0]["reportQuery"]["statement"]["query"] for call in run_report.call_args_list]
+    assert queries == ["WHERE ORDER_ID IN (1)", "WHERE LINE_ITEM_ID IN (901, 902)"]
+
+
+@pytest.fixture
+def gam_adapter():
+    principal = Mock(spec=Principal)
+    principal.principal_id = "test_principal"
+    principal.platform_mappings = {}
+    adapter = GoogleAdManager(
+        config={"network_code": "123456", "refresh_token": "test_token", "enabled": True},
+        principal=principal,
+        network_code="123456",
+        advertiser_id="789",
+        trafficker_id="101112",
+        dry_run=False,
+        tenant_id="test_tenant",
+    )
+    adapter.client = Mock()
+    return adapter
+
+
+def _media_buy(media_buy_id, raw_request=None):
+    media_buy = Mock()
+    media_buy.media_buy_id = media_buy_id
+    media_buy.currency = "USD"
+    media_buy.budget = 1000.0
+    media_buy.raw_request = raw_request or {}
+    return media_buy
+
+
+def _package(media_buy_id, package_id, line_item_id):
+    package = Mock()
+    package.media_buy_id = media_buy_id
+    package.package_id = package_id
+    package.package_config = {"platform_line_item_id": line_item_id}
+    return package
+
+
+def _row(order_id, line_item_id, day, impressions, clicks, spend):
+    return {
+        "timestamp": f"{day}T00:00:00",
+        "order_id": order_id,
+        "line_item_id": line_item_id,
+        "impressions": impressions,
+        "clicks": clicks,
+        "spend": spend,
+    }
+
+
+def test_deliveries_for_many_media_buys_use_one_report(gam_adapter):
+    session = MagicMock()
+    session.scalars.return_value.all.side_effect = [
+        [_media_buy("111"), _media_buy("222", {"packages": [{"package_id": "pkg_b", "platform_line_item_id": "902"}]})],
+        [_package("111", "pkg_a1", "901"), _package("111", "pkg_a2", "903")],
+    ]
+    reporting_data = ReportingData(
+        data=[
+            _row("111", "901", "2026-03-08", 1000, 10, 5.0),
+            _row("111", "903", "2026-03-08", 500, 0, 2.5),
+            _row("111", "901", "2026-03-09", 2000, 20, 10.0),
+            _row("222", "902", "2026-03-09", 400, 4, 2.0),
+        ],
+        start_date=datetime(2026, 3, 1),
+        end_date=datetime(2026, 3, 10),
+        requested_timezone="America/New_York",
+        data_timezone="America/New_York",
+        data_valid_until=datetime(2026, 3, 9, 23, 59),
+        query_type="this_month",
+        dimensions=["DATE", "ADVERTISER_ID", "ORDER_ID", "LINE_ITEM_ID"],
+        metrics={},
+    )
+
+    with (
+        patch("src.core.database.database_session.get_db_session") as get_session,
+        patch("src.adapters.gam_reporting_service.GAMReportingService") as reporting_service_class,
+        patch("src.adapters.google_ad_manager.validate_and_log_freshness", return_value=True),
+    ):
+        get_session.return_value.__enter__.return_value = session
+        reporting_service = reporting_service_class.return_value
+        reporting_service.get_order_delivery_data.return_value = reporting_data
+
+        results = gam_adapter.get_media_buy_deliveries(["111", "222", "333"], DATE_RANGE, datetime.now())
+
+    reporting_service.get_order_delivery_data.assert_called_once()
+    assert reporting_service.get_order_delivery_data.call_args.kwargs["order_ids"] == ["111", "222"]
+
+    first = results["111"]
+    assert (first.totals.impressions, first.totals.clicks, first.totals.spend) == (3500, 30, 17.5)
+    assert {p.package_id: (p.impressions, p.spend) for p in first.by_package} == {
+        "pkg_a1": (3000, 15.0),
+        "pkg_a2": (500, 2.5),
+    }
+    assert first.daily_breakdown == [
+        {"date": "2026-03-08", "impressions": 1500.0, "spend": 7.5},
+        {"date": "2026-03-09", "impressions": 2000.0, "spend": 10.0},
+    ]
+    # Line item recorded only in the original request still maps to its package
+    assert [(p.package_id, p.impressions) for p in results["222"].by_package] == [("pkg_b", 400)]
+    # Unknown media buy gets zero totals rather than failing the batch
+    assert results["333"].totals.impressions == 0
+
+
+def test_manual_approval_media_buy_is_reported_by_line_item(gam_adapter):
+    """mb_ IDs are not GAM orders, so their rows are selected and attributed by line item."""
+    session = MagicMock()
+    session.scalars.return_value.all.side_effect = [
+        [_media_buy("111"), _media_buy("mb_abc")],
+        [_package("111", "pkg_a", "901"), _package("mb_abc", "pkg_m", "905")],
+    ]
+    reporting_data = ReportingData(
+        data=[
+            _row("111", "901", "2026-03-08", 1000, 10, 5.0),
+            _row("555", "905", "2026-03-08", 300, 3, 1.5),
+        ],
+        start_date=datetime(2026, 3, 1),
+        end_date=datetime(2026, 3, 10),
+        requested_timezone="America/New_York",
+        data_timezone="America/New_York",
+        data_valid_until=datetime(2026, 3, 9, 23, 59),
+        query_type="this_month",
+        dimensions=["DATE", "ADVERTISER_ID", "ORDER_ID", "LINE_ITEM_ID"],
+        metrics={},
+    )
+
+    with (
+        patch("src.core.database.database_session.get_db_session") as get_session,
+        patch("src.adapters.gam_reporting_service.GAMReportingService") as reporting_service_class,
+        patch("src.adapters.google_ad_manager.validate_and_log_freshness", return_value=True),
+    ):
+        get_session.return_value.__enter__.return_value = session
+        reporting_service = reporting_service_class.return_value
+        reporting_service.get_order_delivery_data.return_value = reporting_data
+
+        results = gam_adapter.get_media_buy_deliveries(["111", "mb_abc"], DATE_RANGE, datetime.now())
+
+    call_kwargs = reporting_service.get_order_delivery_data.call_args.kwargs
+    assert (call_kwargs["order_ids"], call_kwargs["line_item_ids"]) == (["111"], ["905"])
+    assert results["111"].totals.impressions == 1000
+    assert results["mb_abc"].totals.impressions == 300
+    assert [(p.package_id, p.impressions) for p in results["mb_abc"].by_package] == [("pkg_m", 300)]
+
+
+def test_stale_batch_raises(gam_adapter):
+    session = MagicMock()
+    session.scalars.return_value.all.side_effect = [[_media_buy("111")], []]
+
+    with (
+        patch("src.core.database.database_session.get_db_session") as get_session,
+        patch("src.adapters.gam_reporting_service.GAMReportingService"),
+        patch("src.adapters.google_ad_manager.validate_and_log_freshness", return_value=False),
+    ):
+        get_session.return_value.__enter__.return_value = session
+        with pytest.raises(ValueError, match="not fresh"):
+            gam_adapter.get_media_buy_deliveries(["111"], DATE_RANGE, datetime.now())
+
+
+def _delivery(media_buy_id, impressions, spend):
+    return MediaBuyDeliveryData(
+        media_buy_id=media_buy_id,
+        status="active",
+        totals=DeliveryTotals(impressions=impressions, spend=spend, clicks=None),
+        by_package=[],
+    )
+
+
+def _scheduled_media_buy(media_buy_id, principal_id):
+    media_buy = Mock()
+    media_buy.media_buy_id = media_buy_id
+    media_buy.tenant_id = "tenant_1"
+    media_buy.principal_id = principal_id
+    media_buy.raw_request = {"reporting_webhook": {"url": "https://example.com/hook", "frequency": "daily"}}
+    return media_buy
+
+
+def test_scheduler_fetches_delivery_once_per_principal():
+    now = datetime.now(UTC)
+    batch_response = GetMediaBuyDeliveryResponse(
+        reporting_period=ReportingPeriod(start=(now - timedelta(days=1)).isoformat(), end=now.isoformat()),
+        currency="USD",
+        aggregated_totals=AggregatedTotals(impressions=300.0, spend=3.0, media_buy_count=2),
+        media_buy_deliveries=[_delivery("mb_1", 100, 1.0), _delivery("mb_2", 200, 2.0)],
+    )
+    session = MagicMock()
+    session.scalars.return_value.all.return_value = ["mb_sent"]
+    media_buys = [
+        _scheduled_media_buy("mb_1", "p1"),
+        _scheduled_media_buy("mb_2", "p1"),
+        _scheduled_media_buy("mb_sent", "p1"),
+        _scheduled_media_buy("mb_3", "p2"),
+    ]
+
+    with (
+        patch("src.services.delivery_webhook_scheduler.get_protocol_webhook_service"),
+        patch(
+            "src.services.delivery_webhook_scheduler._get_media_buy_delivery_impl",
+            side_effect=[batch_response, RuntimeError("adapter down")],
+        ) as impl,
+    ):
+        deliveries = DeliveryWebhookScheduler()._fetch_deliveries(media_buys, session)
+
+    assert [call.args[0].media_buy_ids for call in impl.call_args_list] == [["mb_1", "mb_2"], ["mb_3"]]
+    assert set(deliveries) == {"mb_1", "mb_2"}
+    assert [d.media_buy_id for d in deliveries["mb_2"].media_buy_deliveries] == ["mb_2"]
+    assert deliveries["mb_2"].aggregated_totals.impressions == 200.0
+    assert deliveries["mb_2"].aggregated_totals.media_buy_count == 1
@@ -0,0 +1,145 @@
+"""Tests for batched package updates: GAM line item batching and update_packages."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, Mock, patch
+
+from src.adapters.base import AdServerAdapter
+from src.adapters.gam.managers.orders import GAMOrdersManager
+from src.core.schemas import AdapterPackageUpdate, Error, UpdateMediaBuyError, UpdateMediaBuySuccess
+
+
+def _line_item(line_item_id, cost_micro=2_000_000, units=1000):
+    return {"id": int(line_item_id), "costPerUnit": {"microAmount": cost_micro}, "primaryGoal": {"units": units}}
+
+
+def _manager(service):
+    client_manager = Mock()
+    client_manager.get_service.return_value = service
+    return GAMOrdersManager(client_manager, advertiser_id="1", trafficker_id="2")
+
+
+def test_budgets_are_read_and_written_with_one_call_each():
+    service = Mock()
+    service.getLineItemsByStatement.return_value = {"results": [_line_item("11"), _line_item("22")]}
+    service.updateLineItems.side_effect = lambda line_items: line_items
+
+    errors = _manager(service).update_line_item_budgets(
+        {"11": (100.0, "cpm"), "22": (50.0, "cpc"), "33": (10.0, "cpm")}
+    )
+
+    assert errors == {"11": None, "22": None, "33": "Line item not found in GAM"}
+    statement = service.getLineItemsByStatement.call_args.args[0]
+    assert statement["query"].startswith("WHERE id IN (11, 22, 33)")
+    written = service.updateLineItems.call_args.args[0]
+    # $100 at $2 CPM = 50,000 impressions; $50 at $2 CPC = 25 clicks
+    assert [li["primaryGoal"]["units"] for li in written] == [50_000, 25]
+    service.updateLineItems.assert_called_once()
+
+
+def test_rejected_batch_is_retried_per_line_item_to_find_the_failure():
+    service = Mock()
+    service.getLineItemsByStatement.return_value = {"results": [_line_item("11"), _line_item("22")]}
+
+    def update(line_items):
+        if any(li["id"] == 22 for li in line_items):
+            raise Exception("[LineItemError.ALREADY_STARTED]")
+        return line_items
+
+    service.updateLineItems.side_effect = update
+
+    errors = _manager(service).update_line_item_budgets({"11": (100.0, "cpm"), "22": (50.0, "cpm")})
+
+    assert errors["11"] is None
+    assert "ALREADY_STARTED" in errors["22"]
+    assert service.updateLineItems.call_count == 3  # The batch, then each line item
+
+
+def test_pause_is_one_line_item_action_for_all_line_items():
+    service = Mock()
+    service.performLineItemAction.return_value = {"numChanges": 2}
+
+    errors = _manager(service).perform_line_item_action(["11", "22"], "PauseLineItems")
+
+    assert errors == {"11": None, "22": None}
+    action, statement = service.performLineItemAction.call_args.args
+    assert action == {"xsi_type": "PauseLineItems"}
+    assert statement["query"].startswith("WHERE id IN (11, 22)")
+
+
+def _gam_adapter(packages):
+    from src.adapters.google_ad_manager import GoogleAdManager
+
+    adapter = Mock(spec=GoogleAdManager)
+    adapter.log = Mock()
+    adapter.tenant_id = "tenant_1"
+    adapter._requires_manual_approval = Mock(return_value=False)
+    adapter.orders_manager = Mock()
+    session = MagicMock()
+    session.scalars.return_value.all.return_value = packages
+    return adapter, session
+
+
+def _package(package_id, line_item_id, spend=0.0):
+    package = Mock()
+    package.package_id = package_id
+    package.package_config = {
+        "platform_line_item_id": line_item_id,
+        "pricing": {"model": "cpm"},
+        "delivery_metrics": {"spend": spend},
+    }
+    return package
+
+
+def test_gam_update_packages_batches_changes_and_reports_each_result():
+    from src.adapters.google_ad_manager import GoogleAdManager
+
+    pkg_a, pkg_b, pkg_c = _package("pkg_a", "11"), _package("pkg_b", "22", spend=500.0), _package("pkg_c", "33")
+    adapter, session = _gam_adapter([pkg_a, pkg_b, pkg_c])
+    adapter.orders_manager.update_line_item_budgets.return_value = {"11": None}
+    adapter.orders_manager.perform_line_item_action.return_value = {"22": None, "33": "NOT_ALLOWED"}
+    updates = [
+        AdapterPackageUpdate(package_id="pkg_a", action="update_package_budget", budget=1000),
+        AdapterPackageUpdate(package_id="pkg_b", action="update_package_budget", budget=100),  # Below spend
+        AdapterPackageUpdate(package_id="pkg_b", action="pause_package"),
+        AdapterPackageUpdate(package_id="pkg_c", action="pause_package"),
+        AdapterPackageUpdate(package_id="pkg_x", action="pause_package"),
+    ]
+
+    with (
+        patch("src.core.database.database_session.get_db_session") as get_db_session,
+        patch("sqlalchemy.orm.attributes.flag_modified"),
+    ):
+        get_db_session.return_value.__enter__.return_value = session
+        results = GoogleAdManager.update_packages(adapter, "mb_1", "buyer_1", updates, datetime.now(UTC))
+
+    assert [r.error.code if r.error else None for r in results] == [
+        None,
+        "budget_below_delivery",
+        None,
+        "gam_update_failed",
+        "package_not_found",
+    ]
+    assert results[3].error.details == {"package_id": "pkg_c", "line_item_id": "33"}
+    adapter.orders_manager.update_line_item_budgets.assert_called_once_with({"11": (1000.0, "cpm")})
+    adapter.orders_manager.perform_line_item_action.assert_called_once_with(["22", "33"], "PauseLineItems")
+    assert pkg_a.package_config["budget"] == 1000.0
+    session.commit.assert_called_once()
+
+
+def test_default_update_packages_applies_every_change_through_update_media_buy():
+    adapter = Mock(spec=AdServerAdapter)
+    adapter.update_media_buy.side_effect = [
+        UpdateMediaBuyError(errors=[Error(code="package_not_found", message="Package pkg_a not found")]),
+        UpdateMediaBuySuccess(media_buy_id="mb_1", buyer_ref="buyer_1", affected_packages=[]),
+    ]
+    updates = [
+        AdapterPackageUpdate(package_id="pkg_a", action="update_package_budget", budget=1500.75),
+        AdapterPackageUpdate(package_id="pkg_b", action="resume_package"),
+    ]
+
+    results = AdServerAdapter.update_packages(adapter, "mb_1", "buyer_1", updates, datetime.now(UTC))
+
+    assert results[0].error.code == "package_not_found"
+    assert results[1].error is None
+    assert adapter.update_media_buy.call_args_list[0].kwargs["budget"] == 1500
+    assert adapter.update_media_buy.call_args_list[1].kwargs["action"] == "resume_package"
@@ -0,0 +1,97 @@
+"""Tests for page-by-page GAM inventory discovery and the streaming inventory writer."""
+
+import re
+from unittest.mock import MagicMock, Mock
+
+from src.adapters.gam_inventory_discovery import AdUnit, CustomTargetingValue, GAMInventoryDiscovery
+from src.services.gam_inventory_service import GAMInventoryService
+
+
+def _paged_client(method_name, rows):
+    """GAM client whose service pages `rows` by the statement's LIMIT/OFFSET."""
+    statements = []
+
+    def fetch(statement):
+        statements.append(statement)
+        limit, offset = map(int, re.search(r"LIMIT (\d+) OFFSET (\d+)", statement["query"]).groups())
+        return {"results": rows[offset : offset + limit]}
+
+    client = Mock()
+    client.GetService.return_value = Mock(**{f"{method_name}.side_effect": fetch})
+    return client, statements
+
+
+def _gam_value(value_id, display_name=None):
+    return {
+        "id": value_id,
+        "customTargetingKeyId": 7,
+        "name": f"value_{value_id}",
+        "displayName": display_name,
+        "matchType": None,
+        "status": "ACTIVE",
+    }
+
+
+def test_values_are_streamed_page_by_page_without_being_kept():
+    client, statements = _paged_client("getCustomTargetingValuesByStatement", [_gam_value(i) for i in range(1200)])
+    discovery = GAMInventoryDiscovery(client, "tenant_1")
+
+    pages = list(discovery.iter_custom_targeting_values("7"))
+
+    assert [len(page) for page in pages] == [500, 500, 200]
+    assert len(statements) == 4  # The empty fourth page ends the stream
+    assert discovery.custom_targeting_values == {}
+    value = pages[0][0]
+    # Null SOAP fields fall back to the same defaults as missing ones
+    assert (value.display_name, value.match_type) == ("value_0", "EXACT")
+    assert not hasattr(value, "__dict__")
+
+
+def test_value_limit_stops_paging_mid_page():
+    client, statements = _paged_client("getCustomTargetingValuesByStatement", [_gam_value(i) for i in range(50)])
+
+    values = GAMInventoryDiscovery(client, "tenant_1").discover_custom_targeting_values_for_key("7", max_values=30)
+
+    assert [v.id for v in values] == [str(i) for i in range(30)]
+    assert len(statements) == 1
+
+
+def test_inventory_pages_are_written_in_batches_with_one_id_lookup():
+    db = MagicMock()
+    db.execute.return_value.all.return_value = [Mock(inventory_id="3", id=99)]
+    service = GAMInventoryService(db)
+    flushed = []
+    service._flush_batch = lambda to_insert, to_update: flushed.append((len(to_insert), len(to_update)))
+    pages = iter([[_label(i) for i in range(300)], [], [_label(i) for i in range(300, 600)]])
+
+    written = service._write_inventory_pages("tenant_1", "label", pages, sync_time=Mock())
+
+    assert written == 600
+    db.execute.assert_called_once()
+    assert flushed == [(499, 1), (100, 0)]
+
+
+def _label(label_id):
+    return Mock(id=str(label_id), is_active=True, label_type="COMPETITIVE_EXCLUSION")
+
+
+def test_ad_unit_tree_nests_children_under_their_parents():
+    discovery = GAMInventoryDiscovery(Mock(), "tenant_1")
+    for unit_id, parent_id in [("1", None), ("2", "1"), ("3", "2"), ("4", "1"), ("5", None)]:
+        discovery.ad_units[unit_id] = AdUnit.from_gam_object(
+            {"id": unit_id, "name": f"Unit {unit_id}", "adUnitCode": unit_id, "parentId": parent_id}
+        )
+
+    tree = discovery.build_ad_unit_tree()
+
+    def shape(node):
+        return (node["id"], [shape(child) for child in node["children"]])
+
+    assert [shape(node) for node in tree["root_units"]] == [("1", [("2", [("3", [])]), ("4", [])]), ("5", [])]
+    assert tree["total_units"] == 5
+
+
+def test_records_still_round_trip_through_the_cache_format():
+    value = CustomTargetingValue.from_gam_object(_gam_value(1, display_name="One"))
+
+    assert CustomTargetingValue(**value.to_dict()) == value
@@ -0,0 +1,154 @@
+"""Tests for incremental, status-partitioned GAM orders and line items sync."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, Mock, call, patch
+
+from sqlalchemy.dialects import postgresql
+
+from src.adapters.gam_orders_discovery import (
+    LINE_ITEM_STATUS_PARTITIONS,
+    ORDER_STATUS_PARTITIONS,
+    GAMOrdersDiscovery,
+)
+from src.core.database.models import GAMLineItem, GAMOrder
+from src.services.gam_orders_service import ORDERS_SYNC_OVERLAP, GAMOrdersService
+
+
+def _gam_order(order_id, status):
+    return {"id": order_id, "name": f"Order {order_id}", "status": status}
+
+
+def _gam_line_item(line_item_id, status):
+    return {
+        "id": line_item_id,
+        "orderId": 1,
+        "name": f"LI {line_item_id}",
+        "status": status,
+        "lineItemType": "STANDARD",
+    }
+
+
+def _client(method_name, rows_by_status):
+    """GAM client whose service pages the rows matching the statement's status filter."""
+    statements = []
+
+    def fetch(statement):
+        statements.append(statement)
+        query = statement["query"]
+        if "OFFSET 0" not in query:
+            return {}
+        # A named partition lists its statuses; the catch-all lists every status it excludes
+        named = "status IN" in query
+        return {"results": [row for s, rows in rows_by_status.items() if (f"'{s}'" in query) == named for row in rows]}
+
+    client = Mock()
+    client.GetService.return_value = Mock(**{f"{method_name}.side_effect": fetch})
+    return client, statements
+
+
+def test_orders_are_paged_across_every_status_partition():
+    client, statements = _client(
+        "getOrdersByStatement",
+        {
+            "APPROVED": [_gam_order(1, "APPROVED")],
+            "PAUSED": [_gam_order(2, "PAUSED")],
+            "ARCHIVED": [_gam_order(3, "X")],
+        },
+    )
+
+    orders = GAMOrdersDiscovery(client, "tenant_1").discover_orders()
+
+    assert sorted(order.order_id for order in orders) == ["1", "2", "3"]
+    first_pages = [s["query"] for s in statements if "OFFSET 0" in s["query"]]
+    assert len(first_pages) == len(ORDER_STATUS_PARTITIONS)
+    # The catch-all partition excludes every named status, so nothing is read twice
+    assert any(q.startswith("WHERE status != 'DRAFT' AND") for q in first_pages)
+    assert all("lastModifiedDateTime" not in q for q in first_pages)
+
+
+def test_incremental_line_items_always_refetch_delivering_partitions():
+    client, statements = _client("getLineItemsByStatement", {"DELIVERING": [_gam_line_item(10, "DELIVERING")]})
+    since = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+    line_items = GAMOrdersDiscovery(client, "tenant_1").discover_line_items(since=since)
+
+    assert [li.line_item_id for li in line_items] == ["10"]
+    first_pages = [s["query"] for s in statements if "OFFSET 0" in s["query"]]
+    assert len(first_pages) == len(LINE_ITEM_STATUS_PARTITIONS)
+    incremental = [q for q in first_pages if "lastModifiedDateTime >= :since" in q]
+    assert len(incremental) == len(LINE_ITEM_STATUS_PARTITIONS) - 2
+    assert not any("'DELIVERING'" in q or "'READY'" in q for q in incremental if "status IN" in q)
+    # Each partition uses its own service (zeep clients are not shared across threads)
+    assert client.GetService.call_count == len(LINE_ITEM_STATUS_PARTITIONS)
+
+
+def test_line_items_upsert_in_one_statement_and_keep_stats_gam_did_not_return():
+    db = Mock()
+    service = GAMOrdersService(db)
+    rows = [{"tenant_id": "t1", "line_item_id": str(i), "name": f"LI {i}", "stats_clicks": None} for i in range(3)]
+
+    service._upsert_rows(GAMLineItem, ["tenant_id", "line_item_id"], rows, keep_existing_when_null=("stats_clicks",))
+
+    db.execute.assert_called_once()
+    sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (tenant_id, line_item_id) DO UPDATE" in sql
+    assert "coalesce(excluded.stats_clicks, gam_line_items.stats_clicks)" in sql
+    assert "name = excluded.name" in sql
+
+
+def test_upsert_refreshes_readiness_of_affected_media_buys_per_tenant():
+    db = Mock()
+    service = GAMOrdersService(db)
+    rows = [
+        {"tenant_id": "t1", "order_id": "11", "name": "A"},
+        {"tenant_id": "t1", "order_id": "12", "name": "B"},
+        {"tenant_id": "t2", "order_id": "21", "name": "C"},
+    ]
+
+    with patch("src.services.gam_orders_service.store_readiness_snapshots") as store_snapshots:
+        service._upsert_rows(GAMOrder, ["tenant_id", "order_id"], rows)
+
+    assert store_snapshots.call_args_list == [call(db, "t1", ["11", "12"]), call(db, "t2", ["21"])]
+
+
+def _session_with_last_sync(started_at):
+    session = MagicMock()
+    session.scalars.return_value.first.return_value = Mock(started_at=started_at) if started_at else None
+    return session
+
+
+def test_incremental_sync_starts_from_last_completed_sync_and_reports_progress():
+    started_at = datetime(2026, 3, 1, 12, 0)
+    service = GAMOrdersService(_session_with_last_sync(started_at))
+    discovery = Mock()
+    discovery.discover_orders.return_value = []
+    discovery.discover_line_items.return_value = []
+    discovery.build_summary.return_value = {"orders": {"total": 0}}
+
+    with (
+        patch("src.services.gam_orders_service.GAMOrdersDiscovery", return_value=discovery),
+        patch("src.services.gam_orders_service._update_sync_progress") as update_progress,
+    ):
+        summary = service.sync_tenant_orders("tenant_1", Mock(), sync_id="orders_sync_1")
+
+    since = discovery.discover_orders.call_args.kwargs["since"]
+    assert since == started_at.replace(tzinfo=UTC) - ORDERS_SYNC_OVERLAP
+    assert discovery.discover_line_items.call_args.kwargs["since"] == since
+    assert "rows_per_second" in summary
+    progress = [c.args[1] for c in update_progress.call_args_list]
+    assert [p["phase_num"] for p in progress] == [1, 2, 3, 4]
+    assert set(progress[0]) >= {"phase", "phase_num", "total_phases", "count", "mode", "rows_per_second"}
+    assert progress[0]["mode"] == "incremental"
+
+
+def test_sync_without_a_completed_sync_falls_back_to_full():
+    service = GAMOrdersService(_session_with_last_sync(None))
+    discovery = Mock()
+    discovery.discover_orders.return_value = []
+    discovery.discover_line_items.return_value = []
+    discovery.build_summary.return_value = {}
+
+    with patch("src.services.gam_orders_service.GAMOrdersDiscovery", return_value=discovery):
+        service.sync_tenant_orders("tenant_1", Mock())
+
+    assert discovery.discover_orders.call_args.kwargs["since"] is None
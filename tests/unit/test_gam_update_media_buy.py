@@ -240,7 +240,7 @@ def test_pause_resume_package_actions_work():
 
 
 def test_pause_resume_media_buy_actions_work():
-    """Test that pause/resume media buy actions work via GAM API (all packages)."""
+    """Test that pause/resume media buy actions pause/resume all line items with one batched GAM action."""
     from src.adapters.google_ad_manager import GoogleAdManager
 
     media_buy_id = "mb_test123"
@@ -263,8 +263,9 @@ def test_pause_resume_media_buy_actions_work():
     mock_adapter.workflow_manager = Mock()
     # Mock orders_manager for GAM API sync
     mock_adapter.orders_manager = Mock()
-    mock_adapter.orders_manager.pause_line_item = Mock(return_value=True)
-    mock_adapter.orders_manager.resume_line_item = Mock(return_value=True)
+    mock_adapter.orders_manager.perform_line_item_action = Mock(
+        side_effect=lambda line_item_ids, action: dict.fromkeys(line_item_ids)
+    )
 
     with patch("src.core.database.database_session.get_db_session") as mock_db:
         mock_session = MagicMock()
@@ -286,18 +287,15 @@ def test_pause_resume_media_buy_actions_work():
             today=datetime.now(UTC),
         )
 
-        # Verify pause was called for both packages
-        assert mock_adapter.orders_manager.pause_line_item.call_count == 2
-        mock_adapter.orders_manager.pause_line_item.assert_any_call("111")
-        mock_adapter.orders_manager.pause_line_item.assert_any_call("222")
+        # Verify both line items were paused in one call
+        mock_adapter.orders_manager.perform_line_item_action.assert_called_once_with(["111", "222"], "PauseLineItems")
 
         # Verify success response
         assert isinstance(result, UpdateMediaBuySuccess), "pause_media_buy should return success"
         assert result.media_buy_id == media_buy_id
 
         # Reset mocks for next test
-        mock_adapter.orders_manager.pause_line_item.reset_mock()
-        mock_adapter.orders_manager.resume_line_item.reset_mock()
+        mock_adapter.orders_manager.perform_line_item_action.reset_mock()
         mock_scalars.all.return_value = [mock_package1, mock_package2]  # Reset package query
 
         # Test resume_media_buy
@@ -311,10 +309,8 @@ def test_pause_resume_media_buy_actions_work():
             today=datetime.now(UTC),
         )
 
-        # Verify resume was called for both packages
-        assert mock_adapter.orders_manager.resume_line_item.call_count == 2
-        mock_adapter.orders_manager.resume_line_item.assert_any_call("111")
-        mock_adapter.orders_manager.resume_line_item.assert_any_call("222")
+        # Verify both line items were resumed in one call
+        mock_adapter.orders_manager.perform_line_item_action.assert_called_once_with(["111", "222"], "ResumeLineItems")
 
         # Verify success response
         assert isinstance(result, UpdateMediaBuySuccess), "resume_media_buy should return success"
@@ -0,0 +1,188 @@
+"""Tests for the concurrent get_products pipeline and its latency budget."""
+
+import asyncio
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastmcp.exceptions import ToolError
+
+from src.core.tools.products import _get_products_impl, _StageTimings
+from tests.helpers.adcp_factories import create_test_product
+
+
+def _make_request(brief: str = "Athletic footwear"):
+    req = MagicMock()
+    req.brand_manifest = None
+    req.brief = brief
+    req.filters = None
+    req.context = None
+    req.min_exposures = None
+    return req
+
+
+def _patch_pipeline(stack: ExitStack, tenant: dict, products: list, variants=([], False)) -> dict:
+    """Patch the get_products collaborators; returns the mocks by name."""
+    mocks = {
+        "principal": stack.enter_context(patch("src.core.tools.products.get_principal_from_context")),
+        "principal_obj": stack.enter_context(patch("src.core.tools.products.get_principal_object")),
+        "testing": stack.enter_context(patch("src.core.tools.products.get_testing_context")),
+        "hooks": stack.enter_context(patch("src.core.tools.products.apply_testing_hooks")),
+        "load": stack.enter_context(patch("src.core.tools.products._load_tenant_products")),
+        "variants": stack.enter_context(
+            patch("src.services.dynamic_products.generate_variants_within_budget", new_callable=AsyncMock)
+        ),
+        "pricing": stack.enter_context(patch("src.services.dynamic_pricing_service.DynamicPricingService")),
+        "db": stack.enter_context(patch("src.core.tools.products.get_db_session")),
+        "audit": stack.enter_context(patch("src.core.tools.products.get_audit_logger")),
+        "rank": stack.enter_context(patch("src.core.tools.products._rank_products", new_callable=AsyncMock)),
+    }
+    stack.enter_context(patch("src.core.tools.products.set_current_tenant"))
+    mocks["principal"].return_value = (None, tenant)
+    mocks["principal_obj"].return_value = None
+    mocks["testing"].return_value = None
+    mocks["hooks"].side_effect = lambda data, *args, **kwargs: data
+    mocks["load"].return_value = products
+    mocks["variants"].return_value = variants
+    mocks["pricing"].return_value.enrich_products_with_pricing.side_effect = lambda products, **kwargs: products
+    mocks["rank"].side_effect = lambda products, prompt, brief: products
+    return mocks
+
+
+class TestStageTimings:
+    @pytest.mark.asyncio
+    async def test_run_records_stage_and_returns_result(self):
+        timings = _StageTimings()
+
+        async def stage():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        assert await timings.run("policy_check", stage()) == "done"
+        assert timings.ms["policy_check"] >= 10
+
+    def test_measure_records_stage_on_error(self):
+        timings = _StageTimings()
+
+        with pytest.raises(RuntimeError):
+            with timings.measure("dynamic_pricing"):
+                raise RuntimeError("boom")
+
+        assert "dynamic_pricing" in timings.ms
+
+
+class TestLatencyBudget:
+    @pytest.mark.asyncio
+    async def test_within_budget_has_no_degraded_stages(self):
+        tenant = {"tenant_id": "t1", "brand_manifest_policy": "public", "advertising_policy": {}}
+        with ExitStack() as stack:
+            mocks = _patch_pipeline(stack, tenant, [create_test_product(product_id="p1")])
+
+            response = await _get_products_impl(_make_request(), MagicMock())
+
+        assert [p.product_id for p in response.products] == ["p1"]
+        assert response.ext is None
+        mocks["audit"].assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deferred_variants_are_reported(self):
+        tenant = {"tenant_id": "t1", "brand_manifest_policy": "public", "advertising_policy": {}}
+        with ExitStack() as stack:
+            mocks = _patch_pipeline(stack, tenant, [create_test_product(product_id="p1")], variants=([], True))
+
+            response = await _get_products_impl(_make_request(), MagicMock())
+
+        assert response.model_dump(mode="json")["ext"] == {"degraded_stages": ["dynamic_variants"]}
+        details = mocks["audit"].return_value.log_operation.call_args.kwargs["details"]
+        assert details["degraded_stages"] == ["dynamic_variants"]
+        assert "product_load" in details["stage_timings_ms"]
+
+    @pytest.mark.asyncio
+    async def test_spent_budget_skips_ai_ranking(self):
+        tenant = {
+            "tenant_id": "t1",
+            "brand_manifest_policy": "public",
+            "advertising_policy": {},
+            "product_ranking_prompt": "Rank by relevance",
+            "products_latency_budget_ms": 1,
+        }
+        with ExitStack() as stack:
+            mocks = _patch_pipeline(stack, tenant, [create_test_product(product_id="p1")])
+
+            async def slow_variants(*args, **kwargs):
+                await asyncio.sleep(0.01)
+                return [], False
+
+            mocks["variants"].side_effect = slow_variants
+
+            response = await _get_products_impl(_make_request(), MagicMock())
+
+        assert [p.product_id for p in response.products] == ["p1"]
+        assert response.model_dump(mode="json")["ext"] == {"degraded_stages": ["ai_ranking"]}
+        mocks["rank"].assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_slow_ranking_returns_unranked_products(self):
+        tenant = {
+            "tenant_id": "t1",
+            "brand_manifest_policy": "public",
+            "advertising_policy": {},
+            "product_ranking_prompt": "Rank by relevance",
+            "products_latency_budget_ms": 200,
+        }
+        with ExitStack() as stack:
+            mocks = _patch_pipeline(
+                stack, tenant, [create_test_product(product_id="p1"), create_test_product(product_id="p2")]
+            )
+
+            async def slow_rank(products, prompt, brief):
+                await asyncio.sleep(5)
+                return list(reversed(products))
+
+            mocks["rank"].side_effect = slow_rank
+
+            response = await _get_products_impl(_make_request(), MagicMock())
+
+        assert [p.product_id for p in response.products] == ["p1", "p2"]
+        assert response.model_dump(mode="json")["ext"] == {"degraded_stages": ["ai_ranking"]}
+
+
+class TestConcurrentStages:
+    @pytest.mark.asyncio
+    async def test_blocked_brief_never_reaches_signals_agents(self):
+        tenant = {"tenant_id": "t1", "brand_manifest_policy": "public", "advertising_policy": {"enabled": True}}
+
+        async def blocked_policy(*args, **kwargs):
+            raise ToolError("POLICY_VIOLATION", "Brief blocked by advertising policy")
+
+        with ExitStack() as stack:
+            mocks = _patch_pipeline(stack, tenant, [])
+            stack.enter_context(patch("src.core.tools.products._check_brief_policy", side_effect=blocked_policy))
+
+            with pytest.raises(ToolError):
+                await _get_products_impl(_make_request(), MagicMock())
+
+            mocks["variants"].assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_variants_start_after_allowed_policy(self):
+        tenant = {"tenant_id": "t1", "brand_manifest_policy": "public", "advertising_policy": {"enabled": True}}
+        order = []
+
+        async def allowed_policy(*args, **kwargs):
+            order.append("policy_check")
+            return None, None
+
+        async def variants(*args, **kwargs):
+            order.append("dynamic_variants")
+            return [], False
+
+        with ExitStack() as stack:
+            mocks = _patch_pipeline(stack, tenant, [create_test_product(product_id="p1")])
+            mocks["variants"].side_effect = variants
+            stack.enter_context(patch("src.core.tools.products._check_brief_policy", side_effect=allowed_policy))
+
+            response = await _get_products_impl(_make_request(), MagicMock())
+
+        assert [p.product_id for p in response.products] == ["p1"]
+        assert order == ["policy_check", "dynamic_variants"]
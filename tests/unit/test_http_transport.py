@@ -0,0 +1,122 @@
+"""Tests for the shared pooled HTTP transport used by the REST ad server adapters."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.adapters.http_transport import (
+    DEFAULT_TIMEOUT,
+    AdapterHttpTransport,
+    RateLimiter,
+    close_http_transports,
+    get_http_transport,
+)
+
+
+def _response(status, headers=None):
+    response = Mock(spec=requests.Response)
+    response.status_code = status
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def transport():
+    transport = AdapterHttpTransport("kevel", rate_limit_per_second=1000)
+    transport.session = Mock()
+    with patch("src.adapters.http_transport.time.sleep") as sleep:
+        transport.sleep = sleep
+        yield transport
+
+
+def test_get_is_retried_on_server_errors_with_default_timeout(transport):
+    ok = _response(200)
+    transport.session.request.side_effect = [_response(503), requests.exceptions.ReadTimeout("slow"), ok]
+
+    assert transport.get("https://api.kevel.co/v1/flight") is ok
+
+    assert transport.session.request.call_count == 3
+    assert transport.session.request.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+    assert transport.sleep.call_count == 2
+
+
+def test_post_is_only_retried_when_not_processed(transport):
+    error = _response(500)
+    transport.session.request.return_value = error
+    assert transport.post("https://api.kevel.co/v1/campaign", json={}) is error
+    assert transport.session.request.call_count == 1
+
+    transport.session.request.reset_mock()
+    transport.session.request.side_effect = requests.exceptions.ReadTimeout("may have been created")
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        transport.post("https://api.kevel.co/v1/campaign", json={})
+    assert transport.session.request.call_count == 1
+
+    transport.session.request.reset_mock()
+    ok = _response(200)
+    transport.session.request.side_effect = [_response(429, {"Retry-After": "2"}), ok]
+    assert transport.post("https://api.kevel.co/v1/campaign", json={}) is ok
+    transport.sleep.assert_called_with(2.0)
+
+
+def test_retries_give_up_after_max_attempts(transport):
+    transport.session.request.return_value = _response(502)
+
+    assert transport.put("https://api.kevel.co/v1/flight/1", json={}).status_code == 502
+    assert transport.session.request.call_count == transport.max_retries + 1
+
+
+def test_bulk_runs_concurrently_and_keeps_item_order():
+    transport = AdapterHttpTransport("kevel", bulk_concurrency=4)
+    barrier = threading.Barrier(4, timeout=5)
+
+    def call(item):
+        barrier.wait()  # Only passes if all four calls are in flight together
+        return item * 10
+
+    assert transport.bulk(call, [1, 2, 3, 4]) == [10, 20, 30, 40]
+
+
+def test_bulk_finishes_every_call_before_raising_the_first_failure():
+    transport = AdapterHttpTransport("kevel", bulk_concurrency=3)
+    done = []
+
+    def call(item):
+        if item == 2:
+            raise ValueError("flight 2 rejected")
+        time.sleep(0.01)
+        done.append(item)
+        return item
+
+    with pytest.raises(ValueError, match="flight 2"):
+        transport.bulk(call, [1, 2, 3])
+    assert sorted(done) == [1, 3]
+
+    results = transport.bulk(call, [1, 2, 3], return_exceptions=True)
+    assert results[0] == 1 and results[2] == 3
+    assert isinstance(results[1], ValueError)
+
+
+def test_rate_limiter_spaces_requests_beyond_the_burst():
+    limiter = RateLimiter(rate_per_second=10, burst=2)
+
+    with patch("src.adapters.http_transport.time.sleep") as sleep:
+        for _ in range(4):
+            limiter.acquire()
+
+    waits = [c.args[0] for c in sleep.call_args_list]
+    assert len(waits) == 2
+    assert waits[0] == pytest.approx(0.1, abs=0.02)
+    assert waits[1] == pytest.approx(0.2, abs=0.02)
+
+
+def test_transports_are_shared_per_network_account():
+    try:
+        assert get_http_transport("kevel", "123") is get_http_transport("kevel", "123")
+        assert get_http_transport("kevel", "123") is not get_http_transport("kevel", "456")
+        assert get_http_transport("xandr", "123").rate_limiter.rate == 5.0
+    finally:
+        close_http_transports()
@@ -0,0 +1,171 @@
+"""Tests for the idempotency layer on the mutating tools."""
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+from unittest.mock import Mock, patch
+
+import pytest
+from fastmcp.exceptions import ToolError
+from sqlalchemy.dialects import postgresql
+
+from src.core.schemas import SyncCreativesResponse
+from src.core.tool_context import ToolContext
+from src.services.idempotency import (
+    STATUS_COMPLETED,
+    STATUS_IN_PROGRESS,
+    IdempotencyScope,
+    IdempotencyStore,
+    IdempotentExecutor,
+    StoredRecord,
+    build_scope,
+    idempotent,
+    model_codec,
+    request_hash,
+)
+
+CODEC = model_codec(SyncCreativesResponse)
+
+
+def _scope(key="key-1", digest="abc", ttl_seconds=3600):
+    return IdempotencyScope("t1", "p1", "sync_creatives", key, digest, ttl_seconds)
+
+
+def _ctx(idempotency_key=None):
+    return ToolContext(
+        context_id="ctx_1",
+        tenant_id="t1",
+        principal_id="p1",
+        tool_name="sync_creatives",
+        request_timestamp=datetime.now(UTC),
+        metadata={"idempotency_key": idempotency_key},
+    )
+
+
+def test_claim_takes_over_only_expired_records_or_abandoned_leases():
+    now = datetime(2026, 3, 1, tzinfo=UTC)
+    stmt = IdempotencyStore(lease_seconds=300).claim_statement(_scope(ttl_seconds=0), now)
+
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (tenant_id, principal_id, tool_name, idempotency_key) DO UPDATE" in sql
+    assert "idempotency_records.expires_at <=" in sql
+    assert "idempotency_records.locked_until <" in sql
+    assert "RETURNING" in sql
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    # An in-progress record outlives its lease even when completed responses are not replayed
+    assert params["expires_at"] == params["locked_until"]
+
+
+def test_client_key_replays_for_ttl_and_derived_key_includes_request_hash():
+    arguments = {"creatives": [{"creative_id": "c1"}], "dry_run": False}
+
+    with patch("src.core.auth.get_principal_from_context", return_value=("p1", {"tenant_id": "t1"})):
+        client = build_scope("sync_creatives", arguments, _ctx("retry-7"), lambda a: None, replay_ttl_seconds=0)
+        derived = build_scope("sync_creatives", arguments, _ctx(), lambda a: "ref", replay_ttl_seconds=0)
+
+    assert (client.key, client.ttl_seconds) == ("retry-7", 24 * 3600)
+    assert derived.key == f"ref:{request_hash(arguments)}"
+    assert derived.ttl_seconds == 0
+    assert client.request_hash == derived.request_hash
+
+
+def test_completed_record_is_replayed_without_running_the_tool():
+    stored = SyncCreativesResponse(creatives=[], dry_run=False)
+    store = Mock()
+    store.claim.return_value = StoredRecord(STATUS_COMPLETED, "abc", CODEC.encode(stored))
+    call = Mock()
+
+    result = IdempotentExecutor(store).run_sync(_scope(), CODEC, call)
+
+    call.assert_not_called()
+    assert isinstance(result, SyncCreativesResponse)
+    assert result.creatives == []
+
+
+def test_key_reused_with_different_request_is_rejected():
+    store = Mock()
+    store.claim.return_value = StoredRecord(STATUS_IN_PROGRESS, "other-hash", None)
+
+    with pytest.raises(ToolError, match="IDEMPOTENCY_KEY_REUSED"):
+        IdempotentExecutor(store).run_sync(_scope(), CODEC, Mock())
+
+
+def test_failed_execution_releases_the_claim():
+    store = Mock()
+    store.claim.return_value = None
+
+    with pytest.raises(RuntimeError):
+        IdempotentExecutor(store).run_sync(_scope(), CODEC, Mock(side_effect=RuntimeError("gam down")))
+
+    store.release.assert_called_once()
+    store.complete.assert_not_called()
+
+
+def test_store_unavailable_runs_the_tool_unprotected():
+    store = Mock()
+    store.claim.side_effect = RuntimeError("no database")
+
+    assert IdempotentExecutor(store).run_sync(_scope(), CODEC, lambda: "ran") == "ran"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_share_one_execution():
+    store = Mock()
+    store.claim.return_value = None
+    calls = 0
+
+    async def create():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return SyncCreativesResponse(creatives=[])
+
+    executor = IdempotentExecutor(store)
+    first, second = await asyncio.gather(
+        executor.run_async(_scope(), CODEC, create), executor.run_async(_scope(), CODEC, create)
+    )
+
+    assert calls == 1
+    assert first is second
+    store.claim.assert_called_once()
+    store.complete.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_mcp_sync_creatives_waits_for_duplicates_off_the_event_loop():
+    """A duplicate sync_creatives polling for the key holder must not block the event loop."""
+    from src.core.tools import creatives
+
+    loop_thread = threading.get_ident()
+    impl_threads = []
+
+    def blocking_impl(**kwargs):
+        impl_threads.append(threading.get_ident())
+        return SyncCreativesResponse(creatives=[])
+
+    with patch.object(creatives, "_sync_creatives_impl", blocking_impl):
+        await creatives.sync_creatives(creatives=[], ctx=_ctx())
+
+    assert impl_threads and loop_thread not in impl_threads
+
+
+def test_nested_idempotent_calls_are_not_keyed_again():
+    store = Mock()
+    store.claim.return_value = None
+    executor = IdempotentExecutor(store)
+
+    @idempotent("sync_creatives", CODEC, natural_key=lambda a: None)
+    def inner(ctx=None):
+        return SyncCreativesResponse(creatives=[])
+
+    @idempotent("update_media_buy", CODEC, natural_key=lambda a: None)
+    def outer(ctx=None):
+        return inner(ctx=ctx)
+
+    with (
+        patch("src.services.idempotency.get_idempotent_executor", return_value=executor),
+        patch("src.core.auth.get_principal_from_context", return_value=("p1", {"tenant_id": "t1"})),
+    ):
+        outer(ctx=_ctx())
+
+    assert [c.args[0].tool_name for c in store.claim.call_args_list] == ["update_media_buy"]
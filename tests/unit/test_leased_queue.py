@@ -0,0 +1,67 @@
+"""Unit tests for the shared leased queue worker pool."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from src.core.database.models import CreativeReviewJob, WebhookOutbox
+from src.services.creative_review_queue import CreativeReviewWorkerPool
+from src.services.leased_queue import retry_delay_seconds
+from src.services.webhook_outbox import WebhookOutboxDispatcher
+
+
+def _executed_sql(mock_db) -> str:
+    stmt = mock_db.return_value.__enter__.return_value.execute.call_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_retry_delay_caps_at_last_step():
+    assert 5 <= retry_delay_seconds(1, (5, 30)) <= 5.5
+    assert 30 <= retry_delay_seconds(9, (5, 30)) <= 33
+
+
+def test_counted_reschedule_records_attempt_and_error():
+    pool = CreativeReviewWorkerPool(worker_count=1)
+
+    with patch("src.services.leased_queue.get_db_session") as mock_db:
+        pool._reschedule(7, timedelta(seconds=30), "boom")
+
+    sql = _executed_sql(mock_db)
+    assert sql.startswith(f"UPDATE {CreativeReviewJob.__tablename__}")
+    assert "attempt_count=(creative_review_jobs.attempt_count +" in sql
+    assert "last_error=" in sql
+    assert "locked_until=" in sql
+
+
+def test_uncounted_reschedule_keeps_attempts_and_error():
+    """Circuit-breaker deferrals must not burn an attempt or clear the previous error."""
+    dispatcher = WebhookOutboxDispatcher(worker_count=1)
+
+    with patch("src.services.leased_queue.get_db_session") as mock_db:
+        dispatcher._reschedule(7, timedelta(seconds=60), None, False)
+
+    sql = _executed_sql(mock_db)
+    assert sql.startswith(f"UPDATE {WebhookOutbox.__tablename__}")
+    assert "attempt_count" not in sql
+    assert "last_error" not in sql
+    assert "next_attempt_at=" in sql
+
+
+def test_purge_targets_each_queue_finished_rows_at_most_hourly():
+    dispatcher = WebhookOutboxDispatcher(worker_count=1)
+    pool = CreativeReviewWorkerPool(worker_count=1)
+
+    with patch("src.services.leased_queue.get_db_session") as mock_db:
+        mock_db.return_value.__enter__.return_value.execute.return_value = MagicMock(rowcount=0)
+        dispatcher._maybe_purge()
+        outbox_sql = _executed_sql(mock_db)
+        pool._maybe_purge()
+        review_sql = _executed_sql(mock_db)
+        dispatcher._maybe_purge()
+        pool._maybe_purge()
+
+        assert mock_db.return_value.__enter__.return_value.execute.call_count == 2
+
+    assert "webhook_outbox.delivered_at <" in outbox_sql
+    assert "creative_review_jobs.completed_at <" in review_sql
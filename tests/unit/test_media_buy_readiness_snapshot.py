@@ -0,0 +1,227 @@
+"""Tests for the stored media buy readiness snapshot."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.admin.services.media_buy_readiness_service import (
+    MediaBuyReadinessService,
+    check_readiness_consistency,
+    compute_readiness_snapshots,
+    refresh_readiness_after_flush,
+    store_readiness_snapshots,
+)
+from src.core.database.models import Creative, CreativeAssignment, GAMOrder, MediaBuy
+
+NOW = datetime(2026, 3, 1, tzinfo=UTC)
+
+
+def _result(rows=None, scalar=None):
+    result = MagicMock()
+    result.all.return_value = rows or []
+    result.scalar.return_value = scalar
+    result.scalars.return_value = iter(rows or [])
+    return result
+
+
+def _snapshot(**overrides):
+    snapshot = {
+        "packages_total": 2,
+        "packages_with_creatives": 2,
+        "creatives_total": 2,
+        "creatives_approved": 2,
+        "creatives_pending": 0,
+        "creatives_rejected": 0,
+        "blocking_issues": [],
+        "warnings": [],
+        "gam_order_status": None,
+        "gam_line_items_total": 0,
+        "gam_line_items_ready": 0,
+    }
+    snapshot.update(overrides)
+    return snapshot
+
+
+def _media_buy(status="active", snapshot=None, start_offset_days=1) -> MediaBuy:
+    buy = MediaBuy(
+        media_buy_id="mb_1",
+        tenant_id="tenant1",
+        status=status,
+        start_date=(NOW + timedelta(days=start_offset_days)).date(),
+        end_date=(NOW + timedelta(days=30)).date(),
+    )
+    buy.readiness_snapshot = snapshot
+    return buy
+
+
+def test_compute_snapshot_counts_creatives_and_gam_status():
+    bind = MagicMock()
+    bind.execute.side_effect = [
+        _result([("mb_1", {"packages": [{"package_id": "p1"}, {"package_id": "p2"}]})]),
+        _result([("mb_1", "p1", "c1"), ("mb_1", "p1", "c2")]),
+        _result([("c1", "approved"), ("c2", "pending_review")]),
+        _result(scalar="google_ad_manager"),
+        _result([("mb_1", "PENDING_APPROVAL")]),
+        _result([("mb_1", "READY"), ("mb_1", "DRAFT")]),
+    ]
+
+    snapshots = compute_readiness_snapshots(bind, "tenant1", ["mb_1"])
+
+    assert snapshots["mb_1"] == _snapshot(
+        packages_with_creatives=1,
+        creatives_approved=1,
+        creatives_pending=1,
+        blocking_issues=["1 package(s) missing creative assignments"],
+        warnings=[
+            "1 creative(s) pending approval",
+            "GAM order is pending approval",
+            "1 GAM line item(s) need approval",
+        ],
+        gam_order_status="PENDING_APPROVAL",
+        gam_line_items_total=2,
+        gam_line_items_ready=1,
+    )
+    # One query per input table, regardless of the number of media buys
+    assert bind.execute.call_count == 6
+
+
+def test_compute_snapshot_skips_gam_for_other_ad_servers():
+    bind = MagicMock()
+    bind.execute.side_effect = [
+        _result([("mb_1", {"packages": [{"package_id": "p1"}]})]),
+        _result([]),
+        _result(scalar="mock"),
+    ]
+
+    snapshots = compute_readiness_snapshots(bind, "tenant1", ["mb_1"])
+
+    assert snapshots["mb_1"]["blocking_issues"] == [
+        "1 package(s) missing creative assignments",
+        "No creatives uploaded",
+    ]
+    assert snapshots["mb_1"]["gam_order_status"] is None
+
+
+def test_compute_snapshot_omits_missing_media_buys():
+    bind = MagicMock()
+    bind.execute.return_value = _result([])
+
+    assert compute_readiness_snapshots(bind, "tenant1", ["mb_missing"]) == {}
+    assert bind.execute.call_count == 1
+
+
+def test_readiness_derives_time_dependent_state_from_snapshot():
+    session = MagicMock()
+
+    scheduled = MediaBuyReadinessService.get_readiness_for_media_buy(_media_buy(snapshot=_snapshot()), session, NOW)
+    live = MediaBuyReadinessService.get_readiness_for_media_buy(
+        _media_buy(snapshot=_snapshot(), start_offset_days=-1), session, NOW
+    )
+
+    assert scheduled["state"] == "scheduled"
+    assert scheduled["is_ready_to_activate"]
+    assert live["state"] == "live"
+    session.execute.assert_not_called()
+
+
+def test_readiness_without_snapshot_computes_from_source_tables():
+    session = MagicMock()
+    with patch(
+        "src.admin.services.media_buy_readiness_service.compute_readiness_snapshots",
+        return_value={"mb_1": _snapshot(creatives_approved=1, creatives_pending=1)},
+    ) as compute:
+        readiness = MediaBuyReadinessService.get_readiness_for_media_buy(_media_buy(), session, NOW)
+
+    compute.assert_called_once_with(session, "tenant1", ["mb_1"])
+    assert readiness["state"] == "needs_creatives"
+
+
+def test_failed_media_buy_ignores_snapshot():
+    readiness = MediaBuyReadinessService.get_readiness_for_media_buy(
+        _media_buy(status="failed", snapshot=_snapshot()), MagicMock(), NOW
+    )
+
+    assert readiness["state"] == "failed"
+    assert readiness["blocking_issues"] == ["Media buy creation failed"]
+
+
+def test_store_keeps_media_buy_updated_at():
+    bind = MagicMock()
+    with patch(
+        "src.admin.services.media_buy_readiness_service.compute_readiness_snapshots",
+        return_value={"mb_1": _snapshot()},
+    ):
+        assert store_readiness_snapshots(bind, "tenant1", ["mb_1"]) == 1
+
+    stmt = bind.execute.call_args.args[0]
+    assert set(stmt.compile().params) >= {"readiness_snapshot", "readiness_updated_at"}
+    assert "updated_at=media_buys.updated_at" in str(stmt.compile()).replace(" ", "")
+
+
+def _flush_session(new=(), dirty=(), deleted=()):
+    session = MagicMock()
+    session.new = list(new)
+    session.dirty = list(dirty)
+    session.deleted = list(deleted)
+    return session
+
+
+def test_after_flush_refreshes_media_buys_of_new_assignments():
+    assignment = CreativeAssignment(tenant_id="tenant1", media_buy_id="mb_1", package_id="p1", creative_id="c1")
+    session = _flush_session(new=[assignment])
+
+    with patch("src.admin.services.media_buy_readiness_service.store_readiness_snapshots") as store:
+        refresh_readiness_after_flush(session, None)
+
+    store.assert_called_once_with(session.connection.return_value, "tenant1", ["mb_1"])
+
+
+def test_after_flush_maps_creative_approval_to_assigned_media_buys():
+    creative = Creative()
+    for name, value in {"tenant_id": "tenant1", "creative_id": "c1", "status": "pending_review"}.items():
+        set_committed_value(creative, name, value)
+    creative.status = "approved"
+    session = _flush_session(dirty=[creative])
+    connection = session.connection.return_value
+    connection.execute.return_value = _result(["mb_1", "mb_2"])
+
+    with patch("src.admin.services.media_buy_readiness_service.store_readiness_snapshots") as store:
+        refresh_readiness_after_flush(session, None)
+
+    store.assert_called_once_with(connection, "tenant1", ["mb_1", "mb_2"])
+
+
+def test_after_flush_ignores_unrelated_changes():
+    buy = MediaBuy()
+    for name, value in {"tenant_id": "tenant1", "media_buy_id": "mb_1", "status": "active"}.items():
+        set_committed_value(buy, name, value)
+    buy.status = "paused"
+    order = GAMOrder()
+    for name, value in {"tenant_id": "tenant1", "order_id": "mb_2", "status": "APPROVED"}.items():
+        set_committed_value(order, name, value)
+    order.order_name = "Renamed"
+    session = _flush_session(dirty=[buy, order])
+
+    with patch("src.admin.services.media_buy_readiness_service.store_readiness_snapshots") as store:
+        refresh_readiness_after_flush(session, None)
+
+    store.assert_not_called()
+    session.connection.assert_not_called()
+
+
+def test_consistency_check_reports_missing_and_stale_snapshots():
+    session = MagicMock()
+    session.execute.return_value = _result(
+        [("tenant1", "mb_ok", _snapshot()), ("tenant1", "mb_stale", _snapshot()), ("tenant1", "mb_missing", None)]
+    )
+    expected = {
+        "mb_ok": _snapshot(),
+        "mb_stale": _snapshot(creatives_approved=1, creatives_rejected=1),
+        "mb_missing": _snapshot(),
+    }
+
+    with patch("src.admin.services.media_buy_readiness_service.compute_readiness_snapshots", return_value=expected):
+        mismatches = check_readiness_consistency("tenant1", session)
+
+    assert {m.media_buy_id for m in mismatches} == {"mb_stale", "mb_missing"}
@@ -0,0 +1,102 @@
+"""Tests for the single-transaction unit of work used by create_media_buy."""
+
+from unittest.mock import MagicMock, Mock, call, patch
+
+from src.core.database.media_buy_unit_of_work import MediaBuyUnitOfWork, media_buy_unit_of_work
+
+
+def test_commit_bulk_inserts_then_runs_callbacks_in_order():
+    session = MagicMock()
+    uow = MediaBuyUnitOfWork(session, "t1")
+    events = []
+    session.commit.side_effect = lambda: events.append("commit")
+    media_buy = Mock()
+
+    uow.add(media_buy)
+    uow.add_package("mb_1", "pkg_1", {"package_id": "pkg_1"}, budget=1000.0, pacing="even")
+    uow.add_package("mb_1", "pkg_2", {"package_id": "pkg_2"}, bid_price=2.5)
+    assignment_id = uow.add_assignment("mb_1", "pkg_1", "cr_1")
+    uow.after_commit("first", lambda: events.append("first"))
+    uow.after_commit("broken", Mock(side_effect=RuntimeError("slack down")))
+    uow.after_commit("last", lambda: events.append("last"))
+
+    # Nothing touches the session until commit
+    session.add.assert_not_called()
+    session.execute.assert_not_called()
+
+    with patch("src.core.database.media_buy_unit_of_work.store_readiness_snapshots") as store_snapshots:
+        store_snapshots.side_effect = lambda *args: events.append("readiness")
+        uow.commit()
+
+    session.add.assert_called_once_with(media_buy)
+    packages_call, assignments_call = session.execute.call_args_list
+    assert [row["package_id"] for row in packages_call.args[1]] == ["pkg_1", "pkg_2"]
+    assert str(packages_call.args[1][0]["budget"]) == "1000.0"
+    assert packages_call.args[1][1]["budget"] is None
+    assert assignments_call.args[1] == [
+        {
+            "assignment_id": assignment_id,
+            "tenant_id": "t1",
+            "media_buy_id": "mb_1",
+            "package_id": "pkg_1",
+            "creative_id": "cr_1",
+        }
+    ]
+    session.commit.assert_called_once()
+    # The bulk inserts skip the after_flush hook, so readiness is refreshed explicitly before commit
+    store_snapshots.assert_called_once_with(session, "t1", ["mb_1"])
+    # A failing callback does not stop the ones after it
+    assert events == ["readiness", "commit", "first", "last"]
+
+
+def test_uncommitted_unit_writes_nothing_and_skips_callbacks():
+    session = MagicMock()
+    callback = Mock()
+
+    with patch("src.core.database.media_buy_unit_of_work.get_db_session") as get_session:
+        get_session.return_value.__enter__.return_value = session
+        with media_buy_unit_of_work("t1") as uow:
+            uow.add(Mock())
+            uow.add_package("mb_1", "pkg_1", {})
+            uow.after_commit("notify", callback)
+
+    session.execute.assert_not_called()
+    session.commit.assert_not_called()
+    callback.assert_not_called()
+
+
+def test_lookups_only_query_ids_not_loaded_yet():
+    preloaded = Mock(product_id="prod_1")
+    creative = Mock(creative_id="cr_1")
+    session = MagicMock()
+    session.scalars.side_effect = [[Mock(product_id="prod_2")], [creative]]
+    uow = MediaBuyUnitOfWork(session, "t1", products={"prod_1": preloaded})
+
+    products = uow.load_products(["prod_1", "prod_2", "prod_2"])
+    assert set(products) == {"prod_1", "prod_2"}
+    assert uow.load_creatives(["cr_1"]) == {"cr_1": creative}
+
+    # Everything is cached now - no further queries
+    uow.load_products(["prod_1", "prod_2"])
+    uow.load_creatives(["cr_1"])
+    assert session.scalars.call_count == 2
+    product_query = str(session.scalars.call_args_list[0].args[0])
+    assert "products.product_id IN" in product_query
+
+
+def test_modified_json_attribute_is_flagged_on_commit():
+    session = MagicMock()
+    creative = Mock()
+    uow = MediaBuyUnitOfWork(session, "t1")
+    uow.mark_modified(creative, "data")
+
+    with (
+        patch("src.core.database.media_buy_unit_of_work.attributes.flag_modified") as flag_modified,
+        patch("src.core.database.media_buy_unit_of_work.store_readiness_snapshots") as store_snapshots,
+    ):
+        uow.commit()
+
+    assert session.add.call_args_list == [call(creative)]
+    flag_modified.assert_called_once_with(creative, "data")
+    # No bulk rows - the session's own readiness hook covers ORM changes
+    store_snapshots.assert_not_called()
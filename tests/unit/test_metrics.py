@@ -264,3 +264,60 @@ def test_metrics_thread_safety():
     )._value.get()
     expected_value = initial_value + (num_threads * increments_per_thread)
     assert final_value == expected_value
+
+
+def test_observe_tool_call_records_histograms():
+    """Test that tool call latency and DB usage land in the per-tool histograms."""
+    from src.core.metrics import observe_tool_call, tool_call_db_queries, tool_call_duration
+
+    observe_tool_call("get_products", "mcp", "success", 0.2, 7, 0.05)
+
+    assert tool_call_duration.labels(tool="get_products", protocol="mcp", status="success")._sum.get() >= 0.2
+    assert tool_call_db_queries.labels(tool="get_products", protocol="mcp")._sum.get() >= 7
+
+
+def test_instrument_adapter_call_records_status():
+    """Test that adapter methods are timed with success and error status."""
+    import pytest
+
+    from src.core.metrics import adapter_call_duration, instrument_adapter_call
+
+    @instrument_adapter_call("test_adapter", "create_media_buy")
+    def create_media_buy(fail: bool):
+        if fail:
+            raise RuntimeError("ad server down")
+        return "ok"
+
+    assert create_media_buy(False) == "ok"
+    with pytest.raises(RuntimeError):
+        create_media_buy(True)
+
+    success = adapter_call_duration.labels(adapter="test_adapter", method="create_media_buy", status="success")
+    error = adapter_call_duration.labels(adapter="test_adapter", method="create_media_buy", status="error")
+    assert success._sum.get() > 0
+    assert error._sum.get() > 0
+    # Wrapping twice is a no-op
+    assert instrument_adapter_call("test_adapter", "create_media_buy")(create_media_buy) is create_media_buy
+
+
+async def test_instrument_adapter_call_supports_coroutines():
+    """Test that async adapter methods stay awaitable after instrumentation."""
+    from src.core.metrics import adapter_call_duration, instrument_adapter_call
+
+    @instrument_adapter_call("test_adapter", "get_available_inventory")
+    async def get_available_inventory():
+        return {"placements": []}
+
+    assert await get_available_inventory() == {"placements": []}
+    metric = adapter_call_duration.labels(adapter="test_adapter", method="get_available_inventory", status="success")
+    assert metric._sum.get() > 0
+
+
+def test_adapter_subclasses_are_instrumented():
+    """Test that AdServerAdapter subclasses get their interface methods wrapped automatically."""
+    from src.adapters.mock_ad_server import MockAdServer
+    from src.core.metrics import _instrumented_adapter_calls
+
+    assert MockAdServer.create_media_buy in _instrumented_adapter_calls
+    assert MockAdServer.get_media_buy_delivery in _instrumented_adapter_calls
+    assert MockAdServer.create_media_buy.__name__ == "create_media_buy"
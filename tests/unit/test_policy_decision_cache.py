@@ -0,0 +1,147 @@
+"""Unit tests for the content-addressed AI policy decision cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services.policy_check_service import PolicyCheckResult, PolicyCheckService, PolicyStatus
+from src.services.policy_decision_cache import PolicyDecisionCache, policy_decision_key
+
+
+def _allowed() -> PolicyCheckResult:
+    return PolicyCheckResult(status=PolicyStatus.ALLOWED, warnings=[])
+
+
+class TestPolicyDecisionKey:
+    """Test cases for policy_decision_key()."""
+
+    def test_key_ignores_case_and_whitespace(self):
+        """Trivially different briefs share a decision."""
+        assert policy_decision_key("Sports  Fans", "Acme", None, "google-gla:m") == policy_decision_key(
+            " sports fans", "acme", {}, "google-gla:m"
+        )
+
+    def test_key_changes_with_policy_and_model(self):
+        """A policy edit or model switch invalidates cached decisions."""
+        base = policy_decision_key("sports fans", "Acme", {"prohibited_categories": []}, "google-gla:m")
+
+        assert base != policy_decision_key("sports fans", "Acme", {"prohibited_categories": ["x"]}, "google-gla:m")
+        assert base != policy_decision_key("sports fans", "Acme", {"prohibited_categories": []}, "openai:m")
+        assert base != policy_decision_key("sports fans", "Other", {"prohibited_categories": []}, "google-gla:m")
+
+
+class TestPolicyDecisionCache:
+    """Test cases for PolicyDecisionCache layering and single-flight."""
+
+    async def test_miss_checks_once_then_serves_from_memory(self):
+        """A miss runs the check and persists it; later calls skip the database."""
+        cache = PolicyDecisionCache()
+        check = AsyncMock(return_value=_allowed())
+
+        with (
+            patch.object(cache, "_load", return_value=None) as load,
+            patch.object(cache, "_store") as store,
+        ):
+            first = await cache.get_or_check("k", "t1", "model", check)
+            second = await cache.get_or_check("k", "t1", "model", check)
+
+        assert first is second
+        check.assert_awaited_once()
+        load.assert_called_once_with("k")
+        store.assert_called_once_with("k", "t1", "model", first)
+
+    async def test_database_hit_skips_check(self):
+        """A decision stored by another process is reused without calling the model."""
+        cache = PolicyDecisionCache()
+        check = AsyncMock()
+
+        with patch.object(cache, "_load", return_value=_allowed()), patch.object(cache, "_store") as store:
+            result = await cache.get_or_check("k", "t1", "model", check)
+
+        assert result.status == PolicyStatus.ALLOWED
+        check.assert_not_awaited()
+        store.assert_not_called()
+
+    async def test_concurrent_identical_checks_are_coalesced(self):
+        """Concurrent checks for the same key share one model call."""
+        cache = PolicyDecisionCache()
+        release = asyncio.Event()
+
+        async def slow_check():
+            await release.wait()
+            return _allowed()
+
+        check = AsyncMock(side_effect=slow_check)
+        with patch.object(cache, "_load", return_value=None), patch.object(cache, "_store"):
+            waiters = [asyncio.create_task(cache.get_or_check("k", "t1", "model", check)) for _ in range(5)]
+            await asyncio.sleep(0.01)
+            release.set()
+            results = await asyncio.gather(*waiters)
+
+        check.assert_awaited_once()
+        assert all(result is results[0] for result in results)
+
+    async def test_expired_memory_entry_is_reloaded(self):
+        """Entries past the TTL fall through to the lower layers."""
+        cache = PolicyDecisionCache(ttl_seconds=0)
+        check = AsyncMock(return_value=_allowed())
+
+        with patch.object(cache, "_load", return_value=None), patch.object(cache, "_store"):
+            await cache.get_or_check("k", "t1", "model", check)
+            await cache.get_or_check("k", "t1", "model", check)
+
+        assert check.await_count == 2
+
+    async def test_failed_check_is_not_cached(self):
+        """Errors propagate and the next call retries."""
+        cache = PolicyDecisionCache()
+        check = AsyncMock(side_effect=[RuntimeError("model down"), _allowed()])
+
+        with patch.object(cache, "_load", return_value=None), patch.object(cache, "_store"):
+            try:
+                await cache.get_or_check("k", "t1", "model", check)
+            except RuntimeError:
+                pass
+            result = await cache.get_or_check("k", "t1", "model", check)
+
+        assert result.status == PolicyStatus.ALLOWED
+        assert check.await_count == 2
+
+
+class TestPolicyCheckServiceReuse:
+    """Test cases for agent reuse and cache use in PolicyCheckService."""
+
+    def test_agent_reused_for_same_tenant_config(self):
+        """Services built from the same AI config share one agent."""
+        with (
+            patch(
+                "src.services.policy_check_service.create_policy_agent", side_effect=lambda model: MagicMock()
+            ) as create_agent,
+            patch("src.services.policy_check_service._policy_agents", {}),
+            patch("src.services.ai.factory.AIServiceFactory.create_model", return_value="model"),
+        ):
+            first = PolicyCheckService(gemini_api_key="key-a")
+            second = PolicyCheckService(gemini_api_key="key-a")
+            other = PolicyCheckService(gemini_api_key="key-b")
+
+        assert first._agent is second._agent
+        assert other._agent is not first._agent
+        assert create_agent.call_count == 2
+
+    async def test_tenant_checks_go_through_cache(self):
+        """With a tenant_id the decision is served by the policy decision cache."""
+        cache = MagicMock()
+        cache.get_or_check = AsyncMock(return_value=_allowed())
+
+        with (
+            patch("src.services.policy_check_service.create_policy_agent", return_value=MagicMock()),
+            patch("src.services.policy_check_service._policy_agents", {}),
+            patch("src.services.ai.factory.AIServiceFactory.create_model", return_value="model"),
+            patch("src.services.policy_decision_cache.get_policy_decision_cache", return_value=cache),
+        ):
+            service = PolicyCheckService(gemini_api_key="key-a")
+            result = await service.check_brief_compliance("sports fans", promoted_offering="Acme", tenant_id="t1")
+
+        assert result.status == PolicyStatus.ALLOWED
+        key, tenant_id, model, _check = cache.get_or_check.call_args.args
+        assert key == policy_decision_key("sports fans", "Acme", None, service.model_id)
+        assert (tenant_id, model) == ("t1", service.model_id)
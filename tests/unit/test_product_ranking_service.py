@@ -0,0 +1,146 @@
+"""Tests for cached, batched AI product ranking."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.ai.agents.ranking_agent import ProductRanking, ProductRankingResult, build_ranking_prompt
+from src.services.product_ranking_service import (
+    MAX_DIGEST_DESCRIPTION_CHARS,
+    ProductRankingService,
+    catalog_version,
+    product_digest,
+)
+from tests.helpers.adcp_factories import create_test_product
+
+
+def _digests(count: int) -> list[dict]:
+    return [
+        {"product_id": f"p{i}", "name": f"Product {i}", "description": "", "channels": [], "formats": []}
+        for i in range(count)
+    ]
+
+
+async def _score_by_index(agent, custom_prompt, brief, products):
+    """Fake ranking call: score = index / 10, plus an id that belongs to no chunk."""
+    rankings = [
+        ProductRanking(product_id=p["product_id"], relevance_score=int(p["product_id"][1:]) / 10, reason="ok")
+        for p in products
+    ]
+    rankings.append(ProductRanking(product_id="invented", relevance_score=1.0, reason="hallucinated"))
+    return ProductRankingResult(rankings=rankings)
+
+
+class TestProductDigest:
+    def test_digest_contains_only_ranking_fields(self):
+        product = create_test_product(
+            product_id="video_premium",
+            name="Premium Video",
+            description="x" * (MAX_DIGEST_DESCRIPTION_CHARS + 100),
+            format_ids=["video_1920x1080"],
+        )
+
+        digest = product_digest(product)
+
+        assert set(digest) == {"product_id", "name", "description", "channels", "formats"}
+        assert digest["formats"] == ["video_1920x1080"]
+        assert len(digest["description"]) == MAX_DIGEST_DESCRIPTION_CHARS
+
+    def test_catalog_version_ignores_order_but_not_content(self):
+        digests = _digests(3)
+        edited = [dict(d) for d in digests]
+        edited[1]["name"] = "Renamed"
+
+        assert catalog_version(digests) == catalog_version(list(reversed(digests)))
+        assert catalog_version(digests) != catalog_version(edited)
+
+    def test_prompt_uses_compact_json(self):
+        prompt = build_ranking_prompt("Prefer video", "Sports fans", _digests(1))
+
+        assert '{"product_id":"p0","name":"Product 0"' in prompt
+
+
+class TestProductRankingService:
+    @pytest.mark.asyncio
+    async def test_large_catalog_is_ranked_in_parallel_chunks(self):
+        service = ProductRankingService(chunk_size=2)
+
+        with patch(
+            "src.services.ai.agents.ranking_agent.rank_products_async", side_effect=_score_by_index
+        ) as mock_rank:
+            scores = await service.rank(_digests(5), "brief", "prompt", "gemini:flash", MagicMock)
+
+        assert [len(call.kwargs["products"]) for call in mock_rank.call_args_list] == [2, 2, 1]
+        assert set(scores) == {"p0", "p1", "p2", "p3", "p4"}
+        assert scores["p4"][0] == pytest.approx(0.4)
+
+    @pytest.mark.asyncio
+    async def test_repeated_ranking_is_served_from_cache(self):
+        service = ProductRankingService()
+        create_agent = MagicMock()
+
+        with patch(
+            "src.services.ai.agents.ranking_agent.rank_products_async", side_effect=_score_by_index
+        ) as mock_rank:
+            first = await service.rank(_digests(3), "Sports  Fans", "prompt", "gemini:flash", create_agent)
+            second = await service.rank(
+                list(reversed(_digests(3))), "sports fans", "prompt", "gemini:flash", create_agent
+            )
+
+        assert first == second
+        assert mock_rank.call_count == 1
+        create_agent.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_prompt_model_or_catalog_change_misses_cache(self):
+        service = ProductRankingService()
+
+        with patch(
+            "src.services.ai.agents.ranking_agent.rank_products_async", side_effect=_score_by_index
+        ) as mock_rank:
+            await service.rank(_digests(3), "brief", "prompt", "gemini:flash", MagicMock)
+            await service.rank(_digests(3), "brief", "other prompt", "gemini:flash", MagicMock)
+            await service.rank(_digests(3), "brief", "prompt", "openai:gpt-4o", MagicMock)
+            await service.rank(_digests(4), "brief", "prompt", "gemini:flash", MagicMock)
+
+        assert mock_rank.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_rankings_are_coalesced(self):
+        service = ProductRankingService()
+        release = asyncio.Event()
+
+        async def slow_rank(*args, **kwargs):
+            await release.wait()
+            return await _score_by_index(*args, **kwargs)
+
+        with patch("src.services.ai.agents.ranking_agent.rank_products_async", side_effect=slow_rank) as mock_rank:
+            callers = [
+                asyncio.create_task(service.rank(_digests(2), "brief", "prompt", "gemini:flash", MagicMock))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*callers)
+
+        assert mock_rank.call_count == 1
+        assert results[0] == results[1] == results[2]
+
+    @pytest.mark.asyncio
+    async def test_failed_ranking_is_not_cached(self):
+        service = ProductRankingService()
+
+        with patch(
+            "src.services.ai.agents.ranking_agent.rank_products_async", side_effect=RuntimeError("rate limited")
+        ):
+            with pytest.raises(RuntimeError):
+                await service.rank(_digests(2), "brief", "prompt", "gemini:flash", MagicMock)
+
+        with patch(
+            "src.services.ai.agents.ranking_agent.rank_products_async", side_effect=_score_by_index
+        ) as mock_rank:
+            scores = await service.rank(_digests(2), "brief", "prompt", "gemini:flash", MagicMock)
+
+        assert mock_rank.call_count == 1
+        assert set(scores) == {"p0", "p1"}
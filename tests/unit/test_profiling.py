@@ -0,0 +1,97 @@
+"""Unit tests for the runtime-toggleable sampling profiler."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.core.profiling import SamplingProfiler, profiler_endpoint
+
+
+def _busy_worker(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class TestSamplingProfiler:
+    """Test cases for SamplingProfiler."""
+
+    def test_sample_collects_other_threads(self):
+        """A sample includes a collapsed stack for each other thread, rooted at the thread name."""
+        stop = threading.Event()
+        worker = threading.Thread(target=_busy_worker, args=(stop,), name="busy-worker")
+        worker.start()
+        try:
+            profiler = SamplingProfiler()
+            profiler.sample()
+        finally:
+            stop.set()
+            worker.join()
+
+        stacks = profiler.collapsed_stacks().splitlines()
+        assert profiler.status()["samples"] == 1
+        assert any(line.startswith("busy-worker;") and "_busy_worker" in line for line in stacks)
+
+    def test_start_stop_and_reset(self):
+        """The profiler samples in the background until stopped; reset discards samples."""
+        profiler = SamplingProfiler()
+
+        assert profiler.start(interval=0.001, max_seconds=5)
+        assert not profiler.start()  # Already running
+        deadline = time.monotonic() + 2
+        while profiler.status()["samples"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        profiler.stop()
+
+        assert not profiler.is_running
+        assert profiler.status()["samples"] > 0
+        profiler.reset()
+        assert profiler.status()["samples"] == 0
+        assert profiler.collapsed_stacks() == ""
+
+    def test_stops_after_max_seconds(self):
+        """Sampling stops on its own once max_seconds has elapsed."""
+        profiler = SamplingProfiler()
+        profiler.start(interval=0.001, max_seconds=0.05)
+        profiler._thread.join(timeout=2)
+
+        assert not profiler.is_running
+
+
+class TestProfilerEndpoint:
+    """Test cases for the /debug/profiler endpoint."""
+
+    def _client(self) -> TestClient:
+        app = Starlette(routes=[Route("/debug/profiler", profiler_endpoint, methods=["GET", "POST"])])
+        return TestClient(app)
+
+    def test_disabled_by_default(self, monkeypatch):
+        """The endpoint is forbidden unless ADCP_PROFILING_ENABLED=true."""
+        monkeypatch.delenv("ADCP_PROFILING_ENABLED", raising=False)
+
+        response = self._client().post("/debug/profiler", json={"action": "start"})
+
+        assert response.status_code == 403
+
+    def test_start_read_stop(self, monkeypatch):
+        """Start and stop through the endpoint, then read collapsed stacks."""
+        monkeypatch.setenv("ADCP_PROFILING_ENABLED", "true")
+        profiler = SamplingProfiler()
+
+        with patch("src.core.profiling.get_sampling_profiler", return_value=profiler):
+            client = self._client()
+            started = client.post("/debug/profiler", json={"action": "start", "interval": 0.001, "max_seconds": 5})
+            time.sleep(0.05)
+            stopped = client.post("/debug/profiler", json={"action": "stop"})
+            collapsed = client.get("/debug/profiler", params={"format": "collapsed"})
+            invalid = client.post("/debug/profiler", json={"action": "explode"})
+
+        assert started.status_code == 200
+        assert started.json()["running"] is True
+        assert stopped.json()["running"] is False
+        assert stopped.json()["samples"] > 0
+        assert collapsed.text
+        assert invalid.status_code == 400
@@ -0,0 +1,51 @@
+"""Unit tests for protocol webhook delivery on the shared I/O loop."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from src.services.protocol_webhook_service import ProtocolWebhookService
+
+
+class _Response:
+    status = 200
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read(self):
+        return b""
+
+    def raise_for_status(self):
+        return None
+
+
+async def test_audit_writes_run_off_the_io_loop_thread():
+    """Audit log calls do blocking file I/O, so they must not run on the delivery loop."""
+    with patch("src.services.protocol_webhook_service.get_webhook_delivery_log_writer"):
+        service = ProtocolWebhookService()
+
+    audit_threads: list[threading.Thread] = []
+    audit_logger = MagicMock()
+    audit_logger.log_info.side_effect = lambda message: audit_threads.append(threading.current_thread())
+    audit_logger.log_success.side_effect = lambda message: audit_threads.append(threading.current_thread())
+
+    http = MagicMock()
+    http.post.return_value = _Response()
+
+    with (
+        patch("src.services.protocol_webhook_service.get_audit_logger", return_value=audit_logger),
+        patch.object(service, "_get_http_session", return_value=http),
+    ):
+        delivered = await service._send_with_retry_and_logging(
+            url="https://example.com/webhook",
+            payload={"task_id": "task_1", "status": "completed"},
+            headers={},
+            metadata={"task_type": "create_media_buy", "tenant_id": "tenant_1"},
+        )
+
+    assert delivered is True
+    assert len(audit_threads) == 2
+    assert threading.current_thread() not in audit_threads
@@ -0,0 +1,181 @@
+"""Unit tests for request-scoped memoization of tool-call lookups."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from src.core.request_scope import (
+    get_request_scope,
+    invalidate_request_cache,
+    memoize,
+    record_db_query,
+    request_scope,
+    seed_request_cache,
+)
+
+
+class TestRequestScope:
+    """Test cases for memoize() and the database round-trip counter."""
+
+    def test_memoize_outside_scope_always_loads(self):
+        """Without a request scope every call reaches the loader."""
+        loader = MagicMock(return_value="value")
+
+        assert memoize(("key",), loader) == "value"
+        assert memoize(("key",), loader) == "value"
+
+        assert loader.call_count == 2
+
+    def test_memoize_inside_scope_loads_once(self):
+        """Within a scope the loader runs once per key, including for None results."""
+        loader = MagicMock(return_value=None)
+        other_loader = MagicMock(return_value="other")
+
+        with request_scope("get_products") as scope:
+            assert memoize(("principal", "t1", "p1"), loader) is None
+            assert memoize(("principal", "t1", "p1"), loader) is None
+            assert memoize(("principal", "t1", "p2"), other_loader) == "other"
+
+        loader.assert_called_once()
+        other_loader.assert_called_once()
+        assert scope.memo_hits == 1
+
+    def test_scope_ends_with_the_request(self):
+        """Memoized values do not leak into the next request."""
+        loader = MagicMock(return_value="value")
+
+        with request_scope("get_products"):
+            memoize(("key",), loader)
+        assert get_request_scope() is None
+        with request_scope("get_products"):
+            memoize(("key",), loader)
+
+        assert loader.call_count == 2
+
+    def test_nested_scopes_share_the_outer_scope(self):
+        """Wrapping the same call at several layers opens a single scope."""
+        with request_scope("outer") as outer:
+            with request_scope("inner") as inner:
+                assert inner is outer
+            assert get_request_scope() is outer
+
+    def test_seed_and_invalidate(self):
+        """Seeded values are served without loading; invalidated keys reload."""
+        loader = MagicMock(return_value={"tenant_id": "t1", "name": "Reloaded"})
+
+        with request_scope("create_media_buy"):
+            seed_request_cache(("tenant", "t1"), {"tenant_id": "t1", "name": "Seeded"})
+            assert memoize(("tenant", "t1"), loader)["name"] == "Seeded"
+            loader.assert_not_called()
+
+            invalidate_request_cache(("tenant", "t1"))
+            assert memoize(("tenant", "t1"), loader)["name"] == "Reloaded"
+
+    def test_db_round_trips_are_counted_per_scope(self):
+        """record_db_query() counts against the active scope only."""
+        record_db_query()  # Outside any scope: ignored
+
+        with request_scope("get_products") as scope:
+            record_db_query()
+            record_db_query()
+
+        assert scope.db_query_count == 2
+
+    def test_db_time_is_accumulated_per_scope(self):
+        """record_db_query(duration) sums statement latency for the scope."""
+        with request_scope("get_products") as scope:
+            record_db_query(0.25)
+            record_db_query(0.5)
+
+        assert scope.db_query_count == 2
+        assert scope.db_query_seconds == 0.75
+
+    def test_tool_call_metrics_recorded_on_exit(self):
+        """Closing the scope records latency, status and DB usage per tool and protocol."""
+        with patch("src.core.request_scope.observe_tool_call") as observe:
+            with request_scope("sync_creatives", protocol="a2a"):
+                record_db_query(0.1)
+
+            try:
+                with request_scope("sync_creatives", protocol="a2a"):
+                    raise ValueError("boom")
+            except ValueError:
+                pass
+
+        first, second = observe.call_args_list
+        assert first.args[:3] == ("sync_creatives", "a2a", "success")
+        assert first.args[4:] == (1, 0.1)
+        assert second.args[:3] == ("sync_creatives", "a2a", "error")
+
+    async def test_worker_threads_share_the_scope(self):
+        """asyncio.to_thread copies the context, so thread work counts against the same request."""
+        loader = MagicMock(return_value="value")
+
+        def work():
+            record_db_query()
+            return memoize(("key",), loader)
+
+        with request_scope("get_products") as scope:
+            await asyncio.gather(asyncio.to_thread(work), asyncio.to_thread(work))
+            assert memoize(("key",), loader) == "value"
+
+        assert scope.db_query_count == 2
+        assert loader.call_count <= 2
+
+
+class TestMemoizedLookups:
+    """Test that identity lookups are reused within a tool call."""
+
+    def test_get_principal_object_queries_once_per_request(self):
+        """Repeated get_principal_object calls in one request hit the database once."""
+        from src.core.auth import get_principal_object
+
+        db_principal = MagicMock(principal_id="p1", platform_mappings={"mock": {"advertiser_id": "adv_1"}})
+        db_principal.name = "Principal One"
+        mock_session = MagicMock()
+        mock_session.scalars.return_value.first.return_value = db_principal
+
+        with (
+            patch("src.core.auth.get_current_tenant", return_value={"tenant_id": "t1"}),
+            patch("src.core.auth.get_db_session") as mock_get_session,
+        ):
+            mock_get_session.return_value.__enter__.return_value = mock_session
+
+            with request_scope("create_media_buy"):
+                first = get_principal_object("p1")
+                second = get_principal_object("p1")
+
+        assert first is second
+        assert first.name == "Principal One"
+        assert mock_get_session.call_count == 1
+
+    def test_tenant_seeded_at_the_boundary_is_reused_by_id(self):
+        """get_tenant_by_id issues no query for a tenant the request boundary already loaded."""
+        from src.core.config_loader import get_tenant_by_id
+
+        tenant_dict = {"tenant_id": "t1", "name": "Tenant One"}
+
+        with patch("src.core.config_loader.get_db_session") as mock_get_session:
+            with request_scope("get_products"):
+                seed_request_cache(("tenant", "t1"), tenant_dict)
+                assert get_tenant_by_id("t1") == tenant_dict
+
+        mock_get_session.assert_not_called()
+
+    def test_tenant_lookup_seeds_tenant_by_id(self):
+        """Resolving a tenant by host makes later lookups by id free for the request."""
+        from src.core.config_loader import get_tenant_by_virtual_host
+
+        tenant_dict = {"tenant_id": "t1", "name": "Tenant One"}
+
+        with (
+            patch("src.core.config_loader.get_db_session") as mock_get_session,
+            patch("src.core.utils.tenant_utils.serialize_tenant_to_dict", return_value=tenant_dict),
+        ):
+            mock_get_session.return_value.__enter__.return_value.scalars.return_value.first.return_value = MagicMock()
+
+            with request_scope("get_products"):
+                assert get_tenant_by_virtual_host("ads.example.com") == tenant_dict
+                assert get_tenant_by_virtual_host("ads.example.com") == tenant_dict
+                assert memoize(("tenant", "t1"), MagicMock(side_effect=AssertionError("not memoized"))) == tenant_dict
+
+        assert mock_get_session.call_count == 1
@@ -0,0 +1,141 @@
+"""Tests for the per-tenant daily revenue rollup."""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.core.database.models import MediaBuy
+from src.services.revenue_rollup_service import (
+    daily_revenue_query,
+    get_daily_revenue,
+    media_buy_rollup_range,
+    refresh_media_buy_revenue,
+    refresh_revenue_rollup,
+)
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _persisted_buy(**committed) -> MediaBuy:
+    """MediaBuy whose attributes look loaded from the database."""
+    values = {
+        "tenant_id": "tenant1",
+        "budget": Decimal("3000"),
+        "start_date": date(2026, 1, 1),
+        "end_date": date(2026, 1, 30),
+        "status": "active",
+        "raw_request": {},
+    }
+    values.update(committed)
+    buy = MediaBuy()
+    for name, value in values.items():
+        set_committed_value(buy, name, value)
+    return buy
+
+
+def test_daily_revenue_query_is_single_generate_series_scan():
+    sql = _compile(daily_revenue_query("tenant1", date(2026, 1, 1), date(2026, 1, 30)))
+
+    assert "generate_series" in sql
+    assert "LEFT OUTER JOIN media_buys" in sql
+    assert "GROUP BY days.day" in sql
+
+
+def test_refresh_upserts_recomputed_days():
+    session = MagicMock()
+
+    refresh_revenue_rollup(session, "tenant1", date(2026, 1, 1), date(2026, 1, 5))
+
+    lock_sql, upsert_sql = (_compile(call.args[0]) for call in session.execute.call_args_list)
+    assert "pg_advisory_xact_lock(hashtext(" in lock_sql
+    assert upsert_sql.startswith("INSERT INTO tenant_daily_revenue")
+    assert "ON CONFLICT (tenant_id, day) DO UPDATE" in upsert_sql
+
+
+def test_refresh_skips_empty_range():
+    session = MagicMock()
+
+    refresh_revenue_rollup(session, "tenant1", date(2026, 1, 5), date(2026, 1, 1))
+
+    session.execute.assert_not_called()
+
+
+def test_new_live_buy_covers_its_flight():
+    buy = MediaBuy(tenant_id="tenant1", budget=Decimal("100"), start_date=date(2026, 2, 1), end_date=date(2026, 2, 10))
+    buy.status = "active"
+
+    assert media_buy_rollup_range(buy) == (date(2026, 2, 1), date(2026, 2, 10))
+
+
+def test_moved_flight_covers_old_and_new_days():
+    buy = _persisted_buy()
+    buy.start_date = date(2026, 1, 15)
+    buy.end_date = date(2026, 2, 15)
+
+    assert media_buy_rollup_range(buy) == (date(2026, 1, 1), date(2026, 2, 15))
+
+
+def test_status_change_out_of_revenue_is_refreshed():
+    buy = _persisted_buy()
+    buy.status = "paused"
+
+    assert media_buy_rollup_range(buy) == (date(2026, 1, 1), date(2026, 1, 30))
+
+
+def test_changes_outside_rollup_inputs_are_ignored():
+    buy = _persisted_buy()
+    buy.raw_request = {"po_number": "PO-1"}
+
+    assert media_buy_rollup_range(buy) is None
+
+
+def test_non_revenue_status_transition_is_ignored():
+    buy = _persisted_buy(status="draft")
+    buy.status = "pending_approval"
+
+    assert media_buy_rollup_range(buy) is None
+
+
+def test_deleted_buy_uses_committed_values():
+    assert media_buy_rollup_range(_persisted_buy(), require_change=False) == (date(2026, 1, 1), date(2026, 1, 30))
+
+
+def test_bulk_update_refresh_uses_current_flight():
+    session = MagicMock()
+    session.execute.return_value.first.return_value = MagicMock(
+        tenant_id="tenant1", start_date=date(2026, 1, 1), end_date=date(2026, 1, 3)
+    )
+
+    refresh_media_buy_revenue(session, "mb_1")
+
+    assert session.execute.call_count == 3
+    assert "INSERT INTO tenant_daily_revenue" in _compile(session.execute.call_args.args[0])
+
+
+def test_rollup_days_without_rows_are_zero():
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [(date(2026, 1, 2), Decimal("33.3333"))]
+
+    revenue = get_daily_revenue(session, "tenant1", date(2026, 1, 1), date(2026, 1, 3), use_rollup=True)
+
+    assert revenue == [
+        {"date": "2026-01-01", "revenue": 0.0},
+        {"date": "2026-01-02", "revenue": 33.33},
+        {"date": "2026-01-03", "revenue": 0.0},
+    ]
+    assert "FROM tenant_daily_revenue" in _compile(session.execute.call_args.args[0])
+
+
+def test_fallback_computes_series_from_media_buys():
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [(date(2026, 1, 1), Decimal("10")), (date(2026, 1, 2), 0)]
+
+    revenue = get_daily_revenue(session, "tenant1", date(2026, 1, 1), date(2026, 1, 2), use_rollup=False)
+
+    assert [d["revenue"] for d in revenue] == [10.0, 0.0]
+    assert "generate_series" in _compile(session.execute.call_args.args[0])
@@ -1,5 +1,6 @@
 """Unit tests for signals agent registry (adcp v1.0.1 migration)."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -248,3 +249,89 @@ class TestSignalsAgentRegistry:
             assert result["success"] is False
             assert "error" in result
             assert "Authentication" in result["error"] or "failed" in result["error"]
+
+
+class TestSignalsCache:
+    """Unit tests for get_signals() caching and single-flight coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_identical_briefs_are_served_from_cache(self):
+        """Briefs differing only in case/whitespace hit the cache; other tenants do not."""
+        registry = SignalsAgentRegistry()
+        query = AsyncMock(return_value=([{"signal_agent_segment_id": "auto"}], True))
+
+        with patch.object(registry, "_query_all_agents", query):
+            first = await registry.get_signals(brief="Automotive  intenders", tenant_id="t1")
+            second = await registry.get_signals(brief="automotive intenders ", tenant_id="t1")
+            await registry.get_signals(brief="automotive intenders", tenant_id="t2")
+
+        assert first == second == [{"signal_agent_segment_id": "auto"}]
+        assert query.await_count == 2  # t1 once, t2 once
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_and_expiry_bypass_cache(self):
+        """force_refresh and an expired entry both trigger a fresh query."""
+        registry = SignalsAgentRegistry()
+        query = AsyncMock(return_value=([], True))
+
+        with patch.object(registry, "_query_all_agents", query):
+            await registry.get_signals(brief="sports", tenant_id="t1")
+            await registry.get_signals(brief="sports", tenant_id="t1", force_refresh=True)
+            for entry in registry._signals_cache.values():
+                entry.ttl_seconds = -1
+            await registry.get_signals(brief="sports", tenant_id="t1")
+
+        assert query.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_queries_are_coalesced(self):
+        """Concurrent callers with the same brief share one upstream fan-out."""
+        registry = SignalsAgentRegistry()
+        release = asyncio.Event()
+
+        async def slow_query(*args, **kwargs):
+            await release.wait()
+            return [{"signal_agent_segment_id": "news"}], True
+
+        query = AsyncMock(side_effect=slow_query)
+        with patch.object(registry, "_query_all_agents", query):
+            waiters = [asyncio.create_task(registry.get_signals(brief="news", tenant_id="t1")) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*waiters)
+
+        assert query.await_count == 1
+        assert all(result == [{"signal_agent_segment_id": "news"}] for result in results)
+        assert registry._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_query(self):
+        """A caller that gives up (latency budget) leaves the fetch running to fill the cache."""
+        registry = SignalsAgentRegistry()
+        release = asyncio.Event()
+
+        async def slow_query(*args, **kwargs):
+            await release.wait()
+            return [{"signal_agent_segment_id": "travel"}], True
+
+        with patch.object(registry, "_query_all_agents", AsyncMock(side_effect=slow_query)) as query:
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(registry.get_signals(brief="travel", tenant_id="t1"), timeout=0.01)
+            release.set()
+            await asyncio.sleep(0.01)
+            cached = await registry.get_signals(brief="travel", tenant_id="t1")
+
+        assert query.await_count == 1
+        assert cached == [{"signal_agent_segment_id": "travel"}]
+
+    @pytest.mark.asyncio
+    async def test_partial_responses_are_not_cached(self):
+        """If an agent failed, the next identical query retries instead of using the cache."""
+        registry = SignalsAgentRegistry()
+        query = AsyncMock(return_value=([], False))
+
+        with patch.object(registry, "_query_all_agents", query):
+            await registry.get_signals(brief="finance", tenant_id="t1")
+            await registry.get_signals(brief="finance", tenant_id="t1")
+
+        assert query.await_count == 2
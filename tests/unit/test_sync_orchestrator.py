@@ -0,0 +1,149 @@
+"""Tests for the scheduled multi-tenant sync orchestrator."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, Mock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from src.core.database.models import SyncJob, SyncSchedule
+from src.services import sync_orchestrator
+from src.services.sync_orchestrator import (
+    DEFAULT_SYNC_INTERVALS,
+    SYNC_SCHEDULE_JITTER,
+    ClaimedJob,
+    SyncLeaseHeartbeat,
+    SyncOrchestrator,
+    claim_due_jobs,
+    reclaim_expired_leases,
+    seed_default_schedules,
+)
+
+
+def _schedule(tenant_id, sync_type, interval=3600):
+    return SyncSchedule(
+        tenant_id=tenant_id,
+        sync_type=sync_type,
+        interval_seconds=interval,
+        next_run_at=datetime.now(UTC) - timedelta(minutes=1),
+    )
+
+
+def _claim_session(running, due):
+    session = MagicMock()
+    session.execute.return_value.all.return_value = running
+    session.scalars.return_value.all.return_value = due
+    return session
+
+
+def test_claim_respects_per_tenant_and_global_limits():
+    due = [
+        _schedule("t1", "orders"),
+        _schedule("t1", "inventory"),
+        _schedule("t2", "orders"),
+        _schedule("t3", "orders"),
+    ]
+    session = _claim_session(running=[("t3", "inventory")], due=due)
+
+    claimed = claim_due_jobs(session, capacity=4, global_limit=3, per_tenant_limit=1)
+
+    # Two free global slots; t1's second type and t3 (already running) wait for a later tick
+    assert [(job.tenant_id, job.sync_type) for job in claimed] == [("t1", "orders"), ("t2", "orders")]
+    jobs = [c.args[0] for c in session.add.call_args_list]
+    assert all(isinstance(job, SyncJob) and job.status == "running" for job in jobs)
+    assert all(job.lease_owner == sync_orchestrator.worker_id() and job.lease_expires_at for job in jobs)
+    assert due[0].last_sync_id == claimed[0].sync_id
+    assert due[1].last_sync_id is None
+
+
+def test_claim_holds_the_advisory_lock_before_counting_running_jobs():
+    session = _claim_session(running=[], due=[])
+
+    claim_due_jobs(session, capacity=1)
+
+    lock_call, count_call = session.execute.call_args_list
+    assert "pg_advisory_xact_lock" in str(lock_call.args[0])
+    assert lock_call.args[1] == {"key": sync_orchestrator._CLAIM_LOCK_KEY}
+    assert "FROM sync_jobs" in str(count_call.args[0])
+
+
+def test_claimed_schedule_next_run_is_jittered_around_the_interval():
+    schedule = _schedule("t1", "orders", interval=3600)
+    claim_due_jobs(_claim_session(running=[], due=[schedule]), capacity=1)
+
+    delay = (schedule.next_run_at - schedule.last_started_at).total_seconds()
+    assert 3600 * (1 - SYNC_SCHEDULE_JITTER) <= delay <= 3600 * (1 + SYNC_SCHEDULE_JITTER)
+
+
+def test_nothing_is_claimed_when_the_global_limit_is_reached():
+    session = _claim_session(running=[("t1", "orders"), ("t2", "orders")], due=[_schedule("t3", "orders")])
+
+    assert claim_due_jobs(session, capacity=4, global_limit=2) == []
+    session.scalars.assert_not_called()
+
+
+def test_expired_leases_are_failed_and_their_schedules_made_due():
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [("orders_t1_abc", "t1", "orders")]
+
+    assert reclaim_expired_leases(session) == ["orders_t1_abc"]
+
+    reclaim, reschedule = (str(c.args[0].compile(dialect=postgresql.dialect())) for c in session.execute.call_args_list)
+    assert "sync_jobs.lease_expires_at < now()" in reclaim
+    assert "sync_jobs.lease_expires_at IS NULL AND sync_jobs.started_at <" in reclaim
+    assert reclaim.startswith("UPDATE sync_jobs SET status=")
+    assert "UPDATE sync_schedules SET next_run_at=now()" in reschedule
+
+
+def test_schedules_are_seeded_once_with_first_runs_spread_across_the_interval():
+    session = MagicMock()
+    tenants = [("t1", "refresh-token"), ("t2", None)]
+    session.execute.side_effect = [
+        Mock(all=Mock(return_value=tenants)),
+        Mock(tuples=Mock(return_value=Mock(all=Mock(return_value=[("t1", "inventory")])))),
+        Mock(),
+    ]
+
+    created = seed_default_schedules(session)
+
+    rows = session.execute.call_args_list[2].args[0].compile(dialect=postgresql.dialect()).params
+    created_types = sorted((rows[k], rows[k.replace("tenant_id", "sync_type")]) for k in rows if "tenant_id" in k)
+    # t1 already has inventory; t2 has no refresh token for format metrics
+    assert created_types == [("t1", "format_metrics"), ("t1", "orders"), ("t2", "inventory"), ("t2", "orders")]
+    assert created == 4
+    now = datetime.now(UTC)
+    for key in (k for k in rows if "next_run_at" in k):
+        assert now - timedelta(minutes=1) <= rows[key] <= now + timedelta(seconds=max(DEFAULT_SYNC_INTERVALS.values()))
+
+
+def test_heartbeat_reports_leases_it_no_longer_owns():
+    heartbeat = SyncLeaseHeartbeat()
+    heartbeat._sync_ids = {"job_a", "job_b"}
+    session = MagicMock()
+    session.scalars.return_value = ["job_a"]
+
+    with patch.object(sync_orchestrator, "get_db_session") as get_db_session:
+        get_db_session.return_value.__enter__.return_value = session
+        lost = heartbeat.beat()
+
+    assert lost == {"job_b"}
+    assert heartbeat._sync_ids == {"job_a"}
+    sql = str(session.scalars.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "lease_expires_at=(now() + " in sql
+    assert "sync_jobs.lease_owner = " in sql
+
+
+def test_failed_job_is_recorded_and_its_lease_released():
+    orchestrator = SyncOrchestrator(workers=1)
+    job = ClaimedJob("orders_t1_abc", "t1", "orders")
+    heartbeat = Mock()
+
+    with (
+        patch.dict(sync_orchestrator.SYNC_RUNNERS, {"orders": Mock(side_effect=RuntimeError("GAM down"))}),
+        patch.object(sync_orchestrator, "get_lease_heartbeat", return_value=heartbeat),
+        patch.object(sync_orchestrator, "_mark_sync_failed") as mark_failed,
+    ):
+        orchestrator._run_job(job)
+
+    mark_failed.assert_called_once_with("orders_t1_abc", "GAM down")
+    heartbeat.release.assert_called_once_with("orders_t1_abc")
+    assert orchestrator.busy_workers() == 0
@@ -0,0 +1,70 @@
+"""Unit tests for the batched webhook delivery log writer."""
+
+from unittest.mock import MagicMock, patch
+
+from src.services.webhook_delivery_log_writer import WebhookDeliveryLogWriter
+
+
+def _make_writer() -> WebhookDeliveryLogWriter:
+    # Large interval so the background thread never flushes on its own during a test
+    return WebhookDeliveryLogWriter(batch_size=1000, flush_interval_seconds=3600)
+
+
+class TestWebhookDeliveryLogWriter:
+    """Test cases for buffering, coalescing and flushing delivery log rows."""
+
+    def test_rows_with_same_id_are_coalesced(self):
+        """Later states of a delivery overwrite earlier ones before the write."""
+        writer = _make_writer()
+
+        writer.record(id="log_1", status="retrying", attempt_count=1, http_status_code=503)
+        writer.record(id="log_1", status="success", attempt_count=2, http_status_code=200)
+        writer.record(id="log_2", status="failed", attempt_count=3)
+
+        assert writer.pending_count() == 2
+
+        with patch("src.services.webhook_delivery_log_writer.get_db_session"):
+            writer.close()
+
+    def test_flush_writes_all_pending_rows_in_one_statement(self):
+        """A flush issues a single execute with every pending row and commits once."""
+        writer = _make_writer()
+        writer.record(id="log_1", status="retrying", attempt_count=1)
+        writer.record(id="log_1", status="success", attempt_count=2)
+        writer.record(id="log_2", status="failed", attempt_count=1, error_message="HTTP 404")
+
+        mock_session = MagicMock()
+        with patch("src.services.webhook_delivery_log_writer.get_db_session") as mock_get_session:
+            mock_get_session.return_value.__enter__.return_value = mock_session
+            written = writer.flush()
+
+        assert written == 2
+        assert writer.pending_count() == 0
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
+
+        rows = mock_session.execute.call_args[0][1]
+        rows_by_id = {row["id"]: row for row in rows}
+        assert rows_by_id["log_1"]["status"] == "success"
+        assert rows_by_id["log_1"]["attempt_count"] == 2
+        # Missing columns are filled so every row has the same shape
+        assert rows_by_id["log_1"]["error_message"] is None
+        assert rows_by_id["log_2"]["error_message"] == "HTTP 404"
+
+    def test_flush_with_nothing_pending_skips_database(self):
+        """No session is opened when the buffer is empty."""
+        writer = _make_writer()
+
+        with patch("src.services.webhook_delivery_log_writer.get_db_session") as mock_get_session:
+            assert writer.flush() == 0
+
+        mock_get_session.assert_not_called()
+
+    def test_flush_failure_is_logged_not_raised(self):
+        """Database errors are swallowed so webhook delivery is never affected."""
+        writer = _make_writer()
+        writer.record(id="log_1", status="success", attempt_count=1)
+
+        with patch("src.services.webhook_delivery_log_writer.get_db_session") as mock_get_session:
+            mock_get_session.side_effect = RuntimeError("database unavailable")
+            assert writer.flush() == 0
@@ -9,7 +9,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.services.webhook_delivery_service import CircuitState, WebhookDeliveryService
+from src.services.webhook_delivery_service import WebhookDeliveryService, WebhookRejectedError
 
 
 @pytest.fixture
@@ -88,68 +88,73 @@ def test_thread_safety(webhook_service, mock_db_session):
         assert webhook_service._sequence_numbers[media_buy_id] == num_threads
 
 
+def _queued_rows(mock_db_session):
+    """Return the outbox rows added to the mocked session."""
+    return [call.args[0] for call in mock_db_session.add.call_args_list]
+
+
 def test_adcp_payload_structure(webhook_service, mock_db_session):
     """Test that payload follows AdCP V2.3 structure with enhanced security (PR #86)."""
     media_buy_id = "buy_adcp"
     start_time = datetime.now(UTC)
 
-    # Mock httpx to capture the payload
-    with patch("src.services.webhook_delivery_service.httpx.Client") as mock_client:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+    # Mock webhook config
+    mock_config = MagicMock()
+    mock_config.url = "https://example.com/webhook"
+    mock_config.authentication_type = None
+    mock_config.validation_token = None
+    mock_config.webhook_secret = None  # No HMAC for this test
 
-        # Mock webhook config
-        mock_config = MagicMock()
-        mock_config.url = "https://example.com/webhook"
-        mock_config.authentication_type = None
-        mock_config.validation_token = None
-        mock_config.webhook_secret = None  # No HMAC for this test
-
-        # Update mock to return config for SQLAlchemy 2.0
-        mock_db_session.scalars.return_value.all.return_value = [mock_config]
-
-        # Send webhook
-        webhook_service.send_delivery_webhook(
-            media_buy_id=media_buy_id,
-            tenant_id="tenant1",
-            principal_id="principal1",
-            reporting_period_start=start_time,
-            reporting_period_end=start_time,
-            impressions=5000,
-            spend=500.0,
-            clicks=50,
-            ctr=0.01,
-            is_final=False,
-            next_expected_interval_seconds=60.0,
-        )
+    # Update mock to return config for SQLAlchemy 2.0
+    mock_db_session.scalars.return_value.all.return_value = [mock_config]
 
-        # Verify httpx was called
-        assert mock_client.return_value.__enter__.return_value.post.called
-        call_args = mock_client.return_value.__enter__.return_value.post.call_args
+    # Send webhook
+    result = webhook_service.send_delivery_webhook(
+        media_buy_id=media_buy_id,
+        tenant_id="tenant1",
+        principal_id="principal1",
+        reporting_period_start=start_time,
+        reporting_period_end=start_time,
+        impressions=5000,
+        spend=500.0,
+        clicks=50,
+        ctr=0.01,
+        is_final=False,
+        next_expected_interval_seconds=60.0,
+    )
 
-        # Check new payload structure (PR #86 - no wrapper, direct payload)
-        # Version should match what's reported by the adcp library
-        from adcp import get_adcp_version
-
-        payload = call_args.kwargs["json"]
-        assert payload["adcp_version"] == get_adcp_version()
-        assert payload["notification_type"] == "scheduled"
-        assert payload["is_adjusted"] is False  # NEW in PR #86
-        assert payload["sequence_number"] == 1
-        assert "reporting_period" in payload
-        assert payload["reporting_period"]["start"] == start_time.isoformat()
-        assert "media_buy_deliveries" in payload
-        assert len(payload["media_buy_deliveries"]) == 1
-
-        # Check delivery data
-        delivery = payload["media_buy_deliveries"][0]
-        assert delivery["media_buy_id"] == media_buy_id
-        assert delivery["status"] == "active"
-        assert delivery["totals"]["impressions"] == 5000
-        assert delivery["totals"]["spend"] == 500.0
-        assert delivery["totals"]["clicks"] == 50
-        assert delivery["totals"]["ctr"] == 0.01
+    # Webhook is queued in the outbox in the same transaction
+    assert result is True
+    mock_db_session.commit.assert_called_once()
+    rows = _queued_rows(mock_db_session)
+    assert len(rows) == 1
+    assert rows[0].kind == "delivery_report"
+    assert rows[0].endpoint_url == "https://example.com/webhook"
+    assert rows[0].endpoint_key == "tenant1:https://example.com/webhook"
+    assert rows[0].status == "pending"
+
+    # Check new payload structure (PR #86 - no wrapper, direct payload)
+    # Version should match what's reported by the adcp library
+    from adcp import get_adcp_version
+
+    payload = rows[0].payload
+    assert payload["adcp_version"] == get_adcp_version()
+    assert payload["notification_type"] == "scheduled"
+    assert payload["is_adjusted"] is False  # NEW in PR #86
+    assert payload["sequence_number"] == 1
+    assert "reporting_period" in payload
+    assert payload["reporting_period"]["start"] == start_time.isoformat()
+    assert "media_buy_deliveries" in payload
+    assert len(payload["media_buy_deliveries"]) == 1
+
+    # Check delivery data
+    delivery = payload["media_buy_deliveries"][0]
+    assert delivery["media_buy_id"] == media_buy_id
+    assert delivery["status"] == "active"
+    assert delivery["totals"]["impressions"] == 5000
+    assert delivery["totals"]["spend"] == 500.0
+    assert delivery["totals"]["clicks"] == 50
+    assert delivery["totals"]["ctr"] == 0.01
 
 
 def test_final_notification_type(webhook_service, mock_db_session):
@@ -157,36 +162,66 @@ def test_final_notification_type(webhook_service, mock_db_session):
     media_buy_id = "buy_final"
     start_time = datetime.now(UTC)
 
-    with patch("src.services.webhook_delivery_service.httpx.Client") as mock_client:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+    mock_config = MagicMock()
+    mock_config.url = "https://example.com/webhook"
+    mock_config.authentication_type = None
+    mock_config.validation_token = None
+    mock_config.webhook_secret = None
+    mock_db_session.scalars.return_value.all.return_value = [mock_config]
 
-        mock_config = MagicMock()
-        mock_config.url = "https://example.com/webhook"
-        mock_config.authentication_type = None
-        mock_config.validation_token = None
-        mock_config.webhook_secret = None
-        mock_db_session.scalars.return_value.all.return_value = [mock_config]
+    # Send final webhook
+    webhook_service.send_delivery_webhook(
+        media_buy_id=media_buy_id,
+        tenant_id="tenant1",
+        principal_id="principal1",
+        reporting_period_start=start_time,
+        reporting_period_end=start_time,
+        impressions=10000,
+        spend=1000.0,
+        status="completed",
+        is_final=True,
+    )
 
-        # Send final webhook
-        webhook_service.send_delivery_webhook(
-            media_buy_id=media_buy_id,
-            tenant_id="tenant1",
-            principal_id="principal1",
-            reporting_period_start=start_time,
-            reporting_period_end=start_time,
-            impressions=10000,
-            spend=1000.0,
-            status="completed",
-            is_final=True,
-        )
+    # Check notification_type (direct payload structure in PR #86)
+    payload = _queued_rows(mock_db_session)[0].payload
+    assert payload["notification_type"] == "final"
+    assert payload["is_adjusted"] is False
+    assert "next_expected_at" not in payload
+
+
+def test_one_outbox_row_per_endpoint(webhook_service, mock_db_session):
+    """Each active endpoint gets its own outbox row referencing (not copying) its credentials."""
+    start_time = datetime.now(UTC)
 
-        # Check notification_type (direct payload structure in PR #86)
-        payload = mock_client.return_value.__enter__.return_value.post.call_args.kwargs["json"]
-        assert payload["notification_type"] == "final"
-        assert payload["is_adjusted"] is False
-        assert "next_expected_at" not in payload
+    configs = []
+    for i, auth_type in enumerate(["bearer", None]):
+        config = MagicMock()
+        config.id = f"pnc_{i}"
+        config.url = f"https://example.com/webhook/{i}"
+        config.authentication_type = auth_type
+        config.authentication_token = "secret_token" if auth_type else None
+        config.webhook_secret = None
+        configs.append(config)
+    mock_db_session.scalars.return_value.all.return_value = configs
+
+    webhook_service.send_delivery_webhook(
+        media_buy_id="buy_multi",
+        tenant_id="tenant1",
+        principal_id="principal1",
+        reporting_period_start=start_time,
+        reporting_period_end=start_time,
+        impressions=1000,
+        spend=100.0,
+    )
+
+    rows = _queued_rows(mock_db_session)
+    assert [row.endpoint_url for row in rows] == ["https://example.com/webhook/0", "https://example.com/webhook/1"]
+    assert [row.delivery_config for row in rows] == [
+        {"push_notification_config_id": "pnc_0"},
+        {"push_notification_config_id": "pnc_1"},
+    ]
+    assert rows[0].event_metadata == {"task_type": "delivery_report", "media_buy_id": "buy_multi"}
+    mock_db_session.commit.assert_called_once()
 
 
 def test_reset_sequence(webhook_service, mock_db_session):
@@ -214,98 +249,41 @@ def test_reset_sequence(webhook_service, mock_db_session):
         assert media_buy_id not in webhook_service._sequence_numbers
 
 
-def test_failure_tracking(webhook_service, mock_db_session):
-    """Test that failures are tracked correctly with circuit breaker (PR #86)."""
-    media_buy_id = "buy_fail"
-    start_time = datetime.now(UTC)
-
+def test_deliver_payload_status_handling(webhook_service):
+    """A single delivery attempt reports success only for 2xx responses."""
     with patch("src.services.webhook_delivery_service.httpx.Client") as mock_client:
-        # First call succeeds
-        mock_response_ok = MagicMock()
-        mock_response_ok.status_code = 200
-
-        # Second call fails (with retries)
-        mock_response_fail = MagicMock()
-        mock_response_fail.status_code = 500
-
-        # Mock will be called 3 times total (1 success, then 2 failure attempts with retries)
-        mock_client.return_value.__enter__.return_value.post.side_effect = [
-            mock_response_ok,  # First webhook succeeds
-            mock_response_fail,  # Second webhook attempt 1 fails
-            mock_response_fail,  # Second webhook attempt 2 fails (retry)
-            mock_response_fail,  # Second webhook attempt 3 fails (retry)
-        ]
-
-        mock_config = MagicMock()
-        mock_config.url = "https://example.com/webhook"
-        mock_config.authentication_type = None
-        mock_config.validation_token = None
-        mock_config.webhook_secret = None
-        mock_db_session.scalars.return_value.all.return_value = [mock_config]
-
-        # First webhook - success
-        result1 = webhook_service.send_delivery_webhook(
-            media_buy_id=media_buy_id,
-            tenant_id="tenant1",
-            principal_id="principal1",
-            reporting_period_start=start_time,
-            reporting_period_end=start_time,
-            impressions=1000,
-            spend=100.0,
-        )
-        assert result1 is True
+        mock_post = mock_client.return_value.__enter__.return_value.post
 
-        # Check circuit breaker state after success (should be CLOSED)
-        endpoint_key = "tenant1:https://example.com/webhook"
-        state, failures = webhook_service.get_circuit_breaker_state(endpoint_key)
-        assert state == CircuitState.CLOSED
-        assert failures == 0
+        mock_post.return_value = MagicMock(status_code=200)
+        assert webhook_service.deliver_payload("https://example.com/webhook", {"a": 1}) is True
 
-        # Second webhook - failure (will retry 3 times)
-        result2 = webhook_service.send_delivery_webhook(
-            media_buy_id=media_buy_id,
-            tenant_id="tenant1",
-            principal_id="principal1",
-            reporting_period_start=start_time,
-            reporting_period_end=start_time,
-            impressions=2000,
-            spend=200.0,
-        )
-        assert result2 is False
+        mock_post.return_value = MagicMock(status_code=500)
+        assert webhook_service.deliver_payload("https://example.com/webhook", {"a": 1}) is False
 
-        # Check circuit breaker recorded the failure
-        state, failures = webhook_service.get_circuit_breaker_state(endpoint_key)
-        assert state == CircuitState.CLOSED  # Still closed (threshold is 5)
-        assert failures == 1
+        # Rate limiting is worth retrying; other client errors are permanent
+        mock_post.return_value = MagicMock(status_code=429)
+        assert webhook_service.deliver_payload("https://example.com/webhook", {"a": 1}) is False
 
+        mock_post.return_value = MagicMock(status_code=404)
+        with pytest.raises(WebhookRejectedError):
+            webhook_service.deliver_payload("https://example.com/webhook", {"a": 1})
+
+        # Exactly one POST per call - retries are scheduled by the outbox dispatcher
+        assert mock_post.call_count == 4
 
-def test_authentication_headers(webhook_service, mock_db_session):
-    """Test that authentication headers are set correctly (PR #86)."""
-    media_buy_id = "buy_auth"
-    start_time = datetime.now(UTC)
 
+def test_authentication_headers(webhook_service):
+    """Test that authentication headers are set correctly (PR #86)."""
     with patch("src.services.webhook_delivery_service.httpx.Client") as mock_client:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_client.return_value.__enter__.return_value.post.return_value = mock_response
 
-        # Test bearer auth
-        mock_config = MagicMock()
-        mock_config.url = "https://example.com/webhook"
-        mock_config.authentication_type = "bearer"
-        mock_config.authentication_token = "secret_token"
-        mock_config.validation_token = "validation_token"
-        mock_config.webhook_secret = None
-        mock_db_session.scalars.return_value.all.return_value = [mock_config]
-
-        webhook_service.send_delivery_webhook(
-            media_buy_id=media_buy_id,
-            tenant_id="tenant1",
-            principal_id="principal1",
-            reporting_period_start=start_time,
-            reporting_period_end=start_time,
-            impressions=1000,
-            spend=100.0,
+        webhook_service.deliver_payload(
+            "https://example.com/webhook",
+            {"media_buy_deliveries": []},
+            authentication_type="bearer",
+            authentication_token="secret_token",
         )
 
         # Verify headers (PR #86 added X-ADCP-Timestamp, no longer uses X-Webhook-Token)
@@ -313,6 +291,22 @@ def test_authentication_headers(webhook_service, mock_db_session):
         headers = call_args.kwargs["headers"]
         assert headers["Authorization"] == "Bearer secret_token"
         assert "X-ADCP-Timestamp" in headers  # NEW in PR #86
+        assert "X-ADCP-Signature" not in headers
+
+
+def test_hmac_signature_uses_send_time_timestamp(webhook_service):
+    """The HMAC signature is computed over the timestamp sent with the request."""
+    secret = "s" * 32
+    payload = {"media_buy_deliveries": []}
+
+    with patch("src.services.webhook_delivery_service.httpx.Client") as mock_client:
+        mock_client.return_value.__enter__.return_value.post.return_value = MagicMock(status_code=200)
+
+        webhook_service.deliver_payload("https://example.com/webhook", payload, webhook_secret=secret)
+
+        headers = mock_client.return_value.__enter__.return_value.post.call_args.kwargs["headers"]
+        expected = webhook_service._generate_hmac_signature(payload, secret, headers["X-ADCP-Timestamp"])
+        assert headers["X-ADCP-Signature"] == expected
 
 
 def test_no_webhooks_configured(webhook_service, mock_db_session):
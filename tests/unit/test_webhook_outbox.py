@@ -0,0 +1,190 @@
+"""Unit tests for the webhook outbox and its dispatcher."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from cryptography.fernet import Fernet
+
+from src.core.database.models import PushNotificationConfig
+from src.services import webhook_outbox
+from src.services.leased_queue import retry_delay_seconds
+from src.services.webhook_delivery_service import CircuitState, WebhookRejectedError
+from src.services.webhook_outbox import (
+    OUTBOX_KIND_PROTOCOL,
+    RETRY_SCHEDULE_SECONDS,
+    WebhookOutboxDispatcher,
+    delivery_config_for,
+    enqueue_webhook,
+    load_delivery_credentials,
+    make_endpoint_key,
+)
+
+
+def _row(**overrides):
+    row = {
+        "id": 1,
+        "tenant_id": "tenant1",
+        "principal_id": "principal1",
+        "kind": OUTBOX_KIND_PROTOCOL,
+        "endpoint_url": "https://example.com/webhook",
+        "endpoint_key": "tenant1:https://example.com/webhook",
+        "payload": {"task_id": "task_1"},
+        "delivery_config": None,
+        "event_metadata": None,
+        "attempt_count": 0,
+        "max_attempts": 3,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def dispatcher():
+    """Dispatcher with database writes mocked out."""
+    dispatcher = WebhookOutboxDispatcher(worker_count=1)
+    dispatcher._mark_delivered = MagicMock()
+    dispatcher._mark_failed = MagicMock()
+    dispatcher._reschedule = MagicMock()
+    return dispatcher
+
+
+def test_endpoint_key_is_tenant_scoped():
+    """The same URL under two tenants is ordered and circuit-broken independently."""
+    assert make_endpoint_key("t1", "https://x") != make_endpoint_key("t2", "https://x")
+    assert make_endpoint_key(None, "https://x") == ":https://x"
+
+
+def test_retry_delay_follows_schedule_with_bounded_jitter():
+    """Delays follow the retry schedule, capped at its last step, with at most 10% jitter."""
+    for attempt, base in enumerate(RETRY_SCHEDULE_SECONDS, start=1):
+        assert base <= retry_delay_seconds(attempt, RETRY_SCHEDULE_SECONDS) <= base * 1.1
+
+    last = RETRY_SCHEDULE_SECONDS[-1]
+    assert last <= retry_delay_seconds(50, RETRY_SCHEDULE_SECONDS) <= last * 1.1
+
+
+def test_enqueue_adds_pending_row_without_committing():
+    """Enqueueing joins the caller's transaction; the caller commits."""
+    session = MagicMock()
+
+    entry = enqueue_webhook(
+        session,
+        kind=OUTBOX_KIND_PROTOCOL,
+        url="https://example.com/webhook",
+        payload={"task_id": "task_1"},
+        tenant_id="tenant1",
+        principal_id="principal1",
+    )
+
+    session.add.assert_called_once_with(entry)
+    session.commit.assert_not_called()
+    assert entry.status == "pending"
+    assert entry.attempt_count == 0
+    assert entry.endpoint_key == "tenant1:https://example.com/webhook"
+
+
+def test_request_scoped_config_token_is_stored_encrypted(monkeypatch):
+    """A config built from request data has no row to reference, so its token is encrypted at rest."""
+    monkeypatch.setenv("ENCRYPTION_KEY", Fernet.generate_key().decode())
+    config = PushNotificationConfig(
+        id="pnc_1", url="https://example.com/webhook", authentication_type="Bearer", authentication_token="s3cret"
+    )
+
+    delivery_config = delivery_config_for(config)
+
+    assert "s3cret" not in str(delivery_config)
+    assert load_delivery_credentials(delivery_config) == {
+        "authentication_type": "Bearer",
+        "authentication_token": "s3cret",
+        "webhook_secret": None,
+    }
+
+
+def test_referenced_config_credentials_are_read_at_send_time():
+    """Saved configs are referenced by id; deactivating one stops delivery of its queued rows."""
+    config = PushNotificationConfig(
+        id="pnc_1", authentication_type="HMAC-SHA256", authentication_token="tok", webhook_secret="x" * 32
+    )
+    config.is_active = True
+    session = MagicMock()
+    session.get.return_value = config
+
+    with patch.object(webhook_outbox, "get_db_session") as get_db_session:
+        get_db_session.return_value.__enter__.return_value = session
+        credentials = load_delivery_credentials({"push_notification_config_id": "pnc_1"})
+        assert credentials["webhook_secret"] == "x" * 32
+
+        config.is_active = False
+        with pytest.raises(ValueError, match="no longer active"):
+            load_delivery_credentials({"push_notification_config_id": "pnc_1"})
+
+
+async def test_successful_delivery_marks_row_delivered(dispatcher):
+    """A successful attempt marks the row delivered and closes the circuit."""
+    with patch.object(dispatcher, "_deliver", AsyncMock(return_value=True)):
+        await dispatcher.process_item(_row())
+
+    dispatcher._mark_delivered.assert_called_once_with(1)
+    dispatcher._reschedule.assert_not_called()
+    assert dispatcher.get_circuit_breaker_state("https://example.com/webhook") == (CircuitState.CLOSED, 0)
+
+
+async def test_failed_delivery_is_rescheduled_with_backoff(dispatcher):
+    """A failed attempt below max_attempts is rescheduled and counted."""
+    with patch.object(dispatcher, "_deliver", AsyncMock(side_effect=RuntimeError("boom"))):
+        await dispatcher.process_item(_row())
+
+    dispatcher._mark_delivered.assert_not_called()
+    row_id, delay, error, count_attempt = dispatcher._reschedule.call_args.args
+    assert row_id == 1
+    assert delay.total_seconds() >= RETRY_SCHEDULE_SECONDS[0]
+    assert "boom" in error
+    assert count_attempt is True
+    assert dispatcher.get_circuit_breaker_state("https://example.com/webhook") == (CircuitState.CLOSED, 1)
+
+
+async def test_final_failed_attempt_parks_row(dispatcher):
+    """The last allowed attempt marks the row failed instead of rescheduling."""
+    with patch.object(dispatcher, "_deliver", AsyncMock(return_value=False)):
+        await dispatcher.process_item(_row(attempt_count=2, max_attempts=3))
+
+    dispatcher._mark_failed.assert_called_once()
+    dispatcher._reschedule.assert_not_called()
+
+
+async def test_rejected_delivery_fails_on_first_attempt(dispatcher):
+    """A permanent 4xx rejection is not retried and does not trip the circuit breaker."""
+    with patch.object(dispatcher, "_deliver", AsyncMock(side_effect=WebhookRejectedError(410, "HTTP 410"))):
+        await dispatcher.process_item(_row(attempt_count=0, max_attempts=8))
+
+    dispatcher._mark_failed.assert_called_once()
+    assert "HTTP 410" in dispatcher._mark_failed.call_args.args[1]
+    dispatcher._reschedule.assert_not_called()
+    assert dispatcher.get_circuit_breaker_state("https://example.com/webhook") == (CircuitState.CLOSED, 0)
+
+
+async def test_protocol_rows_ask_for_rejections_to_be_raised(dispatcher):
+    service = MagicMock()
+    service.send_notification = AsyncMock(return_value=True)
+
+    with patch("src.services.protocol_webhook_service.get_protocol_webhook_service", return_value=service):
+        assert await dispatcher._deliver(_row(delivery_config={})) is True
+
+    kwargs = service.send_notification.call_args.kwargs
+    assert (kwargs["max_attempts"], kwargs["raise_on_rejection"]) == (1, True)
+
+
+async def test_open_circuit_defers_without_counting_attempt(dispatcher):
+    """Rows for an endpoint with an open circuit are deferred, not attempted."""
+    circuit_breaker = dispatcher.get_circuit_breaker("tenant1:https://example.com/webhook")
+    for _ in range(circuit_breaker.failure_threshold):
+        circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitState.OPEN
+
+    deliver = AsyncMock(return_value=True)
+    with patch.object(dispatcher, "_deliver", deliver):
+        await dispatcher.process_item(_row())
+
+    deliver.assert_not_awaited()
+    _, _, _, count_attempt = dispatcher._reschedule.call_args.args
+    assert count_attempt is False
@@ -0,0 +1,143 @@
+"""Tests for the shared Xandr token cache and concurrent paging/reporting."""
+
+import threading
+import time
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.adapters import xandr
+from src.adapters.http_transport import close_http_transports
+from src.adapters.xandr import XANDR_TOKEN_TTL, XandrAdapter, XandrTokenCache, _report_windows
+
+KEY = XandrTokenCache.key("https://api.appnexus.com", "user", "secret")
+
+
+@pytest.fixture
+def adapter_factory():
+    principal = Mock()
+    principal.name = "test_principal"
+    principal.principal_id = "principal_123"
+    principal.platform_mappings = {"xandr": {"advertiser_id": "789"}}
+    config = {"api_endpoint": "https://api.appnexus.com", "username": "user", "password": "secret", "member_id": "1"}
+
+    with (
+        patch.multiple("src.adapters.xandr.XandrAdapter", __abstractmethods__=set()),
+        patch.object(xandr, "_token_cache", XandrTokenCache()),
+    ):
+        yield lambda: XandrAdapter(config=config, principal=principal)
+    close_http_transports()
+
+
+def _response(status=200, body=None):
+    response = Mock(status_code=status)
+    response.json.return_value = body or {}
+    return response
+
+
+def test_concurrent_callers_share_one_authentication():
+    cache = XandrTokenCache()
+    calls = []
+
+    def authenticate():
+        calls.append(1)
+        time.sleep(0.05)
+        return "token-1"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(KEY, authenticate))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert {token for token, _ in results} == {"token-1"}
+
+
+def test_token_is_renewed_proactively_and_kept_if_renewal_fails():
+    cache = XandrTokenCache()
+    cache.get(KEY, lambda: "old")
+    # Five minutes left: inside the refresh margin but still valid
+    cache._tokens[KEY] = ("old", datetime.now(UTC) + timedelta(minutes=5))
+
+    assert cache.get(KEY, Mock(side_effect=RuntimeError("auth down")))[0] == "old"
+
+    token, expiry = cache.get(KEY, lambda: "new")
+    assert token == "new"
+    assert expiry > datetime.now(UTC) + XANDR_TOKEN_TTL - timedelta(minutes=1)
+
+
+def test_caller_does_not_wait_for_a_renewal_while_the_token_is_valid():
+    cache = XandrTokenCache()
+    cache._tokens[KEY] = ("old", datetime.now(UTC) + timedelta(minutes=5))
+    cache._locks[KEY] = threading.Lock()
+    cache._locks[KEY].acquire()  # Another caller is renewing
+
+    assert cache.get(KEY, Mock(side_effect=AssertionError("must not authenticate")))[0] == "old"
+
+
+def test_adapters_with_same_credentials_reuse_the_token(adapter_factory):
+    first, second = adapter_factory(), adapter_factory()
+    assert first.http is second.http
+    auth = _response(body={"response": {"status": "OK", "token": "tok"}})
+    ok = _response(body={"response": {"status": "OK"}})
+
+    with patch.object(first.http, "post", return_value=auth) as post, patch.object(first.http, "get", return_value=ok):
+        first._make_request("GET", "/member")
+        second._make_request("GET", "/member")
+
+    post.assert_called_once()
+    assert second.token == "tok"
+
+
+def test_unauthorized_response_renews_the_token_once(adapter_factory):
+    adapter = adapter_factory()
+    tokens = iter(["stale", "fresh"])
+    ok = _response(body={"response": {"status": "OK"}})
+
+    with (
+        patch.object(adapter, "_request_token", side_effect=lambda: next(tokens)),
+        patch.object(adapter.http, "get", side_effect=[_response(401), ok]) as get,
+    ):
+        assert adapter._make_request("GET", "/member") == {"response": {"status": "OK"}}
+
+    assert [c.kwargs["headers"]["Authorization"] for c in get.call_args_list] == ["stale", "fresh"]
+
+
+def test_remaining_pages_are_fetched_after_the_first(adapter_factory):
+    adapter = adapter_factory()
+
+    def page(method, endpoint, data):
+        start = data["start_element"]
+        return {"response": {"count": 250, "insertion-orders": [{"id": start + i} for i in range(2)]}}
+
+    with patch.object(adapter, "_make_request", side_effect=page) as request:
+        items = adapter._get_all("/insertion-order", "insertion-orders", {"advertiser_id": "789"})
+
+    assert sorted(c.args[2]["start_element"] for c in request.call_args_list) == [0, 100, 200]
+    assert [item["id"] for item in items] == [0, 1, 100, 101, 200, 201]
+
+
+def test_report_windows_cover_the_range_without_overlap():
+    assert _report_windows(date(2026, 3, 1), date(2026, 3, 17)) == [
+        (date(2026, 3, 1), date(2026, 3, 8)),
+        (date(2026, 3, 8), date(2026, 3, 15)),
+        (date(2026, 3, 15), date(2026, 3, 17)),
+    ]
+
+
+def test_reporting_data_aggregates_all_windows(adapter_factory):
+    adapter = adapter_factory()
+    rows = {
+        "2026-03-01": [{"day": "2026-03-01", "insertion_order_id": 1, "imps": 100, "clicks": 1, "media_cost": 1.0}],
+        "2026-03-08": [{"day": "2026-03-08", "insertion_order_id": 1, "imps": 50, "clicks": 0, "media_cost": 0.5}],
+    }
+
+    with patch.object(adapter, "_run_report", side_effect=lambda report: rows[report["start_date"]]):
+        summary = adapter.get_reporting_data(datetime(2026, 3, 1), datetime(2026, 3, 10))
+
+    assert summary["total_impressions"] == 150
+    assert summary["by_insertion_order"]["1"]["impressions"] == 150
+    assert set(summary["by_day"]) == {"2026-03-01", "2026-03-08"}